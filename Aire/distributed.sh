@@ -0,0 +1,39 @@
+#!/bin/bash
+#SBATCH --job-name=nonaga-distributed
+#SBATCH --time=00:20:00
+#SBATCH --nodes=4
+#SBATCH --ntasks-per-node=1  # One worker launcher per node
+#SBATCH --cpus-per-task=64   # Worker processes per node
+
+# 1. Load Miniforge instead of the bare Python module
+module purge
+module load miniforge
+
+# 2. Create the environment (only if it doesn't exist)
+# We use --prefix to keep it in your project folder
+if [ ! -d "./conda_env" ]; then
+    conda create --prefix ./conda_env python=3.11 cython -y
+fi
+
+source activate ./conda_env
+pip install -r requirements.txt
+
+# The master runs on the first node of the allocation, the workers of every node connect to it
+MASTER_HOST=$(scontrol show hostnames "$SLURM_JOB_NODELIST" | head -n 1)
+PORT=5757
+export NONAGA_GA_AUTHKEY=$(python -c "import secrets; print(secrets.token_hex(16))")
+
+# Start the workers, which wait for the master to listen. The master runs here, on the first node,
+# so the worker step there leaves it a core; the other nodes give all their cores to workers.
+LOCAL_PROCESSES=$((SLURM_CPUS_PER_TASK - 1))
+srun --nodes=1 --ntasks=1 --nodelist="$MASTER_HOST" --cpus-per-task=$LOCAL_PROCESSES \
+    python -u ga_framework/distributed.py "$MASTER_HOST:$PORT" --processes $LOCAL_PROCESSES &
+if [ "$SLURM_NNODES" -gt 1 ]; then
+    srun --nodes=$((SLURM_NNODES - 1)) --ntasks=$((SLURM_NNODES - 1)) --ntasks-per-node=1 --exclude="$MASTER_HOST" \
+        python -u ga_framework/distributed.py "$MASTER_HOST:$PORT" --processes $SLURM_CPUS_PER_TASK &
+fi
+
+# Run the job; the workers stop when it is over
+python -u ga_framework/main.py --mode distributed --host "$MASTER_HOST" --port $PORT \
+    --min-workers $(((SLURM_NNODES - 1) * SLURM_CPUS_PER_TASK + LOCAL_PROCESSES))
+wait
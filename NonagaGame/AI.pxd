@@ -1,6 +1,7 @@
 # cython: language_level=3
 from nonaga_logic cimport NonagaLogic
 from nonaga_board cimport NonagaBoard, NonagaPiece
+from nonaga_endgame cimport EndgameTable
 
 cdef class AI:
     
@@ -9,9 +10,16 @@ cdef class AI:
     cdef public int max_color
     cdef public int min_color
     cdef public int depth_0_color
+    cdef public bint quiescence
+    cdef public object progress_callback
+    cdef public EndgameTable endgame_table
+    cdef public long long nodes
 
     cdef tuple minimax_piece(self, NonagaLogic game_state, int depth, bint maximizingPlayer, int color, double alpha, double beta)
     cdef tuple minimax_tile(self, NonagaLogic game_state, int depth, bint maximizingPlayer, int color, double alpha, double beta)
+    cdef double horizon_value(self, NonagaLogic game_state, bint maximizingPlayer, int color)
+    cdef bint can_parry_threats(self, NonagaLogic game_state, int color)
+    cdef bint tile_move_parries(self, NonagaLogic game_state, int opponent_color)
     cdef int cost_function(self, NonagaLogic game_state, bint maximizingPlayer, int color, list params)
     cdef tuple missing_tiles_and_enemy_pieces(self, NonagaBoard board, NonagaPiece p0, NonagaPiece p1, NonagaPiece p2, int color)
     cpdef tuple get_best_move(self, NonagaLogic game_state)
@@ -1,7 +1,8 @@
 # cython: language_level=3, boundscheck=False, wraparound=False, profile=True
 from nonaga_constants import RED, BLACK
 from nonaga_logic cimport NonagaLogic
-from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile
+from nonaga_board cimport (NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile, MAX_PIECE_MOVES,
+                           piece_move_from, piece_move_to)
 import json
 import os
 
@@ -11,16 +12,55 @@ faulthandler.enable()
 # Module-level constants for alpha-beta bounds
 cdef double NEG_INF = float('-inf')
 cdef double POS_INF = float('inf')
+cdef double WIN_SCORE = 99999999
+
+
+class SearchCancelled(Exception):
+    """Raised by get_best_move when the progress callback asks the search to stop."""
+
+
+cdef set threat_footprint(list threats):
+    """Cells whose tile or piece content decides whether the threatening slides still land.
+
+    That is every cell a slide crosses, its destination and the cell right
+    behind it, which currently stops the slide.
+    """
+    cdef set cells = set()
+    cdef tuple origin, destination
+    cdef int dq, dr, ds, steps, k
+    for origin, destination in threats:
+        dq = destination[0] - origin[0]
+        dr = destination[1] - origin[1]
+        ds = destination[2] - origin[2]
+        steps = (abs(dq) + abs(dr) + abs(ds)) // 2
+        dq //= steps
+        dr //= steps
+        ds //= steps
+        for k in range(1, steps + 2):
+            cells.add((origin[0] + k * dq, origin[1] + k * dr, origin[2] + k * ds))
+    return cells
 
 
 cdef class AI:
     """Minimax AI with alpha-beta pruning for Nonaga."""
-    def __init__(self, parameter, int depth=2, int color=BLACK):
+    def __init__(self, parameter, int depth=2, int color=BLACK, bint quiescence=True):
+        self.reset(parameter, depth, color, quiescence)
+
+    def reset(self, parameter, int depth=2, int color=BLACK, bint quiescence=True):
+        """Set up the AI as __init__ does, so that one object can play match after match."""
         self.parameter = parameter
         self.depth = depth
         self.max_color = color
         self.min_color = (color + 1) % 2
         self.depth_0_color = (color + depth) % 2
+        # extend the search at the horizon when a piece slide wins or must be blocked
+        self.quiescence = quiescence
+        # called with (root moves searched, root moves) after each root move, returning True cancels the search
+        self.progress_callback = None
+        # solved positions probed at the horizon, see nonaga_endgame.EndgameTable
+        self.endgame_table = None
+        # positions with a piece to move visited by the last get_best_move
+        self.nodes = 0
 
     # Inspired from https://papers-100-lines.medium.com/the-minimax-algorithm-and-alpha-beta-pruning-tutorial-in-30-lines-of-python-code-e4a3d97fa144
 
@@ -33,70 +73,72 @@ cdef class AI:
         cdef tuple best_piece_move = None
         cdef tuple best_tile_move = None
         cdef tuple candidate_tile_move = None
-        cdef dict all_possible_piece_moves = {}
+        cdef int piece_moves[MAX_PIECE_MOVES]
+        cdef int num_piece_moves, k
+        cdef NonagaBoard board = game_state.board
         cdef NonagaPiece piece
         cdef tuple move = None
 
-        # end of the loop
-        if depth == 0: 
-            return (self.cost_function(game_state, maximizingPlayer, self.max_color, self.parameter), None, None)
-        elif game_state.check_win_condition(RED) or game_state.check_win_condition(BLACK):
-            # the last player to play won
+        self.nodes += 1
+        # the win is checked first so that a winning move just before the horizon is scored as such
+        if game_state.check_win_condition(RED) or game_state.check_win_condition(BLACK):
+            # the last player to play won, the remaining depth makes earlier wins worth more
             if maximizingPlayer:
-                return (-99999999, None, None)
+                return (-(WIN_SCORE + depth), None, None)
             else:
-                return (99999999, None, None)
-         
-        
+                return (WIN_SCORE + depth, None, None)
+        # end of the loop
+        elif depth == 0:
+            return (self.horizon_value(game_state, maximizingPlayer, color), None, None)
+
+        # piece moves are generated into a C buffer, only the explored ones are turned into positions
+        num_piece_moves = board.fill_piece_moves(game_state.current_player, piece_moves)
+        if num_piece_moves == 0:
+            return (self.cost_function(game_state, maximizingPlayer, self.max_color, self.parameter), None, None)
+
         # AI's turn
         if maximizingPlayer:
             value = NEG_INF
-            all_possible_piece_moves = game_state.get_all_valid_piece_moves_ai()
-            if not all_possible_piece_moves:
-                return (self.cost_function(game_state, maximizingPlayer, self.max_color, self.parameter), None, None)
-            for piece in all_possible_piece_moves:
+            for k in range(num_piece_moves):
+                piece = board.get_piece_at_cell(piece_move_from(piece_moves[k]))
                 original_position = piece.get_position()
-                for move in all_possible_piece_moves[piece]:
-                    game_state.move_piece(piece, move)
-
-                    # We don't change the depth and current player because one player moves a piece and tile per turn
-                    tmp, candidate_tile_move = self.minimax_tile(
-                        game_state, depth, maximizingPlayer, color, alpha, beta)
-                    game_state.undo_piece_move(piece, original_position)
-                    if tmp > value:
-                        value = tmp
-                        best_piece_move = (original_position, move)
-                        best_tile_move = candidate_tile_move
-                    alpha = max(alpha, value)
-                    if alpha >= beta:
-                        break
-                else:
-                    continue
-                break
+                move = board.cell_position(piece_move_to(piece_moves[k]), piece.q, piece.r)
+                game_state.move_piece(piece, move)
+
+                # We don't change the depth and current player because one player moves a piece and tile per turn
+                tmp, candidate_tile_move = self.minimax_tile(
+                    game_state, depth, maximizingPlayer, color, alpha, beta)
+                game_state.undo_piece_move(piece, original_position)
+                # only the root call searches at full depth
+                if depth == self.depth and self.progress_callback is not None:
+                    if self.progress_callback(k + 1, num_piece_moves):
+                        raise SearchCancelled()
+                if tmp > value:
+                    value = tmp
+                    best_piece_move = (original_position, move)
+                    best_tile_move = candidate_tile_move
+                alpha = max(alpha, value)
+                if alpha >= beta:
+                    break
         # player's turn
         else:
             value = POS_INF
-            all_possible_piece_moves = game_state.get_all_valid_piece_moves_ai()
-            if not all_possible_piece_moves:
-                return (self.cost_function(game_state, maximizingPlayer, self.max_color, self.parameter), None, None)
-            for piece in all_possible_piece_moves:
+            for k in range(num_piece_moves):
+                piece = board.get_piece_at_cell(piece_move_from(piece_moves[k]))
                 original_position = piece.get_position()
-                for move in all_possible_piece_moves[piece]:
-                    game_state.move_piece(piece, move)
-
-                    tmp, candidate_tile_move = self.minimax_tile(
-                        game_state, depth, maximizingPlayer, color,alpha, beta)
-                    game_state.undo_piece_move(piece, original_position)
-                    if tmp < value:
-                        value = tmp
-                        best_piece_move = (original_position, move)
-                        best_tile_move = candidate_tile_move
-                    beta = min(beta, value)
-                    if alpha >= beta:
-                        break
-                else:
-                    continue
-                break
+                move = board.cell_position(piece_move_to(piece_moves[k]), piece.q, piece.r)
+                game_state.move_piece(piece, move)
+
+                tmp, candidate_tile_move = self.minimax_tile(
+                    game_state, depth, maximizingPlayer, color,alpha, beta)
+                game_state.undo_piece_move(piece, original_position)
+                if tmp < value:
+                    value = tmp
+                    best_piece_move = (original_position, move)
+                    best_tile_move = candidate_tile_move
+                beta = min(beta, value)
+                if alpha >= beta:
+                    break
 
         if best_piece_move is None or best_tile_move is None:
             return (self.cost_function(game_state, maximizingPlayer, self.max_color, self.parameter), None, None)
@@ -172,14 +214,99 @@ cdef class AI:
         return (value, best_tile_move)
 
 
+    cdef double horizon_value(self, NonagaLogic game_state, bint maximizingPlayer, int color):
+        """Evaluates a leaf, resolving immediate wins instead of trusting cost_function.
+
+        The side to move wins if one of its pieces can slide into contact with
+        the two others. Otherwise, if the opponent threatens such a slide, only
+        the moves that block it are searched: when none exists the position is
+        lost. Positions solved by the endgame table score as the table says,
+        the others are evaluated statically.
+        """
+        cdef int distance
+        cdef double score
+        # wins found here lie beyond the horizon, so they score below the ones reached by the search
+        if self.quiescence:
+            if game_state.has_winning_piece_move(color):
+                return WIN_SCORE - 1 if maximizingPlayer else -(WIN_SCORE - 1)
+            if game_state.has_winning_piece_move((color + 1) % 2) and not self.can_parry_threats(game_state, color):
+                return -(WIN_SCORE - 2) if maximizingPlayer else WIN_SCORE - 2
+        # the table only holds positions where a player has two pieces at most one cell apart
+        if self.endgame_table is not None and (game_state.may_connect_in_one_move(color)
+                                               or game_state.may_connect_in_one_move((color + 1) % 2)):
+            distance = self.endgame_table.probe_game(game_state)
+            if distance != 0:
+                # the sooner the win, the higher the score
+                score = WIN_SCORE - abs(distance)
+                return score if (distance > 0) == maximizingPlayer else -score
+        return self.cost_function(game_state, maximizingPlayer, self.max_color, self.parameter)
+
+    cdef bint can_parry_threats(self, NonagaLogic game_state, int color):
+        """Looks for a piece move followed by a tile move after which the opponent has no winning slide."""
+        cdef int opponent_color = (color + 1) % 2
+        cdef NonagaBoard board = game_state.board
+        cdef int piece_moves[MAX_PIECE_MOVES]
+        cdef int num_piece_moves = board.fill_piece_moves(color, piece_moves)
+        cdef int k
+        cdef bint tile_needed
+        cdef NonagaPiece piece
+        cdef tuple original_position, move
+        cdef bint parried
+
+        # a piece move that stops every threat on its own is the cheapest parry to find,
+        # so tile moves are only tried in the second pass
+        for tile_needed in range(2):
+            for k in range(num_piece_moves):
+                piece = board.get_piece_at_cell(piece_move_from(piece_moves[k]))
+                original_position = piece.get_position()
+                move = board.cell_position(piece_move_to(piece_moves[k]), piece.q, piece.r)
+                game_state.move_piece(piece, move)
+                if tile_needed:
+                    parried = self.tile_move_parries(game_state, opponent_color)
+                else:
+                    parried = not game_state.has_winning_piece_move(opponent_color)
+                game_state.undo_piece_move(piece, original_position)
+                if parried:
+                    return True
+        return False
+
+    cdef bint tile_move_parries(self, NonagaLogic game_state, int opponent_color):
+        """Looks for a tile move after which the opponent has no winning slide.
+
+        Only tile moves touching a threatening slide are tried: lifting a tile
+        from its path or filling the gap that stops it.
+        """
+        cdef list threats = game_state.get_winning_piece_moves(opponent_color)
+        cdef set footprint = threat_footprint(threats)
+        cdef NonagaIsland island = <NonagaIsland>game_state.board.islands[0]
+        cdef NonagaTile tile
+        cdef tuple original_position, move
+        cdef set destinations
+        cdef bint parried
+
+        for tile in list(island.get_movable_tiles()):
+            original_position = tile.get_position()
+            if original_position in footprint:
+                destinations = game_state._get_valid_tile_positions(tile, island)
+            else:
+                destinations = {cell for cell in footprint
+                                if game_state.is_valid_tile_destination(tile, cell)}
+            for move in destinations:
+                game_state.move_tile(tile, move)
+                parried = not game_state.has_winning_piece_move(opponent_color)
+                game_state.undo_tile_move(tile, original_position)
+                if parried:
+                    return True
+        return False
+
     cdef int cost_function(self, NonagaLogic game_state, bint maximizingPlayer, int max_color, list params):
         # for the AI, bigger better for the player lower better
         cdef int min_color = (max_color + 1) % 2
         cdef NonagaBoard board = game_state.board
         
-        # Get both piece sets at once to reduce board access
-        cdef list max_pieces = board.get_pieces(max_color)
-        cdef list min_pieces = board.get_pieces(min_color)
+        # Piece lists and pair distances are kept up to date by the game logic
+        cdef list max_pieces = <list>game_state.pieces_by_color[max_color]
+        cdef list min_pieces = <list>game_state.pieces_by_color[min_color]
         
         # Extract pieces and positions for max_color (AI)
         cdef NonagaPiece p0 = <NonagaPiece>max_pieces[0]
@@ -205,9 +332,9 @@ cdef class AI:
                 max_aligned += 1
         
         # Inline pieces_distance calculation for max pieces
-        cdef int d1 = p0.distance_to(p1)
-        cdef int d2 = p1.distance_to(p2)  
-        cdef int d3 = p2.distance_to(p0)
+        cdef int d1 = game_state.piece_distances[max_color][0]
+        cdef int d2 = game_state.piece_distances[max_color][1]
+        cdef int d3 = game_state.piece_distances[max_color][2]
         cdef int max_distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)
         
         # Calculate missing tiles and enemy pieces for max pieces
@@ -228,9 +355,9 @@ cdef class AI:
                 min_aligned += 1
         
         # Inline pieces_distance calculation for min pieces
-        d1 = mp0.distance_to(mp1)
-        d2 = mp1.distance_to(mp2)
-        d3 = mp2.distance_to(mp0)
+        d1 = game_state.piece_distances[min_color][0]
+        d2 = game_state.piece_distances[min_color][1]
+        d3 = game_state.piece_distances[min_color][2]
         cdef int min_distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)
         
         # Calculate missing tiles and enemy pieces for min pieces
@@ -290,9 +417,16 @@ cdef class AI:
         cdef NonagaTile actual_tile
         cdef tuple best_piece_move, best_tile_move
         cdef double score
-        result = self.minimax_piece(
-            game_state, self.depth, True, game_state.get_current_player(), NEG_INF, POS_INF)
-      
+        # the moves tried and undone by the search are not part of the game
+        change_feed = game_state.change_feed
+        game_state.change_feed = None
+        self.nodes = 0
+        try:
+            result = self.minimax_piece(
+                game_state, self.depth, True, game_state.get_current_player(), NEG_INF, POS_INF)
+        finally:
+            game_state.change_feed = change_feed
+
         score = result[0]
         best_piece_move = result[1]
         best_tile_move = result[2]
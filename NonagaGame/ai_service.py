@@ -0,0 +1,291 @@
+import argparse
+import asyncio
+import itertools
+import multiprocessing
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor
+
+if __name__ == "__main__":
+    # Build the extensions before the worker processes import them
+    from compiler import compile_cython_files
+    compile_cython_files()
+
+from nonaga_constants import AI_PARAM
+from ai_worker import search_batch
+from nonaga_symmetry import canonicalize_snapshot
+from protocol import MAX_MESSAGE_SIZE, MessageTooLong, ProtocolError, encode_message, read_message
+
+# Workers per search depth: deep searches get their own processes so they cannot starve the quick ones
+DEFAULT_POOLS = {1: 1, 2: 2, 3: 2, 4: 1}
+CACHE_SIZE = 100000     # searched positions kept in memory
+BATCH_SIZE = 4          # positions sent to a worker in one task
+BATCH_DELAY = 0.002     # seconds a request may wait for others to fill its batch
+
+
+def _to_move(move):
+    """Move tuple from its JSON form, where positions are lists."""
+    if move is None:
+        return None
+    (piece, piece_destination), (tile, tile_destination) = move
+    return (tuple(piece), tuple(piece_destination)), (tuple(tile), tuple(tile_destination))
+
+
+class AIService:
+    """Searches AI moves for many games at once.
+
+    Requests for the same position, depth and parameters are answered from a
+    cache shared by every client, or wait for the identical search already
+    running instead of starting another. Positions are keyed by their
+    canonical form, so rotated, mirrored, shifted or color-swapped copies of
+    a position share their search. Other requests are grouped in small
+    batches and searched by a process pool per depth.
+
+    Games in the same process call request_move() directly; other processes
+    connect to start() with AIServiceClient.
+    """
+
+    def __init__(self, pools=None, parameter=None, cache_size=CACHE_SIZE,
+                 batch_size=BATCH_SIZE, batch_delay=BATCH_DELAY):
+        """Initialize the service.
+
+        Args:
+            pools: dict of search depth -> number of worker processes
+            parameter: evaluation weights used when a request does not give any
+            cache_size: number of searched positions remembered
+            batch_size: maximum number of positions searched by one worker task
+            batch_delay: seconds to wait for a batch to fill before sending it
+        """
+        self.pool_sizes = dict(pools if pools is not None else DEFAULT_POOLS)
+        self.parameter = list(parameter if parameter is not None else AI_PARAM)
+        self.cache_size = cache_size
+        self.batch_size = batch_size
+        self.batch_delay = batch_delay
+        self.cache = OrderedDict()
+        self.stats = {"requests": 0, "cache_hits": 0, "joined": 0, "searched": 0, "batches": 0}
+        self._pools = {}
+        self._in_flight = {}    # key -> future shared by the identical requests
+        self._batches = {}      # (depth, parameter) -> [(key, snapshot)] waiting to be sent
+        self._server = None
+
+    def _get_pool(self, depth):
+        pool = self._pools.get(depth)
+        if pool is None:
+            pool = ProcessPoolExecutor(self.pool_sizes[depth], mp_context=multiprocessing.get_context("spawn"))
+            self._pools[depth] = pool
+        return pool
+
+    async def request_move(self, snapshot, depth, parameter=None):
+        """Best move for the player to move in a get_snapshot() position.
+
+        Returns:
+            ((piece position, destination), (tile position, destination))
+        """
+        if depth not in self.pool_sizes:
+            raise ValueError(f"No worker pool searches at depth {depth}.")
+        parameter = tuple(parameter if parameter is not None else self.parameter)
+        canonical, symmetry = canonicalize_snapshot(snapshot)
+        key = (canonical, depth, parameter)
+        self.stats["requests"] += 1
+
+        # Moves are cached and shared in the coordinates of the canonical position
+        if key in self.cache:
+            self.cache.move_to_end(key)
+            self.stats["cache_hits"] += 1
+            return symmetry.invert_move(self.cache[key])
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.stats["joined"] += 1
+        else:
+            future = asyncio.get_running_loop().create_future()
+            self._in_flight[key] = future
+            self._enqueue(depth, parameter, key, snapshot, symmetry)
+        # shield: a client giving up must not cancel the search other requests wait for
+        return symmetry.invert_move(await asyncio.shield(future))
+
+    def _enqueue(self, depth, parameter, key, snapshot, symmetry):
+        batch = self._batches.setdefault((depth, parameter), [])
+        batch.append((key, snapshot, symmetry))
+        if len(batch) >= self.batch_size:
+            self._flush(depth, parameter)
+        elif len(batch) == 1:
+            asyncio.get_running_loop().call_later(self.batch_delay, self._flush, depth, parameter)
+
+    def _flush(self, depth, parameter):
+        batch = self._batches.pop((depth, parameter), None)
+        if not batch:
+            return
+        self.stats["batches"] += 1
+        self.stats["searched"] += len(batch)
+        # called from call_later too, where an exception would only be logged and leave the requests waiting
+        try:
+            task = asyncio.get_running_loop().run_in_executor(
+                self._get_pool(depth), search_batch, list(parameter), depth, [snapshot for _, snapshot, _ in batch])
+        except Exception as error:
+            # e.g. a broken pool: the next batch starts a new one
+            pool = self._pools.pop(depth, None)
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+            self._fail(batch, error)
+            return
+        task.add_done_callback(lambda done: self._complete(batch, done))
+
+    def _complete(self, batch, done):
+        if done.cancelled():
+            self._fail(batch, asyncio.CancelledError())
+            return
+        error = done.exception()
+        if error is not None:
+            self._fail(batch, error)
+            return
+        for (key, _, symmetry), move in zip(batch, done.result()):
+            if move is None:
+                self._fail([(key, None, symmetry)], RuntimeError("The search found no move."))
+                continue
+            future = self._in_flight.pop(key, None)
+            move = symmetry.apply_move(move)
+            self.cache[key] = move
+            if len(self.cache) > self.cache_size:
+                self.cache.popitem(last=False)
+            if future is not None and not future.done():
+                future.set_result(move)
+
+    def _fail(self, batch, error):
+        """Give up the requests of a batch: every one waiting on it gets *error*."""
+        for key, _, _ in batch:
+            future = self._in_flight.pop(key, None)
+            if future is not None and not future.done():
+                future.set_exception(error)
+
+    # ── socket front end ──────────────────────────────────
+    async def start(self, host="127.0.0.1", port=0):
+        """Accept AIServiceClient connections; port 0 picks a free port, available as self.port."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_MESSAGE_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for pool in self._pools.values():
+            pool.shutdown(wait=False, cancel_futures=True)
+        self._pools = {}
+
+    async def _handle_connection(self, reader, writer):
+        tasks = set()
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                except MessageTooLong as e:
+                    writer.write(encode_message({"type": "error", "id": None, "message": str(e)}))
+                    break
+                except ProtocolError as e:
+                    writer.write(encode_message({"type": "error", "id": None, "message": str(e)}))
+                    continue
+                if message is None:
+                    break
+                # Requests of one connection are answered as they finish, not in order
+                task = asyncio.ensure_future(self._answer(writer, message))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+        finally:
+            for task in tasks:
+                task.cancel()
+            writer.close()
+
+    async def _answer(self, writer, message):
+        request_id = message.get("id")
+        try:
+            if message["type"] != "search":
+                raise ProtocolError(f"Unknown message type: {message['type']!r}")
+            move = await self.request_move(message["snapshot"], message["depth"], message.get("parameter"))
+            reply = {"type": "move", "id": request_id, "move": move}
+        except (ProtocolError, ValueError, KeyError, TypeError) as e:
+            reply = {"type": "error", "id": request_id, "message": str(e)}
+        if not writer.is_closing():
+            writer.write(encode_message(reply))
+
+
+class AIServiceClient:
+    """Connection to an AIService running in another process, with the same request_move() coroutine."""
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self._request_ids = itertools.count(1)
+        self._pending = {}
+        self._reader_task = None
+
+    async def connect(self, host="127.0.0.1", port=8766):
+        self.reader, self.writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE_SIZE)
+        self._reader_task = asyncio.ensure_future(self._read_replies())
+        return self
+
+    async def close(self):
+        if self._reader_task is not None:
+            self._reader_task.cancel()
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.writer = None
+
+    async def _read_replies(self):
+        try:
+            while True:
+                message = await read_message(self.reader)
+                if message is None:
+                    break
+                future = self._pending.pop(message.get("id"), None)
+                if future is None or future.done():
+                    continue
+                if message["type"] == "move":
+                    future.set_result(_to_move(message["move"]))
+                else:
+                    future.set_exception(ProtocolError(message.get("message")))
+        finally:
+            for future in self._pending.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("AI service connection closed."))
+            self._pending.clear()
+
+    async def request_move(self, snapshot, depth, parameter=None):
+        """Best move for the player to move in a get_snapshot() position, searched by the service."""
+        request_id = next(self._request_ids)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[request_id] = future
+        message = {"type": "search", "id": request_id, "snapshot": snapshot, "depth": depth}
+        if parameter is not None:
+            message["parameter"] = list(parameter)
+        self.writer.write(encode_message(message))
+        await self.writer.drain()
+        return await future
+
+
+async def _main(host, port, pools):
+    service = await AIService(pools).start(host, port)
+    print(f"Nonaga AI service listening on {host}:{service.port}", flush=True)
+    try:
+        await service.serve_forever()
+    finally:
+        await service.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Serve Nonaga AI moves to game servers.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8766)
+    parser.add_argument("--pool", action="append", default=None, metavar="DEPTH:WORKERS",
+                        help="worker processes for a search depth, can be repeated (default: 1:1 2:2 3:2 4:1)")
+    args = parser.parse_args()
+    pools = None
+    if args.pool:
+        pools = {int(depth): int(workers) for depth, workers in (pool.split(":") for pool in args.pool)}
+    asyncio.run(_main(args.host, args.port, pools))
@@ -0,0 +1,229 @@
+import multiprocessing
+import queue
+
+SEARCH = "search"
+PONDER = "ponder"
+PREDICTION = "prediction"
+RESULT = "result"
+
+
+def position_key(snapshot):
+    """Hashable key of a snapshot, equal for the same position whatever the order of its tiles and pieces.
+
+    Accepts snapshots decoded from JSON, where positions are lists.
+    """
+    return (tuple(sorted(tuple(position) for position in snapshot["tiles"])),
+            tuple(sorted((tuple(position), color) for position, color in snapshot["pieces"])),
+            snapshot["current_player"],
+            snapshot["turn_phase"])
+
+
+def _same_position(snapshot_a, snapshot_b):
+    """Compare two snapshots regardless of the order of their tiles and pieces."""
+    if snapshot_a is None or snapshot_b is None:
+        return False
+    return position_key(snapshot_a) == position_key(snapshot_b)
+
+
+def _search(parameter, depth, game, progress=None, cancel=None):
+    """Best move for the current player of *game* as positions, or None if the search was cancelled."""
+    from AI import AI, SearchCancelled
+
+    ai = AI(parameter, depth, game.get_current_player())
+
+    def report(done, total):
+        progress.value = done / total
+        return cancel.is_set()
+
+    if progress is not None:
+        ai.progress_callback = report
+    try:
+        (piece, piece_destination), (tile, tile_destination) = ai.get_best_move(game)
+    except SearchCancelled:
+        return None
+    return (piece.get_position(), piece_destination), (tile.get_position(), tile_destination)
+
+
+def search_snapshot(parameter, depth, snapshot):
+    """Best move for the player to move in a get_snapshot() position, searched in the calling process.
+
+    Returns:
+        ((piece position, destination), (tile position, destination))
+    """
+    from nonaga_logic import NonagaLogic
+
+    return _search(parameter, depth, NonagaLogic.from_snapshot(snapshot))
+
+
+def search_batch(parameter, depth, snapshots):
+    """search_snapshot over several positions in one call, to send a single task to a worker process."""
+    return [search_snapshot(parameter, depth, snapshot) for snapshot in snapshots]
+
+
+def _play(game, move):
+    (piece_position, piece_destination), (tile_position, tile_destination) = move
+    game.move_piece(game.board.get_piece(piece_position), piece_destination)
+    game.move_tile(game.board.get_tile(tile_position), tile_destination)
+
+
+def _worker_main(parameter, depth, tasks, results, progress, cancel):
+    """Worker process loop: runs searches until it receives None."""
+    from nonaga_logic import NonagaLogic
+    from nonaga_constants import RED, BLACK
+
+    while True:
+        task = tasks.get()
+        if task is None:
+            break
+        kind, task_id, snapshot = task
+        cancel.clear()
+        progress.value = 0.0
+        game = NonagaLogic.from_snapshot(snapshot)
+
+        if kind == PONDER:
+            # Guess the opponent's move with the same evaluation, then search our reply to it
+            predicted_move = _search(parameter, depth, game, progress, cancel)
+            if predicted_move is None:
+                results.put((RESULT, task_id, None))
+                continue
+            _play(game, predicted_move)
+            if game.check_win_condition(RED) or game.check_win_condition(BLACK):
+                results.put((RESULT, task_id, None))
+                continue
+            results.put((PREDICTION, task_id, game.get_snapshot()))
+            progress.value = 0.0
+
+        results.put((RESULT, task_id, _search(parameter, depth, game, progress, cancel)))
+
+
+class AIWorker:
+    """Runs AI searches in a background process so the game window keeps rendering.
+
+    The search is started with request_move() and polled every frame with the
+    same call until it returns a move. While the opponent thinks, ponder()
+    predicts their move and searches the reply in advance; if the opponent
+    plays the predicted move, request_move() reuses that search.
+    """
+
+    def __init__(self, parameter, depth=2):
+        self.parameter = parameter
+        self.depth = depth
+        self._context = multiprocessing.get_context("spawn")
+        self._process = None
+        self._tasks = None
+        self._results = None
+        self._progress = None
+        self._cancel = None
+        self._task_id = 0
+        self._task_kind = None
+        self._task_snapshot = None
+        self._prediction = None
+        self._result = None
+        self._done = False
+
+    def _ensure_started(self):
+        if self._process is not None and self._process.is_alive():
+            return
+        self._tasks = self._context.Queue()
+        self._results = self._context.Queue()
+        self._progress = self._context.Value("d", 0.0)
+        self._cancel = self._context.Event()
+        self._process = self._context.Process(
+            target=_worker_main,
+            args=(self.parameter, self.depth, self._tasks, self._results, self._progress, self._cancel),
+            daemon=True,
+        )
+        self._process.start()
+
+    def _submit(self, kind, snapshot):
+        self._ensure_started()
+        self._task_id += 1
+        self._task_kind = kind
+        self._task_snapshot = snapshot
+        self._prediction = None
+        self._result = None
+        self._done = False
+        self._tasks.put((kind, self._task_id, snapshot))
+
+    def _drain(self):
+        """Collect the messages of the current task, dropping those of cancelled ones."""
+        if self._results is None:
+            return
+        while True:
+            try:
+                kind, task_id, payload = self._results.get_nowait()
+            except queue.Empty:
+                return
+            if task_id != self._task_id:
+                continue
+            if kind == PREDICTION:
+                self._prediction = payload
+            else:
+                self._result = payload
+                self._done = True
+
+    @property
+    def busy(self):
+        """True while a search or a ponder is running."""
+        return self._task_kind is not None and not self._done
+
+    @property
+    def progress(self):
+        """Share of the root moves of the running search already explored, between 0 and 1."""
+        return self._progress.value if self._progress is not None else 0.0
+
+    def request_move(self, game_logic):
+        """Start or continue the search for the player to move.
+
+        Returns:
+            ((piece position, destination), (tile position, destination)) once
+            the search is over, None while it is still running.
+        """
+        self._drain()
+        snapshot = game_logic.get_snapshot()
+
+        if self._task_kind == PONDER and self._prediction is not None and _same_position(self._prediction, snapshot):
+            # Ponder hit: the reply to this position is being (or has been) searched already
+            self._task_kind = SEARCH
+            self._task_snapshot = snapshot
+        elif self._task_kind != SEARCH or not _same_position(self._task_snapshot, snapshot):
+            self.cancel()
+            self._submit(SEARCH, snapshot)
+            return None
+
+        if not self._done:
+            return None
+        result = self._result
+        self._task_kind = None
+        self._task_snapshot = None
+        return result
+
+    def ponder(self, game_logic):
+        """Start thinking about the reply to the opponent's likely move, if not already doing so."""
+        self._drain()
+        snapshot = game_logic.get_snapshot()
+        if self._task_kind == PONDER and _same_position(self._task_snapshot, snapshot):
+            return
+        self.cancel()
+        self._submit(PONDER, snapshot)
+
+    def cancel(self):
+        """Stop the running search, its result will be ignored."""
+        if self.busy and self._cancel is not None:
+            self._cancel.set()
+        self._task_id += 1
+        self._task_kind = None
+        self._task_snapshot = None
+        self._prediction = None
+        self._result = None
+        self._done = False
+
+    def close(self):
+        """Stop the worker process."""
+        self.cancel()
+        if self._process is not None:
+            self._tasks.put(None)
+            self._process.join(timeout=1)
+            if self._process.is_alive():
+                self._process.terminate()
+            self._process = None
@@ -0,0 +1,285 @@
+"""Strength against cost of AI configurations.
+
+A player is a search configuration with a parameter set of parameters.json:
+"ab:2" is the alpha-beta AI at depth 2, "mcts:0.5" the MCTS player with 0.5
+seconds per move. Every pair of players plays the same seeded openings, each
+with both colours, and every move is timed and its search counted: positions
+with a piece to move for AI, playouts for MCTS, which are reported apart since
+they do not compare. Each game process runs on cores of its own, so that the
+times are not those of processes competing for a core. The results are printed
+as tables and written to a JSON file; the games are journaled one per line
+next to it, so that an interrupted run resumes where it stopped.
+
+    python NonagaGame/benchmark.py --configs ab:1 ab:2 mcts:0.5 --params 0 1 --openings 10
+"""
+import argparse
+import concurrent.futures
+import itertools
+import json
+import multiprocessing
+import os
+import random
+import statistics
+import time
+
+if __name__ == "__main__":
+    from compiler import compile_cython_files
+    compile_cython_files()
+
+from nonaga_constants import RED, BLACK
+from nonaga_logic import NonagaLogic
+from nonaga_mcts import MCTS
+from build_endgame import play_random_turn
+from AI import AI
+
+KINDS = ("ab", "mcts")
+# what the search size of a move counts, by kind of player
+SEARCH_UNITS = {"ab": "positions", "mcts": "playouts"}
+
+
+def parse_config(text):
+    """("ab", depth) or ("mcts", seconds per move) from "ab:2" or "mcts:0.5"."""
+    kind, _, budget = text.partition(":")
+    if kind not in KINDS or not budget:
+        raise ValueError(f"Unknown configuration {text!r}, expected ab:DEPTH or mcts:SECONDS.")
+    return (kind, int(budget)) if kind == "ab" else (kind, float(budget))
+
+
+def make_player(config, parameter, color, threads=1):
+    kind, budget = parse_config(config)
+    if kind == "ab":
+        return AI(parameter, budget, color)
+    return MCTS(parameter, color, time_limit=budget, threads=threads)
+
+
+def cores():
+    """The cores this process may run on."""
+    if hasattr(os, "sched_getaffinity"):
+        return sorted(os.sched_getaffinity(0))
+    return list(range(os.cpu_count() or 1))
+
+
+def _pin_worker(slices):
+    """Pool initializer: run the worker on a slice of cores no other worker uses."""
+    if hasattr(os, "sched_setaffinity"):
+        os.sched_setaffinity(0, slices.get())
+
+
+def game_key(task):
+    """Identifies a game by everything that decides it, so that a journal is only reused for the same games."""
+    return json.dumps(task)
+
+
+def play_game(task):
+    """Play one game of the benchmark; returns its record.
+
+    task is (red label, red config, red parameter, black label, black config,
+    black parameter, opening, seed, opening_turns, max_moves, threads). The
+    opening is opening_turns random turns drawn from the seed and the opening
+    number, the same for every pairing; threads is the number of search
+    threads of the MCTS players.
+    """
+    (red, red_config, red_parameter, black, black_config, black_parameter,
+     opening, seed, opening_turns, max_moves, threads) = task
+    rng = random.Random(seed * 1000003 + opening)
+    game = NonagaLogic(new_game=True)
+    for _ in range(opening_turns):
+        play_random_turn(game, rng)
+    # MCTS draws its seeds from the random module
+    random.seed(rng.getrandbits(64))
+    players = {RED: make_player(red_config, red_parameter, RED, threads),
+               BLACK: make_player(black_config, black_parameter, BLACK, threads)}
+    moves = {"red": [], "black": []}
+    winner = None
+    turns = 0
+    while turns < max_moves and winner is None:
+        color = game.get_current_player()
+        player = players[color]
+        start = time.perf_counter()
+        (piece, piece_destination), (tile, tile_destination) = player.get_best_move(game)
+        seconds = time.perf_counter() - start
+        nodes = player.nodes if isinstance(player, AI) else player.last_iterations
+        moves["red" if color == RED else "black"].append([seconds, nodes])
+        game.move_piece(piece, piece_destination)
+        game.move_tile(tile, tile_destination)
+        turns += 1
+        if game.check_win_condition(RED):
+            winner = "red"
+        elif game.check_win_condition(BLACK):
+            winner = "black"
+    return {"key": game_key(task), "red": red, "black": black, "opening": opening, "winner": winner,
+            "turns": turns, "moves": moves}
+
+
+def load_journal(path):
+    """Records of the games already played, by game_key."""
+    records = {}
+    if os.path.exists(path):
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    record = json.loads(line)
+                    records[record["key"]] = record
+    return records
+
+
+def percentile(values, fraction):
+    ordered = sorted(values)
+    if not ordered:
+        return 0.0
+    return ordered[min(len(ordered) - 1, int(fraction * len(ordered)))]
+
+
+def cost(moves, unit):
+    """Mean and p95 seconds per move and mean search size per move, counted in *unit*."""
+    seconds = [s for s, _ in moves]
+    return {"moves": len(moves),
+            "mean_latency": statistics.mean(seconds) if seconds else 0.0,
+            "p95_latency": percentile(seconds, 0.95),
+            "mean_search": statistics.mean(n for _, n in moves) if moves else 0.0,
+            "search_unit": unit}
+
+
+def search_unit(player):
+    """Unit of the search size of a player labelled CONFIG/pINDEX."""
+    return SEARCH_UNITS[parse_config(player.rpartition("/")[0])[0]]
+
+
+def summarize(players, records):
+    """Statistics of each pairing (first player's point of view) and of each player over all its games."""
+    pairings = []
+    for a, b in itertools.combinations(players, 2):
+        games = [r for r in records if {r["red"], r["black"]} == {a, b}]
+        if not games:
+            continue
+        wins = sum(1 for r in games if r["winner"] is not None and r[r["winner"]] == a)
+        losses = sum(1 for r in games if r["winner"] is not None and r[r["winner"]] == b)
+        draws = len(games) - wins - losses
+        pairings.append({"player": a, "opponent": b, "games": len(games), "wins": wins, "draws": draws,
+                         "losses": losses, "win_rate": (wins + draws / 2) / len(games),
+                         "player_cost": cost([m for r in games for side in ("red", "black")
+                                              if r[side] == a for m in r["moves"][side]], search_unit(a)),
+                         "opponent_cost": cost([m for r in games for side in ("red", "black")
+                                                if r[side] == b for m in r["moves"][side]], search_unit(b))})
+    summary = []
+    for player in players:
+        games = [r for r in records if player in (r["red"], r["black"])]
+        points = sum(1.0 if r["winner"] is not None and r[r["winner"]] == player else
+                     0.5 if r["winner"] is None else 0.0 for r in games)
+        summary.append({"player": player, "games": len(games),
+                        "score": points / len(games) if games else 0.0,
+                        **cost([m for r in games for side in ("red", "black")
+                                if r[side] == player for m in r["moves"][side]], search_unit(player))})
+    return pairings, summary
+
+
+def print_tables(pairings, summary, target=None):
+    print(f"{'player':<16} {'opponent':<16} {'games':>5} {'W-D-L':>10} {'win rate':>8} "
+          f"{'mean ms':>9} {'p95 ms':>9} {'search per move':>20}")
+    for p in pairings:
+        c = p["player_cost"]
+        record = f"{p['wins']}-{p['draws']}-{p['losses']}"
+        search = f"{c['mean_search']:.0f} {c['search_unit']}"
+        print(f"{p['player']:<16} {p['opponent']:<16} {p['games']:>5} {record:>10} {p['win_rate']:>8.3f} "
+              f"{c['mean_latency'] * 1000:>9.1f} {c['p95_latency'] * 1000:>9.1f} {search:>20}")
+    print()
+    print(f"{'player':<16} {'games':>5} {'score':>6} {'mean ms':>9} {'p95 ms':>9} {'search per move':>20}")
+    for s in sorted(summary, key=lambda s: s["mean_latency"]):
+        search = f"{s['mean_search']:.0f} {s['search_unit']}"
+        print(f"{s['player']:<16} {s['games']:>5} {s['score']:>6.3f} {s['mean_latency'] * 1000:>9.1f} "
+              f"{s['p95_latency'] * 1000:>9.1f} {search:>20}")
+    if target is not None:
+        reaching = [s for s in summary if s["games"] and s["score"] >= target]
+        if reaching:
+            cheapest = min(reaching, key=lambda s: s["mean_latency"])
+            print(f"\nCheapest player scoring at least {target}: {cheapest['player']}")
+        else:
+            print(f"\nNo player scores at least {target}.")
+
+
+def benchmark(configs, parameters, param_indices, openings=10, seed=0, opening_turns=2, max_moves=30,
+              workers=None, output="benchmark.json", target=None, threads=1):
+    """Play every pairing of the players the configurations and parameter sets make, then report.
+
+    Each game process gets *threads* cores of its own (the search threads of
+    an MCTS player), so by default there are as many processes as that
+    leaves; more workers than cores/threads would share cores and skew the
+    times. Games already in the journal (output + ".games.jsonl") are not
+    played again, so a run can be stopped and started again with the same
+    arguments.
+    """
+    for config in configs:
+        parse_config(config)
+    available = cores()
+    slots = max(1, len(available) // threads)
+    workers = min(workers or slots, slots)
+    players = {f"{config}/p{i}": (config, parameters[i]) for config in configs for i in param_indices}
+    labels = list(players)
+    tasks = []
+    for a, b in itertools.combinations(labels, 2):
+        for opening in range(openings):
+            for red, black in ((a, b), (b, a)):
+                tasks.append((red, *players[red], black, *players[black], opening, seed, opening_turns, max_moves,
+                              threads))
+
+    journal = output + ".games.jsonl"
+    done = load_journal(journal)
+    todo = [task for task in tasks if game_key(task) not in done]
+    print(f"{len(labels)} players, {len(tasks)} games, {len(tasks) - len(todo)} already in {journal}, "
+          f"{workers} processes on {threads} cores each")
+
+    core_slices = multiprocessing.Queue()
+    for i in range(workers):
+        core_slices.put(available[i * threads:(i + 1) * threads])
+    start = time.perf_counter()
+    with open(journal, "a") as f, \
+            concurrent.futures.ProcessPoolExecutor(max_workers=workers, initializer=_pin_worker,
+                                                   initargs=(core_slices,)) as executor:
+        futures = [executor.submit(play_game, task) for task in todo]
+        for count, future in enumerate(concurrent.futures.as_completed(futures), 1):
+            record = future.result()
+            done[record["key"]] = record
+            f.write(json.dumps(record) + "\n")
+            f.flush()
+            if count % 10 == 0 or count == len(todo):
+                print(f"{count}/{len(todo)} games played in {time.perf_counter() - start:.1f}s")
+
+    records = [done[game_key(task)] for task in tasks]
+    pairings, summary = summarize(labels, records)
+    print()
+    print_tables(pairings, summary, target)
+    with open(output, "w") as f:
+        json.dump({"settings": {"configs": configs, "params": param_indices, "openings": openings, "seed": seed,
+                                "opening_turns": opening_turns, "max_moves": max_moves, "threads": threads},
+                   "pairings": pairings, "players": summary}, f, indent=1)
+    print(f"\nResults written to {output}")
+    return pairings, summary
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Play seeded matches between AI configurations and "
+                                                 "compare their strength with their cost per move.")
+    parser.add_argument("--configs", nargs="+", default=["ab:1", "ab:2"],
+                        help="ab:DEPTH (alpha-beta AI) or mcts:SECONDS (MCTS with a time budget per move)")
+    parser.add_argument("--parameters", default="parameters.json", help="file of parameter sets")
+    parser.add_argument("--params", type=int, nargs="+", default=[0],
+                        help="indices of the parameter sets each configuration plays with")
+    parser.add_argument("--openings", type=int, default=10,
+                        help="random openings per pairing, each played with both colours")
+    parser.add_argument("--opening-turns", type=int, default=2, help="random turns of an opening")
+    parser.add_argument("--seed", type=int, default=0, help="seed of the openings and of MCTS")
+    parser.add_argument("--max-moves", type=int, default=30, help="turns after which a game is drawn")
+    parser.add_argument("--threads", type=int, default=1, help="search threads of the MCTS players, "
+                                                               "each game process getting as many cores")
+    parser.add_argument("--workers", type=int, default=None,
+                        help="processes playing games (default and maximum: cores / threads)")
+    parser.add_argument("--output", default="benchmark.json",
+                        help="JSON results; the games are journaled to OUTPUT.games.jsonl")
+    parser.add_argument("--target", type=float, default=None,
+                        help="also name the cheapest player whose overall score reaches this")
+    args = parser.parse_args()
+
+    with open(args.parameters) as f:
+        parameter_sets = json.load(f)
+    benchmark(args.configs, parameter_sets, args.params, args.openings, args.seed, args.opening_turns,
+              args.max_moves, args.workers, args.output, args.target, args.threads)
@@ -0,0 +1,97 @@
+import argparse
+import random
+import time
+from collections import Counter
+
+if __name__ == "__main__":
+    from compiler import compile_cython_files
+    compile_cython_files()
+
+from nonaga_constants import AI_PARAM, RED, BLACK
+from nonaga_logic import NonagaLogic
+from nonaga_endgame import EndgameBuilder, EndgameTable
+from nonaga_symmetry import canonical_key
+from AI import AI
+
+
+def play_random_turn(game, rng):
+    """Play a random piece move, then a random tile move."""
+    player = game.get_current_player()
+    piece_moves = [(position, destination)
+                   for position, destinations in game.get_all_valid_piece_moves().items()
+                   if game.board.get_piece(position).color == player
+                   for destination in destinations]
+    piece_position, piece_destination = rng.choice(piece_moves)
+    game.move_piece(game.board.get_piece(piece_position), piece_destination)
+    tile_moves = [(position, destination)
+                  for position, destinations in game.get_all_valid_tile_moves().items()
+                  for destination in destinations]
+    tile_position, tile_destination = rng.choice(tile_moves)
+    game.move_tile(game.board.get_tile(tile_position), tile_destination)
+
+
+def self_play_seeds(games, parameter=None, depth=1, randomness=0.3, max_turns=60, seed=None):
+    """Positions of AI games where a player has two pieces at most one cell apart.
+
+    A share of the moves is played at random so that the games do not all
+    follow the same line. Positions equivalent under the board symmetries are
+    only returned once.
+    """
+    rng = random.Random(seed)
+    parameter = list(parameter if parameter is not None else AI_PARAM)
+    seen = set()
+    seeds = []
+    for _ in range(games):
+        game = NonagaLogic()
+        for _ in range(max_turns):
+            if game.check_win_condition(RED) or game.check_win_condition(BLACK):
+                break
+            if game.may_connect_in_one_move(RED) or game.may_connect_in_one_move(BLACK):
+                key = canonical_key(game)
+                if key not in seen:
+                    seen.add(key)
+                    seeds.append(game.get_snapshot())
+            if rng.random() < randomness:
+                play_random_turn(game, rng)
+            else:
+                (piece, piece_destination), (tile, tile_destination) = AI(
+                    parameter, depth, game.get_current_player()).get_best_move(game)
+                game.move_piece(piece, piece_destination)
+                game.move_tile(tile, tile_destination)
+    return seeds
+
+
+def build(path, seeds, plies=4, radius=2, verbose=True):
+    """Expand and solve the seed positions, then write the table to path.
+
+    Returns:
+        the EndgameBuilder, to inspect the solved values
+    """
+    builder = EndgameBuilder(plies, radius)
+    start = time.perf_counter()
+    for k, snapshot in enumerate(seeds, 1):
+        builder.add_seed(NonagaLogic.from_snapshot(snapshot))
+        if verbose and k % 50 == 0:
+            print(f"{k}/{len(seeds)} seeds, {builder.expanded} positions expanded "
+                  f"({time.perf_counter() - start:.1f}s)", flush=True)
+    builder.solve()
+    builder.write(path)
+    if verbose:
+        distances = Counter(builder.values.values())
+        print(f"{len(builder.values)} positions solved in {time.perf_counter() - start:.1f}s: " +
+              ", ".join(f"{'win' if d > 0 else 'loss'} in {abs(d)}: {n}" for d, n in sorted(distances.items())))
+        with EndgameTable(path) as table:
+            print(f"{len(table)} positions written to {path}")
+    return builder
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build a Nonaga endgame table from self-play positions.")
+    parser.add_argument("output", help="table file to write")
+    parser.add_argument("--games", type=int, default=20, help="self-play games the seed positions come from")
+    parser.add_argument("--plies", type=int, default=4, help="piece and tile moves expanded from each seed")
+    parser.add_argument("--radius", type=int, default=2,
+                        help="distance to the attacker's pieces within which its tile moves are tried")
+    parser.add_argument("--seed", type=int, default=None, help="random seed of the self-play games")
+    args = parser.parse_args()
+    build(args.output, self_play_seeds(args.games, seed=args.seed), args.plies, args.radius)
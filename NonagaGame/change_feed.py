@@ -0,0 +1,199 @@
+import asyncio
+from collections import deque
+
+from protocol import encode_message
+
+KEYFRAME_INTERVAL = 20      # moves between two keyframes
+SUBSCRIBER_BUFFER = 64      # messages queued for a subscriber before it is resynchronized
+
+
+class ChangeFeed:
+    """Turns the moves played on a NonagaLogic into numbered events.
+
+    Every move gives a "delta" event: the piece or tile moved (from/to) and the
+    player and phase to play next. Every KEYFRAME_INTERVAL moves, and whenever a
+    whole position is loaded, a "keyframe" event carries the full position so
+    that late or lagging listeners can start over from it.
+
+    Listeners are called with each event dict, in sequence order.
+    """
+
+    def __init__(self, game_logic, keyframe_interval=KEYFRAME_INTERVAL):
+        self.game_logic = game_logic
+        self.keyframe_interval = keyframe_interval
+        self.sequence = 0
+        self.listeners = []
+        game_logic.change_feed = self
+
+    def detach(self):
+        self.game_logic.change_feed = None
+
+    def keyframe(self):
+        """Keyframe event of the current position, numbered like the last event emitted."""
+        message = {"type": "keyframe", "seq": self.sequence}
+        message.update(self.game_logic.get_snapshot())
+        return message
+
+    def piece_moved(self, origin, destination):
+        self._moved("piece", origin, destination)
+
+    def tile_moved(self, origin, destination):
+        self._moved("tile", origin, destination)
+
+    def position_loaded(self):
+        self.sequence += 1
+        self._emit(self.keyframe())
+
+    def _moved(self, kind, origin, destination):
+        self.sequence += 1
+        self._emit({"type": "delta", "seq": self.sequence, "kind": kind, "from": origin, "to": destination,
+                    "player": self.game_logic.current_player, "phase": self.game_logic.turn_phase})
+        if self.sequence % self.keyframe_interval == 0:
+            self._emit(self.keyframe())
+
+    def _emit(self, event):
+        for listener in self.listeners:
+            listener(event)
+
+
+class FeedReader:
+    """Rebuilds the position of a game from its feed events, on the receiving side.
+
+    Positions are compared as tuples, so events decoded from JSON can be applied.
+    """
+
+    def __init__(self):
+        self.sequence = None
+        self.tiles = None
+        self.pieces = None
+        self.current_player = None
+        self.turn_phase = None
+
+    def apply(self, event):
+        """Apply a "keyframe" or "delta" event.
+
+        Returns:
+            False if a delta does not follow the last event applied: the
+            position is then unknown until the next keyframe.
+        """
+        if event["type"] == "keyframe":
+            self.tiles = {tuple(position) for position in event["tiles"]}
+            self.pieces = {tuple(position): color for position, color in event["pieces"]}
+            self.current_player = event["current_player"]
+            self.turn_phase = event["turn_phase"]
+            self.sequence = event["seq"]
+            return True
+        if self.sequence is None or event["seq"] != self.sequence + 1:
+            self.sequence = None
+            return False
+        origin, destination = tuple(event["from"]), tuple(event["to"])
+        if event["kind"] == "piece":
+            self.pieces[destination] = self.pieces.pop(origin)
+        else:
+            self.tiles.remove(origin)
+            self.tiles.add(destination)
+        self.current_player = event["player"]
+        self.turn_phase = event["phase"]
+        self.sequence = event["seq"]
+        return True
+
+    def get_snapshot(self):
+        """The rebuilt position in the NonagaLogic.get_snapshot() format."""
+        return {
+            "tiles": sorted(self.tiles),
+            "pieces": sorted(self.pieces.items()),
+            "current_player": self.current_player,
+            "turn_phase": self.turn_phase,
+        }
+
+
+class Subscription:
+    """Messages of a FeedPublisher waiting to be read by one subscriber."""
+
+    def __init__(self, publisher, maxsize):
+        self.publisher = publisher
+        self.maxsize = maxsize
+        self.resyncs = 0
+        self._messages = deque()
+        self._ready = asyncio.Event()
+        self._closed = False
+
+    def _push(self, data, is_keyframe):
+        if len(self._messages) >= self.maxsize:
+            # Too slow: the queued deltas are worthless once a keyframe replaces them
+            self._messages.clear()
+            self.resyncs += 1
+            if not is_keyframe:
+                self._messages.append(self.publisher.keyframe_bytes())
+                self._ready.set()
+                return
+        self._messages.append(data)
+        self._ready.set()
+
+    async def get(self):
+        """Next encoded message, None once unsubscribed."""
+        while not self._messages:
+            if self._closed:
+                return None
+            self._ready.clear()
+            await self._ready.wait()
+        return self._messages.popleft()
+
+    def close(self):
+        self._closed = True
+        self._ready.set()
+        self.publisher._subscriptions.discard(self)
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        data = await self.get()
+        if data is None:
+            raise StopAsyncIteration
+        return data
+
+
+class FeedPublisher:
+    """Fans the events of a ChangeFeed out to many subscribers.
+
+    Each event is encoded once whatever the number of subscribers. A subscriber
+    that falls more than its buffer behind has its queued deltas replaced by
+    one keyframe, so a slow reader costs neither memory nor the other readers.
+    """
+
+    def __init__(self, feed, buffer_size=SUBSCRIBER_BUFFER):
+        self.feed = feed
+        self.buffer_size = buffer_size
+        self._subscriptions = set()
+        self._keyframe = None   # (sequence, encoded keyframe) of the latest keyframe built
+        feed.listeners.append(self._publish)
+
+    def close(self):
+        self.feed.listeners.remove(self._publish)
+        for subscription in list(self._subscriptions):
+            subscription.close()
+
+    def subscribe(self):
+        """Start receiving the encoded events, beginning with a keyframe of the current position."""
+        subscription = Subscription(self, self.buffer_size)
+        subscription._push(self.keyframe_bytes(), True)
+        self._subscriptions.add(subscription)
+        return subscription
+
+    def keyframe_bytes(self):
+        """Encoded keyframe of the current position, built once per sequence number."""
+        if self._keyframe is None or self._keyframe[0] != self.feed.sequence:
+            self._keyframe = (self.feed.sequence, encode_message(self.feed.keyframe()))
+        return self._keyframe[1]
+
+    def _publish(self, event):
+        data = encode_message(event)
+        is_keyframe = event["type"] == "keyframe"
+        if is_keyframe:
+            self._keyframe = (event["seq"], data)
+        for subscription in self._subscriptions:
+            subscription._push(data, is_keyframe)
+
+    def __len__(self):
+        return len(self._subscriptions)
@@ -0,0 +1,82 @@
+import asyncio
+
+from change_feed import FeedReader
+from protocol import MAX_MESSAGE_SIZE, encode_message, read_message
+
+
+class NonagaClient:
+    """Minimal asyncio client for NonagaServer, used to script games and to test the server over loopback."""
+
+    def __init__(self):
+        self.reader = None
+        self.writer = None
+        self.game_id = None
+        self.color = None
+        self.token = None
+        self.state = None
+        self.feed = FeedReader()
+
+    async def connect(self, host="127.0.0.1", port=8765):
+        self.reader, self.writer = await asyncio.open_connection(host, port, limit=MAX_MESSAGE_SIZE)
+        return self
+
+    async def close(self):
+        if self.writer is not None:
+            self.writer.close()
+            try:
+                await self.writer.wait_closed()
+            except ConnectionError:
+                pass
+            self.writer = None
+
+    async def send(self, message):
+        self.writer.write(encode_message(message))
+        await self.writer.drain()
+
+    async def receive(self):
+        """Next server message, None once the server closed the connection.
+
+        "joined" and "state" messages also update game_id, color, token and
+        state; "keyframe" and "delta" messages of a watched game update feed.
+        """
+        message = await read_message(self.reader)
+        if message is None:
+            return None
+        if message["type"] == "joined":
+            self.game_id = message["game_id"]
+            self.color = message["color"]
+            self.token = message["token"]
+        elif message["type"] == "state":
+            self.state = message
+        elif message["type"] in ("keyframe", "delta"):
+            self.feed.apply(message)
+        return message
+
+    async def wait_for(self, *types):
+        """Skip messages until one of the given types arrives and return it."""
+        while True:
+            message = await self.receive()
+            if message is None or message["type"] in types:
+                return message
+
+    async def create(self, opponent="human", color=0, depth=2):
+        await self.send({"type": "create", "opponent": opponent, "color": color, "depth": depth})
+        return await self.wait_for("joined", "error")
+
+    async def join(self, game_id):
+        await self.send({"type": "join", "game_id": game_id})
+        return await self.wait_for("joined", "error")
+
+    async def reconnect(self, game_id, token):
+        await self.send({"type": "reconnect", "game_id": game_id, "token": token})
+        return await self.wait_for("joined", "error")
+
+    async def watch(self, game_id):
+        """Follow a game as a spectator; its position is then kept in feed."""
+        await self.send({"type": "watch", "game_id": game_id})
+        return await self.wait_for("keyframe", "error")
+
+    async def move(self, kind, origin, destination):
+        """Send a "piece" or "tile" move and return the resulting state, or the error."""
+        await self.send({"type": "move", "kind": kind, "from": list(origin), "to": list(destination)})
+        return await self.wait_for("state", "error")
@@ -1,15 +1,119 @@
-import subprocess
-import shutil
+import hashlib
+import importlib.machinery
 import glob
+import json
 import sys
 import os
+import time
+from contextlib import contextmanager
 
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
 
-def compile_cython_files():
-    """Compiles the Cython files for improved performance."""
+STAMP_FILE = ".build_stamp"
+LOCK_FILE = ".build.lock"
+
+
+def _project_paths():
     # setup.py is in the project root (one level up from this file)
     project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
     nonaga_dir = os.path.join(project_root, "NonagaGame")
+    return project_root, nonaga_dir
+
+
+def cython_modules(nonaga_dir=None):
+    """Names of the extension modules: setup.py compiles every .pyx of NonagaGame."""
+    if nonaga_dir is None:
+        nonaga_dir = _project_paths()[1]
+    return sorted(os.path.splitext(os.path.basename(path))[0]
+                  for path in glob.glob(os.path.join(nonaga_dir, "*.pyx")))
+
+
+def _source_hash(project_root, nonaga_dir):
+    """Hashes the Cython sources, setup.py and the build flags of this interpreter."""
+    digest = hashlib.sha256()
+    sources = [os.path.join(project_root, "setup.py")]
+    for module in cython_modules(nonaga_dir):
+        for ext in (".pyx", ".pxd", ".h"):
+            path = os.path.join(nonaga_dir, module + ext)
+            if os.path.exists(path):
+                sources.append(path)
+    for path in sources:
+        digest.update(os.path.basename(path).encode())
+        with open(path, "rb") as f:
+            digest.update(f.read())
+
+    # The same sources compiled for another interpreter or with other flags are not interchangeable
+    digest.update(sys.version.encode())
+    digest.update(importlib.machinery.EXTENSION_SUFFIXES[0].encode())
+    for var in ("CC", "CFLAGS", "LDFLAGS"):
+        digest.update(f"{var}={os.environ.get(var, '')}".encode())
+    return digest.hexdigest()
+
+
+def _artifacts_exist(nonaga_dir):
+    suffix = importlib.machinery.EXTENSION_SUFFIXES[0]
+    return all(os.path.exists(os.path.join(nonaga_dir, module + suffix)) for module in cython_modules(nonaga_dir))
+
+
+def _read_stamp(nonaga_dir):
+    try:
+        with open(os.path.join(nonaga_dir, STAMP_FILE), "r") as f:
+            return json.load(f).get("hash")
+    except (OSError, ValueError):
+        return None
+
+
+def _write_stamp(nonaga_dir, source_hash):
+    stamp_path = os.path.join(nonaga_dir, STAMP_FILE)
+    tmp_path = f"{stamp_path}.{os.getpid()}"
+    with open(tmp_path, "w") as f:
+        json.dump({"hash": source_hash, "built_at": time.time()}, f)
+    os.replace(tmp_path, stamp_path)
+
+
+def _is_fresh(nonaga_dir, source_hash):
+    """Returns True if the compiled extensions match the current sources and build flags."""
+    return _artifacts_exist(nonaga_dir) and _read_stamp(nonaga_dir) == source_hash
+
+
+@contextmanager
+def _build_lock(lock_path):
+    """Holds the build lock so concurrent jobs on a shared filesystem do not compile twice.
+
+    The lock is an operating system lock on a file that stays in place: it
+    is released when its holder exits, even by crashing, so it is never
+    stale however long a build takes.
+    """
+    with open(lock_path, "a+b") as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            while True:
+                try:
+                    msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+                    break
+                except OSError:
+                    # LK_LOCK gives up after 10 seconds
+                    continue
+        try:
+            yield
+        finally:
+            if fcntl is not None:
+                fcntl.flock(f, fcntl.LOCK_UN)
+            else:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+def _build(project_root, nonaga_dir):
+    import subprocess
+    import shutil
+
     subprocess.check_call(
         [sys.executable, "setup.py", "build_ext", "--inplace"],
         cwd=project_root,
@@ -21,4 +125,35 @@ def compile_cython_files():
             os.remove(dest)
         shutil.move(ext_file, dest)
         print(f"Moved {os.path.basename(ext_file)} -> NonagaGame/")
+
+
+def compile_cython_files(force=False):
+    """Compiles the Cython files for improved performance.
+
+    The build is skipped when the extensions on disk were produced from the
+    current sources and build flags, unless *force* is set.
+
+    Returns:
+        True if a compilation was run, False if the existing build was reused.
+    """
+    project_root, nonaga_dir = _project_paths()
+    source_hash = _source_hash(project_root, nonaga_dir)
+    if not force and _is_fresh(nonaga_dir, source_hash):
+        return False
+
+    with _build_lock(os.path.join(nonaga_dir, LOCK_FILE)):
+        # Another process may have finished the build while we were waiting
+        if not force and _is_fresh(nonaga_dir, source_hash):
+            return False
+        _build(project_root, nonaga_dir)
+        _write_stamp(nonaga_dir, source_hash)
     print("Cython files compiled successfully.")
+    return True
+
+
+def report_startup_time(start_time, compiled, label="Startup"):
+    """Prints the time spent since *start_time* (a time.perf_counter() value) getting ready to run."""
+    elapsed = time.perf_counter() - start_time
+    build = "compiled" if compiled else "build reused"
+    print(f"{label}: {elapsed:.3f}s ({build})", flush=True)
+    return elapsed
@@ -1,12 +1,11 @@
-from turtle import color
-
 import pygame
 import math
 from nonaga_constants import *
 from nonaga_board import NonagaBoard, NonagaPiece, NonagaTile
 from nonaga_logic import NonagaLogic
-from AI import AI
-import cProfile
+from ai_worker import AIWorker
+from render_cache import RenderCache
+from hex_geometry import HexLayout
 
 class Game:
     """Manages the PyGame game loop and rendering."""
@@ -14,7 +13,8 @@ class Game:
     def __init__(self, ai:bool=False, screen_width=800, screen_height=500):
         """Initialize the game."""
         self.ai_playing: bool = ai
-        self.ai = AI(AI_PARAM)
+        # The AI searches in a background process so the window keeps responding
+        self.ai_worker = AIWorker(AI_PARAM, depth=2) if ai else None
         self.screen_width = screen_width
         self.screen_height = screen_height
         self.screen = None
@@ -41,6 +41,18 @@ class Game:
 
         self.board_center_x = None
         self.board_center_y = None
+        self.layout = HexLayout(HEX_SIZE)
+        # Tile or piece at each position, used for hit testing and rebuilt after every move
+        self._position_index = None
+
+        # Rendering caches, created in setup() once pygame is initialized
+        self.render_cache = None
+        self.title_font = None
+        self._board_layer = None
+        self._board_key = None
+        self._board_rect = None
+        self._title_rect = None
+        self._title_surface = None
 
     def setup(self):
         """Set up the game window and resources."""
@@ -49,6 +61,8 @@ class Game:
             (self.screen_width, self.screen_height), pygame.RESIZABLE)
         pygame.display.set_caption("Nonaga")
         self.clock = pygame.time.Clock()
+        self.render_cache = RenderCache(HEX_SIZE, CIRCLE_SIZE)
+        self.title_font = pygame.font.Font(None, 32)
 
     def run(self):
         """Main game loop."""
@@ -59,21 +73,12 @@ class Game:
             self.render_frame()
             self.ai_plays()
             self.update_game_state()
-            # debug
-            # last = ( list(self.game_logic.board.islands[0].pieces))
-            # if last != ( list(self.game_logic.board.islands[0].pieces)):
-            #     print(list(self.game_logic.board.islands[0].pieces)[0], '1')
             self.update_moves()
-            # if last != ( list(self.game_logic.board.islands[0].pieces)):
-            #     print(list(self.game_logic.board.islands[0].pieces)[0],'2')
             self.handle_events()
-            # if last != ( list(self.game_logic.board.islands[0].pieces)):
-            #     print(list(self.game_logic.board.islands[0].pieces)[0],'3')
-
             self.handle_moves()
-            # if last != ( list(self.game_logic.board.islands[0].pieces)):
-            #     print(list(self.game_logic.board.islands[0].pieces)[0], '4')
-            # print('-----')
+            self.clock.tick(self.fps)
+        if self.ai_worker is not None:
+            self.ai_worker.close()
         self.running = True
 
         while self.running and (self.game_logic.check_win_condition(RED) or self.game_logic.check_win_condition(BLACK)):
@@ -89,21 +94,76 @@ class Game:
         elif self.game_logic.check_win_condition(BLACK):
             self.title = "Black won!"
             self.running = False
+        elif self._is_ai_turn():
+            self.title = f"AI is thinking... {self.ai_worker.progress:.0%}"
         else:
             current_player = "Red" if self.game_logic.get_current_player() == RED else "Black"
             phase = "Piece" if self.game_logic.get_current_turn_phase() == PIECE_TO_MOVE else "Tile"
             self.title = f"{current_player} has to move a {phase}"
 
+    def _is_ai_turn(self):
+        """True when the AI has to play, the human's clicks are then ignored."""
+        return self.ai_playing and self.game_logic.get_current_player() == BLACK
+
     def render_frame(self):
-        """Clear screen and render game state."""
-        self.screen.fill((255, 255, 255))  # Clear screen with white background
+        """Redraw the parts of the window that changed since the last frame.
+
+        The board is drawn on an off-screen layer that is only rebuilt when the
+        tiles, pieces, highlighted moves or window size change; then only the
+        board and title areas that changed are pushed to the display.
+        """
         state = self.game_logic.get_board_state()
         self.board_center_x = self.screen.get_width() // 2
         self.board_center_y = self.screen.get_height() // 2
-        self.render(self.screen, state["tiles"], state["pieces"], self.last_clicked_tile_moves, self.last_clicked_piece_moves,
-                    self.board_center_x, self.board_center_y)
-        self._draw_title(self.screen)
-        pygame.display.flip()
+        self.layout.set_center(self.board_center_x, self.board_center_y)
+        highlight = self.last_clicked_piece.get_color() if self.last_clicked_piece is not None else None
+        board_key = (self.screen.get_size(),
+                     tuple(tile.get_position() for tile in state["tiles"]),
+                     tuple((piece.get_position(), piece.get_color()) for piece in state["pieces"]),
+                     tuple(self.last_clicked_tile_moves), tuple(self.last_clicked_piece_moves), highlight)
+        dirty = []
+        full_redraw = False
+        redraw_title = self._title_rect is None
+
+        if self._board_layer is None or self._board_layer.get_size() != self.screen.get_size():
+            # New or resized window: everything has to be drawn again
+            self._board_layer = pygame.Surface(self.screen.get_size())
+            self._board_key = None
+            self._board_rect = None
+            full_redraw = True
+
+        if board_key != self._board_key:
+            self._board_key = board_key
+            self._board_layer.fill((255, 255, 255))
+            board_rect = self.render(self._board_layer, state["tiles"], state["pieces"], self.last_clicked_tile_moves,
+                                     self.last_clicked_piece_moves)
+            if full_redraw:
+                changed = self.screen.get_rect()
+            elif self._board_rect is not None:
+                # Repaint where the board was and where it is now
+                changed = board_rect.union(self._board_rect)
+            else:
+                changed = board_rect
+            self._board_rect = board_rect
+            self.screen.blit(self._board_layer, changed, changed)
+            dirty.append(changed)
+            if self._title_rect is not None and self._title_rect.colliderect(changed):
+                redraw_title = True
+
+        title_surface = self.render_cache.text(self.title_font, self.title, (0, 0, 0))
+        title_rect = title_surface.get_rect(center=(self.screen.get_width() // 2, 32))
+        if redraw_title or title_rect != self._title_rect or title_surface is not self._title_surface:
+            if self._title_rect is not None and not full_redraw:
+                # Restore the board under the previous title
+                self.screen.blit(self._board_layer, self._title_rect, self._title_rect)
+                dirty.append(self._title_rect)
+            self.screen.blit(self._board_layer, title_rect, title_rect)
+            dirty.append(self._draw_title(self.screen))
+            self._title_rect = title_rect
+            self._title_surface = title_surface
+
+        if dirty:
+            pygame.display.update(dirty)
 
     def handle_events(self):
         """Handle user input events."""
@@ -129,87 +189,36 @@ class Game:
                     
 
     def ai_plays(self):
-
-        if self.ai_playing and self.game_logic.get_current_player() == BLACK:
-            self.title = "AI is thinking..."
-            self.render_frame()
-            
-            best_piece_move, best_tile_move = self.ai.get_best_move(self.game_logic)
-            
-            # Debug output for AI move ===================================
-            print("Best piece move:", best_piece_move)
-            print("Best tile move:", best_tile_move)
-            # end debug
-            
-            if best_piece_move is not None and best_tile_move is not None:
-                self.game_logic.move_piece(
-                    best_piece_move[0], best_piece_move[1])
-                self.game_logic.move_tile(best_tile_move[0], best_tile_move[1])
-                
-            # Debug output for board state after AI move ==================
-            pieces = self.game_logic.board.get_pieces(BLACK)
-            d1 = pieces[0].distance_to(pieces[1])
-            d2 = pieces[1].distance_to(pieces[2])
-            d3 = pieces[2].distance_to(pieces[0])
-            if d1 > d2 and d1 > d3:
-                print("Distance sum:", d2+d3)
-            elif d2 > d1 and d2 > d3:
-                print("Distance sum:", d3+d1)
-            else:
-                print("Distance sum:", d1+d2)
-            missing_count = 0
-
-            p1 = pieces[0].get_position()
-            p2 = pieces[1].get_position()
-            p3 = pieces[2].get_position()
-
-            q_min = min(p1[0], p2[0], p3[0])
-            q_max = max(p1[0], p2[0], p3[0])
-            r_min = min(p1[1], p2[1], p3[1])
-            r_max = max(p1[1], p2[1], p3[1])
-            s_min = min(p1[2], p2[2], p3[2])
-            s_max = max(p1[2], p2[2], p3[2])
-            enemy_count = 0
-            for q in range(q_min, q_max + 1):
-                for r in range(r_min, r_max + 1):
-                    s = -q - r
-                    if s < s_min or s > s_max:
-                        continue
-                    if self.game_logic.board.get_tile((q, r, s)) is None:
-                        missing_count += 1
-
-                    elif self.game_logic.board.get_piece((q, r, s)) is not None and self.game_logic.board.get_piece((q, r, s)).get_color() != BLACK:
-                            enemy_count += 1
-            print("Missing pieces black:", missing_count)
-            print("Enemy pieces:", enemy_count)
-            pieces = [piece.get_position() for piece in pieces]
-            aligned_count = 0
-            for i in range(3):
-                if pieces[0][i] == pieces[1][i]:
-                    aligned_count += 1
-                if pieces[1][i] == pieces[2][i]:
-                    aligned_count += 1
-                if pieces[2][i] == pieces[0][i]:
-                    aligned_count += 1
-            print("Black Aligned pieces:", aligned_count)
-            pieces = self.game_logic.board.get_pieces(RED)
-            pieces = [piece.get_position() for piece in pieces]
-            aligned_count = 0
-            for i in range(3):
-                if pieces[0][i] == pieces[1][i]:
-                    aligned_count += 1
-                if pieces[1][i] == pieces[2][i]:
-                    aligned_count += 1
-                if pieces[2][i] == pieces[0][i]:
-                    aligned_count += 1
-            print("Red Aligned pieces:", aligned_count)
-            # end debug
+        """Poll the background AI: play its move once found, ponder during the human's turn."""
+        if not self.ai_playing or self.game_logic.check_win_condition(RED) or self.game_logic.check_win_condition(BLACK):
+            return
+        if not self._is_ai_turn():
+            if self.game_logic.get_current_turn_phase() == PIECE_TO_MOVE:
+                self.ai_worker.ponder(self.game_logic)
+            return
+
+        best_move = self.ai_worker.request_move(self.game_logic)
+        if best_move is None:
+            return
+        best_piece_move, best_tile_move = best_move
+
+        self.game_logic.move_piece(
+            self.game_logic.board.get_piece(best_piece_move[0]), best_piece_move[1])
+        self.game_logic.move_tile(
+            self.game_logic.board.get_tile(best_tile_move[0]), best_tile_move[1])
+        self._position_index = None
         self.update_game_state()
 
-    
     def update_moves(self):
         """Update game state."""
-        
+        if self._is_ai_turn():
+            # Clicks made while the AI thinks must not move its pieces
+            self.last_clicked_piece_moves = []
+            self.last_clicked_tile_moves = []
+            self.piece_moving = None
+            self.tile_moving = None
+            return
+
         if self.last_clicked_piece is not None and self.last_clicked_piece.get_color() == self.game_logic.get_current_player() and self.game_logic.get_current_turn_phase() == PIECE_TO_MOVE:
             self.last_clicked_piece_moves = self.game_logic.get_all_valid_piece_moves().get(
                 self.last_clicked_piece.get_position(), [])
@@ -226,39 +235,38 @@ class Game:
 
     def handle_moves(self):
         """Handle move execution based on last clicked piece/tile and valid moves."""
+        if self._is_ai_turn():
+            return
 
         if self.last_clicked_piece_moves is not [] and self.piece_moving is not None and self.last_clicked_tile is not None and self.last_clicked_tile.get_position() in self.last_clicked_piece_moves:
 
             self.game_logic.move_piece(
                 self.piece_moving, self.last_clicked_tile.get_position())
+            self._position_index = None
             # to prevent highlighting possibe tile moves
             self.last_clicked_tile = None
         if self.tile_move_to is not None and self.tile_moving is not None and self.tile_move_to in self.last_clicked_tile_moves:
 
             self.game_logic.move_tile(self.tile_moving, self.tile_move_to)
+            self._position_index = None
 
-    def render(self, screen, tiles, pieces, tile_moves, piece_moves,
-               center_x=None, center_y=None):
-        """Render hexagons and circles on the board.
+    def render(self, screen, tiles, pieces, tile_moves, piece_moves):
+        """Render hexagons and circles on the board, placed by self.layout.
 
         Args:
             screen: pygame surface to render to
             tiles: list of NonagaTile objects to render as hexagons
             pieces: list of NonagaPiece objects to render as circles
-            hex_size: size of hexagons and circles (distance from center to vertex)
-            center_x: x-coordinate of board center (defaults to screen center)
-            center_y: y-coordinate of board center (defaults to screen center)
+
+        Returns:
+            pygame.Rect covering everything that was drawn
         """
-        # Set default center if not provided
-        if center_x is None:
-            center_x = screen.get_width() // 2
-        if center_y is None:
-            center_y = screen.get_height() // 2
+        drawn = []
 
         # Render hexagons first (tiles)
         for tile in tiles:
             q, r, s = tile.get_position()
-            self._draw_hexagon(screen, q, r, HEX_COLOR, center_x, center_y)
+            drawn.append(self._draw_hexagon(screen, q, r, HEX_COLOR))
 
         # Render circles on top (pieces)
         for piece in pieces:
@@ -266,83 +274,66 @@ class Game:
             # Determine circle color
             piece_color = RED_PIECE_COLOR if piece.get_color(
             ) == RED else BLACK_PIECE_COLOR  # Red or Black
-            self._draw_circle(screen, q, r,
-                              piece_color, center_x, center_y)
+            drawn.append(self._draw_circle(screen, q, r, piece_color))
 
         # Render possible moves for last clicked piece
         color = RED_PIECE_MOVE_COLOR if self.last_clicked_piece is not None and self.last_clicked_piece.get_color(
         ) == RED else BLACK_PIECE_MOVE_COLOR
         for move in piece_moves:
             q, r, s = move
-            self._draw_circle(screen, q, r,
-                              color, center_x, center_y)
+            drawn.append(self._draw_circle(screen, q, r, color))
 
         # Render possible moves for last clicked tile
         for move in tile_moves:
             q, r, s = move
-            self._draw_hexagon(
-                screen, q, r, HEX_MOVE_COLOR, center_x, center_y)
+            drawn.append(self._draw_hexagon(screen, q, r, HEX_MOVE_COLOR))
 
-    def _draw_hexagon(self, screen, q, r, color, center_x, center_y):
+        return drawn[0].unionall(drawn[1:]) if drawn else pygame.Rect(self.layout.center_x, self.layout.center_y, 0, 0)
+
+    def _draw_hexagon(self, screen, q, r, color):
         """Draw a hexagon at axial coordinates (q, r).
 
         Args:
             screen: pygame surface to draw on
             q: axial q coordinate
             r: axial r coordinate
-            center_x: x-coordinate of board center
-            center_y: y-coordinate of board center
-        """
-        # Convert axial coordinates to pixel coordinates
-        x, y = self._axial_to_pixel(q, r, center_x, center_y)
-        cx, cy = round(x), round(y)
-
-        # Generate hexagon vertices (flat-top orientation)
-        points = []
-        for i in range(6):
-            angle = math.pi / 3 * i
-            px = cx + HEX_SIZE * math.cos(angle)
-            py = cy + HEX_SIZE * math.sin(angle)
-            points.append((px, py))
-
-        # Draw the hexagon
-        pygame.draw.polygon(screen, color, points)
-        pygame.draw.polygon(screen, (0, 0, 0), points, 2)  # Draw border
-
-    def _draw_circle(self, screen, q, r, color, center_x, center_y):
-        """Draw a circle at axial coordinates (q, r).
+            color: RGB tuple for hexagon color
 
-        Args:
-            screen: pygame surface to draw on
-            q: axial q coordinate
-            r: axial r coordinate
-            color: RGB tuple for circle color
-            center_x: x-coordinate of board center
-            center_y: y-coordinate of board center
+        Returns:
+            pygame.Rect of the drawn area
         """
-        # Convert axial coordinates to pixel coordinates
-        x, y = self._axial_to_pixel(q, r, center_x, center_y)
+        x, y = self.layout.to_pixel(q, r)
 
-        # Draw the circle
-        pygame.draw.circle(screen, color, (round(x), round(y)), CIRCLE_SIZE)
+        # Blit the pre-rendered hexagon (flat-top orientation, with border)
+        sprite, (anchor_x, anchor_y) = self.render_cache.hexagon(color)
+        return screen.blit(sprite, (round(x) - anchor_x, round(y) - anchor_y))
 
-    def _axial_to_pixel(self, q, r, center_x, center_y):
-        """Convert axial coordinates to pixel coordinates.
+    def _draw_circle(self, screen, q, r, color):
+        """Draw a circle at axial coordinates (q, r).
 
         Args:
+            screen: pygame surface to draw on
             q: axial q coordinate
             r: axial r coordinate
-            center_x: x-coordinate of board center
-            center_y: y-coordinate of board center
+            color: RGB tuple for circle color
 
         Returns:
-            Tuple of (x, y) pixel coordinates
+            pygame.Rect of the drawn area
         """
-        # For flat-top hexagons, the spacing formula is:
-        x = HEX_SIZE * (3/2 * q)
-        y = HEX_SIZE * (math.sqrt(3)/2 * q + math.sqrt(3) * r)
+        x, y = self.layout.to_pixel(q, r)
+
+        # Blit the pre-rendered circle
+        sprite, (anchor_x, anchor_y) = self.render_cache.circle(color)
+        return screen.blit(sprite, (round(x) - anchor_x, round(y) - anchor_y))
 
-        return center_x + x, center_y + y
+    def _get_position_index(self):
+        """Map every occupied position to its piece, or to its tile if it holds no piece."""
+        if self._position_index is None:
+            state = self.game_logic.get_board_state()
+            self._position_index = {tile.get_position(): tile for tile in state["tiles"]}
+            for piece in state["pieces"]:
+                self._position_index[piece.get_position()] = piece
+        return self._position_index
 
     def _handle_mouse_motion(self, mouse_pos):
         """Handle mouse movement and update hovered piece/tile.
@@ -350,9 +341,6 @@ class Game:
         Args:
             mouse_pos: tuple of (x, y) mouse position
         """
-        state = self.game_logic.get_board_state()
-        mx, my = mouse_pos
-
         # Reset hovered piece first
         self.hovered_piece = None
 
@@ -360,37 +348,22 @@ class Game:
         self.hovered_tile = None
         self.hovered_tile_move_pos = None
 
-        # Check each tile for collision with mouse position
-        for tile in state["tiles"]:
-            q, r, s = tile.get_position()
-            # Convert axial coordinates to pixel coordinates
-            x, y = self._axial_to_pixel(
-                q, r, self.board_center_x, self.board_center_y)
-            # Check if mouse is over this hexagon
-            if self._point_in_hexagon(mx, my, x, y, HEX_SIZE):
-                # If there's a piece on this tile, prioritize the piece
-                if tile in state["pieces"]:
-                    self.hovered_piece = state["pieces"][state["pieces"].index(
-                        tile)]
-                else:
-                    self.hovered_tile = tile
-                return
-        if self.last_clicked_tile_moves is not [] and self.last_clicked_tile is not None:
-            for move in self.last_clicked_tile_moves:
-                q, r, s = move
-                x, y = self._axial_to_pixel(
-                    q, r, self.board_center_x, self.board_center_y)
-                if self._point_in_hexagon(mx, my, x, y, HEX_SIZE):
-                    self.hovered_tile_move_pos = (q, r, s)
-                    return
-
+        # The hexagon under the mouse is computed directly, no need to test every tile
+        position = self.layout.to_hex(*mouse_pos)
+        target = self._get_position_index().get(position)
+        if isinstance(target, NonagaPiece):
+            # If there's a piece on this tile, prioritize the piece
+            self.hovered_piece = target
+        elif target is not None:
+            self.hovered_tile = target
+        elif self.last_clicked_tile is not None and position in self.last_clicked_tile_moves:
+            self.hovered_tile_move_pos = position
 
     def _draw_title(self, screen, color=(0, 0, 0)):
         """Draw the title centered at the top of the window."""
-        font = pygame.font.Font(None, 32)
-        text_surface = font.render(self.title, True, color)
+        text_surface = self.render_cache.text(self.title_font, self.title, color)
         text_rect = text_surface.get_rect(center=(screen.get_width() // 2, 32))
-        screen.blit(text_surface, text_rect)
+        return screen.blit(text_surface, text_rect)
 
     def _point_in_circle(self, px, py, cx, cy, radius):
         """Check if a point is inside a circle.
@@ -405,58 +378,3 @@ class Game:
         """
         distance = math.sqrt((px - cx) ** 2 + (py - cy) ** 2)
         return distance <= radius
-
-    def _point_in_hexagon(self, px, py, hx, hy, size):
-        """Check if a point is inside a hexagon using distance to edges.
-
-        Args:
-            px, py: point coordinates
-            hx, hy: hexagon center coordinates
-            size: hexagon size (distance from center to vertex)
-
-        Returns:
-            True if point is inside the hexagon
-        """
-        # Translate point to hexagon center
-        dx = px - hx
-        dy = py - hy
-
-        # For a flat-top hexagon, check if point is within bounds
-        # Get the vertices of the hexagon
-        vertices = []
-        for i in range(6):
-            angle = math.pi / 3 * i
-            vx = hx + size * math.cos(angle)
-            vy = hy + size * math.sin(angle)
-            vertices.append((vx, vy))
-
-        # Use cross product method to check if point is inside polygon
-        return self._point_in_polygon(px, py, vertices)
-
-    def _point_in_polygon(self, px, py, vertices):
-        """Check if a point is inside a polygon using ray casting algorithm.
-
-        Args:
-            px, py: point coordinates
-            vertices: list of (x, y) tuples representing polygon vertices
-
-        Returns:
-            True if point is inside the polygon
-        """
-        n = len(vertices)
-        inside = False
-
-        p1x, p1y = vertices[0]
-        for i in range(1, n + 1):
-            p2x, p2y = vertices[i % n]
-            if py > min(p1y, p2y):
-                if py <= max(p1y, p2y):
-                    if px <= max(p1x, p2x):
-                        if p1y != p2y:
-                            xinters = (py - p1y) * (p2x - p1x) / \
-                                (p2y - p1y) + p1x
-                        if p1x == p2x or px <= xinters:
-                            inside = not inside
-            p1x, p1y = p2x, p2y
-
-        return inside
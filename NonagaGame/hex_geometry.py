@@ -0,0 +1,56 @@
+import math
+
+SQRT3 = math.sqrt(3)
+
+
+def cube_round(q, r, s):
+    """Round fractional cube coordinates to the cube coordinates of the hexagon containing them."""
+    rq, rr, rs = round(q), round(r), round(s)
+    dq, dr, ds = abs(rq - q), abs(rr - r), abs(rs - s)
+    # Rounding each coordinate alone may break q + r + s == 0, fix the one that moved the most
+    if dq > dr and dq > ds:
+        rq = -rr - rs
+    elif dr > ds:
+        rr = -rq - rs
+    else:
+        rs = -rq - rr
+    return rq, rr, rs
+
+
+class HexLayout:
+    """Conversions between flat-top hexagon coordinates and pixels.
+
+    Only depends on the hexagon size and the pixel position of the (0, 0, 0)
+    hexagon, so any front end drawing the board this way can share it.
+    """
+
+    def __init__(self, size, center_x=0, center_y=0):
+        """Initialize the layout.
+
+        Args:
+            size: distance from a hexagon center to its vertices, in pixels
+            center_x: x-coordinate of the (0, 0, 0) hexagon center
+            center_y: y-coordinate of the (0, 0, 0) hexagon center
+        """
+        self.size = size
+        self.center_x = center_x
+        self.center_y = center_y
+
+    def set_center(self, center_x, center_y):
+        """Move the board, e.g. after the window was resized."""
+        self.center_x = center_x
+        self.center_y = center_y
+
+    def to_pixel(self, q, r):
+        """Pixel coordinates (x, y) of the center of the hexagon at axial coordinates (q, r)."""
+        x = self.size * (3/2 * q)
+        y = self.size * (SQRT3/2 * q + SQRT3 * r)
+        return self.center_x + x, self.center_y + y
+
+    def to_hex(self, x, y):
+        """Cube coordinates (q, r, s) of the hexagon containing the pixel (x, y)."""
+        x = (x - self.center_x) / self.size
+        y = (y - self.center_y) / self.size
+        q = 2/3 * x
+        r = -1/3 * x + SQRT3/3 * y
+        return cube_round(q, r, -q - r)
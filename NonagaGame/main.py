@@ -1,21 +1,19 @@
-import subprocess
-import shutil
-import glob
-import sys
-import os
+import time
 
-from compiler import compile_cython_files
+STARTUP_TIME = time.perf_counter()
 
+from compiler import compile_cython_files, report_startup_time
 
-def game_loop():
+
+def game_loop(compiled=False):
     """Main entry point for the game."""
     # Import game modules here, after Cython compilation is done
-    from nonaga_board import NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile
-    from nonaga_logic import NonagaLogic
     from nonaga_constants import SCREEN_HEIGHT, SCREEN_WIDTH
     from menu_window import Menu
     from game_window import Game
 
+    report_startup_time(STARTUP_TIME, compiled)
+
     while True:
         # Show menu and get player choice
         menu = Menu(SCREEN_WIDTH, SCREEN_HEIGHT)
@@ -33,5 +31,5 @@ def game_loop():
 
 
 if __name__ == "__main__":
-    compile_cython_files()
-    game_loop()
+    compiled = compile_cython_files()
+    game_loop(compiled)
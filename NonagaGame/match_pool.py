@@ -0,0 +1,65 @@
+from contextlib import contextmanager
+
+from nonaga_constants import RED, BLACK
+from nonaga_logic import NonagaLogic
+from AI import AI
+
+
+class MatchPool:
+    """Games and AIs reused from match to match instead of being built for each one.
+
+    A match needs a NonagaLogic (its board, 19 tiles and 6 pieces) and two AI
+    objects; the pool resets released ones to the start position and to the
+    new parameters. It is not thread-safe: each process (or thread) keeps its
+    own, see process_pool.
+    """
+
+    def __init__(self):
+        self._free = []
+
+    def acquire(self, params_red, params_black, depth=1, quiescence=True):
+        """(game, ai_red, ai_black) ready to play a new match."""
+        if self._free:
+            game, ai_red, ai_black = self._free.pop()
+            game.reset()
+            ai_red.reset(params_red, depth, RED, quiescence)
+            ai_black.reset(params_black, depth, BLACK, quiescence)
+        else:
+            ai_red = AI(params_red, depth, RED, quiescence)
+            ai_black = AI(params_black, depth, BLACK, quiescence)
+            game = NonagaLogic(new_game=True)
+            # start from a reset board like the games played on reused ones
+            game.reset()
+        game.player_red = ai_red
+        game.player_black = ai_black
+        return game, ai_red, ai_black
+
+    def release(self, match):
+        """Give back the objects returned by acquire, which must not be used any more."""
+        game, _, _ = match
+        game.change_feed = None
+        self._free.append(match)
+
+    @contextmanager
+    def match(self, params_red, params_black, depth=1, quiescence=True):
+        """Context manager form of acquire and release."""
+        match = self.acquire(params_red, params_black, depth, quiescence)
+        try:
+            yield match
+        finally:
+            self.release(match)
+
+
+_process_pool = None
+
+
+def process_pool():
+    """The MatchPool of the current process, e.g. of a worker of a process pool.
+
+    A forked worker starts from a copy of its parent's pool and keeps its own
+    from then on.
+    """
+    global _process_pool
+    if _process_pool is None:
+        _process_pool = MatchPool()
+    return _process_pool
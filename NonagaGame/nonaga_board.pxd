@@ -1,5 +1,50 @@
 # cython: language_level=3
 
+# Occupancy grid: axial (q, r) coordinates wrapped onto a GRID_SIZE x GRID_SIZE torus.
+# The 19 tiles of the island never span half of GRID_SIZE, so wrapped cells never alias each other.
+cdef enum:
+    GRID_BITS = 6
+    GRID_SIZE = 64
+    GRID_MASK = 63
+    GRID_CELLS = 4096
+    MAX_PIECE_MOVES = 18    # 3 pieces x 6 directions
+    MAX_ISLAND_TILES = 19   # all the tiles of the game
+
+cdef enum:
+    CELL_EMPTY = 0
+    CELL_TILE = 1
+    CELL_PIECE = 2          # a tile holding a piece
+
+
+cdef inline int cell_index(int q, int r) nogil:
+    return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+
+cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:
+    """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+    return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2
+
+# Piece moves are encoded as a single int holding the origin and destination cells
+cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:
+    return (from_cell << (2 * GRID_BITS)) | to_cell
+
+cdef inline int piece_move_from(int move) nogil:
+    return move >> (2 * GRID_BITS)
+
+cdef inline int piece_move_to(int move) nogil:
+    return move & (GRID_CELLS - 1)
+
+
+# Grid rules on bare cell arrays, for code that works on copies of the board (see nonaga_position)
+cdef int step_cell(int cell, int direction) noexcept nogil
+cdef int neighbor_mask(const unsigned char* cells, int cell) noexcept nogil
+cdef bint is_movable_tile(int mask) noexcept nogil
+cdef bint is_valid_tile_destination_mask(int mask) noexcept nogil
+cdef void articulation_tiles(const unsigned char* cells, const int* tile_cells, int num_tiles,
+                             int* order, int* low, bint* cut) noexcept nogil
+cdef int slide_moves(const unsigned char* cells, const int* piece_cells, const int* piece_colors,
+                     int num_pieces, int color, int* moves) noexcept nogil
+
+
 cdef class NonagaTilesCoordinates:
     cdef public int q, r, s
     cdef public object island_id
@@ -23,6 +68,13 @@ cdef class NonagaPiece(NonagaTile):
 cdef class NonagaIsland:
     cdef public int id
     cdef public set movable_tiles, unmovable_tiles, all_tiles, border_tiles, pieces
+    cdef public dict frontier
+    cdef unsigned char occupied[GRID_CELLS]
+    cdef unsigned char neighbor_masks[GRID_CELLS]
+    cdef unsigned char articulation[GRID_CELLS]     # tiles whose removal would split the island
+    cdef int _tile_cells[3 * MAX_ISLAND_TILES]      # work arrays of _update_articulation
+    cdef bint _cut[MAX_ISLAND_TILES]
+    cdef tuple _saved                               # state recorded by _save, see NonagaBoard.reset
 
     cpdef int get_id(self)
     cpdef int get_number_of_tiles(self)
@@ -30,18 +82,35 @@ cdef class NonagaIsland:
     cpdef set get_movable_tiles(self)
     cpdef set get_pieces(self)
     cdef void _add_tile(self, NonagaTile tile)
-    cdef set _get_tile_coords_set(self, tiles=*)
-    cdef list _get_neighbors(self, NonagaTile tile, set tile_coords_set=*)
-    cdef bint _neighbors_restrain_piece(self, list neighbors)
+    cdef void _clear(self)
+    cdef void _save(self)
+    cdef void _restore(self)
+    cdef list _update_articulation(self)
+    cdef list _articulation_after_move(self, int from_q, int from_r, int to_q, int to_r, int vacated_mask)
+    cdef void _place_in_frontier(self, int q, int r)
+    cdef void _lift_from_frontier(self, int q, int r)
+    cdef int _mask_without_tile(self, tuple position, int mask, NonagaTile tile)
+    cpdef set valid_tile_destinations(self, NonagaTile tile)
+    cdef list ordered_tile_destinations(self, NonagaTile tile)
+    cpdef bint is_valid_tile_destination(self, NonagaTile tile, tuple destination)
 
 
 cdef class NonagaBoard:
     cdef public dict islands
     cdef public list pieces, tiles
+    cdef unsigned char cells[GRID_CELLS]
+    cdef int piece_cells[6]
+    cdef int piece_colors[6]
+    cdef int num_pieces
 
     cdef tuple _initialize_board(self)
+    cdef void _set_content(self, list tiles, list pieces)
     cpdef NonagaPiece get_piece(self, tuple position)
     cpdef NonagaTile get_tile(self, tuple position)
     cpdef bint is_there_tile(self, tuple position)
     cpdef bint is_there_piece(self, tuple position)
     cpdef get_pieces(self, color=*)
+    cdef void _fill_cells(self)
+    cdef int fill_piece_moves(self, int color, int* moves) noexcept nogil
+    cdef NonagaPiece get_piece_at_cell(self, int cell)
+    cdef tuple cell_position(self, int cell, int reference_q, int reference_r)
@@ -1,4 +1,6 @@
 # cython: language_level=3, boundscheck=False, wraparound=False, profile=True
+cimport cython
+from libc.string cimport memcpy
 from nonaga_constants import RED, BLACK
 
 # ──────────────────────────────────────────────────────────
@@ -12,6 +14,159 @@ NEIGHBOR_OFFSETS[3] = [-1, 1,  0]
 NEIGHBOR_OFFSETS[4] = [-1, 0,  1]
 NEIGHBOR_OFFSETS[5] = [0, -1,  1]
 
+# Neighbor cell of every grid cell in each direction, the ray tables used to slide pieces
+cdef int[GRID_CELLS][6] CELL_STEPS
+cdef int _cell, _direction
+for _cell in range(GRID_CELLS):
+    for _direction in range(6):
+        CELL_STEPS[_cell][_direction] = cell_index(
+            (_cell >> GRID_BITS) + NEIGHBOR_OFFSETS[_direction][0],
+            (_cell & GRID_MASK) + NEIGHBOR_OFFSETS[_direction][1])
+
+# Slide directions in the order NonagaLogic used to scan them (dimension q, r, s; direction -1 then 1)
+cdef int[6] SLIDE_DIRECTIONS
+SLIDE_DIRECTIONS[:] = [4, 1, 0, 3, 2, 5]
+
+# Direction index of the unit offset (dq, dr), indexed by [dq + 1][dr + 1], -1 when not a neighbor
+cdef int[3][3] DIRECTION_OF
+DIRECTION_OF[:] = [[-1, 4, 3], [5, -1, 2], [0, 1, -1]]
+
+
+cdef bint _mask_restrains_piece(int mask):
+    """Whether a tile can slide in or out between the neighbors flagged in a 6-bit mask.
+
+    It can when the neighbors follow each other around the ring, or when 3
+    neighbors leave two adjacent sides free, whichever side that is.
+    """
+    cdef int count = 0, runs = 0, i
+    for i in range(6):
+        if mask & (1 << i):
+            count += 1
+            # a run of neighbors starts where the previous side is free
+            if not mask & (1 << ((i + 5) % 6)):
+                runs += 1
+    if count == 0 or count == 6:
+        return True
+    return runs == 1 or (runs == 2 and count == 3)
+
+
+# Whether an empty cell with the given tile-neighbor mask can receive a moved tile
+cdef bint[64] VALID_TILE_DESTINATION
+# Whether a free tile with the given tile-neighbor mask can slide out of the island (see also articulation_tiles)
+cdef bint[64] MOVABLE_TILE
+# Whether the tile neighbors of a cell form one unbroken arc or ring around it, so that they stay
+# connected to each other without it: such a tile is never an articulation tile (see move_tile)
+cdef bint[64] SINGLE_ARC
+cdef int _mask, _count, _runs
+for _mask in range(64):
+    _count = bin(_mask).count("1")
+    VALID_TILE_DESTINATION[_mask] = 2 <= _count <= 4 and (_count <= 2 or _mask_restrains_piece(_mask))
+    MOVABLE_TILE[_mask] = _count <= 2 or (_count <= 4 and _mask_restrains_piece(_mask))
+    _runs = sum(1 for _i in range(6) if _mask & (1 << _i) and not _mask & (1 << ((_i + 5) % 6)))
+    SINGLE_ARC[_mask] = _runs == 1 or _mask == 63
+
+
+# ──────────────────────────────────────────────────────────
+# Grid rules shared with the code working on bare cell arrays (see nonaga_position)
+# ──────────────────────────────────────────────────────────
+# Not profiled: they are called millions of times by searches and the trace hooks would dwarf them
+@cython.profile(False)
+cdef int step_cell(int cell, int direction) noexcept nogil:
+    """Neighbor of a cell in one of the six NEIGHBOR_OFFSETS directions."""
+    return CELL_STEPS[cell][direction]
+
+
+@cython.profile(False)
+cdef int neighbor_mask(const unsigned char* cells, int cell) noexcept nogil:
+    """Bit i is set when the neighbor of *cell* in direction i holds a tile (with or without a piece)."""
+    cdef int mask = 0, i
+    for i in range(6):
+        if cells[CELL_STEPS[cell][i]] != CELL_EMPTY:
+            mask |= 1 << i
+    return mask
+
+
+@cython.profile(False)
+cdef bint is_movable_tile(int mask) noexcept nogil:
+    return MOVABLE_TILE[mask]
+
+
+@cython.profile(False)
+cdef bint is_valid_tile_destination_mask(int mask) noexcept nogil:
+    return VALID_TILE_DESTINATION[mask]
+
+
+@cython.profile(False)
+cdef void _visit_articulation(const unsigned char* cells, const int* tile_cells, const int* index_of, int tile,
+                              int parent, int* order, int* low, bint* cut, int* counter) noexcept nogil:
+    """Depth-first step of Hopcroft and Tarjan's articulation point search."""
+    cdef int k, other, children = 0
+    cdef int cell
+    order[tile] = low[tile] = counter[0]
+    counter[0] += 1
+    for k in range(6):
+        cell = CELL_STEPS[tile_cells[tile]][k]
+        if cells[cell] == CELL_EMPTY:
+            continue
+        other = index_of[cell]
+        if order[other] < 0:
+            children += 1
+            _visit_articulation(cells, tile_cells, index_of, other, tile, order, low, cut, counter)
+            low[tile] = min(low[tile], low[other])
+            if parent >= 0 and low[other] >= order[tile]:
+                cut[tile] = True
+        elif other != parent:
+            low[tile] = min(low[tile], order[other])
+    if parent < 0 and children > 1:
+        cut[tile] = True
+
+
+@cython.profile(False)
+cdef void articulation_tiles(const unsigned char* cells, const int* tile_cells, int num_tiles,
+                             int* order, int* low, bint* cut) noexcept nogil:
+    """Flag in *cut* the tiles whose removal would split the island, in one depth-first pass.
+
+    *cells* is an occupancy grid where tiles are non-zero and every tile is
+    one of *tile_cells*; *order* and *low* are work arrays. All three hold
+    num_tiles entries like *tile_cells*.
+    """
+    # tile index of each occupied cell; only the entries of tile_cells are written and read
+    cdef int index_of[GRID_CELLS]
+    cdef int i, counter = 0
+    for i in range(num_tiles):
+        index_of[tile_cells[i]] = i
+        order[i] = -1
+        cut[i] = False
+    for i in range(num_tiles):
+        if order[i] < 0:
+            _visit_articulation(cells, tile_cells, index_of, i, -1, order, low, cut, &counter)
+
+
+@cython.profile(False)
+cdef int slide_moves(const unsigned char* cells, const int* piece_cells, const int* piece_colors,
+                     int num_pieces, int color, int* moves) noexcept nogil:
+    """Write the encoded slides of a player's pieces into *moves*, returning how many there are.
+
+    *moves* must hold at least MAX_PIECE_MOVES entries. A piece slides
+    over free tiles until the next cell is empty or holds a piece.
+    """
+    cdef int count = 0
+    cdef int i, k, origin, cell, destination
+    for i in range(num_pieces):
+        if piece_colors[i] != color:
+            continue
+        origin = piece_cells[i]
+        for k in range(6):
+            destination = -1
+            cell = CELL_STEPS[origin][SLIDE_DIRECTIONS[k]]
+            while cells[cell] == CELL_TILE:
+                destination = cell
+                cell = CELL_STEPS[cell][SLIDE_DIRECTIONS[k]]
+            if destination >= 0:
+                moves[count] = encode_piece_move(origin, destination)
+                count += 1
+    return count
+
 # Python-visible tuple version (kept for callers that read _NEIGHBOR_OFFSETS)
 _PY_NEIGHBOR_OFFSETS = (
     (1, -1, 0),
@@ -23,6 +178,13 @@ _PY_NEIGHBOR_OFFSETS = (
 )
 
 
+cdef inline tuple _cell_position(int cell, int reference_q, int reference_r):
+    """Position of a grid cell, unwrapped next to the (reference_q, reference_r) coordinates."""
+    cdef int q = unwrap_coordinate(cell >> GRID_BITS, reference_q)
+    cdef int r = unwrap_coordinate(cell & GRID_MASK, reference_r)
+    return (q, r, -q - r)
+
+
 #  NonagaTilesCoordinates
 cdef class NonagaTilesCoordinates:
     """Holds the hexagonal coordinates for all tiles on the Nonaga board."""
@@ -114,6 +276,8 @@ cdef class NonagaIsland:
         self.all_tiles = set()
         self.border_tiles = set()
         self.pieces = set()
+        # empty cells touching the island, mapped to the mask of their tile neighbors
+        self.frontier = {}
 
         if tiles is not None and pieces is not None:
             self.add_tiles(tiles)
@@ -123,13 +287,19 @@ cdef class NonagaIsland:
     # ── move operations ─────────────────────────────────
     def move_tile(self, NonagaTile tile, tuple position):
         cdef tuple prev = tile.get_position()
+        cdef int vacated_mask
         self.movable_tiles.discard(tile)
         self.unmovable_tiles.discard(tile)
         self.border_tiles.discard(tile)
         self.all_tiles.discard(tile)
+        self._lift_from_frontier(tile.q, tile.r)
+        self.articulation[cell_index(tile.q, tile.r)] = 0
+        vacated_mask = self.neighbor_masks[cell_index(tile.q, tile.r)]
         tile.set_position(position)
         self.all_tiles.add(tile)
-        self.update_tiles([prev, position])
+        self._place_in_frontier(tile.q, tile.r)
+        self.update_tiles([prev, position] + self._articulation_after_move(<int>prev[0], <int>prev[1], tile.q, tile.r,
+                                                                           vacated_mask))
 
     def move_piece(self, NonagaPiece piece, tuple position):
         cdef tuple prev = piece.get_position()
@@ -161,18 +331,20 @@ cdef class NonagaIsland:
     cdef void _add_tile(self, NonagaTile tile):
         tile.island_id = self.id
         self.movable_tiles.add(tile)
+        if tile not in self.all_tiles:
+            self._place_in_frontier(tile.q, tile.r)
         self.all_tiles.add(tile)
 
     def add_tile(self, NonagaTile tile):
         self._add_tile(tile)
-        self.update_tiles([tile.get_position()])
+        self.update_tiles([tile.get_position()] + self._update_articulation())
         self.border_tiles = self.movable_tiles | self.unmovable_tiles
 
     def add_tiles(self, list tiles):
         cdef NonagaTile t
         for t in tiles:
             self._add_tile(t)
-        self.update_tiles([t.get_position() for t in tiles])
+        self.update_tiles([t.get_position() for t in tiles] + self._update_articulation())
         self.border_tiles = self.movable_tiles | self.unmovable_tiles
 
     def add_piece(self, NonagaPiece piece):
@@ -198,74 +370,213 @@ cdef class NonagaIsland:
     def remove_piece(self, NonagaPiece piece):
         self.pieces.discard(piece)
 
-    # ── neighbor helpers ─────────────────────────────────
-    cdef set _get_tile_coords_set(self, tiles=None):
-        if tiles is None:
-            tiles = self.all_tiles
-        return {(<NonagaTile>t).get_position() for t in tiles}
-
-    cdef list _get_neighbors(self, NonagaTile tile, set tile_coords_set=None):
-        if tile_coords_set is None:
-            tile_coords_set = self._get_tile_coords_set()
-
-        cdef int q = tile.q, r = tile.r, s = tile.s
-        cdef int i
-        cdef tuple pos
-        cdef list neighbors = []
-
+    cdef void _clear(self):
+        """Remove every tile and piece, keeping the containers; the tiles must still be where they were added."""
+        cdef NonagaTile tile
+        for tile in self.all_tiles:
+            self._lift_from_frontier(tile.q, tile.r)
+            self.articulation[cell_index(tile.q, tile.r)] = 0
+        self.movable_tiles.clear()
+        self.unmovable_tiles.clear()
+        self.all_tiles.clear()
+        self.border_tiles.clear()
+        self.pieces.clear()
+        self.frontier.clear()
+
+    cdef void _save(self):
+        """Record the current state so that _restore can return to it once the tiles and pieces are back in place."""
+        self._saved = (set(self.movable_tiles), set(self.unmovable_tiles), set(self.all_tiles),
+                       set(self.border_tiles), set(self.pieces), dict(self.frontier),
+                       self.occupied[:GRID_CELLS], self.neighbor_masks[:GRID_CELLS],
+                       self.articulation[:GRID_CELLS])
+
+    cdef void _restore(self):
+        """Return to the state recorded by _save, without recomputing it."""
+        cdef bytes occupied, neighbor_masks, articulation
+        movable, unmovable, all_tiles, border, pieces, frontier, occupied, neighbor_masks, articulation = self._saved
+        self.movable_tiles.clear()
+        self.movable_tiles.update(movable)
+        self.unmovable_tiles.clear()
+        self.unmovable_tiles.update(unmovable)
+        self.all_tiles.clear()
+        self.all_tiles.update(all_tiles)
+        self.border_tiles.clear()
+        self.border_tiles.update(border)
+        self.pieces.clear()
+        self.pieces.update(pieces)
+        self.frontier.clear()
+        self.frontier.update(frontier)
+        memcpy(self.occupied, <const char*>occupied, GRID_CELLS)
+        memcpy(self.neighbor_masks, <const char*>neighbor_masks, GRID_CELLS)
+        memcpy(self.articulation, <const char*>articulation, GRID_CELLS)
+
+    # ── connectivity ─────────────────────────────────────
+    cdef list _update_articulation(self):
+        """Recompute which tiles hold the island together; returns the positions whose status changed.
+
+        One depth-first pass over all the tiles, in the island's own work
+        arrays. move_tile avoids it when the move cannot change any status.
+        """
+        cdef list tiles = list(self.all_tiles)
+        cdef int n = len(tiles), i, cell
+        cdef int* tile_cells = self._tile_cells
+        cdef list changed = []
+        cdef NonagaTile tile
+        if n > MAX_ISLAND_TILES:
+            raise ValueError(f"An island holds at most {MAX_ISLAND_TILES} tiles, not {n}.")
+        for i in range(n):
+            tile = <NonagaTile>tiles[i]
+            tile_cells[i] = cell_index(tile.q, tile.r)
+        # tile_cells is followed by the two work arrays of articulation_tiles
+        articulation_tiles(self.occupied, tile_cells, n, tile_cells + n, tile_cells + 2 * n, self._cut)
+        for i in range(n):
+            cell = tile_cells[i]
+            if self.articulation[cell] != self._cut[i]:
+                self.articulation[cell] = self._cut[i]
+                changed.append((<NonagaTile>tiles[i]).get_position())
+        return changed
+
+    cdef list _articulation_after_move(self, int from_q, int from_r, int to_q, int to_r, int vacated_mask):
+        """Articulation changes of a tile move from (from_q, from_r) to (to_q, to_r), the tile already placed.
+
+        When the tiles around the vacated cell (*vacated_mask*, taken before
+        the tile was placed again) and around the destination each form a
+        single arc, their paths through the moved tile can go round it
+        instead, so only the neighbors of the two cells and the moved tile
+        itself can change status. Those whose own neighbors form a single
+        arc (or none) cannot be articulation tiles; if one of them has its
+        neighbors in several arcs the whole island is searched again.
+        """
+        cdef int i, k, q, r, cell
+        cdef int[2] qs = [from_q, to_q]
+        cdef int[2] rs = [from_r, to_r]
+        cdef int[13] cells
+        cdef list changed = []
+        if not SINGLE_ARC[vacated_mask] or not SINGLE_ARC[self.neighbor_masks[cell_index(to_q, to_r)]]:
+            return self._update_articulation()
+        cells[0] = cell_index(to_q, to_r)
+        for i in range(2):
+            for k in range(6):
+                cell = CELL_STEPS[cell_index(qs[i], rs[i])][k]
+                cells[1 + 6 * i + k] = cell
+                if self.occupied[cell] and self.neighbor_masks[cell] and not SINGLE_ARC[self.neighbor_masks[cell]]:
+                    return self._update_articulation()
+        for i in range(13):
+            cell = cells[i]
+            if self.occupied[cell] and self.articulation[cell]:
+                self.articulation[cell] = 0
+                if i == 0:
+                    q, r = to_q, to_r
+                else:
+                    q = qs[(i - 1) // 6] + NEIGHBOR_OFFSETS[(i - 1) % 6][0]
+                    r = rs[(i - 1) // 6] + NEIGHBOR_OFFSETS[(i - 1) % 6][1]
+                changed.append((q, r, -q - r))
+        return changed
+
+    # ── tile destination frontier ───────────────────────
+    cdef void _place_in_frontier(self, int q, int r):
+        """A tile now occupies (q, r): update the masks of the surrounding empty cells."""
+        cdef int i, nq, nr, neighbor
+        self.occupied[cell_index(q, r)] = 1
+        self.frontier.pop((q, r, -q - r), None)
+        for i in range(6):
+            nq = q + NEIGHBOR_OFFSETS[i][0]
+            nr = r + NEIGHBOR_OFFSETS[i][1]
+            neighbor = cell_index(nq, nr)
+            self.neighbor_masks[neighbor] |= 1 << ((i + 3) % 6)
+            if not self.occupied[neighbor]:
+                self.frontier[(nq, nr, -nq - nr)] = self.neighbor_masks[neighbor]
+
+    cdef void _lift_from_frontier(self, int q, int r):
+        """The tile on (q, r) left: the cell may join the frontier and its empty neighbors lose a tile."""
+        cdef int i, nq, nr, neighbor
+        cdef int cell = cell_index(q, r)
+        self.occupied[cell] = 0
         for i in range(6):
-            pos = (q + NEIGHBOR_OFFSETS[i][0],
-                   r + NEIGHBOR_OFFSETS[i][1],
-                   s + NEIGHBOR_OFFSETS[i][2])
-            if pos in tile_coords_set:
-                neighbors.append(pos)
-        return neighbors
-
-    cdef bint _neighbors_restrain_piece(self, list neighbors):
-        if not neighbors:
-            return True
-
-        cdef set neighbor_set = set(neighbors)
-        cdef tuple start = <tuple>neighbors[0]
-        cdef set visited = {start}
-        cdef list queue = [start]
-        cdef tuple curr, adj_pos
-        cdef int cq, cr, cs, i
-        cdef int n_neighbors = len(neighbors)
-
-        while queue:
-            curr = <tuple>queue.pop(0)
-            cq = curr[0]; cr = curr[1]; cs = curr[2]
-            for i in range(6):
-                adj_pos = (cq + NEIGHBOR_OFFSETS[i][0],
-                           cr + NEIGHBOR_OFFSETS[i][1],
-                           cs + NEIGHBOR_OFFSETS[i][2])
-                if adj_pos in neighbor_set and adj_pos not in visited:
-                    visited.add(adj_pos)
-                    queue.append(adj_pos)
-
-        cdef int diff = len(visited) - n_neighbors
-        if diff < 0:
-            diff = -diff
-        return len(visited) == n_neighbors or (diff == 1 and n_neighbors == 3)
+            nq = q + NEIGHBOR_OFFSETS[i][0]
+            nr = r + NEIGHBOR_OFFSETS[i][1]
+            neighbor = cell_index(nq, nr)
+            self.neighbor_masks[neighbor] &= ~(1 << ((i + 3) % 6))
+            if not self.occupied[neighbor]:
+                if self.neighbor_masks[neighbor]:
+                    self.frontier[(nq, nr, -nq - nr)] = self.neighbor_masks[neighbor]
+                else:
+                    self.frontier.pop((nq, nr, -nq - nr), None)
+        if self.neighbor_masks[cell]:
+            self.frontier[(q, r, -q - r)] = self.neighbor_masks[cell]
+
+    cdef int _mask_without_tile(self, tuple position, int mask, NonagaTile tile):
+        """Neighbor mask of an empty cell once *tile* has been lifted from the island."""
+        cdef int dq = tile.q - <int>position[0]
+        cdef int dr = tile.r - <int>position[1]
+        if -1 <= dq <= 1 and -1 <= dr <= 1 and DIRECTION_OF[dq + 1][dr + 1] >= 0:
+            mask &= ~(1 << DIRECTION_OF[dq + 1][dr + 1])
+        return mask
+
+    cpdef set valid_tile_destinations(self, NonagaTile tile):
+        """Positions a tile of this island can be moved to.
+
+        A destination is an empty cell touching 2 to 4 of the remaining tiles
+        between which a tile can slide (_mask_restrains_piece), so only the
+        frontier has to be filtered.
+        """
+        cdef set destinations = set()
+        cdef tuple position
+        cdef int mask
+        if not self.occupied[cell_index(tile.q, tile.r)]:
+            return destinations
+        for position, mask in self.frontier.items():
+            if VALID_TILE_DESTINATION[self._mask_without_tile(position, mask, tile)]:
+                destinations.add(position)
+        return destinations
+
+    cdef list ordered_tile_destinations(self, NonagaTile tile):
+        """valid_tile_destinations as a list by increasing grid cell, the order in which nonaga_position lists them."""
+        cdef int cells[6 * MAX_ISLAND_TILES]
+        cdef int count = 0, i, cell
+        cdef tuple position
+        cdef int mask
+        if not self.occupied[cell_index(tile.q, tile.r)]:
+            return []
+        for position, mask in self.frontier.items():
+            if not VALID_TILE_DESTINATION[self._mask_without_tile(position, mask, tile)]:
+                continue
+            if count == 6 * MAX_ISLAND_TILES:
+                raise ValueError(f"An island holds at most {MAX_ISLAND_TILES} tiles.")
+            # insertion sort, there are a few dozen destinations at most
+            cell = cell_index(<int>position[0], <int>position[1])
+            i = count
+            while i > 0 and cells[i - 1] > cell:
+                cells[i] = cells[i - 1]
+                i -= 1
+            cells[i] = cell
+            count += 1
+        return [_cell_position(cells[i], tile.q, tile.r) for i in range(count)]
+
+    cpdef bint is_valid_tile_destination(self, NonagaTile tile, tuple destination):
+        """Check a single destination of a tile without listing all its valid positions."""
+        mask = self.frontier.get(destination)
+        if mask is None or not self.occupied[cell_index(tile.q, tile.r)]:
+            return False
+        return VALID_TILE_DESTINATION[self._mask_without_tile(destination, <int>mask, tile)]
 
     # ── update_tiles ─────────────────────────────────────
     def update_tiles(self, list coordinates=None):
         """Update movable / unmovable tiles.
 
-        If *coordinates* is given only those positions and their
+        A tile is movable when it holds no piece, can slide out between its
+        neighbors and is not an articulation tile, so that the island stays
+        in one piece. If *coordinates* is given only those positions and their
         neighbors are re-evaluated (incremental update).
         """
         cdef set all_tiles = self.all_tiles
-        cdef set tile_coords_set = self._get_tile_coords_set(all_tiles)
         cdef set tiles_to_update
         cdef set new_movable = set()
         cdef set new_unmovable = set()
-        cdef list neighbors
-        cdef int neighbor_count
-        cdef int q, r, s, i
+        cdef int q, r, s, i, cell
         cdef tuple coord
         cdef dict tile_by_position
+        cdef NonagaTile tile
 
         if coordinates is None:
             tiles_to_update = all_tiles
@@ -289,20 +600,11 @@ cdef class NonagaIsland:
                 return
 
         for tile in tiles_to_update:
-            neighbors = self._get_neighbors(<NonagaTile>tile, tile_coords_set)
-            neighbor_count = len(neighbors)
-
-            if tile in self.pieces:
-                new_unmovable.add(tile)
-            elif neighbor_count >= 5:
+            cell = cell_index(tile.q, tile.r)
+            if tile in self.pieces or self.articulation[cell] or not MOVABLE_TILE[self.neighbor_masks[cell]]:
                 new_unmovable.add(tile)
-            elif neighbor_count <= 2:
-                new_movable.add(tile)
             else:
-                if self._neighbors_restrain_piece(neighbors):
-                    new_movable.add(tile)
-                else:
-                    new_unmovable.add(tile)
+                new_movable.add(tile)
 
         if coordinates is None:
             self.movable_tiles = new_movable
@@ -328,6 +630,28 @@ cdef class NonagaIsland:
 # ══════════════════════════════════════════════════════════
 #  NonagaBoard
 # ══════════════════════════════════════════════════════════
+def _start_tiles(int radius=2):
+    cdef list coords = []
+    cdef int q, r, r_start, r_end
+    for q in range(-radius, radius + 1):
+        r_start = -radius if -q - radius < -radius else -q - radius
+        r_end = radius if -q + radius > radius else -q + radius
+        for r in range(r_start, r_end + 1):
+            coords.append((q, r, -q - r))
+    return tuple(coords)
+
+
+# the start position: a hexagon of 19 tiles with the pieces on alternate corners
+START_TILES = _start_tiles()
+START_PIECES = (
+    ((-2,  0,  2), RED),
+    ((-2,  2,  0), BLACK),
+    (( 0,  2, -2), RED),
+    (( 2,  0, -2), BLACK),
+    (( 2, -2,  0), RED),
+    (( 0, -2,  2), BLACK),
+)
+
 cdef class NonagaBoard:
     """Represents the state of the Nonaga game board."""
 
@@ -339,36 +663,77 @@ cdef class NonagaBoard:
             tiles = []
             pieces = []
 
+        self._set_content(tiles, pieces)
+
+    cdef void _set_content(self, list tiles, list pieces):
         cdef NonagaIsland island = NonagaIsland(island_id=0, tiles=tiles, pieces=pieces)
         self.islands = {0: island}
         self.pieces = pieces
         self.tiles = tiles
+        self._fill_cells()
+
+    def load_position(self, list tile_positions, list pieces):
+        """Replace the board content with tiles on *tile_positions* and (position, color) *pieces*."""
+        cdef list tiles = [NonagaTile(q, r, s) for q, r, s in tile_positions]
+        cdef list piece_objects = [NonagaPiece(q, r, s, color) for (q, r, s), color in pieces]
+        self._set_content(tiles, piece_objects)
+
+    cdef void _fill_cells(self):
+        """Rebuild the occupancy grid from the tile and piece lists."""
+        cdef NonagaTile t
+        cdef NonagaPiece p
+        cdef int i
+        for i in range(GRID_CELLS):
+            self.cells[i] = CELL_EMPTY
+        for t in self.tiles:
+            self.cells[cell_index(t.q, t.r)] = CELL_TILE
+        self.num_pieces = len(self.pieces)
+        for i in range(self.num_pieces):
+            p = <NonagaPiece>self.pieces[i]
+            self.piece_cells[i] = cell_index(p.q, p.r)
+            self.piece_colors[i] = p.color
+            self.cells[self.piece_cells[i]] = CELL_PIECE
 
     cdef tuple _initialize_board(self):
-        cdef list coords = []
-        cdef int radius = 2
-        cdef int q, r, r_start, r_end
-
-        for q in range(-radius, radius + 1):
-            r_start = -radius if -q - radius < -radius else -q - radius
-            r_end = radius if -q + radius > radius else -q + radius
-            for r in range(r_start, r_end + 1):
-                coords.append((q, r, -q - r))
-
-        cdef list tiles = [NonagaTile(q, r, s) for q, r, s in coords]
-
-        cdef list pieces_coord = [
-            ((-2,  0,  2), RED),
-            ((-2,  2,  0), BLACK),
-            (( 0,  2, -2), RED),
-            (( 2,  0, -2), BLACK),
-            (( 2, -2,  0), RED),
-            (( 0, -2,  2), BLACK),
-        ]
+        cdef list tiles = [NonagaTile(q, r, s) for q, r, s in START_TILES]
         cdef list pieces = [NonagaPiece(q, r, s, color)
-                            for (q, r, s), color in pieces_coord]
+                            for (q, r, s), color in START_PIECES]
         return tiles, pieces
 
+    def reset(self):
+        """Put the board back in the start position.
+
+        The tile, piece and island objects of a game board are moved back
+        and reused instead of being built again; other boards are rebuilt.
+        The island's start state is computed on the first reset and copied
+        back on every one.
+        """
+        cdef NonagaIsland island
+        cdef NonagaTile tile
+        cdef NonagaPiece piece
+        cdef list tiles, pieces
+        cdef int i
+        if (len(self.tiles) != len(START_TILES) or len(self.pieces) != len(START_PIECES)
+                or len(self.islands) != 1 or 0 not in self.islands):
+            tiles, pieces = self._initialize_board()
+            self._set_content(tiles, pieces)
+            return
+        island = <NonagaIsland>self.islands[0]
+        if island._saved is None:
+            island._clear()
+        for i in range(len(START_TILES)):
+            tile = <NonagaTile>self.tiles[i]
+            tile.q, tile.r, tile.s = START_TILES[i]
+        for i in range(len(START_PIECES)):
+            piece = <NonagaPiece>self.pieces[i]
+            (piece.q, piece.r, piece.s), piece.color = START_PIECES[i]
+        if island._saved is None:
+            island.add_tiles(self.tiles)
+            island.add_pieces(self.pieces)
+            island._save()
+        island._restore()
+        self._fill_cells()
+
     # Keep the public name expected by the rest of the codebase
     def initialize_board(self):
         return self._initialize_board()
@@ -406,11 +771,38 @@ cdef class NonagaBoard:
 
     def move_piece(self, NonagaPiece piece, tuple position):
         cdef NonagaIsland island = <NonagaIsland>self.islands[piece.island_id]
+        cdef int i
         island.move_piece(piece, position)
+        for i in range(self.num_pieces):
+            if self.pieces[i] is piece:
+                self.cells[self.piece_cells[i]] = CELL_TILE
+                self.piece_cells[i] = cell_index(piece.q, piece.r)
+                self.cells[self.piece_cells[i]] = CELL_PIECE
+                break
 
     def move_tile(self, NonagaTile tile, tuple position):
         cdef NonagaIsland island = <NonagaIsland>self.islands[tile.island_id]
+        self.cells[cell_index(tile.q, tile.r)] = CELL_EMPTY
         island.move_tile(tile, position)
+        self.cells[cell_index(tile.q, tile.r)] = CELL_TILE
+
+    cdef int fill_piece_moves(self, int color, int* moves) noexcept nogil:
+        """Write the encoded slides of a player's pieces into *moves*, returning how many there are.
+
+        *moves* must hold at least MAX_PIECE_MOVES entries (see slide_moves).
+        """
+        return slide_moves(self.cells, self.piece_cells, self.piece_colors, self.num_pieces, color, moves)
+
+    cdef NonagaPiece get_piece_at_cell(self, int cell):
+        cdef int i
+        for i in range(self.num_pieces):
+            if self.piece_cells[i] == cell:
+                return <NonagaPiece>self.pieces[i]
+        return None
+
+    cdef tuple cell_position(self, int cell, int reference_q, int reference_r):
+        """Position of a grid cell, unwrapped next to the (reference_q, reference_r) coordinates."""
+        return _cell_position(cell, reference_q, reference_r)
 
     def create_island(self):
         pass
@@ -0,0 +1,34 @@
+# cython: language_level=3
+from nonaga_logic cimport NonagaLogic
+
+
+cdef class EndgameTable:
+    cdef object _file
+    cdef object _map
+    cdef const unsigned long long[::1] _hashes
+    cdef const signed char[::1] _values
+    cdef unsigned long long _mask
+    cdef readonly long long entries
+    cdef readonly int plies
+
+    cdef int probe_key(self, bytes key)
+    cdef int probe_game(self, NonagaLogic game)
+    cpdef object probe(self, NonagaLogic game)
+
+
+cdef class _Node:
+    cdef int phase
+    cdef int plies
+    cdef bint restricted
+    cdef bint complete
+    cdef list children
+
+
+cdef class EndgameBuilder:
+    cdef readonly int plies, radius
+    cdef readonly dict values
+    cdef dict nodes
+
+    cdef bytes _expand(self, NonagaLogic game, int plies, int attacker)
+    cdef bint _in_region(self, NonagaLogic game, int attacker, tuple origin, tuple destination)
+    cdef int _tile_node_value(self, NonagaLogic game)
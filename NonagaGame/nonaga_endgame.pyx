@@ -0,0 +1,351 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, profile=True
+import mmap
+import struct
+import sys
+
+from nonaga_constants import RED, BLACK, PIECE_TO_MOVE
+from nonaga_board cimport (NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile, MAX_PIECE_MOVES,
+                           piece_move_from, piece_move_to)
+from nonaga_logic cimport NonagaLogic
+from nonaga_symmetry cimport _canonicalize
+
+# ──────────────────────────────────────────────────────────
+# Table file: a header, then an open addressing hash table of 64-bit key
+# hashes and, in the same slot order, the signed distance of each position
+# ──────────────────────────────────────────────────────────
+MAGIC = b"NONAGAEG"
+VERSION = 2                           # 2: tiles holding the island together cannot be moved
+HEADER = struct.Struct("<8sIIQQ")     # magic, version, plies, slots, entries
+MAX_DISTANCE = 127
+
+
+cdef inline unsigned long long _hash_key(bytes key):
+    """FNV-1a of a canonical key, never 0 since 0 marks an empty slot."""
+    cdef const unsigned char* data = key
+    cdef Py_ssize_t i, n = len(key)
+    cdef unsigned long long h = 14695981039346656037ULL
+    for i in range(n):
+        h ^= data[i]
+        h *= 1099511628211ULL
+    return h if h else 1
+
+
+cdef inline int _hex_distance(NonagaPiece piece, tuple position):
+    cdef int dq = piece.q - <int>position[0]
+    cdef int dr = piece.r - <int>position[1]
+    cdef int ds = piece.s - <int>position[2]
+    return (abs(dq) + abs(dr) + abs(ds)) // 2
+
+
+def write_table(path, dict values, int plies):
+    """Write {canonical key: signed distance} as a table EndgameTable can map.
+
+    The table has at least twice as many slots as entries, so a probe looks
+    at very few slots.
+    """
+    if sys.byteorder != "little":
+        raise ValueError("Endgame tables are stored little-endian.")
+    cdef Py_ssize_t entries = len(values)
+    cdef unsigned long long slots = 16
+    while slots < 2 * <unsigned long long>entries:
+        slots *= 2
+    hash_buffer = bytearray(8 * slots)
+    value_buffer = bytearray(slots)
+    cdef unsigned long long[::1] hashes = memoryview(hash_buffer).cast("Q")
+    cdef signed char[::1] distances = memoryview(value_buffer).cast("b")
+    cdef unsigned long long mask = slots - 1, h, i
+    cdef bytes key
+    for key, distance in values.items():
+        h = _hash_key(key)
+        i = h & mask
+        while hashes[i] != 0 and hashes[i] != h:
+            i = (i + 1) & mask
+        hashes[i] = h
+        distances[i] = max(-MAX_DISTANCE, min(MAX_DISTANCE, distance))
+    with open(path, "wb") as f:
+        f.write(HEADER.pack(MAGIC, VERSION, plies, slots, entries))
+        f.write(hash_buffer)
+        f.write(value_buffer)
+
+
+cdef class EndgameTable:
+    """Read-only endgame table mapped from a file written by EndgameBuilder.
+
+    Values are distances in plies (a piece move or a tile move) to the end of
+    the game with best play, from the point of view of the player to move:
+    d > 0 wins in d plies, d < 0 loses in -d plies, 0 means unknown. The file
+    is memory-mapped, so it is shared by the processes that open it and only
+    the pages probed are read.
+    """
+
+    def __init__(self, path):
+        if sys.byteorder != "little":
+            raise ValueError("Endgame tables are stored little-endian.")
+        self._file = open(path, "rb")
+        try:
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            magic, version, plies, slots, entries = HEADER.unpack_from(self._map)
+            if magic != MAGIC or version != VERSION:
+                raise ValueError(f"{path} is not a version {VERSION} Nonaga endgame table.")
+            if slots & (slots - 1) or len(self._map) != HEADER.size + 9 * slots:
+                raise ValueError(f"{path} is truncated or corrupted.")
+        except BaseException:
+            self.close()
+            raise
+        self.plies = plies
+        self.entries = entries
+        self._mask = slots - 1
+        view = memoryview(self._map)
+        self._hashes = view[HEADER.size:HEADER.size + 8 * slots].cast("Q")
+        self._values = view[HEADER.size + 8 * slots:].cast("b")
+
+    def close(self):
+        # the memoryviews must be released before the map can be closed
+        self._hashes = None
+        self._values = None
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc_info):
+        self.close()
+
+    def __len__(self):
+        return self.entries
+
+    cdef int probe_key(self, bytes key):
+        """Distance stored for a canonical key, 0 if the position is not in the table."""
+        cdef unsigned long long h = _hash_key(key)
+        cdef unsigned long long i = h & self._mask
+        cdef unsigned long long stored
+        while True:
+            stored = self._hashes[i]
+            if stored == h:
+                return self._values[i]
+            if stored == 0:
+                return 0
+            i = (i + 1) & self._mask
+
+    cdef int probe_game(self, NonagaLogic game):
+        return self.probe_key(_canonicalize(game, None))
+
+    cpdef object probe(self, NonagaLogic game):
+        """Signed distance of the game's position (see the class docstring), None if it is not in the table."""
+        cdef int distance = self.probe_game(game)
+        return distance if distance != 0 else None
+
+
+cdef class _Node:
+    """A position expanded by EndgameBuilder and the canonical keys of its children."""
+    pass
+
+
+cdef class EndgameBuilder:
+    """Solves the positions near a win and writes them as an EndgameTable.
+
+    Each seed is expanded plies deep, identical positions reached by
+    different seeds, move orders or symmetries being expanded once. Only the
+    positions where a player has two pieces at most one cell apart are kept,
+    the others being too far from a win to be solved. Positions where the
+    player to move can slide a piece to a win are the starting points of a
+    retrograde pass: a position wins if one of its moves leads to a position
+    lost for the opponent, and loses once every move leads to a position won
+    by the opponent.
+
+    To keep the graph small, the tile moves of the player to move in the
+    seed (the attacker) are limited to the tiles taken from or brought
+    within radius cells of its pieces, the defender's moves are all tried.
+    Wins found that way are real wins, and a position only counts as lost
+    when all its moves were tried, so every stored value is exact.
+    """
+
+    def __init__(self, int plies=4, int radius=2):
+        self.plies = plies
+        self.radius = radius
+        self.values = {}
+        self.nodes = {}
+
+    @property
+    def expanded(self):
+        """Number of positions whose moves were generated."""
+        return len(self.nodes)
+
+    def add_seed(self, NonagaLogic game):
+        """Expand the positions reachable within plies moves of the game's position."""
+        self._expand(game, self.plies, game.current_player)
+
+    cdef bytes _expand(self, NonagaLogic game, int plies, int attacker):
+        """Canonical key of the position after adding it and its subtree, None outside the solved region."""
+        cdef int side = game.current_player
+        cdef bint full = side != attacker
+        cdef bint restricted = False, complete = True
+        cdef bytes key, child
+        cdef set children
+        cdef _Node node
+        cdef NonagaBoard board
+        cdef NonagaPiece piece
+        cdef NonagaTile tile
+        cdef dict tile_moves
+        cdef tuple origin, destination
+        cdef int moves[MAX_PIECE_MOVES]
+        cdef int count, k, value
+
+        if not (game.may_connect_in_one_move(RED) or game.may_connect_in_one_move(BLACK)):
+            return None
+        key = _canonicalize(game, None)
+        if key in self.values:
+            return key
+        node = self.nodes.get(key)
+        if node is not None and node.plies >= plies and not (full and node.restricted):
+            return key
+        if game.turn_phase == PIECE_TO_MOVE:
+            if game.has_winning_piece_move(side):
+                self.values[key] = 1
+                return key
+            # the children of a piece move could only be solved by their own children
+            if plies <= 1:
+                return key
+        elif plies == 0:
+            return key
+        elif plies == 1:
+            # the opponent's replies are only checked for a winning slide
+            value = self._tile_node_value(game)
+            if value:
+                self.values[key] = value
+            else:
+                # remembered so that transpositions do not check it again
+                node = _Node()
+                node.phase = game.turn_phase
+                node.plies = plies
+                node.children = []
+                self.nodes[key] = node
+            return key
+
+        children = set()
+        if game.turn_phase == PIECE_TO_MOVE:
+            board = game.board
+            count = board.fill_piece_moves(side, moves)
+            for k in range(count):
+                piece = board.get_piece_at_cell(piece_move_from(moves[k]))
+                origin = piece.get_position()
+                destination = board.cell_position(piece_move_to(moves[k]), piece.q, piece.r)
+                game.move_piece(piece, destination)
+                child = self._expand(game, plies - 1, attacker)
+                game.undo_piece_move(piece, origin)
+                if child is None:
+                    complete = False
+                else:
+                    children.add(child)
+        else:
+            tile_moves = game.get_all_valid_tile_moves_ai()
+            for tile in tile_moves:
+                origin = tile.get_position()
+                for destination in tile_moves[tile]:
+                    if not full and not self._in_region(game, attacker, origin, destination):
+                        restricted = True
+                        continue
+                    game.move_tile(tile, destination)
+                    child = self._expand(game, plies - 1, attacker)
+                    game.undo_tile_move(tile, origin)
+                    if child is None:
+                        complete = False
+                    else:
+                        children.add(child)
+
+        node = _Node()
+        node.phase = game.turn_phase
+        node.plies = plies
+        node.restricted = restricted
+        node.complete = complete and not restricted
+        node.children = list(children)
+        self.nodes[key] = node
+        return key
+
+    cdef bint _in_region(self, NonagaLogic game, int attacker, tuple origin, tuple destination):
+        cdef NonagaPiece piece
+        for piece in <list>game.pieces_by_color[attacker]:
+            if _hex_distance(piece, origin) <= self.radius or _hex_distance(piece, destination) <= self.radius:
+                return True
+        return False
+
+    cdef int _tile_node_value(self, NonagaLogic game):
+        """-2 if every tile move lets the opponent slide a piece to a win, else 0 (unknown)."""
+        cdef int opponent = (game.current_player + 1) % 2
+        cdef dict tile_moves = game.get_all_valid_tile_moves_ai()
+        cdef NonagaTile tile
+        cdef tuple origin, destination
+        cdef bint lost
+        if not tile_moves:
+            return 0
+        for tile in tile_moves:
+            origin = tile.get_position()
+            for destination in tile_moves[tile]:
+                game.move_tile(tile, destination)
+                lost = game.has_winning_piece_move(opponent)
+                game.undo_tile_move(tile, origin)
+                if not lost:
+                    return 0
+        return -2
+
+    def solve(self):
+        """Propagate the known values back through the expanded positions.
+
+        Positions are solved by increasing distance, so a won position gets
+        its fastest win and a lost one its slowest loss.
+
+        Returns:
+            the number of positions with a value
+        """
+        cdef dict parents = {}
+        cdef dict remaining = {}
+        cdef dict buckets = {}
+        cdef bytes key, child, parent
+        cdef _Node node
+        cdef int distance
+        cdef bint child_wins, same_player
+
+        for key, node in self.nodes.items():
+            if key in self.values:
+                continue
+            # an unsolvable child (outside the region, or a move not tried) keeps the position from losing
+            remaining[key] = len(node.children) + (0 if node.complete else 1)
+            for child in node.children:
+                parents.setdefault(child, []).append(key)
+
+        # positions are solved at distance 1 (a winning slide) or 2 (every tile move lets one through)
+        for key, value in self.values.items():
+            buckets.setdefault(abs(value), []).append(key)
+        distance = 1
+        while buckets and distance < MAX_DISTANCE:
+            for child in buckets.pop(distance, ()):
+                child_wins = self.values[child] > 0
+                for parent in parents.get(child, ()):
+                    if parent in self.values:
+                        continue
+                    # a piece move leaves the same player to move, a tile move hands over to the opponent
+                    node = self.nodes[parent]
+                    same_player = node.phase == PIECE_TO_MOVE
+                    if child_wins == same_player:
+                        self.values[parent] = distance + 1
+                    else:
+                        remaining[parent] -= 1
+                        if remaining[parent] != 0:
+                            continue
+                        self.values[parent] = -(distance + 1)
+                    buckets.setdefault(distance + 1, []).append(parent)
+            distance += 1
+        return len(self.values)
+
+    def write(self, path):
+        """Write the solved positions to path.
+
+        Immediate wins are left out, has_winning_piece_move() finds them as
+        fast as a probe would.
+        """
+        write_table(path, {key: value for key, value in self.values.items() if value != 1}, self.plies)
@@ -1,5 +1,5 @@
 # cython: language_level=3
-from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaTile, NonagaPiece
+from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaTile, NonagaPiece, MAX_PIECE_MOVES
 
 cdef class NonagaLogic:
 
@@ -7,6 +7,9 @@ cdef class NonagaLogic:
     cdef public NonagaBoard board
     cdef public int current_player
     cdef public int turn_phase
+    cdef public object change_feed
+    cdef list pieces_by_color
+    cdef int piece_distances[2][3]
 
     cpdef object get_board_state(self)
     cdef dict get_all_valid_tile_moves_ai(self)
@@ -15,6 +18,7 @@ cdef class NonagaLogic:
     cpdef dict get_all_valid_piece_moves(self)
     cdef is_ai_player(self, int player_color)
     cdef set _get_valid_tile_positions(self, NonagaTile tile, NonagaIsland island)
+    cpdef bint is_valid_tile_destination(self, NonagaTile tile, tuple destination)
 
     cdef tuple _get_valid_piece_moves_in_direction(self, NonagaPiece piece, NonagaIsland island,
                                                      int dimension, int direction)
@@ -28,6 +32,12 @@ cdef class NonagaLogic:
     cdef void _last_turn_phase(self)
     cpdef int get_current_turn_phase(self)
 
+    cdef void _track_pieces(self)
+    cdef void _update_piece_distances(self, int color)
     cpdef bint check_win_condition(self, int color)
+    cpdef bint may_connect_in_one_move(self, int color)
+    cdef list _winning_piece_moves(self, int color, bint first_only)
+    cpdef list get_winning_piece_moves(self, int color)
+    cpdef bint has_winning_piece_move(self, int color)
     cpdef int get_current_player(self)
     cpdef void switch_player(self)
@@ -1,26 +1,31 @@
 # cython: language_level=3, boundscheck=False, wraparound=False, profile = True
 from nonaga_constants import RED, BLACK, PIECE_TO_MOVE, TILE_TO_MOVE
-from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile
+from nonaga_board cimport (NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile, MAX_PIECE_MOVES,
+                           GRID_BITS, GRID_MASK, cell_index, unwrap_coordinate, piece_move_from, piece_move_to)
 from nonaga_board import NonagaBoard, NonagaIsland, NonagaPiece, NonagaTile
 
-# Module-level C neighbor offsets for check_win_condition
-cdef int[6][3] _WIN_OFFSETS
-_WIN_OFFSETS[0] = [1, -1,  0]
-_WIN_OFFSETS[1] = [1,  0, -1]
-_WIN_OFFSETS[2] = [0,  1, -1]
-_WIN_OFFSETS[3] = [-1, 1,  0]
-_WIN_OFFSETS[4] = [-1, 0,  1]
-_WIN_OFFSETS[5] = [0, -1,  1]
-
-# Python-visible tuple version for _get_valid_tile_positions
-_PY_NEIGHBOR_OFFSETS = (
-    (1, -1, 0),
-    (1, 0, -1),
-    (0, 1, -1),
-    (-1, 1, 0),
-    (-1, 0, 1),
-    (0, -1, 1),
-)
+# Pair distance used when a player does not have exactly three pieces on the board
+cdef int NO_CONTACT = 99
+
+
+cdef inline int _hex_distance(int q1, int r1, int s1, int q2, int r2, int s2):
+    cdef int dq = q1 - q2
+    cdef int dr = r1 - r2
+    cdef int ds = s1 - s2
+    if dq < 0: dq = -dq
+    if dr < 0: dr = -dr
+    if ds < 0: ds = -ds
+    return (dq + dr + ds) // 2
+
+
+cdef inline bint _connects(int q, int r, int s, NonagaPiece a, NonagaPiece b, int ab_distance):
+    """True if a piece on (q, r, s) would make a connected group with the pieces a and b."""
+    cdef int adjacent = 1 if ab_distance == 1 else 0
+    if _hex_distance(q, r, s, a.q, a.r, a.s) == 1:
+        adjacent += 1
+    if _hex_distance(q, r, s, b.q, b.r, b.s) == 1:
+        adjacent += 1
+    return adjacent >= 2
 
 
 cdef class NonagaLogic:
@@ -32,23 +37,77 @@ cdef class NonagaLogic:
         self.board = NonagaBoard(new_game=new_game)
         self.current_player = RED
         self.turn_phase = PIECE_TO_MOVE
+        # optional observer told about every move played through move_piece/move_tile (see change_feed.py)
+        self.change_feed = None
+        self._track_pieces()
+
+    cdef void _track_pieces(self):
+        # pieces of each color in board order, with the distances between them kept up to date on every piece move
+        self.pieces_by_color = [self.board.get_pieces(RED), self.board.get_pieces(BLACK)]
+        self._update_piece_distances(RED)
+        self._update_piece_distances(BLACK)
 
     # ── board state ──────────────────────────────────────
     cpdef object get_board_state(self):
         return self.board.get_state()
 
+    def get_snapshot(self):
+        """Plain-data copy of the position that can be pickled, serialized or compared."""
+        cdef NonagaTile t
+        cdef NonagaPiece p
+        return {
+            "tiles": [t.get_position() for t in self.board.tiles],
+            "pieces": [(p.get_position(), p.color) for p in self.board.pieces],
+            "current_player": self.current_player,
+            "turn_phase": self.turn_phase,
+        }
+
+    def load_snapshot(self, dict snapshot):
+        """Replace the position with one returned by get_snapshot."""
+        self.board.load_position([tuple(position) for position in snapshot["tiles"]],
+                                 [(tuple(position), color) for position, color in snapshot["pieces"]])
+        self.current_player = snapshot["current_player"]
+        self.turn_phase = snapshot["turn_phase"]
+        self._track_pieces()
+        if self.change_feed is not None:
+            self.change_feed.position_loaded()
+
+    def reset(self):
+        """Go back to the start position of a new game, reusing the board and its tiles and pieces."""
+        self.board.reset()
+        self.current_player = RED
+        self.turn_phase = PIECE_TO_MOVE
+        self._track_pieces()
+        if self.change_feed is not None:
+            self.change_feed.position_loaded()
+
+    @classmethod
+    def from_snapshot(cls, dict snapshot, player_red=None, player_black=None):
+        """Create a game in the position described by a snapshot."""
+        game = cls(player_red, player_black, new_game=False)
+        game.load_snapshot(snapshot)
+        return game
+
     cdef is_ai_player(self, int player_color):
         player = self.player_red if player_color == 1 else self.player_black
         return callable(player)
 
     # ── tile moves ───────────────────────────────────────
     cdef dict get_all_valid_tile_moves_ai(self):
-        """Get valid tile moves keyed by NonagaTile objects (for the AI)."""
+        """Get valid tile moves keyed by NonagaTile objects (for the AI).
+
+        The tiles come in board order and their destinations by grid cell, as
+        in nonaga_position.fill_position_tile_moves, so that the searches of
+        AI and nonaga_match break ties between equal moves the same way
+        whatever order the island's sets iterate in.
+        """
         cdef NonagaIsland island = <NonagaIsland>self.board.islands[0]
+        cdef set movable = island.movable_tiles
         cdef dict move = {}
         cdef NonagaTile tile
-        for tile in island.get_movable_tiles():
-            move[tile] = self._get_valid_tile_positions(tile, island)
+        for tile in self.board.tiles:
+            if tile in movable:
+                move[tile] = island.ordered_tile_destinations(tile)
         return move
 
     cpdef dict get_all_valid_tile_moves(self):
@@ -61,69 +120,29 @@ cdef class NonagaLogic:
         return move
 
     cdef set _get_valid_tile_positions(self, NonagaTile tile, NonagaIsland island):
-        cdef set tile_coords_set = island._get_tile_coords_set()
-        cdef tuple tile_position = tile.get_position()
-
-        if tile_position not in tile_coords_set:
-            return set()
-        tile_coords_set.remove(tile_position)
-
-        cdef tuple neighbor_offsets = _PY_NEIGHBOR_OFFSETS
-        cdef set candidate_positions = set()
-        cdef tuple existing_pos, offset, candidate, neighbor_pos
-        cdef list neighbor_positions
-        cdef int neighbor_count
-
-        for existing_pos in tile_coords_set:
-            for offset in neighbor_offsets:
-                candidate_positions.add((
-                    existing_pos[0] + offset[0],
-                    existing_pos[1] + offset[1],
-                    existing_pos[2] + offset[2],
-                ))
-
-        candidate_positions.difference_update(tile_coords_set)
-
-        cdef set valid_positions = set()
-        for candidate in candidate_positions:
-            neighbor_positions = []
-            for offset in neighbor_offsets:
-                neighbor_pos = (
-                    candidate[0] + offset[0],
-                    candidate[1] + offset[1],
-                    candidate[2] + offset[2],
-                )
-                if neighbor_pos in tile_coords_set:
-                    neighbor_positions.append(neighbor_pos)
-
-            neighbor_count = len(neighbor_positions)
-            if 2 <= neighbor_count <= 4:
-                if neighbor_count <= 2 or island._neighbors_restrain_piece(neighbor_positions):
-                    valid_positions.add(candidate)
-
-        valid_positions.discard(tile_position)
-        return valid_positions
+        # the island keeps the empty cells around it up to date, so this is a filter over them
+        return island.valid_tile_destinations(tile)
+
+    cpdef bint is_valid_tile_destination(self, NonagaTile tile, tuple destination):
+        """Check a single destination of a movable tile without listing all its valid positions."""
+        cdef NonagaIsland island = <NonagaIsland>self.board.islands[tile.island_id]
+        return island.is_valid_tile_destination(tile, destination)
 
     # ── piece moves ──────────────────────────────────────
     cdef dict get_all_valid_piece_moves_ai(self):
         """Get valid piece moves keyed by NonagaPiece objects (for the AI)."""
         cdef dict moves = {}
-        cdef int cur = self.current_player
-        cdef NonagaIsland island
-        cdef int dimension, direction
-        cdef tuple valid_move
+        cdef int encoded_moves[MAX_PIECE_MOVES]
+        cdef int count = self.board.fill_piece_moves(self.current_player, encoded_moves)
+        cdef int k
         cdef NonagaPiece piece
 
-        for piece in self.board.get_pieces():
-            if piece.color == cur:
-                island = <NonagaIsland>self.board.islands[piece.island_id]
-                moves[piece] = []
-                for dimension in range(3):
-                    for direction in range(-1, 2, 2):   # -1, 1
-                        valid_move = self._get_valid_piece_moves_in_direction(
-                            piece, island, dimension, direction)
-                        if valid_move is not None:
-                            moves[piece].append(valid_move)
+        for piece in self.pieces_by_color[self.current_player]:
+            moves[piece] = []
+        for k in range(count):
+            piece = self.board.get_piece_at_cell(piece_move_from(encoded_moves[k]))
+            (<list>moves[piece]).append(
+                self.board.cell_position(piece_move_to(encoded_moves[k]), piece.q, piece.r))
         return moves
 
     cpdef dict get_all_valid_piece_moves(self):
@@ -149,10 +168,9 @@ cdef class NonagaLogic:
 
     cdef tuple _get_valid_piece_moves_in_direction(self, NonagaPiece piece, NonagaIsland island,
                                                      int dimension, int direction):
-        cdef int pq = piece.q, pr = piece.r, ps = piece.s
         cdef int num_tiles = island.get_number_of_tiles()
         cdef tuple destination = None
-        cdef int i
+        cdef int step
         cdef int fixed_index = (dimension + 1) % 3
         cdef int dependent_index = (dimension + 2) % 3
         cdef int coords[3]
@@ -160,13 +178,14 @@ cdef class NonagaLogic:
         cdef set all_tiles = island.all_tiles
         cdef set pieces_set = island.pieces
 
-        coords[0] = pq
-        coords[1] = pr
-        coords[2] = ps
+        coords[0] = piece.q
+        coords[1] = piece.r
+        coords[2] = piece.s
+        cdef int start = coords[dimension]
 
-        for i in range(coords[dimension] + direction,
-                       direction * num_tiles, direction):
-            coords[dimension] = i
+        # a slide cannot cross more tiles than the island holds, wherever the island lies
+        for step in range(1, num_tiles + 1):
+            coords[dimension] = start + direction * step
             coords[dependent_index] = -(coords[dimension] + coords[fixed_index])
             tile = (coords[0], coords[1], coords[2])
 
@@ -177,25 +196,29 @@ cdef class NonagaLogic:
             else:
                 break
 
-            # reset for next iteration
-            coords[0] = pq
-            coords[1] = pr
-            coords[2] = ps
-
         return destination
 
     # ── execute moves ────────────────────────────────────
     cpdef void move_tile(self, NonagaTile tile, tuple destination):
+        cdef tuple origin
         if self.turn_phase == TILE_TO_MOVE:
+            origin = (tile.q, tile.r, tile.s) if self.change_feed is not None else None
             self.board.move_tile(tile, destination)
             self._next_turn_phase()
+            if self.change_feed is not None:
+                self.change_feed.tile_moved(origin, destination)
         else:
             raise ValueError("Invalid move: It's not the tile move phase.")
 
     cpdef void move_piece(self, NonagaPiece piece, tuple destination):
+        cdef tuple origin
         if self.turn_phase == PIECE_TO_MOVE and self.current_player == piece.color:
+            origin = (piece.q, piece.r, piece.s) if self.change_feed is not None else None
             self.board.move_piece(piece, destination)
+            self._update_piece_distances(piece.color)
             self._next_turn_phase()
+            if self.change_feed is not None:
+                self.change_feed.piece_moved(origin, destination)
         else:
             raise ValueError(
                 "Invalid move: the piece does not belong to the current player.")
@@ -211,6 +234,7 @@ cdef class NonagaLogic:
     cdef void undo_piece_move(self, NonagaPiece piece, tuple destination):
         try:
             self.board.move_piece(piece, destination)
+            self._update_piece_distances(piece.color)
             self._last_turn_phase()
         except ValueError as e:
             raise ValueError("Invalid move: the piece doesnt exist")
@@ -234,34 +258,87 @@ cdef class NonagaLogic:
         return self.turn_phase
 
     # ── win condition ────────────────────────────────────
+    cdef void _update_piece_distances(self, int color):
+        """Refresh the distances between the pieces of a player: (p0, p1), (p1, p2) and (p2, p0)."""
+        cdef list pieces = <list>self.pieces_by_color[color]
+        cdef NonagaPiece p0, p1, p2
+        if len(pieces) != 3:
+            self.piece_distances[color][0] = NO_CONTACT
+            self.piece_distances[color][1] = NO_CONTACT
+            self.piece_distances[color][2] = NO_CONTACT
+            return
+        p0 = <NonagaPiece>pieces[0]
+        p1 = <NonagaPiece>pieces[1]
+        p2 = <NonagaPiece>pieces[2]
+        self.piece_distances[color][0] = _hex_distance(p0.q, p0.r, p0.s, p1.q, p1.r, p1.s)
+        self.piece_distances[color][1] = _hex_distance(p1.q, p1.r, p1.s, p2.q, p2.r, p2.s)
+        self.piece_distances[color][2] = _hex_distance(p2.q, p2.r, p2.s, p0.q, p0.r, p0.s)
+
+    def get_piece_distances(self, int color):
+        """Distances between the pieces of a player as (d(p0, p1), d(p1, p2), d(p2, p0))."""
+        return (self.piece_distances[color][0], self.piece_distances[color][1], self.piece_distances[color][2])
+
     cpdef bint check_win_condition(self, int color):
         """Check if the three pieces of a player are connected."""
-        cdef list pieces
-        cdef NonagaPiece p
-        if color == RED:
-            pieces = [(p.q, p.r, p.s) for p in self.board.get_pieces(RED)]
-        else:
-            pieces = [(p.q, p.r, p.s) for p in self.board.get_pieces(BLACK)]
-
-        cdef set piece_set = set(pieces)
-        cdef tuple start = <tuple>pieces[0]
-        cdef set visited = {start}
-        cdef list queue = [start]
-        cdef tuple curr, adj_pos
-        cdef int cq, cr, cs, i
-
-        while queue:
-            curr = <tuple>queue.pop(0)
-            cq = curr[0]; cr = curr[1]; cs = curr[2]
-            for i in range(6):
-                adj_pos = (cq + _WIN_OFFSETS[i][0],
-                           cr + _WIN_OFFSETS[i][1],
-                           cs + _WIN_OFFSETS[i][2])
-                if adj_pos in piece_set and adj_pos not in visited:
-                    visited.add(adj_pos)
-                    queue.append(adj_pos)
-
-        return len(visited) == len(pieces)
+        # three pieces are connected when at least two of their pairs are in contact
+        cdef int contacts = 0
+        cdef int k
+        for k in range(3):
+            if self.piece_distances[color][k] == 1:
+                contacts += 1
+        return contacts >= 2
+
+    cpdef bint may_connect_in_one_move(self, int color):
+        """Cheap necessary condition for a winning piece slide: two pieces at most one cell apart."""
+        cdef int k
+        for k in range(3):
+            if self.piece_distances[color][k] <= 2:
+                return True
+        return False
+
+    cdef list _winning_piece_moves(self, int color, bint first_only):
+        cdef list pieces = <list>self.pieces_by_color[color]
+        cdef list winning_moves = []
+        cdef NonagaPiece piece, a, b
+        cdef int encoded_moves[MAX_PIECE_MOVES]
+        cdef int count, i, k, origin, destination, ab_distance, q, r
+
+        if not self.may_connect_in_one_move(color):
+            return winning_moves
+
+        count = self.board.fill_piece_moves(color, encoded_moves)
+        for i in range(3):
+            piece = <NonagaPiece>pieces[i]
+            a = <NonagaPiece>pieces[(i + 1) % 3]
+            b = <NonagaPiece>pieces[(i + 2) % 3]
+            # the moved piece can only join the two others if they are at most one cell apart
+            ab_distance = self.piece_distances[color][(i + 1) % 3]
+            if ab_distance > 2:
+                continue
+            origin = cell_index(piece.q, piece.r)
+            for k in range(count):
+                if piece_move_from(encoded_moves[k]) != origin:
+                    continue
+                destination = piece_move_to(encoded_moves[k])
+                q = unwrap_coordinate(destination >> GRID_BITS, piece.q)
+                r = unwrap_coordinate(destination & GRID_MASK, piece.r)
+                if _connects(q, r, -q - r, a, b, ab_distance):
+                    winning_moves.append((piece.get_position(), (q, r, -q - r)))
+                    if first_only:
+                        return winning_moves
+        return winning_moves
+
+    cpdef list get_winning_piece_moves(self, int color):
+        """List the (origin, destination) piece slides that would connect the three pieces of a player.
+
+        The current player and turn phase are ignored, so this also reports the
+        threats of the player who is not on move.
+        """
+        return self._winning_piece_moves(color, False)
+
+    cpdef bint has_winning_piece_move(self, int color):
+        """Check if a player could connect their three pieces with a single piece slide."""
+        return len(self._winning_piece_moves(color, True)) > 0
 
     # ── player management ────────────────────────────────
     cpdef int get_current_player(self):
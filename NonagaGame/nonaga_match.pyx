@@ -0,0 +1,618 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Not profiled: its functions run without the GIL, millions of times per match, and trace hooks would dwarf them
+"""Whole AI-versus-AI matches played in C, without the GIL.
+
+NonagaTournamentFitness and evaluate_parameters.run_match play their games
+move by move from Python. play_match and play_matches play the same games
+on a Position: each player searches with the minimax of AI.get_best_move
+(alpha-beta on piece then tile moves, the quiescence check of horizon_value,
+the same cost_function), and a match ends at the first win or after
+max_moves turns. Moves are searched in the same order as AI's, so ties
+are broken alike and the games are AI's games move for move; match_moves
+lists the turns of a match to check it.
+
+play_lockstep plays many depth-1 matches together, one turn of every game
+at a time, and searches each distinct position once for all the games
+that reached it.
+"""
+import threading
+from array import array
+
+from cpython.mem cimport PyMem_Malloc, PyMem_Free
+from libc.math cimport INFINITY
+from libc.stdlib cimport qsort
+from libc.string cimport memset, memcmp
+
+from nonaga_constants import RED, BLACK
+from nonaga_board cimport GRID_CELLS, CELL_TILE, MAX_PIECE_MOVES, step_cell, piece_move_from, piece_move_to
+from nonaga_logic cimport NonagaLogic
+from nonaga_position cimport (Position, MAX_TILE_MOVES, NUM_COST_FEATURES, load_position,
+                              fill_position_piece_moves, fill_position_tile_moves, play_piece_move, play_tile_move,
+                              undo_piece_move, undo_tile_move, move_positions, position_won, find_winning_slide,
+                              fill_winning_slides, cost_features, position_cost)
+
+cdef int _RED = RED
+cdef int _BLACK = BLACK
+
+# winner of a match that reached max_moves, or where a player had no move
+DRAW = -1
+cdef int _DRAW = DRAW
+
+cdef double WIN_SCORE = 99999999
+
+
+# One player's search settings, the fields of AI it uses
+cdef struct Searcher:
+    int params[NUM_COST_FEATURES]
+    int depth
+    int max_color
+    bint quiescence
+
+
+# ── search, as in AI ─────────────────────────────────────
+cdef double _minimax_piece(Position* position, const Searcher* searcher, int depth, bint maximizing, int color,
+                           double alpha, double beta, int* best_piece, int* best_tile) noexcept nogil:
+    """AI.minimax_piece; the best moves are -1 where it returns None."""
+    cdef int moves[MAX_PIECE_MOVES]
+    cdef int count, k, tile_move
+    cdef double value, score
+    best_piece[0] = -1
+    best_tile[0] = -1
+    if position_won(position, _RED) or position_won(position, _BLACK):
+        return -(WIN_SCORE + depth) if maximizing else WIN_SCORE + depth
+    elif depth == 0:
+        return _horizon_value(position, searcher, maximizing, color)
+
+    count = fill_position_piece_moves(position, moves)
+    if count == 0:
+        return position_cost(position, searcher.max_color, searcher.params)
+
+    value = -INFINITY if maximizing else INFINITY
+    for k in range(count):
+        play_piece_move(position, moves[k])
+        score = _minimax_tile(position, searcher, depth, maximizing, color, alpha, beta, &tile_move)
+        undo_piece_move(position, moves[k])
+        if (score > value) if maximizing else (score < value):
+            value = score
+            best_piece[0] = moves[k]
+            best_tile[0] = tile_move
+        if maximizing:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+
+    if best_piece[0] < 0 or best_tile[0] < 0:
+        best_piece[0] = -1
+        best_tile[0] = -1
+        return position_cost(position, searcher.max_color, searcher.params)
+    return value
+
+
+cdef double _minimax_tile(Position* position, const Searcher* searcher, int depth, bint maximizing, int color,
+                          double alpha, double beta, int* best_tile) noexcept nogil:
+    """AI.minimax_tile."""
+    cdef int moves[MAX_TILE_MOVES]
+    cdef int count = fill_position_tile_moves(position, moves)
+    cdef int k, piece_move, tile_move
+    cdef double value, score
+    best_tile[0] = -1
+    if count == 0:
+        return position_cost(position, searcher.max_color, searcher.params)
+
+    value = -INFINITY if maximizing else INFINITY
+    for k in range(count):
+        play_tile_move(position, moves[k])
+        score = _minimax_piece(position, searcher, depth - 1, not maximizing, (color + 1) % 2, alpha, beta,
+                               &piece_move, &tile_move)
+        undo_tile_move(position, moves[k])
+        if (score > value) if maximizing else (score < value):
+            value = score
+            best_tile[0] = moves[k]
+        if maximizing:
+            alpha = max(alpha, value)
+        else:
+            beta = min(beta, value)
+        if alpha >= beta:
+            break
+
+    if best_tile[0] < 0:
+        return position_cost(position, searcher.max_color, searcher.params)
+    return value
+
+
+cdef double _horizon_value(Position* position, const Searcher* searcher, bint maximizing, int color) noexcept nogil:
+    """AI.horizon_value, without an endgame table."""
+    if searcher.quiescence:
+        if find_winning_slide(position, color) >= 0:
+            return WIN_SCORE - 1 if maximizing else -(WIN_SCORE - 1)
+        if find_winning_slide(position, (color + 1) % 2) >= 0 and not _can_parry_threats(position, color):
+            return -(WIN_SCORE - 2) if maximizing else WIN_SCORE - 2
+    return position_cost(position, searcher.max_color, searcher.params)
+
+
+cdef bint _can_parry_threats(Position* position, int color) noexcept nogil:
+    """AI.can_parry_threats: a piece move, alone then followed by a tile move, after which the opponent cannot win."""
+    cdef int opponent = (color + 1) % 2
+    cdef int moves[MAX_PIECE_MOVES]
+    cdef int count = fill_position_piece_moves(position, moves)
+    cdef int k, tile_needed
+    cdef bint parried
+    for tile_needed in range(2):
+        for k in range(count):
+            play_piece_move(position, moves[k])
+            if tile_needed:
+                parried = _tile_move_parries(position, opponent)
+            else:
+                parried = find_winning_slide(position, opponent) < 0
+            undo_piece_move(position, moves[k])
+            if parried:
+                return True
+    return False
+
+
+cdef void _mark_footprint(const Position* position, int move, unsigned char* footprint) noexcept nogil:
+    """Mark the cells of AI's threat_footprint for a slide: the cells it crosses, its destination and its stop."""
+    cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+    cdef int direction, cell
+    for direction in range(6):
+        # a slide runs over tiles up to the last one before a gap or a piece
+        cell = step_cell(origin, direction)
+        while position.cells[cell] == CELL_TILE and cell != destination:
+            cell = step_cell(cell, direction)
+        if cell != destination:
+            continue
+        cell = step_cell(origin, direction)
+        while cell != destination:
+            footprint[cell] = 1
+            cell = step_cell(cell, direction)
+        footprint[destination] = 1
+        footprint[step_cell(destination, direction)] = 1
+        return
+
+
+cdef bint _tile_move_parries(Position* position, int opponent) noexcept nogil:
+    """AI.tile_move_parries: only the tile moves from or to a cell of a threatening slide can stop it."""
+    cdef int threats[MAX_PIECE_MOVES]
+    cdef int moves[MAX_TILE_MOVES]
+    cdef unsigned char footprint[GRID_CELLS]
+    cdef int num_threats = fill_winning_slides(position, opponent, threats)
+    cdef int count, k
+    cdef bint parried
+    memset(footprint, 0, GRID_CELLS)
+    for k in range(num_threats):
+        _mark_footprint(position, threats[k], footprint)
+    count = fill_position_tile_moves(position, moves)
+    for k in range(count):
+        if not footprint[piece_move_from(moves[k])] and not footprint[piece_move_to(moves[k])]:
+            continue
+        play_tile_move(position, moves[k])
+        parried = find_winning_slide(position, opponent) < 0
+        undo_tile_move(position, moves[k])
+        if parried:
+            return True
+    return False
+
+
+# ── matches ──────────────────────────────────────────────
+cdef int _play(Position* position, const Searcher* searchers, int max_moves, int* turns) noexcept nogil:
+    """Play from the position until a player wins; returns RED, BLACK or DRAW.
+
+    searchers holds RED's then BLACK's settings; *turns* receives the turns played.
+    """
+    cdef int moves, player, piece_move, tile_move
+    for moves in range(max_moves):
+        player = position.current_player
+        _minimax_piece(position, &searchers[player], searchers[player].depth, True, player, -INFINITY, INFINITY,
+                       &piece_move, &tile_move)
+        if piece_move < 0 or tile_move < 0:
+            # AI.get_best_move fails without a move, which the Python loops count as a draw
+            turns[0] = moves
+            return _DRAW
+        play_piece_move(position, piece_move)
+        play_tile_move(position, tile_move)
+        if position_won(position, _RED):
+            turns[0] = moves + 1
+            return _RED
+        elif position_won(position, _BLACK):
+            turns[0] = moves + 1
+            return _BLACK
+    turns[0] = max_moves
+    return _DRAW
+
+
+cdef void _play_games(const Position* start, const Searcher* searchers, int first, int count, int step,
+                      int max_moves, int* winners, int* turns) noexcept nogil:
+    """Play the games first, first + step, ... below count; game i is played by searchers[2 i] and [2 i + 1]."""
+    cdef Position position
+    cdef int i = first
+    while i < count:
+        position = start[0]
+        winners[i] = _play(&position, &searchers[2 * i], max_moves, &turns[i])
+        i += step
+
+
+cdef void _set_searcher(Searcher* searcher, params, int depth, int color, bint quiescence) except *:
+    if len(params) != NUM_COST_FEATURES:
+        raise ValueError(f"Expected {NUM_COST_FEATURES} parameters, got {len(params)}.")
+    cdef int k
+    for k in range(NUM_COST_FEATURES):
+        searcher.params[k] = params[k]
+    searcher.depth = depth
+    searcher.max_color = color
+    searcher.quiescence = quiescence
+
+
+cdef void _start_position(Position* position) except *:
+    load_position(position, NonagaLogic(new_game=True))
+
+
+def play_match(params_red, params_black, int depth=1, int max_moves=30, bint quiescence=True):
+    """Play a match from the start position between two cost_function parameter sets.
+
+    Returns:
+        (winner, turns): RED, BLACK or DRAW, and the number of turns played
+    """
+    cdef Position position
+    cdef Searcher searchers[2]
+    cdef int winner, turns = 0
+    if depth < 1:
+        raise ValueError("The search depth must be at least 1.")
+    _set_searcher(&searchers[0], params_red, depth, _RED, quiescence)
+    _set_searcher(&searchers[1], params_black, depth, _BLACK, quiescence)
+    _start_position(&position)
+    with nogil:
+        winner = _play(&position, searchers, max_moves, &turns)
+    return winner, turns
+
+
+def match_moves(params_red, params_black, int depth=1, int max_moves=30, bint quiescence=True):
+    """The turns of play_match, for comparing them with the games of AI.get_best_move.
+
+    Returns:
+        a list of ((piece origin, destination), (tile origin, destination)) position tuples, one per turn
+    """
+    cdef Position position
+    cdef Searcher searchers[2]
+    cdef int turn, player, piece_move = -1, tile_move = -1
+    cdef list turns = []
+    cdef tuple piece_positions
+    if depth < 1:
+        raise ValueError("The search depth must be at least 1.")
+    _set_searcher(&searchers[0], params_red, depth, _RED, quiescence)
+    _set_searcher(&searchers[1], params_black, depth, _BLACK, quiescence)
+    _start_position(&position)
+    for turn in range(max_moves):
+        player = position.current_player
+        with nogil:
+            _minimax_piece(&position, &searchers[player], depth, True, player, -INFINITY, INFINITY,
+                           &piece_move, &tile_move)
+        if piece_move < 0 or tile_move < 0:
+            break
+        piece_positions = move_positions(&position, piece_move, True)
+        play_piece_move(&position, piece_move)
+        turns.append((piece_positions, move_positions(&position, tile_move, False)))
+        play_tile_move(&position, tile_move)
+        if position_won(&position, _RED) or position_won(&position, _BLACK):
+            break
+    return turns
+
+
+cdef class _Batch:
+    """The C data of play_matches, shared by its threads."""
+    cdef Position start
+    cdef Searcher* searchers
+    cdef int count
+    cdef int max_moves
+    cdef int[::1] winners
+    cdef int[::1] turns
+
+    def __dealloc__(self):
+        PyMem_Free(self.searchers)
+
+    def run(self, int first, int step):
+        with nogil:
+            _play_games(&self.start, self.searchers, first, self.count, step, self.max_moves,
+                        &self.winners[0], &self.turns[0])
+
+
+def play_matches(pairings, int depth=1, int max_moves=30, bint quiescence=True, int threads=1):
+    """Play a match for each (params_red, params_black) pairing, see play_match.
+
+    Args:
+        threads: threads sharing the matches, which run without the GIL
+    Returns:
+        (winners, turns): two array('i') with an entry per pairing
+    """
+    cdef list items = list(pairings)
+    cdef _Batch batch = _Batch()
+    cdef Py_ssize_t i
+    winners = array('i', [_DRAW]) * len(items)
+    turns = array('i', [0]) * len(items)
+    if not items:
+        return winners, turns
+    if depth < 1:
+        raise ValueError("The search depth must be at least 1.")
+    batch.searchers = <Searcher*>PyMem_Malloc(2 * len(items) * sizeof(Searcher))
+    if batch.searchers == NULL:
+        raise MemoryError()
+    for i in range(len(items)):
+        params_red, params_black = items[i]
+        _set_searcher(&batch.searchers[2 * i], params_red, depth, _RED, quiescence)
+        _set_searcher(&batch.searchers[2 * i + 1], params_black, depth, _BLACK, quiescence)
+    _start_position(&batch.start)
+    batch.count = len(items)
+    batch.max_moves = max_moves
+    batch.winners = winners
+    batch.turns = turns
+
+    threads = max(1, min(threads, len(items)))
+    workers = [threading.Thread(target=batch.run, args=(t, threads), daemon=True) for t in range(1, threads)]
+    for worker in workers:
+        worker.start()
+    batch.run(0, threads)
+    for worker in workers:
+        worker.join()
+    return winners, turns
+
+
+# ── lockstep matches at depth 1 ─────────────────────────
+# A depth-1 search prunes nothing: the move played is the first (piece, tile)
+# pair of highest value, where the value of each pair is either a constant
+# (a win or a lost position found by the quiescence check) or the dot product
+# of the player's parameters with the cost features of the position reached.
+# Those do not depend on the parameters, so they are computed once per
+# distinct position and every game there only takes its dot products.
+
+cdef struct Children:
+    int count
+    int* piece_moves
+    int* tile_moves             # -1 after a piece move that leaves no tile move
+    unsigned char* scored       # whether the value is params . features rather than constant
+    double* constant
+    int* features               # NUM_COST_FEATURES per child
+
+
+cdef struct GameKey:
+    unsigned long long hash
+    int game
+
+
+cdef int _compare_keys(const void* a, const void* b) noexcept nogil:
+    cdef const GameKey* x = <const GameKey*>a
+    cdef const GameKey* y = <const GameKey*>b
+    if x.hash != y.hash:
+        return -1 if x.hash < y.hash else 1
+    return x.game - y.game
+
+
+cdef inline size_t _state_size(const Position* position) noexcept nogil:
+    # the cells are a function of the coordinates that follow them
+    return <const char*>(position + 1) - <const char*>&position.num_tiles
+
+
+cdef unsigned long long _position_hash(const Position* position) noexcept nogil:
+    """FNV-1a of the tile and piece coordinates, player and phase."""
+    cdef const unsigned char* data = <const unsigned char*>&position.num_tiles
+    cdef size_t i, size = _state_size(position)
+    cdef unsigned long long h = 14695981039346656037ULL
+    for i in range(size):
+        h = (h ^ data[i]) * 1099511628211ULL
+    return h
+
+
+cdef inline bint _same_state(const Position* a, const Position* b) noexcept nogil:
+    return memcmp(&a.num_tiles, &b.num_tiles, _state_size(a)) == 0
+
+
+cdef void _add_scored(Children* children, const Position* position, int piece_move, int tile_move,
+                      int mover) noexcept nogil:
+    cdef int k = children.count
+    children.piece_moves[k] = piece_move
+    children.tile_moves[k] = tile_move
+    children.scored[k] = True
+    children.constant[k] = 0.0
+    cost_features(position, mover, &children.features[k * NUM_COST_FEATURES])
+    children.count += 1
+
+
+cdef void _expand(Position* position, Children* children, bint quiescence) noexcept nogil:
+    """The root children of _minimax_piece at depth 1, valued as _minimax_piece values them at depth 0."""
+    cdef int piece_moves[MAX_PIECE_MOVES]
+    cdef int tile_moves[MAX_TILE_MOVES]
+    cdef int mover = position.current_player, opponent = (position.current_player + 1) % 2
+    cdef int num_piece_moves = fill_position_piece_moves(position, piece_moves)
+    cdef int num_tile_moves, i, j, k
+    children.count = 0
+    for i in range(num_piece_moves):
+        play_piece_move(position, piece_moves[i])
+        num_tile_moves = fill_position_tile_moves(position, tile_moves)
+        if num_tile_moves == 0:
+            _add_scored(children, position, piece_moves[i], -1, mover)
+        for j in range(num_tile_moves):
+            play_tile_move(position, tile_moves[j])
+            k = children.count
+            if position_won(position, _RED) or position_won(position, _BLACK):
+                children.constant[k] = WIN_SCORE
+            elif quiescence and find_winning_slide(position, opponent) >= 0:
+                children.constant[k] = -(WIN_SCORE - 1)
+            elif (quiescence and find_winning_slide(position, mover) >= 0
+                  and not _can_parry_threats(position, opponent)):
+                children.constant[k] = WIN_SCORE - 2
+            else:
+                _add_scored(children, position, piece_moves[i], tile_moves[j], mover)
+                undo_tile_move(position, tile_moves[j])
+                continue
+            children.piece_moves[k] = piece_moves[i]
+            children.tile_moves[k] = tile_moves[j]
+            children.scored[k] = False
+            children.count += 1
+            undo_tile_move(position, tile_moves[j])
+        undo_piece_move(position, piece_moves[i])
+
+
+cdef int _choose(const Children* children, const int* params) noexcept nogil:
+    """Index of the first child of highest value for the parameters, -1 without children."""
+    cdef int k, j, chosen = -1, cost
+    cdef double value, best = -INFINITY
+    for k in range(children.count):
+        if children.scored[k]:
+            cost = 0
+            for j in range(NUM_COST_FEATURES):
+                cost += params[j] * children.features[k * NUM_COST_FEATURES + j]
+            value = cost
+        else:
+            value = children.constant[k]
+        if value > best:
+            best = value
+            chosen = k
+    return chosen
+
+
+cdef int _lockstep(Position* games, const int* params, int count, int max_moves, bint quiescence,
+                   int* winners, int* turns, GameKey* keys, int* chosen_piece, int* chosen_tile,
+                   unsigned char* active, unsigned char* grouped, Children* children) noexcept nogil:
+    """Play the games one turn at a time; params holds RED's then BLACK's parameters for each game.
+
+    Returns the number of positions searched.
+    """
+    cdef int move, i, m, start, end, a, b, player, child, expansions = 0
+    for i in range(count):
+        active[i] = True
+        winners[i] = _DRAW
+        turns[i] = max_moves
+
+    for move in range(max_moves):
+        # games in the same position are next to each other once sorted by hash
+        m = 0
+        for i in range(count):
+            if active[i]:
+                keys[m].hash = _position_hash(&games[i])
+                keys[m].game = i
+                grouped[i] = False
+                m += 1
+        if m == 0:
+            break
+        qsort(keys, m, sizeof(GameKey), _compare_keys)
+
+        start = 0
+        while start < m:
+            end = start + 1
+            while end < m and keys[end].hash == keys[start].hash:
+                end += 1
+            for a in range(start, end):
+                if grouped[keys[a].game]:
+                    continue
+                _expand(&games[keys[a].game], children, quiescence)
+                expansions += 1
+                for b in range(a, end):
+                    i = keys[b].game
+                    if grouped[i] or not _same_state(&games[i], &games[keys[a].game]):
+                        continue
+                    grouped[i] = True
+                    player = games[i].current_player
+                    child = _choose(children, &params[(2 * i + player) * NUM_COST_FEATURES])
+                    if child < 0 or children.tile_moves[child] < 0:
+                        chosen_piece[i] = -1
+                        chosen_tile[i] = -1
+                    else:
+                        chosen_piece[i] = children.piece_moves[child]
+                        chosen_tile[i] = children.tile_moves[child]
+            start = end
+
+        for a in range(m):
+            i = keys[a].game
+            if chosen_piece[i] < 0:
+                # as in _play: no move is a draw
+                active[i] = False
+                turns[i] = move
+                continue
+            play_piece_move(&games[i], chosen_piece[i])
+            play_tile_move(&games[i], chosen_tile[i])
+            if position_won(&games[i], _RED):
+                winners[i] = _RED
+            elif position_won(&games[i], _BLACK):
+                winners[i] = _BLACK
+            else:
+                continue
+            active[i] = False
+            turns[i] = move + 1
+    return expansions
+
+
+cdef class _Lockstep:
+    """The C buffers of play_lockstep."""
+    cdef Position* games
+    cdef int* params
+    cdef GameKey* keys
+    cdef int* chosen
+    cdef unsigned char* flags
+    cdef Children children
+
+    def __cinit__(self, int count):
+        cdef size_t capacity = MAX_PIECE_MOVES * MAX_TILE_MOVES
+        self.games = <Position*>PyMem_Malloc(count * sizeof(Position))
+        self.params = <int*>PyMem_Malloc(2 * count * NUM_COST_FEATURES * sizeof(int))
+        self.keys = <GameKey*>PyMem_Malloc(count * sizeof(GameKey))
+        self.chosen = <int*>PyMem_Malloc(2 * count * sizeof(int))
+        self.flags = <unsigned char*>PyMem_Malloc(2 * count)
+        self.children.piece_moves = <int*>PyMem_Malloc(capacity * sizeof(int))
+        self.children.tile_moves = <int*>PyMem_Malloc(capacity * sizeof(int))
+        self.children.scored = <unsigned char*>PyMem_Malloc(capacity)
+        self.children.constant = <double*>PyMem_Malloc(capacity * sizeof(double))
+        self.children.features = <int*>PyMem_Malloc(capacity * NUM_COST_FEATURES * sizeof(int))
+        if (self.games == NULL or self.params == NULL or self.keys == NULL or self.chosen == NULL
+                or self.flags == NULL or self.children.piece_moves == NULL or self.children.tile_moves == NULL
+                or self.children.scored == NULL or self.children.constant == NULL
+                or self.children.features == NULL):
+            raise MemoryError()
+
+    def __dealloc__(self):
+        PyMem_Free(self.games)
+        PyMem_Free(self.params)
+        PyMem_Free(self.keys)
+        PyMem_Free(self.chosen)
+        PyMem_Free(self.flags)
+        PyMem_Free(self.children.piece_moves)
+        PyMem_Free(self.children.tile_moves)
+        PyMem_Free(self.children.scored)
+        PyMem_Free(self.children.constant)
+        PyMem_Free(self.children.features)
+
+
+def play_lockstep(pairings, int max_moves=30, bint quiescence=True):
+    """Play a depth-1 match for each (params_red, params_black) pairing, all games one turn at a time.
+
+    The results are those of play_matches(pairings, depth=1), but every
+    position reached by several games (the start position, then the lines
+    the players agree on) is searched once for all of them.
+
+    Returns:
+        (winners, turns, searched): two array('i') with an entry per pairing,
+        and the number of positions searched
+    """
+    cdef list items = list(pairings)
+    cdef int count = len(items), i, j, k, searched
+    winners = array('i', [_DRAW]) * count
+    turns = array('i', [0]) * count
+    if count == 0:
+        return winners, turns, 0
+    cdef int[::1] winner_view = winners
+    cdef int[::1] turn_view = turns
+    cdef _Lockstep buffers = _Lockstep(count)
+    cdef Position start
+    _start_position(&start)
+    for i in range(count):
+        buffers.games[i] = start
+        params_red, params_black = items[i]
+        for k, params in enumerate((params_red, params_black)):
+            if len(params) != NUM_COST_FEATURES:
+                raise ValueError(f"Expected {NUM_COST_FEATURES} parameters, got {len(params)}.")
+            for j in range(NUM_COST_FEATURES):
+                buffers.params[(2 * i + k) * NUM_COST_FEATURES + j] = params[j]
+    with nogil:
+        searched = _lockstep(buffers.games, buffers.params, count, max_moves, quiescence,
+                             &winner_view[0], &turn_view[0], buffers.keys, buffers.chosen, &buffers.chosen[count],
+                             buffers.flags, &buffers.flags[count], &buffers.children)
+    return winners, turns, searched
@@ -0,0 +1,18159 @@
+/* Generated by Cython 3.2.4 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "name": "nonaga_mcts",
+        "sources": [
+            "NonagaGame/nonaga_mcts.pyx"
+        ]
+    },
+    "module_name": "nonaga_mcts"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+/* InitLimitedAPI */
+#if defined(Py_LIMITED_API)
+  #if !defined(CYTHON_LIMITED_API)
+  #define CYTHON_LIMITED_API 1
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef _MSC_VER
+  #pragma message ("Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.")
+  #else
+  #warning Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x03080000
+    #error Cython requires Python 3.8+.
+#else
+#define __PYX_ABI_VERSION "3_2_4"
+#define CYTHON_HEX_VERSION 0x030204F0
+#define CYTHON_FUTURE_DIVISION 1
+/* CModulePreamble */
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 1
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
+  #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 0
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #ifdef Py_GIL_DISABLED
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 1
+  #else
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #endif
+  #if PY_VERSION_HEX < 0x030A0000
+    #undef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #elif !defined(CYTHON_USE_TYPE_SLOTS)
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLIST_INTERNALS)
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #elif !defined(CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL 0
+  #elif !defined(CYTHON_FAST_GIL)
+    #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
+  #endif
+  #ifndef CYTHON_METH_FASTCALL
+    #define CYTHON_METH_FASTCALL 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL 1
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #ifndef CYTHON_USE_SYS_MONITORING
+    #define CYTHON_USE_SYS_MONITORING (PY_VERSION_HEX >= 0x030d00B1)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5 && !CYTHON_USE_MODULE_STATE)
+  #endif
+  #ifndef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #if defined(CYTHON_IMMORTAL_CONSTANTS) && PY_VERSION_HEX < 0x030C0000
+    #undef CYTHON_IMMORTAL_CONSTANTS
+    #define CYTHON_IMMORTAL_CONSTANTS 0  // definitely won't work
+  #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
+    #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+#endif
+#ifndef CYTHON_COMPRESS_STRINGS
+  #define CYTHON_COMPRESS_STRINGS 1
+#endif
+#ifndef CYTHON_FAST_PYCCALL
+#define CYTHON_FAST_PYCCALL  CYTHON_FAST_PYCALL
+#endif
+#ifndef CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define CYTHON_VECTORCALL  (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+#else
+#define CYTHON_VECTORCALL  (CYTHON_FAST_PYCCALL)
+#endif
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#include <stdint.h>
+typedef uintptr_t  __pyx_uintptr_t;
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#ifndef Py_UNREACHABLE
+  #define Py_UNREACHABLE()  assert(0); abort()
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x03090000)
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+
+/* CInitCode */
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+/* PythonCompatibility */
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #ifndef CO_OPTIMIZED
+    static int CO_OPTIMIZED;
+    #endif
+    #ifndef CO_NEWLOCALS
+    static int CO_NEWLOCALS;
+    #endif
+    #ifndef CO_VARARGS
+    static int CO_VARARGS;
+    #endif
+    #ifndef CO_VARKEYWORDS
+    static int CO_VARKEYWORDS;
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    static int CO_ASYNC_GENERATOR;
+    #endif
+    #ifndef CO_GENERATOR
+    static int CO_GENERATOR;
+    #endif
+    #ifndef CO_COROUTINE
+    static int CO_COROUTINE;
+    #endif
+#else
+    #ifndef CO_COROUTINE
+      #define CO_COROUTINE 0x80
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+      #define CO_ASYNC_GENERATOR 0x200
+    #endif
+#endif
+static int __Pyx_init_co_variables(void);
+#if PY_VERSION_HEX >= 0x030900A4 || defined(Py_IS_TYPE)
+  #define __Pyx_IS_TYPE(ob, type) Py_IS_TYPE(ob, type)
+#else
+  #define __Pyx_IS_TYPE(ob, type) (((const PyObject*)ob)->ob_type == (type))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE 0
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING 0
+#endif
+#ifndef Py_TPFLAGS_IMMUTABLETYPE
+  #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
+#endif
+#ifndef Py_TPFLAGS_DISALLOW_INSTANTIATION
+  #define Py_TPFLAGS_DISALLOW_INSTANTIATION (1UL << 7)
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#ifndef METH_FASTCALL
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
+#endif
+#if CYTHON_METH_FASTCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#if PY_VERSION_HEX >= 0x030900B1
+#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_CheckExact(func)
+#else
+#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_Check(func)
+#endif
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(void)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if PY_VERSION_HEX < 0x03090000 || (CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000)
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#elif CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) GraalPyFrame_SetLineNumber((frame), (lineno))
+#elif CYTHON_COMPILING_IN_GRAAL
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) _PyFrame_SetLineNumber((frame), (lineno))
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#endif
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#define __Pyx_PyModule_GetState(o) (__pyx_mstatetype *)__Pyx__PyModule_GetState(o)
+#else
+#define __Pyx_PyModule_GetState(op) ((void)op,__pyx_mstate_global)
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE((PyObject *) obj), name, func_ctype)
+#define __Pyx_PyObject_TryGetSlot(obj, name, func_ctype) __Pyx_PyType_TryGetSlot(Py_TYPE(obj), name, func_ctype)
+#define __Pyx_PyObject_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#define __Pyx_PyObject_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype) __Pyx_PyType_GetSlot(type, name, func_ctype)
+  #define __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype) (((type)->sub) ? ((type)->sub->name) : NULL)
+  #define __Pyx_PyType_TryGetSubSlot(type, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype)
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype)\
+    ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000 ||\
+     (PyType_GetFlags(type) & Py_TPFLAGS_HEAPTYPE) || __Pyx_get_runtime_version() >= 0x030A0000) ?\
+     __Pyx_PyType_GetSlot(type, name, func_ctype) : NULL)
+  #define __Pyx_PyType_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSlot(obj, name, func_ctype)
+  #define __Pyx_PyType_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSlot(obj, name, func_ctype)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+#define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL) PyErr_Clear();
+    return res;
+}
+#elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+#endif
+#define __Pyx_PyObject_GetIterNextFunc(iterator)  __Pyx_PyObject_GetSlot(iterator, tp_iternext, iternextfunc)
+#if CYTHON_USE_TYPE_SPECS
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#else
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains)
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && PyUnstable_Object_IsUniquelyReferenced(obj)) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#elif CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        __Pyx_IS_TYPE(obj, &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+enum __Pyx_ReferenceSharing {
+  __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
+  __Pyx_ReferenceSharing_OwnStrongReference,
+  __Pyx_ReferenceSharing_FunctionArgument,
+  __Pyx_ReferenceSharing_SharedReference, // Never trust it to be unshared because it's a global or similar
+};
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX >= 0x030E0000
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing)\
+    (sharing == __Pyx_ReferenceSharing_DefinitelyUnique ? 1 :\
+      (sharing == __Pyx_ReferenceSharing_FunctionArgument ? PyUnstable_Object_IsUniqueReferencedTemporary(o) :\
+      (sharing == __Pyx_ReferenceSharing_OwnStrongReference ? PyUnstable_Object_IsUniquelyReferenced(o) : 0)))
+#elif (CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING) || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)sharing), Py_REFCNT(o) == 1)
+#else
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+  #elif CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
+  #endif
+#elif CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+  #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+  #endif
+#else
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_NewRef(PyList_GET_ITEM(o, i))
+#endif
+#if CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS && !CYTHON_COMPILING_IN_LIMITED_API && CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GetItemRefFast(o, i, unsafe_shared) (__Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+#else
+  #define __Pyx_PyList_GetItemRefFast(o, i, unsafe_shared) __Pyx_PyList_GetItemRef(o, i)
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyObject_GetItem(dict, key);
+  if (*result == NULL) {
+    if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+      PyErr_Clear();
+      return 0;
+    }
+    return -1;
+  }
+  return 1;
+}
+#else
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyDict_GetItemWithError(dict, key);
+  if (*result == NULL) {
+    return PyErr_Occurred() ? -1 : 0;
+  }
+  Py_INCREF(*result);
+  return 1;
+}
+#endif
+#if defined(CYTHON_DEBUG_VISIT_CONST) && CYTHON_DEBUG_VISIT_CONST
+  #define __Pyx_VISIT_CONST(obj)  Py_VISIT(obj)
+#else
+  #define __Pyx_VISIT_CONST(obj)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GET_ITEM(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GET_ITEM(o, i)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GetItem(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GetItem(o, i)
+#endif
+#if CYTHON_ASSUME_SAFE_SIZE
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
+#else
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_InternFromString)
+  #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#endif
+#define __Pyx_PyLong_FromHash_t PyLong_FromSsize_t
+#define __Pyx_PyLong_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#if __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+    #define __Pyx_PySendResult PySendResult
+#else
+    typedef enum {
+        PYGEN_RETURN = 0,
+        PYGEN_ERROR = -1,
+        PYGEN_NEXT = 1,
+    } __Pyx_PySendResult;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030A00A3
+  typedef __Pyx_PySendResult (*__Pyx_pyiter_sendfunc)(PyObject *iter, PyObject *value, PyObject **result);
+#else
+  #define __Pyx_pyiter_sendfunc sendfunc
+#endif
+#if !CYTHON_USE_AM_SEND
+#define __PYX_HAS_PY_AM_SEND 0
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+#define __PYX_HAS_PY_AM_SEND 1
+#else
+#define __PYX_HAS_PY_AM_SEND 2  // our own backported implementation
+#endif
+#if __PYX_HAS_PY_AM_SEND < 2
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#else
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+        __Pyx_pyiter_sendfunc am_send;
+    } __Pyx_PyAsyncMethodsStruct;
+    #define __Pyx_SlotTpAsAsync(s) ((PyAsyncMethods*)(s))
+#endif
+#if CYTHON_USE_AM_SEND && PY_VERSION_HEX < 0x030A00F0
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (1UL << 21)
+#else
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
+#endif
+#if PY_VERSION_HEX >= 0x03090000
+#define __Pyx_PyInterpreterState_Get() PyInterpreterState_Get()
+#else
+#define __Pyx_PyInterpreterState_Get() PyThreadState_Get()->interp
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
+#ifdef __cplusplus
+extern "C"
+#endif
+PyAPI_FUNC(void *) PyMem_Calloc(size_t nelem, size_t elsize);
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_init_co_variable(PyObject *inspect, const char* name, int *write_to) {
+    int value;
+    PyObject *py_value = PyObject_GetAttrString(inspect, name);
+    if (!py_value) return 0;
+    value = (int) PyLong_AsLong(py_value);
+    Py_DECREF(py_value);
+    *write_to = value;
+    return value != -1 || !PyErr_Occurred();
+}
+static int __Pyx_init_co_variables(void) {
+    PyObject *inspect;
+    int result;
+    inspect = PyImport_ImportModule("inspect");
+    result =
+#if !defined(CO_OPTIMIZED)
+        __Pyx_init_co_variable(inspect, "CO_OPTIMIZED", &CO_OPTIMIZED) &&
+#endif
+#if !defined(CO_NEWLOCALS)
+        __Pyx_init_co_variable(inspect, "CO_NEWLOCALS", &CO_NEWLOCALS) &&
+#endif
+#if !defined(CO_VARARGS)
+        __Pyx_init_co_variable(inspect, "CO_VARARGS", &CO_VARARGS) &&
+#endif
+#if !defined(CO_VARKEYWORDS)
+        __Pyx_init_co_variable(inspect, "CO_VARKEYWORDS", &CO_VARKEYWORDS) &&
+#endif
+#if !defined(CO_ASYNC_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_ASYNC_GENERATOR", &CO_ASYNC_GENERATOR) &&
+#endif
+#if !defined(CO_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_GENERATOR", &CO_GENERATOR) &&
+#endif
+#if !defined(CO_COROUTINE)
+        __Pyx_init_co_variable(inspect, "CO_COROUTINE", &CO_COROUTINE) &&
+#endif
+        1;
+    Py_DECREF(inspect);
+    return result ? 0 : -1;
+}
+#else
+static int __Pyx_init_co_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+#endif
+
+/* MathInitCode */
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #ifndef _USE_MATH_DEFINES
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#ifndef CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#define CYTHON_CLINE_IN_TRACEBACK_RUNTIME 0
+#endif
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+#define CYTHON_CLINE_IN_TRACEBACK CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#endif
+#if CYTHON_CLINE_IN_TRACEBACK
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; __pyx_clineno = __LINE__; (void) __pyx_clineno; }
+#else
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; (void) __pyx_clineno; }
+#endif
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__nonaga_mcts
+#define __PYX_HAVE_API__nonaga_mcts
+/* Early includes */
+#include "pythread.h"
+#include <string.h>
+#include <stdlib.h>
+#include <math.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+#ifdef CYTHON_FREETHREADING_COMPATIBLE
+#if CYTHON_FREETHREADING_COMPATIBLE
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AS_STRING(s)
+#else
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AsString(s)
+#endif
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+static CYTHON_INLINE PyObject *__Pyx_NewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_NewRef)
+    return Py_NewRef(obj);
+#else
+    Py_INCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_XNewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_XNewRef)
+    return Py_XNewRef(obj);
+#else
+    Py_XINCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b);
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#else
+#define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#endif
+#define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_Sign(x)  (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK)
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_Sign(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_Sign(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_Sign(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#elif __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeASCII(c_str, size, NULL)
+#else
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+/* PretendToInitialize */
+#ifdef __cplusplus
+#if __cplusplus > 201103L
+#include <type_traits>
+#endif
+template <typename T>
+static void __Pyx_pretend_to_initialize(T* ptr) {
+#if __cplusplus > 201103L
+    if ((std::is_trivially_default_constructible<T>::value))
+#endif
+        *ptr = T();
+    (void)ptr;
+}
+#else
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+#endif
+
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * const __pyx_cfilenm = __FILE__;
+static const char *__pyx_filename;
+
+/* #### Code section: filename_table ### */
+
+static const char* const __pyx_f[] = {
+  "NonagaGame/nonaga_mcts.pyx",
+  "NonagaGame/nonaga_mcts.pxd",
+  "<stringsource>",
+  "NonagaGame/nonaga_board.pxd",
+  "NonagaGame/nonaga_logic.pxd",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* Atomics.proto (used by UnpackUnboundCMethod) */
+#include <pythread.h>
+#ifndef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 1
+#endif
+#define __PYX_CYTHON_ATOMICS_ENABLED() CYTHON_ATOMICS
+#define __PYX_GET_CYTHON_COMPILING_IN_CPYTHON_FREETHREADING() CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __pyx_atomic_int_type int
+#define __pyx_nonatomic_int_type int
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__))
+    #include <stdatomic.h>
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)))
+    #include <atomic>
+#endif
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__) &&\
+                       ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type atomic_int
+    #define __pyx_atomic_ptr_type atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) atomic_fetch_add_explicit(value, 1, memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) atomic_fetch_add_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) atomic_fetch_sub_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) atomic_load_explicit(value, memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) atomic_load_explicit(value, memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C atomics"
+    #endif
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)) &&\
+                    ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type std::atomic_int
+    #define __pyx_atomic_ptr_type std::atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) std::atomic_fetch_sub_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) std::atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) std::atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) std::atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) std::atomic_load_explicit(value, std::memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) std::atomic_load_explicit(value, std::memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) std::atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C++ atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C++ atomics"
+    #endif
+#elif CYTHON_ATOMICS && (__GNUC__ >= 5 || (__GNUC__ == 4 &&\
+                    (__GNUC_MINOR__ > 1 ||\
+                    (__GNUC_MINOR__ == 1 && __GNUC_PATCHLEVEL__ >= 2))))
+    #define __pyx_atomic_ptr_type void*
+    #define __pyx_nonatomic_ptr_type void*
+    #define __pyx_atomic_incr_relaxed(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) __sync_fetch_and_sub(value, 1)
+    #define __pyx_atomic_sub(value, arg) __sync_fetch_and_sub(value, arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_store(value, new_value) __sync_lock_test_and_set(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_load_acquire(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) __sync_lock_test_and_set(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_nonatomic_ptr_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Using GNU atomics"
+    #endif
+#elif CYTHON_ATOMICS && defined(_MSC_VER)
+    #include <intrin.h>
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type long
+    #define __pyx_atomic_ptr_type void*
+    #undef __pyx_nonatomic_int_type
+    #define __pyx_nonatomic_int_type long
+    #define __pyx_nonatomic_ptr_type void*
+    #pragma intrinsic (_InterlockedExchangeAdd, _InterlockedExchange, _InterlockedCompareExchange, _InterlockedCompareExchangePointer, _InterlockedExchangePointer)
+    #define __pyx_atomic_incr_relaxed(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) _InterlockedExchangeAdd(value, -1)
+    #define __pyx_atomic_sub(value, arg) _InterlockedExchangeAdd(value, -arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = _InterlockedCompareExchange(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) _InterlockedExchangeAdd(value, 0)
+    #define __pyx_atomic_store(value, new_value) _InterlockedExchange(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) *(void * volatile *)value
+    #define __pyx_atomic_pointer_load_acquire(value) _InterlockedCompareExchangePointer(value, 0, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) _InterlockedExchangePointer(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_atomic_ptr_type old = _InterlockedCompareExchangePointer(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #pragma message ("Using MSVC atomics")
+    #endif
+#else
+    #undef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 0
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Not using atomics"
+    #endif
+#endif
+
+/* CriticalSectionsDefinition.proto (used by CriticalSections) */
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyCriticalSection void*
+#define __Pyx_PyCriticalSection2 void*
+#define __Pyx_PyCriticalSection_End(cs)
+#define __Pyx_PyCriticalSection2_End(cs)
+#else
+#define __Pyx_PyCriticalSection PyCriticalSection
+#define __Pyx_PyCriticalSection2 PyCriticalSection2
+#define __Pyx_PyCriticalSection_End PyCriticalSection_End
+#define __Pyx_PyCriticalSection2_End PyCriticalSection2_End
+#endif
+
+/* CriticalSections.proto (used by ParseKeywordsImpl) */
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyCriticalSection_Begin(cs, arg) (void)(cs)
+#define __Pyx_PyCriticalSection2_Begin(cs, arg1, arg2) (void)(cs)
+#else
+#define __Pyx_PyCriticalSection_Begin PyCriticalSection_Begin
+#define __Pyx_PyCriticalSection2_Begin PyCriticalSection2_Begin
+#endif
+#if PY_VERSION_HEX < 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_BEGIN_CRITICAL_SECTION(o) {
+#define __Pyx_END_CRITICAL_SECTION() }
+#else
+#define __Pyx_BEGIN_CRITICAL_SECTION Py_BEGIN_CRITICAL_SECTION
+#define __Pyx_END_CRITICAL_SECTION Py_END_CRITICAL_SECTION
+#endif
+
+/* IncludeStructmemberH.proto (used by FixUpExtensionType) */
+#include <structmember.h>
+
+/* #### Code section: numeric_typedefs ### */
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates;
+struct __pyx_obj_12nonaga_board_NonagaTile;
+struct __pyx_obj_12nonaga_board_NonagaPiece;
+struct __pyx_obj_12nonaga_board_NonagaIsland;
+struct __pyx_obj_12nonaga_board_NonagaBoard;
+struct __pyx_obj_12nonaga_logic_NonagaLogic;
+struct __pyx_obj_11nonaga_mcts_MCTS;
+struct __pyx_opt_args_12nonaga_board_11NonagaBoard_get_pieces;
+
+/* "nonaga_board.pxd":5
+ * # Occupancy grid: axial (q, r) coordinates wrapped onto a GRID_SIZE x GRID_SIZE torus.
+ * # The 19 tiles of the island never span half of GRID_SIZE, so wrapped cells never alias each other.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     GRID_BITS = 6
+ *     GRID_SIZE = 64
+*/
+enum  {
+  __pyx_e_12nonaga_board_GRID_BITS = 6,
+  __pyx_e_12nonaga_board_GRID_SIZE = 64,
+  __pyx_e_12nonaga_board_GRID_MASK = 63,
+  __pyx_e_12nonaga_board_GRID_CELLS = 0x1000,
+  __pyx_e_12nonaga_board_MAX_PIECE_MOVES = 18,
+  __pyx_e_12nonaga_board_MAX_ISLAND_TILES = 19
+};
+
+/* "nonaga_board.pxd":13
+ *     MAX_ISLAND_TILES = 19   # all the tiles of the game
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     CELL_EMPTY = 0
+ *     CELL_TILE = 1
+*/
+enum  {
+  __pyx_e_12nonaga_board_CELL_EMPTY = 0,
+  __pyx_e_12nonaga_board_CELL_TILE = 1,
+  __pyx_e_12nonaga_board_CELL_PIECE = 2
+};
+
+/* "nonaga_board.pxd":112
+ *     cpdef bint is_there_tile(self, tuple position)
+ *     cpdef bint is_there_piece(self, tuple position)
+ *     cpdef get_pieces(self, color=*)             # <<<<<<<<<<<<<<
+ *     cdef void _fill_cells(self)
+ *     cdef int fill_piece_moves(self, int color, int* moves) noexcept nogil
+*/
+struct __pyx_opt_args_12nonaga_board_11NonagaBoard_get_pieces {
+  int __pyx_n;
+  PyObject *color;
+};
+struct __pyx_t_15nonaga_position_Position;
+
+/* "nonaga_position.pxd":5
+ * from nonaga_logic cimport NonagaLogic
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     POSITION_TILES = 19         # tiles of a Nonaga island
+ *     POSITION_PIECES = 6
+*/
+enum  {
+
+  /* "nonaga_position.pxd":9
+ *     POSITION_PIECES = 6
+ *     # every movable tile to every empty cell next to the island
+ *     MAX_TILE_MOVES = POSITION_TILES * 6 * POSITION_TILES             # <<<<<<<<<<<<<<
+ *     NUM_COST_FEATURES = 8       # the terms weighted by the 8 parameters of AI.cost_function
+ * 
+*/
+  __pyx_e_15nonaga_position_POSITION_TILES = 19,
+  __pyx_e_15nonaga_position_POSITION_PIECES = 6,
+  __pyx_e_15nonaga_position_MAX_TILE_MOVES = ((__pyx_e_15nonaga_position_POSITION_TILES * 6) * __pyx_e_15nonaga_position_POSITION_TILES),
+  __pyx_e_15nonaga_position_NUM_COST_FEATURES = 8
+};
+
+/* "nonaga_position.pxd":15
+ * # Copy of a game position in plain C data, so that it can be played on without the GIL.
+ * # Coordinates are the real (q, r) ones; cells is the occupancy grid of NonagaBoard.
+ * cdef struct Position:             # <<<<<<<<<<<<<<
+ *     unsigned char cells[GRID_CELLS]
+ *     int num_tiles
+*/
+struct __pyx_t_15nonaga_position_Position {
+  unsigned char cells[__pyx_e_12nonaga_board_GRID_CELLS];
+  int num_tiles;
+  int tile_cells[__pyx_e_15nonaga_position_POSITION_TILES];
+  int tile_q[__pyx_e_15nonaga_position_POSITION_TILES];
+  int tile_r[__pyx_e_15nonaga_position_POSITION_TILES];
+  int num_pieces;
+  int piece_cells[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int piece_colors[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int piece_q[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int piece_r[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int current_player;
+  int turn_phase;
+};
+struct __pyx_t_11nonaga_mcts_NodePool;
+
+/* "nonaga_mcts.pxd":8
+ * 
+ * # The nodes of a search tree, field by field in growable C arrays; the children of a node are consecutive
+ * cdef struct NodePool:             # <<<<<<<<<<<<<<
+ *     int* parent
+ *     int* first_child
+*/
+struct __pyx_t_11nonaga_mcts_NodePool {
+  int *parent;
+  int *first_child;
+  int *num_children;
+  int *move;
+  int *visits;
+  int *virtual_loss;
+  double *value;
+  signed char *mover;
+  signed char *winner;
+  int size;
+  int capacity;
+};
+
+/* "nonaga_mcts.pyx":25
+ * 
+ * # Rollout policies
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     ROLLOUT_NONE = 0        # the leaf is evaluated by cost_function right away
+ *     ROLLOUT_RANDOM = 1      # random moves, winning slides are always played
+*/
+enum  {
+  __pyx_e_11nonaga_mcts_ROLLOUT_NONE = 0,
+  __pyx_e_11nonaga_mcts_ROLLOUT_RANDOM = 1,
+  __pyx_e_11nonaga_mcts_ROLLOUT_GUIDED = 2
+};
+
+/* "nonaga_mcts.pyx":32
+ * ROLLOUTS = {"none": ROLLOUT_NONE, "random": ROLLOUT_RANDOM, "guided": ROLLOUT_GUIDED}
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     BATCH = 16              # iterations a thread runs between two looks at the clock
+ *     EXPAND_VISITS = 2       # visits of a leaf before its moves are added to the tree
+*/
+enum  {
+  __pyx_e_11nonaga_mcts_BATCH = 16,
+  __pyx_e_11nonaga_mcts_EXPAND_VISITS = 2,
+  __pyx_e_11nonaga_mcts_REUSE_PLIES = 4,
+  __pyx_e_11nonaga_mcts_LOST_COST = -2147483647L
+};
+
+/* "nonaga_board.pxd":48
+ * 
+ * 
+ * cdef class NonagaTilesCoordinates:             # <<<<<<<<<<<<<<
+ *     cdef public int q, r, s
+ *     cdef public object island_id
+*/
+struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates *__pyx_vtab;
+  int q;
+  int r;
+  int s;
+  PyObject *island_id;
+};
+
+
+/* "nonaga_board.pxd":57
+ * 
+ * 
+ * cdef class NonagaTile(NonagaTilesCoordinates):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+*/
+struct __pyx_obj_12nonaga_board_NonagaTile {
+  struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates __pyx_base;
+};
+
+
+/* "nonaga_board.pxd":61
+ * 
+ * 
+ * cdef class NonagaPiece(NonagaTile):             # <<<<<<<<<<<<<<
+ *     cdef public int color
+ * 
+*/
+struct __pyx_obj_12nonaga_board_NonagaPiece {
+  struct __pyx_obj_12nonaga_board_NonagaTile __pyx_base;
+  int color;
+};
+
+
+/* "nonaga_board.pxd":68
+ * 
+ * 
+ * cdef class NonagaIsland:             # <<<<<<<<<<<<<<
+ *     cdef public int id
+ *     cdef public set movable_tiles, unmovable_tiles, all_tiles, border_tiles, pieces
+*/
+struct __pyx_obj_12nonaga_board_NonagaIsland {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_board_NonagaIsland *__pyx_vtab;
+  int id;
+  PyObject *movable_tiles;
+  PyObject *unmovable_tiles;
+  PyObject *all_tiles;
+  PyObject *border_tiles;
+  PyObject *pieces;
+  PyObject *frontier;
+  unsigned char occupied[__pyx_e_12nonaga_board_GRID_CELLS];
+  unsigned char neighbor_masks[__pyx_e_12nonaga_board_GRID_CELLS];
+  unsigned char articulation[__pyx_e_12nonaga_board_GRID_CELLS];
+  int _tile_cells[(3 * __pyx_e_12nonaga_board_MAX_ISLAND_TILES)];
+  int _cut[__pyx_e_12nonaga_board_MAX_ISLAND_TILES];
+  PyObject *_saved;
+};
+
+
+/* "nonaga_board.pxd":98
+ * 
+ * 
+ * cdef class NonagaBoard:             # <<<<<<<<<<<<<<
+ *     cdef public dict islands
+ *     cdef public list pieces, tiles
+*/
+struct __pyx_obj_12nonaga_board_NonagaBoard {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_board_NonagaBoard *__pyx_vtab;
+  PyObject *islands;
+  PyObject *pieces;
+  PyObject *tiles;
+  unsigned char cells[__pyx_e_12nonaga_board_GRID_CELLS];
+  int piece_cells[6];
+  int piece_colors[6];
+  int num_pieces;
+};
+
+
+/* "nonaga_logic.pxd":4
+ * from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaTile, NonagaPiece, MAX_PIECE_MOVES
+ * 
+ * cdef class NonagaLogic:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public object player_red, player_black
+*/
+struct __pyx_obj_12nonaga_logic_NonagaLogic {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic *__pyx_vtab;
+  PyObject *player_red;
+  PyObject *player_black;
+  struct __pyx_obj_12nonaga_board_NonagaBoard *board;
+  int current_player;
+  int turn_phase;
+  PyObject *change_feed;
+  PyObject *pieces_by_color;
+  int piece_distances[2][3];
+};
+
+
+/* "nonaga_mcts.pxd":22
+ * 
+ * 
+ * cdef class MCTS:             # <<<<<<<<<<<<<<
+ *     cdef public object parameter
+ *     cdef public int max_color
+*/
+struct __pyx_obj_11nonaga_mcts_MCTS {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_11nonaga_mcts_MCTS *__pyx_vtab;
+  PyObject *parameter;
+  int max_color;
+  double time_limit;
+  int iterations;
+  int threads;
+  PyObject *rollout;
+  int rollout_turns;
+  double exploration;
+  double evaluation_scale;
+  int reuse_tree;
+  int max_nodes;
+  int last_iterations;
+  int reused_visits;
+  struct __pyx_t_11nonaga_mcts_NodePool pool;
+  struct __pyx_t_15nonaga_position_Position root_position;
+  int has_root;
+  int params[8];
+  int rollout_mode;
+  PyThread_type_lock lock;
+  int done_iterations;
+  int target_iterations;
+  int failed;
+};
+
+
+
+/* "nonaga_board.pxd":48
+ * 
+ * 
+ * cdef class NonagaTilesCoordinates:             # <<<<<<<<<<<<<<
+ *     cdef public int q, r, s
+ *     cdef public object island_id
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates {
+  PyObject *(*get_island_id)(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, int __pyx_skip_dispatch);
+  PyObject *(*get_position)(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, int __pyx_skip_dispatch);
+  int (*distance_to)(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates *__pyx_vtabptr_12nonaga_board_NonagaTilesCoordinates;
+
+
+/* "nonaga_board.pxd":57
+ * 
+ * 
+ * cdef class NonagaTile(NonagaTilesCoordinates):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaTile {
+  struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates __pyx_base;
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaTile *__pyx_vtabptr_12nonaga_board_NonagaTile;
+
+
+/* "nonaga_board.pxd":61
+ * 
+ * 
+ * cdef class NonagaPiece(NonagaTile):             # <<<<<<<<<<<<<<
+ *     cdef public int color
+ * 
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaPiece {
+  struct __pyx_vtabstruct_12nonaga_board_NonagaTile __pyx_base;
+  int (*get_color)(struct __pyx_obj_12nonaga_board_NonagaPiece *, int __pyx_skip_dispatch);
+  void (*set_color)(struct __pyx_obj_12nonaga_board_NonagaPiece *, int, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaPiece *__pyx_vtabptr_12nonaga_board_NonagaPiece;
+
+
+/* "nonaga_board.pxd":68
+ * 
+ * 
+ * cdef class NonagaIsland:             # <<<<<<<<<<<<<<
+ *     cdef public int id
+ *     cdef public set movable_tiles, unmovable_tiles, all_tiles, border_tiles, pieces
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaIsland {
+  int (*get_id)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  int (*get_number_of_tiles)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_tiles)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  PyObject *(*get_movable_tiles)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  PyObject *(*get_pieces)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  void (*_add_tile)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *);
+  void (*_clear)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  void (*_save)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  void (*_restore)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  PyObject *(*_update_articulation)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  PyObject *(*_articulation_after_move)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int, int, int, int);
+  void (*_place_in_frontier)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int);
+  void (*_lift_from_frontier)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int);
+  int (*_mask_without_tile)(struct __pyx_obj_12nonaga_board_NonagaIsland *, PyObject *, int, struct __pyx_obj_12nonaga_board_NonagaTile *);
+  PyObject *(*valid_tile_destinations)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *, int __pyx_skip_dispatch);
+  PyObject *(*ordered_tile_destinations)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *);
+  int (*is_valid_tile_destination)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaIsland *__pyx_vtabptr_12nonaga_board_NonagaIsland;
+
+
+/* "nonaga_board.pxd":98
+ * 
+ * 
+ * cdef class NonagaBoard:             # <<<<<<<<<<<<<<
+ *     cdef public dict islands
+ *     cdef public list pieces, tiles
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaBoard {
+  PyObject *(*_initialize_board)(struct __pyx_obj_12nonaga_board_NonagaBoard *);
+  void (*_set_content)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, PyObject *);
+  struct __pyx_obj_12nonaga_board_NonagaPiece *(*get_piece)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_12nonaga_board_NonagaTile *(*get_tile)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  int (*is_there_tile)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  int (*is_there_piece)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_pieces)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int __pyx_skip_dispatch, struct __pyx_opt_args_12nonaga_board_11NonagaBoard_get_pieces *__pyx_optional_args);
+  void (*_fill_cells)(struct __pyx_obj_12nonaga_board_NonagaBoard *);
+  int (*fill_piece_moves)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int, int *);
+  struct __pyx_obj_12nonaga_board_NonagaPiece *(*get_piece_at_cell)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int);
+  PyObject *(*cell_position)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int, int, int);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaBoard *__pyx_vtabptr_12nonaga_board_NonagaBoard;
+
+
+/* "nonaga_logic.pxd":4
+ * from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaTile, NonagaPiece, MAX_PIECE_MOVES
+ * 
+ * cdef class NonagaLogic:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public object player_red, player_black
+*/
+
+struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic {
+  PyObject *(*get_board_state)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_valid_tile_moves_ai)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  PyObject *(*get_all_valid_tile_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_valid_piece_moves_ai)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  PyObject *(*get_all_valid_piece_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  PyObject *(*is_ai_player)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int);
+  PyObject *(*_get_valid_tile_positions)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  int (*is_valid_tile_destination)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*_get_valid_piece_moves_in_direction)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaPiece *, struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int);
+  void (*move_tile)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *, int __pyx_skip_dispatch);
+  void (*move_piece)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaPiece *, PyObject *, int __pyx_skip_dispatch);
+  void (*undo_tile_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *);
+  void (*undo_piece_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaPiece *, PyObject *);
+  void (*_next_turn_phase)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  void (*_last_turn_phase)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  int (*get_current_turn_phase)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  void (*_track_pieces)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  void (*_update_piece_distances)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int);
+  int (*check_win_condition)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  int (*may_connect_in_one_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  PyObject *(*_winning_piece_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int);
+  PyObject *(*get_winning_piece_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  int (*has_winning_piece_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  int (*get_current_player)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  void (*switch_player)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic *__pyx_vtabptr_12nonaga_logic_NonagaLogic;
+
+
+/* "nonaga_mcts.pyx":115
+ * 
+ * 
+ * cdef class MCTS:             # <<<<<<<<<<<<<<
+ *     """Monte Carlo tree search player with the get_best_move interface of AI.
+ * 
+*/
+
+struct __pyx_vtabstruct_11nonaga_mcts_MCTS {
+  int (*_iterate)(struct __pyx_obj_11nonaga_mcts_MCTS *, unsigned PY_LONG_LONG *);
+  int (*_expand)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, struct __pyx_t_15nonaga_position_Position *);
+  int (*_select)(struct __pyx_obj_11nonaga_mcts_MCTS *, int);
+  double (*_simulate)(struct __pyx_obj_11nonaga_mcts_MCTS *, struct __pyx_t_15nonaga_position_Position *, int, unsigned PY_LONG_LONG *);
+  double (*_evaluate)(struct __pyx_obj_11nonaga_mcts_MCTS *, struct __pyx_t_15nonaga_position_Position const *);
+  int (*_find_node)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, struct __pyx_t_15nonaga_position_Position *, struct __pyx_t_15nonaga_position_Position const *, int);
+  void (*_reroot)(struct __pyx_obj_11nonaga_mcts_MCTS *, int);
+  int (*_best_move)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, struct __pyx_t_15nonaga_position_Position *);
+  int (*_child_with_move)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, int);
+  PyObject *(*get_best_move)(struct __pyx_obj_11nonaga_mcts_MCTS *, struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_11nonaga_mcts_MCTS *__pyx_vtabptr_11nonaga_mcts_MCTS;
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* DivInt[long].proto */
+static CYTHON_INLINE long __Pyx_div_long(long, long, int b_is_constant);
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by WriteUnraisableException) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* TupleAndListFromArray.proto (used by fastcall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* IncludeStringH.proto (used by BytesEquals) */
+#include <string.h>
+
+/* BytesEquals.proto (used by UnicodeEquals) */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* UnicodeEquals.proto (used by fastcall) */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals);
+
+/* fastcall.proto */
+#if CYTHON_AVOID_BORROWED_REFS
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_PySequence_ITEM(args, i)
+#elif CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_NewRef(__Pyx_PyTuple_GET_ITEM(args, i))
+#else
+    #define __Pyx_ArgRef_VARARGS(args, i) __Pyx_XNewRef(PyTuple_GetItem(args, i))
+#endif
+#define __Pyx_NumKwargs_VARARGS(kwds) PyDict_Size(kwds)
+#define __Pyx_KwValues_VARARGS(args, nargs) NULL
+#define __Pyx_GetKwValue_VARARGS(kw, kwvalues, s) __Pyx_PyDict_GetItemStrWithError(kw, s)
+#define __Pyx_KwargsAsDict_VARARGS(kw, kwvalues) PyDict_Copy(kw)
+#if CYTHON_METH_FASTCALL
+    #define __Pyx_ArgRef_FASTCALL(args, i) __Pyx_NewRef(args[i])
+    #define __Pyx_NumKwargs_FASTCALL(kwds) __Pyx_PyTuple_GET_SIZE(kwds)
+    #define __Pyx_KwValues_FASTCALL(args, nargs) ((args) + (nargs))
+    static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+    CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues);
+  #else
+    #define __Pyx_KwargsAsDict_FASTCALL(kw, kwvalues) _PyStack_AsDict(kwvalues, kw)
+  #endif
+#else
+    #define __Pyx_ArgRef_FASTCALL __Pyx_ArgRef_VARARGS
+    #define __Pyx_NumKwargs_FASTCALL __Pyx_NumKwargs_VARARGS
+    #define __Pyx_KwValues_FASTCALL __Pyx_KwValues_VARARGS
+    #define __Pyx_GetKwValue_FASTCALL __Pyx_GetKwValue_VARARGS
+    #define __Pyx_KwargsAsDict_FASTCALL __Pyx_KwargsAsDict_VARARGS
+#endif
+#define __Pyx_ArgsSlice_VARARGS(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#if CYTHON_METH_FASTCALL || (CYTHON_COMPILING_IN_CPYTHON && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) __Pyx_PyTuple_FromArray(args + start, stop - start)
+#else
+#define __Pyx_ArgsSlice_FASTCALL(args, start, stop) PyTuple_GetSlice(args, start, stop)
+#endif
+
+/* RaiseArgTupleInvalid.proto */
+static void __Pyx_RaiseArgtupleInvalid(const char* func_name, int exact,
+    Py_ssize_t num_min, Py_ssize_t num_max, Py_ssize_t num_found);
+
+/* py_dict_items.proto (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d);
+
+/* CallCFunction.proto (used by CallUnboundCMethod0) */
+#define __Pyx_CallCFunction(cfunc, self, args)\
+    ((PyCFunction)(void(*)(void))(cfunc)->func)(self, args)
+#define __Pyx_CallCFunctionWithKeywords(cfunc, self, args, kwargs)\
+    ((PyCFunctionWithKeywords)(void(*)(void))(cfunc)->func)(self, args, kwargs)
+#define __Pyx_CallCFunctionFast(cfunc, self, args, nargs)\
+    ((__Pyx_PyCFunctionFast)(void(*)(void))(PyCFunction)(cfunc)->func)(self, args, nargs)
+#define __Pyx_CallCFunctionFastWithKeywords(cfunc, self, args, nargs, kwnames)\
+    ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))(PyCFunction)(cfunc)->func)(self, args, nargs, kwnames)
+
+/* PyObjectCall.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto (used by PyObjectCallOneArg) */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs);
+
+/* PyObjectCallOneArg.proto (used by CallUnboundCMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* PyObjectGetAttrStr.proto (used by UnpackUnboundCMethod) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* UnpackUnboundCMethod.proto (used by CallUnboundCMethod0) */
+typedef struct {
+    PyObject *type;
+    PyObject **method_name;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && CYTHON_ATOMICS
+    __pyx_atomic_int_type initialized;
+#endif
+    PyCFunction func;
+    PyObject *method;
+    int flag;
+} __Pyx_CachedCFunction;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+static CYTHON_INLINE int __Pyx_CachedCFunction_GetAndSetInitializing(__Pyx_CachedCFunction *cfunc) {
+#if !CYTHON_ATOMICS
+    return 1;
+#else
+    __pyx_nonatomic_int_type expected = 0;
+    if (__pyx_atomic_int_cmp_exchange(&cfunc->initialized, &expected, 1)) {
+        return 0;
+    }
+    return expected;
+#endif
+}
+static CYTHON_INLINE void __Pyx_CachedCFunction_SetFinishedInitializing(__Pyx_CachedCFunction *cfunc) {
+#if CYTHON_ATOMICS
+    __pyx_atomic_store(&cfunc->initialized, 2);
+#endif
+}
+#else
+#define __Pyx_CachedCFunction_GetAndSetInitializing(cfunc) 2
+#define __Pyx_CachedCFunction_SetFinishedInitializing(cfunc)
+#endif
+
+/* CallUnboundCMethod0.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self);
+#else
+#define __Pyx_CallUnboundCMethod0(cfunc, self)  __Pyx__CallUnboundCMethod0(cfunc, self)
+#endif
+
+/* py_dict_values.proto (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d);
+
+/* OwnedDictNext.proto (used by RejectKeywords) */
+#if CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, PyObject **ppos, PyObject **pkey, PyObject **pvalue);
+#else
+CYTHON_INLINE
+static int __Pyx_PyDict_NextRef(PyObject *p, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue);
+#endif
+
+/* RejectKeywords.export */
+static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds);
+
+/* RaiseDoubleKeywords.proto (used by ParseKeywordsImpl) */
+static void __Pyx_RaiseDoubleKeywordsError(const char* func_name, PyObject* kw_name);
+
+/* ParseKeywordsImpl.export */
+static int __Pyx_ParseKeywordsTuple(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+static int __Pyx_ParseKeywordDictToDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name
+);
+static int __Pyx_ParseKeywordDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+
+/* CallUnboundCMethod2.proto */
+CYTHON_UNUSED
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2);
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2);
+#else
+#define __Pyx_CallUnboundCMethod2(cfunc, self, arg1, arg2)  __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2)
+#endif
+
+/* ParseKeywords.proto */
+static CYTHON_INLINE int __Pyx_ParseKeywords(
+    PyObject *kwds, PyObject *const *kwvalues, PyObject ** const argnames[],
+    PyObject *kwds2, PyObject *values[],
+    Py_ssize_t num_pos_args, Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs
+);
+
+/* ArgTypeTestFunc.export */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact);
+
+/* ArgTypeTest.proto */
+#define __Pyx_ArgTypeTest(obj, type, none_allowed, name, exact)\
+    ((likely(__Pyx_IS_TYPE(obj, type) | (none_allowed && (obj == Py_None)))) ? 1 :\
+        __Pyx__ArgTypeTest(obj, type, name, exact))
+
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by GetBuiltinName) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* GetBuiltinName.proto (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* PySequenceContains.proto */
+static CYTHON_INLINE int __Pyx_PySequence_ContainsTF(PyObject* item, PyObject* seq, int eq) {
+    int result = PySequence_Contains(seq, item);
+    return unlikely(result < 0) ? result : (result == (eq == Py_EQ));
+}
+
+/* PyValueError_Check.proto */
+#define __Pyx_PyExc_ValueError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ValueError)
+
+/* PyObjectFormatAndDecref.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f);
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f);
+
+/* PyObjectFormatSimple.proto */
+#if CYTHON_COMPILING_IN_PYPY
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#elif CYTHON_USE_TYPE_SLOTS
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        likely(PyLong_CheckExact(s)) ? PyLong_Type.tp_repr(s) :\
+        likely(PyFloat_CheckExact(s)) ? PyFloat_Type.tp_repr(s) :\
+        PyObject_Format(s, f))
+#else
+    #define __Pyx_PyObject_FormatSimple(s, f) (\
+        likely(PyUnicode_CheckExact(s)) ? (Py_INCREF(s), s) :\
+        PyObject_Format(s, f))
+#endif
+
+/* JoinPyUnicode.export */
+static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char);
+
+/* RaiseException.export */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* RaiseUnexpectedTypeError.proto */
+static int __Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj);
+
+/* GetItemInt.proto */
+#define __Pyx_GetItemInt(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Fast(o, (Py_ssize_t)i, is_list, wraparound, boundscheck, unsafe_shared) :\
+    (is_list ? (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL) :\
+               __Pyx_GetItemInt_Generic(o, to_py_func(i))))
+#define __Pyx_GetItemInt_List(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_List_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared);
+#define __Pyx_GetItemInt_Tuple(o, i, type, is_signed, to_py_func, is_list, wraparound, boundscheck, has_gil, unsafe_shared)\
+    (__Pyx_fits_Py_ssize_t(i, type, is_signed) ?\
+    __Pyx_GetItemInt_Tuple_Fast(o, (Py_ssize_t)i, wraparound, boundscheck, unsafe_shared) :\
+    (PyErr_SetString(PyExc_IndexError, "tuple index out of range"), (PyObject*)NULL))
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared);
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j);
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i,
+                                                     int is_list, int wraparound, int boundscheck, int unsafe_shared);
+
+/* DictGetItem.proto */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key);
+#define __Pyx_PyObject_Dict_GetItem(obj, name)\
+    (likely(PyDict_CheckExact(obj)) ?\
+     __Pyx_PyDict_GetItem(obj, name) : PyObject_GetItem(obj, name))
+#else
+#define __Pyx_PyDict_GetItem(d, key) PyObject_GetItem(d, key)
+#define __Pyx_PyObject_Dict_GetItem(obj, name)  PyObject_GetItem(obj, name)
+#endif
+
+/* ModInt[long].proto */
+static CYTHON_INLINE long __Pyx_mod_long(long, long, int b_is_constant);
+
+/* ListCompAppend.proto */
+#if CYTHON_USE_PYLIST_INTERNALS && CYTHON_ASSUME_SAFE_MACROS
+static CYTHON_INLINE int __Pyx_ListComp_Append(PyObject* list, PyObject* x) {
+    PyListObject* L = (PyListObject*) list;
+    Py_ssize_t len = Py_SIZE(list);
+    if (likely(L->allocated > len)) {
+        Py_INCREF(x);
+        #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000
+        L->ob_item[len] = x;
+        #else
+        PyList_SET_ITEM(list, len, x);
+        #endif
+        __Pyx_SET_SIZE(list, len + 1);
+        return 0;
+    }
+    return PyList_Append(list, x);
+}
+#else
+#define __Pyx_ListComp_Append(L,x) PyList_Append(L,x)
+#endif
+
+/* PyObjectVectorCallKwBuilder.proto */
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#if CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x03090000
+#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
+#else
+#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
+#endif
+#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#else
+#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
+#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
+#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
+#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
+#endif
+
+/* PyObjectFastCallMethod.proto */
+#if CYTHON_VECTORCALL && PY_VERSION_HEX >= 0x03090000
+#define __Pyx_PyObject_FastCallMethod(name, args, nargsf) PyObject_VectorcallMethod(name, args, nargsf, NULL)
+#else
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf);
+#endif
+
+/* PyMemoryError_Check.proto */
+#define __Pyx_PyExc_MemoryError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_MemoryError)
+
+/* PyTypeError_Check.proto */
+#define __Pyx_PyExc_TypeError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_TypeError)
+
+/* AllocateExtensionType.proto */
+static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final);
+
+/* CallTypeTraverse.proto */
+#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
+#define __Pyx_call_type_traverse(o, always_call, visit, arg) 0
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg);
+#endif
+
+/* LimitedApiGetTypeDict.proto (used by SetItemOnTypeDict) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_GetTypeDict(PyTypeObject *tp);
+#endif
+
+/* SetItemOnTypeDict.proto (used by FixUpExtensionType) */
+static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v);
+#define __Pyx_SetItemOnTypeDict(tp, k, v) __Pyx__SetItemOnTypeDict((PyTypeObject*)tp, k, v)
+
+/* FixUpExtensionType.proto */
+static CYTHON_INLINE int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type);
+
+/* PyObjectCallNoArg.proto (used by PyObjectCallMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func);
+
+/* PyObjectGetMethod.proto (used by PyObjectCallMethod0) */
+#if !(CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000)))
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method);
+#endif
+
+/* PyObjectCallMethod0.proto (used by PyType_Ready) */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name);
+
+/* ValidateBasesTuple.proto (used by PyType_Ready) */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases);
+#endif
+
+/* PyType_Ready.proto */
+CYTHON_UNUSED static int __Pyx_PyType_Ready(PyTypeObject *t);
+
+/* SetVTable.proto */
+static int __Pyx_SetVtable(PyTypeObject* typeptr , void* vtable);
+
+/* GetVTable.proto (used by MergeVTables) */
+static void* __Pyx_GetVtable(PyTypeObject *type);
+
+/* MergeVTables.proto */
+static int __Pyx_MergeVtables(PyTypeObject *type);
+
+/* DelItemOnTypeDict.proto (used by SetupReduce) */
+static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k);
+#define __Pyx_DelItemOnTypeDict(tp, k) __Pyx__DelItemOnTypeDict((PyTypeObject*)tp, k)
+
+/* SetupReduce.proto */
+static int __Pyx_setup_reduce(PyObject* type_obj);
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_3_2_4
+#define __PYX_HAVE_RT_ImportType_proto_3_2_4
+#if defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if (defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L) || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_3_2_4(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_3_2_4(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_3_2_4 {
+   __Pyx_ImportType_CheckSize_Error_3_2_4 = 0,
+   __Pyx_ImportType_CheckSize_Warn_3_2_4 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_3_2_4 = 2
+};
+static PyTypeObject *__Pyx_ImportType_3_2_4(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_2_4 check_size);
+#endif
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_3_2_4(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* HasAttr.proto (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_HasAttr(o, n)  PyObject_HasAttrWithError(o, n)
+#else
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+#endif
+
+/* ImportImpl.export */
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level);
+
+/* Import.proto */
+static CYTHON_INLINE PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* dict_setdefault.proto (used by FetchCommonType) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* AddModuleRef.proto (used by FetchSharedCythonModule) */
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING ) ||\
+     __PYX_LIMITED_VERSION_HEX < 0x030d0000)
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
+#else
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#endif
+
+/* FetchSharedCythonModule.proto (used by FetchCommonType) */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void);
+
+/* FetchCommonType.proto (used by CommonTypesMetaclass) */
+static PyTypeObject* __Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases);
+
+/* CommonTypesMetaclass.proto (used by CythonFunctionShared) */
+static int __pyx_CommonTypesMetaclass_init(PyObject *module);
+#define __Pyx_CommonTypesMetaclass_USED
+
+/* PyMethodNew.proto (used by CythonFunctionShared) */
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ);
+
+/* PyVectorcallFastCallDict.proto (used by CythonFunctionShared) */
+#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw);
+#endif
+
+/* CythonFunctionShared.proto (used by CythonFunction) */
+#define __Pyx_CyFunction_USED
+#define __Pyx_CYFUNCTION_STATICMETHOD  0x01
+#define __Pyx_CYFUNCTION_CLASSMETHOD   0x02
+#define __Pyx_CYFUNCTION_CCLASS        0x04
+#define __Pyx_CYFUNCTION_COROUTINE     0x08
+#define __Pyx_CyFunction_GetClosure(f)\
+    (((__pyx_CyFunctionObject *) (f))->func_closure)
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_CyFunction_GetClassObj(f)\
+      (((__pyx_CyFunctionObject *) (f))->func_classobj)
+#else
+  #define __Pyx_CyFunction_GetClassObj(f)\
+      ((PyObject*) ((PyCMethodObject *) (f))->mm_class)
+#endif
+#define __Pyx_CyFunction_SetClassObj(f, classobj)\
+    __Pyx__CyFunction_SetClassObj((__pyx_CyFunctionObject *) (f), (classobj))
+#define __Pyx_CyFunction_Defaults(type, f)\
+    ((type *)(((__pyx_CyFunctionObject *) (f))->defaults))
+#define __Pyx_CyFunction_SetDefaultsGetter(f, g)\
+    ((__pyx_CyFunctionObject *) (f))->defaults_getter = (g)
+typedef struct {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject_HEAD
+    PyObject *func;
+#elif PY_VERSION_HEX < 0x030900B1
+    PyCFunctionObject func;
+#else
+    PyCMethodObject func;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API && CYTHON_METH_FASTCALL
+    __pyx_vectorcallfunc func_vectorcall;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_weakreflist;
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_dict;
+#endif
+    PyObject *func_name;
+    PyObject *func_qualname;
+    PyObject *func_doc;
+    PyObject *func_globals;
+    PyObject *func_code;
+    PyObject *func_closure;
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *func_classobj;
+#endif
+    PyObject *defaults;
+    int flags;
+    PyObject *defaults_tuple;
+    PyObject *defaults_kwdict;
+    PyObject *(*defaults_getter)(PyObject *);
+    PyObject *func_annotations;
+    PyObject *func_is_coroutine;
+} __pyx_CyFunctionObject;
+#undef __Pyx_CyOrPyCFunction_Check
+#define __Pyx_CyFunction_Check(obj)  __Pyx_TypeCheck(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+#define __Pyx_CyOrPyCFunction_Check(obj)  __Pyx_TypeCheck2(obj, __pyx_mstate_global->__pyx_CyFunctionType, &PyCFunction_Type)
+#define __Pyx_CyFunction_CheckExact(obj)  __Pyx_IS_TYPE(obj, __pyx_mstate_global->__pyx_CyFunctionType)
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void));
+#undef __Pyx_IsSameCFunction
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCyOrCFunction(func, cfunc)
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject* op, PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj);
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func,
+                                                         PyTypeObject *defaults_type);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *m,
+                                                            PyObject *tuple);
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *m,
+                                                             PyObject *dict);
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *m,
+                                                              PyObject *dict);
+static int __pyx_CyFunction_init(PyObject *module);
+#if CYTHON_METH_FASTCALL
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames);
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyFunction_func_vectorcall(f) (((__pyx_CyFunctionObject*)f)->func_vectorcall)
+#else
+#define __Pyx_CyFunction_func_vectorcall(f) (((PyCFunctionObject*)f)->vectorcall)
+#endif
+#endif
+
+/* CythonFunction.proto */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml,
+                                      int flags, PyObject* qualname,
+                                      PyObject *closure,
+                                      PyObject *module, PyObject *globals,
+                                      PyObject* code);
+
+/* CLineInTraceback.proto (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#else
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#endif
+
+/* CodeObjectCache.proto (used by AddTraceback) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject __Pyx_CachedCodeObjectType;
+#else
+typedef PyCodeObject __Pyx_CachedCodeObjectType;
+#endif
+typedef struct {
+    __Pyx_CachedCodeObjectType* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_int_type accessor_count;
+  #endif
+};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyLong_As_unsigned_PY_LONG_LONG(PyObject *);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
+
+/* FormatTypeName.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyType_GetFullyQualifiedName PyType_GetFullyQualifiedName
+#else
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#endif
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+#ifdef PyExceptionInstance_Check
+  #define __Pyx_PyBaseException_Check(obj) PyExceptionInstance_Check(obj)
+#else
+  #define __Pyx_PyBaseException_Check(obj) __Pyx_TypeCheck(obj, PyExc_BaseException)
+#endif
+
+/* GetRuntimeVersion.proto */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+static unsigned long __Pyx_cached_runtime_version = 0;
+static void __Pyx_init_runtime_version(void);
+#else
+#define __Pyx_init_runtime_version()
+#endif
+static unsigned long __Pyx_get_runtime_version(void);
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* DecompressString.proto */
+static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo);
+
+/* MultiPhaseInitModuleState.proto */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+static PyObject *__Pyx_State_FindModule(void*);
+static int __Pyx_State_AddModule(PyObject* module, void*);
+static int __Pyx_State_RemoveModule(void*);
+#elif CYTHON_USE_MODULE_STATE
+#define __Pyx_State_FindModule PyState_FindModule
+#define __Pyx_State_AddModule PyState_AddModule
+#define __Pyx_State_RemoveModule PyState_RemoveModule
+#endif
+
+/* #### Code section: module_declarations ### */
+/* CythonABIVersion.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #if CYTHON_METH_FASTCALL
+        #define __PYX_FASTCALL_ABI_SUFFIX  "_fastcall"
+    #else
+        #define __PYX_FASTCALL_ABI_SUFFIX
+    #endif
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_FASTCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#else
+    #define __PYX_LIMITED_ABI_SUFFIX
+#endif
+#if __PYX_HAS_PY_AM_SEND == 1
+    #define __PYX_AM_SEND_ABI_SUFFIX
+#elif __PYX_HAS_PY_AM_SEND == 2
+    #define __PYX_AM_SEND_ABI_SUFFIX "amsendbackport"
+#else
+    #define __PYX_AM_SEND_ABI_SUFFIX "noamsend"
+#endif
+#ifndef __PYX_MONITORING_ABI_SUFFIX
+    #define __PYX_MONITORING_ABI_SUFFIX
+#endif
+#if CYTHON_USE_TP_FINALIZE
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX
+#else
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX "nofinalize"
+#endif
+#if CYTHON_USE_FREELISTS || !defined(__Pyx_AsyncGen_USED)
+    #define __PYX_FREELISTS_ABI_SUFFIX
+#else
+    #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+
+static int __pyx_f_11nonaga_mcts_4MCTS__iterate(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, unsigned PY_LONG_LONG *__pyx_v_rng); /* proto*/
+static int __pyx_f_11nonaga_mcts_4MCTS__expand(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, struct __pyx_t_15nonaga_position_Position *__pyx_v_position); /* proto*/
+static int __pyx_f_11nonaga_mcts_4MCTS__select(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node); /* proto*/
+static double __pyx_f_11nonaga_mcts_4MCTS__simulate(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_winner, unsigned PY_LONG_LONG *__pyx_v_rng); /* proto*/
+static double __pyx_f_11nonaga_mcts_4MCTS__evaluate(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_t_15nonaga_position_Position const *__pyx_v_position); /* proto*/
+static int __pyx_f_11nonaga_mcts_4MCTS__find_node(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, struct __pyx_t_15nonaga_position_Position *__pyx_v_position, struct __pyx_t_15nonaga_position_Position const *__pyx_v_target, int __pyx_v_plies); /* proto*/
+static void __pyx_f_11nonaga_mcts_4MCTS__reroot(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node); /* proto*/
+static int __pyx_f_11nonaga_mcts_4MCTS__best_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, struct __pyx_t_15nonaga_position_Position *__pyx_v_position); /* proto*/
+static int __pyx_f_11nonaga_mcts_4MCTS__child_with_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, int __pyx_v_move); /* proto*/
+static PyObject *__pyx_f_11nonaga_mcts_4MCTS_get_best_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_obj_12nonaga_logic_NonagaLogic *__pyx_v_game_state, int __pyx_skip_dispatch); /* proto*/
+
+/* Module declarations from "cpython.pythread" */
+
+/* Module declarations from "nonaga_board" */
+
+/* Module declarations from "nonaga_logic" */
+
+/* Module declarations from "nonaga_position" */
+static void (*__pyx_f_15nonaga_position_load_position)(struct __pyx_t_15nonaga_position_Position *, struct __pyx_obj_12nonaga_logic_NonagaLogic *); /*proto*/
+static int (*__pyx_f_15nonaga_position_same_position)(struct __pyx_t_15nonaga_position_Position const *, struct __pyx_t_15nonaga_position_Position const *); /*proto*/
+static int (*__pyx_f_15nonaga_position_fill_position_piece_moves)(struct __pyx_t_15nonaga_position_Position const *, int *); /*proto*/
+static int (*__pyx_f_15nonaga_position_fill_position_tile_moves)(struct __pyx_t_15nonaga_position_Position *, int *); /*proto*/
+static void (*__pyx_f_15nonaga_position_play_piece_move)(struct __pyx_t_15nonaga_position_Position *, int); /*proto*/
+static void (*__pyx_f_15nonaga_position_play_tile_move)(struct __pyx_t_15nonaga_position_Position *, int); /*proto*/
+static void (*__pyx_f_15nonaga_position_undo_piece_move)(struct __pyx_t_15nonaga_position_Position *, int); /*proto*/
+static void (*__pyx_f_15nonaga_position_undo_tile_move)(struct __pyx_t_15nonaga_position_Position *, int); /*proto*/
+static PyObject *(*__pyx_f_15nonaga_position_move_positions)(struct __pyx_t_15nonaga_position_Position const *, int, int); /*proto*/
+static int (*__pyx_f_15nonaga_position_position_won)(struct __pyx_t_15nonaga_position_Position const *, int); /*proto*/
+static int (*__pyx_f_15nonaga_position_find_winning_slide)(struct __pyx_t_15nonaga_position_Position const *, int); /*proto*/
+static int (*__pyx_f_15nonaga_position_position_cost)(struct __pyx_t_15nonaga_position_Position const *, int, int const *); /*proto*/
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "libc.stdlib" */
+
+/* Module declarations from "libc.math" */
+
+/* Module declarations from "nonaga_mcts" */
+static int __pyx_v_11nonaga_mcts__RED;
+static int __pyx_v_11nonaga_mcts__PIECE_TO_MOVE;
+static CYTHON_INLINE unsigned PY_LONG_LONG __pyx_f_11nonaga_mcts__next_random(unsigned PY_LONG_LONG *); /*proto*/
+static CYTHON_INLINE int __pyx_f_11nonaga_mcts__random_below(unsigned PY_LONG_LONG *, int); /*proto*/
+static int __pyx_f_11nonaga_mcts_pool_allocate(struct __pyx_t_11nonaga_mcts_NodePool *, int); /*proto*/
+static void __pyx_f_11nonaga_mcts_pool_free(struct __pyx_t_11nonaga_mcts_NodePool *); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "nonaga_mcts"
+extern int __pyx_module_is_main_nonaga_mcts;
+int __pyx_module_is_main_nonaga_mcts = 0;
+
+/* Implementation of "nonaga_mcts" */
+/* #### Code section: global_var ### */
+/* #### Code section: string_decls ### */
+/* #### Code section: decls ### */
+static int __pyx_pf_11nonaga_mcts_4MCTS___cinit__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static void __pyx_pf_11nonaga_mcts_4MCTS_2__dealloc__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_4__init__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_parameter, int __pyx_v_color, double __pyx_v_time_limit, int __pyx_v_iterations, int __pyx_v_threads, PyObject *__pyx_v_rollout, int __pyx_v_rollout_turns, double __pyx_v_exploration, double __pyx_v_evaluation_scale, int __pyx_v_reuse_tree, int __pyx_v_max_nodes); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9tree_size___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_6_run(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, double __pyx_v_deadline, unsigned PY_LONG_LONG __pyx_v_seed); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_8get_best_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_obj_12nonaga_logic_NonagaLogic *__pyx_v_game_state); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9parameter___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_9parameter_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_9parameter_4__del__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9max_color___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_9max_color_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10time_limit___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_10time_limit_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10iterations___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_10iterations_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_7threads___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_7threads_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_7rollout___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_7rollout_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_7rollout_4__del__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_13rollout_turns___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_13rollout_turns_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_11exploration___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_11exploration_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_16evaluation_scale___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_16evaluation_scale_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10reuse_tree___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_10reuse_tree_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9max_nodes___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static int __pyx_pf_11nonaga_mcts_4MCTS_9max_nodes_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_15last_iterations___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_13reused_visits___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self); /* proto */
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state); /* proto */
+static PyObject *__pyx_tp_new_11nonaga_mcts_MCTS(PyTypeObject *t, PyObject *a, PyObject *k); /*proto*/
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+/* SmallCodeConfig */
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+typedef struct {
+  PyObject *__pyx_d;
+  PyObject *__pyx_b;
+  PyObject *__pyx_cython_runtime;
+  PyObject *__pyx_empty_tuple;
+  PyObject *__pyx_empty_bytes;
+  PyObject *__pyx_empty_unicode;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaTilesCoordinates;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaTile;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaPiece;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaIsland;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaBoard;
+  PyTypeObject *__pyx_ptype_12nonaga_logic_NonagaLogic;
+  PyObject *__pyx_type_11nonaga_mcts_MCTS;
+  PyTypeObject *__pyx_ptype_11nonaga_mcts_MCTS;
+  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_items;
+  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_pop;
+  __Pyx_CachedCFunction __pyx_umethod_PyDict_Type_values;
+  int __pyx_k_;
+  PyObject *__pyx_codeobj_tab[4];
+  PyObject *__pyx_string_tab[89];
+  PyObject *__pyx_number_tab[1];
+/* #### Code section: module_state_contents ### */
+/* CommonTypesMetaclass.module_state_decls */
+PyTypeObject *__pyx_CommonTypesMetaclassType;
+
+/* CachedMethodType.module_state_decls */
+#if CYTHON_COMPILING_IN_LIMITED_API
+PyObject *__Pyx_CachedMethodType;
+#endif
+
+/* CythonFunctionShared.module_state_decls */
+PyTypeObject *__pyx_CyFunctionType;
+
+/* CodeObjectCache.module_state_decls */
+struct __Pyx_CodeObjectCache __pyx_code_cache;
+
+/* #### Code section: module_state_end ### */
+} __pyx_mstatetype;
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate_global (__Pyx_PyModule_GetState(__Pyx_State_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (__Pyx_State_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstatetype __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: constant_name_defines ### */
+#define __pyx_kp_u_A_time_limit_or_a_number_of_iter __pyx_string_tab[0]
+#define __pyx_kp_u_No_tile_can_be_moved __pyx_string_tab[1]
+#define __pyx_kp_u_NonagaGame_nonaga_mcts_pyx __pyx_string_tab[2]
+#define __pyx_kp_u_Note_that_Cython_is_deliberately __pyx_string_tab[3]
+#define __pyx_kp_u_The_player_to_move_has_no_piece __pyx_string_tab[4]
+#define __pyx_kp_u_The_search_starts_with_a_piece_t __pyx_string_tab[5]
+#define __pyx_kp_u_The_search_tree_could_not_grow __pyx_string_tab[6]
+#define __pyx_kp_u_Unknown_rollout __pyx_string_tab[7]
+#define __pyx_kp_u__2 __pyx_string_tab[8]
+#define __pyx_kp_u__3 __pyx_string_tab[9]
+#define __pyx_kp_u_add_note __pyx_string_tab[10]
+#define __pyx_kp_u_disable __pyx_string_tab[11]
+#define __pyx_kp_u_enable __pyx_string_tab[12]
+#define __pyx_kp_u_expected_one_of __pyx_string_tab[13]
+#define __pyx_kp_u_gc __pyx_string_tab[14]
+#define __pyx_kp_u_isenabled __pyx_string_tab[15]
+#define __pyx_kp_u_no_default___reduce___due_to_non __pyx_string_tab[16]
+#define __pyx_kp_u_stringsource __pyx_string_tab[17]
+#define __pyx_n_u_BLACK __pyx_string_tab[18]
+#define __pyx_n_u_MCTS __pyx_string_tab[19]
+#define __pyx_n_u_MCTS___reduce_cython __pyx_string_tab[20]
+#define __pyx_n_u_MCTS___setstate_cython __pyx_string_tab[21]
+#define __pyx_n_u_MCTS__run __pyx_string_tab[22]
+#define __pyx_n_u_MCTS_get_best_move __pyx_string_tab[23]
+#define __pyx_n_u_PIECE_TO_MOVE __pyx_string_tab[24]
+#define __pyx_n_u_Pyx_PyDict_NextRef __pyx_string_tab[25]
+#define __pyx_n_u_RED __pyx_string_tab[26]
+#define __pyx_n_u_ROLLOUTS __pyx_string_tab[27]
+#define __pyx_n_u_Thread __pyx_string_tab[28]
+#define __pyx_n_u_args __pyx_string_tab[29]
+#define __pyx_n_u_asyncio_coroutines __pyx_string_tab[30]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[31]
+#define __pyx_n_u_color __pyx_string_tab[32]
+#define __pyx_n_u_daemon __pyx_string_tab[33]
+#define __pyx_n_u_deadline __pyx_string_tab[34]
+#define __pyx_n_u_evaluation_scale __pyx_string_tab[35]
+#define __pyx_n_u_exploration __pyx_string_tab[36]
+#define __pyx_n_u_func __pyx_string_tab[37]
+#define __pyx_n_u_game_state __pyx_string_tab[38]
+#define __pyx_n_u_get_best_move __pyx_string_tab[39]
+#define __pyx_n_u_getrandbits __pyx_string_tab[40]
+#define __pyx_n_u_getstate __pyx_string_tab[41]
+#define __pyx_n_u_guided __pyx_string_tab[42]
+#define __pyx_n_u_is_coroutine __pyx_string_tab[43]
+#define __pyx_n_u_items __pyx_string_tab[44]
+#define __pyx_n_u_iterations __pyx_string_tab[45]
+#define __pyx_n_u_join __pyx_string_tab[46]
+#define __pyx_n_u_k __pyx_string_tab[47]
+#define __pyx_n_u_main __pyx_string_tab[48]
+#define __pyx_n_u_max_nodes __pyx_string_tab[49]
+#define __pyx_n_u_module __pyx_string_tab[50]
+#define __pyx_n_u_name __pyx_string_tab[51]
+#define __pyx_n_u_nonaga_constants __pyx_string_tab[52]
+#define __pyx_n_u_nonaga_mcts __pyx_string_tab[53]
+#define __pyx_n_u_none __pyx_string_tab[54]
+#define __pyx_n_u_parameter __pyx_string_tab[55]
+#define __pyx_n_u_perf_counter __pyx_string_tab[56]
+#define __pyx_n_u_pop __pyx_string_tab[57]
+#define __pyx_n_u_pyx_state __pyx_string_tab[58]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[59]
+#define __pyx_n_u_qualname __pyx_string_tab[60]
+#define __pyx_n_u_random __pyx_string_tab[61]
+#define __pyx_n_u_reduce __pyx_string_tab[62]
+#define __pyx_n_u_reduce_cython __pyx_string_tab[63]
+#define __pyx_n_u_reduce_ex __pyx_string_tab[64]
+#define __pyx_n_u_reuse_tree __pyx_string_tab[65]
+#define __pyx_n_u_rng __pyx_string_tab[66]
+#define __pyx_n_u_rollout __pyx_string_tab[67]
+#define __pyx_n_u_rollout_turns __pyx_string_tab[68]
+#define __pyx_n_u_run __pyx_string_tab[69]
+#define __pyx_n_u_running __pyx_string_tab[70]
+#define __pyx_n_u_seed __pyx_string_tab[71]
+#define __pyx_n_u_self __pyx_string_tab[72]
+#define __pyx_n_u_set_name __pyx_string_tab[73]
+#define __pyx_n_u_setdefault __pyx_string_tab[74]
+#define __pyx_n_u_setstate __pyx_string_tab[75]
+#define __pyx_n_u_setstate_cython __pyx_string_tab[76]
+#define __pyx_n_u_start __pyx_string_tab[77]
+#define __pyx_n_u_target __pyx_string_tab[78]
+#define __pyx_n_u_test __pyx_string_tab[79]
+#define __pyx_n_u_threading __pyx_string_tab[80]
+#define __pyx_n_u_threads __pyx_string_tab[81]
+#define __pyx_n_u_time __pyx_string_tab[82]
+#define __pyx_n_u_time_limit __pyx_string_tab[83]
+#define __pyx_n_u_values __pyx_string_tab[84]
+#define __pyx_kp_b_PyObject_struct___pyx_t_15nonaga __pyx_string_tab[85]
+#define __pyx_kp_b_iso88591_A_Qaz_8_s_AQ_E_aq_q_T_1A_HAT_4z __pyx_string_tab[86]
+#define __pyx_kp_b_iso88591_A_e2Q_A_a_E_aq_t4y_y_D_S_1 __pyx_string_tab[87]
+#define __pyx_kp_b_iso88591_Q __pyx_string_tab[88]
+#define __pyx_int_64 __pyx_number_tab[0]
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
+  __pyx_mstatetype *clear_module_state = __Pyx_PyModule_GetState(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __Pyx_State_RemoveModule(NULL);
+  #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaTile);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaPiece);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaIsland);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaBoard);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_logic_NonagaLogic);
+  Py_CLEAR(clear_module_state->__pyx_ptype_11nonaga_mcts_MCTS);
+  Py_CLEAR(clear_module_state->__pyx_type_11nonaga_mcts_MCTS);
+  for (int i=0; i<4; ++i) { Py_CLEAR(clear_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<89; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<1; ++i) { Py_CLEAR(clear_module_state->__pyx_number_tab[i]); }
+/* #### Code section: module_state_clear_contents ### */
+/* CommonTypesMetaclass.module_state_clear */
+Py_CLEAR(clear_module_state->__pyx_CommonTypesMetaclassType);
+
+/* CythonFunctionShared.module_state_clear */
+Py_CLEAR(clear_module_state->__pyx_CyFunctionType);
+
+/* #### Code section: module_state_clear_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstatetype *traverse_module_state = __Pyx_PyModule_GetState(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaTile);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaPiece);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaIsland);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaBoard);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_logic_NonagaLogic);
+  Py_VISIT(traverse_module_state->__pyx_ptype_11nonaga_mcts_MCTS);
+  Py_VISIT(traverse_module_state->__pyx_type_11nonaga_mcts_MCTS);
+  for (int i=0; i<4; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_codeobj_tab[i]); }
+  for (int i=0; i<89; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+  for (int i=0; i<1; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_number_tab[i]); }
+/* #### Code section: module_state_traverse_contents ### */
+/* CommonTypesMetaclass.module_state_traverse */
+Py_VISIT(traverse_module_state->__pyx_CommonTypesMetaclassType);
+
+/* CythonFunctionShared.module_state_traverse */
+Py_VISIT(traverse_module_state->__pyx_CyFunctionType);
+
+/* #### Code section: module_state_traverse_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_code ### */
+
+/* "nonaga_board.pxd":19
+ * 
+ * 
+ * cdef inline int cell_index(int q, int r) nogil:             # <<<<<<<<<<<<<<
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_cell_index(int __pyx_v_q, int __pyx_v_r) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":20
+ * 
+ * cdef inline int cell_index(int q, int r) nogil:
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:
+*/
+  __pyx_r = (((__pyx_v_q & __pyx_e_12nonaga_board_GRID_MASK) << __pyx_e_12nonaga_board_GRID_BITS) | (__pyx_v_r & __pyx_e_12nonaga_board_GRID_MASK));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":19
+ * 
+ * 
+ * cdef inline int cell_index(int q, int r) nogil:             # <<<<<<<<<<<<<<
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":22
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:             # <<<<<<<<<<<<<<
+ *     """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+ *     return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_unwrap_coordinate(int __pyx_v_wrapped, int __pyx_v_reference) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":24
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:
+ *     """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+ *     return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2             # <<<<<<<<<<<<<<
+ * 
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+*/
+  __pyx_r = ((__pyx_v_reference + (((__pyx_v_wrapped - __pyx_v_reference) + __Pyx_div_long(__pyx_e_12nonaga_board_GRID_SIZE, 2, 1)) & __pyx_e_12nonaga_board_GRID_MASK)) - __Pyx_div_long(__pyx_e_12nonaga_board_GRID_SIZE, 2, 1));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":22
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:             # <<<<<<<<<<<<<<
+ *     """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+ *     return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":27
+ * 
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+ * cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:             # <<<<<<<<<<<<<<
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_encode_piece_move(int __pyx_v_from_cell, int __pyx_v_to_cell) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":28
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+ * cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int piece_move_from(int move) nogil:
+*/
+  __pyx_r = ((__pyx_v_from_cell << (2 * __pyx_e_12nonaga_board_GRID_BITS)) | __pyx_v_to_cell);
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":27
+ * 
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+ * cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:             # <<<<<<<<<<<<<<
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":30
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+ * cdef inline int piece_move_from(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move >> (2 * GRID_BITS)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_piece_move_from(int __pyx_v_move) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":31
+ * 
+ * cdef inline int piece_move_from(int move) nogil:
+ *     return move >> (2 * GRID_BITS)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int piece_move_to(int move) nogil:
+*/
+  __pyx_r = (__pyx_v_move >> (2 * __pyx_e_12nonaga_board_GRID_BITS));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":30
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+ * cdef inline int piece_move_from(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move >> (2 * GRID_BITS)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":33
+ *     return move >> (2 * GRID_BITS)
+ * 
+ * cdef inline int piece_move_to(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move & (GRID_CELLS - 1)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_piece_move_to(int __pyx_v_move) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":34
+ * 
+ * cdef inline int piece_move_to(int move) nogil:
+ *     return move & (GRID_CELLS - 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = (__pyx_v_move & (__pyx_e_12nonaga_board_GRID_CELLS - 1));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":33
+ *     return move >> (2 * GRID_BITS)
+ * 
+ * cdef inline int piece_move_to(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move & (GRID_CELLS - 1)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":39
+ * 
+ * 
+ * cdef inline unsigned long long _next_random(unsigned long long* state) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # xorshift64*, one state per thread
+ *     state[0] ^= state[0] >> 12
+*/
+
+static CYTHON_INLINE unsigned PY_LONG_LONG __pyx_f_11nonaga_mcts__next_random(unsigned PY_LONG_LONG *__pyx_v_state) {
+  unsigned PY_LONG_LONG __pyx_r;
+  long __pyx_t_1;
+
+  /* "nonaga_mcts.pyx":41
+ * cdef inline unsigned long long _next_random(unsigned long long* state) noexcept nogil:
+ *     # xorshift64*, one state per thread
+ *     state[0] ^= state[0] >> 12             # <<<<<<<<<<<<<<
+ *     state[0] ^= state[0] << 25
+ *     state[0] ^= state[0] >> 27
+*/
+  __pyx_t_1 = 0;
+  (__pyx_v_state[__pyx_t_1]) = ((__pyx_v_state[__pyx_t_1]) ^ ((__pyx_v_state[0]) >> 12));
+
+  /* "nonaga_mcts.pyx":42
+ *     # xorshift64*, one state per thread
+ *     state[0] ^= state[0] >> 12
+ *     state[0] ^= state[0] << 25             # <<<<<<<<<<<<<<
+ *     state[0] ^= state[0] >> 27
+ *     return state[0] * 2685821657736338717ULL
+*/
+  __pyx_t_1 = 0;
+  (__pyx_v_state[__pyx_t_1]) = ((__pyx_v_state[__pyx_t_1]) ^ ((__pyx_v_state[0]) << 25));
+
+  /* "nonaga_mcts.pyx":43
+ *     state[0] ^= state[0] >> 12
+ *     state[0] ^= state[0] << 25
+ *     state[0] ^= state[0] >> 27             # <<<<<<<<<<<<<<
+ *     return state[0] * 2685821657736338717ULL
+ * 
+*/
+  __pyx_t_1 = 0;
+  (__pyx_v_state[__pyx_t_1]) = ((__pyx_v_state[__pyx_t_1]) ^ ((__pyx_v_state[0]) >> 27));
+
+  /* "nonaga_mcts.pyx":44
+ *     state[0] ^= state[0] << 25
+ *     state[0] ^= state[0] >> 27
+ *     return state[0] * 2685821657736338717ULL             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = ((__pyx_v_state[0]) * 2685821657736338717ULL);
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":39
+ * 
+ * 
+ * cdef inline unsigned long long _next_random(unsigned long long* state) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     # xorshift64*, one state per thread
+ *     state[0] ^= state[0] >> 12
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":47
+ * 
+ * 
+ * cdef inline int _random_below(unsigned long long* state, int n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return <int>((_next_random(state) >> 33) % <unsigned long long>n)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_11nonaga_mcts__random_below(unsigned PY_LONG_LONG *__pyx_v_state, int __pyx_v_n) {
+  int __pyx_r;
+  unsigned PY_LONG_LONG __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_mcts.pyx":48
+ * 
+ * cdef inline int _random_below(unsigned long long* state, int n) noexcept nogil:
+ *     return <int>((_next_random(state) >> 33) % <unsigned long long>n)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_1 = (__pyx_f_11nonaga_mcts__next_random(__pyx_v_state) >> 33);
+  if (unlikely(((unsigned PY_LONG_LONG)__pyx_v_n) == 0)) {
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    PyErr_SetString(PyExc_ZeroDivisionError, "integer division or modulo by zero");
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    __PYX_ERR(0, 48, __pyx_L1_error)
+  }
+  __pyx_r = ((int)(__pyx_t_1 % ((unsigned PY_LONG_LONG)__pyx_v_n)));
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":47
+ * 
+ * 
+ * cdef inline int _random_below(unsigned long long* state, int n) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     return <int>((_next_random(state) >> 33) % <unsigned long long>n)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_mcts._random_below", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":51
+ * 
+ * 
+ * cdef int pool_allocate(NodePool* pool, int count) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Index of *count* new consecutive nodes, -1 if memory ran out."""
+ *     cdef int capacity = pool.capacity if pool.capacity else 1024
+*/
+
+static int __pyx_f_11nonaga_mcts_pool_allocate(struct __pyx_t_11nonaga_mcts_NodePool *__pyx_v_pool, int __pyx_v_count) {
+  int __pyx_v_capacity;
+  void *__pyx_v_p;
+  int __pyx_v_first;
+  int __pyx_v_i;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "nonaga_mcts.pyx":53
+ * cdef int pool_allocate(NodePool* pool, int count) noexcept nogil:
+ *     """Index of *count* new consecutive nodes, -1 if memory ran out."""
+ *     cdef int capacity = pool.capacity if pool.capacity else 1024             # <<<<<<<<<<<<<<
+ *     cdef void* p
+ *     while capacity < pool.size + count:
+*/
+  __pyx_t_2 = (__pyx_v_pool->capacity != 0);
+  if (__pyx_t_2) {
+    __pyx_t_1 = __pyx_v_pool->capacity;
+  } else {
+    __pyx_t_1 = 0x400;
+  }
+  __pyx_v_capacity = __pyx_t_1;
+
+  /* "nonaga_mcts.pyx":55
+ *     cdef int capacity = pool.capacity if pool.capacity else 1024
+ *     cdef void* p
+ *     while capacity < pool.size + count:             # <<<<<<<<<<<<<<
+ *         capacity *= 2
+ *     if capacity != pool.capacity:
+*/
+  while (1) {
+    __pyx_t_2 = (__pyx_v_capacity < (__pyx_v_pool->size + __pyx_v_count));
+    if (!__pyx_t_2) break;
+
+    /* "nonaga_mcts.pyx":56
+ *     cdef void* p
+ *     while capacity < pool.size + count:
+ *         capacity *= 2             # <<<<<<<<<<<<<<
+ *     if capacity != pool.capacity:
+ *         p = realloc(pool.parent, capacity * sizeof(int))
+*/
+    __pyx_v_capacity = (__pyx_v_capacity * 2);
+  }
+
+  /* "nonaga_mcts.pyx":57
+ *     while capacity < pool.size + count:
+ *         capacity *= 2
+ *     if capacity != pool.capacity:             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.parent, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+  __pyx_t_2 = (__pyx_v_capacity != __pyx_v_pool->capacity);
+  if (__pyx_t_2) {
+
+    /* "nonaga_mcts.pyx":58
+ *         capacity *= 2
+ *     if capacity != pool.capacity:
+ *         p = realloc(pool.parent, capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.parent = <int*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->parent, (__pyx_v_capacity * (sizeof(int))));
+
+    /* "nonaga_mcts.pyx":59
+ *     if capacity != pool.capacity:
+ *         p = realloc(pool.parent, capacity * sizeof(int))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.parent = <int*>p
+ *         p = realloc(pool.first_child, capacity * sizeof(int))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":60
+ *         p = realloc(pool.parent, capacity * sizeof(int))
+ *         if p == NULL: return -1
+ *         pool.parent = <int*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.first_child, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->parent = ((int *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":61
+ *         if p == NULL: return -1
+ *         pool.parent = <int*>p
+ *         p = realloc(pool.first_child, capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.first_child = <int*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->first_child, (__pyx_v_capacity * (sizeof(int))));
+
+    /* "nonaga_mcts.pyx":62
+ *         pool.parent = <int*>p
+ *         p = realloc(pool.first_child, capacity * sizeof(int))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.first_child = <int*>p
+ *         p = realloc(pool.num_children, capacity * sizeof(int))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":63
+ *         p = realloc(pool.first_child, capacity * sizeof(int))
+ *         if p == NULL: return -1
+ *         pool.first_child = <int*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.num_children, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->first_child = ((int *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":64
+ *         if p == NULL: return -1
+ *         pool.first_child = <int*>p
+ *         p = realloc(pool.num_children, capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.num_children = <int*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->num_children, (__pyx_v_capacity * (sizeof(int))));
+
+    /* "nonaga_mcts.pyx":65
+ *         pool.first_child = <int*>p
+ *         p = realloc(pool.num_children, capacity * sizeof(int))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.num_children = <int*>p
+ *         p = realloc(pool.move, capacity * sizeof(int))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":66
+ *         p = realloc(pool.num_children, capacity * sizeof(int))
+ *         if p == NULL: return -1
+ *         pool.num_children = <int*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.move, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->num_children = ((int *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":67
+ *         if p == NULL: return -1
+ *         pool.num_children = <int*>p
+ *         p = realloc(pool.move, capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.move = <int*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->move, (__pyx_v_capacity * (sizeof(int))));
+
+    /* "nonaga_mcts.pyx":68
+ *         pool.num_children = <int*>p
+ *         p = realloc(pool.move, capacity * sizeof(int))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.move = <int*>p
+ *         p = realloc(pool.visits, capacity * sizeof(int))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":69
+ *         p = realloc(pool.move, capacity * sizeof(int))
+ *         if p == NULL: return -1
+ *         pool.move = <int*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.visits, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->move = ((int *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":70
+ *         if p == NULL: return -1
+ *         pool.move = <int*>p
+ *         p = realloc(pool.visits, capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.visits = <int*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->visits, (__pyx_v_capacity * (sizeof(int))));
+
+    /* "nonaga_mcts.pyx":71
+ *         pool.move = <int*>p
+ *         p = realloc(pool.visits, capacity * sizeof(int))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.visits = <int*>p
+ *         p = realloc(pool.virtual_loss, capacity * sizeof(int))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":72
+ *         p = realloc(pool.visits, capacity * sizeof(int))
+ *         if p == NULL: return -1
+ *         pool.visits = <int*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.virtual_loss, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->visits = ((int *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":73
+ *         if p == NULL: return -1
+ *         pool.visits = <int*>p
+ *         p = realloc(pool.virtual_loss, capacity * sizeof(int))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.virtual_loss = <int*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->virtual_loss, (__pyx_v_capacity * (sizeof(int))));
+
+    /* "nonaga_mcts.pyx":74
+ *         pool.visits = <int*>p
+ *         p = realloc(pool.virtual_loss, capacity * sizeof(int))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.virtual_loss = <int*>p
+ *         p = realloc(pool.value, capacity * sizeof(double))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":75
+ *         p = realloc(pool.virtual_loss, capacity * sizeof(int))
+ *         if p == NULL: return -1
+ *         pool.virtual_loss = <int*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.value, capacity * sizeof(double))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->virtual_loss = ((int *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":76
+ *         if p == NULL: return -1
+ *         pool.virtual_loss = <int*>p
+ *         p = realloc(pool.value, capacity * sizeof(double))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.value = <double*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->value, (__pyx_v_capacity * (sizeof(double))));
+
+    /* "nonaga_mcts.pyx":77
+ *         pool.virtual_loss = <int*>p
+ *         p = realloc(pool.value, capacity * sizeof(double))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.value = <double*>p
+ *         p = realloc(pool.mover, capacity * sizeof(signed char))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":78
+ *         p = realloc(pool.value, capacity * sizeof(double))
+ *         if p == NULL: return -1
+ *         pool.value = <double*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.mover, capacity * sizeof(signed char))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->value = ((double *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":79
+ *         if p == NULL: return -1
+ *         pool.value = <double*>p
+ *         p = realloc(pool.mover, capacity * sizeof(signed char))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.mover = <signed char*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->mover, (__pyx_v_capacity * (sizeof(signed char))));
+
+    /* "nonaga_mcts.pyx":80
+ *         pool.value = <double*>p
+ *         p = realloc(pool.mover, capacity * sizeof(signed char))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.mover = <signed char*>p
+ *         p = realloc(pool.winner, capacity * sizeof(signed char))
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":81
+ *         p = realloc(pool.mover, capacity * sizeof(signed char))
+ *         if p == NULL: return -1
+ *         pool.mover = <signed char*>p             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.winner, capacity * sizeof(signed char))
+ *         if p == NULL: return -1
+*/
+    __pyx_v_pool->mover = ((signed char *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":82
+ *         if p == NULL: return -1
+ *         pool.mover = <signed char*>p
+ *         p = realloc(pool.winner, capacity * sizeof(signed char))             # <<<<<<<<<<<<<<
+ *         if p == NULL: return -1
+ *         pool.winner = <signed char*>p
+*/
+    __pyx_v_p = realloc(__pyx_v_pool->winner, (__pyx_v_capacity * (sizeof(signed char))));
+
+    /* "nonaga_mcts.pyx":83
+ *         pool.mover = <signed char*>p
+ *         p = realloc(pool.winner, capacity * sizeof(signed char))
+ *         if p == NULL: return -1             # <<<<<<<<<<<<<<
+ *         pool.winner = <signed char*>p
+ *         pool.capacity = capacity
+*/
+    __pyx_t_2 = (__pyx_v_p == NULL);
+    if (__pyx_t_2) {
+      __pyx_r = -1;
+      goto __pyx_L0;
+    }
+
+    /* "nonaga_mcts.pyx":84
+ *         p = realloc(pool.winner, capacity * sizeof(signed char))
+ *         if p == NULL: return -1
+ *         pool.winner = <signed char*>p             # <<<<<<<<<<<<<<
+ *         pool.capacity = capacity
+ *     cdef int first = pool.size
+*/
+    __pyx_v_pool->winner = ((signed char *)__pyx_v_p);
+
+    /* "nonaga_mcts.pyx":85
+ *         if p == NULL: return -1
+ *         pool.winner = <signed char*>p
+ *         pool.capacity = capacity             # <<<<<<<<<<<<<<
+ *     cdef int first = pool.size
+ *     cdef int i
+*/
+    __pyx_v_pool->capacity = __pyx_v_capacity;
+
+    /* "nonaga_mcts.pyx":57
+ *     while capacity < pool.size + count:
+ *         capacity *= 2
+ *     if capacity != pool.capacity:             # <<<<<<<<<<<<<<
+ *         p = realloc(pool.parent, capacity * sizeof(int))
+ *         if p == NULL: return -1
+*/
+  }
+
+  /* "nonaga_mcts.pyx":86
+ *         pool.winner = <signed char*>p
+ *         pool.capacity = capacity
+ *     cdef int first = pool.size             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(first, first + count):
+*/
+  __pyx_t_1 = __pyx_v_pool->size;
+  __pyx_v_first = __pyx_t_1;
+
+  /* "nonaga_mcts.pyx":88
+ *     cdef int first = pool.size
+ *     cdef int i
+ *     for i in range(first, first + count):             # <<<<<<<<<<<<<<
+ *         pool.parent[i] = -1
+ *         pool.first_child[i] = -1
+*/
+  __pyx_t_1 = (__pyx_v_first + __pyx_v_count);
+  __pyx_t_3 = __pyx_t_1;
+  for (__pyx_t_4 = __pyx_v_first; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "nonaga_mcts.pyx":89
+ *     cdef int i
+ *     for i in range(first, first + count):
+ *         pool.parent[i] = -1             # <<<<<<<<<<<<<<
+ *         pool.first_child[i] = -1
+ *         pool.num_children[i] = -1
+*/
+    (__pyx_v_pool->parent[__pyx_v_i]) = -1;
+
+    /* "nonaga_mcts.pyx":90
+ *     for i in range(first, first + count):
+ *         pool.parent[i] = -1
+ *         pool.first_child[i] = -1             # <<<<<<<<<<<<<<
+ *         pool.num_children[i] = -1
+ *         pool.move[i] = -1
+*/
+    (__pyx_v_pool->first_child[__pyx_v_i]) = -1;
+
+    /* "nonaga_mcts.pyx":91
+ *         pool.parent[i] = -1
+ *         pool.first_child[i] = -1
+ *         pool.num_children[i] = -1             # <<<<<<<<<<<<<<
+ *         pool.move[i] = -1
+ *         pool.visits[i] = 0
+*/
+    (__pyx_v_pool->num_children[__pyx_v_i]) = -1;
+
+    /* "nonaga_mcts.pyx":92
+ *         pool.first_child[i] = -1
+ *         pool.num_children[i] = -1
+ *         pool.move[i] = -1             # <<<<<<<<<<<<<<
+ *         pool.visits[i] = 0
+ *         pool.virtual_loss[i] = 0
+*/
+    (__pyx_v_pool->move[__pyx_v_i]) = -1;
+
+    /* "nonaga_mcts.pyx":93
+ *         pool.num_children[i] = -1
+ *         pool.move[i] = -1
+ *         pool.visits[i] = 0             # <<<<<<<<<<<<<<
+ *         pool.virtual_loss[i] = 0
+ *         pool.value[i] = 0
+*/
+    (__pyx_v_pool->visits[__pyx_v_i]) = 0;
+
+    /* "nonaga_mcts.pyx":94
+ *         pool.move[i] = -1
+ *         pool.visits[i] = 0
+ *         pool.virtual_loss[i] = 0             # <<<<<<<<<<<<<<
+ *         pool.value[i] = 0
+ *         pool.mover[i] = -1
+*/
+    (__pyx_v_pool->virtual_loss[__pyx_v_i]) = 0;
+
+    /* "nonaga_mcts.pyx":95
+ *         pool.visits[i] = 0
+ *         pool.virtual_loss[i] = 0
+ *         pool.value[i] = 0             # <<<<<<<<<<<<<<
+ *         pool.mover[i] = -1
+ *         pool.winner[i] = -1
+*/
+    (__pyx_v_pool->value[__pyx_v_i]) = 0.0;
+
+    /* "nonaga_mcts.pyx":96
+ *         pool.virtual_loss[i] = 0
+ *         pool.value[i] = 0
+ *         pool.mover[i] = -1             # <<<<<<<<<<<<<<
+ *         pool.winner[i] = -1
+ *     pool.size += count
+*/
+    (__pyx_v_pool->mover[__pyx_v_i]) = -1;
+
+    /* "nonaga_mcts.pyx":97
+ *         pool.value[i] = 0
+ *         pool.mover[i] = -1
+ *         pool.winner[i] = -1             # <<<<<<<<<<<<<<
+ *     pool.size += count
+ *     return first
+*/
+    (__pyx_v_pool->winner[__pyx_v_i]) = -1;
+  }
+
+  /* "nonaga_mcts.pyx":98
+ *         pool.mover[i] = -1
+ *         pool.winner[i] = -1
+ *     pool.size += count             # <<<<<<<<<<<<<<
+ *     return first
+ * 
+*/
+  __pyx_v_pool->size = (__pyx_v_pool->size + __pyx_v_count);
+
+  /* "nonaga_mcts.pyx":99
+ *         pool.winner[i] = -1
+ *     pool.size += count
+ *     return first             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = __pyx_v_first;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":51
+ * 
+ * 
+ * cdef int pool_allocate(NodePool* pool, int count) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Index of *count* new consecutive nodes, -1 if memory ran out."""
+ *     cdef int capacity = pool.capacity if pool.capacity else 1024
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":102
+ * 
+ * 
+ * cdef void pool_free(NodePool* pool) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     free(pool.parent)
+ *     free(pool.first_child)
+*/
+
+static void __pyx_f_11nonaga_mcts_pool_free(struct __pyx_t_11nonaga_mcts_NodePool *__pyx_v_pool) {
+
+  /* "nonaga_mcts.pyx":103
+ * 
+ * cdef void pool_free(NodePool* pool) noexcept nogil:
+ *     free(pool.parent)             # <<<<<<<<<<<<<<
+ *     free(pool.first_child)
+ *     free(pool.num_children)
+*/
+  free(__pyx_v_pool->parent);
+
+  /* "nonaga_mcts.pyx":104
+ * cdef void pool_free(NodePool* pool) noexcept nogil:
+ *     free(pool.parent)
+ *     free(pool.first_child)             # <<<<<<<<<<<<<<
+ *     free(pool.num_children)
+ *     free(pool.move)
+*/
+  free(__pyx_v_pool->first_child);
+
+  /* "nonaga_mcts.pyx":105
+ *     free(pool.parent)
+ *     free(pool.first_child)
+ *     free(pool.num_children)             # <<<<<<<<<<<<<<
+ *     free(pool.move)
+ *     free(pool.visits)
+*/
+  free(__pyx_v_pool->num_children);
+
+  /* "nonaga_mcts.pyx":106
+ *     free(pool.first_child)
+ *     free(pool.num_children)
+ *     free(pool.move)             # <<<<<<<<<<<<<<
+ *     free(pool.visits)
+ *     free(pool.virtual_loss)
+*/
+  free(__pyx_v_pool->move);
+
+  /* "nonaga_mcts.pyx":107
+ *     free(pool.num_children)
+ *     free(pool.move)
+ *     free(pool.visits)             # <<<<<<<<<<<<<<
+ *     free(pool.virtual_loss)
+ *     free(pool.value)
+*/
+  free(__pyx_v_pool->visits);
+
+  /* "nonaga_mcts.pyx":108
+ *     free(pool.move)
+ *     free(pool.visits)
+ *     free(pool.virtual_loss)             # <<<<<<<<<<<<<<
+ *     free(pool.value)
+ *     free(pool.mover)
+*/
+  free(__pyx_v_pool->virtual_loss);
+
+  /* "nonaga_mcts.pyx":109
+ *     free(pool.visits)
+ *     free(pool.virtual_loss)
+ *     free(pool.value)             # <<<<<<<<<<<<<<
+ *     free(pool.mover)
+ *     free(pool.winner)
+*/
+  free(__pyx_v_pool->value);
+
+  /* "nonaga_mcts.pyx":110
+ *     free(pool.virtual_loss)
+ *     free(pool.value)
+ *     free(pool.mover)             # <<<<<<<<<<<<<<
+ *     free(pool.winner)
+ *     memset(pool, 0, sizeof(NodePool))
+*/
+  free(__pyx_v_pool->mover);
+
+  /* "nonaga_mcts.pyx":111
+ *     free(pool.value)
+ *     free(pool.mover)
+ *     free(pool.winner)             # <<<<<<<<<<<<<<
+ *     memset(pool, 0, sizeof(NodePool))
+ * 
+*/
+  free(__pyx_v_pool->winner);
+
+  /* "nonaga_mcts.pyx":112
+ *     free(pool.mover)
+ *     free(pool.winner)
+ *     memset(pool, 0, sizeof(NodePool))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  (void)(memset(__pyx_v_pool, 0, (sizeof(struct __pyx_t_11nonaga_mcts_NodePool))));
+
+  /* "nonaga_mcts.pyx":102
+ * 
+ * 
+ * cdef void pool_free(NodePool* pool) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     free(pool.parent)
+ *     free(pool.first_child)
+*/
+
+  /* function exit code */
+}
+
+/* "nonaga_mcts.pyx":130
+ *     """
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         memset(&self.pool, 0, sizeof(NodePool))
+ *         self.lock = PyThread_allocate_lock()
+*/
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_1__cinit__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__cinit__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__cinit__", 1, 0, 0, __pyx_nargs); return -1; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return -1;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__cinit__", __pyx_kwds); return -1;}
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS___cinit__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS___cinit__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "nonaga_mcts.pyx":131
+ * 
+ *     def __cinit__(self):
+ *         memset(&self.pool, 0, sizeof(NodePool))             # <<<<<<<<<<<<<<
+ *         self.lock = PyThread_allocate_lock()
+ *         if self.lock == NULL:
+*/
+  (void)(memset((&__pyx_v_self->pool), 0, (sizeof(struct __pyx_t_11nonaga_mcts_NodePool))));
+
+  /* "nonaga_mcts.pyx":132
+ *     def __cinit__(self):
+ *         memset(&self.pool, 0, sizeof(NodePool))
+ *         self.lock = PyThread_allocate_lock()             # <<<<<<<<<<<<<<
+ *         if self.lock == NULL:
+ *             raise MemoryError()
+*/
+  __pyx_v_self->lock = PyThread_allocate_lock();
+
+  /* "nonaga_mcts.pyx":133
+ *         memset(&self.pool, 0, sizeof(NodePool))
+ *         self.lock = PyThread_allocate_lock()
+ *         if self.lock == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ * 
+*/
+  __pyx_t_1 = (__pyx_v_self->lock == NULL);
+  if (unlikely(__pyx_t_1)) {
+
+    /* "nonaga_mcts.pyx":134
+ *         self.lock = PyThread_allocate_lock()
+ *         if self.lock == NULL:
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ * 
+ *     def __dealloc__(self):
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 134, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":133
+ *         memset(&self.pool, 0, sizeof(NodePool))
+ *         self.lock = PyThread_allocate_lock()
+ *         if self.lock == NULL:             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ * 
+*/
+  }
+
+  /* "nonaga_mcts.pyx":130
+ *     """
+ * 
+ *     def __cinit__(self):             # <<<<<<<<<<<<<<
+ *         memset(&self.pool, 0, sizeof(NodePool))
+ *         self.lock = PyThread_allocate_lock()
+*/
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.__cinit__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":136
+ *             raise MemoryError()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         pool_free(&self.pool)
+ *         if self.lock != NULL:
+*/
+
+/* Python wrapper */
+static void __pyx_pw_11nonaga_mcts_4MCTS_3__dealloc__(PyObject *__pyx_v_self); /*proto*/
+static void __pyx_pw_11nonaga_mcts_4MCTS_3__dealloc__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__dealloc__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_pf_11nonaga_mcts_4MCTS_2__dealloc__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+}
+
+static void __pyx_pf_11nonaga_mcts_4MCTS_2__dealloc__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  int __pyx_t_1;
+
+  /* "nonaga_mcts.pyx":137
+ * 
+ *     def __dealloc__(self):
+ *         pool_free(&self.pool)             # <<<<<<<<<<<<<<
+ *         if self.lock != NULL:
+ *             PyThread_free_lock(self.lock)
+*/
+  __pyx_f_11nonaga_mcts_pool_free((&__pyx_v_self->pool));
+
+  /* "nonaga_mcts.pyx":138
+ *     def __dealloc__(self):
+ *         pool_free(&self.pool)
+ *         if self.lock != NULL:             # <<<<<<<<<<<<<<
+ *             PyThread_free_lock(self.lock)
+ * 
+*/
+  __pyx_t_1 = (__pyx_v_self->lock != NULL);
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":139
+ *         pool_free(&self.pool)
+ *         if self.lock != NULL:
+ *             PyThread_free_lock(self.lock)             # <<<<<<<<<<<<<<
+ * 
+ *     def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,
+*/
+    PyThread_free_lock(__pyx_v_self->lock);
+
+    /* "nonaga_mcts.pyx":138
+ *     def __dealloc__(self):
+ *         pool_free(&self.pool)
+ *         if self.lock != NULL:             # <<<<<<<<<<<<<<
+ *             PyThread_free_lock(self.lock)
+ * 
+*/
+  }
+
+  /* "nonaga_mcts.pyx":136
+ *             raise MemoryError()
+ * 
+ *     def __dealloc__(self):             # <<<<<<<<<<<<<<
+ *         pool_free(&self.pool)
+ *         if self.lock != NULL:
+*/
+
+  /* function exit code */
+}
+
+/* "nonaga_mcts.pyx":141
+ *             PyThread_free_lock(self.lock)
+ * 
+ *     def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,             # <<<<<<<<<<<<<<
+ *                  str rollout="guided", int rollout_turns=20, double exploration=1.0,
+ *                  double evaluation_scale=100.0, bint reuse_tree=True, int max_nodes=2000000):
+*/
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_5__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11nonaga_mcts_4MCTS_4__init__, "Initialize the player.\n\n        Args:\n            parameter: the 8 cost_function weights of AI\n            color: player the AI plays\n            time_limit: seconds per move, 0 to only count iterations\n            iterations: iterations per move, 0 to only watch the clock\n            threads: threads searching the tree\n            rollout: \"guided\", \"random\" or \"none\" (see ROLLOUTS)\n            rollout_turns: turns played by a rollout before cost_function judges its position\n            exploration: UCT exploration constant\n            evaluation_scale: cost_function difference worth a 73% win probability\n            reuse_tree: keep the tree between moves\n            max_nodes: nodes after which the tree stops growing\n        ");
+#if CYTHON_UPDATE_DESCRIPTOR_DOC
+struct wrapperbase __pyx_wrapperbase_11nonaga_mcts_4MCTS_4__init__;
+#endif
+static int __pyx_pw_11nonaga_mcts_4MCTS_5__init__(PyObject *__pyx_v_self, PyObject *__pyx_args, PyObject *__pyx_kwds) {
+  PyObject *__pyx_v_parameter = 0;
+  int __pyx_v_color;
+  double __pyx_v_time_limit;
+  int __pyx_v_iterations;
+  int __pyx_v_threads;
+  PyObject *__pyx_v_rollout = 0;
+  int __pyx_v_rollout_turns;
+  double __pyx_v_exploration;
+  double __pyx_v_evaluation_scale;
+  int __pyx_v_reuse_tree;
+  int __pyx_v_max_nodes;
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[11] = {0,0,0,0,0,0,0,0,0,0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__init__ (wrapper)", 0);
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return -1;
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_parameter,&__pyx_mstate_global->__pyx_n_u_color,&__pyx_mstate_global->__pyx_n_u_time_limit,&__pyx_mstate_global->__pyx_n_u_iterations,&__pyx_mstate_global->__pyx_n_u_threads,&__pyx_mstate_global->__pyx_n_u_rollout,&__pyx_mstate_global->__pyx_n_u_rollout_turns,&__pyx_mstate_global->__pyx_n_u_exploration,&__pyx_mstate_global->__pyx_n_u_evaluation_scale,&__pyx_mstate_global->__pyx_n_u_reuse_tree,&__pyx_mstate_global->__pyx_n_u_max_nodes,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_VARARGS(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 141, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case 11:
+        values[10] = __Pyx_ArgRef_VARARGS(__pyx_args, 10);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case 10:
+        values[9] = __Pyx_ArgRef_VARARGS(__pyx_args, 9);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  9:
+        values[8] = __Pyx_ArgRef_VARARGS(__pyx_args, 8);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  8:
+        values[7] = __Pyx_ArgRef_VARARGS(__pyx_args, 7);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  7:
+        values[6] = __Pyx_ArgRef_VARARGS(__pyx_args, 6);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  6:
+        values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__init__", 0) < (0)) __PYX_ERR(0, 141, __pyx_L3_error)
+      if (!values[5]) values[5] = __Pyx_NewRef(((PyObject*)__pyx_mstate_global->__pyx_n_u_guided));
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 11, i); __PYX_ERR(0, 141, __pyx_L3_error) }
+      }
+    } else {
+      switch (__pyx_nargs) {
+        case 11:
+        values[10] = __Pyx_ArgRef_VARARGS(__pyx_args, 10);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[10])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case 10:
+        values[9] = __Pyx_ArgRef_VARARGS(__pyx_args, 9);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[9])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  9:
+        values[8] = __Pyx_ArgRef_VARARGS(__pyx_args, 8);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[8])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  8:
+        values[7] = __Pyx_ArgRef_VARARGS(__pyx_args, 7);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[7])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  7:
+        values[6] = __Pyx_ArgRef_VARARGS(__pyx_args, 6);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[6])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  6:
+        values[5] = __Pyx_ArgRef_VARARGS(__pyx_args, 5);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[5])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  5:
+        values[4] = __Pyx_ArgRef_VARARGS(__pyx_args, 4);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[4])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  4:
+        values[3] = __Pyx_ArgRef_VARARGS(__pyx_args, 3);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[3])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  3:
+        values[2] = __Pyx_ArgRef_VARARGS(__pyx_args, 2);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[2])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  2:
+        values[1] = __Pyx_ArgRef_VARARGS(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 141, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_VARARGS(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 141, __pyx_L3_error)
+        break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      if (!values[5]) values[5] = __Pyx_NewRef(((PyObject*)__pyx_mstate_global->__pyx_n_u_guided));
+    }
+    __pyx_v_parameter = values[0];
+    if (values[1]) {
+      __pyx_v_color = __Pyx_PyLong_As_int(values[1]); if (unlikely((__pyx_v_color == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L3_error)
+    } else {
+      __pyx_v_color = __pyx_mstate_global->__pyx_k_;
+    }
+    if (values[2]) {
+      __pyx_v_time_limit = __Pyx_PyFloat_AsDouble(values[2]); if (unlikely((__pyx_v_time_limit == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L3_error)
+    } else {
+      __pyx_v_time_limit = ((double)1.0);
+    }
+    if (values[3]) {
+      __pyx_v_iterations = __Pyx_PyLong_As_int(values[3]); if (unlikely((__pyx_v_iterations == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L3_error)
+    } else {
+      __pyx_v_iterations = ((int)0);
+    }
+    if (values[4]) {
+      __pyx_v_threads = __Pyx_PyLong_As_int(values[4]); if (unlikely((__pyx_v_threads == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L3_error)
+    } else {
+      __pyx_v_threads = ((int)1);
+    }
+    __pyx_v_rollout = ((PyObject*)values[5]);
+    if (values[6]) {
+      __pyx_v_rollout_turns = __Pyx_PyLong_As_int(values[6]); if (unlikely((__pyx_v_rollout_turns == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L3_error)
+    } else {
+      __pyx_v_rollout_turns = ((int)20);
+    }
+    if (values[7]) {
+      __pyx_v_exploration = __Pyx_PyFloat_AsDouble(values[7]); if (unlikely((__pyx_v_exploration == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 142, __pyx_L3_error)
+    } else {
+      __pyx_v_exploration = ((double)1.0);
+    }
+    if (values[8]) {
+      __pyx_v_evaluation_scale = __Pyx_PyFloat_AsDouble(values[8]); if (unlikely((__pyx_v_evaluation_scale == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L3_error)
+    } else {
+      __pyx_v_evaluation_scale = ((double)100.0);
+    }
+    if (values[9]) {
+      __pyx_v_reuse_tree = __Pyx_PyObject_IsTrue(values[9]); if (unlikely((__pyx_v_reuse_tree == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L3_error)
+    } else {
+
+      /* "nonaga_mcts.pyx":143
+ *     def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,
+ *                  str rollout="guided", int rollout_turns=20, double exploration=1.0,
+ *                  double evaluation_scale=100.0, bint reuse_tree=True, int max_nodes=2000000):             # <<<<<<<<<<<<<<
+ *         """Initialize the player.
+ * 
+*/
+      __pyx_v_reuse_tree = ((int)1);
+    }
+    if (values[10]) {
+      __pyx_v_max_nodes = __Pyx_PyLong_As_int(values[10]); if (unlikely((__pyx_v_max_nodes == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 143, __pyx_L3_error)
+    } else {
+      __pyx_v_max_nodes = ((int)0x1E8480);
+    }
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__init__", 0, 1, 11, __pyx_nargs); __PYX_ERR(0, 141, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_rollout), (&PyUnicode_Type), 1, "rollout", 1))) __PYX_ERR(0, 142, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_4__init__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), __pyx_v_parameter, __pyx_v_color, __pyx_v_time_limit, __pyx_v_iterations, __pyx_v_threads, __pyx_v_rollout, __pyx_v_rollout_turns, __pyx_v_exploration, __pyx_v_evaluation_scale, __pyx_v_reuse_tree, __pyx_v_max_nodes);
+
+  /* "nonaga_mcts.pyx":141
+ *             PyThread_free_lock(self.lock)
+ * 
+ *     def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,             # <<<<<<<<<<<<<<
+ *                  str rollout="guided", int rollout_turns=20, double exploration=1.0,
+ *                  double evaluation_scale=100.0, bint reuse_tree=True, int max_nodes=2000000):
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = -1;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_4__init__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_parameter, int __pyx_v_color, double __pyx_v_time_limit, int __pyx_v_iterations, int __pyx_v_threads, PyObject *__pyx_v_rollout, int __pyx_v_rollout_turns, double __pyx_v_exploration, double __pyx_v_evaluation_scale, int __pyx_v_reuse_tree, int __pyx_v_max_nodes) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7[5];
+  size_t __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_t_10;
+  long __pyx_t_11;
+  long __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__init__", 0);
+
+  /* "nonaga_mcts.pyx":159
+ *             max_nodes: nodes after which the tree stops growing
+ *         """
+ *         if rollout not in ROLLOUTS:             # <<<<<<<<<<<<<<
+ *             raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")
+ *         if time_limit <= 0 and iterations <= 0:
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_ROLLOUTS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = (__Pyx_PySequence_ContainsTF(__pyx_v_rollout, __pyx_t_1, Py_NE)); if (unlikely((__pyx_t_2 < 0))) __PYX_ERR(0, 159, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "nonaga_mcts.pyx":160
+ *         """
+ *         if rollout not in ROLLOUTS:
+ *             raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")             # <<<<<<<<<<<<<<
+ *         if time_limit <= 0 and iterations <= 0:
+ *             raise ValueError("A time limit or a number of iterations is needed.")
+*/
+    __pyx_t_3 = NULL;
+    __pyx_t_4 = __Pyx_PyObject_FormatSimpleAndDecref(PyObject_Repr(__pyx_v_rollout), __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 160, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __Pyx_GetModuleGlobalName(__pyx_t_5, __pyx_mstate_global->__pyx_n_u_ROLLOUTS); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 160, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __pyx_t_6 = PySequence_List(__pyx_t_5); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    if (unlikely((PyList_Sort(__pyx_t_6) < 0))) __PYX_ERR(0, 160, __pyx_L1_error)
+    __pyx_t_5 = __Pyx_PyObject_FormatSimple(__pyx_t_6, __pyx_mstate_global->__pyx_empty_unicode); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 160, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_5);
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __pyx_t_7[0] = __pyx_mstate_global->__pyx_kp_u_Unknown_rollout;
+    __pyx_t_7[1] = __pyx_t_4;
+    __pyx_t_7[2] = __pyx_mstate_global->__pyx_kp_u_expected_one_of;
+    __pyx_t_7[3] = __pyx_t_5;
+    __pyx_t_7[4] = __pyx_mstate_global->__pyx_kp_u__2;
+    __pyx_t_6 = __Pyx_PyUnicode_Join(__pyx_t_7, 5, 16 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_4) + 18 + __Pyx_PyUnicode_GET_LENGTH(__pyx_t_5) + 1, 127 | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_4) | __Pyx_PyUnicode_MAX_CHAR_VALUE(__pyx_t_5));
+    if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 160, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_6);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __Pyx_DECREF(__pyx_t_5); __pyx_t_5 = 0;
+    __pyx_t_8 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_3, __pyx_t_6};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 160, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 160, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":159
+ *             max_nodes: nodes after which the tree stops growing
+ *         """
+ *         if rollout not in ROLLOUTS:             # <<<<<<<<<<<<<<
+ *             raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")
+ *         if time_limit <= 0 and iterations <= 0:
+*/
+  }
+
+  /* "nonaga_mcts.pyx":161
+ *         if rollout not in ROLLOUTS:
+ *             raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")
+ *         if time_limit <= 0 and iterations <= 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("A time limit or a number of iterations is needed.")
+ *         self.parameter = parameter
+*/
+  __pyx_t_9 = (__pyx_v_time_limit <= 0.0);
+  if (__pyx_t_9) {
+  } else {
+    __pyx_t_2 = __pyx_t_9;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_9 = (__pyx_v_iterations <= 0);
+  __pyx_t_2 = __pyx_t_9;
+  __pyx_L5_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "nonaga_mcts.pyx":162
+ *             raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")
+ *         if time_limit <= 0 and iterations <= 0:
+ *             raise ValueError("A time limit or a number of iterations is needed.")             # <<<<<<<<<<<<<<
+ *         self.parameter = parameter
+ *         self.max_color = color
+*/
+    __pyx_t_6 = NULL;
+    __pyx_t_8 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_6, __pyx_mstate_global->__pyx_kp_u_A_time_limit_or_a_number_of_iter};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_8, (2-__pyx_t_8) | (__pyx_t_8*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_6); __pyx_t_6 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 162, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 162, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":161
+ *         if rollout not in ROLLOUTS:
+ *             raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")
+ *         if time_limit <= 0 and iterations <= 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("A time limit or a number of iterations is needed.")
+ *         self.parameter = parameter
+*/
+  }
+
+  /* "nonaga_mcts.pyx":163
+ *         if time_limit <= 0 and iterations <= 0:
+ *             raise ValueError("A time limit or a number of iterations is needed.")
+ *         self.parameter = parameter             # <<<<<<<<<<<<<<
+ *         self.max_color = color
+ *         self.time_limit = time_limit
+*/
+  __Pyx_INCREF(__pyx_v_parameter);
+  __Pyx_GIVEREF(__pyx_v_parameter);
+  __Pyx_GOTREF(__pyx_v_self->parameter);
+  __Pyx_DECREF(__pyx_v_self->parameter);
+  __pyx_v_self->parameter = __pyx_v_parameter;
+
+  /* "nonaga_mcts.pyx":164
+ *             raise ValueError("A time limit or a number of iterations is needed.")
+ *         self.parameter = parameter
+ *         self.max_color = color             # <<<<<<<<<<<<<<
+ *         self.time_limit = time_limit
+ *         self.iterations = iterations
+*/
+  __pyx_v_self->max_color = __pyx_v_color;
+
+  /* "nonaga_mcts.pyx":165
+ *         self.parameter = parameter
+ *         self.max_color = color
+ *         self.time_limit = time_limit             # <<<<<<<<<<<<<<
+ *         self.iterations = iterations
+ *         self.threads = max(1, threads)
+*/
+  __pyx_v_self->time_limit = __pyx_v_time_limit;
+
+  /* "nonaga_mcts.pyx":166
+ *         self.max_color = color
+ *         self.time_limit = time_limit
+ *         self.iterations = iterations             # <<<<<<<<<<<<<<
+ *         self.threads = max(1, threads)
+ *         self.rollout = rollout
+*/
+  __pyx_v_self->iterations = __pyx_v_iterations;
+
+  /* "nonaga_mcts.pyx":167
+ *         self.time_limit = time_limit
+ *         self.iterations = iterations
+ *         self.threads = max(1, threads)             # <<<<<<<<<<<<<<
+ *         self.rollout = rollout
+ *         self.rollout_turns = rollout_turns
+*/
+  __pyx_t_10 = __pyx_v_threads;
+  __pyx_t_11 = 1;
+  __pyx_t_2 = (__pyx_t_10 > __pyx_t_11);
+  if (__pyx_t_2) {
+    __pyx_t_12 = __pyx_t_10;
+  } else {
+    __pyx_t_12 = __pyx_t_11;
+  }
+  __pyx_v_self->threads = __pyx_t_12;
+
+  /* "nonaga_mcts.pyx":168
+ *         self.iterations = iterations
+ *         self.threads = max(1, threads)
+ *         self.rollout = rollout             # <<<<<<<<<<<<<<
+ *         self.rollout_turns = rollout_turns
+ *         self.exploration = exploration
+*/
+  __Pyx_INCREF(__pyx_v_rollout);
+  __Pyx_GIVEREF(__pyx_v_rollout);
+  __Pyx_GOTREF(__pyx_v_self->rollout);
+  __Pyx_DECREF(__pyx_v_self->rollout);
+  __pyx_v_self->rollout = __pyx_v_rollout;
+
+  /* "nonaga_mcts.pyx":169
+ *         self.threads = max(1, threads)
+ *         self.rollout = rollout
+ *         self.rollout_turns = rollout_turns             # <<<<<<<<<<<<<<
+ *         self.exploration = exploration
+ *         self.evaluation_scale = evaluation_scale
+*/
+  __pyx_v_self->rollout_turns = __pyx_v_rollout_turns;
+
+  /* "nonaga_mcts.pyx":170
+ *         self.rollout = rollout
+ *         self.rollout_turns = rollout_turns
+ *         self.exploration = exploration             # <<<<<<<<<<<<<<
+ *         self.evaluation_scale = evaluation_scale
+ *         self.reuse_tree = reuse_tree
+*/
+  __pyx_v_self->exploration = __pyx_v_exploration;
+
+  /* "nonaga_mcts.pyx":171
+ *         self.rollout_turns = rollout_turns
+ *         self.exploration = exploration
+ *         self.evaluation_scale = evaluation_scale             # <<<<<<<<<<<<<<
+ *         self.reuse_tree = reuse_tree
+ *         self.max_nodes = max_nodes
+*/
+  __pyx_v_self->evaluation_scale = __pyx_v_evaluation_scale;
+
+  /* "nonaga_mcts.pyx":172
+ *         self.exploration = exploration
+ *         self.evaluation_scale = evaluation_scale
+ *         self.reuse_tree = reuse_tree             # <<<<<<<<<<<<<<
+ *         self.max_nodes = max_nodes
+ *         self.has_root = False
+*/
+  __pyx_v_self->reuse_tree = __pyx_v_reuse_tree;
+
+  /* "nonaga_mcts.pyx":173
+ *         self.evaluation_scale = evaluation_scale
+ *         self.reuse_tree = reuse_tree
+ *         self.max_nodes = max_nodes             # <<<<<<<<<<<<<<
+ *         self.has_root = False
+ *         self.last_iterations = 0
+*/
+  __pyx_v_self->max_nodes = __pyx_v_max_nodes;
+
+  /* "nonaga_mcts.pyx":174
+ *         self.reuse_tree = reuse_tree
+ *         self.max_nodes = max_nodes
+ *         self.has_root = False             # <<<<<<<<<<<<<<
+ *         self.last_iterations = 0
+ *         self.reused_visits = 0
+*/
+  __pyx_v_self->has_root = 0;
+
+  /* "nonaga_mcts.pyx":175
+ *         self.max_nodes = max_nodes
+ *         self.has_root = False
+ *         self.last_iterations = 0             # <<<<<<<<<<<<<<
+ *         self.reused_visits = 0
+ * 
+*/
+  __pyx_v_self->last_iterations = 0;
+
+  /* "nonaga_mcts.pyx":176
+ *         self.has_root = False
+ *         self.last_iterations = 0
+ *         self.reused_visits = 0             # <<<<<<<<<<<<<<
+ * 
+ *     @property
+*/
+  __pyx_v_self->reused_visits = 0;
+
+  /* "nonaga_mcts.pyx":141
+ *             PyThread_free_lock(self.lock)
+ * 
+ *     def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,             # <<<<<<<<<<<<<<
+ *                  str rollout="guided", int rollout_turns=20, double exploration=1.0,
+ *                  double evaluation_scale=100.0, bint reuse_tree=True, int max_nodes=2000000):
+*/
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.__init__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":178
+ *         self.reused_visits = 0
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def tree_size(self):
+ *         return self.pool.size
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9tree_size_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9tree_size_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9tree_size___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9tree_size___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+
+  /* "nonaga_mcts.pyx":180
+ *     @property
+ *     def tree_size(self):
+ *         return self.pool.size             # <<<<<<<<<<<<<<
+ * 
+ *     #  one iteration
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->pool.size); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 180, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":178
+ *         self.reused_visits = 0
+ * 
+ *     @property             # <<<<<<<<<<<<<<
+ *     def tree_size(self):
+ *         return self.pool.size
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.tree_size.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":183
+ * 
+ *     #  one iteration
+ *     cdef int _iterate(self, unsigned long long* rng) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Select a leaf, value it and back the result up; returns 0 once the search should stop."""
+ *         cdef Position position
+*/
+
+static int __pyx_f_11nonaga_mcts_4MCTS__iterate(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, unsigned PY_LONG_LONG *__pyx_v_rng) {
+  struct __pyx_t_15nonaga_position_Position __pyx_v_position;
+  int __pyx_v_node;
+  int __pyx_v_child;
+  int __pyx_v_winner;
+  double __pyx_v_red_result;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  struct __pyx_t_15nonaga_position_Position __pyx_t_3;
+  int __pyx_t_4;
+  double __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":186
+ *         """Select a leaf, value it and back the result up; returns 0 once the search should stop."""
+ *         cdef Position position
+ *         cdef int node = 0, child, winner             # <<<<<<<<<<<<<<
+ *         cdef double red_result, result
+ * 
+*/
+  __pyx_v_node = 0;
+
+  /* "nonaga_mcts.pyx":189
+ *         cdef double red_result, result
+ * 
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)             # <<<<<<<<<<<<<<
+ *         if self.failed or (self.target_iterations and self.done_iterations >= self.target_iterations):
+ *             PyThread_release_lock(self.lock)
+*/
+  (void)(PyThread_acquire_lock(__pyx_v_self->lock, WAIT_LOCK));
+
+  /* "nonaga_mcts.pyx":190
+ * 
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)
+ *         if self.failed or (self.target_iterations and self.done_iterations >= self.target_iterations):             # <<<<<<<<<<<<<<
+ *             PyThread_release_lock(self.lock)
+ *             return 0
+*/
+  if (!__pyx_v_self->failed) {
+  } else {
+    __pyx_t_1 = __pyx_v_self->failed;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_self->target_iterations != 0);
+  if (__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_self->done_iterations >= __pyx_v_self->target_iterations);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":191
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)
+ *         if self.failed or (self.target_iterations and self.done_iterations >= self.target_iterations):
+ *             PyThread_release_lock(self.lock)             # <<<<<<<<<<<<<<
+ *             return 0
+ *         position = self.root_position
+*/
+    PyThread_release_lock(__pyx_v_self->lock);
+
+    /* "nonaga_mcts.pyx":192
+ *         if self.failed or (self.target_iterations and self.done_iterations >= self.target_iterations):
+ *             PyThread_release_lock(self.lock)
+ *             return 0             # <<<<<<<<<<<<<<
+ *         position = self.root_position
+ *         while True:
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":190
+ * 
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)
+ *         if self.failed or (self.target_iterations and self.done_iterations >= self.target_iterations):             # <<<<<<<<<<<<<<
+ *             PyThread_release_lock(self.lock)
+ *             return 0
+*/
+  }
+
+  /* "nonaga_mcts.pyx":193
+ *             PyThread_release_lock(self.lock)
+ *             return 0
+ *         position = self.root_position             # <<<<<<<<<<<<<<
+ *         while True:
+ *             self.pool.virtual_loss[node] += 1
+*/
+  __pyx_t_3 = __pyx_v_self->root_position;
+  __pyx_v_position = __pyx_t_3;
+
+  /* "nonaga_mcts.pyx":194
+ *             return 0
+ *         position = self.root_position
+ *         while True:             # <<<<<<<<<<<<<<
+ *             self.pool.virtual_loss[node] += 1
+ *             if self.pool.winner[node] >= 0:
+*/
+  while (1) {
+
+    /* "nonaga_mcts.pyx":195
+ *         position = self.root_position
+ *         while True:
+ *             self.pool.virtual_loss[node] += 1             # <<<<<<<<<<<<<<
+ *             if self.pool.winner[node] >= 0:
+ *                 break
+*/
+    __pyx_t_4 = __pyx_v_node;
+    (__pyx_v_self->pool.virtual_loss[__pyx_t_4]) = ((__pyx_v_self->pool.virtual_loss[__pyx_t_4]) + 1);
+
+    /* "nonaga_mcts.pyx":196
+ *         while True:
+ *             self.pool.virtual_loss[node] += 1
+ *             if self.pool.winner[node] >= 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             if self.pool.num_children[node] < 0:
+*/
+    __pyx_t_1 = ((__pyx_v_self->pool.winner[__pyx_v_node]) >= 0);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":197
+ *             self.pool.virtual_loss[node] += 1
+ *             if self.pool.winner[node] >= 0:
+ *                 break             # <<<<<<<<<<<<<<
+ *             if self.pool.num_children[node] < 0:
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+*/
+      goto __pyx_L8_break;
+
+      /* "nonaga_mcts.pyx":196
+ *         while True:
+ *             self.pool.virtual_loss[node] += 1
+ *             if self.pool.winner[node] >= 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             if self.pool.num_children[node] < 0:
+*/
+    }
+
+    /* "nonaga_mcts.pyx":198
+ *             if self.pool.winner[node] >= 0:
+ *                 break
+ *             if self.pool.num_children[node] < 0:             # <<<<<<<<<<<<<<
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+ *                     break
+*/
+    __pyx_t_1 = ((__pyx_v_self->pool.num_children[__pyx_v_node]) < 0);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":199
+ *                 break
+ *             if self.pool.num_children[node] < 0:
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if not self._expand(node, &position):
+*/
+      __pyx_t_2 = (__pyx_v_node != 0);
+      if (__pyx_t_2) {
+      } else {
+        __pyx_t_1 = __pyx_t_2;
+        goto __pyx_L12_bool_binop_done;
+      }
+      __pyx_t_2 = ((__pyx_v_self->pool.visits[__pyx_v_node]) < __pyx_e_11nonaga_mcts_EXPAND_VISITS);
+      __pyx_t_1 = __pyx_t_2;
+      __pyx_L12_bool_binop_done:;
+      if (__pyx_t_1) {
+
+        /* "nonaga_mcts.pyx":200
+ *             if self.pool.num_children[node] < 0:
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+ *                     break             # <<<<<<<<<<<<<<
+ *                 if not self._expand(node, &position):
+ *                     break
+*/
+        goto __pyx_L8_break;
+
+        /* "nonaga_mcts.pyx":199
+ *                 break
+ *             if self.pool.num_children[node] < 0:
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:             # <<<<<<<<<<<<<<
+ *                     break
+ *                 if not self._expand(node, &position):
+*/
+      }
+
+      /* "nonaga_mcts.pyx":201
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+ *                     break
+ *                 if not self._expand(node, &position):             # <<<<<<<<<<<<<<
+ *                     break
+ *             if self.pool.num_children[node] == 0:
+*/
+      __pyx_t_1 = (!((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_expand(__pyx_v_self, __pyx_v_node, (&__pyx_v_position)));
+      if (__pyx_t_1) {
+
+        /* "nonaga_mcts.pyx":202
+ *                     break
+ *                 if not self._expand(node, &position):
+ *                     break             # <<<<<<<<<<<<<<
+ *             if self.pool.num_children[node] == 0:
+ *                 break
+*/
+        goto __pyx_L8_break;
+
+        /* "nonaga_mcts.pyx":201
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+ *                     break
+ *                 if not self._expand(node, &position):             # <<<<<<<<<<<<<<
+ *                     break
+ *             if self.pool.num_children[node] == 0:
+*/
+      }
+
+      /* "nonaga_mcts.pyx":198
+ *             if self.pool.winner[node] >= 0:
+ *                 break
+ *             if self.pool.num_children[node] < 0:             # <<<<<<<<<<<<<<
+ *                 if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+ *                     break
+*/
+    }
+
+    /* "nonaga_mcts.pyx":203
+ *                 if not self._expand(node, &position):
+ *                     break
+ *             if self.pool.num_children[node] == 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             child = self._select(node)
+*/
+    __pyx_t_1 = ((__pyx_v_self->pool.num_children[__pyx_v_node]) == 0);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":204
+ *                     break
+ *             if self.pool.num_children[node] == 0:
+ *                 break             # <<<<<<<<<<<<<<
+ *             child = self._select(node)
+ *             if position.turn_phase == _PIECE_TO_MOVE:
+*/
+      goto __pyx_L8_break;
+
+      /* "nonaga_mcts.pyx":203
+ *                 if not self._expand(node, &position):
+ *                     break
+ *             if self.pool.num_children[node] == 0:             # <<<<<<<<<<<<<<
+ *                 break
+ *             child = self._select(node)
+*/
+    }
+
+    /* "nonaga_mcts.pyx":205
+ *             if self.pool.num_children[node] == 0:
+ *                 break
+ *             child = self._select(node)             # <<<<<<<<<<<<<<
+ *             if position.turn_phase == _PIECE_TO_MOVE:
+ *                 play_piece_move(&position, self.pool.move[child])
+*/
+    __pyx_v_child = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_select(__pyx_v_self, __pyx_v_node);
+
+    /* "nonaga_mcts.pyx":206
+ *                 break
+ *             child = self._select(node)
+ *             if position.turn_phase == _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(&position, self.pool.move[child])
+ *             else:
+*/
+    __pyx_t_1 = (__pyx_v_position.turn_phase == __pyx_v_11nonaga_mcts__PIECE_TO_MOVE);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":207
+ *             child = self._select(node)
+ *             if position.turn_phase == _PIECE_TO_MOVE:
+ *                 play_piece_move(&position, self.pool.move[child])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 play_tile_move(&position, self.pool.move[child])
+*/
+      __pyx_f_15nonaga_position_play_piece_move((&__pyx_v_position), (__pyx_v_self->pool.move[__pyx_v_child]));
+
+      /* "nonaga_mcts.pyx":206
+ *                 break
+ *             child = self._select(node)
+ *             if position.turn_phase == _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(&position, self.pool.move[child])
+ *             else:
+*/
+      goto __pyx_L16;
+    }
+
+    /* "nonaga_mcts.pyx":209
+ *                 play_piece_move(&position, self.pool.move[child])
+ *             else:
+ *                 play_tile_move(&position, self.pool.move[child])             # <<<<<<<<<<<<<<
+ *             node = child
+ *         # another thread may reallocate the pool once the lock is released
+*/
+    /*else*/ {
+      __pyx_f_15nonaga_position_play_tile_move((&__pyx_v_position), (__pyx_v_self->pool.move[__pyx_v_child]));
+    }
+    __pyx_L16:;
+
+    /* "nonaga_mcts.pyx":210
+ *             else:
+ *                 play_tile_move(&position, self.pool.move[child])
+ *             node = child             # <<<<<<<<<<<<<<
+ *         # another thread may reallocate the pool once the lock is released
+ *         winner = self.pool.winner[node]
+*/
+    __pyx_v_node = __pyx_v_child;
+  }
+  __pyx_L8_break:;
+
+  /* "nonaga_mcts.pyx":212
+ *             node = child
+ *         # another thread may reallocate the pool once the lock is released
+ *         winner = self.pool.winner[node]             # <<<<<<<<<<<<<<
+ *         PyThread_release_lock(self.lock)
+ * 
+*/
+  __pyx_v_winner = (__pyx_v_self->pool.winner[__pyx_v_node]);
+
+  /* "nonaga_mcts.pyx":213
+ *         # another thread may reallocate the pool once the lock is released
+ *         winner = self.pool.winner[node]
+ *         PyThread_release_lock(self.lock)             # <<<<<<<<<<<<<<
+ * 
+ *         red_result = self._simulate(&position, winner, rng)
+*/
+  PyThread_release_lock(__pyx_v_self->lock);
+
+  /* "nonaga_mcts.pyx":215
+ *         PyThread_release_lock(self.lock)
+ * 
+ *         red_result = self._simulate(&position, winner, rng)             # <<<<<<<<<<<<<<
+ * 
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)
+*/
+  __pyx_v_red_result = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_simulate(__pyx_v_self, (&__pyx_v_position), __pyx_v_winner, __pyx_v_rng);
+
+  /* "nonaga_mcts.pyx":217
+ *         red_result = self._simulate(&position, winner, rng)
+ * 
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)             # <<<<<<<<<<<<<<
+ *         while node >= 0:
+ *             self.pool.virtual_loss[node] -= 1
+*/
+  (void)(PyThread_acquire_lock(__pyx_v_self->lock, WAIT_LOCK));
+
+  /* "nonaga_mcts.pyx":218
+ * 
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)
+ *         while node >= 0:             # <<<<<<<<<<<<<<
+ *             self.pool.virtual_loss[node] -= 1
+ *             self.pool.visits[node] += 1
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_node >= 0);
+    if (!__pyx_t_1) break;
+
+    /* "nonaga_mcts.pyx":219
+ *         PyThread_acquire_lock(self.lock, WAIT_LOCK)
+ *         while node >= 0:
+ *             self.pool.virtual_loss[node] -= 1             # <<<<<<<<<<<<<<
+ *             self.pool.visits[node] += 1
+ *             self.pool.value[node] += red_result if self.pool.mover[node] == _RED else 1.0 - red_result
+*/
+    __pyx_t_4 = __pyx_v_node;
+    (__pyx_v_self->pool.virtual_loss[__pyx_t_4]) = ((__pyx_v_self->pool.virtual_loss[__pyx_t_4]) - 1);
+
+    /* "nonaga_mcts.pyx":220
+ *         while node >= 0:
+ *             self.pool.virtual_loss[node] -= 1
+ *             self.pool.visits[node] += 1             # <<<<<<<<<<<<<<
+ *             self.pool.value[node] += red_result if self.pool.mover[node] == _RED else 1.0 - red_result
+ *             node = self.pool.parent[node]
+*/
+    __pyx_t_4 = __pyx_v_node;
+    (__pyx_v_self->pool.visits[__pyx_t_4]) = ((__pyx_v_self->pool.visits[__pyx_t_4]) + 1);
+
+    /* "nonaga_mcts.pyx":221
+ *             self.pool.virtual_loss[node] -= 1
+ *             self.pool.visits[node] += 1
+ *             self.pool.value[node] += red_result if self.pool.mover[node] == _RED else 1.0 - red_result             # <<<<<<<<<<<<<<
+ *             node = self.pool.parent[node]
+ *         self.done_iterations += 1
+*/
+    __pyx_t_4 = __pyx_v_node;
+    __pyx_t_1 = ((__pyx_v_self->pool.mover[__pyx_v_node]) == __pyx_v_11nonaga_mcts__RED);
+    if (__pyx_t_1) {
+      __pyx_t_5 = __pyx_v_red_result;
+    } else {
+      __pyx_t_5 = (1.0 - __pyx_v_red_result);
+    }
+    (__pyx_v_self->pool.value[__pyx_t_4]) = ((__pyx_v_self->pool.value[__pyx_t_4]) + __pyx_t_5);
+
+    /* "nonaga_mcts.pyx":222
+ *             self.pool.visits[node] += 1
+ *             self.pool.value[node] += red_result if self.pool.mover[node] == _RED else 1.0 - red_result
+ *             node = self.pool.parent[node]             # <<<<<<<<<<<<<<
+ *         self.done_iterations += 1
+ *         PyThread_release_lock(self.lock)
+*/
+    __pyx_v_node = (__pyx_v_self->pool.parent[__pyx_v_node]);
+  }
+
+  /* "nonaga_mcts.pyx":223
+ *             self.pool.value[node] += red_result if self.pool.mover[node] == _RED else 1.0 - red_result
+ *             node = self.pool.parent[node]
+ *         self.done_iterations += 1             # <<<<<<<<<<<<<<
+ *         PyThread_release_lock(self.lock)
+ *         return 1
+*/
+  __pyx_v_self->done_iterations = (__pyx_v_self->done_iterations + 1);
+
+  /* "nonaga_mcts.pyx":224
+ *             node = self.pool.parent[node]
+ *         self.done_iterations += 1
+ *         PyThread_release_lock(self.lock)             # <<<<<<<<<<<<<<
+ *         return 1
+ * 
+*/
+  PyThread_release_lock(__pyx_v_self->lock);
+
+  /* "nonaga_mcts.pyx":225
+ *         self.done_iterations += 1
+ *         PyThread_release_lock(self.lock)
+ *         return 1             # <<<<<<<<<<<<<<
+ * 
+ *     cdef bint _expand(self, int node, Position* position) noexcept nogil:
+*/
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":183
+ * 
+ *     #  one iteration
+ *     cdef int _iterate(self, unsigned long long* rng) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Select a leaf, value it and back the result up; returns 0 once the search should stop."""
+ *         cdef Position position
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":227
+ *         return 1
+ * 
+ *     cdef bint _expand(self, int node, Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Add the children of a node; False when the tree is full."""
+ *         cdef int moves[MAX_TILE_MOVES]
+*/
+
+static int __pyx_f_11nonaga_mcts_4MCTS__expand(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, struct __pyx_t_15nonaga_position_Position *__pyx_v_position) {
+  int __pyx_v_moves[__pyx_e_15nonaga_position_MAX_TILE_MOVES];
+  int __pyx_v_count;
+  int __pyx_v_first;
+  int __pyx_v_i;
+  int __pyx_v_player;
+  int __pyx_v_piece_phase;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":230
+ *         """Add the children of a node; False when the tree is full."""
+ *         cdef int moves[MAX_TILE_MOVES]
+ *         cdef int count, first, i, player = position.current_player             # <<<<<<<<<<<<<<
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ * 
+*/
+  __pyx_t_1 = __pyx_v_position->current_player;
+  __pyx_v_player = __pyx_t_1;
+
+  /* "nonaga_mcts.pyx":231
+ *         cdef int moves[MAX_TILE_MOVES]
+ *         cdef int count, first, i, player = position.current_player
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ * 
+ *         if piece_phase:
+*/
+  __pyx_v_piece_phase = (__pyx_v_position->turn_phase == __pyx_v_11nonaga_mcts__PIECE_TO_MOVE);
+
+  /* "nonaga_mcts.pyx":233
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ * 
+ *         if piece_phase:             # <<<<<<<<<<<<<<
+ *             count = fill_position_piece_moves(position, moves)
+ *         else:
+*/
+  if (__pyx_v_piece_phase) {
+
+    /* "nonaga_mcts.pyx":234
+ * 
+ *         if piece_phase:
+ *             count = fill_position_piece_moves(position, moves)             # <<<<<<<<<<<<<<
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)
+*/
+    __pyx_v_count = __pyx_f_15nonaga_position_fill_position_piece_moves(__pyx_v_position, __pyx_v_moves);
+
+    /* "nonaga_mcts.pyx":233
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ * 
+ *         if piece_phase:             # <<<<<<<<<<<<<<
+ *             count = fill_position_piece_moves(position, moves)
+ *         else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "nonaga_mcts.pyx":236
+ *             count = fill_position_piece_moves(position, moves)
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)             # <<<<<<<<<<<<<<
+ *         if self.pool.size + count > self.max_nodes:
+ *             return False
+*/
+  /*else*/ {
+    __pyx_v_count = __pyx_f_15nonaga_position_fill_position_tile_moves(__pyx_v_position, __pyx_v_moves);
+  }
+  __pyx_L3:;
+
+  /* "nonaga_mcts.pyx":237
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)
+ *         if self.pool.size + count > self.max_nodes:             # <<<<<<<<<<<<<<
+ *             return False
+ *         first = pool_allocate(&self.pool, count)
+*/
+  __pyx_t_2 = ((__pyx_v_self->pool.size + __pyx_v_count) > __pyx_v_self->max_nodes);
+  if (__pyx_t_2) {
+
+    /* "nonaga_mcts.pyx":238
+ *             count = fill_position_tile_moves(position, moves)
+ *         if self.pool.size + count > self.max_nodes:
+ *             return False             # <<<<<<<<<<<<<<
+ *         first = pool_allocate(&self.pool, count)
+ *         if first < 0:
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":237
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)
+ *         if self.pool.size + count > self.max_nodes:             # <<<<<<<<<<<<<<
+ *             return False
+ *         first = pool_allocate(&self.pool, count)
+*/
+  }
+
+  /* "nonaga_mcts.pyx":239
+ *         if self.pool.size + count > self.max_nodes:
+ *             return False
+ *         first = pool_allocate(&self.pool, count)             # <<<<<<<<<<<<<<
+ *         if first < 0:
+ *             self.failed = True
+*/
+  __pyx_v_first = __pyx_f_11nonaga_mcts_pool_allocate((&__pyx_v_self->pool), __pyx_v_count);
+
+  /* "nonaga_mcts.pyx":240
+ *             return False
+ *         first = pool_allocate(&self.pool, count)
+ *         if first < 0:             # <<<<<<<<<<<<<<
+ *             self.failed = True
+ *             return False
+*/
+  __pyx_t_2 = (__pyx_v_first < 0);
+  if (__pyx_t_2) {
+
+    /* "nonaga_mcts.pyx":241
+ *         first = pool_allocate(&self.pool, count)
+ *         if first < 0:
+ *             self.failed = True             # <<<<<<<<<<<<<<
+ *             return False
+ *         for i in range(count):
+*/
+    __pyx_v_self->failed = 1;
+
+    /* "nonaga_mcts.pyx":242
+ *         if first < 0:
+ *             self.failed = True
+ *             return False             # <<<<<<<<<<<<<<
+ *         for i in range(count):
+ *             self.pool.parent[first + i] = node
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":240
+ *             return False
+ *         first = pool_allocate(&self.pool, count)
+ *         if first < 0:             # <<<<<<<<<<<<<<
+ *             self.failed = True
+ *             return False
+*/
+  }
+
+  /* "nonaga_mcts.pyx":243
+ *             self.failed = True
+ *             return False
+ *         for i in range(count):             # <<<<<<<<<<<<<<
+ *             self.pool.parent[first + i] = node
+ *             self.pool.move[first + i] = moves[i]
+*/
+  __pyx_t_1 = __pyx_v_count;
+  __pyx_t_3 = __pyx_t_1;
+  for (__pyx_t_4 = 0; __pyx_t_4 < __pyx_t_3; __pyx_t_4+=1) {
+    __pyx_v_i = __pyx_t_4;
+
+    /* "nonaga_mcts.pyx":244
+ *             return False
+ *         for i in range(count):
+ *             self.pool.parent[first + i] = node             # <<<<<<<<<<<<<<
+ *             self.pool.move[first + i] = moves[i]
+ *             self.pool.mover[first + i] = player
+*/
+    (__pyx_v_self->pool.parent[(__pyx_v_first + __pyx_v_i)]) = __pyx_v_node;
+
+    /* "nonaga_mcts.pyx":245
+ *         for i in range(count):
+ *             self.pool.parent[first + i] = node
+ *             self.pool.move[first + i] = moves[i]             # <<<<<<<<<<<<<<
+ *             self.pool.mover[first + i] = player
+ *             if piece_phase:
+*/
+    (__pyx_v_self->pool.move[(__pyx_v_first + __pyx_v_i)]) = (__pyx_v_moves[__pyx_v_i]);
+
+    /* "nonaga_mcts.pyx":246
+ *             self.pool.parent[first + i] = node
+ *             self.pool.move[first + i] = moves[i]
+ *             self.pool.mover[first + i] = player             # <<<<<<<<<<<<<<
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[i])
+*/
+    (__pyx_v_self->pool.mover[(__pyx_v_first + __pyx_v_i)]) = __pyx_v_player;
+
+    /* "nonaga_mcts.pyx":247
+ *             self.pool.move[first + i] = moves[i]
+ *             self.pool.mover[first + i] = player
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(position, moves[i])
+ *                 if position_won(position, player):
+*/
+    if (__pyx_v_piece_phase) {
+
+      /* "nonaga_mcts.pyx":248
+ *             self.pool.mover[first + i] = player
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[i])             # <<<<<<<<<<<<<<
+ *                 if position_won(position, player):
+ *                     self.pool.winner[first + i] = player
+*/
+      __pyx_f_15nonaga_position_play_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_i]));
+
+      /* "nonaga_mcts.pyx":249
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[i])
+ *                 if position_won(position, player):             # <<<<<<<<<<<<<<
+ *                     self.pool.winner[first + i] = player
+ *                 undo_piece_move(position, moves[i])
+*/
+      __pyx_t_2 = __pyx_f_15nonaga_position_position_won(__pyx_v_position, __pyx_v_player);
+      if (__pyx_t_2) {
+
+        /* "nonaga_mcts.pyx":250
+ *                 play_piece_move(position, moves[i])
+ *                 if position_won(position, player):
+ *                     self.pool.winner[first + i] = player             # <<<<<<<<<<<<<<
+ *                 undo_piece_move(position, moves[i])
+ *             else:
+*/
+        (__pyx_v_self->pool.winner[(__pyx_v_first + __pyx_v_i)]) = __pyx_v_player;
+
+        /* "nonaga_mcts.pyx":249
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[i])
+ *                 if position_won(position, player):             # <<<<<<<<<<<<<<
+ *                     self.pool.winner[first + i] = player
+ *                 undo_piece_move(position, moves[i])
+*/
+      }
+
+      /* "nonaga_mcts.pyx":251
+ *                 if position_won(position, player):
+ *                     self.pool.winner[first + i] = player
+ *                 undo_piece_move(position, moves[i])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 # a tile move letting the opponent slide into a win is lost already
+*/
+      __pyx_f_15nonaga_position_undo_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_i]));
+
+      /* "nonaga_mcts.pyx":247
+ *             self.pool.move[first + i] = moves[i]
+ *             self.pool.mover[first + i] = player
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(position, moves[i])
+ *                 if position_won(position, player):
+*/
+      goto __pyx_L8;
+    }
+
+    /* "nonaga_mcts.pyx":254
+ *             else:
+ *                 # a tile move letting the opponent slide into a win is lost already
+ *                 play_tile_move(position, moves[i])             # <<<<<<<<<<<<<<
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+ *                     self.pool.winner[first + i] = position.current_player
+*/
+    /*else*/ {
+      __pyx_f_15nonaga_position_play_tile_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_i]));
+
+      /* "nonaga_mcts.pyx":255
+ *                 # a tile move letting the opponent slide into a win is lost already
+ *                 play_tile_move(position, moves[i])
+ *                 if find_winning_slide(position, position.current_player) >= 0:             # <<<<<<<<<<<<<<
+ *                     self.pool.winner[first + i] = position.current_player
+ *                 undo_tile_move(position, moves[i])
+*/
+      __pyx_t_2 = (__pyx_f_15nonaga_position_find_winning_slide(__pyx_v_position, __pyx_v_position->current_player) >= 0);
+      if (__pyx_t_2) {
+
+        /* "nonaga_mcts.pyx":256
+ *                 play_tile_move(position, moves[i])
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+ *                     self.pool.winner[first + i] = position.current_player             # <<<<<<<<<<<<<<
+ *                 undo_tile_move(position, moves[i])
+ *         self.pool.first_child[node] = first
+*/
+        __pyx_t_5 = __pyx_v_position->current_player;
+        (__pyx_v_self->pool.winner[(__pyx_v_first + __pyx_v_i)]) = __pyx_t_5;
+
+        /* "nonaga_mcts.pyx":255
+ *                 # a tile move letting the opponent slide into a win is lost already
+ *                 play_tile_move(position, moves[i])
+ *                 if find_winning_slide(position, position.current_player) >= 0:             # <<<<<<<<<<<<<<
+ *                     self.pool.winner[first + i] = position.current_player
+ *                 undo_tile_move(position, moves[i])
+*/
+      }
+
+      /* "nonaga_mcts.pyx":257
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+ *                     self.pool.winner[first + i] = position.current_player
+ *                 undo_tile_move(position, moves[i])             # <<<<<<<<<<<<<<
+ *         self.pool.first_child[node] = first
+ *         self.pool.num_children[node] = count
+*/
+      __pyx_f_15nonaga_position_undo_tile_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_i]));
+    }
+    __pyx_L8:;
+  }
+
+  /* "nonaga_mcts.pyx":258
+ *                     self.pool.winner[first + i] = position.current_player
+ *                 undo_tile_move(position, moves[i])
+ *         self.pool.first_child[node] = first             # <<<<<<<<<<<<<<
+ *         self.pool.num_children[node] = count
+ *         return True
+*/
+  (__pyx_v_self->pool.first_child[__pyx_v_node]) = __pyx_v_first;
+
+  /* "nonaga_mcts.pyx":259
+ *                 undo_tile_move(position, moves[i])
+ *         self.pool.first_child[node] = first
+ *         self.pool.num_children[node] = count             # <<<<<<<<<<<<<<
+ *         return True
+ * 
+*/
+  (__pyx_v_self->pool.num_children[__pyx_v_node]) = __pyx_v_count;
+
+  /* "nonaga_mcts.pyx":260
+ *         self.pool.first_child[node] = first
+ *         self.pool.num_children[node] = count
+ *         return True             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _select(self, int node) noexcept nogil:
+*/
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":227
+ *         return 1
+ * 
+ *     cdef bint _expand(self, int node, Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Add the children of a node; False when the tree is full."""
+ *         cdef int moves[MAX_TILE_MOVES]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":262
+ *         return True
+ * 
+ *     cdef int _select(self, int node) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """UCT choice among the children of an expanded node.
+ * 
+*/
+
+static int __pyx_f_11nonaga_mcts_4MCTS__select(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node) {
+  int __pyx_v_first;
+  int __pyx_v_best;
+  int __pyx_v_child;
+  int __pyx_v_n;
+  double __pyx_v_log_n;
+  double __pyx_v_score;
+  double __pyx_v_best_score;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_mcts.pyx":268
+ *         every move is lost.
+ *         """
+ *         cdef int first = self.pool.first_child[node], best = first, child, n             # <<<<<<<<<<<<<<
+ *         cdef double log_n = log(self.pool.visits[node] + self.pool.virtual_loss[node] + 1.0)
+ *         cdef double score, best_score = -1.0
+*/
+  __pyx_v_first = (__pyx_v_self->pool.first_child[__pyx_v_node]);
+  __pyx_v_best = __pyx_v_first;
+
+  /* "nonaga_mcts.pyx":269
+ *         """
+ *         cdef int first = self.pool.first_child[node], best = first, child, n
+ *         cdef double log_n = log(self.pool.visits[node] + self.pool.virtual_loss[node] + 1.0)             # <<<<<<<<<<<<<<
+ *         cdef double score, best_score = -1.0
+ *         for child in range(first, first + self.pool.num_children[node]):
+*/
+  __pyx_v_log_n = log((((__pyx_v_self->pool.visits[__pyx_v_node]) + (__pyx_v_self->pool.virtual_loss[__pyx_v_node])) + 1.0));
+
+  /* "nonaga_mcts.pyx":270
+ *         cdef int first = self.pool.first_child[node], best = first, child, n
+ *         cdef double log_n = log(self.pool.visits[node] + self.pool.virtual_loss[node] + 1.0)
+ *         cdef double score, best_score = -1.0             # <<<<<<<<<<<<<<
+ *         for child in range(first, first + self.pool.num_children[node]):
+ *             if self.pool.winner[child] == self.pool.mover[child]:
+*/
+  __pyx_v_best_score = -1.0;
+
+  /* "nonaga_mcts.pyx":271
+ *         cdef double log_n = log(self.pool.visits[node] + self.pool.virtual_loss[node] + 1.0)
+ *         cdef double score, best_score = -1.0
+ *         for child in range(first, first + self.pool.num_children[node]):             # <<<<<<<<<<<<<<
+ *             if self.pool.winner[child] == self.pool.mover[child]:
+ *                 return child
+*/
+  __pyx_t_1 = (__pyx_v_first + (__pyx_v_self->pool.num_children[__pyx_v_node]));
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = __pyx_v_first; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_child = __pyx_t_3;
+
+    /* "nonaga_mcts.pyx":272
+ *         cdef double score, best_score = -1.0
+ *         for child in range(first, first + self.pool.num_children[node]):
+ *             if self.pool.winner[child] == self.pool.mover[child]:             # <<<<<<<<<<<<<<
+ *                 return child
+ *             if self.pool.winner[child] >= 0:
+*/
+    __pyx_t_4 = ((__pyx_v_self->pool.winner[__pyx_v_child]) == (__pyx_v_self->pool.mover[__pyx_v_child]));
+    if (__pyx_t_4) {
+
+      /* "nonaga_mcts.pyx":273
+ *         for child in range(first, first + self.pool.num_children[node]):
+ *             if self.pool.winner[child] == self.pool.mover[child]:
+ *                 return child             # <<<<<<<<<<<<<<
+ *             if self.pool.winner[child] >= 0:
+ *                 continue
+*/
+      __pyx_r = __pyx_v_child;
+      goto __pyx_L0;
+
+      /* "nonaga_mcts.pyx":272
+ *         cdef double score, best_score = -1.0
+ *         for child in range(first, first + self.pool.num_children[node]):
+ *             if self.pool.winner[child] == self.pool.mover[child]:             # <<<<<<<<<<<<<<
+ *                 return child
+ *             if self.pool.winner[child] >= 0:
+*/
+    }
+
+    /* "nonaga_mcts.pyx":274
+ *             if self.pool.winner[child] == self.pool.mover[child]:
+ *                 return child
+ *             if self.pool.winner[child] >= 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]
+*/
+    __pyx_t_4 = ((__pyx_v_self->pool.winner[__pyx_v_child]) >= 0);
+    if (__pyx_t_4) {
+
+      /* "nonaga_mcts.pyx":275
+ *                 return child
+ *             if self.pool.winner[child] >= 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]
+ *             if n == 0:
+*/
+      goto __pyx_L3_continue;
+
+      /* "nonaga_mcts.pyx":274
+ *             if self.pool.winner[child] == self.pool.mover[child]:
+ *                 return child
+ *             if self.pool.winner[child] >= 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]
+*/
+    }
+
+    /* "nonaga_mcts.pyx":276
+ *             if self.pool.winner[child] >= 0:
+ *                 continue
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]             # <<<<<<<<<<<<<<
+ *             if n == 0:
+ *                 return child
+*/
+    __pyx_v_n = ((__pyx_v_self->pool.visits[__pyx_v_child]) + (__pyx_v_self->pool.virtual_loss[__pyx_v_child]));
+
+    /* "nonaga_mcts.pyx":277
+ *                 continue
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]
+ *             if n == 0:             # <<<<<<<<<<<<<<
+ *                 return child
+ *             # virtual losses count as lost games until their result comes back
+*/
+    __pyx_t_4 = (__pyx_v_n == 0);
+    if (__pyx_t_4) {
+
+      /* "nonaga_mcts.pyx":278
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]
+ *             if n == 0:
+ *                 return child             # <<<<<<<<<<<<<<
+ *             # virtual losses count as lost games until their result comes back
+ *             score = self.pool.value[child] / n + self.exploration * sqrt(log_n / n)
+*/
+      __pyx_r = __pyx_v_child;
+      goto __pyx_L0;
+
+      /* "nonaga_mcts.pyx":277
+ *                 continue
+ *             n = self.pool.visits[child] + self.pool.virtual_loss[child]
+ *             if n == 0:             # <<<<<<<<<<<<<<
+ *                 return child
+ *             # virtual losses count as lost games until their result comes back
+*/
+    }
+
+    /* "nonaga_mcts.pyx":280
+ *                 return child
+ *             # virtual losses count as lost games until their result comes back
+ *             score = self.pool.value[child] / n + self.exploration * sqrt(log_n / n)             # <<<<<<<<<<<<<<
+ *             if score > best_score:
+ *                 best_score = score
+*/
+    if (unlikely(__pyx_v_n == 0)) {
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      __PYX_ERR(0, 280, __pyx_L1_error)
+    }
+    if (unlikely(__pyx_v_n == 0)) {
+      PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+      PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+      __Pyx_PyGILState_Release(__pyx_gilstate_save);
+      __PYX_ERR(0, 280, __pyx_L1_error)
+    }
+    __pyx_v_score = (((__pyx_v_self->pool.value[__pyx_v_child]) / ((double)__pyx_v_n)) + (__pyx_v_self->exploration * sqrt((__pyx_v_log_n / ((double)__pyx_v_n)))));
+
+    /* "nonaga_mcts.pyx":281
+ *             # virtual losses count as lost games until their result comes back
+ *             score = self.pool.value[child] / n + self.exploration * sqrt(log_n / n)
+ *             if score > best_score:             # <<<<<<<<<<<<<<
+ *                 best_score = score
+ *                 best = child
+*/
+    __pyx_t_4 = (__pyx_v_score > __pyx_v_best_score);
+    if (__pyx_t_4) {
+
+      /* "nonaga_mcts.pyx":282
+ *             score = self.pool.value[child] / n + self.exploration * sqrt(log_n / n)
+ *             if score > best_score:
+ *                 best_score = score             # <<<<<<<<<<<<<<
+ *                 best = child
+ *         return best
+*/
+      __pyx_v_best_score = __pyx_v_score;
+
+      /* "nonaga_mcts.pyx":283
+ *             if score > best_score:
+ *                 best_score = score
+ *                 best = child             # <<<<<<<<<<<<<<
+ *         return best
+ * 
+*/
+      __pyx_v_best = __pyx_v_child;
+
+      /* "nonaga_mcts.pyx":281
+ *             # virtual losses count as lost games until their result comes back
+ *             score = self.pool.value[child] / n + self.exploration * sqrt(log_n / n)
+ *             if score > best_score:             # <<<<<<<<<<<<<<
+ *                 best_score = score
+ *                 best = child
+*/
+    }
+    __pyx_L3_continue:;
+  }
+
+  /* "nonaga_mcts.pyx":284
+ *                 best_score = score
+ *                 best = child
+ *         return best             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double _simulate(self, Position* position, int winner, unsigned long long* rng) noexcept nogil:
+*/
+  __pyx_r = __pyx_v_best;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":262
+ *         return True
+ * 
+ *     cdef int _select(self, int node) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """UCT choice among the children of an expanded node.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_mcts.MCTS._select", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":286
+ *         return best
+ * 
+ *     cdef double _simulate(self, Position* position, int winner, unsigned long long* rng) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Probability that RED wins from the position, from a rollout or cost_function."""
+ *         cdef int moves[MAX_TILE_MOVES]
+*/
+
+static double __pyx_f_11nonaga_mcts_4MCTS__simulate(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_winner, unsigned PY_LONG_LONG *__pyx_v_rng) {
+  int __pyx_v_moves[__pyx_e_15nonaga_position_MAX_TILE_MOVES];
+  int __pyx_v_count;
+  int __pyx_v_move;
+  CYTHON_UNUSED int __pyx_v_ply;
+  int __pyx_v_k;
+  int __pyx_v_player;
+  int __pyx_v_cost;
+  int __pyx_v_best_cost;
+  double __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+  long __pyx_t_3;
+  long __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+
+  /* "nonaga_mcts.pyx":290
+ *         cdef int moves[MAX_TILE_MOVES]
+ *         cdef int count, move, ply, k, player, cost, best_cost
+ *         if winner >= 0:             # <<<<<<<<<<<<<<
+ *             return 1.0 if winner == _RED else 0.0
+ *         if self.rollout_mode != ROLLOUT_NONE:
+*/
+  __pyx_t_1 = (__pyx_v_winner >= 0);
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":291
+ *         cdef int count, move, ply, k, player, cost, best_cost
+ *         if winner >= 0:
+ *             return 1.0 if winner == _RED else 0.0             # <<<<<<<<<<<<<<
+ *         if self.rollout_mode != ROLLOUT_NONE:
+ *             for ply in range(2 * self.rollout_turns):
+*/
+    __pyx_t_1 = (__pyx_v_winner == __pyx_v_11nonaga_mcts__RED);
+    if (__pyx_t_1) {
+      __pyx_t_2 = 1.0;
+    } else {
+      __pyx_t_2 = 0.0;
+    }
+    __pyx_r = __pyx_t_2;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":290
+ *         cdef int moves[MAX_TILE_MOVES]
+ *         cdef int count, move, ply, k, player, cost, best_cost
+ *         if winner >= 0:             # <<<<<<<<<<<<<<
+ *             return 1.0 if winner == _RED else 0.0
+ *         if self.rollout_mode != ROLLOUT_NONE:
+*/
+  }
+
+  /* "nonaga_mcts.pyx":292
+ *         if winner >= 0:
+ *             return 1.0 if winner == _RED else 0.0
+ *         if self.rollout_mode != ROLLOUT_NONE:             # <<<<<<<<<<<<<<
+ *             for ply in range(2 * self.rollout_turns):
+ *                 player = position.current_player
+*/
+  __pyx_t_1 = (__pyx_v_self->rollout_mode != __pyx_e_11nonaga_mcts_ROLLOUT_NONE);
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":293
+ *             return 1.0 if winner == _RED else 0.0
+ *         if self.rollout_mode != ROLLOUT_NONE:
+ *             for ply in range(2 * self.rollout_turns):             # <<<<<<<<<<<<<<
+ *                 player = position.current_player
+ *                 if position.turn_phase == _PIECE_TO_MOVE:
+*/
+    __pyx_t_3 = (2 * __pyx_v_self->rollout_turns);
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_ply = __pyx_t_5;
+
+      /* "nonaga_mcts.pyx":294
+ *         if self.rollout_mode != ROLLOUT_NONE:
+ *             for ply in range(2 * self.rollout_turns):
+ *                 player = position.current_player             # <<<<<<<<<<<<<<
+ *                 if position.turn_phase == _PIECE_TO_MOVE:
+ *                     move = find_winning_slide(position, player)
+*/
+      __pyx_t_6 = __pyx_v_position->current_player;
+      __pyx_v_player = __pyx_t_6;
+
+      /* "nonaga_mcts.pyx":295
+ *             for ply in range(2 * self.rollout_turns):
+ *                 player = position.current_player
+ *                 if position.turn_phase == _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *                     move = find_winning_slide(position, player)
+ *                     if move >= 0:
+*/
+      __pyx_t_1 = (__pyx_v_position->turn_phase == __pyx_v_11nonaga_mcts__PIECE_TO_MOVE);
+      if (__pyx_t_1) {
+
+        /* "nonaga_mcts.pyx":296
+ *                 player = position.current_player
+ *                 if position.turn_phase == _PIECE_TO_MOVE:
+ *                     move = find_winning_slide(position, player)             # <<<<<<<<<<<<<<
+ *                     if move >= 0:
+ *                         return 1.0 if player == _RED else 0.0
+*/
+        __pyx_v_move = __pyx_f_15nonaga_position_find_winning_slide(__pyx_v_position, __pyx_v_player);
+
+        /* "nonaga_mcts.pyx":297
+ *                 if position.turn_phase == _PIECE_TO_MOVE:
+ *                     move = find_winning_slide(position, player)
+ *                     if move >= 0:             # <<<<<<<<<<<<<<
+ *                         return 1.0 if player == _RED else 0.0
+ *                     count = fill_position_piece_moves(position, moves)
+*/
+        __pyx_t_1 = (__pyx_v_move >= 0);
+        if (__pyx_t_1) {
+
+          /* "nonaga_mcts.pyx":298
+ *                     move = find_winning_slide(position, player)
+ *                     if move >= 0:
+ *                         return 1.0 if player == _RED else 0.0             # <<<<<<<<<<<<<<
+ *                     count = fill_position_piece_moves(position, moves)
+ *                     if count == 0:
+*/
+          __pyx_t_1 = (__pyx_v_player == __pyx_v_11nonaga_mcts__RED);
+          if (__pyx_t_1) {
+            __pyx_t_2 = 1.0;
+          } else {
+            __pyx_t_2 = 0.0;
+          }
+          __pyx_r = __pyx_t_2;
+          goto __pyx_L0;
+
+          /* "nonaga_mcts.pyx":297
+ *                 if position.turn_phase == _PIECE_TO_MOVE:
+ *                     move = find_winning_slide(position, player)
+ *                     if move >= 0:             # <<<<<<<<<<<<<<
+ *                         return 1.0 if player == _RED else 0.0
+ *                     count = fill_position_piece_moves(position, moves)
+*/
+        }
+
+        /* "nonaga_mcts.pyx":299
+ *                     if move >= 0:
+ *                         return 1.0 if player == _RED else 0.0
+ *                     count = fill_position_piece_moves(position, moves)             # <<<<<<<<<<<<<<
+ *                     if count == 0:
+ *                         break
+*/
+        __pyx_v_count = __pyx_f_15nonaga_position_fill_position_piece_moves(__pyx_v_position, __pyx_v_moves);
+
+        /* "nonaga_mcts.pyx":300
+ *                         return 1.0 if player == _RED else 0.0
+ *                     count = fill_position_piece_moves(position, moves)
+ *                     if count == 0:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     move = moves[_random_below(rng, count)]
+*/
+        __pyx_t_1 = (__pyx_v_count == 0);
+        if (__pyx_t_1) {
+
+          /* "nonaga_mcts.pyx":301
+ *                     count = fill_position_piece_moves(position, moves)
+ *                     if count == 0:
+ *                         break             # <<<<<<<<<<<<<<
+ *                     move = moves[_random_below(rng, count)]
+ *                     if self.rollout_mode == ROLLOUT_GUIDED:
+*/
+          goto __pyx_L6_break;
+
+          /* "nonaga_mcts.pyx":300
+ *                         return 1.0 if player == _RED else 0.0
+ *                     count = fill_position_piece_moves(position, moves)
+ *                     if count == 0:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     move = moves[_random_below(rng, count)]
+*/
+        }
+
+        /* "nonaga_mcts.pyx":302
+ *                     if count == 0:
+ *                         break
+ *                     move = moves[_random_below(rng, count)]             # <<<<<<<<<<<<<<
+ *                     if self.rollout_mode == ROLLOUT_GUIDED:
+ *                         best_cost = 0
+*/
+        __pyx_v_move = (__pyx_v_moves[__pyx_f_11nonaga_mcts__random_below(__pyx_v_rng, __pyx_v_count)]);
+
+        /* "nonaga_mcts.pyx":303
+ *                         break
+ *                     move = moves[_random_below(rng, count)]
+ *                     if self.rollout_mode == ROLLOUT_GUIDED:             # <<<<<<<<<<<<<<
+ *                         best_cost = 0
+ *                         for k in range(count):
+*/
+        __pyx_t_1 = (__pyx_v_self->rollout_mode == __pyx_e_11nonaga_mcts_ROLLOUT_GUIDED);
+        if (__pyx_t_1) {
+
+          /* "nonaga_mcts.pyx":304
+ *                     move = moves[_random_below(rng, count)]
+ *                     if self.rollout_mode == ROLLOUT_GUIDED:
+ *                         best_cost = 0             # <<<<<<<<<<<<<<
+ *                         for k in range(count):
+ *                             play_piece_move(position, moves[k])
+*/
+          __pyx_v_best_cost = 0;
+
+          /* "nonaga_mcts.pyx":305
+ *                     if self.rollout_mode == ROLLOUT_GUIDED:
+ *                         best_cost = 0
+ *                         for k in range(count):             # <<<<<<<<<<<<<<
+ *                             play_piece_move(position, moves[k])
+ *                             cost = position_cost(position, player, self.params)
+*/
+          __pyx_t_6 = __pyx_v_count;
+          __pyx_t_7 = __pyx_t_6;
+          for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+            __pyx_v_k = __pyx_t_8;
+
+            /* "nonaga_mcts.pyx":306
+ *                         best_cost = 0
+ *                         for k in range(count):
+ *                             play_piece_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *                             cost = position_cost(position, player, self.params)
+ *                             undo_piece_move(position, moves[k])
+*/
+            __pyx_f_15nonaga_position_play_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+
+            /* "nonaga_mcts.pyx":307
+ *                         for k in range(count):
+ *                             play_piece_move(position, moves[k])
+ *                             cost = position_cost(position, player, self.params)             # <<<<<<<<<<<<<<
+ *                             undo_piece_move(position, moves[k])
+ *                             if k == 0 or cost > best_cost:
+*/
+            __pyx_v_cost = __pyx_f_15nonaga_position_position_cost(__pyx_v_position, __pyx_v_player, __pyx_v_self->params);
+
+            /* "nonaga_mcts.pyx":308
+ *                             play_piece_move(position, moves[k])
+ *                             cost = position_cost(position, player, self.params)
+ *                             undo_piece_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *                             if k == 0 or cost > best_cost:
+ *                                 best_cost = cost
+*/
+            __pyx_f_15nonaga_position_undo_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+
+            /* "nonaga_mcts.pyx":309
+ *                             cost = position_cost(position, player, self.params)
+ *                             undo_piece_move(position, moves[k])
+ *                             if k == 0 or cost > best_cost:             # <<<<<<<<<<<<<<
+ *                                 best_cost = cost
+ *                                 move = moves[k]
+*/
+            __pyx_t_9 = (__pyx_v_k == 0);
+            if (!__pyx_t_9) {
+            } else {
+              __pyx_t_1 = __pyx_t_9;
+              goto __pyx_L14_bool_binop_done;
+            }
+            __pyx_t_9 = (__pyx_v_cost > __pyx_v_best_cost);
+            __pyx_t_1 = __pyx_t_9;
+            __pyx_L14_bool_binop_done:;
+            if (__pyx_t_1) {
+
+              /* "nonaga_mcts.pyx":310
+ *                             undo_piece_move(position, moves[k])
+ *                             if k == 0 or cost > best_cost:
+ *                                 best_cost = cost             # <<<<<<<<<<<<<<
+ *                                 move = moves[k]
+ *                     play_piece_move(position, move)
+*/
+              __pyx_v_best_cost = __pyx_v_cost;
+
+              /* "nonaga_mcts.pyx":311
+ *                             if k == 0 or cost > best_cost:
+ *                                 best_cost = cost
+ *                                 move = moves[k]             # <<<<<<<<<<<<<<
+ *                     play_piece_move(position, move)
+ *                 else:
+*/
+              __pyx_v_move = (__pyx_v_moves[__pyx_v_k]);
+
+              /* "nonaga_mcts.pyx":309
+ *                             cost = position_cost(position, player, self.params)
+ *                             undo_piece_move(position, moves[k])
+ *                             if k == 0 or cost > best_cost:             # <<<<<<<<<<<<<<
+ *                                 best_cost = cost
+ *                                 move = moves[k]
+*/
+            }
+          }
+
+          /* "nonaga_mcts.pyx":303
+ *                         break
+ *                     move = moves[_random_below(rng, count)]
+ *                     if self.rollout_mode == ROLLOUT_GUIDED:             # <<<<<<<<<<<<<<
+ *                         best_cost = 0
+ *                         for k in range(count):
+*/
+        }
+
+        /* "nonaga_mcts.pyx":312
+ *                                 best_cost = cost
+ *                                 move = moves[k]
+ *                     play_piece_move(position, move)             # <<<<<<<<<<<<<<
+ *                 else:
+ *                     count = fill_position_tile_moves(position, moves)
+*/
+        __pyx_f_15nonaga_position_play_piece_move(__pyx_v_position, __pyx_v_move);
+
+        /* "nonaga_mcts.pyx":295
+ *             for ply in range(2 * self.rollout_turns):
+ *                 player = position.current_player
+ *                 if position.turn_phase == _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *                     move = find_winning_slide(position, player)
+ *                     if move >= 0:
+*/
+        goto __pyx_L7;
+      }
+
+      /* "nonaga_mcts.pyx":314
+ *                     play_piece_move(position, move)
+ *                 else:
+ *                     count = fill_position_tile_moves(position, moves)             # <<<<<<<<<<<<<<
+ *                     if count == 0:
+ *                         break
+*/
+      /*else*/ {
+        __pyx_v_count = __pyx_f_15nonaga_position_fill_position_tile_moves(__pyx_v_position, __pyx_v_moves);
+
+        /* "nonaga_mcts.pyx":315
+ *                 else:
+ *                     count = fill_position_tile_moves(position, moves)
+ *                     if count == 0:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     play_tile_move(position, moves[_random_below(rng, count)])
+*/
+        __pyx_t_1 = (__pyx_v_count == 0);
+        if (__pyx_t_1) {
+
+          /* "nonaga_mcts.pyx":316
+ *                     count = fill_position_tile_moves(position, moves)
+ *                     if count == 0:
+ *                         break             # <<<<<<<<<<<<<<
+ *                     play_tile_move(position, moves[_random_below(rng, count)])
+ *         return self._evaluate(position)
+*/
+          goto __pyx_L6_break;
+
+          /* "nonaga_mcts.pyx":315
+ *                 else:
+ *                     count = fill_position_tile_moves(position, moves)
+ *                     if count == 0:             # <<<<<<<<<<<<<<
+ *                         break
+ *                     play_tile_move(position, moves[_random_below(rng, count)])
+*/
+        }
+
+        /* "nonaga_mcts.pyx":317
+ *                     if count == 0:
+ *                         break
+ *                     play_tile_move(position, moves[_random_below(rng, count)])             # <<<<<<<<<<<<<<
+ *         return self._evaluate(position)
+ * 
+*/
+        __pyx_f_15nonaga_position_play_tile_move(__pyx_v_position, (__pyx_v_moves[__pyx_f_11nonaga_mcts__random_below(__pyx_v_rng, __pyx_v_count)]));
+      }
+      __pyx_L7:;
+    }
+    __pyx_L6_break:;
+
+    /* "nonaga_mcts.pyx":292
+ *         if winner >= 0:
+ *             return 1.0 if winner == _RED else 0.0
+ *         if self.rollout_mode != ROLLOUT_NONE:             # <<<<<<<<<<<<<<
+ *             for ply in range(2 * self.rollout_turns):
+ *                 player = position.current_player
+*/
+  }
+
+  /* "nonaga_mcts.pyx":318
+ *                         break
+ *                     play_tile_move(position, moves[_random_below(rng, count)])
+ *         return self._evaluate(position)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef double _evaluate(self, const Position* position) noexcept nogil:
+*/
+  __pyx_r = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_evaluate(__pyx_v_self, __pyx_v_position);
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":286
+ *         return best
+ * 
+ *     cdef double _simulate(self, Position* position, int winner, unsigned long long* rng) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Probability that RED wins from the position, from a rollout or cost_function."""
+ *         cdef int moves[MAX_TILE_MOVES]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":320
+ *         return self._evaluate(position)
+ * 
+ *     cdef double _evaluate(self, const Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         return 1.0 / (1.0 + exp(-position_cost(position, _RED, self.params) / self.evaluation_scale))
+ * 
+*/
+
+static double __pyx_f_11nonaga_mcts_4MCTS__evaluate(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_t_15nonaga_position_Position const *__pyx_v_position) {
+  double __pyx_r;
+  int __pyx_t_1;
+  double __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_mcts.pyx":321
+ * 
+ *     cdef double _evaluate(self, const Position* position) noexcept nogil:
+ *         return 1.0 / (1.0 + exp(-position_cost(position, _RED, self.params) / self.evaluation_scale))             # <<<<<<<<<<<<<<
+ * 
+ *     #  tree reuse
+*/
+  __pyx_t_1 = (-__pyx_f_15nonaga_position_position_cost(__pyx_v_position, __pyx_v_11nonaga_mcts__RED, __pyx_v_self->params));
+  if (unlikely(__pyx_v_self->evaluation_scale == 0)) {
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    __PYX_ERR(0, 321, __pyx_L1_error)
+  }
+  __pyx_t_2 = (1.0 + exp((((double)__pyx_t_1) / __pyx_v_self->evaluation_scale)));
+  if (unlikely(__pyx_t_2 == 0)) {
+    PyGILState_STATE __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+    PyErr_SetString(PyExc_ZeroDivisionError, "float division");
+    __Pyx_PyGILState_Release(__pyx_gilstate_save);
+    __PYX_ERR(0, 321, __pyx_L1_error)
+  }
+  __pyx_r = (1.0 / __pyx_t_2);
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":320
+ *         return self._evaluate(position)
+ * 
+ *     cdef double _evaluate(self, const Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         return 1.0 / (1.0 + exp(-position_cost(position, _RED, self.params) / self.evaluation_scale))
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_mcts.MCTS._evaluate", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":324
+ * 
+ *     #  tree reuse
+ *     cdef int _find_node(self, int node, Position* position, const Position* target, int plies) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Node of the subtree whose position is *target*, at most *plies* moves below, -1 if none."""
+ *         cdef int child, found
+*/
+
+static int __pyx_f_11nonaga_mcts_4MCTS__find_node(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, struct __pyx_t_15nonaga_position_Position *__pyx_v_position, struct __pyx_t_15nonaga_position_Position const *__pyx_v_target, int __pyx_v_plies) {
+  int __pyx_v_child;
+  int __pyx_v_found;
+  int __pyx_v_piece_phase;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":328
+ *         cdef int child, found
+ *         cdef bint piece_phase
+ *         if same_position(position, target):             # <<<<<<<<<<<<<<
+ *             return node
+ *         if plies == 0 or self.pool.num_children[node] <= 0:
+*/
+  __pyx_t_1 = __pyx_f_15nonaga_position_same_position(__pyx_v_position, __pyx_v_target);
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":329
+ *         cdef bint piece_phase
+ *         if same_position(position, target):
+ *             return node             # <<<<<<<<<<<<<<
+ *         if plies == 0 or self.pool.num_children[node] <= 0:
+ *             return -1
+*/
+    __pyx_r = __pyx_v_node;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":328
+ *         cdef int child, found
+ *         cdef bint piece_phase
+ *         if same_position(position, target):             # <<<<<<<<<<<<<<
+ *             return node
+ *         if plies == 0 or self.pool.num_children[node] <= 0:
+*/
+  }
+
+  /* "nonaga_mcts.pyx":330
+ *         if same_position(position, target):
+ *             return node
+ *         if plies == 0 or self.pool.num_children[node] <= 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE
+*/
+  __pyx_t_2 = (__pyx_v_plies == 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L5_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_self->pool.num_children[__pyx_v_node]) <= 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L5_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":331
+ *             return node
+ *         if plies == 0 or self.pool.num_children[node] <= 0:
+ *             return -1             # <<<<<<<<<<<<<<
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+*/
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":330
+ *         if same_position(position, target):
+ *             return node
+ *         if plies == 0 or self.pool.num_children[node] <= 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE
+*/
+  }
+
+  /* "nonaga_mcts.pyx":332
+ *         if plies == 0 or self.pool.num_children[node] <= 0:
+ *             return -1
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if piece_phase:
+*/
+  __pyx_v_piece_phase = (__pyx_v_position->turn_phase == __pyx_v_11nonaga_mcts__PIECE_TO_MOVE);
+
+  /* "nonaga_mcts.pyx":333
+ *             return -1
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):             # <<<<<<<<<<<<<<
+ *             if piece_phase:
+ *                 play_piece_move(position, self.pool.move[child])
+*/
+  __pyx_t_3 = ((__pyx_v_self->pool.first_child[__pyx_v_node]) + (__pyx_v_self->pool.num_children[__pyx_v_node]));
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = (__pyx_v_self->pool.first_child[__pyx_v_node]); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_child = __pyx_t_5;
+
+    /* "nonaga_mcts.pyx":334
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(position, self.pool.move[child])
+ *             else:
+*/
+    if (__pyx_v_piece_phase) {
+
+      /* "nonaga_mcts.pyx":335
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if piece_phase:
+ *                 play_piece_move(position, self.pool.move[child])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 play_tile_move(position, self.pool.move[child])
+*/
+      __pyx_f_15nonaga_position_play_piece_move(__pyx_v_position, (__pyx_v_self->pool.move[__pyx_v_child]));
+
+      /* "nonaga_mcts.pyx":334
+ *         piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(position, self.pool.move[child])
+ *             else:
+*/
+      goto __pyx_L9;
+    }
+
+    /* "nonaga_mcts.pyx":337
+ *                 play_piece_move(position, self.pool.move[child])
+ *             else:
+ *                 play_tile_move(position, self.pool.move[child])             # <<<<<<<<<<<<<<
+ *             found = self._find_node(child, position, target, plies - 1)
+ *             if piece_phase:
+*/
+    /*else*/ {
+      __pyx_f_15nonaga_position_play_tile_move(__pyx_v_position, (__pyx_v_self->pool.move[__pyx_v_child]));
+    }
+    __pyx_L9:;
+
+    /* "nonaga_mcts.pyx":338
+ *             else:
+ *                 play_tile_move(position, self.pool.move[child])
+ *             found = self._find_node(child, position, target, plies - 1)             # <<<<<<<<<<<<<<
+ *             if piece_phase:
+ *                 undo_piece_move(position, self.pool.move[child])
+*/
+    __pyx_v_found = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_find_node(__pyx_v_self, __pyx_v_child, __pyx_v_position, __pyx_v_target, (__pyx_v_plies - 1));
+
+    /* "nonaga_mcts.pyx":339
+ *                 play_tile_move(position, self.pool.move[child])
+ *             found = self._find_node(child, position, target, plies - 1)
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 undo_piece_move(position, self.pool.move[child])
+ *             else:
+*/
+    if (__pyx_v_piece_phase) {
+
+      /* "nonaga_mcts.pyx":340
+ *             found = self._find_node(child, position, target, plies - 1)
+ *             if piece_phase:
+ *                 undo_piece_move(position, self.pool.move[child])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 undo_tile_move(position, self.pool.move[child])
+*/
+      __pyx_f_15nonaga_position_undo_piece_move(__pyx_v_position, (__pyx_v_self->pool.move[__pyx_v_child]));
+
+      /* "nonaga_mcts.pyx":339
+ *                 play_tile_move(position, self.pool.move[child])
+ *             found = self._find_node(child, position, target, plies - 1)
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 undo_piece_move(position, self.pool.move[child])
+ *             else:
+*/
+      goto __pyx_L10;
+    }
+
+    /* "nonaga_mcts.pyx":342
+ *                 undo_piece_move(position, self.pool.move[child])
+ *             else:
+ *                 undo_tile_move(position, self.pool.move[child])             # <<<<<<<<<<<<<<
+ *             if found >= 0:
+ *                 return found
+*/
+    /*else*/ {
+      __pyx_f_15nonaga_position_undo_tile_move(__pyx_v_position, (__pyx_v_self->pool.move[__pyx_v_child]));
+    }
+    __pyx_L10:;
+
+    /* "nonaga_mcts.pyx":343
+ *             else:
+ *                 undo_tile_move(position, self.pool.move[child])
+ *             if found >= 0:             # <<<<<<<<<<<<<<
+ *                 return found
+ *         return -1
+*/
+    __pyx_t_1 = (__pyx_v_found >= 0);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":344
+ *                 undo_tile_move(position, self.pool.move[child])
+ *             if found >= 0:
+ *                 return found             # <<<<<<<<<<<<<<
+ *         return -1
+ * 
+*/
+      __pyx_r = __pyx_v_found;
+      goto __pyx_L0;
+
+      /* "nonaga_mcts.pyx":343
+ *             else:
+ *                 undo_tile_move(position, self.pool.move[child])
+ *             if found >= 0:             # <<<<<<<<<<<<<<
+ *                 return found
+ *         return -1
+*/
+    }
+  }
+
+  /* "nonaga_mcts.pyx":345
+ *             if found >= 0:
+ *                 return found
+ *         return -1             # <<<<<<<<<<<<<<
+ * 
+ *     cdef void _reroot(self, int node) except *:
+*/
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":324
+ * 
+ *     #  tree reuse
+ *     cdef int _find_node(self, int node, Position* position, const Position* target, int plies) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Node of the subtree whose position is *target*, at most *plies* moves below, -1 if none."""
+ *         cdef int child, found
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":347
+ *         return -1
+ * 
+ *     cdef void _reroot(self, int node) except *:             # <<<<<<<<<<<<<<
+ *         """Replace the tree by the subtree of *node*, copied breadth first into a new pool."""
+ *         cdef NodePool* old = &self.pool
+*/
+
+static void __pyx_f_11nonaga_mcts_4MCTS__reroot(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node) {
+  struct __pyx_t_11nonaga_mcts_NodePool *__pyx_v_old;
+  struct __pyx_t_11nonaga_mcts_NodePool __pyx_v_new;
+  int *__pyx_v_queue;
+  int __pyx_v_head;
+  int __pyx_v_tail;
+  int __pyx_v_source;
+  int __pyx_v_target;
+  int __pyx_v_first;
+  int __pyx_v_i;
+  int __pyx_v_n;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+
+  /* "nonaga_mcts.pyx":349
+ *     cdef void _reroot(self, int node) except *:
+ *         """Replace the tree by the subtree of *node*, copied breadth first into a new pool."""
+ *         cdef NodePool* old = &self.pool             # <<<<<<<<<<<<<<
+ *         cdef NodePool new
+ *         cdef int* queue = <int*>malloc(2 * old.size * sizeof(int))
+*/
+  __pyx_v_old = (&__pyx_v_self->pool);
+
+  /* "nonaga_mcts.pyx":351
+ *         cdef NodePool* old = &self.pool
+ *         cdef NodePool new
+ *         cdef int* queue = <int*>malloc(2 * old.size * sizeof(int))             # <<<<<<<<<<<<<<
+ *         cdef int head = 0, tail = 2, source, target, first, i, n
+ *         memset(&new, 0, sizeof(NodePool))
+*/
+  __pyx_v_queue = ((int *)malloc(((2 * __pyx_v_old->size) * (sizeof(int)))));
+
+  /* "nonaga_mcts.pyx":352
+ *         cdef NodePool new
+ *         cdef int* queue = <int*>malloc(2 * old.size * sizeof(int))
+ *         cdef int head = 0, tail = 2, source, target, first, i, n             # <<<<<<<<<<<<<<
+ *         memset(&new, 0, sizeof(NodePool))
+ *         if queue == NULL or pool_allocate(&new, 1) < 0:
+*/
+  __pyx_v_head = 0;
+  __pyx_v_tail = 2;
+
+  /* "nonaga_mcts.pyx":353
+ *         cdef int* queue = <int*>malloc(2 * old.size * sizeof(int))
+ *         cdef int head = 0, tail = 2, source, target, first, i, n
+ *         memset(&new, 0, sizeof(NodePool))             # <<<<<<<<<<<<<<
+ *         if queue == NULL or pool_allocate(&new, 1) < 0:
+ *             free(queue)
+*/
+  (void)(memset((&__pyx_v_new), 0, (sizeof(struct __pyx_t_11nonaga_mcts_NodePool))));
+
+  /* "nonaga_mcts.pyx":354
+ *         cdef int head = 0, tail = 2, source, target, first, i, n
+ *         memset(&new, 0, sizeof(NodePool))
+ *         if queue == NULL or pool_allocate(&new, 1) < 0:             # <<<<<<<<<<<<<<
+ *             free(queue)
+ *             pool_free(&new)
+*/
+  __pyx_t_2 = (__pyx_v_queue == NULL);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_f_11nonaga_mcts_pool_allocate((&__pyx_v_new), 1) < 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_1)) {
+
+    /* "nonaga_mcts.pyx":355
+ *         memset(&new, 0, sizeof(NodePool))
+ *         if queue == NULL or pool_allocate(&new, 1) < 0:
+ *             free(queue)             # <<<<<<<<<<<<<<
+ *             pool_free(&new)
+ *             raise MemoryError()
+*/
+    free(__pyx_v_queue);
+
+    /* "nonaga_mcts.pyx":356
+ *         if queue == NULL or pool_allocate(&new, 1) < 0:
+ *             free(queue)
+ *             pool_free(&new)             # <<<<<<<<<<<<<<
+ *             raise MemoryError()
+ *         queue[0] = node
+*/
+    __pyx_f_11nonaga_mcts_pool_free((&__pyx_v_new));
+
+    /* "nonaga_mcts.pyx":357
+ *             free(queue)
+ *             pool_free(&new)
+ *             raise MemoryError()             # <<<<<<<<<<<<<<
+ *         queue[0] = node
+ *         queue[1] = 0
+*/
+    PyErr_NoMemory(); __PYX_ERR(0, 357, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":354
+ *         cdef int head = 0, tail = 2, source, target, first, i, n
+ *         memset(&new, 0, sizeof(NodePool))
+ *         if queue == NULL or pool_allocate(&new, 1) < 0:             # <<<<<<<<<<<<<<
+ *             free(queue)
+ *             pool_free(&new)
+*/
+  }
+
+  /* "nonaga_mcts.pyx":358
+ *             pool_free(&new)
+ *             raise MemoryError()
+ *         queue[0] = node             # <<<<<<<<<<<<<<
+ *         queue[1] = 0
+ *         while head < tail:
+*/
+  (__pyx_v_queue[0]) = __pyx_v_node;
+
+  /* "nonaga_mcts.pyx":359
+ *             raise MemoryError()
+ *         queue[0] = node
+ *         queue[1] = 0             # <<<<<<<<<<<<<<
+ *         while head < tail:
+ *             source = queue[head]
+*/
+  (__pyx_v_queue[1]) = 0;
+
+  /* "nonaga_mcts.pyx":360
+ *         queue[0] = node
+ *         queue[1] = 0
+ *         while head < tail:             # <<<<<<<<<<<<<<
+ *             source = queue[head]
+ *             target = queue[head + 1]
+*/
+  while (1) {
+    __pyx_t_1 = (__pyx_v_head < __pyx_v_tail);
+    if (!__pyx_t_1) break;
+
+    /* "nonaga_mcts.pyx":361
+ *         queue[1] = 0
+ *         while head < tail:
+ *             source = queue[head]             # <<<<<<<<<<<<<<
+ *             target = queue[head + 1]
+ *             head += 2
+*/
+    __pyx_v_source = (__pyx_v_queue[__pyx_v_head]);
+
+    /* "nonaga_mcts.pyx":362
+ *         while head < tail:
+ *             source = queue[head]
+ *             target = queue[head + 1]             # <<<<<<<<<<<<<<
+ *             head += 2
+ *             new.move[target] = old.move[source]
+*/
+    __pyx_v_target = (__pyx_v_queue[(__pyx_v_head + 1)]);
+
+    /* "nonaga_mcts.pyx":363
+ *             source = queue[head]
+ *             target = queue[head + 1]
+ *             head += 2             # <<<<<<<<<<<<<<
+ *             new.move[target] = old.move[source]
+ *             new.visits[target] = old.visits[source]
+*/
+    __pyx_v_head = (__pyx_v_head + 2);
+
+    /* "nonaga_mcts.pyx":364
+ *             target = queue[head + 1]
+ *             head += 2
+ *             new.move[target] = old.move[source]             # <<<<<<<<<<<<<<
+ *             new.visits[target] = old.visits[source]
+ *             new.value[target] = old.value[source]
+*/
+    (__pyx_v_new.move[__pyx_v_target]) = (__pyx_v_old->move[__pyx_v_source]);
+
+    /* "nonaga_mcts.pyx":365
+ *             head += 2
+ *             new.move[target] = old.move[source]
+ *             new.visits[target] = old.visits[source]             # <<<<<<<<<<<<<<
+ *             new.value[target] = old.value[source]
+ *             new.mover[target] = old.mover[source]
+*/
+    (__pyx_v_new.visits[__pyx_v_target]) = (__pyx_v_old->visits[__pyx_v_source]);
+
+    /* "nonaga_mcts.pyx":366
+ *             new.move[target] = old.move[source]
+ *             new.visits[target] = old.visits[source]
+ *             new.value[target] = old.value[source]             # <<<<<<<<<<<<<<
+ *             new.mover[target] = old.mover[source]
+ *             new.winner[target] = old.winner[source]
+*/
+    (__pyx_v_new.value[__pyx_v_target]) = (__pyx_v_old->value[__pyx_v_source]);
+
+    /* "nonaga_mcts.pyx":367
+ *             new.visits[target] = old.visits[source]
+ *             new.value[target] = old.value[source]
+ *             new.mover[target] = old.mover[source]             # <<<<<<<<<<<<<<
+ *             new.winner[target] = old.winner[source]
+ *             n = old.num_children[source]
+*/
+    (__pyx_v_new.mover[__pyx_v_target]) = (__pyx_v_old->mover[__pyx_v_source]);
+
+    /* "nonaga_mcts.pyx":368
+ *             new.value[target] = old.value[source]
+ *             new.mover[target] = old.mover[source]
+ *             new.winner[target] = old.winner[source]             # <<<<<<<<<<<<<<
+ *             n = old.num_children[source]
+ *             new.num_children[target] = n
+*/
+    (__pyx_v_new.winner[__pyx_v_target]) = (__pyx_v_old->winner[__pyx_v_source]);
+
+    /* "nonaga_mcts.pyx":369
+ *             new.mover[target] = old.mover[source]
+ *             new.winner[target] = old.winner[source]
+ *             n = old.num_children[source]             # <<<<<<<<<<<<<<
+ *             new.num_children[target] = n
+ *             if n <= 0:
+*/
+    __pyx_v_n = (__pyx_v_old->num_children[__pyx_v_source]);
+
+    /* "nonaga_mcts.pyx":370
+ *             new.winner[target] = old.winner[source]
+ *             n = old.num_children[source]
+ *             new.num_children[target] = n             # <<<<<<<<<<<<<<
+ *             if n <= 0:
+ *                 continue
+*/
+    (__pyx_v_new.num_children[__pyx_v_target]) = __pyx_v_n;
+
+    /* "nonaga_mcts.pyx":371
+ *             n = old.num_children[source]
+ *             new.num_children[target] = n
+ *             if n <= 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             first = pool_allocate(&new, n)
+*/
+    __pyx_t_1 = (__pyx_v_n <= 0);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":372
+ *             new.num_children[target] = n
+ *             if n <= 0:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             first = pool_allocate(&new, n)
+ *             if first < 0:
+*/
+      goto __pyx_L6_continue;
+
+      /* "nonaga_mcts.pyx":371
+ *             n = old.num_children[source]
+ *             new.num_children[target] = n
+ *             if n <= 0:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             first = pool_allocate(&new, n)
+*/
+    }
+
+    /* "nonaga_mcts.pyx":373
+ *             if n <= 0:
+ *                 continue
+ *             first = pool_allocate(&new, n)             # <<<<<<<<<<<<<<
+ *             if first < 0:
+ *                 free(queue)
+*/
+    __pyx_v_first = __pyx_f_11nonaga_mcts_pool_allocate((&__pyx_v_new), __pyx_v_n);
+
+    /* "nonaga_mcts.pyx":374
+ *                 continue
+ *             first = pool_allocate(&new, n)
+ *             if first < 0:             # <<<<<<<<<<<<<<
+ *                 free(queue)
+ *                 pool_free(&new)
+*/
+    __pyx_t_1 = (__pyx_v_first < 0);
+    if (unlikely(__pyx_t_1)) {
+
+      /* "nonaga_mcts.pyx":375
+ *             first = pool_allocate(&new, n)
+ *             if first < 0:
+ *                 free(queue)             # <<<<<<<<<<<<<<
+ *                 pool_free(&new)
+ *                 raise MemoryError()
+*/
+      free(__pyx_v_queue);
+
+      /* "nonaga_mcts.pyx":376
+ *             if first < 0:
+ *                 free(queue)
+ *                 pool_free(&new)             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             new.first_child[target] = first
+*/
+      __pyx_f_11nonaga_mcts_pool_free((&__pyx_v_new));
+
+      /* "nonaga_mcts.pyx":377
+ *                 free(queue)
+ *                 pool_free(&new)
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *             new.first_child[target] = first
+ *             for i in range(n):
+*/
+      PyErr_NoMemory(); __PYX_ERR(0, 377, __pyx_L1_error)
+
+      /* "nonaga_mcts.pyx":374
+ *                 continue
+ *             first = pool_allocate(&new, n)
+ *             if first < 0:             # <<<<<<<<<<<<<<
+ *                 free(queue)
+ *                 pool_free(&new)
+*/
+    }
+
+    /* "nonaga_mcts.pyx":378
+ *                 pool_free(&new)
+ *                 raise MemoryError()
+ *             new.first_child[target] = first             # <<<<<<<<<<<<<<
+ *             for i in range(n):
+ *                 new.parent[first + i] = target
+*/
+    (__pyx_v_new.first_child[__pyx_v_target]) = __pyx_v_first;
+
+    /* "nonaga_mcts.pyx":379
+ *                 raise MemoryError()
+ *             new.first_child[target] = first
+ *             for i in range(n):             # <<<<<<<<<<<<<<
+ *                 new.parent[first + i] = target
+ *                 queue[tail] = old.first_child[source] + i
+*/
+    __pyx_t_3 = __pyx_v_n;
+    __pyx_t_4 = __pyx_t_3;
+    for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_i = __pyx_t_5;
+
+      /* "nonaga_mcts.pyx":380
+ *             new.first_child[target] = first
+ *             for i in range(n):
+ *                 new.parent[first + i] = target             # <<<<<<<<<<<<<<
+ *                 queue[tail] = old.first_child[source] + i
+ *                 queue[tail + 1] = first + i
+*/
+      (__pyx_v_new.parent[(__pyx_v_first + __pyx_v_i)]) = __pyx_v_target;
+
+      /* "nonaga_mcts.pyx":381
+ *             for i in range(n):
+ *                 new.parent[first + i] = target
+ *                 queue[tail] = old.first_child[source] + i             # <<<<<<<<<<<<<<
+ *                 queue[tail + 1] = first + i
+ *                 tail += 2
+*/
+      (__pyx_v_queue[__pyx_v_tail]) = ((__pyx_v_old->first_child[__pyx_v_source]) + __pyx_v_i);
+
+      /* "nonaga_mcts.pyx":382
+ *                 new.parent[first + i] = target
+ *                 queue[tail] = old.first_child[source] + i
+ *                 queue[tail + 1] = first + i             # <<<<<<<<<<<<<<
+ *                 tail += 2
+ *         free(queue)
+*/
+      (__pyx_v_queue[(__pyx_v_tail + 1)]) = (__pyx_v_first + __pyx_v_i);
+
+      /* "nonaga_mcts.pyx":383
+ *                 queue[tail] = old.first_child[source] + i
+ *                 queue[tail + 1] = first + i
+ *                 tail += 2             # <<<<<<<<<<<<<<
+ *         free(queue)
+ *         pool_free(old)
+*/
+      __pyx_v_tail = (__pyx_v_tail + 2);
+    }
+    __pyx_L6_continue:;
+  }
+
+  /* "nonaga_mcts.pyx":384
+ *                 queue[tail + 1] = first + i
+ *                 tail += 2
+ *         free(queue)             # <<<<<<<<<<<<<<
+ *         pool_free(old)
+ *         self.pool = new
+*/
+  free(__pyx_v_queue);
+
+  /* "nonaga_mcts.pyx":385
+ *                 tail += 2
+ *         free(queue)
+ *         pool_free(old)             # <<<<<<<<<<<<<<
+ *         self.pool = new
+ * 
+*/
+  __pyx_f_11nonaga_mcts_pool_free(__pyx_v_old);
+
+  /* "nonaga_mcts.pyx":386
+ *         free(queue)
+ *         pool_free(old)
+ *         self.pool = new             # <<<<<<<<<<<<<<
+ * 
+ *     #  move choice
+*/
+  __pyx_v_self->pool = __pyx_v_new;
+
+  /* "nonaga_mcts.pyx":347
+ *         return -1
+ * 
+ *     cdef void _reroot(self, int node) except *:             # <<<<<<<<<<<<<<
+ *         """Replace the tree by the subtree of *node*, copied breadth first into a new pool."""
+ *         cdef NodePool* old = &self.pool
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS._reroot", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+}
+
+/* "nonaga_mcts.pyx":389
+ * 
+ *     #  move choice
+ *     cdef int _best_move(self, int node, Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Winning or most visited move of a node, -1 if there is none.
+ * 
+*/
+
+static int __pyx_f_11nonaga_mcts_4MCTS__best_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, struct __pyx_t_15nonaga_position_Position *__pyx_v_position) {
+  int __pyx_v_moves[__pyx_e_15nonaga_position_MAX_TILE_MOVES];
+  int __pyx_v_best;
+  int __pyx_v_child;
+  int __pyx_v_count;
+  int __pyx_v_k;
+  int __pyx_v_cost;
+  int __pyx_v_best_cost;
+  int __pyx_v_player;
+  int __pyx_v_piece_phase;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":397
+ *         """
+ *         cdef int moves[MAX_TILE_MOVES]
+ *         cdef int best = -1, child, count, k, cost, best_cost = 0, player = position.current_player             # <<<<<<<<<<<<<<
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         if node >= 0 and self.pool.num_children[node] > 0:
+*/
+  __pyx_v_best = -1;
+  __pyx_v_best_cost = 0;
+  __pyx_t_1 = __pyx_v_position->current_player;
+  __pyx_v_player = __pyx_t_1;
+
+  /* "nonaga_mcts.pyx":398
+ *         cdef int moves[MAX_TILE_MOVES]
+ *         cdef int best = -1, child, count, k, cost, best_cost = 0, player = position.current_player
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ *         if node >= 0 and self.pool.num_children[node] > 0:
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+*/
+  __pyx_v_piece_phase = (__pyx_v_position->turn_phase == __pyx_v_11nonaga_mcts__PIECE_TO_MOVE);
+
+  /* "nonaga_mcts.pyx":399
+ *         cdef int best = -1, child, count, k, cost, best_cost = 0, player = position.current_player
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         if node >= 0 and self.pool.num_children[node] > 0:             # <<<<<<<<<<<<<<
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *                 if self.pool.winner[child] == self.pool.mover[child]:
+*/
+  __pyx_t_3 = (__pyx_v_node >= 0);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_3 = ((__pyx_v_self->pool.num_children[__pyx_v_node]) > 0);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_2) {
+
+    /* "nonaga_mcts.pyx":400
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         if node >= 0 and self.pool.num_children[node] > 0:
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):             # <<<<<<<<<<<<<<
+ *                 if self.pool.winner[child] == self.pool.mover[child]:
+ *                     return self.pool.move[child]
+*/
+    __pyx_t_1 = ((__pyx_v_self->pool.first_child[__pyx_v_node]) + (__pyx_v_self->pool.num_children[__pyx_v_node]));
+    __pyx_t_4 = __pyx_t_1;
+    for (__pyx_t_5 = (__pyx_v_self->pool.first_child[__pyx_v_node]); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+      __pyx_v_child = __pyx_t_5;
+
+      /* "nonaga_mcts.pyx":401
+ *         if node >= 0 and self.pool.num_children[node] > 0:
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *                 if self.pool.winner[child] == self.pool.mover[child]:             # <<<<<<<<<<<<<<
+ *                     return self.pool.move[child]
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+*/
+      __pyx_t_2 = ((__pyx_v_self->pool.winner[__pyx_v_child]) == (__pyx_v_self->pool.mover[__pyx_v_child]));
+      if (__pyx_t_2) {
+
+        /* "nonaga_mcts.pyx":402
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *                 if self.pool.winner[child] == self.pool.mover[child]:
+ *                     return self.pool.move[child]             # <<<<<<<<<<<<<<
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+ *                     best = child
+*/
+        __pyx_r = (__pyx_v_self->pool.move[__pyx_v_child]);
+        goto __pyx_L0;
+
+        /* "nonaga_mcts.pyx":401
+ *         if node >= 0 and self.pool.num_children[node] > 0:
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *                 if self.pool.winner[child] == self.pool.mover[child]:             # <<<<<<<<<<<<<<
+ *                     return self.pool.move[child]
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+*/
+      }
+
+      /* "nonaga_mcts.pyx":403
+ *                 if self.pool.winner[child] == self.pool.mover[child]:
+ *                     return self.pool.move[child]
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):             # <<<<<<<<<<<<<<
+ *                     best = child
+ *             if best >= 0:
+*/
+      __pyx_t_3 = ((__pyx_v_self->pool.winner[__pyx_v_child]) < 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_3 = ((__pyx_v_self->pool.visits[__pyx_v_child]) > 0);
+      if (__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_3 = (__pyx_v_best < 0);
+      if (!__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L10_bool_binop_done;
+      }
+      __pyx_t_3 = ((__pyx_v_self->pool.visits[__pyx_v_child]) > (__pyx_v_self->pool.visits[__pyx_v_best]));
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L10_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "nonaga_mcts.pyx":404
+ *                     return self.pool.move[child]
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+ *                     best = child             # <<<<<<<<<<<<<<
+ *             if best >= 0:
+ *                 return self.pool.move[best]
+*/
+        __pyx_v_best = __pyx_v_child;
+
+        /* "nonaga_mcts.pyx":403
+ *                 if self.pool.winner[child] == self.pool.mover[child]:
+ *                     return self.pool.move[child]
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):             # <<<<<<<<<<<<<<
+ *                     best = child
+ *             if best >= 0:
+*/
+      }
+    }
+
+    /* "nonaga_mcts.pyx":405
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+ *                     best = child
+ *             if best >= 0:             # <<<<<<<<<<<<<<
+ *                 return self.pool.move[best]
+ * 
+*/
+    __pyx_t_2 = (__pyx_v_best >= 0);
+    if (__pyx_t_2) {
+
+      /* "nonaga_mcts.pyx":406
+ *                     best = child
+ *             if best >= 0:
+ *                 return self.pool.move[best]             # <<<<<<<<<<<<<<
+ * 
+ *         if piece_phase:
+*/
+      __pyx_r = (__pyx_v_self->pool.move[__pyx_v_best]);
+      goto __pyx_L0;
+
+      /* "nonaga_mcts.pyx":405
+ *                 if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+ *                     best = child
+ *             if best >= 0:             # <<<<<<<<<<<<<<
+ *                 return self.pool.move[best]
+ * 
+*/
+    }
+
+    /* "nonaga_mcts.pyx":399
+ *         cdef int best = -1, child, count, k, cost, best_cost = 0, player = position.current_player
+ *         cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+ *         if node >= 0 and self.pool.num_children[node] > 0:             # <<<<<<<<<<<<<<
+ *             for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *                 if self.pool.winner[child] == self.pool.mover[child]:
+*/
+  }
+
+  /* "nonaga_mcts.pyx":408
+ *                 return self.pool.move[best]
+ * 
+ *         if piece_phase:             # <<<<<<<<<<<<<<
+ *             count = fill_position_piece_moves(position, moves)
+ *         else:
+*/
+  if (__pyx_v_piece_phase) {
+
+    /* "nonaga_mcts.pyx":409
+ * 
+ *         if piece_phase:
+ *             count = fill_position_piece_moves(position, moves)             # <<<<<<<<<<<<<<
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)
+*/
+    __pyx_v_count = __pyx_f_15nonaga_position_fill_position_piece_moves(__pyx_v_position, __pyx_v_moves);
+
+    /* "nonaga_mcts.pyx":408
+ *                 return self.pool.move[best]
+ * 
+ *         if piece_phase:             # <<<<<<<<<<<<<<
+ *             count = fill_position_piece_moves(position, moves)
+ *         else:
+*/
+    goto __pyx_L15;
+  }
+
+  /* "nonaga_mcts.pyx":411
+ *             count = fill_position_piece_moves(position, moves)
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)             # <<<<<<<<<<<<<<
+ *         for k in range(count):
+ *             if piece_phase:
+*/
+  /*else*/ {
+    __pyx_v_count = __pyx_f_15nonaga_position_fill_position_tile_moves(__pyx_v_position, __pyx_v_moves);
+  }
+  __pyx_L15:;
+
+  /* "nonaga_mcts.pyx":412
+ *         else:
+ *             count = fill_position_tile_moves(position, moves)
+ *         for k in range(count):             # <<<<<<<<<<<<<<
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[k])
+*/
+  __pyx_t_1 = __pyx_v_count;
+  __pyx_t_4 = __pyx_t_1;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_k = __pyx_t_5;
+
+    /* "nonaga_mcts.pyx":413
+ *             count = fill_position_tile_moves(position, moves)
+ *         for k in range(count):
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)
+*/
+    if (__pyx_v_piece_phase) {
+
+      /* "nonaga_mcts.pyx":414
+ *         for k in range(count):
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *                 cost = position_cost(position, player, self.params)
+ *                 if position_won(position, player):
+*/
+      __pyx_f_15nonaga_position_play_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+
+      /* "nonaga_mcts.pyx":415
+ *             if piece_phase:
+ *                 play_piece_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)             # <<<<<<<<<<<<<<
+ *                 if position_won(position, player):
+ *                     undo_piece_move(position, moves[k])
+*/
+      __pyx_v_cost = __pyx_f_15nonaga_position_position_cost(__pyx_v_position, __pyx_v_player, __pyx_v_self->params);
+
+      /* "nonaga_mcts.pyx":416
+ *                 play_piece_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)
+ *                 if position_won(position, player):             # <<<<<<<<<<<<<<
+ *                     undo_piece_move(position, moves[k])
+ *                     return moves[k]
+*/
+      __pyx_t_2 = __pyx_f_15nonaga_position_position_won(__pyx_v_position, __pyx_v_player);
+      if (__pyx_t_2) {
+
+        /* "nonaga_mcts.pyx":417
+ *                 cost = position_cost(position, player, self.params)
+ *                 if position_won(position, player):
+ *                     undo_piece_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *                     return moves[k]
+ *                 undo_piece_move(position, moves[k])
+*/
+        __pyx_f_15nonaga_position_undo_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+
+        /* "nonaga_mcts.pyx":418
+ *                 if position_won(position, player):
+ *                     undo_piece_move(position, moves[k])
+ *                     return moves[k]             # <<<<<<<<<<<<<<
+ *                 undo_piece_move(position, moves[k])
+ *             else:
+*/
+        __pyx_r = (__pyx_v_moves[__pyx_v_k]);
+        goto __pyx_L0;
+
+        /* "nonaga_mcts.pyx":416
+ *                 play_piece_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)
+ *                 if position_won(position, player):             # <<<<<<<<<<<<<<
+ *                     undo_piece_move(position, moves[k])
+ *                     return moves[k]
+*/
+      }
+
+      /* "nonaga_mcts.pyx":419
+ *                     undo_piece_move(position, moves[k])
+ *                     return moves[k]
+ *                 undo_piece_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *             else:
+ *                 play_tile_move(position, moves[k])
+*/
+      __pyx_f_15nonaga_position_undo_piece_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+
+      /* "nonaga_mcts.pyx":413
+ *             count = fill_position_tile_moves(position, moves)
+ *         for k in range(count):
+ *             if piece_phase:             # <<<<<<<<<<<<<<
+ *                 play_piece_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)
+*/
+      goto __pyx_L18;
+    }
+
+    /* "nonaga_mcts.pyx":421
+ *                 undo_piece_move(position, moves[k])
+ *             else:
+ *                 play_tile_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *                 cost = position_cost(position, player, self.params)
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+*/
+    /*else*/ {
+      __pyx_f_15nonaga_position_play_tile_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+
+      /* "nonaga_mcts.pyx":422
+ *             else:
+ *                 play_tile_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)             # <<<<<<<<<<<<<<
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+ *                     cost = LOST_COST
+*/
+      __pyx_v_cost = __pyx_f_15nonaga_position_position_cost(__pyx_v_position, __pyx_v_player, __pyx_v_self->params);
+
+      /* "nonaga_mcts.pyx":423
+ *                 play_tile_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)
+ *                 if find_winning_slide(position, position.current_player) >= 0:             # <<<<<<<<<<<<<<
+ *                     cost = LOST_COST
+ *                 undo_tile_move(position, moves[k])
+*/
+      __pyx_t_2 = (__pyx_f_15nonaga_position_find_winning_slide(__pyx_v_position, __pyx_v_position->current_player) >= 0);
+      if (__pyx_t_2) {
+
+        /* "nonaga_mcts.pyx":424
+ *                 cost = position_cost(position, player, self.params)
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+ *                     cost = LOST_COST             # <<<<<<<<<<<<<<
+ *                 undo_tile_move(position, moves[k])
+ *             if best < 0 or cost > best_cost:
+*/
+        __pyx_v_cost = __pyx_e_11nonaga_mcts_LOST_COST;
+
+        /* "nonaga_mcts.pyx":423
+ *                 play_tile_move(position, moves[k])
+ *                 cost = position_cost(position, player, self.params)
+ *                 if find_winning_slide(position, position.current_player) >= 0:             # <<<<<<<<<<<<<<
+ *                     cost = LOST_COST
+ *                 undo_tile_move(position, moves[k])
+*/
+      }
+
+      /* "nonaga_mcts.pyx":425
+ *                 if find_winning_slide(position, position.current_player) >= 0:
+ *                     cost = LOST_COST
+ *                 undo_tile_move(position, moves[k])             # <<<<<<<<<<<<<<
+ *             if best < 0 or cost > best_cost:
+ *                 best = moves[k]
+*/
+      __pyx_f_15nonaga_position_undo_tile_move(__pyx_v_position, (__pyx_v_moves[__pyx_v_k]));
+    }
+    __pyx_L18:;
+
+    /* "nonaga_mcts.pyx":426
+ *                     cost = LOST_COST
+ *                 undo_tile_move(position, moves[k])
+ *             if best < 0 or cost > best_cost:             # <<<<<<<<<<<<<<
+ *                 best = moves[k]
+ *                 best_cost = cost
+*/
+    __pyx_t_3 = (__pyx_v_best < 0);
+    if (!__pyx_t_3) {
+    } else {
+      __pyx_t_2 = __pyx_t_3;
+      goto __pyx_L22_bool_binop_done;
+    }
+    __pyx_t_3 = (__pyx_v_cost > __pyx_v_best_cost);
+    __pyx_t_2 = __pyx_t_3;
+    __pyx_L22_bool_binop_done:;
+    if (__pyx_t_2) {
+
+      /* "nonaga_mcts.pyx":427
+ *                 undo_tile_move(position, moves[k])
+ *             if best < 0 or cost > best_cost:
+ *                 best = moves[k]             # <<<<<<<<<<<<<<
+ *                 best_cost = cost
+ *         return best
+*/
+      __pyx_v_best = (__pyx_v_moves[__pyx_v_k]);
+
+      /* "nonaga_mcts.pyx":428
+ *             if best < 0 or cost > best_cost:
+ *                 best = moves[k]
+ *                 best_cost = cost             # <<<<<<<<<<<<<<
+ *         return best
+ * 
+*/
+      __pyx_v_best_cost = __pyx_v_cost;
+
+      /* "nonaga_mcts.pyx":426
+ *                     cost = LOST_COST
+ *                 undo_tile_move(position, moves[k])
+ *             if best < 0 or cost > best_cost:             # <<<<<<<<<<<<<<
+ *                 best = moves[k]
+ *                 best_cost = cost
+*/
+    }
+  }
+
+  /* "nonaga_mcts.pyx":429
+ *                 best = moves[k]
+ *                 best_cost = cost
+ *         return best             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int _child_with_move(self, int node, int move) noexcept nogil:
+*/
+  __pyx_r = __pyx_v_best;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":389
+ * 
+ *     #  move choice
+ *     cdef int _best_move(self, int node, Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         """Winning or most visited move of a node, -1 if there is none.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":431
+ *         return best
+ * 
+ *     cdef int _child_with_move(self, int node, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         cdef int child
+ *         if node < 0 or self.pool.num_children[node] <= 0:
+*/
+
+static int __pyx_f_11nonaga_mcts_4MCTS__child_with_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, int __pyx_v_node, int __pyx_v_move) {
+  int __pyx_v_child;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":433
+ *     cdef int _child_with_move(self, int node, int move) noexcept nogil:
+ *         cdef int child
+ *         if node < 0 or self.pool.num_children[node] <= 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+*/
+  __pyx_t_2 = (__pyx_v_node < 0);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = ((__pyx_v_self->pool.num_children[__pyx_v_node]) <= 0);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nonaga_mcts.pyx":434
+ *         cdef int child
+ *         if node < 0 or self.pool.num_children[node] <= 0:
+ *             return -1             # <<<<<<<<<<<<<<
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if self.pool.move[child] == move:
+*/
+    __pyx_r = -1;
+    goto __pyx_L0;
+
+    /* "nonaga_mcts.pyx":433
+ *     cdef int _child_with_move(self, int node, int move) noexcept nogil:
+ *         cdef int child
+ *         if node < 0 or self.pool.num_children[node] <= 0:             # <<<<<<<<<<<<<<
+ *             return -1
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+*/
+  }
+
+  /* "nonaga_mcts.pyx":435
+ *         if node < 0 or self.pool.num_children[node] <= 0:
+ *             return -1
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):             # <<<<<<<<<<<<<<
+ *             if self.pool.move[child] == move:
+ *                 return child
+*/
+  __pyx_t_3 = ((__pyx_v_self->pool.first_child[__pyx_v_node]) + (__pyx_v_self->pool.num_children[__pyx_v_node]));
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = (__pyx_v_self->pool.first_child[__pyx_v_node]); __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_child = __pyx_t_5;
+
+    /* "nonaga_mcts.pyx":436
+ *             return -1
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if self.pool.move[child] == move:             # <<<<<<<<<<<<<<
+ *                 return child
+ *         return -1
+*/
+    __pyx_t_1 = ((__pyx_v_self->pool.move[__pyx_v_child]) == __pyx_v_move);
+    if (__pyx_t_1) {
+
+      /* "nonaga_mcts.pyx":437
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if self.pool.move[child] == move:
+ *                 return child             # <<<<<<<<<<<<<<
+ *         return -1
+ * 
+*/
+      __pyx_r = __pyx_v_child;
+      goto __pyx_L0;
+
+      /* "nonaga_mcts.pyx":436
+ *             return -1
+ *         for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+ *             if self.pool.move[child] == move:             # <<<<<<<<<<<<<<
+ *                 return child
+ *         return -1
+*/
+    }
+  }
+
+  /* "nonaga_mcts.pyx":438
+ *             if self.pool.move[child] == move:
+ *                 return child
+ *         return -1             # <<<<<<<<<<<<<<
+ * 
+ *     #  search
+*/
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":431
+ *         return best
+ * 
+ *     cdef int _child_with_move(self, int node, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *         cdef int child
+ *         if node < 0 or self.pool.num_children[node] <= 0:
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":441
+ * 
+ *     #  search
+ *     def _run(self, double deadline, unsigned long long seed):             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long rng = seed | 1
+ *         cdef int k
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_7_run(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_11nonaga_mcts_4MCTS_7_run = {"_run", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_7_run, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_7_run(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  double __pyx_v_deadline;
+  unsigned PY_LONG_LONG __pyx_v_seed;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[2] = {0,0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("_run (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_deadline,&__pyx_mstate_global->__pyx_n_u_seed,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 441, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  2:
+        values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 441, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 441, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "_run", 0) < (0)) __PYX_ERR(0, 441, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 2; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("_run", 1, 2, 2, i); __PYX_ERR(0, 441, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 2)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 441, __pyx_L3_error)
+      values[1] = __Pyx_ArgRef_FASTCALL(__pyx_args, 1);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[1])) __PYX_ERR(0, 441, __pyx_L3_error)
+    }
+    __pyx_v_deadline = __Pyx_PyFloat_AsDouble(values[0]); if (unlikely((__pyx_v_deadline == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 441, __pyx_L3_error)
+    __pyx_v_seed = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(values[1]); if (unlikely((__pyx_v_seed == (unsigned PY_LONG_LONG)-1) && PyErr_Occurred())) __PYX_ERR(0, 441, __pyx_L3_error)
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("_run", 1, 2, 2, __pyx_nargs); __PYX_ERR(0, 441, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("nonaga_mcts.MCTS._run", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_6_run(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), __pyx_v_deadline, __pyx_v_seed);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_6_run(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, double __pyx_v_deadline, unsigned PY_LONG_LONG __pyx_v_seed) {
+  unsigned PY_LONG_LONG __pyx_v_rng;
+  CYTHON_UNUSED int __pyx_v_k;
+  int __pyx_v_running;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  size_t __pyx_t_10;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("_run", 0);
+
+  /* "nonaga_mcts.pyx":442
+ *     #  search
+ *     def _run(self, double deadline, unsigned long long seed):
+ *         cdef unsigned long long rng = seed | 1             # <<<<<<<<<<<<<<
+ *         cdef int k
+ *         cdef bint running = True
+*/
+  __pyx_v_rng = (__pyx_v_seed | 1);
+
+  /* "nonaga_mcts.pyx":444
+ *         cdef unsigned long long rng = seed | 1
+ *         cdef int k
+ *         cdef bint running = True             # <<<<<<<<<<<<<<
+ *         while running:
+ *             with nogil:
+*/
+  __pyx_v_running = 1;
+
+  /* "nonaga_mcts.pyx":445
+ *         cdef int k
+ *         cdef bint running = True
+ *         while running:             # <<<<<<<<<<<<<<
+ *             with nogil:
+ *                 for k in range(BATCH):
+*/
+  while (1) {
+    if (!__pyx_v_running) break;
+
+    /* "nonaga_mcts.pyx":446
+ *         cdef bint running = True
+ *         while running:
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 for k in range(BATCH):
+ *                     if not self._iterate(&rng):
+*/
+    {
+        PyThreadState * _save;
+        _save = PyEval_SaveThread();
+        __Pyx_FastGIL_Remember();
+        /*try:*/ {
+
+          /* "nonaga_mcts.pyx":447
+ *         while running:
+ *             with nogil:
+ *                 for k in range(BATCH):             # <<<<<<<<<<<<<<
+ *                     if not self._iterate(&rng):
+ *                         running = False
+*/
+          __pyx_t_1 = __pyx_e_11nonaga_mcts_BATCH;
+          __pyx_t_2 = __pyx_t_1;
+          for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+            __pyx_v_k = __pyx_t_3;
+
+            /* "nonaga_mcts.pyx":448
+ *             with nogil:
+ *                 for k in range(BATCH):
+ *                     if not self._iterate(&rng):             # <<<<<<<<<<<<<<
+ *                         running = False
+ *                         break
+*/
+            __pyx_t_4 = (!(((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_iterate(__pyx_v_self, (&__pyx_v_rng)) != 0));
+            if (__pyx_t_4) {
+
+              /* "nonaga_mcts.pyx":449
+ *                 for k in range(BATCH):
+ *                     if not self._iterate(&rng):
+ *                         running = False             # <<<<<<<<<<<<<<
+ *                         break
+ *             if deadline and time.perf_counter() >= deadline:
+*/
+              __pyx_v_running = 0;
+
+              /* "nonaga_mcts.pyx":450
+ *                     if not self._iterate(&rng):
+ *                         running = False
+ *                         break             # <<<<<<<<<<<<<<
+ *             if deadline and time.perf_counter() >= deadline:
+ *                 running = False
+*/
+              goto __pyx_L11_break;
+
+              /* "nonaga_mcts.pyx":448
+ *             with nogil:
+ *                 for k in range(BATCH):
+ *                     if not self._iterate(&rng):             # <<<<<<<<<<<<<<
+ *                         running = False
+ *                         break
+*/
+            }
+          }
+          __pyx_L11_break:;
+        }
+
+        /* "nonaga_mcts.pyx":446
+ *         cdef bint running = True
+ *         while running:
+ *             with nogil:             # <<<<<<<<<<<<<<
+ *                 for k in range(BATCH):
+ *                     if not self._iterate(&rng):
+*/
+        /*finally:*/ {
+          /*normal exit:*/{
+            __Pyx_FastGIL_Forget();
+            PyEval_RestoreThread(_save);
+            goto __pyx_L9;
+          }
+          __pyx_L9:;
+        }
+    }
+
+    /* "nonaga_mcts.pyx":451
+ *                         running = False
+ *                         break
+ *             if deadline and time.perf_counter() >= deadline:             # <<<<<<<<<<<<<<
+ *                 running = False
+ * 
+*/
+    __pyx_t_5 = (__pyx_v_deadline != 0);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L14_bool_binop_done;
+    }
+    __pyx_t_7 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_time); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_8);
+    __pyx_t_9 = __Pyx_PyObject_GetAttrStr(__pyx_t_8, __pyx_mstate_global->__pyx_n_u_perf_counter); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __Pyx_DECREF(__pyx_t_8); __pyx_t_8 = 0;
+    __pyx_t_10 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_9))) {
+      __pyx_t_7 = PyMethod_GET_SELF(__pyx_t_9);
+      assert(__pyx_t_7);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_9);
+      __Pyx_INCREF(__pyx_t_7);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_9, __pyx__function);
+      __pyx_t_10 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_7, NULL};
+      __pyx_t_6 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_9, __pyx_callargs+__pyx_t_10, (1-__pyx_t_10) | (__pyx_t_10*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_7); __pyx_t_7 = 0;
+      __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+      if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 451, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_6);
+    }
+    __pyx_t_9 = PyFloat_FromDouble(__pyx_v_deadline); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_9);
+    __pyx_t_7 = PyObject_RichCompare(__pyx_t_6, __pyx_t_9, Py_GE); __Pyx_XGOTREF(__pyx_t_7); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_6); __pyx_t_6 = 0;
+    __Pyx_DECREF(__pyx_t_9); __pyx_t_9 = 0;
+    __pyx_t_5 = __Pyx_PyObject_IsTrue(__pyx_t_7); if (unlikely((__pyx_t_5 < 0))) __PYX_ERR(0, 451, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_7); __pyx_t_7 = 0;
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_L14_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "nonaga_mcts.pyx":452
+ *                         break
+ *             if deadline and time.perf_counter() >= deadline:
+ *                 running = False             # <<<<<<<<<<<<<<
+ * 
+ *     cpdef tuple get_best_move(self, NonagaLogic game_state):
+*/
+      __pyx_v_running = 0;
+
+      /* "nonaga_mcts.pyx":451
+ *                         running = False
+ *                         break
+ *             if deadline and time.perf_counter() >= deadline:             # <<<<<<<<<<<<<<
+ *                 running = False
+ * 
+*/
+    }
+  }
+
+  /* "nonaga_mcts.pyx":441
+ * 
+ *     #  search
+ *     def _run(self, double deadline, unsigned long long seed):             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long rng = seed | 1
+ *         cdef int k
+*/
+
+  /* function exit code */
+  __pyx_r = Py_None; __Pyx_INCREF(Py_None);
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS._run", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pyx":454
+ *                 running = False
+ * 
+ *     cpdef tuple get_best_move(self, NonagaLogic game_state):             # <<<<<<<<<<<<<<
+ *         """Returns the best move for the player to move, searched for time_limit seconds or iterations.
+ * 
+*/
+
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9get_best_move(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyObject *__pyx_f_11nonaga_mcts_4MCTS_get_best_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_obj_12nonaga_logic_NonagaLogic *__pyx_v_game_state, int __pyx_skip_dispatch) {
+  struct __pyx_t_15nonaga_position_Position __pyx_v_position;
+  int __pyx_v_node;
+  int __pyx_v_i;
+  int __pyx_v_move;
+  double __pyx_v_deadline;
+  PyObject *__pyx_v_piece_move = 0;
+  PyObject *__pyx_v_tile_move = 0;
+  PyObject *__pyx_v_workers = NULL;
+  PyObject *__pyx_v_worker = NULL;
+  CYTHON_UNUSED long __pyx_7genexpr__pyx_v__;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  PyObject *__pyx_t_3 = NULL;
+  PyObject *__pyx_t_4 = NULL;
+  size_t __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  double __pyx_t_10;
+  double __pyx_t_11;
+  long __pyx_t_12;
+  long __pyx_t_13;
+  long __pyx_t_14;
+  PyObject *__pyx_t_15 = NULL;
+  PyObject *__pyx_t_16 = NULL;
+  PyObject *__pyx_t_17 = NULL;
+  PyObject *__pyx_t_18 = NULL;
+  PyObject *__pyx_t_19 = NULL;
+  PyObject *__pyx_t_20 = NULL;
+  Py_ssize_t __pyx_t_21;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_best_move", 0);
+  /* Check if called by wrapper */
+  if (unlikely(__pyx_skip_dispatch)) ;
+  /* Check if overridden in Python */
+  else if (
+  #if !CYTHON_USE_TYPE_SLOTS
+  unlikely(Py_TYPE(((PyObject *)__pyx_v_self)) != __pyx_mstate_global->__pyx_ptype_11nonaga_mcts_MCTS &&
+  __Pyx_PyType_HasFeature(Py_TYPE(((PyObject *)__pyx_v_self)), Py_TPFLAGS_HAVE_GC))
+  #else
+  unlikely(Py_TYPE(((PyObject *)__pyx_v_self))->tp_dictoffset != 0 || __Pyx_PyType_HasFeature(Py_TYPE(((PyObject *)__pyx_v_self)), (Py_TPFLAGS_IS_ABSTRACT | Py_TPFLAGS_HEAPTYPE)))
+  #endif
+  ) {
+    #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    static PY_UINT64_T __pyx_tp_dict_version = __PYX_DICT_VERSION_INIT, __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+    if (unlikely(!__Pyx_object_dict_version_matches(((PyObject *)__pyx_v_self), __pyx_tp_dict_version, __pyx_obj_dict_version))) {
+      PY_UINT64_T __pyx_typedict_guard = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      #endif
+      __pyx_t_1 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_get_best_move); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      if (!__Pyx_IsSameCFunction(__pyx_t_1, (void(*)(void)) __pyx_pw_11nonaga_mcts_4MCTS_9get_best_move)) {
+        __Pyx_XDECREF(__pyx_r);
+        __pyx_t_3 = NULL;
+        __Pyx_INCREF(__pyx_t_1);
+        __pyx_t_4 = __pyx_t_1; 
+        __pyx_t_5 = 1;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_4))) {
+          __pyx_t_3 = PyMethod_GET_SELF(__pyx_t_4);
+          assert(__pyx_t_3);
+          PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_4);
+          __Pyx_INCREF(__pyx_t_3);
+          __Pyx_INCREF(__pyx__function);
+          __Pyx_DECREF_SET(__pyx_t_4, __pyx__function);
+          __pyx_t_5 = 0;
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_3, ((PyObject *)__pyx_v_game_state)};
+          __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_4, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 454, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_2);
+        }
+        if (!(likely(PyTuple_CheckExact(__pyx_t_2))||((__pyx_t_2) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_t_2))) __PYX_ERR(0, 454, __pyx_L1_error)
+        __pyx_r = ((PyObject*)__pyx_t_2);
+        __pyx_t_2 = 0;
+        __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+        goto __pyx_L0;
+      }
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+      __pyx_tp_dict_version = __Pyx_get_tp_dict_version(((PyObject *)__pyx_v_self));
+      __pyx_obj_dict_version = __Pyx_get_object_dict_version(((PyObject *)__pyx_v_self));
+      if (unlikely(__pyx_typedict_guard != __pyx_tp_dict_version)) {
+        __pyx_tp_dict_version = __pyx_obj_dict_version = __PYX_DICT_VERSION_INIT;
+      }
+      #endif
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      #if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_PYTYPE_LOOKUP && CYTHON_USE_TYPE_SLOTS
+    }
+    #endif
+  }
+
+  /* "nonaga_mcts.pyx":463
+ *         """
+ *         cdef Position position
+ *         cdef int node = -1, i, move             # <<<<<<<<<<<<<<
+ *         cdef double deadline
+ *         cdef tuple piece_move, tile_move
+*/
+  __pyx_v_node = -1;
+
+  /* "nonaga_mcts.pyx":467
+ *         cdef tuple piece_move, tile_move
+ * 
+ *         load_position(&position, game_state)             # <<<<<<<<<<<<<<
+ *         if position.turn_phase != _PIECE_TO_MOVE:
+ *             raise ValueError("The search starts with a piece to move.")
+*/
+  __pyx_f_15nonaga_position_load_position((&__pyx_v_position), __pyx_v_game_state); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 467, __pyx_L1_error)
+
+  /* "nonaga_mcts.pyx":468
+ * 
+ *         load_position(&position, game_state)
+ *         if position.turn_phase != _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *             raise ValueError("The search starts with a piece to move.")
+ *         for i in range(8):
+*/
+  __pyx_t_6 = (__pyx_v_position.turn_phase != __pyx_v_11nonaga_mcts__PIECE_TO_MOVE);
+  if (unlikely(__pyx_t_6)) {
+
+    /* "nonaga_mcts.pyx":469
+ *         load_position(&position, game_state)
+ *         if position.turn_phase != _PIECE_TO_MOVE:
+ *             raise ValueError("The search starts with a piece to move.")             # <<<<<<<<<<<<<<
+ *         for i in range(8):
+ *             self.params[i] = self.parameter[i]
+*/
+    __pyx_t_2 = NULL;
+    __pyx_t_5 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_2, __pyx_mstate_global->__pyx_kp_u_The_search_starts_with_a_piece_t};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 469, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 469, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":468
+ * 
+ *         load_position(&position, game_state)
+ *         if position.turn_phase != _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *             raise ValueError("The search starts with a piece to move.")
+ *         for i in range(8):
+*/
+  }
+
+  /* "nonaga_mcts.pyx":470
+ *         if position.turn_phase != _PIECE_TO_MOVE:
+ *             raise ValueError("The search starts with a piece to move.")
+ *         for i in range(8):             # <<<<<<<<<<<<<<
+ *             self.params[i] = self.parameter[i]
+ *         self.rollout_mode = ROLLOUTS[self.rollout]
+*/
+  for (__pyx_t_7 = 0; __pyx_t_7 < 8; __pyx_t_7+=1) {
+    __pyx_v_i = __pyx_t_7;
+
+    /* "nonaga_mcts.pyx":471
+ *             raise ValueError("The search starts with a piece to move.")
+ *         for i in range(8):
+ *             self.params[i] = self.parameter[i]             # <<<<<<<<<<<<<<
+ *         self.rollout_mode = ROLLOUTS[self.rollout]
+ * 
+*/
+    __pyx_t_1 = __Pyx_GetItemInt(__pyx_v_self->parameter, __pyx_v_i, int, 1, __Pyx_PyLong_From_int, 0, 0, 0, 1, __Pyx_ReferenceSharing_SharedReference); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 471, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    __pyx_t_8 = __Pyx_PyLong_As_int(__pyx_t_1); if (unlikely((__pyx_t_8 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 471, __pyx_L1_error)
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    (__pyx_v_self->params[__pyx_v_i]) = __pyx_t_8;
+  }
+
+  /* "nonaga_mcts.pyx":472
+ *         for i in range(8):
+ *             self.params[i] = self.parameter[i]
+ *         self.rollout_mode = ROLLOUTS[self.rollout]             # <<<<<<<<<<<<<<
+ * 
+ *         if self.has_root and self.reuse_tree and self.pool.size:
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_1, __pyx_mstate_global->__pyx_n_u_ROLLOUTS); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_t_2 = __Pyx_PyObject_Dict_GetItem(__pyx_t_1, __pyx_v_self->rollout); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 472, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __Pyx_PyLong_As_int(__pyx_t_2); if (unlikely((__pyx_t_7 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 472, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_self->rollout_mode = __pyx_t_7;
+
+  /* "nonaga_mcts.pyx":474
+ *         self.rollout_mode = ROLLOUTS[self.rollout]
+ * 
+ *         if self.has_root and self.reuse_tree and self.pool.size:             # <<<<<<<<<<<<<<
+ *             node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)
+ *         if node > 0:
+*/
+  if (__pyx_v_self->has_root) {
+  } else {
+    __pyx_t_6 = __pyx_v_self->has_root;
+    goto __pyx_L7_bool_binop_done;
+  }
+  if (__pyx_v_self->reuse_tree) {
+  } else {
+    __pyx_t_6 = __pyx_v_self->reuse_tree;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_9 = (__pyx_v_self->pool.size != 0);
+  __pyx_t_6 = __pyx_t_9;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_6) {
+
+    /* "nonaga_mcts.pyx":475
+ * 
+ *         if self.has_root and self.reuse_tree and self.pool.size:
+ *             node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)             # <<<<<<<<<<<<<<
+ *         if node > 0:
+ *             self._reroot(node)
+*/
+    __pyx_v_node = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_find_node(__pyx_v_self, 0, (&__pyx_v_self->root_position), (&__pyx_v_position), __pyx_e_11nonaga_mcts_REUSE_PLIES);
+
+    /* "nonaga_mcts.pyx":474
+ *         self.rollout_mode = ROLLOUTS[self.rollout]
+ * 
+ *         if self.has_root and self.reuse_tree and self.pool.size:             # <<<<<<<<<<<<<<
+ *             node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)
+ *         if node > 0:
+*/
+  }
+
+  /* "nonaga_mcts.pyx":476
+ *         if self.has_root and self.reuse_tree and self.pool.size:
+ *             node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)
+ *         if node > 0:             # <<<<<<<<<<<<<<
+ *             self._reroot(node)
+ *         elif node < 0:
+*/
+  __pyx_t_6 = (__pyx_v_node > 0);
+  if (__pyx_t_6) {
+
+    /* "nonaga_mcts.pyx":477
+ *             node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)
+ *         if node > 0:
+ *             self._reroot(node)             # <<<<<<<<<<<<<<
+ *         elif node < 0:
+ *             self.pool.size = 0
+*/
+    ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_reroot(__pyx_v_self, __pyx_v_node); if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 477, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":476
+ *         if self.has_root and self.reuse_tree and self.pool.size:
+ *             node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)
+ *         if node > 0:             # <<<<<<<<<<<<<<
+ *             self._reroot(node)
+ *         elif node < 0:
+*/
+    goto __pyx_L10;
+  }
+
+  /* "nonaga_mcts.pyx":478
+ *         if node > 0:
+ *             self._reroot(node)
+ *         elif node < 0:             # <<<<<<<<<<<<<<
+ *             self.pool.size = 0
+ *         self.root_position = position
+*/
+  __pyx_t_6 = (__pyx_v_node < 0);
+  if (__pyx_t_6) {
+
+    /* "nonaga_mcts.pyx":479
+ *             self._reroot(node)
+ *         elif node < 0:
+ *             self.pool.size = 0             # <<<<<<<<<<<<<<
+ *         self.root_position = position
+ *         self.has_root = True
+*/
+    __pyx_v_self->pool.size = 0;
+
+    /* "nonaga_mcts.pyx":478
+ *         if node > 0:
+ *             self._reroot(node)
+ *         elif node < 0:             # <<<<<<<<<<<<<<
+ *             self.pool.size = 0
+ *         self.root_position = position
+*/
+  }
+  __pyx_L10:;
+
+  /* "nonaga_mcts.pyx":480
+ *         elif node < 0:
+ *             self.pool.size = 0
+ *         self.root_position = position             # <<<<<<<<<<<<<<
+ *         self.has_root = True
+ *         if self.pool.size == 0:
+*/
+  __pyx_v_self->root_position = __pyx_v_position;
+
+  /* "nonaga_mcts.pyx":481
+ *             self.pool.size = 0
+ *         self.root_position = position
+ *         self.has_root = True             # <<<<<<<<<<<<<<
+ *         if self.pool.size == 0:
+ *             if pool_allocate(&self.pool, 1) < 0:
+*/
+  __pyx_v_self->has_root = 1;
+
+  /* "nonaga_mcts.pyx":482
+ *         self.root_position = position
+ *         self.has_root = True
+ *         if self.pool.size == 0:             # <<<<<<<<<<<<<<
+ *             if pool_allocate(&self.pool, 1) < 0:
+ *                 raise MemoryError()
+*/
+  __pyx_t_6 = (__pyx_v_self->pool.size == 0);
+  if (__pyx_t_6) {
+
+    /* "nonaga_mcts.pyx":483
+ *         self.has_root = True
+ *         if self.pool.size == 0:
+ *             if pool_allocate(&self.pool, 1) < 0:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             self.pool.mover[0] = (position.current_player + 1) % 2
+*/
+    __pyx_t_6 = (__pyx_f_11nonaga_mcts_pool_allocate((&__pyx_v_self->pool), 1) < 0);
+    if (unlikely(__pyx_t_6)) {
+
+      /* "nonaga_mcts.pyx":484
+ *         if self.pool.size == 0:
+ *             if pool_allocate(&self.pool, 1) < 0:
+ *                 raise MemoryError()             # <<<<<<<<<<<<<<
+ *             self.pool.mover[0] = (position.current_player + 1) % 2
+ *         # the result of the root's position is for its moves to tell
+*/
+      PyErr_NoMemory(); __PYX_ERR(0, 484, __pyx_L1_error)
+
+      /* "nonaga_mcts.pyx":483
+ *         self.has_root = True
+ *         if self.pool.size == 0:
+ *             if pool_allocate(&self.pool, 1) < 0:             # <<<<<<<<<<<<<<
+ *                 raise MemoryError()
+ *             self.pool.mover[0] = (position.current_player + 1) % 2
+*/
+    }
+
+    /* "nonaga_mcts.pyx":485
+ *             if pool_allocate(&self.pool, 1) < 0:
+ *                 raise MemoryError()
+ *             self.pool.mover[0] = (position.current_player + 1) % 2             # <<<<<<<<<<<<<<
+ *         # the result of the root's position is for its moves to tell
+ *         self.pool.winner[0] = -1
+*/
+    (__pyx_v_self->pool.mover[0]) = __Pyx_mod_long((__pyx_v_position.current_player + 1), 2, 1);
+
+    /* "nonaga_mcts.pyx":482
+ *         self.root_position = position
+ *         self.has_root = True
+ *         if self.pool.size == 0:             # <<<<<<<<<<<<<<
+ *             if pool_allocate(&self.pool, 1) < 0:
+ *                 raise MemoryError()
+*/
+  }
+
+  /* "nonaga_mcts.pyx":487
+ *             self.pool.mover[0] = (position.current_player + 1) % 2
+ *         # the result of the root's position is for its moves to tell
+ *         self.pool.winner[0] = -1             # <<<<<<<<<<<<<<
+ *         self.reused_visits = self.pool.visits[0]
+ * 
+*/
+  (__pyx_v_self->pool.winner[0]) = -1;
+
+  /* "nonaga_mcts.pyx":488
+ *         # the result of the root's position is for its moves to tell
+ *         self.pool.winner[0] = -1
+ *         self.reused_visits = self.pool.visits[0]             # <<<<<<<<<<<<<<
+ * 
+ *         self.failed = False
+*/
+  __pyx_v_self->reused_visits = (__pyx_v_self->pool.visits[0]);
+
+  /* "nonaga_mcts.pyx":490
+ *         self.reused_visits = self.pool.visits[0]
+ * 
+ *         self.failed = False             # <<<<<<<<<<<<<<
+ *         self.done_iterations = 0
+ *         self.target_iterations = self.iterations
+*/
+  __pyx_v_self->failed = 0;
+
+  /* "nonaga_mcts.pyx":491
+ * 
+ *         self.failed = False
+ *         self.done_iterations = 0             # <<<<<<<<<<<<<<
+ *         self.target_iterations = self.iterations
+ *         # nothing to search for when a slide wins right away
+*/
+  __pyx_v_self->done_iterations = 0;
+
+  /* "nonaga_mcts.pyx":492
+ *         self.failed = False
+ *         self.done_iterations = 0
+ *         self.target_iterations = self.iterations             # <<<<<<<<<<<<<<
+ *         # nothing to search for when a slide wins right away
+ *         if find_winning_slide(&position, position.current_player) < 0:
+*/
+  __pyx_t_7 = __pyx_v_self->iterations;
+  __pyx_v_self->target_iterations = __pyx_t_7;
+
+  /* "nonaga_mcts.pyx":494
+ *         self.target_iterations = self.iterations
+ *         # nothing to search for when a slide wins right away
+ *         if find_winning_slide(&position, position.current_player) < 0:             # <<<<<<<<<<<<<<
+ *             deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+*/
+  __pyx_t_6 = (__pyx_f_15nonaga_position_find_winning_slide((&__pyx_v_position), __pyx_v_position.current_player) < 0);
+  if (__pyx_t_6) {
+
+    /* "nonaga_mcts.pyx":495
+ *         # nothing to search for when a slide wins right away
+ *         if find_winning_slide(&position, position.current_player) < 0:
+ *             deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0             # <<<<<<<<<<<<<<
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+ *                        for _ in range(self.threads - 1)]
+*/
+    __pyx_t_6 = (__pyx_v_self->time_limit > 0.0);
+    if (__pyx_t_6) {
+      __pyx_t_1 = NULL;
+      __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_time); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 495, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      __pyx_t_3 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_perf_counter); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 495, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+      __pyx_t_5 = 1;
+      #if CYTHON_UNPACK_METHODS
+      if (unlikely(PyMethod_Check(__pyx_t_3))) {
+        __pyx_t_1 = PyMethod_GET_SELF(__pyx_t_3);
+        assert(__pyx_t_1);
+        PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_3);
+        __Pyx_INCREF(__pyx_t_1);
+        __Pyx_INCREF(__pyx__function);
+        __Pyx_DECREF_SET(__pyx_t_3, __pyx__function);
+        __pyx_t_5 = 0;
+      }
+      #endif
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_1, NULL};
+        __pyx_t_2 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_3, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_1); __pyx_t_1 = 0;
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+        if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 495, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_2);
+      }
+      __pyx_t_3 = PyFloat_FromDouble(__pyx_v_self->time_limit); if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 495, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __pyx_t_1 = PyNumber_Add(__pyx_t_2, __pyx_t_3); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 495, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __pyx_t_11 = __Pyx_PyFloat_AsDouble(__pyx_t_1); if (unlikely((__pyx_t_11 == (double)-1) && PyErr_Occurred())) __PYX_ERR(0, 495, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+      __pyx_t_10 = __pyx_t_11;
+    } else {
+      __pyx_t_10 = 0.0;
+    }
+    __pyx_v_deadline = __pyx_t_10;
+
+    /* "nonaga_mcts.pyx":496
+ *         if find_winning_slide(&position, position.current_player) < 0:
+ *             deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)             # <<<<<<<<<<<<<<
+ *                        for _ in range(self.threads - 1)]
+ *             for worker in workers:
+*/
+    { /* enter inner scope */
+      __pyx_t_1 = PyList_New(0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 496, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+
+      /* "nonaga_mcts.pyx":497
+ *             deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+ *                        for _ in range(self.threads - 1)]             # <<<<<<<<<<<<<<
+ *             for worker in workers:
+ *                 worker.start()
+*/
+      __pyx_t_12 = (__pyx_v_self->threads - 1);
+      __pyx_t_13 = __pyx_t_12;
+      for (__pyx_t_14 = 0; __pyx_t_14 < __pyx_t_13; __pyx_t_14+=1) {
+        __pyx_7genexpr__pyx_v__ = __pyx_t_14;
+
+        /* "nonaga_mcts.pyx":496
+ *         if find_winning_slide(&position, position.current_player) < 0:
+ *             deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)             # <<<<<<<<<<<<<<
+ *                        for _ in range(self.threads - 1)]
+ *             for worker in workers:
+*/
+        __pyx_t_2 = NULL;
+        __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_threading); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_15 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_Thread); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_15);
+        __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+        __pyx_t_4 = __Pyx_PyObject_GetAttrStr(((PyObject *)__pyx_v_self), __pyx_mstate_global->__pyx_n_u_run); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_4);
+        __pyx_t_16 = PyFloat_FromDouble(__pyx_v_deadline); if (unlikely(!__pyx_t_16)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_16);
+        __pyx_t_18 = NULL;
+        __Pyx_GetModuleGlobalName(__pyx_t_19, __pyx_mstate_global->__pyx_n_u_random); if (unlikely(!__pyx_t_19)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_19);
+        __pyx_t_20 = __Pyx_PyObject_GetAttrStr(__pyx_t_19, __pyx_mstate_global->__pyx_n_u_getrandbits); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_20);
+        __Pyx_DECREF(__pyx_t_19); __pyx_t_19 = 0;
+        __pyx_t_5 = 1;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_20))) {
+          __pyx_t_18 = PyMethod_GET_SELF(__pyx_t_20);
+          assert(__pyx_t_18);
+          PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_20);
+          __Pyx_INCREF(__pyx_t_18);
+          __Pyx_INCREF(__pyx__function);
+          __Pyx_DECREF_SET(__pyx_t_20, __pyx__function);
+          __pyx_t_5 = 0;
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2] = {__pyx_t_18, __pyx_mstate_global->__pyx_int_64};
+          __pyx_t_17 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_20, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+          __Pyx_XDECREF(__pyx_t_18); __pyx_t_18 = 0;
+          __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+          if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 496, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_17);
+        }
+        __pyx_t_20 = PyTuple_New(2); if (unlikely(!__pyx_t_20)) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_20);
+        __Pyx_GIVEREF(__pyx_t_16);
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_20, 0, __pyx_t_16) != (0)) __PYX_ERR(0, 496, __pyx_L1_error);
+        __Pyx_GIVEREF(__pyx_t_17);
+        if (__Pyx_PyTuple_SET_ITEM(__pyx_t_20, 1, __pyx_t_17) != (0)) __PYX_ERR(0, 496, __pyx_L1_error);
+        __pyx_t_16 = 0;
+        __pyx_t_17 = 0;
+        __pyx_t_5 = 1;
+        #if CYTHON_UNPACK_METHODS
+        if (unlikely(PyMethod_Check(__pyx_t_15))) {
+          __pyx_t_2 = PyMethod_GET_SELF(__pyx_t_15);
+          assert(__pyx_t_2);
+          PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_15);
+          __Pyx_INCREF(__pyx_t_2);
+          __Pyx_INCREF(__pyx__function);
+          __Pyx_DECREF_SET(__pyx_t_15, __pyx__function);
+          __pyx_t_5 = 0;
+        }
+        #endif
+        {
+          PyObject *__pyx_callargs[2 + ((CYTHON_VECTORCALL) ? 3 : 0)] = {__pyx_t_2, NULL};
+          __pyx_t_17 = __Pyx_MakeVectorcallBuilderKwds(3); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 496, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_17);
+          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_target, __pyx_t_4, __pyx_t_17, __pyx_callargs+1, 0) < (0)) __PYX_ERR(0, 496, __pyx_L1_error)
+          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_args, __pyx_t_20, __pyx_t_17, __pyx_callargs+1, 1) < (0)) __PYX_ERR(0, 496, __pyx_L1_error)
+          if (__Pyx_VectorcallBuilder_AddArg(__pyx_mstate_global->__pyx_n_u_daemon, Py_True, __pyx_t_17, __pyx_callargs+1, 2) < (0)) __PYX_ERR(0, 496, __pyx_L1_error)
+          __pyx_t_3 = __Pyx_Object_Vectorcall_CallFromBuilder((PyObject*)__pyx_t_15, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET), __pyx_t_17);
+          __Pyx_XDECREF(__pyx_t_2); __pyx_t_2 = 0;
+          __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+          __Pyx_DECREF(__pyx_t_20); __pyx_t_20 = 0;
+          __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+          __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+          if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 496, __pyx_L1_error)
+          __Pyx_GOTREF(__pyx_t_3);
+        }
+        if (unlikely(__Pyx_ListComp_Append(__pyx_t_1, (PyObject*)__pyx_t_3))) __PYX_ERR(0, 496, __pyx_L1_error)
+        __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+      }
+    } /* exit inner scope */
+    __pyx_v_workers = ((PyObject*)__pyx_t_1);
+    __pyx_t_1 = 0;
+
+    /* "nonaga_mcts.pyx":498
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+ *                        for _ in range(self.threads - 1)]
+ *             for worker in workers:             # <<<<<<<<<<<<<<
+ *                 worker.start()
+ *             self._run(deadline, random.getrandbits(64))
+*/
+    __pyx_t_1 = __pyx_v_workers; __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_21 = 0;
+    for (;;) {
+      {
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 498, __pyx_L1_error)
+        #endif
+        if (__pyx_t_21 >= __pyx_temp) break;
+      }
+      __pyx_t_3 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_21, __Pyx_ReferenceSharing_OwnStrongReference);
+      ++__pyx_t_21;
+      if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 498, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_3);
+      __Pyx_XDECREF_SET(__pyx_v_worker, __pyx_t_3);
+      __pyx_t_3 = 0;
+
+      /* "nonaga_mcts.pyx":499
+ *                        for _ in range(self.threads - 1)]
+ *             for worker in workers:
+ *                 worker.start()             # <<<<<<<<<<<<<<
+ *             self._run(deadline, random.getrandbits(64))
+ *             for worker in workers:
+*/
+      __pyx_t_15 = __pyx_v_worker;
+      __Pyx_INCREF(__pyx_t_15);
+      __pyx_t_5 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_15, NULL};
+        __pyx_t_3 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_start, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+        if (unlikely(!__pyx_t_3)) __PYX_ERR(0, 499, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_3);
+      }
+      __Pyx_DECREF(__pyx_t_3); __pyx_t_3 = 0;
+
+      /* "nonaga_mcts.pyx":498
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+ *                        for _ in range(self.threads - 1)]
+ *             for worker in workers:             # <<<<<<<<<<<<<<
+ *                 worker.start()
+ *             self._run(deadline, random.getrandbits(64))
+*/
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "nonaga_mcts.pyx":500
+ *             for worker in workers:
+ *                 worker.start()
+ *             self._run(deadline, random.getrandbits(64))             # <<<<<<<<<<<<<<
+ *             for worker in workers:
+ *                 worker.join()
+*/
+    __pyx_t_3 = ((PyObject *)__pyx_v_self);
+    __Pyx_INCREF(__pyx_t_3);
+    __pyx_t_15 = PyFloat_FromDouble(__pyx_v_deadline); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 500, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_15);
+    __pyx_t_20 = NULL;
+    __Pyx_GetModuleGlobalName(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_random); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 500, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_4);
+    __pyx_t_2 = __Pyx_PyObject_GetAttrStr(__pyx_t_4, __pyx_mstate_global->__pyx_n_u_getrandbits); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 500, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_2);
+    __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    __pyx_t_5 = 1;
+    #if CYTHON_UNPACK_METHODS
+    if (unlikely(PyMethod_Check(__pyx_t_2))) {
+      __pyx_t_20 = PyMethod_GET_SELF(__pyx_t_2);
+      assert(__pyx_t_20);
+      PyObject* __pyx__function = PyMethod_GET_FUNCTION(__pyx_t_2);
+      __Pyx_INCREF(__pyx_t_20);
+      __Pyx_INCREF(__pyx__function);
+      __Pyx_DECREF_SET(__pyx_t_2, __pyx__function);
+      __pyx_t_5 = 0;
+    }
+    #endif
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_20, __pyx_mstate_global->__pyx_int_64};
+      __pyx_t_17 = __Pyx_PyObject_FastCall((PyObject*)__pyx_t_2, __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_20); __pyx_t_20 = 0;
+      __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+      if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 500, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+    }
+    __pyx_t_5 = 0;
+    {
+      PyObject *__pyx_callargs[3] = {__pyx_t_3, __pyx_t_15, __pyx_t_17};
+      __pyx_t_1 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_run, __pyx_callargs+__pyx_t_5, (3-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_3); __pyx_t_3 = 0;
+      __Pyx_DECREF(__pyx_t_15); __pyx_t_15 = 0;
+      __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 500, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "nonaga_mcts.pyx":501
+ *                 worker.start()
+ *             self._run(deadline, random.getrandbits(64))
+ *             for worker in workers:             # <<<<<<<<<<<<<<
+ *                 worker.join()
+ *         if self.failed:
+*/
+    __pyx_t_1 = __pyx_v_workers; __Pyx_INCREF(__pyx_t_1);
+    __pyx_t_21 = 0;
+    for (;;) {
+      {
+        Py_ssize_t __pyx_temp = __Pyx_PyList_GET_SIZE(__pyx_t_1);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely((__pyx_temp < 0))) __PYX_ERR(0, 501, __pyx_L1_error)
+        #endif
+        if (__pyx_t_21 >= __pyx_temp) break;
+      }
+      __pyx_t_17 = __Pyx_PyList_GetItemRefFast(__pyx_t_1, __pyx_t_21, __Pyx_ReferenceSharing_OwnStrongReference);
+      ++__pyx_t_21;
+      if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 501, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_17);
+      __Pyx_XDECREF_SET(__pyx_v_worker, __pyx_t_17);
+      __pyx_t_17 = 0;
+
+      /* "nonaga_mcts.pyx":502
+ *             self._run(deadline, random.getrandbits(64))
+ *             for worker in workers:
+ *                 worker.join()             # <<<<<<<<<<<<<<
+ *         if self.failed:
+ *             raise MemoryError("The search tree could not grow.")
+*/
+      __pyx_t_15 = __pyx_v_worker;
+      __Pyx_INCREF(__pyx_t_15);
+      __pyx_t_5 = 0;
+      {
+        PyObject *__pyx_callargs[2] = {__pyx_t_15, NULL};
+        __pyx_t_17 = __Pyx_PyObject_FastCallMethod((PyObject*)__pyx_mstate_global->__pyx_n_u_join, __pyx_callargs+__pyx_t_5, (1-__pyx_t_5) | (1*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+        __Pyx_XDECREF(__pyx_t_15); __pyx_t_15 = 0;
+        if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 502, __pyx_L1_error)
+        __Pyx_GOTREF(__pyx_t_17);
+      }
+      __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+
+      /* "nonaga_mcts.pyx":501
+ *                 worker.start()
+ *             self._run(deadline, random.getrandbits(64))
+ *             for worker in workers:             # <<<<<<<<<<<<<<
+ *                 worker.join()
+ *         if self.failed:
+*/
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+    /* "nonaga_mcts.pyx":494
+ *         self.target_iterations = self.iterations
+ *         # nothing to search for when a slide wins right away
+ *         if find_winning_slide(&position, position.current_player) < 0:             # <<<<<<<<<<<<<<
+ *             deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0
+ *             workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+*/
+  }
+
+  /* "nonaga_mcts.pyx":503
+ *             for worker in workers:
+ *                 worker.join()
+ *         if self.failed:             # <<<<<<<<<<<<<<
+ *             raise MemoryError("The search tree could not grow.")
+ *         self.last_iterations = self.done_iterations
+*/
+  if (unlikely(__pyx_v_self->failed)) {
+
+    /* "nonaga_mcts.pyx":504
+ *                 worker.join()
+ *         if self.failed:
+ *             raise MemoryError("The search tree could not grow.")             # <<<<<<<<<<<<<<
+ *         self.last_iterations = self.done_iterations
+ * 
+*/
+    __pyx_t_17 = NULL;
+    __pyx_t_5 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_17, __pyx_mstate_global->__pyx_kp_u_The_search_tree_could_not_grow};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_MemoryError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 504, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 504, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":503
+ *             for worker in workers:
+ *                 worker.join()
+ *         if self.failed:             # <<<<<<<<<<<<<<
+ *             raise MemoryError("The search tree could not grow.")
+ *         self.last_iterations = self.done_iterations
+*/
+  }
+
+  /* "nonaga_mcts.pyx":505
+ *         if self.failed:
+ *             raise MemoryError("The search tree could not grow.")
+ *         self.last_iterations = self.done_iterations             # <<<<<<<<<<<<<<
+ * 
+ *         # the most visited piece move, then its most visited tile move
+*/
+  __pyx_t_7 = __pyx_v_self->done_iterations;
+  __pyx_v_self->last_iterations = __pyx_t_7;
+
+  /* "nonaga_mcts.pyx":508
+ * 
+ *         # the most visited piece move, then its most visited tile move
+ *         move = self._best_move(0, &position)             # <<<<<<<<<<<<<<
+ *         if move < 0:
+ *             raise ValueError("The player to move has no piece move.")
+*/
+  __pyx_v_move = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_best_move(__pyx_v_self, 0, (&__pyx_v_position));
+
+  /* "nonaga_mcts.pyx":509
+ *         # the most visited piece move, then its most visited tile move
+ *         move = self._best_move(0, &position)
+ *         if move < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("The player to move has no piece move.")
+ *         node = self._child_with_move(0, move)
+*/
+  __pyx_t_6 = (__pyx_v_move < 0);
+  if (unlikely(__pyx_t_6)) {
+
+    /* "nonaga_mcts.pyx":510
+ *         move = self._best_move(0, &position)
+ *         if move < 0:
+ *             raise ValueError("The player to move has no piece move.")             # <<<<<<<<<<<<<<
+ *         node = self._child_with_move(0, move)
+ *         piece_move = move_positions(&position, move, True)
+*/
+    __pyx_t_17 = NULL;
+    __pyx_t_5 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_17, __pyx_mstate_global->__pyx_kp_u_The_player_to_move_has_no_piece};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 510, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 510, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":509
+ *         # the most visited piece move, then its most visited tile move
+ *         move = self._best_move(0, &position)
+ *         if move < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("The player to move has no piece move.")
+ *         node = self._child_with_move(0, move)
+*/
+  }
+
+  /* "nonaga_mcts.pyx":511
+ *         if move < 0:
+ *             raise ValueError("The player to move has no piece move.")
+ *         node = self._child_with_move(0, move)             # <<<<<<<<<<<<<<
+ *         piece_move = move_positions(&position, move, True)
+ *         play_piece_move(&position, move)
+*/
+  __pyx_v_node = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_child_with_move(__pyx_v_self, 0, __pyx_v_move);
+
+  /* "nonaga_mcts.pyx":512
+ *             raise ValueError("The player to move has no piece move.")
+ *         node = self._child_with_move(0, move)
+ *         piece_move = move_positions(&position, move, True)             # <<<<<<<<<<<<<<
+ *         play_piece_move(&position, move)
+ *         move = self._best_move(node, &position)
+*/
+  __pyx_t_1 = __pyx_f_15nonaga_position_move_positions((&__pyx_v_position), __pyx_v_move, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 512, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_piece_move = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nonaga_mcts.pyx":513
+ *         node = self._child_with_move(0, move)
+ *         piece_move = move_positions(&position, move, True)
+ *         play_piece_move(&position, move)             # <<<<<<<<<<<<<<
+ *         move = self._best_move(node, &position)
+ *         if move < 0:
+*/
+  __pyx_f_15nonaga_position_play_piece_move((&__pyx_v_position), __pyx_v_move);
+
+  /* "nonaga_mcts.pyx":514
+ *         piece_move = move_positions(&position, move, True)
+ *         play_piece_move(&position, move)
+ *         move = self._best_move(node, &position)             # <<<<<<<<<<<<<<
+ *         if move < 0:
+ *             raise ValueError("No tile can be moved.")
+*/
+  __pyx_v_move = ((struct __pyx_vtabstruct_11nonaga_mcts_MCTS *)__pyx_v_self->__pyx_vtab)->_best_move(__pyx_v_self, __pyx_v_node, (&__pyx_v_position));
+
+  /* "nonaga_mcts.pyx":515
+ *         play_piece_move(&position, move)
+ *         move = self._best_move(node, &position)
+ *         if move < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("No tile can be moved.")
+ *         tile_move = move_positions(&position, move, False)
+*/
+  __pyx_t_6 = (__pyx_v_move < 0);
+  if (unlikely(__pyx_t_6)) {
+
+    /* "nonaga_mcts.pyx":516
+ *         move = self._best_move(node, &position)
+ *         if move < 0:
+ *             raise ValueError("No tile can be moved.")             # <<<<<<<<<<<<<<
+ *         tile_move = move_positions(&position, move, False)
+ *         return ((game_state.board.get_piece(piece_move[0]), piece_move[1]),
+*/
+    __pyx_t_17 = NULL;
+    __pyx_t_5 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_17, __pyx_mstate_global->__pyx_kp_u_No_tile_can_be_moved};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_5, (2-__pyx_t_5) | (__pyx_t_5*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_17); __pyx_t_17 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 516, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 516, __pyx_L1_error)
+
+    /* "nonaga_mcts.pyx":515
+ *         play_piece_move(&position, move)
+ *         move = self._best_move(node, &position)
+ *         if move < 0:             # <<<<<<<<<<<<<<
+ *             raise ValueError("No tile can be moved.")
+ *         tile_move = move_positions(&position, move, False)
+*/
+  }
+
+  /* "nonaga_mcts.pyx":517
+ *         if move < 0:
+ *             raise ValueError("No tile can be moved.")
+ *         tile_move = move_positions(&position, move, False)             # <<<<<<<<<<<<<<
+ *         return ((game_state.board.get_piece(piece_move[0]), piece_move[1]),
+ *                 (game_state.board.get_tile(tile_move[0]), tile_move[1]))
+*/
+  __pyx_t_1 = __pyx_f_15nonaga_position_move_positions((&__pyx_v_position), __pyx_v_move, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 517, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_v_tile_move = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nonaga_mcts.pyx":518
+ *             raise ValueError("No tile can be moved.")
+ *         tile_move = move_positions(&position, move, False)
+ *         return ((game_state.board.get_piece(piece_move[0]), piece_move[1]),             # <<<<<<<<<<<<<<
+ *                 (game_state.board.get_tile(tile_move[0]), tile_move[1]))
+*/
+  __Pyx_XDECREF(__pyx_r);
+  if (unlikely(__pyx_v_piece_move == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 518, __pyx_L1_error)
+  }
+  __pyx_t_1 = __Pyx_PyTuple_GET_ITEM(__pyx_v_piece_move, 0);
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(PyTuple_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_t_1))) __PYX_ERR(0, 518, __pyx_L1_error)
+  __pyx_t_17 = ((PyObject *)((struct __pyx_vtabstruct_12nonaga_board_NonagaBoard *)__pyx_v_game_state->board->__pyx_vtab)->get_piece(__pyx_v_game_state->board, ((PyObject*)__pyx_t_1), 0)); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  if (unlikely(__pyx_v_piece_move == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 518, __pyx_L1_error)
+  }
+  __pyx_t_1 = PyTuple_New(2); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __Pyx_GIVEREF(__pyx_t_17);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 0, __pyx_t_17) != (0)) __PYX_ERR(0, 518, __pyx_L1_error);
+  __Pyx_INCREF(__Pyx_PyTuple_GET_ITEM(__pyx_v_piece_move, 1));
+  __Pyx_GIVEREF(__Pyx_PyTuple_GET_ITEM(__pyx_v_piece_move, 1));
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_1, 1, __Pyx_PyTuple_GET_ITEM(__pyx_v_piece_move, 1)) != (0)) __PYX_ERR(0, 518, __pyx_L1_error);
+  __pyx_t_17 = 0;
+
+  /* "nonaga_mcts.pyx":519
+ *         tile_move = move_positions(&position, move, False)
+ *         return ((game_state.board.get_piece(piece_move[0]), piece_move[1]),
+ *                 (game_state.board.get_tile(tile_move[0]), tile_move[1]))             # <<<<<<<<<<<<<<
+*/
+  if (unlikely(__pyx_v_tile_move == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 519, __pyx_L1_error)
+  }
+  __pyx_t_17 = __Pyx_PyTuple_GET_ITEM(__pyx_v_tile_move, 0);
+  __Pyx_INCREF(__pyx_t_17);
+  if (!(likely(PyTuple_CheckExact(__pyx_t_17))||((__pyx_t_17) == Py_None) || __Pyx_RaiseUnexpectedTypeError("tuple", __pyx_t_17))) __PYX_ERR(0, 519, __pyx_L1_error)
+  __pyx_t_15 = ((PyObject *)((struct __pyx_vtabstruct_12nonaga_board_NonagaBoard *)__pyx_v_game_state->board->__pyx_vtab)->get_tile(__pyx_v_game_state->board, ((PyObject*)__pyx_t_17), 0)); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+  __Pyx_DECREF(__pyx_t_17); __pyx_t_17 = 0;
+  if (unlikely(__pyx_v_tile_move == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+    __PYX_ERR(0, 519, __pyx_L1_error)
+  }
+  __pyx_t_17 = PyTuple_New(2); if (unlikely(!__pyx_t_17)) __PYX_ERR(0, 519, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_17);
+  __Pyx_GIVEREF(__pyx_t_15);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 0, __pyx_t_15) != (0)) __PYX_ERR(0, 519, __pyx_L1_error);
+  __Pyx_INCREF(__Pyx_PyTuple_GET_ITEM(__pyx_v_tile_move, 1));
+  __Pyx_GIVEREF(__Pyx_PyTuple_GET_ITEM(__pyx_v_tile_move, 1));
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_17, 1, __Pyx_PyTuple_GET_ITEM(__pyx_v_tile_move, 1)) != (0)) __PYX_ERR(0, 519, __pyx_L1_error);
+  __pyx_t_15 = 0;
+
+  /* "nonaga_mcts.pyx":518
+ *             raise ValueError("No tile can be moved.")
+ *         tile_move = move_positions(&position, move, False)
+ *         return ((game_state.board.get_piece(piece_move[0]), piece_move[1]),             # <<<<<<<<<<<<<<
+ *                 (game_state.board.get_tile(tile_move[0]), tile_move[1]))
+*/
+  __pyx_t_15 = PyTuple_New(2); if (unlikely(!__pyx_t_15)) __PYX_ERR(0, 518, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_15);
+  __Pyx_GIVEREF(__pyx_t_1);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 0, __pyx_t_1) != (0)) __PYX_ERR(0, 518, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_17);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_15, 1, __pyx_t_17) != (0)) __PYX_ERR(0, 518, __pyx_L1_error);
+  __pyx_t_1 = 0;
+  __pyx_t_17 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_15);
+  __pyx_t_15 = 0;
+  goto __pyx_L0;
+
+  /* "nonaga_mcts.pyx":454
+ *                 running = False
+ * 
+ *     cpdef tuple get_best_move(self, NonagaLogic game_state):             # <<<<<<<<<<<<<<
+ *         """Returns the best move for the player to move, searched for time_limit seconds or iterations.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_3);
+  __Pyx_XDECREF(__pyx_t_4);
+  __Pyx_XDECREF(__pyx_t_15);
+  __Pyx_XDECREF(__pyx_t_16);
+  __Pyx_XDECREF(__pyx_t_17);
+  __Pyx_XDECREF(__pyx_t_18);
+  __Pyx_XDECREF(__pyx_t_19);
+  __Pyx_XDECREF(__pyx_t_20);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.get_best_move", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XDECREF(__pyx_v_piece_move);
+  __Pyx_XDECREF(__pyx_v_tile_move);
+  __Pyx_XDECREF(__pyx_v_workers);
+  __Pyx_XDECREF(__pyx_v_worker);
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9get_best_move(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+PyDoc_STRVAR(__pyx_doc_11nonaga_mcts_4MCTS_8get_best_move, "Returns the best move for the player to move, searched for time_limit seconds or iterations.\n\n        Args:\n            game_state: current game state, with a piece to move\n        Returns:\n            A tuple containing the best piece move and the best tile move combination.\n        ");
+static PyMethodDef __pyx_mdef_11nonaga_mcts_4MCTS_9get_best_move = {"get_best_move", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_9get_best_move, __Pyx_METH_FASTCALL|METH_KEYWORDS, __pyx_doc_11nonaga_mcts_4MCTS_8get_best_move};
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9get_best_move(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  struct __pyx_obj_12nonaga_logic_NonagaLogic *__pyx_v_game_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("get_best_move (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_game_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(0, 454, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 454, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "get_best_move", 0) < (0)) __PYX_ERR(0, 454, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("get_best_move", 1, 1, 1, i); __PYX_ERR(0, 454, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(0, 454, __pyx_L3_error)
+    }
+    __pyx_v_game_state = ((struct __pyx_obj_12nonaga_logic_NonagaLogic *)values[0]);
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("get_best_move", 1, 1, 1, __pyx_nargs); __PYX_ERR(0, 454, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.get_best_move", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  if (unlikely(!__Pyx_ArgTypeTest(((PyObject *)__pyx_v_game_state), __pyx_mstate_global->__pyx_ptype_12nonaga_logic_NonagaLogic, 1, "game_state", 0))) __PYX_ERR(0, 454, __pyx_L1_error)
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_8get_best_move(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), __pyx_v_game_state);
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_r = NULL;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  goto __pyx_L7_cleaned_up;
+  __pyx_L0:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __pyx_L7_cleaned_up:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_8get_best_move(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, struct __pyx_obj_12nonaga_logic_NonagaLogic *__pyx_v_game_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("get_best_move", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __pyx_f_11nonaga_mcts_4MCTS_get_best_move(__pyx_v_self, __pyx_v_game_state, 1); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.get_best_move", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":23
+ * 
+ * cdef class MCTS:
+ *     cdef public object parameter             # <<<<<<<<<<<<<<
+ *     cdef public int max_color
+ *     cdef public double time_limit
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9parameter_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9parameter_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9parameter___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9parameter___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->parameter);
+  __pyx_r = __pyx_v_self->parameter;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_9parameter_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_9parameter_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9parameter_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_9parameter_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __Pyx_INCREF(__pyx_v_value);
+  __Pyx_GIVEREF(__pyx_v_value);
+  __Pyx_GOTREF(__pyx_v_self->parameter);
+  __Pyx_DECREF(__pyx_v_self->parameter);
+  __pyx_v_self->parameter = __pyx_v_value;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_9parameter_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_9parameter_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9parameter_4__del__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_9parameter_4__del__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->parameter);
+  __Pyx_DECREF(__pyx_v_self->parameter);
+  __pyx_v_self->parameter = Py_None;
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":24
+ * cdef class MCTS:
+ *     cdef public object parameter
+ *     cdef public int max_color             # <<<<<<<<<<<<<<
+ *     cdef public double time_limit
+ *     cdef public int iterations
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9max_color_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9max_color_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9max_color___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9max_color___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->max_color); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 24, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.max_color.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_9max_color_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_9max_color_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9max_color_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_9max_color_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 24, __pyx_L1_error)
+  __pyx_v_self->max_color = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.max_color.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":25
+ *     cdef public object parameter
+ *     cdef public int max_color
+ *     cdef public double time_limit             # <<<<<<<<<<<<<<
+ *     cdef public int iterations
+ *     cdef public int threads
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_10time_limit_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_10time_limit_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10time_limit___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10time_limit___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->time_limit); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 25, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.time_limit.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_10time_limit_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_10time_limit_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10time_limit_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_10time_limit_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  double __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyFloat_AsDouble(__pyx_v_value); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 25, __pyx_L1_error)
+  __pyx_v_self->time_limit = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.time_limit.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":26
+ *     cdef public int max_color
+ *     cdef public double time_limit
+ *     cdef public int iterations             # <<<<<<<<<<<<<<
+ *     cdef public int threads
+ *     cdef public str rollout
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_10iterations_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_10iterations_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10iterations___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10iterations___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->iterations); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 26, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.iterations.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_10iterations_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_10iterations_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10iterations_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_10iterations_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 26, __pyx_L1_error)
+  __pyx_v_self->iterations = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.iterations.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":27
+ *     cdef public double time_limit
+ *     cdef public int iterations
+ *     cdef public int threads             # <<<<<<<<<<<<<<
+ *     cdef public str rollout
+ *     cdef public int rollout_turns
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_7threads_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_7threads_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_7threads___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_7threads___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->threads); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 27, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.threads.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_7threads_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_7threads_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_7threads_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_7threads_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 27, __pyx_L1_error)
+  __pyx_v_self->threads = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.threads.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":28
+ *     cdef public int iterations
+ *     cdef public int threads
+ *     cdef public str rollout             # <<<<<<<<<<<<<<
+ *     cdef public int rollout_turns
+ *     cdef public double exploration
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_7rollout_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_7rollout_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_7rollout___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_7rollout___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __Pyx_INCREF(__pyx_v_self->rollout);
+  __pyx_r = __pyx_v_self->rollout;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_7rollout_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_7rollout_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_7rollout_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_7rollout_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__set__", 0);
+  __pyx_t_1 = __pyx_v_value;
+  __Pyx_INCREF(__pyx_t_1);
+  if (!(likely(PyUnicode_CheckExact(__pyx_t_1))||((__pyx_t_1) == Py_None) || __Pyx_RaiseUnexpectedTypeError("str", __pyx_t_1))) __PYX_ERR(1, 28, __pyx_L1_error)
+  __Pyx_GIVEREF(__pyx_t_1);
+  __Pyx_GOTREF(__pyx_v_self->rollout);
+  __Pyx_DECREF(__pyx_v_self->rollout);
+  __pyx_v_self->rollout = ((PyObject*)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.rollout.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_7rollout_5__del__(PyObject *__pyx_v_self); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_7rollout_5__del__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_7rollout_4__del__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_7rollout_4__del__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__del__", 0);
+  __Pyx_INCREF(Py_None);
+  __Pyx_GIVEREF(Py_None);
+  __Pyx_GOTREF(__pyx_v_self->rollout);
+  __Pyx_DECREF(__pyx_v_self->rollout);
+  __pyx_v_self->rollout = ((PyObject*)Py_None);
+
+  /* function exit code */
+  __pyx_r = 0;
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":29
+ *     cdef public int threads
+ *     cdef public str rollout
+ *     cdef public int rollout_turns             # <<<<<<<<<<<<<<
+ *     cdef public double exploration
+ *     cdef public double evaluation_scale
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_13rollout_turns_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_13rollout_turns_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_13rollout_turns___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_13rollout_turns___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->rollout_turns); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 29, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.rollout_turns.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_13rollout_turns_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_13rollout_turns_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_13rollout_turns_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_13rollout_turns_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 29, __pyx_L1_error)
+  __pyx_v_self->rollout_turns = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.rollout_turns.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":30
+ *     cdef public str rollout
+ *     cdef public int rollout_turns
+ *     cdef public double exploration             # <<<<<<<<<<<<<<
+ *     cdef public double evaluation_scale
+ *     cdef public bint reuse_tree
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_11exploration_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_11exploration_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_11exploration___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_11exploration___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->exploration); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.exploration.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_11exploration_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_11exploration_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_11exploration_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_11exploration_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  double __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyFloat_AsDouble(__pyx_v_value); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 30, __pyx_L1_error)
+  __pyx_v_self->exploration = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.exploration.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":31
+ *     cdef public int rollout_turns
+ *     cdef public double exploration
+ *     cdef public double evaluation_scale             # <<<<<<<<<<<<<<
+ *     cdef public bint reuse_tree
+ *     cdef public int max_nodes
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_16evaluation_scale_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_16evaluation_scale_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_16evaluation_scale___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_16evaluation_scale___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = PyFloat_FromDouble(__pyx_v_self->evaluation_scale); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 31, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.evaluation_scale.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_16evaluation_scale_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_16evaluation_scale_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_16evaluation_scale_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_16evaluation_scale_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  double __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyFloat_AsDouble(__pyx_v_value); if (unlikely((__pyx_t_1 == (double)-1) && PyErr_Occurred())) __PYX_ERR(1, 31, __pyx_L1_error)
+  __pyx_v_self->evaluation_scale = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.evaluation_scale.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":32
+ *     cdef public double exploration
+ *     cdef public double evaluation_scale
+ *     cdef public bint reuse_tree             # <<<<<<<<<<<<<<
+ *     cdef public int max_nodes
+ *     cdef readonly int last_iterations
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_10reuse_tree_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_10reuse_tree_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10reuse_tree___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10reuse_tree___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyBool_FromLong(__pyx_v_self->reuse_tree); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 32, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.reuse_tree.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_10reuse_tree_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_10reuse_tree_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10reuse_tree_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_10reuse_tree_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyObject_IsTrue(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 32, __pyx_L1_error)
+  __pyx_v_self->reuse_tree = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.reuse_tree.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":33
+ *     cdef public double evaluation_scale
+ *     cdef public bint reuse_tree
+ *     cdef public int max_nodes             # <<<<<<<<<<<<<<
+ *     cdef readonly int last_iterations
+ *     cdef readonly int reused_visits
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9max_nodes_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_9max_nodes_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9max_nodes___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_9max_nodes___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->max_nodes); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 33, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.max_nodes.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* Python wrapper */
+static int __pyx_pw_11nonaga_mcts_4MCTS_9max_nodes_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value); /*proto*/
+static int __pyx_pw_11nonaga_mcts_4MCTS_9max_nodes_3__set__(PyObject *__pyx_v_self, PyObject *__pyx_v_value) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  int __pyx_r;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__set__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_9max_nodes_2__set__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), ((PyObject *)__pyx_v_value));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static int __pyx_pf_11nonaga_mcts_4MCTS_9max_nodes_2__set__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, PyObject *__pyx_v_value) {
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __pyx_t_1 = __Pyx_PyLong_As_int(__pyx_v_value); if (unlikely((__pyx_t_1 == (int)-1) && PyErr_Occurred())) __PYX_ERR(1, 33, __pyx_L1_error)
+  __pyx_v_self->max_nodes = __pyx_t_1;
+
+  /* function exit code */
+  __pyx_r = 0;
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.max_nodes.__set__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = -1;
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":34
+ *     cdef public bint reuse_tree
+ *     cdef public int max_nodes
+ *     cdef readonly int last_iterations             # <<<<<<<<<<<<<<
+ *     cdef readonly int reused_visits
+ * 
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_15last_iterations_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_15last_iterations_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_15last_iterations___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_15last_iterations___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->last_iterations); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 34, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.last_iterations.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_mcts.pxd":35
+ *     cdef public int max_nodes
+ *     cdef readonly int last_iterations
+ *     cdef readonly int reused_visits             # <<<<<<<<<<<<<<
+ * 
+ *     cdef NodePool pool
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_13reused_visits_1__get__(PyObject *__pyx_v_self); /*proto*/
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_13reused_visits_1__get__(PyObject *__pyx_v_self) {
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__get__ (wrapper)", 0);
+  __pyx_kwvalues = __Pyx_KwValues_VARARGS(__pyx_args, __pyx_nargs);
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_13reused_visits___get__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_13reused_visits___get__(struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__get__", 0);
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_1 = __Pyx_PyLong_From_int(__pyx_v_self->reused_visits); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 35, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_r = __pyx_t_1;
+  __pyx_t_1 = 0;
+  goto __pyx_L0;
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.reused_visits.__get__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_11__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_11nonaga_mcts_4MCTS_11__reduce_cython__ = {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_11__reduce_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__reduce_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  if (unlikely(__pyx_nargs > 0)) { __Pyx_RaiseArgtupleInvalid("__reduce_cython__", 1, 0, 0, __pyx_nargs); return NULL; }
+  const Py_ssize_t __pyx_kwds_len = unlikely(__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+  if (unlikely(__pyx_kwds_len < 0)) return NULL;
+  if (unlikely(__pyx_kwds_len > 0)) {__Pyx_RejectKeywords("__reduce_cython__", __pyx_kwds); return NULL;}
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_10__reduce_cython__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self));
+
+  /* function exit code */
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_10__reduce_cython__(CYTHON_UNUSED struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__reduce_cython__", 0);
+
+  /* "(tree fragment)":2
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(2, 2, __pyx_L1_error)
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.__reduce_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+/* Python wrapper */
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_13__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+); /*proto*/
+static PyMethodDef __pyx_mdef_11nonaga_mcts_4MCTS_13__setstate_cython__ = {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0};
+static PyObject *__pyx_pw_11nonaga_mcts_4MCTS_13__setstate_cython__(PyObject *__pyx_v_self, 
+#if CYTHON_METH_FASTCALL
+PyObject *const *__pyx_args, Py_ssize_t __pyx_nargs, PyObject *__pyx_kwds
+#else
+PyObject *__pyx_args, PyObject *__pyx_kwds
+#endif
+) {
+  CYTHON_UNUSED PyObject *__pyx_v___pyx_state = 0;
+  #if !CYTHON_METH_FASTCALL
+  CYTHON_UNUSED Py_ssize_t __pyx_nargs;
+  #endif
+  CYTHON_UNUSED PyObject *const *__pyx_kwvalues;
+  PyObject* values[1] = {0};
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyObject *__pyx_r = 0;
+  __Pyx_RefNannyDeclarations
+  __Pyx_RefNannySetupContext("__setstate_cython__ (wrapper)", 0);
+  #if !CYTHON_METH_FASTCALL
+  #if CYTHON_ASSUME_SAFE_SIZE
+  __pyx_nargs = PyTuple_GET_SIZE(__pyx_args);
+  #else
+  __pyx_nargs = PyTuple_Size(__pyx_args); if (unlikely(__pyx_nargs < 0)) return NULL;
+  #endif
+  #endif
+  __pyx_kwvalues = __Pyx_KwValues_FASTCALL(__pyx_args, __pyx_nargs);
+  {
+    PyObject ** const __pyx_pyargnames[] = {&__pyx_mstate_global->__pyx_n_u_pyx_state,0};
+    const Py_ssize_t __pyx_kwds_len = (__pyx_kwds) ? __Pyx_NumKwargs_FASTCALL(__pyx_kwds) : 0;
+    if (unlikely(__pyx_kwds_len) < 0) __PYX_ERR(2, 3, __pyx_L3_error)
+    if (__pyx_kwds_len > 0) {
+      switch (__pyx_nargs) {
+        case  1:
+        values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+        if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(2, 3, __pyx_L3_error)
+        CYTHON_FALLTHROUGH;
+        case  0: break;
+        default: goto __pyx_L5_argtuple_error;
+      }
+      const Py_ssize_t kwd_pos_args = __pyx_nargs;
+      if (__Pyx_ParseKeywords(__pyx_kwds, __pyx_kwvalues, __pyx_pyargnames, 0, values, kwd_pos_args, __pyx_kwds_len, "__setstate_cython__", 0) < (0)) __PYX_ERR(2, 3, __pyx_L3_error)
+      for (Py_ssize_t i = __pyx_nargs; i < 1; i++) {
+        if (unlikely(!values[i])) { __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, i); __PYX_ERR(2, 3, __pyx_L3_error) }
+      }
+    } else if (unlikely(__pyx_nargs != 1)) {
+      goto __pyx_L5_argtuple_error;
+    } else {
+      values[0] = __Pyx_ArgRef_FASTCALL(__pyx_args, 0);
+      if (!CYTHON_ASSUME_SAFE_MACROS && unlikely(!values[0])) __PYX_ERR(2, 3, __pyx_L3_error)
+    }
+    __pyx_v___pyx_state = values[0];
+  }
+  goto __pyx_L6_skip;
+  __pyx_L5_argtuple_error:;
+  __Pyx_RaiseArgtupleInvalid("__setstate_cython__", 1, 1, 1, __pyx_nargs); __PYX_ERR(2, 3, __pyx_L3_error)
+  __pyx_L6_skip:;
+  goto __pyx_L4_argument_unpacking_done;
+  __pyx_L3_error:;
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __Pyx_RefNannyFinishContext();
+  return NULL;
+  __pyx_L4_argument_unpacking_done:;
+  __pyx_r = __pyx_pf_11nonaga_mcts_4MCTS_12__setstate_cython__(((struct __pyx_obj_11nonaga_mcts_MCTS *)__pyx_v_self), __pyx_v___pyx_state);
+
+  /* function exit code */
+  for (Py_ssize_t __pyx_temp=0; __pyx_temp < (Py_ssize_t)(sizeof(values)/sizeof(values[0])); ++__pyx_temp) {
+    Py_XDECREF(values[__pyx_temp]);
+  }
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+static PyObject *__pyx_pf_11nonaga_mcts_4MCTS_12__setstate_cython__(CYTHON_UNUSED struct __pyx_obj_11nonaga_mcts_MCTS *__pyx_v_self, CYTHON_UNUSED PyObject *__pyx_v___pyx_state) {
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__setstate_cython__", 0);
+
+  /* "(tree fragment)":4
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"             # <<<<<<<<<<<<<<
+*/
+  __Pyx_Raise(((PyObject *)(((PyTypeObject*)PyExc_TypeError))), __pyx_mstate_global->__pyx_kp_u_no_default___reduce___due_to_non, 0, 0);
+  __PYX_ERR(2, 4, __pyx_L1_error)
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_AddTraceback("nonaga_mcts.MCTS.__setstate_cython__", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = NULL;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+static struct __pyx_vtabstruct_11nonaga_mcts_MCTS __pyx_vtable_11nonaga_mcts_MCTS;
+
+static PyObject *__pyx_tp_new_11nonaga_mcts_MCTS(PyTypeObject *t, CYTHON_UNUSED PyObject *a, CYTHON_UNUSED PyObject *k) {
+  struct __pyx_obj_11nonaga_mcts_MCTS *p;
+  PyObject *o;
+  o = __Pyx_AllocateExtensionType(t, 0);
+  if (unlikely(!o)) return 0;
+  p = ((struct __pyx_obj_11nonaga_mcts_MCTS *)o);
+  p->__pyx_vtab = __pyx_vtabptr_11nonaga_mcts_MCTS;
+  p->parameter = Py_None; Py_INCREF(Py_None);
+  p->rollout = ((PyObject*)Py_None); Py_INCREF(Py_None);
+  if (unlikely(__pyx_pw_11nonaga_mcts_4MCTS_1__cinit__(o, __pyx_mstate_global->__pyx_empty_tuple, NULL) < 0)) goto bad;
+  return o;
+  bad:
+  Py_DECREF(o); o = 0;
+  return NULL;
+}
+
+static void __pyx_tp_dealloc_11nonaga_mcts_MCTS(PyObject *o) {
+  struct __pyx_obj_11nonaga_mcts_MCTS *p = (struct __pyx_obj_11nonaga_mcts_MCTS *)o;
+  #if CYTHON_USE_TP_FINALIZE
+  if (unlikely(__Pyx_PyObject_GetSlot(o, tp_finalize, destructor)) && !__Pyx_PyObject_GC_IsFinalized(o)) {
+    if (__Pyx_PyObject_GetSlot(o, tp_dealloc, destructor) == __pyx_tp_dealloc_11nonaga_mcts_MCTS) {
+      if (PyObject_CallFinalizerFromDealloc(o)) return;
+    }
+  }
+  #endif
+  PyObject_GC_UnTrack(o);
+  {
+    PyObject *etype, *eval, *etb;
+    PyErr_Fetch(&etype, &eval, &etb);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) + 1);
+    __pyx_pw_11nonaga_mcts_4MCTS_3__dealloc__(o);
+    __Pyx_SET_REFCNT(o, Py_REFCNT(o) - 1);
+    PyErr_Restore(etype, eval, etb);
+  }
+  Py_CLEAR(p->parameter);
+  Py_CLEAR(p->rollout);
+  PyTypeObject *tp = Py_TYPE(o);
+  #if CYTHON_USE_TYPE_SLOTS
+  (*tp->tp_free)(o);
+  #else
+  {
+    freefunc tp_free = (freefunc)PyType_GetSlot(tp, Py_tp_free);
+    if (tp_free) tp_free(o);
+  }
+  #endif
+  #if CYTHON_USE_TYPE_SPECS
+  Py_DECREF(tp);
+  #endif
+}
+
+static int __pyx_tp_traverse_11nonaga_mcts_MCTS(PyObject *o, visitproc v, void *a) {
+  int e;
+  struct __pyx_obj_11nonaga_mcts_MCTS *p = (struct __pyx_obj_11nonaga_mcts_MCTS *)o;
+  {
+    e = __Pyx_call_type_traverse(o, 1, v, a);
+    if (e) return e;
+  }
+  if (p->parameter) {
+    e = (*v)(p->parameter, a); if (e) return e;
+  }
+  return 0;
+}
+
+static int __pyx_tp_clear_11nonaga_mcts_MCTS(PyObject *o) {
+  PyObject* tmp;
+  struct __pyx_obj_11nonaga_mcts_MCTS *p = (struct __pyx_obj_11nonaga_mcts_MCTS *)o;
+  tmp = ((PyObject*)p->parameter);
+  p->parameter = Py_None; Py_INCREF(Py_None);
+  Py_XDECREF(tmp);
+  return 0;
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_tree_size(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_9tree_size_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_parameter(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_9parameter_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_parameter(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_9parameter_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_11nonaga_mcts_4MCTS_9parameter_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_max_color(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_9max_color_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_max_color(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_9max_color_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_time_limit(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_10time_limit_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_time_limit(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_10time_limit_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_iterations(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_10iterations_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_iterations(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_10iterations_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_threads(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_7threads_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_threads(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_7threads_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_rollout(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_7rollout_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_rollout(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_7rollout_3__set__(o, v);
+  }
+  else {
+    return __pyx_pw_11nonaga_mcts_4MCTS_7rollout_5__del__(o);
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_rollout_turns(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_13rollout_turns_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_rollout_turns(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_13rollout_turns_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_exploration(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_11exploration_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_exploration(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_11exploration_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_evaluation_scale(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_16evaluation_scale_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_evaluation_scale(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_16evaluation_scale_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_reuse_tree(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_10reuse_tree_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_reuse_tree(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_10reuse_tree_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_max_nodes(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_9max_nodes_1__get__(o);
+}
+
+static int __pyx_setprop_11nonaga_mcts_4MCTS_max_nodes(PyObject *o, PyObject *v, CYTHON_UNUSED void *x) {
+  if (v) {
+    return __pyx_pw_11nonaga_mcts_4MCTS_9max_nodes_3__set__(o, v);
+  }
+  else {
+    PyErr_SetString(PyExc_NotImplementedError, "__del__");
+    return -1;
+  }
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_last_iterations(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_15last_iterations_1__get__(o);
+}
+
+static PyObject *__pyx_getprop_11nonaga_mcts_4MCTS_reused_visits(PyObject *o, CYTHON_UNUSED void *x) {
+  return __pyx_pw_11nonaga_mcts_4MCTS_13reused_visits_1__get__(o);
+}
+
+static PyMethodDef __pyx_methods_11nonaga_mcts_MCTS[] = {
+  {"_run", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_7_run, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__reduce_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_11__reduce_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {"__setstate_cython__", (PyCFunction)(void(*)(void))(__Pyx_PyCFunction_FastCallWithKeywords)__pyx_pw_11nonaga_mcts_4MCTS_13__setstate_cython__, __Pyx_METH_FASTCALL|METH_KEYWORDS, 0},
+  {0, 0, 0, 0}
+};
+
+static struct PyGetSetDef __pyx_getsets_11nonaga_mcts_MCTS[] = {
+  {"tree_size", __pyx_getprop_11nonaga_mcts_4MCTS_tree_size, 0, 0, 0},
+  {"parameter", __pyx_getprop_11nonaga_mcts_4MCTS_parameter, __pyx_setprop_11nonaga_mcts_4MCTS_parameter, 0, 0},
+  {"max_color", __pyx_getprop_11nonaga_mcts_4MCTS_max_color, __pyx_setprop_11nonaga_mcts_4MCTS_max_color, 0, 0},
+  {"time_limit", __pyx_getprop_11nonaga_mcts_4MCTS_time_limit, __pyx_setprop_11nonaga_mcts_4MCTS_time_limit, 0, 0},
+  {"iterations", __pyx_getprop_11nonaga_mcts_4MCTS_iterations, __pyx_setprop_11nonaga_mcts_4MCTS_iterations, 0, 0},
+  {"threads", __pyx_getprop_11nonaga_mcts_4MCTS_threads, __pyx_setprop_11nonaga_mcts_4MCTS_threads, 0, 0},
+  {"rollout", __pyx_getprop_11nonaga_mcts_4MCTS_rollout, __pyx_setprop_11nonaga_mcts_4MCTS_rollout, 0, 0},
+  {"rollout_turns", __pyx_getprop_11nonaga_mcts_4MCTS_rollout_turns, __pyx_setprop_11nonaga_mcts_4MCTS_rollout_turns, 0, 0},
+  {"exploration", __pyx_getprop_11nonaga_mcts_4MCTS_exploration, __pyx_setprop_11nonaga_mcts_4MCTS_exploration, 0, 0},
+  {"evaluation_scale", __pyx_getprop_11nonaga_mcts_4MCTS_evaluation_scale, __pyx_setprop_11nonaga_mcts_4MCTS_evaluation_scale, 0, 0},
+  {"reuse_tree", __pyx_getprop_11nonaga_mcts_4MCTS_reuse_tree, __pyx_setprop_11nonaga_mcts_4MCTS_reuse_tree, 0, 0},
+  {"max_nodes", __pyx_getprop_11nonaga_mcts_4MCTS_max_nodes, __pyx_setprop_11nonaga_mcts_4MCTS_max_nodes, 0, 0},
+  {"last_iterations", __pyx_getprop_11nonaga_mcts_4MCTS_last_iterations, 0, 0, 0},
+  {"reused_visits", __pyx_getprop_11nonaga_mcts_4MCTS_reused_visits, 0, 0, 0},
+  {0, 0, 0, 0, 0}
+};
+#if CYTHON_USE_TYPE_SPECS
+static PyType_Slot __pyx_type_11nonaga_mcts_MCTS_slots[] = {
+  {Py_tp_dealloc, (void *)__pyx_tp_dealloc_11nonaga_mcts_MCTS},
+  {Py_tp_doc, (void *)PyDoc_STR("Monte Carlo tree search player with the get_best_move interface of AI.\n\n    The tree alternates piece and tile moves, so the wide tile move phase is\n    sampled move by move (UCT) instead of being searched exhaustively. Leaves\n    are valued by a rollout, whose piece moves can be guided by cost_function,\n    or directly by cost_function, mapped to a win probability.\n\n    The search runs on threads that only hold the GIL to look at the clock:\n    positions are played on C copies (nonaga_position) and the tree is shared\n    under a lock, with virtual losses spreading the threads over different\n    branches. The tree is kept between moves: when the game reaches a position\n    of the previous tree, its subtree becomes the new tree.\n    ")},
+  {Py_tp_traverse, (void *)__pyx_tp_traverse_11nonaga_mcts_MCTS},
+  {Py_tp_clear, (void *)__pyx_tp_clear_11nonaga_mcts_MCTS},
+  {Py_tp_methods, (void *)__pyx_methods_11nonaga_mcts_MCTS},
+  {Py_tp_getset, (void *)__pyx_getsets_11nonaga_mcts_MCTS},
+  {Py_tp_init, (void *)__pyx_pw_11nonaga_mcts_4MCTS_5__init__},
+  {Py_tp_new, (void *)__pyx_tp_new_11nonaga_mcts_MCTS},
+  {0, 0},
+};
+static PyType_Spec __pyx_type_11nonaga_mcts_MCTS_spec = {
+  "nonaga_mcts.MCTS",
+  sizeof(struct __pyx_obj_11nonaga_mcts_MCTS),
+  0,
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC,
+  __pyx_type_11nonaga_mcts_MCTS_slots,
+};
+#else
+
+static PyTypeObject __pyx_type_11nonaga_mcts_MCTS = {
+  PyVarObject_HEAD_INIT(0, 0)
+  "nonaga_mcts.""MCTS", /*tp_name*/
+  sizeof(struct __pyx_obj_11nonaga_mcts_MCTS), /*tp_basicsize*/
+  0, /*tp_itemsize*/
+  __pyx_tp_dealloc_11nonaga_mcts_MCTS, /*tp_dealloc*/
+  0, /*tp_vectorcall_offset*/
+  0, /*tp_getattr*/
+  0, /*tp_setattr*/
+  0, /*tp_as_async*/
+  0, /*tp_repr*/
+  0, /*tp_as_number*/
+  0, /*tp_as_sequence*/
+  0, /*tp_as_mapping*/
+  0, /*tp_hash*/
+  0, /*tp_call*/
+  0, /*tp_str*/
+  0, /*tp_getattro*/
+  0, /*tp_setattro*/
+  0, /*tp_as_buffer*/
+  Py_TPFLAGS_DEFAULT|Py_TPFLAGS_HAVE_VERSION_TAG|Py_TPFLAGS_CHECKTYPES|Py_TPFLAGS_HAVE_NEWBUFFER|Py_TPFLAGS_BASETYPE|Py_TPFLAGS_HAVE_GC, /*tp_flags*/
+  PyDoc_STR("Monte Carlo tree search player with the get_best_move interface of AI.\n\n    The tree alternates piece and tile moves, so the wide tile move phase is\n    sampled move by move (UCT) instead of being searched exhaustively. Leaves\n    are valued by a rollout, whose piece moves can be guided by cost_function,\n    or directly by cost_function, mapped to a win probability.\n\n    The search runs on threads that only hold the GIL to look at the clock:\n    positions are played on C copies (nonaga_position) and the tree is shared\n    under a lock, with virtual losses spreading the threads over different\n    branches. The tree is kept between moves: when the game reaches a position\n    of the previous tree, its subtree becomes the new tree.\n    "), /*tp_doc*/
+  __pyx_tp_traverse_11nonaga_mcts_MCTS, /*tp_traverse*/
+  __pyx_tp_clear_11nonaga_mcts_MCTS, /*tp_clear*/
+  0, /*tp_richcompare*/
+  0, /*tp_weaklistoffset*/
+  0, /*tp_iter*/
+  0, /*tp_iternext*/
+  __pyx_methods_11nonaga_mcts_MCTS, /*tp_methods*/
+  0, /*tp_members*/
+  __pyx_getsets_11nonaga_mcts_MCTS, /*tp_getset*/
+  0, /*tp_base*/
+  0, /*tp_dict*/
+  0, /*tp_descr_get*/
+  0, /*tp_descr_set*/
+  #if !CYTHON_USE_TYPE_SPECS
+  0, /*tp_dictoffset*/
+  #endif
+  __pyx_pw_11nonaga_mcts_4MCTS_5__init__, /*tp_init*/
+  0, /*tp_alloc*/
+  __pyx_tp_new_11nonaga_mcts_MCTS, /*tp_new*/
+  0, /*tp_free*/
+  0, /*tp_is_gc*/
+  0, /*tp_bases*/
+  0, /*tp_mro*/
+  0, /*tp_cache*/
+  0, /*tp_subclasses*/
+  0, /*tp_weaklist*/
+  0, /*tp_del*/
+  0, /*tp_version_tag*/
+  #if CYTHON_USE_TP_FINALIZE
+  0, /*tp_finalize*/
+  #else
+  NULL, /*tp_finalize*/
+  #endif
+  #if !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07030800
+  0, /*tp_vectorcall*/
+  #endif
+  #if __PYX_NEED_TP_PRINT_SLOT == 1
+  0, /*tp_print*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000
+  0, /*tp_watched*/
+  #endif
+  #if PY_VERSION_HEX >= 0x030d00A4
+  0, /*tp_versions_used*/
+  #endif
+  #if CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX >= 0x03090000 && PY_VERSION_HEX < 0x030a0000
+  0, /*tp_pypy_flags*/
+  #endif
+};
+#endif
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __pyx_vtabptr_11nonaga_mcts_MCTS = &__pyx_vtable_11nonaga_mcts_MCTS;
+  __pyx_vtable_11nonaga_mcts_MCTS._iterate = (int (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, unsigned PY_LONG_LONG *))__pyx_f_11nonaga_mcts_4MCTS__iterate;
+  __pyx_vtable_11nonaga_mcts_MCTS._expand = (int (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, struct __pyx_t_15nonaga_position_Position *))__pyx_f_11nonaga_mcts_4MCTS__expand;
+  __pyx_vtable_11nonaga_mcts_MCTS._select = (int (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, int))__pyx_f_11nonaga_mcts_4MCTS__select;
+  __pyx_vtable_11nonaga_mcts_MCTS._simulate = (double (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, struct __pyx_t_15nonaga_position_Position *, int, unsigned PY_LONG_LONG *))__pyx_f_11nonaga_mcts_4MCTS__simulate;
+  __pyx_vtable_11nonaga_mcts_MCTS._evaluate = (double (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, struct __pyx_t_15nonaga_position_Position const *))__pyx_f_11nonaga_mcts_4MCTS__evaluate;
+  __pyx_vtable_11nonaga_mcts_MCTS._find_node = (int (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, struct __pyx_t_15nonaga_position_Position *, struct __pyx_t_15nonaga_position_Position const *, int))__pyx_f_11nonaga_mcts_4MCTS__find_node;
+  __pyx_vtable_11nonaga_mcts_MCTS._reroot = (void (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, int))__pyx_f_11nonaga_mcts_4MCTS__reroot;
+  __pyx_vtable_11nonaga_mcts_MCTS._best_move = (int (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, struct __pyx_t_15nonaga_position_Position *))__pyx_f_11nonaga_mcts_4MCTS__best_move;
+  __pyx_vtable_11nonaga_mcts_MCTS._child_with_move = (int (*)(struct __pyx_obj_11nonaga_mcts_MCTS *, int, int))__pyx_f_11nonaga_mcts_4MCTS__child_with_move;
+  __pyx_vtable_11nonaga_mcts_MCTS.get_best_move = (PyObject *(*)(struct __pyx_obj_11nonaga_mcts_MCTS *, struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch))__pyx_f_11nonaga_mcts_4MCTS_get_best_move;
+  #if CYTHON_USE_TYPE_SPECS
+  __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS = (PyTypeObject *) __Pyx_PyType_FromModuleAndSpec(__pyx_m, &__pyx_type_11nonaga_mcts_MCTS_spec, NULL); if (unlikely(!__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_fix_up_extension_type_from_spec(&__pyx_type_11nonaga_mcts_MCTS_spec, __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  #else
+  __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS = &__pyx_type_11nonaga_mcts_MCTS;
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  #endif
+  #if !CYTHON_USE_TYPE_SPECS
+  if (__Pyx_PyType_Ready(__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount((PyObject*)__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS);
+  #endif
+  #if !CYTHON_COMPILING_IN_LIMITED_API
+  if ((CYTHON_USE_TYPE_SLOTS && CYTHON_USE_PYTYPE_LOOKUP) && likely(!__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS->tp_dictoffset && __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS->tp_getattro == PyObject_GenericGetAttr)) {
+    __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS->tp_getattro = PyObject_GenericGetAttr;
+  }
+  #endif
+  #if CYTHON_UPDATE_DESCRIPTOR_DOC
+  {
+    PyObject *wrapper = PyObject_GetAttrString((PyObject *)__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS, "__init__"); if (unlikely(!wrapper)) __PYX_ERR(0, 115, __pyx_L1_error)
+    if (__Pyx_IS_TYPE(wrapper, &PyWrapperDescr_Type)) {
+      __pyx_wrapperbase_11nonaga_mcts_4MCTS_4__init__ = *((PyWrapperDescrObject *)wrapper)->d_base;
+      __pyx_wrapperbase_11nonaga_mcts_4MCTS_4__init__.doc = __pyx_doc_11nonaga_mcts_4MCTS_4__init__;
+      ((PyWrapperDescrObject *)wrapper)->d_base = &__pyx_wrapperbase_11nonaga_mcts_4MCTS_4__init__;
+    }
+  }
+  #endif
+  if (__Pyx_SetVtable(__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS, __pyx_vtabptr_11nonaga_mcts_MCTS) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_MergeVtables(__pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_MCTS, (PyObject *) __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  if (__Pyx_setup_reduce((PyObject *) __pyx_mstate->__pyx_ptype_11nonaga_mcts_MCTS) < (0)) __PYX_ERR(0, 115, __pyx_L1_error)
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("nonaga_board"); if (unlikely(!__pyx_t_1)) __PYX_ERR(3, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaTilesCoordinates",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates) __PYX_ERR(3, 48, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaTilesCoordinates = (struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaTilesCoordinates)) __PYX_ERR(3, 48, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTile = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaTile",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTile), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTile),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTile), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTile),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTile), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTile),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTile) __PYX_ERR(3, 57, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaTile = (struct __pyx_vtabstruct_12nonaga_board_NonagaTile*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTile); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaTile)) __PYX_ERR(3, 57, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaPiece = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaPiece",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaPiece), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaPiece),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaPiece), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaPiece),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaPiece), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaPiece),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaPiece) __PYX_ERR(3, 61, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaPiece = (struct __pyx_vtabstruct_12nonaga_board_NonagaPiece*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaPiece); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaPiece)) __PYX_ERR(3, 61, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaIsland = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaIsland",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaIsland), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaIsland),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaIsland), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaIsland),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaIsland), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaIsland),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaIsland) __PYX_ERR(3, 68, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaIsland = (struct __pyx_vtabstruct_12nonaga_board_NonagaIsland*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaIsland); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaIsland)) __PYX_ERR(3, 68, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaBoard = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaBoard",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaBoard), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaBoard),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaBoard), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaBoard),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaBoard), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaBoard),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaBoard) __PYX_ERR(3, 98, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaBoard = (struct __pyx_vtabstruct_12nonaga_board_NonagaBoard*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaBoard); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaBoard)) __PYX_ERR(3, 98, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nonaga_logic"); if (unlikely(!__pyx_t_1)) __PYX_ERR(4, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_12nonaga_logic_NonagaLogic = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_logic", "NonagaLogic",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_logic_NonagaLogic), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_logic_NonagaLogic),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_logic_NonagaLogic), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_logic_NonagaLogic),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_logic_NonagaLogic), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_logic_NonagaLogic),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_logic_NonagaLogic) __PYX_ERR(4, 4, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_logic_NonagaLogic = (struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_logic_NonagaLogic); if (unlikely(!__pyx_vtabptr_12nonaga_logic_NonagaLogic)) __PYX_ERR(4, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  {
+    __pyx_t_1 = PyImport_ImportModule("nonaga_position"); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    const char * __pyx_import_signature = __Pyx_PyBytes_AsString(__pyx_mstate_global->__pyx_kp_b_PyObject_struct___pyx_t_15nonaga);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!__pyx_import_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
+    #endif
+    const char * __pyx_import_name = __pyx_import_signature + 592;
+    void (**const __pyx_import_pointers[])(void) = {(void (**)(void))&__pyx_f_15nonaga_position_move_positions, (void (**)(void))&__pyx_f_15nonaga_position_fill_position_tile_moves, (void (**)(void))&__pyx_f_15nonaga_position_fill_position_piece_moves, (void (**)(void))&__pyx_f_15nonaga_position_find_winning_slide, (void (**)(void))&__pyx_f_15nonaga_position_position_won, (void (**)(void))&__pyx_f_15nonaga_position_position_cost, (void (**)(void))&__pyx_f_15nonaga_position_same_position, (void (**)(void))&__pyx_f_15nonaga_position_play_piece_move, (void (**)(void))&__pyx_f_15nonaga_position_play_tile_move, (void (**)(void))&__pyx_f_15nonaga_position_undo_piece_move, (void (**)(void))&__pyx_f_15nonaga_position_undo_tile_move, (void (**)(void))&__pyx_f_15nonaga_position_load_position, (void (**)(void)) NULL};
+    void (**const *__pyx_import_pointer)(void) = __pyx_import_pointers;
+    const char *__pyx_import_current_signature = __pyx_import_signature;
+    while (*__pyx_import_pointer) {
+      if (__Pyx_ImportFunction_3_2_4(__pyx_t_1, __pyx_import_name, *__pyx_import_pointer, __pyx_import_current_signature) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+      ++__pyx_import_pointer;
+      __pyx_import_name = strchr(__pyx_import_name, '\0') + 1;
+      __pyx_import_signature = strchr(__pyx_import_signature, '\0') + 1;
+      if (*__pyx_import_signature != '\0') __pyx_import_current_signature = __pyx_import_signature;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_nonaga_mcts(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_nonaga_mcts},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "nonaga_mcts",
+      0, /* m_doc */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
+    #else
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+/* PyModInitFuncType */
+#ifndef CYTHON_NO_PYINIT_EXPORT
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#else
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
+#endif
+
+__Pyx_PyMODINIT_FUNC PyInit_nonaga_mcts(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_nonaga_mcts(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
+      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
+      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    #endif
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_nonaga_mcts(PyObject *__pyx_pyinit_module)
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'nonaga_mcts' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #else
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
+  #else
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "nonaga_mcts" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = __pyx_t_1;
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  #endif
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    PyErr_Clear();
+    __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  
+__Pyx_RefNannySetupContext("PyInit_nonaga_mcts", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Library function declarations ---*/
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_nonaga_mcts) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "nonaga_mcts")) {
+      if (unlikely((PyDict_SetItemString(modules, "nonaga_mcts", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_variable_export_code(__pyx_mstate);
+  (void)__Pyx_modinit_function_export_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_type_init_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (unlikely((__Pyx_modinit_type_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_function_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+
+  /* "nonaga_mcts.pyx":3
+ * # cython: language_level=3, boundscheck=False, wraparound=False
+ * # Not profiled: its functions run without the GIL, millions of times per search, and trace hooks would dwarf them
+ * import random             # <<<<<<<<<<<<<<
+ * import threading
+ * import time
+*/
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_random, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_random, __pyx_t_2) < (0)) __PYX_ERR(0, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":4
+ * # Not profiled: its functions run without the GIL, millions of times per search, and trace hooks would dwarf them
+ * import random
+ * import threading             # <<<<<<<<<<<<<<
+ * import time
+ * 
+*/
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_threading, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_threading, __pyx_t_2) < (0)) __PYX_ERR(0, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":5
+ * import random
+ * import threading
+ * import time             # <<<<<<<<<<<<<<
+ * 
+ * from libc.stdlib cimport malloc, realloc, free
+*/
+  __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_time, 0, 0, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_time, __pyx_t_2) < (0)) __PYX_ERR(0, 5, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":13
+ *                                PyThread_release_lock, WAIT_LOCK)
+ * 
+ * from nonaga_constants import RED, BLACK, PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ * from nonaga_board cimport MAX_PIECE_MOVES
+ * from nonaga_logic cimport NonagaLogic
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_RED,__pyx_mstate_global->__pyx_n_u_BLACK,__pyx_mstate_global->__pyx_n_u_PIECE_TO_MOVE};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_nonaga_constants, __pyx_imported_names, 3, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 13, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_RED,__pyx_mstate_global->__pyx_n_u_BLACK,__pyx_mstate_global->__pyx_n_u_PIECE_TO_MOVE};
+    for (__pyx_t_3=0; __pyx_t_3 < 3; __pyx_t_3++) {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 13, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 13, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":21
+ *                               position_won, find_winning_slide, position_cost)
+ * 
+ * cdef int _RED = RED             # <<<<<<<<<<<<<<
+ * cdef int _PIECE_TO_MOVE = PIECE_TO_MOVE
+ * 
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_RED); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 21, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyLong_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 21, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_11nonaga_mcts__RED = __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":22
+ * 
+ * cdef int _RED = RED
+ * cdef int _PIECE_TO_MOVE = PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ * 
+ * # Rollout policies
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PIECE_TO_MOVE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 22, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyLong_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 22, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_11nonaga_mcts__PIECE_TO_MOVE = __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":30
+ *     ROLLOUT_GUIDED = 2      # piece moves chosen by cost_function, random tile moves
+ * 
+ * ROLLOUTS = {"none": ROLLOUT_NONE, "random": ROLLOUT_RANDOM, "guided": ROLLOUT_GUIDED}             # <<<<<<<<<<<<<<
+ * 
+ * cdef enum:
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(3); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_4 = __Pyx_PyLong_From___pyx_anon_enum(__pyx_e_11nonaga_mcts_ROLLOUT_NONE); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_none, __pyx_t_4) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyLong_From___pyx_anon_enum(__pyx_e_11nonaga_mcts_ROLLOUT_RANDOM); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_random, __pyx_t_4) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  __pyx_t_4 = __Pyx_PyLong_From___pyx_anon_enum(__pyx_e_11nonaga_mcts_ROLLOUT_GUIDED); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_4);
+  if (PyDict_SetItem(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_guided, __pyx_t_4) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_ROLLOUTS, __pyx_t_2) < (0)) __PYX_ERR(0, 30, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":141
+ *             PyThread_free_lock(self.lock)
+ * 
+ *     def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,             # <<<<<<<<<<<<<<
+ *                  str rollout="guided", int rollout_turns=20, double exploration=1.0,
+ *                  double evaluation_scale=100.0, bint reuse_tree=True, int max_nodes=2000000):
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_BLACK); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyLong_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 141, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_mstate_global->__pyx_k_ = __pyx_t_5;
+
+  /* "nonaga_mcts.pyx":441
+ * 
+ *     #  search
+ *     def _run(self, double deadline, unsigned long long seed):             # <<<<<<<<<<<<<<
+ *         cdef unsigned long long rng = seed | 1
+ *         cdef int k
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11nonaga_mcts_4MCTS_7_run, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_MCTS__run, NULL, __pyx_mstate_global->__pyx_n_u_nonaga_mcts, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[0])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 441, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11nonaga_mcts_MCTS, __pyx_mstate_global->__pyx_n_u_run, __pyx_t_2) < (0)) __PYX_ERR(0, 441, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":454
+ *                 running = False
+ * 
+ *     cpdef tuple get_best_move(self, NonagaLogic game_state):             # <<<<<<<<<<<<<<
+ *         """Returns the best move for the player to move, searched for time_limit seconds or iterations.
+ * 
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11nonaga_mcts_4MCTS_9get_best_move, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_MCTS_get_best_move, NULL, __pyx_mstate_global->__pyx_n_u_nonaga_mcts, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[1])); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (__Pyx_SetItemOnTypeDict(__pyx_mstate_global->__pyx_ptype_11nonaga_mcts_MCTS, __pyx_mstate_global->__pyx_n_u_get_best_move, __pyx_t_2) < (0)) __PYX_ERR(0, 454, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":1
+ * def __reduce_cython__(self):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11nonaga_mcts_4MCTS_11__reduce_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_MCTS___reduce_cython, NULL, __pyx_mstate_global->__pyx_n_u_nonaga_mcts, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[2])); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_reduce_cython, __pyx_t_2) < (0)) __PYX_ERR(2, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "(tree fragment)":3
+ * def __reduce_cython__(self):
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+ * def __setstate_cython__(self, __pyx_state):             # <<<<<<<<<<<<<<
+ *     raise TypeError, "no default __reduce__ due to non-trivial __cinit__"
+*/
+  __pyx_t_2 = __Pyx_CyFunction_New(&__pyx_mdef_11nonaga_mcts_4MCTS_13__setstate_cython__, __Pyx_CYFUNCTION_CCLASS, __pyx_mstate_global->__pyx_n_u_MCTS___setstate_cython, NULL, __pyx_mstate_global->__pyx_n_u_nonaga_mcts, __pyx_mstate_global->__pyx_d, ((PyObject *)__pyx_mstate_global->__pyx_codeobj_tab[3])); if (unlikely(!__pyx_t_2)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  PyUnstable_Object_EnableDeferredRefcount(__pyx_t_2);
+  #endif
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_setstate_cython, __pyx_t_2) < (0)) __PYX_ERR(2, 3, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_mcts.pyx":1
+ * # cython: language_level=3, boundscheck=False, wraparound=False             # <<<<<<<<<<<<<<
+ * # Not profiled: its functions run without the GIL, millions of times per search, and trace hooks would dwarf them
+ * import random
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  if (__pyx_m) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init nonaga_mcts", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      PyErr_Fetch(&tp, &value, &tb);
+      PyState_RemoveModule(&__pyx_moduledef);
+      PyErr_Restore(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init nonaga_mcts");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #else
+  return __pyx_m;
+  #endif
+}
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
+
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+
+  /* Cached unbound methods */
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_items.method_name = &__pyx_mstate->__pyx_n_u_items;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_pop.method_name = &__pyx_mstate->__pyx_n_u_pop;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.type = (PyObject*)&PyDict_Type;
+  __pyx_mstate->__pyx_umethod_PyDict_Type_values.method_name = &__pyx_mstate->__pyx_n_u_values;
+  return 0;
+}
+/* #### Code section: cached_constants ### */
+
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+/* #### Code section: init_constants ### */
+
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  {
+    const struct { const unsigned int length: 10; } index[] = {{49},{21},{26},{179},{37},{39},{31},{16},{1},{1},{8},{7},{6},{18},{2},{9},{50},{14},{5},{4},{22},{24},{9},{18},{13},{20},{3},{8},{6},{4},{18},{18},{5},{6},{8},{16},{11},{8},{10},{13},{11},{12},{6},{13},{5},{10},{4},{1},{8},{9},{10},{8},{16},{11},{4},{9},{12},{3},{11},{14},{12},{6},{10},{17},{13},{10},{3},{7},{13},{4},{7},{4},{4},{12},{10},{12},{19},{5},{6},{8},{9},{7},{4},{10},{6},{793},{635},{80},{9}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (1544 bytes) */
+const char* const cstring = "BZh91AY&SYj\016&\373\000\000\367\377\377\377\377\377\376\375\377\277\377\277\377\377w\277\377\377\372@@@@@@@@@@@@@\000@\000P\005Op\246\332\t\000\000`\303BQ5=OD\375H\365<\217!\252{)6\325\007\211\250\317Ja\006 \000\031\246\246\236\221\211\262OA\222a\032mO)\372&\324A\200\002`\000&\t\200\000\000\000\002`\023\001\014\000\001\030\000\000\rL\020\"jd\207\210\324\332\233A3Q\240\000\003@\000\r\003@\000\001\240\320\000h\004\030\000&\000\002`\230\000\000\000\000&\0010\020\300\000\021\200\000\000\222   \020d\3122\243\3650\206D\332hC4\215\240\000\004`\002d\300\230L\236\204\302z\217Q\303\006p\241\305\260PJ\t\354\036\266\342\214\320\254\232\010\020y\255\025\273H\212#\271\317\002\354\022G\23755!3\264\300\314\303\t3J\325\276\345\235\255 L\001\304\342\036\327[\2108jQ\034\344\024\2665I#\253\026 c\322p\234\250\225\026\022\245Z\245\000\261\206KED\345~s|\330_\252\232\027 \300\252\336\036\200 \006\201b\021\023\210\235\361\315O\202\271\303\351\356\343\266\215\017@\343\226Nn\257\207\030\301\000\021\203,H\213\352\241+\350\243T\263x{,\214\025_\232D\304\3374\236z\261\t\312p\255r\315\267b\333\304B\037\327\204e\274\331O\334j\227\375\362\341PA\334\222;nDaI\ttqM\332}\372\025a\230>m\355\3538\n/\371\364\255\2558\362\010\307{9\234\317iTa\002\316xD\317\316\264\353Q\213\200G\033\241\224\222\265\001\235\200q\257\254\365z,0\026\035U({\263\233\323\272\373\036+\376\227\013\266\3272\237?\257\037\311\243p`\320Q\331\024\025\265\026*\023\362\373-\321\033Y\030\203/\201\003 \357E\215\021~%\330\216\323\202 !\3328\205 \230\014!\006\314\324\254\233\020\347\3660\301B\205\023r?\316\372\327\212\245\r\322\310>S\036\n}\320\310\335\211\344\027\345\235\003\253_\255\314A\272[\031\0147\260UpW!\\8\\_\302\2426\2218\003\005\245f\233\255Yd`S\223B\302\016\022\006\352\264\3400\316\024\030k!'\343\357l\245P\1771\351T\005\367\322\001\337\265\324d\016[t\311^\363\265\362\026$\236Mo[\364\272\337\271\225\264Ig\375w\272\375\216\311\370Qc\227'\215fx\036F\215\231\207\314\305c\302]\010\212\246Wsa\242\213\232\272\001\333s\377p\361\217G\274l""\330\032.\327\3154\355\345\375\201I\2337\341q\252\364:\244\013\251\263\237.2\336[\222\251\312\316\327^#\007f3\021\017\326&\271d`\321\2143;\264\336Ow\023i\233\311\332i\235\220E\265\205\214(!v\264R\275\3535\240\352\236\332iYQ&2PO\nD\014\310\212(\250DDlO\301\024\221\206\301p\313\274\307F\004fF\224\033\303\251\024*!\346@B,\3704\2656[eL\322\347\273\230\315\313\212\021\317u\223\251>$\306\201\335\230\306\356\036\007\374\370\3705\257\002[\3669\352\253k\311\230\340IG\n\363,#yI\315\324p\321\264i\261\336&\0231\303\227I\324\272\362<:\321P\347\220u\021\263\344\224H\223\312Y\263-\336.\3723\201\033\004\224\340^\361\331n\251\354\265\220.)\333\204\nr\317e\3273q\351\320D\320\265r^\354\351\211\336]\233E\232*jU\325;\343\202\226\005\034\277d\352M\211\314\031\223'\233\005\351\255wP\242&2[\320\244*\310N\310f 2J\266\326|\333*\324\210\357\013F\035\226\246Z\006:\215Je\255\254\337g\331\247\355@\322\272}\013q1d\030!C\n\307e\214\r\313L\206{\345\266\305\373\345\310m\310\270\255\273[ \347^\350\03530\261 \205\206\017\025P\033lp\"C\252\201\222O2\255\262\006\375\014F\271\t\347\247m\375I[\003R}\304%)\010\213\014\3079\201?!\307\333\217\322\351\303\014\026\335\315l\"\3072D5\255sX\0253B\312\221Od\241\320\264i\023\"\"\232[\301\224\032\347i\302|\016\354\314\315\0315\366Y.\0140%\272\267\021\250Y\303\221\002\2768\026\342\245$\261Me(3\r|?\026\373S2\030\263A\215\210\342a\322\315(\210\317,s\344\2026dAIRv\260\303[\311\014\314\005\322k\321c\271d\030\215\367C\020\332\210h\203\246\235\270\342U \271\206fa\206\272\210\255]\352y5q\023\334\325\301\354\010\326V>\303\210\323\323\206\355\035\234\371\rh\300CCOqH\3524S\245\270rg\016\247FN\366\021\2127\230\006\241\253N\231Cy\337YfG\004\353GlEj\256\007\205\2549\324`Y\366ewv\177\257\257\301\375\351\021i\201_\343\253\270\020\314\321\3222/0\255\266U\210j\342\n|[3\317\351\277\272[\341*\177\320&\325\211\210\014G\331U\037<\324\217\301\316\272\202\245\215O\275\0068F\002?T\270\3746j\253\221\231\301/ \345SM\266\360h\233\376\266=\310\230\307:\223u\033wZ\331\231\323\320|\350{\\~\030""\307\307Kw\361\206\233,\264O2\036j\345\026d\331\276\356T\255\351wy\245H\016\335\222\306y\324\257q\324\376H\321]\374X\302\237Qk\316_\3618\264\311\2137e\367\323:\207\262ML\351\333R\243`t\274\253\005\275T\251\002^\271\275\360[\222\325\256_\307\242\214S\303C\311\232%\237\202\000$e2y\036\330\316\004\373\360cr\026\271\237,\366\021H\017z\207\310\230\336\221\377\213\271\"\234(H5\007\023}\200";
+    PyObject *data = __Pyx_DecompressString(cstring, 1544, 2);
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (1418 bytes) */
+const char* const cstring = "x\332\245UKs\023G\020\226\303\313\200\t\226\361\003\014)FN\n\260\001\245DLB\002IJ\030\223\340\030[\262\005\025(\310\324hw$\217\275\232\221vfe\213T\2528\352\270\3079\356q\217:\372\250#G\035\367\230\237\300OH\317j\221\005\341b\250\362\256{\246\273\277\376\372\265\312#\305j\0249\254\306\024\022.\"\210{\2652u\221\250 \246\250K\024\023\\\"&\021\247\324\246vvM\200\207C\221E8*ST\023\315\370\222\223*\371\215\324\350\267<\026q\315R2[o\355\255\tE\221\332\"\n-\265\324\226\340\006\311\246\016+\033h\352\264\220T.\263 \2201\342\250\260\\\270\271xg\021\021n#\227nS@A\322+[\016\221\222JC\252\3541G1\216T\253Ne\026=\252\240\226\360brH\tT\007\273a\007\265E9\222T\031\001]%\234\013\025g\204\301\235\361\352Ud3\027\202\260&5\336\017\211#i\266\004\246u\207\264\014'\021'\210\266\010\344\017\350\214Z\375\224c#I\211kmA\006\304\005\232\273LmA\371\3726\211\343\260\231r)TMx\216\rP\nU]\261\233}\302w\270\330\345\310\025\216#<\205\262\277\022\333\306\240\2466\223\244\354P\312\315\373\006\242{u\240\t9\nNM\025\252\026\223}\235\r\274lZ!\236\243\020\306.\265=\213b\214l/&\001\335\270\t\005n2\342\200\326b\234)\214\357\231\232\363\252\024\236k\321_\356\257\346\227\376x\274T\3324Ov\000a\305\355\3028\271\205\032B\236\352\303{\327\343\261P\245\n\227\251T\330d]x\264\274\264\214K\353\370\361\372\323e\214\013\255=x\036@\227\361\032\335S\033\264\262\261\374`c}uu\375Ii\263\264\345Rb\023\267*\211lq\213\211\254%\\(\005\343TZ\016\2741\203f\271\304\242eb\355X\302\021\256MhMp\033\334\214\2366\211\343\365{*-\002\025\333\253\203M\377\002W<na\\\205\271\3041\373\367h\302\301\2059+3%\301\346]~\270\3521\230s\314$\0360\201E\250\311\203m\330\026\214\357`\\#@\r\336{\3200\233\002FM\330\236\003\010\030s\023\021'\253`\201\213\"\\\311\241\325\000\221\326\211\013f\200Z\247n\005\254<ndQ\307\030\366\006'l\214\330T\246\321\006\267\341\021\247\217m\230\213\332A\303\377\327\267\301\005\3353\242')6\023\350\362j2l\311?\254<\227K\323H\370\343f,`\225$u*q\317\223L@Jflh\022\360G\246\"\336\005xL\241\2612\225\306*\3560\000\367\005i\2767\346\301""\3617\307t\217\312Bk\275l\226\035-\\\203\331\364,3\312&s\205s\267\223\252\325\005t\3004\265\220\010(\256+Z\270\201\030W\361k>\005/t\010\204\276/Z8\264\343p\350\317t\237O}\216w\237Ar\363\351<\016\3552\237j\nf\037\276\326\220m\352S\\\3373\026\345m\234\273\225\230;\242\312,\334\377\001Z5\262!g\326{\000$S\025\3468\007\270\346\347+\376\000|\250\210?\335\003\r\267\361.\2137\002K\007>\t\251\201\335\256\340\007\007KH\225\222fK\336]\245\314\217\307\020X\377<\210\232\362`s\207\325\361\371@\355\010b\017\260^\347\337N\244N\316\352\364\333\321\324\311i\277\350\023\377U\220\216FO\267\357\370\367\264\0142\321\330\204\277\240\363\272\030\215\216\265\227\375)0hDc\343\376\t\277\241\217\351R0\033\346\302<\350zc\227\364\357A>(\205\351\177\301{\261\375JO\202\372RX\352Lv\236\354\003\3169\177\321\377;\310\004\337\005$P\275\353w\367s\373+]bB\335\366\277\3603\006tT\217\350ttf\302\237\363\363\346|\314\3773\016\334\033\373\252O`U\217D1\272\347?\324_\303\335\330\331\366?\206\235\266\203\253\341\271\360~H\242\361t\337\365\251\316\351\207\301\265\336\302O\373s\373K\373n\027\210\231\024f \310\264n$\260\245`*\250\206\305\220\030\345\212O\342\353\313\211:\023L\006EH\247w\032\342k\242_\205\347{\271\373\335\271.\260\233\361\225\3769<\022\336\202\014/w\217vW{\205\215\336\306\263\336\263\347\321\3304T\251\025\234\010\032\341\211Pu~\330\277\322=\365\346J\257\360\242\367\342e\357\245\325\263\266{\333;\321\314E};8\026\024\003;\234\357\334\352\024\r\353S:\023\215O\373\025\235\244_\364\267\203\343\201\323\311trCj\252s\375*4Lw\256\033j\tm\025\344\336\036O\235\034o+\377.\360\205\376\005\271\241\n\017Zy\266\255z\347\276\201vm\206P\320)\377\257 \007\207\347a\023h\214\316@kG\364\254\361<\233\0005\201&\371\030\320\244\277fb\004+a\245\003c0\356\217\370\263\372\373x*V:\244\343\231\026w\033Q\372\"\\^\0103\341\217\235<L\303|7\327\315\277\006\373+\001\205\002B\211/A\306\243_\266I\224\236\210\306'\375e=\005Q\033\321\244\251\362\242n\205#a:\314D\347\347` \317_0]o\351\243\372Ap&\334\354\034\201\332\214\317\352\314\353""\221\350\350\251\366u\277\370\037{\316\004\367";
+    PyObject *data = __Pyx_DecompressString(cstring, 1418, 1);
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #else /* compression: none (2675 bytes) */
+const char* const bytes = "A time limit or a number of iterations is needed.No tile can be moved.NonagaGame/nonaga_mcts.pyxNote that Cython is deliberately stricter than PEP-484 and rejects subclasses of builtin types. If you need to pass subclasses then set the 'annotation_typing' directive to False.The player to move has no piece move.The search starts with a piece to move.The search tree could not grow.Unknown rollout .?add_notedisableenable, expected one of gcisenabledno default __reduce__ due to non-trivial __cinit__<stringsource>BLACKMCTSMCTS.__reduce_cython__MCTS.__setstate_cython__MCTS._runMCTS.get_best_movePIECE_TO_MOVE__Pyx_PyDict_NextRefREDROLLOUTSThreadargsasyncio.coroutinescline_in_tracebackcolordaemondeadlineevaluation_scaleexploration__func__game_stateget_best_movegetrandbits__getstate__guided_is_coroutineitemsiterationsjoink__main__max_nodes__module____name__nonaga_constantsnonaga_mctsnoneparameterperf_counterpop__pyx_state__pyx_vtable____qualname__random__reduce____reduce_cython____reduce_ex__reuse_treerngrolloutrollout_turns_runrunningseedself__set_name__setdefault__setstate____setstate_cython__starttarget__test__threadingthreadstimetime_limitvaluesPyObject *(struct __pyx_t_15nonaga_position_Position const *, int, int)\000int (struct __pyx_t_15nonaga_position_Position *, int *)\000int (struct __pyx_t_15nonaga_position_Position const *, int *)\000int (struct __pyx_t_15nonaga_position_Position const *, int)\000\000int (struct __pyx_t_15nonaga_position_Position const *, int, int const *)\000int (struct __pyx_t_15nonaga_position_Position const *, struct __pyx_t_15nonaga_position_Position const *)\000void (struct __pyx_t_15nonaga_position_Position *, int)\000\000\000\000void (struct __pyx_t_15nonaga_position_Position *, struct __pyx_obj_12nonaga_logic_NonagaLogic *)\000move_positions\000fill_position_tile_moves\000fill_position_piece_moves\000find_winning_slide\000position_won\000position_cost\000same_position\000play_piece_move\000play_tile_move\000undo_piece_move\000undo_tile_m""ove\000load_position\200A\360\022\000\t\032\230\021\360\010\000\t\026\220Q\220a\220z\240\021\330\010\013\2108\220<\230s\240!\330\014\022\220*\230A\230Q\330\010\014\210E\220\025\220a\220q\330\014\020\220\007\220q\230\005\230T\240\032\2501\250A\330\010\014\320\014\034\230H\240A\240T\250\021\340\010\013\2104\210z\230\024\230T\240\034\250T\260\024\260U\270!\330\014\023\2204\220{\240!\2403\240a\240t\320+;\2701\270J\300a\330\010\013\2105\220\002\220!\330\014\020\220\010\230\001\230\021\330\r\022\220\"\220A\330\014\020\220\005\220X\230Q\330\010\014\320\014\035\230Q\330\010\014\210L\230\001\330\010\013\2104\210u\220F\230#\230Q\330\014\017\210}\230A\230Q\230d\240'\250\023\250B\250a\330\020\021\330\014\020\220\005\220V\2301\230F\240(\320*:\270\"\270C\270r\300\021\340\010\014\210E\220\027\230\001\230\026\230q\330\010\014\320\014\035\230T\240\025\240g\250Q\250a\340\010\014\210J\220a\330\010\014\320\014\037\230q\330\010\014\320\014!\240\024\240Q\340\010\013\320\013\035\230Q\230a\230z\250\030\3201B\300\"\300A\330\014\027\220t\230=\250\003\2502\250T\260\037\300\004\300L\320PR\320RY\320YZ\330\014\026\220a\220y\240\007\240q\250\007\250t\2607\270&\300\n\310&\320P\\\320\\]\320]c\320cj\320jk\330\027\033\2305\240\005\240Q\240d\250)\2602\260Q\330\014\020\220\n\230!\330\020\026\220f\230A\330\014\020\220\005\220Q\220j\240\006\240l\260!\2601\330\014\020\220\n\230!\330\020\026\220e\2301\330\010\013\2104\210q\330\014\022\220+\230Q\230a\330\010\014\320\014\037\230t\2401\360\006\000\t\020\210t\220;\230a\230s\240!\2401\330\010\013\2105\220\002\220!\330\014\022\220*\230A\230Q\330\010\017\210t\320\023$\240A\240S\250\001\330\010\025\220^\2401\240A\240Z\250v\260Q\330\010\027\220q\230\001\230\032\2401\330\010\017\210t\220;\230a\230v\240Q\240a\330\010\013\2105\220\002\220!\330\014\022\220*\230A\230Q\330\010\024\220N\240!\2401\240J\250f\260A\330\010\020\220\001\220\032\2306\240\032\2501\250J\260a\260u\270J\300a\300q\330\021\033\2306\240\031\250!\2509\260A\260U\270)\3001\300A\200A\330\010&\240e\2502""\250Q\340\010\034\230A\330\010\016\210a\330\021\022\330\020\024\220E\230\025\230a\230q\330\024\027\220t\2304\230y\250\001\250\021\250!\330\030\"\240!\330\030\031\330\014\017\210y\230\004\230D\240\r\250S\260\003\2601\330\020\032\230!\200\001\330\004\n\210+\220Q";
+    PyObject *data = NULL;
+    CYTHON_UNUSED_VAR(__Pyx_DecompressString);
+    #endif
+    PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
+    Py_ssize_t pos = 0;
+    for (int i = 0; i < 85; i++) {
+      Py_ssize_t bytes_length = index[i].length;
+      PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
+      if (likely(string) && i >= 18) PyUnicode_InternInPlace(&string);
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+      stringtab[i] = string;
+      pos += bytes_length;
+    }
+    for (int i = 85; i < 89; i++) {
+      Py_ssize_t bytes_length = index[i].length;
+      PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
+      stringtab[i] = string;
+      pos += bytes_length;
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    Py_XDECREF(data);
+    for (Py_ssize_t i = 0; i < 89; i++) {
+      if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    #if CYTHON_IMMORTAL_CONSTANTS
+    {
+      PyObject **table = stringtab + 85;
+      for (Py_ssize_t i=0; i<4; ++i) {
+        #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+        #if PY_VERSION_HEX < 0x030E0000
+        if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+        #else
+        if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+        #endif
+        {
+          Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+        }
+        #else
+        Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+        #endif
+      }
+    }
+    #endif
+  }
+  {
+    PyObject **numbertab = __pyx_mstate->__pyx_number_tab + 0;
+    int8_t const cint_constants_1[] = {64};
+    for (int i = 0; i < 1; i++) {
+      numbertab[i] = PyLong_FromLong(cint_constants_1[i - 0]);
+      if (unlikely(!numbertab[i])) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  #if CYTHON_IMMORTAL_CONSTANTS
+  {
+    PyObject **table = __pyx_mstate->__pyx_number_tab;
+    for (Py_ssize_t i=0; i<1; ++i) {
+      #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+      #if PY_VERSION_HEX < 0x030E0000
+      if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+      #else
+      if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+      #endif
+      {
+        Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+      }
+      #else
+      Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+      #endif
+    }
+  }
+  #endif
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_codeobjects ### */
+typedef struct {
+    unsigned int argcount : 2;
+    unsigned int num_posonly_args : 1;
+    unsigned int num_kwonly_args : 1;
+    unsigned int nlocals : 3;
+    unsigned int flags : 10;
+    unsigned int first_line : 9;
+} __Pyx_PyCode_New_function_description;
+/* NewCodeObj.proto */
+static PyObject* __Pyx_PyCode_New(
+        const __Pyx_PyCode_New_function_description descr,
+        PyObject * const *varnames,
+        PyObject *filename,
+        PyObject *funcname,
+        PyObject *line_table,
+        PyObject *tuple_dedup_map
+);
+
+
+static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
+  PyObject* tuple_dedup_map = PyDict_New();
+  if (unlikely(!tuple_dedup_map)) return -1;
+  {
+    const __Pyx_PyCode_New_function_description descr = {3, 0, 0, 6, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 441};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_deadline, __pyx_mstate->__pyx_n_u_seed, __pyx_mstate->__pyx_n_u_rng, __pyx_mstate->__pyx_n_u_k, __pyx_mstate->__pyx_n_u_running};
+    __pyx_mstate_global->__pyx_codeobj_tab[0] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_NonagaGame_nonaga_mcts_pyx, __pyx_mstate->__pyx_n_u_run, __pyx_mstate->__pyx_kp_b_iso88591_A_e2Q_A_a_E_aq_t4y_y_D_S_1, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[0])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 454};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_game_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[1] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_NonagaGame_nonaga_mcts_pyx, __pyx_mstate->__pyx_n_u_get_best_move, __pyx_mstate->__pyx_kp_b_iso88591_A_Qaz_8_s_AQ_E_aq_q_T_1A_HAT_4z, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[1])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {1, 0, 0, 1, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 1};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self};
+    __pyx_mstate_global->__pyx_codeobj_tab[2] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_reduce_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[2])) goto bad;
+  }
+  {
+    const __Pyx_PyCode_New_function_description descr = {2, 0, 0, 2, (unsigned int)(CO_OPTIMIZED|CO_NEWLOCALS), 3};
+    PyObject* const varnames[] = {__pyx_mstate->__pyx_n_u_self, __pyx_mstate->__pyx_n_u_pyx_state};
+    __pyx_mstate_global->__pyx_codeobj_tab[3] = __Pyx_PyCode_New(descr, varnames, __pyx_mstate->__pyx_kp_u_stringsource, __pyx_mstate->__pyx_n_u_setstate_cython, __pyx_mstate->__pyx_kp_b_iso88591_Q, tuple_dedup_map); if (unlikely(!__pyx_mstate_global->__pyx_codeobj_tab[3])) goto bad;
+  }
+  Py_DECREF(tuple_dedup_map);
+  return 0;
+  bad:
+  Py_DECREF(tuple_dedup_map);
+  return -1;
+}
+/* #### Code section: init_globals ### */
+
+static int __Pyx_InitGlobals(void) {
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CommonTypesMetaclass.init */
+  if (likely(__pyx_CommonTypesMetaclass_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CachedMethodType.init */
+  #if CYTHON_COMPILING_IN_LIMITED_API
+  {
+      PyObject *typesModule=NULL;
+      typesModule = PyImport_ImportModule("types");
+      if (typesModule) {
+          __pyx_mstate_global->__Pyx_CachedMethodType = PyObject_GetAttrString(typesModule, "MethodType");
+          Py_DECREF(typesModule);
+      }
+  } // error handling follows
+  #endif
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  /* CythonFunctionShared.init */
+  if (likely(__pyx_CyFunction_init(__pyx_m) == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* DivInt[long] */
+static CYTHON_INLINE long __Pyx_div_long(long a, long b, int b_is_constant) {
+    long q = a / b;
+    long r = a - q*b;
+    long adapt_python = (b_is_constant ?
+        ((r != 0) & ((r < 0) ^ (b < 0))) :
+        ((r != 0) & ((r ^ b) < 0))
+    );
+    return q - adapt_python;
+}
+
+/* PyErrFetchRestore (used by WriteUnraisableException) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+    CYTHON_UNUSED_VAR(clineno);
+    CYTHON_UNUSED_VAR(lineno);
+    CYTHON_UNUSED_VAR(filename);
+    CYTHON_MAYBE_UNUSED_VAR(nogil);
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(0);
+    }
+    ctx = PyUnicode_FromString(name);
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+    if (nogil)
+        PyGILState_Release(state);
+}
+
+/* TupleAndListFromArray (used by fastcall) */
+#if !CYTHON_COMPILING_IN_CPYTHON && CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    Py_ssize_t i;
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    for (i = 0; i < n; i++) {
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+        Py_INCREF(src[i]);
+    }
+    return res;
+}
+#elif CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    return res;
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return PyList_New(0);
+    }
+    res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    return res;
+}
+#endif
+
+/* BytesEquals (used by UnicodeEquals) */
+static CYTHON_INLINE int __Pyx_PyBytes_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_GRAAL ||\
+        !(CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS)
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    if (s1 == s2) {
+        return (equals == Py_EQ);
+    } else if (PyBytes_CheckExact(s1) & PyBytes_CheckExact(s2)) {
+        const char *ps1, *ps2;
+        Py_ssize_t length = PyBytes_GET_SIZE(s1);
+        if (length != PyBytes_GET_SIZE(s2))
+            return (equals == Py_NE);
+        ps1 = PyBytes_AS_STRING(s1);
+        ps2 = PyBytes_AS_STRING(s2);
+        if (ps1[0] != ps2[0]) {
+            return (equals == Py_NE);
+        } else if (length == 1) {
+            return (equals == Py_EQ);
+        } else {
+            int result;
+#if CYTHON_USE_UNICODE_INTERNALS && (PY_VERSION_HEX < 0x030B0000)
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyBytesObject*)s1)->ob_shash;
+            hash2 = ((PyBytesObject*)s2)->ob_shash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                return (equals == Py_NE);
+            }
+#endif
+            result = memcmp(ps1, ps2, (size_t)length);
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & PyBytes_CheckExact(s2)) {
+        return (equals == Py_NE);
+    } else if ((s2 == Py_None) & PyBytes_CheckExact(s1)) {
+        return (equals == Py_NE);
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+#endif
+}
+
+/* UnicodeEquals (used by fastcall) */
+static CYTHON_INLINE int __Pyx_PyUnicode_Equals(PyObject* s1, PyObject* s2, int equals) {
+#if CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_GRAAL
+    return PyObject_RichCompareBool(s1, s2, equals);
+#else
+    int s1_is_unicode, s2_is_unicode;
+    if (s1 == s2) {
+        goto return_eq;
+    }
+    s1_is_unicode = PyUnicode_CheckExact(s1);
+    s2_is_unicode = PyUnicode_CheckExact(s2);
+    if (s1_is_unicode & s2_is_unicode) {
+        Py_ssize_t length, length2;
+        int kind;
+        void *data1, *data2;
+        #if !CYTHON_COMPILING_IN_LIMITED_API
+        if (unlikely(__Pyx_PyUnicode_READY(s1) < 0) || unlikely(__Pyx_PyUnicode_READY(s2) < 0))
+            return -1;
+        #endif
+        length = __Pyx_PyUnicode_GET_LENGTH(s1);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(length < 0)) return -1;
+        #endif
+        length2 = __Pyx_PyUnicode_GET_LENGTH(s2);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(length2 < 0)) return -1;
+        #endif
+        if (length != length2) {
+            goto return_ne;
+        }
+#if CYTHON_USE_UNICODE_INTERNALS
+        {
+            Py_hash_t hash1, hash2;
+            hash1 = ((PyASCIIObject*)s1)->hash;
+            hash2 = ((PyASCIIObject*)s2)->hash;
+            if (hash1 != hash2 && hash1 != -1 && hash2 != -1) {
+                goto return_ne;
+            }
+        }
+#endif
+        kind = __Pyx_PyUnicode_KIND(s1);
+        if (kind != __Pyx_PyUnicode_KIND(s2)) {
+            goto return_ne;
+        }
+        data1 = __Pyx_PyUnicode_DATA(s1);
+        data2 = __Pyx_PyUnicode_DATA(s2);
+        if (__Pyx_PyUnicode_READ(kind, data1, 0) != __Pyx_PyUnicode_READ(kind, data2, 0)) {
+            goto return_ne;
+        } else if (length == 1) {
+            goto return_eq;
+        } else {
+            int result = memcmp(data1, data2, (size_t)(length * kind));
+            return (equals == Py_EQ) ? (result == 0) : (result != 0);
+        }
+    } else if ((s1 == Py_None) & s2_is_unicode) {
+        goto return_ne;
+    } else if ((s2 == Py_None) & s1_is_unicode) {
+        goto return_ne;
+    } else {
+        int result;
+        PyObject* py_result = PyObject_RichCompare(s1, s2, equals);
+        if (!py_result)
+            return -1;
+        result = __Pyx_PyObject_IsTrue(py_result);
+        Py_DECREF(py_result);
+        return result;
+    }
+return_eq:
+    return (equals == Py_EQ);
+return_ne:
+    return (equals == Py_NE);
+#endif
+}
+
+/* fastcall */
+#if CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject * __Pyx_GetKwValue_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues, PyObject *s)
+{
+    Py_ssize_t i, n = __Pyx_PyTuple_GET_SIZE(kwnames);
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    if (unlikely(n == -1)) return NULL;
+    #endif
+    for (i = 0; i < n; i++)
+    {
+        PyObject *namei = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!namei)) return NULL;
+        #endif
+        if (s == namei) return kwvalues[i];
+    }
+    for (i = 0; i < n; i++)
+    {
+        PyObject *namei = __Pyx_PyTuple_GET_ITEM(kwnames, i);
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!namei)) return NULL;
+        #endif
+        int eq = __Pyx_PyUnicode_Equals(s, namei, Py_EQ);
+        if (unlikely(eq != 0)) {
+            if (unlikely(eq < 0)) return NULL;
+            return kwvalues[i];
+        }
+    }
+    return NULL;
+}
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030d0000 || CYTHON_COMPILING_IN_LIMITED_API
+CYTHON_UNUSED static PyObject *__Pyx_KwargsAsDict_FASTCALL(PyObject *kwnames, PyObject *const *kwvalues) {
+    Py_ssize_t i, nkwargs;
+    PyObject *dict;
+#if !CYTHON_ASSUME_SAFE_SIZE
+    nkwargs = PyTuple_Size(kwnames);
+    if (unlikely(nkwargs < 0)) return NULL;
+#else
+    nkwargs = PyTuple_GET_SIZE(kwnames);
+#endif
+    dict = PyDict_New();
+    if (unlikely(!dict))
+        return NULL;
+    for (i=0; i<nkwargs; i++) {
+#if !CYTHON_ASSUME_SAFE_MACROS
+        PyObject *key = PyTuple_GetItem(kwnames, i);
+        if (!key) goto bad;
+#else
+        PyObject *key = PyTuple_GET_ITEM(kwnames, i);
+#endif
+        if (unlikely(PyDict_SetItem(dict, key, kwvalues[i]) < 0))
+            goto bad;
+    }
+    return dict;
+bad:
+    Py_DECREF(dict);
+    return NULL;
+}
+#endif
+#endif
+
+/* RaiseArgTupleInvalid */
+static void __Pyx_RaiseArgtupleInvalid(
+    const char* func_name,
+    int exact,
+    Py_ssize_t num_min,
+    Py_ssize_t num_max,
+    Py_ssize_t num_found)
+{
+    Py_ssize_t num_expected;
+    const char *more_or_less;
+    if (num_found < num_min) {
+        num_expected = num_min;
+        more_or_less = "at least";
+    } else {
+        num_expected = num_max;
+        more_or_less = "at most";
+    }
+    if (exact) {
+        more_or_less = "exactly";
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "%.200s() takes %.8s %" CYTHON_FORMAT_SSIZE_T "d positional argument%.1s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+                 func_name, more_or_less, num_expected,
+                 (num_expected == 1) ? "" : "s", num_found);
+}
+
+/* PyObjectCall (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectFastCall (used by PyObjectCallOneArg) */
+#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) != (0)) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+#if CYTHON_VECTORCALL && !CYTHON_COMPILING_IN_LIMITED_API
+  #if PY_VERSION_HEX < 0x03090000
+    #define __Pyx_PyVectorcall_Function(callable) _PyVectorcall_Function(callable)
+  #elif CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
+    PyTypeObject *tp = Py_TYPE(callable);
+    #if defined(__Pyx_CyFunction_USED)
+    if (__Pyx_CyFunction_CheckExact(callable)) {
+        return __Pyx_CyFunction_func_vectorcall(callable);
+    }
+    #endif
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_HAVE_VECTORCALL)) {
+        return NULL;
+    }
+    assert(PyCallable_Check(callable));
+    Py_ssize_t offset = tp->tp_vectorcall_offset;
+    assert(offset > 0);
+    vectorcallfunc ptr;
+    memcpy(&ptr, (char *) callable + offset, sizeof(ptr));
+    return ptr;
+}
+  #else
+    #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
+  #endif
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t _nargs, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+          #if CYTHON_COMPILING_IN_LIMITED_API
+            return PyObject_Vectorcall(func, args, _nargs, NULL);
+          #else
+            vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
+            if (f) {
+                return f(func, args, _nargs, NULL);
+            }
+          #endif
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
+    }
+    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
+    #else
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #endif
+}
+
+/* PyObjectCallOneArg (used by CallUnboundCMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *args[2] = {NULL, arg};
+    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* PyObjectGetAttrStr (used by UnpackUnboundCMethod) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* UnpackUnboundCMethod (used by CallUnboundCMethod0) */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *args, PyObject *kwargs) {
+    PyObject *result;
+    PyObject *selfless_args = PyTuple_GetSlice(args, 1, PyTuple_Size(args));
+    if (unlikely(!selfless_args)) return NULL;
+    result = PyObject_Call(method, selfless_args, kwargs);
+    Py_DECREF(selfless_args);
+    return result;
+}
+#elif CYTHON_COMPILING_IN_PYPY && PY_VERSION_HEX < 0x03090000
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject **args, Py_ssize_t nargs, PyObject *kwnames) {
+        return _PyObject_Vectorcall
+            (method, args ? args+1 : NULL, nargs ? nargs-1 : 0, kwnames);
+}
+#else
+static PyObject *__Pyx_SelflessCall(PyObject *method, PyObject *const *args, Py_ssize_t nargs, PyObject *kwnames) {
+    return
+#if PY_VERSION_HEX < 0x03090000
+    _PyObject_Vectorcall
+#else
+    PyObject_Vectorcall
+#endif
+        (method, args ? args+1 : NULL, nargs ? (size_t) nargs-1 : 0, kwnames);
+}
+#endif
+static PyMethodDef __Pyx_UnboundCMethod_Def = {
+     "CythonUnboundCMethod",
+     __PYX_REINTERPRET_FUNCION(PyCFunction, __Pyx_SelflessCall),
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030C0000
+     METH_VARARGS | METH_KEYWORDS,
+#else
+     METH_FASTCALL | METH_KEYWORDS,
+#endif
+     NULL
+};
+static int __Pyx_TryUnpackUnboundCMethod(__Pyx_CachedCFunction* target) {
+    PyObject *method, *result=NULL;
+    method = __Pyx_PyObject_GetAttrStr(target->type, *target->method_name);
+    if (unlikely(!method))
+        return -1;
+    result = method;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (likely(__Pyx_TypeCheck(method, &PyMethodDescr_Type)))
+    {
+        PyMethodDescrObject *descr = (PyMethodDescrObject*) method;
+        target->func = descr->d_method->ml_meth;
+        target->flag = descr->d_method->ml_flags & ~(METH_CLASS | METH_STATIC | METH_COEXIST | METH_STACKLESS);
+    } else
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+#else
+    if (PyCFunction_Check(method))
+#endif
+    {
+        PyObject *self;
+        int self_found;
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        self = PyObject_GetAttrString(method, "__self__");
+        if (!self) {
+            PyErr_Clear();
+        }
+#else
+        self = PyCFunction_GET_SELF(method);
+#endif
+        self_found = (self && self != Py_None);
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_COMPILING_IN_PYPY
+        Py_XDECREF(self);
+#endif
+        if (self_found) {
+            PyObject *unbound_method = PyCFunction_New(&__Pyx_UnboundCMethod_Def, method);
+            if (unlikely(!unbound_method)) return -1;
+            Py_DECREF(method);
+            result = unbound_method;
+        }
+    }
+#if !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    if (unlikely(target->method)) {
+        Py_DECREF(result);
+    } else
+#endif
+    target->method = result;
+    return 0;
+}
+
+/* CallUnboundCMethod0 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
+    int was_initialized = __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        if (likely(cfunc->flag == METH_NOARGS))
+            return __Pyx_CallCFunction(cfunc, self, NULL);
+        if (likely(cfunc->flag == METH_FASTCALL))
+            return __Pyx_CallCFunctionFast(cfunc, self, NULL, 0);
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, NULL, 0, NULL);
+        if (likely(cfunc->flag == (METH_VARARGS | METH_KEYWORDS)))
+            return __Pyx_CallCFunctionWithKeywords(cfunc, self, __pyx_mstate_global->__pyx_empty_tuple, NULL);
+        if (cfunc->flag == METH_VARARGS)
+            return __Pyx_CallCFunction(cfunc, self, __pyx_mstate_global->__pyx_empty_tuple);
+        return __Pyx__CallUnboundCMethod0(cfunc, self);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod0(&tmp_cfunc, self);
+    }
+#endif
+    PyObject *result = __Pyx__CallUnboundCMethod0(cfunc, self);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod0(__Pyx_CachedCFunction* cfunc, PyObject* self) {
+    PyObject *result;
+    if (unlikely(!cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+    result = __Pyx_PyObject_CallOneArg(cfunc->method, self);
+    return result;
+}
+
+/* py_dict_items (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Items(PyObject* d) {
+    return __Pyx_CallUnboundCMethod0(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_items, d);
+}
+
+/* py_dict_values (used by OwnedDictNext) */
+static CYTHON_INLINE PyObject* __Pyx_PyDict_Values(PyObject* d) {
+    return __Pyx_CallUnboundCMethod0(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_values, d);
+}
+
+/* OwnedDictNext (used by RejectKeywords) */
+#if CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, PyObject **ppos, PyObject **pkey, PyObject **pvalue) {
+    PyObject *next = NULL;
+    if (!*ppos) {
+        if (pvalue) {
+            PyObject *dictview = pkey ? __Pyx_PyDict_Items(p) : __Pyx_PyDict_Values(p);
+            if (unlikely(!dictview)) goto bad;
+            *ppos = PyObject_GetIter(dictview);
+            Py_DECREF(dictview);
+        } else {
+            *ppos = PyObject_GetIter(p);
+        }
+        if (unlikely(!*ppos)) goto bad;
+    }
+    next = PyIter_Next(*ppos);
+    if (!next) {
+        if (PyErr_Occurred()) goto bad;
+        return 0;
+    }
+    if (pkey && pvalue) {
+        *pkey = __Pyx_PySequence_ITEM(next, 0);
+        if (unlikely(*pkey)) goto bad;
+        *pvalue = __Pyx_PySequence_ITEM(next, 1);
+        if (unlikely(*pvalue)) goto bad;
+        Py_DECREF(next);
+    } else if (pkey) {
+        *pkey = next;
+    } else {
+        assert(pvalue);
+        *pvalue = next;
+    }
+    return 1;
+  bad:
+    Py_XDECREF(next);
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+    PyErr_FormatUnraisable("Exception ignored in __Pyx_PyDict_NextRef");
+#else
+    PyErr_WriteUnraisable(__pyx_mstate_global->__pyx_n_u_Pyx_PyDict_NextRef);
+#endif
+    if (pkey) *pkey = NULL;
+    if (pvalue) *pvalue = NULL;
+    return 0;
+}
+#else // !CYTHON_AVOID_BORROWED_REFS
+static int __Pyx_PyDict_NextRef(PyObject *p, Py_ssize_t *ppos, PyObject **pkey, PyObject **pvalue) {
+    int result = PyDict_Next(p, ppos, pkey, pvalue);
+    if (likely(result == 1)) {
+        if (pkey) Py_INCREF(*pkey);
+        if (pvalue) Py_INCREF(*pvalue);
+    }
+    return result;
+}
+#endif
+
+/* RejectKeywords */
+static void __Pyx_RejectKeywords(const char* function_name, PyObject *kwds) {
+    PyObject *key = NULL;
+    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds))) {
+        key = __Pyx_PySequence_ITEM(kwds, 0);
+    } else {
+#if CYTHON_AVOID_BORROWED_REFS
+        PyObject *pos = NULL;
+#else
+        Py_ssize_t pos = 0;
+#endif
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+        if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return;
+#endif
+        __Pyx_PyDict_NextRef(kwds, &pos, &key, NULL);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_XDECREF(pos);
+#endif
+    }
+    if (likely(key)) {
+        PyErr_Format(PyExc_TypeError,
+            "%s() got an unexpected keyword argument '%U'",
+            function_name, key);
+        Py_DECREF(key);
+    }
+}
+
+/* RaiseDoubleKeywords (used by ParseKeywordsImpl) */
+static void __Pyx_RaiseDoubleKeywordsError(
+    const char* func_name,
+    PyObject* kw_name)
+{
+    PyErr_Format(PyExc_TypeError,
+        "%s() got multiple values for keyword argument '%U'", func_name, kw_name);
+}
+
+/* CallUnboundCMethod2 */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject *__Pyx_CallUnboundCMethod2(__Pyx_CachedCFunction *cfunc, PyObject *self, PyObject *arg1, PyObject *arg2) {
+    int was_initialized = __Pyx_CachedCFunction_GetAndSetInitializing(cfunc);
+    if (likely(was_initialized == 2 && cfunc->func)) {
+        PyObject *args[2] = {arg1, arg2};
+        if (cfunc->flag == METH_FASTCALL) {
+            return __Pyx_CallCFunctionFast(cfunc, self, args, 2);
+        }
+        if (cfunc->flag == (METH_FASTCALL | METH_KEYWORDS))
+            return __Pyx_CallCFunctionFastWithKeywords(cfunc, self, args, 2, NULL);
+    }
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    else if (unlikely(was_initialized == 1)) {
+        __Pyx_CachedCFunction tmp_cfunc = {
+#ifndef __cplusplus
+            0
+#endif
+        };
+        tmp_cfunc.type = cfunc->type;
+        tmp_cfunc.method_name = cfunc->method_name;
+        return __Pyx__CallUnboundCMethod2(&tmp_cfunc, self, arg1, arg2);
+    }
+#endif
+    PyObject *result = __Pyx__CallUnboundCMethod2(cfunc, self, arg1, arg2);
+    __Pyx_CachedCFunction_SetFinishedInitializing(cfunc);
+    return result;
+}
+#endif
+static PyObject* __Pyx__CallUnboundCMethod2(__Pyx_CachedCFunction* cfunc, PyObject* self, PyObject* arg1, PyObject* arg2){
+    if (unlikely(!cfunc->func && !cfunc->method) && unlikely(__Pyx_TryUnpackUnboundCMethod(cfunc) < 0)) return NULL;
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (cfunc->func && (cfunc->flag & METH_VARARGS)) {
+        PyObject *result = NULL;
+        PyObject *args = PyTuple_New(2);
+        if (unlikely(!args)) return NULL;
+        Py_INCREF(arg1);
+        PyTuple_SET_ITEM(args, 0, arg1);
+        Py_INCREF(arg2);
+        PyTuple_SET_ITEM(args, 1, arg2);
+        if (cfunc->flag & METH_KEYWORDS)
+            result = __Pyx_CallCFunctionWithKeywords(cfunc, self, args, NULL);
+        else
+            result = __Pyx_CallCFunction(cfunc, self, args);
+        Py_DECREF(args);
+        return result;
+    }
+#endif
+    {
+        PyObject *args[4] = {NULL, self, arg1, arg2};
+        return __Pyx_PyObject_FastCall(cfunc->method, args+1, 3 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+    }
+}
+
+/* ParseKeywordsImpl (used by ParseKeywords) */
+static int __Pyx_ValidateDuplicatePosArgs(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    const char* function_name)
+{
+    PyObject ** const *name = argnames;
+    while (name != first_kw_arg) {
+        PyObject *key = **name;
+        int found = PyDict_Contains(kwds, key);
+        if (unlikely(found)) {
+            if (found == 1) __Pyx_RaiseDoubleKeywordsError(function_name, key);
+            goto bad;
+        }
+        name++;
+    }
+    return 0;
+bad:
+    return -1;
+}
+#if CYTHON_USE_UNICODE_INTERNALS
+static CYTHON_INLINE int __Pyx_UnicodeKeywordsEqual(PyObject *s1, PyObject *s2) {
+    int kind;
+    Py_ssize_t len = PyUnicode_GET_LENGTH(s1);
+    if (len != PyUnicode_GET_LENGTH(s2)) return 0;
+    kind = PyUnicode_KIND(s1);
+    if (kind != PyUnicode_KIND(s2)) return 0;
+    const void *data1 = PyUnicode_DATA(s1);
+    const void *data2 = PyUnicode_DATA(s2);
+    return (memcmp(data1, data2, (size_t) len * (size_t) kind) == 0);
+}
+#endif
+static int __Pyx_MatchKeywordArg_str(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    PyObject ** const *name;
+    #if CYTHON_USE_UNICODE_INTERNALS
+    Py_hash_t key_hash = ((PyASCIIObject*)key)->hash;
+    if (unlikely(key_hash == -1)) {
+        key_hash = PyObject_Hash(key);
+        if (unlikely(key_hash == -1))
+            goto bad;
+    }
+    #endif
+    name = first_kw_arg;
+    while (*name) {
+        PyObject *name_str = **name;
+        #if CYTHON_USE_UNICODE_INTERNALS
+        if (key_hash == ((PyASCIIObject*)name_str)->hash && __Pyx_UnicodeKeywordsEqual(name_str, key)) {
+            *index_found = (size_t) (name - argnames);
+            return 1;
+        }
+        #else
+        #if CYTHON_ASSUME_SAFE_SIZE
+        if (PyUnicode_GET_LENGTH(name_str) == PyUnicode_GET_LENGTH(key))
+        #endif
+        {
+            int cmp = PyUnicode_Compare(name_str, key);
+            if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+            if (cmp == 0) {
+                *index_found = (size_t) (name - argnames);
+                return 1;
+            }
+        }
+        #endif
+        name++;
+    }
+    name = argnames;
+    while (name != first_kw_arg) {
+        PyObject *name_str = **name;
+        #if CYTHON_USE_UNICODE_INTERNALS
+        if (unlikely(key_hash == ((PyASCIIObject*)name_str)->hash)) {
+            if (__Pyx_UnicodeKeywordsEqual(name_str, key))
+                goto arg_passed_twice;
+        }
+        #else
+        #if CYTHON_ASSUME_SAFE_SIZE
+        if (PyUnicode_GET_LENGTH(name_str) == PyUnicode_GET_LENGTH(key))
+        #endif
+        {
+            if (unlikely(name_str == key)) goto arg_passed_twice;
+            int cmp = PyUnicode_Compare(name_str, key);
+            if (cmp < 0 && unlikely(PyErr_Occurred())) goto bad;
+            if (cmp == 0) goto arg_passed_twice;
+        }
+        #endif
+        name++;
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+bad:
+    return -1;
+}
+static int __Pyx_MatchKeywordArg_nostr(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    PyObject ** const *name;
+    if (unlikely(!PyUnicode_Check(key))) goto invalid_keyword_type;
+    name = first_kw_arg;
+    while (*name) {
+        int cmp = PyObject_RichCompareBool(**name, key, Py_EQ);
+        if (cmp == 1) {
+            *index_found = (size_t) (name - argnames);
+            return 1;
+        }
+        if (unlikely(cmp == -1)) goto bad;
+        name++;
+    }
+    name = argnames;
+    while (name != first_kw_arg) {
+        int cmp = PyObject_RichCompareBool(**name, key, Py_EQ);
+        if (unlikely(cmp != 0)) {
+            if (cmp == 1) goto arg_passed_twice;
+            else goto bad;
+        }
+        name++;
+    }
+    return 0;
+arg_passed_twice:
+    __Pyx_RaiseDoubleKeywordsError(function_name, key);
+    goto bad;
+invalid_keyword_type:
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() keywords must be strings", function_name);
+    goto bad;
+bad:
+    return -1;
+}
+static CYTHON_INLINE int __Pyx_MatchKeywordArg(
+    PyObject *key,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    size_t *index_found,
+    const char *function_name)
+{
+    return likely(PyUnicode_CheckExact(key)) ?
+        __Pyx_MatchKeywordArg_str(key, argnames, first_kw_arg, index_found, function_name) :
+        __Pyx_MatchKeywordArg_nostr(key, argnames, first_kw_arg, index_found, function_name);
+}
+static void __Pyx_RejectUnknownKeyword(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject ** const *first_kw_arg,
+    const char *function_name)
+{
+    #if CYTHON_AVOID_BORROWED_REFS
+    PyObject *pos = NULL;
+    #else
+    Py_ssize_t pos = 0;
+    #endif
+    PyObject *key = NULL;
+    __Pyx_BEGIN_CRITICAL_SECTION(kwds);
+    while (
+        #if CYTHON_AVOID_BORROWED_REFS
+        __Pyx_PyDict_NextRef(kwds, &pos, &key, NULL)
+        #else
+        PyDict_Next(kwds, &pos, &key, NULL)
+        #endif
+    ) {
+        PyObject** const *name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (!*name) {
+            size_t index_found = 0;
+            int cmp = __Pyx_MatchKeywordArg(key, argnames, first_kw_arg, &index_found, function_name);
+            if (cmp != 1) {
+                if (cmp == 0) {
+                    PyErr_Format(PyExc_TypeError,
+                        "%s() got an unexpected keyword argument '%U'",
+                        function_name, key);
+                }
+                #if CYTHON_AVOID_BORROWED_REFS
+                Py_DECREF(key);
+                #endif
+                break;
+            }
+        }
+        #if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(key);
+        #endif
+    }
+    __Pyx_END_CRITICAL_SECTION();
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(pos);
+    #endif
+    assert(PyErr_Occurred());
+}
+static int __Pyx_ParseKeywordDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    PyObject** const *name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    Py_ssize_t extracted = 0;
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+    if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return -1;
+#endif
+    name = first_kw_arg;
+    while (*name && num_kwargs > extracted) {
+        PyObject * key = **name;
+        PyObject *value;
+        int found = 0;
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+        found = PyDict_GetItemRef(kwds, key, &value);
+        #else
+        value = PyDict_GetItemWithError(kwds, key);
+        if (value) {
+            Py_INCREF(value);
+            found = 1;
+        } else {
+            if (unlikely(PyErr_Occurred())) goto bad;
+        }
+        #endif
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+            extracted++;
+        }
+        name++;
+    }
+    if (num_kwargs > extracted) {
+        if (ignore_unknown_kwargs) {
+            if (unlikely(__Pyx_ValidateDuplicatePosArgs(kwds, argnames, first_kw_arg, function_name) == -1))
+                goto bad;
+        } else {
+            __Pyx_RejectUnknownKeyword(kwds, argnames, first_kw_arg, function_name);
+            goto bad;
+        }
+    }
+    return 0;
+bad:
+    return -1;
+}
+static int __Pyx_ParseKeywordDictToDict(
+    PyObject *kwds,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    const char* function_name)
+{
+    PyObject** const *name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    Py_ssize_t len;
+#if !CYTHON_COMPILING_IN_PYPY || defined(PyArg_ValidateKeywordArguments)
+    if (unlikely(!PyArg_ValidateKeywordArguments(kwds))) return -1;
+#endif
+    if (PyDict_Update(kwds2, kwds) < 0) goto bad;
+    name = first_kw_arg;
+    while (*name) {
+        PyObject *key = **name;
+        PyObject *value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && (PY_VERSION_HEX >= 0x030d00A2 || defined(PyDict_Pop))
+        int found = PyDict_Pop(kwds2, key, &value);
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+        }
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+        int found = PyDict_GetItemRef(kwds2, key, &value);
+        if (found) {
+            if (unlikely(found < 0)) goto bad;
+            values[name-argnames] = value;
+            if (unlikely(PyDict_DelItem(kwds2, key) < 0)) goto bad;
+        }
+#else
+    #if CYTHON_COMPILING_IN_CPYTHON
+        value = _PyDict_Pop(kwds2, key, kwds2);
+    #else
+        value = __Pyx_CallUnboundCMethod2(&__pyx_mstate_global->__pyx_umethod_PyDict_Type_pop, kwds2, key, kwds2);
+    #endif
+        if (value == kwds2) {
+            Py_DECREF(value);
+        } else {
+            if (unlikely(!value)) goto bad;
+            values[name-argnames] = value;
+        }
+#endif
+        name++;
+    }
+    len = PyDict_Size(kwds2);
+    if (len > 0) {
+        return __Pyx_ValidateDuplicatePosArgs(kwds, argnames, first_kw_arg, function_name);
+    } else if (unlikely(len == -1)) {
+        goto bad;
+    }
+    return 0;
+bad:
+    return -1;
+}
+static int __Pyx_ParseKeywordsTuple(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    PyObject *key = NULL;
+    PyObject** const * name;
+    PyObject** const *first_kw_arg = argnames + num_pos_args;
+    for (Py_ssize_t pos = 0; pos < num_kwargs; pos++) {
+#if CYTHON_AVOID_BORROWED_REFS
+        key = __Pyx_PySequence_ITEM(kwds, pos);
+#else
+        key = __Pyx_PyTuple_GET_ITEM(kwds, pos);
+#endif
+#if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(!key)) goto bad;
+#endif
+        name = first_kw_arg;
+        while (*name && (**name != key)) name++;
+        if (*name) {
+            PyObject *value = kwvalues[pos];
+            values[name-argnames] = __Pyx_NewRef(value);
+        } else {
+            size_t index_found = 0;
+            int cmp = __Pyx_MatchKeywordArg(key, argnames, first_kw_arg, &index_found, function_name);
+            if (cmp == 1) {
+                PyObject *value = kwvalues[pos];
+                values[index_found] = __Pyx_NewRef(value);
+            } else {
+                if (unlikely(cmp == -1)) goto bad;
+                if (kwds2) {
+                    PyObject *value = kwvalues[pos];
+                    if (unlikely(PyDict_SetItem(kwds2, key, value))) goto bad;
+                } else if (!ignore_unknown_kwargs) {
+                    goto invalid_keyword;
+                }
+            }
+        }
+        #if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(key);
+        key = NULL;
+        #endif
+    }
+    return 0;
+invalid_keyword:
+    PyErr_Format(PyExc_TypeError,
+        "%s() got an unexpected keyword argument '%U'",
+        function_name, key);
+    goto bad;
+bad:
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(key);
+    #endif
+    return -1;
+}
+
+/* ParseKeywords */
+static int __Pyx_ParseKeywords(
+    PyObject *kwds,
+    PyObject * const *kwvalues,
+    PyObject ** const argnames[],
+    PyObject *kwds2,
+    PyObject *values[],
+    Py_ssize_t num_pos_args,
+    Py_ssize_t num_kwargs,
+    const char* function_name,
+    int ignore_unknown_kwargs)
+{
+    if (CYTHON_METH_FASTCALL && likely(PyTuple_Check(kwds)))
+        return __Pyx_ParseKeywordsTuple(kwds, kwvalues, argnames, kwds2, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
+    else if (kwds2)
+        return __Pyx_ParseKeywordDictToDict(kwds, argnames, kwds2, values, num_pos_args, function_name);
+    else
+        return __Pyx_ParseKeywordDict(kwds, argnames, values, num_pos_args, num_kwargs, function_name, ignore_unknown_kwargs);
+}
+
+/* ArgTypeTestFunc (used by ArgTypeTest) */
+static int __Pyx__ArgTypeTest(PyObject *obj, PyTypeObject *type, const char *name, int exact)
+{
+    __Pyx_TypeName type_name;
+    __Pyx_TypeName obj_type_name;
+    PyObject *extra_info = __pyx_mstate_global->__pyx_empty_unicode;
+    int from_annotation_subclass = 0;
+    if (unlikely(!type)) {
+        PyErr_SetString(PyExc_SystemError, "Missing type object");
+        return 0;
+    }
+    else if (!exact) {
+        if (likely(__Pyx_TypeCheck(obj, type))) return 1;
+    } else if (exact == 2) {
+        if (__Pyx_TypeCheck(obj, type)) {
+            from_annotation_subclass = 1;
+            extra_info = __pyx_mstate_global->__pyx_kp_u_Note_that_Cython_is_deliberately;
+        }
+    }
+    type_name = __Pyx_PyType_GetFullyQualifiedName(type);
+    obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError,
+        "Argument '%.200s' has incorrect type (expected " __Pyx_FMT_TYPENAME
+        ", got " __Pyx_FMT_TYPENAME ")"
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+        "%s%U"
+#endif
+        , name, type_name, obj_type_name
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+        , (from_annotation_subclass ? ". " : ""), extra_info
+#endif
+        );
+#if __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    if (exact == 2 && from_annotation_subclass) {
+        PyObject *res;
+        PyObject *vargs[2];
+        vargs[0] = PyErr_GetRaisedException();
+        vargs[1] = extra_info;
+        res = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_kp_u_add_note, vargs, 2, NULL);
+        Py_XDECREF(res);
+        PyErr_SetRaisedException(vargs[0]);
+    }
+#endif
+    __Pyx_DECREF_TypeName(type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by GetBuiltinName) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* GetBuiltinName (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
+/* PyDictVersioning (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    PyErr_Clear();
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* PyObjectFormatAndDecref */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatSimpleAndDecref(PyObject* s, PyObject* f) {
+    if (unlikely(!s)) return NULL;
+    if (likely(PyUnicode_CheckExact(s))) return s;
+    return __Pyx_PyObject_FormatAndDecref(s, f);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FormatAndDecref(PyObject* s, PyObject* f) {
+    PyObject *result;
+    if (unlikely(!s)) return NULL;
+    result = PyObject_Format(s, f);
+    Py_DECREF(s);
+    return result;
+}
+
+/* JoinPyUnicode */
+static PyObject* __Pyx_PyUnicode_Join(PyObject** values, Py_ssize_t value_count, Py_ssize_t result_ulength,
+                                      Py_UCS4 max_char) {
+#if CYTHON_USE_UNICODE_INTERNALS && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    PyObject *result_uval;
+    int result_ukind, kind_shift;
+    Py_ssize_t i, char_pos;
+    void *result_udata;
+    if (max_char > 1114111) max_char = 1114111;
+    result_uval = PyUnicode_New(result_ulength, max_char);
+    if (unlikely(!result_uval)) return NULL;
+    result_ukind = (max_char <= 255) ? PyUnicode_1BYTE_KIND : (max_char <= 65535) ? PyUnicode_2BYTE_KIND : PyUnicode_4BYTE_KIND;
+    kind_shift = (result_ukind == PyUnicode_4BYTE_KIND) ? 2 : result_ukind - 1;
+    result_udata = PyUnicode_DATA(result_uval);
+    assert(kind_shift == 2 || kind_shift == 1 || kind_shift == 0);
+    if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - result_ulength < 0))
+        goto overflow;
+    char_pos = 0;
+    for (i=0; i < value_count; i++) {
+        int ukind;
+        Py_ssize_t ulength;
+        void *udata;
+        PyObject *uval = values[i];
+        #if !CYTHON_COMPILING_IN_LIMITED_API
+        if (__Pyx_PyUnicode_READY(uval) == (-1))
+            goto bad;
+        #endif
+        ulength = __Pyx_PyUnicode_GET_LENGTH(uval);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(ulength < 0)) goto bad;
+        #endif
+        if (unlikely(!ulength))
+            continue;
+        if (unlikely((PY_SSIZE_T_MAX >> kind_shift) - ulength < char_pos))
+            goto overflow;
+        ukind = __Pyx_PyUnicode_KIND(uval);
+        udata = __Pyx_PyUnicode_DATA(uval);
+        if (ukind == result_ukind) {
+            memcpy((char *)result_udata + (char_pos << kind_shift), udata, (size_t) (ulength << kind_shift));
+        } else {
+            #if PY_VERSION_HEX >= 0x030d0000
+            if (unlikely(PyUnicode_CopyCharacters(result_uval, char_pos, uval, 0, ulength) < 0)) goto bad;
+            #elif CYTHON_COMPILING_IN_CPYTHON || defined(_PyUnicode_FastCopyCharacters)
+            _PyUnicode_FastCopyCharacters(result_uval, char_pos, uval, 0, ulength);
+            #else
+            Py_ssize_t j;
+            for (j=0; j < ulength; j++) {
+                Py_UCS4 uchar = __Pyx_PyUnicode_READ(ukind, udata, j);
+                __Pyx_PyUnicode_WRITE(result_ukind, result_udata, char_pos+j, uchar);
+            }
+            #endif
+        }
+        char_pos += ulength;
+    }
+    return result_uval;
+overflow:
+    PyErr_SetString(PyExc_OverflowError, "join() result is too long for a Python string");
+bad:
+    Py_DECREF(result_uval);
+    return NULL;
+#else
+    Py_ssize_t i;
+    PyObject *result = NULL;
+    PyObject *value_tuple = PyTuple_New(value_count);
+    if (unlikely(!value_tuple)) return NULL;
+    CYTHON_UNUSED_VAR(max_char);
+    CYTHON_UNUSED_VAR(result_ulength);
+    for (i=0; i<value_count; i++) {
+        if (__Pyx_PyTuple_SET_ITEM(value_tuple, i, values[i]) != (0)) goto bad;
+        Py_INCREF(values[i]);
+    }
+    result = PyUnicode_Join(__pyx_mstate_global->__pyx_empty_unicode, value_tuple);
+bad:
+    Py_DECREF(value_tuple);
+    return result;
+#endif
+}
+
+/* RaiseException */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+#elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+
+/* RaiseUnexpectedTypeError */
+static int
+__Pyx_RaiseUnexpectedTypeError(const char *expected, PyObject *obj)
+{
+    __Pyx_TypeName obj_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(obj));
+    PyErr_Format(PyExc_TypeError, "Expected %s, got " __Pyx_FMT_TYPENAME,
+                 expected, obj_type_name);
+    __Pyx_DECREF_TypeName(obj_type_name);
+    return 0;
+}
+
+/* GetItemInt */
+static PyObject *__Pyx_GetItemInt_Generic(PyObject *o, PyObject* j) {
+    PyObject *r;
+    if (unlikely(!j)) return NULL;
+    r = PyObject_GetItem(o, j);
+    Py_DECREF(j);
+    return r;
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_List_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_SIZE
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyList_GET_SIZE(o);
+    }
+    if ((CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS)) {
+        return __Pyx_PyList_GetItemRefFast(o, wrapped_i, unsafe_shared);
+    } else
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyList_GET_SIZE(o)))) {
+        return __Pyx_NewRef(PyList_GET_ITEM(o, wrapped_i));
+    }
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+#else
+    (void)wraparound;
+    (void)boundscheck;
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Tuple_Fast(PyObject *o, Py_ssize_t i,
+                                                              int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    Py_ssize_t wrapped_i = i;
+    if (wraparound & unlikely(i < 0)) {
+        wrapped_i += PyTuple_GET_SIZE(o);
+    }
+    if ((!boundscheck) || likely(__Pyx_is_valid_index(wrapped_i, PyTuple_GET_SIZE(o)))) {
+        return __Pyx_NewRef(PyTuple_GET_ITEM(o, wrapped_i));
+    }
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+#else
+    (void)wraparound;
+    (void)boundscheck;
+    return PySequence_GetItem(o, i);
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_GetItemInt_Fast(PyObject *o, Py_ssize_t i, int is_list,
+                                                     int wraparound, int boundscheck, int unsafe_shared) {
+    CYTHON_MAYBE_UNUSED_VAR(unsafe_shared);
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+    if (is_list || PyList_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyList_GET_SIZE(o);
+        if ((CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)) {
+            return __Pyx_PyList_GetItemRefFast(o, n, unsafe_shared);
+        } else if ((!boundscheck) || (likely(__Pyx_is_valid_index(n, PyList_GET_SIZE(o))))) {
+            return __Pyx_NewRef(PyList_GET_ITEM(o, n));
+        }
+    } else
+    #if !CYTHON_AVOID_BORROWED_REFS
+    if (PyTuple_CheckExact(o)) {
+        Py_ssize_t n = ((!wraparound) | likely(i >= 0)) ? i : i + PyTuple_GET_SIZE(o);
+        if ((!boundscheck) || likely(__Pyx_is_valid_index(n, PyTuple_GET_SIZE(o)))) {
+            return __Pyx_NewRef(PyTuple_GET_ITEM(o, n));
+        }
+    } else
+    #endif
+#endif
+#if CYTHON_USE_TYPE_SLOTS && !CYTHON_COMPILING_IN_PYPY
+    {
+        PyMappingMethods *mm = Py_TYPE(o)->tp_as_mapping;
+        PySequenceMethods *sm = Py_TYPE(o)->tp_as_sequence;
+        if (!is_list && mm && mm->mp_subscript) {
+            PyObject *r, *key = PyLong_FromSsize_t(i);
+            if (unlikely(!key)) return NULL;
+            r = mm->mp_subscript(o, key);
+            Py_DECREF(key);
+            return r;
+        }
+        if (is_list || likely(sm && sm->sq_item)) {
+            if (wraparound && unlikely(i < 0) && likely(sm->sq_length)) {
+                Py_ssize_t l = sm->sq_length(o);
+                if (likely(l >= 0)) {
+                    i += l;
+                } else {
+                    if (!PyErr_ExceptionMatches(PyExc_OverflowError))
+                        return NULL;
+                    PyErr_Clear();
+                }
+            }
+            return sm->sq_item(o, i);
+        }
+    }
+#else
+    if (is_list || !PyMapping_Check(o)) {
+        return PySequence_GetItem(o, i);
+    }
+#endif
+    (void)wraparound;
+    (void)boundscheck;
+    return __Pyx_GetItemInt_Generic(o, PyLong_FromSsize_t(i));
+}
+
+/* DictGetItem */
+#if !CYTHON_COMPILING_IN_PYPY
+static PyObject *__Pyx_PyDict_GetItem(PyObject *d, PyObject* key) {
+    PyObject *value;
+    if (unlikely(__Pyx_PyDict_GetItemRef(d, key, &value) == 0)) { // no value, no error
+        if (unlikely(PyTuple_Check(key))) {
+            PyObject* args = PyTuple_Pack(1, key);
+            if (likely(args)) {
+                PyErr_SetObject(PyExc_KeyError, args);
+                Py_DECREF(args);
+            }
+        } else {
+            PyErr_SetObject(PyExc_KeyError, key);
+        }
+    }
+    return value;
+}
+#endif
+
+/* ModInt[long] */
+static CYTHON_INLINE long __Pyx_mod_long(long a, long b, int b_is_constant) {
+    long r = a % b;
+    long adapt_python = (b_is_constant ?
+        ((r != 0) & ((r < 0) ^ (b < 0))) :
+        ((r != 0) & ((r ^ b) < 0))
+    );
+    return r + adapt_python * b;
+}
+
+/* PyObjectVectorCallKwBuilder */
+#if CYTHON_VECTORCALL
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_PyObject_FastCallDict;
+    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
+    Py_INCREF(key);
+    args[n] = value;
+    return 0;
+}
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_VectorcallBuilder_AddArgStr;
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
+}
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    PyObject *pyKey = PyUnicode_FromString(key);
+    if (!pyKey) return -1;
+    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
+}
+#else // CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return PyDict_SetItem(builder, key, value);
+}
+#endif
+
+/* PyObjectFastCallMethod */
+#if !CYTHON_VECTORCALL || PY_VERSION_HEX < 0x03090000
+static PyObject *__Pyx_PyObject_FastCallMethod(PyObject *name, PyObject *const *args, size_t nargsf) {
+    PyObject *result;
+    PyObject *attr = PyObject_GetAttr(args[0], name);
+    if (unlikely(!attr))
+        return NULL;
+    result = __Pyx_PyObject_FastCall(attr, args+1, nargsf - 1);
+    Py_DECREF(attr);
+    return result;
+}
+#endif
+
+/* AllocateExtensionType */
+static PyObject *__Pyx_AllocateExtensionType(PyTypeObject *t, int is_final) {
+    if (is_final || likely(!__Pyx_PyType_HasFeature(t, Py_TPFLAGS_IS_ABSTRACT))) {
+        allocfunc alloc_func = __Pyx_PyType_GetSlot(t, tp_alloc, allocfunc);
+        return alloc_func(t, 0);
+    } else {
+        newfunc tp_new = __Pyx_PyType_TryGetSlot(&PyBaseObject_Type, tp_new, newfunc);
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (!tp_new) {
+            PyObject *new_str = PyUnicode_FromString("__new__");
+            if (likely(new_str)) {
+                PyObject *o = PyObject_CallMethodObjArgs((PyObject *)&PyBaseObject_Type, new_str, t, NULL);
+                Py_DECREF(new_str);
+                return o;
+            } else
+                return NULL;
+        } else
+    #endif
+        return tp_new(t, __pyx_mstate_global->__pyx_empty_tuple, 0);
+    }
+}
+
+/* CallTypeTraverse */
+#if !CYTHON_USE_TYPE_SPECS || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x03090000)
+#else
+static int __Pyx_call_type_traverse(PyObject *o, int always_call, visitproc visit, void *arg) {
+    #if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x03090000
+    if (__Pyx_get_runtime_version() < 0x03090000) return 0;
+    #endif
+    if (!always_call) {
+        PyTypeObject *base = __Pyx_PyObject_GetSlot(o, tp_base, PyTypeObject*);
+        unsigned long flags = PyType_GetFlags(base);
+        if (flags & Py_TPFLAGS_HEAPTYPE) {
+            return 0;
+        }
+    }
+    Py_VISIT((PyObject*)Py_TYPE(o));
+    return 0;
+}
+#endif
+
+/* LimitedApiGetTypeDict (used by SetItemOnTypeDict) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static Py_ssize_t __Pyx_GetTypeDictOffset(void) {
+    PyObject *tp_dictoffset_o;
+    Py_ssize_t tp_dictoffset;
+    tp_dictoffset_o = PyObject_GetAttrString((PyObject*)(&PyType_Type), "__dictoffset__");
+    if (unlikely(!tp_dictoffset_o)) return -1;
+    tp_dictoffset = PyLong_AsSsize_t(tp_dictoffset_o);
+    Py_DECREF(tp_dictoffset_o);
+    if (unlikely(tp_dictoffset == 0)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "'type' doesn't have a dictoffset");
+        return -1;
+    } else if (unlikely(tp_dictoffset < 0)) {
+        PyErr_SetString(
+            PyExc_TypeError,
+            "'type' has an unexpected negative dictoffset. "
+            "Please report this as Cython bug");
+        return -1;
+    }
+    return tp_dictoffset;
+}
+static PyObject *__Pyx_GetTypeDict(PyTypeObject *tp) {
+    static Py_ssize_t tp_dictoffset = 0;
+    if (unlikely(tp_dictoffset == 0)) {
+        tp_dictoffset = __Pyx_GetTypeDictOffset();
+        if (unlikely(tp_dictoffset == -1 && PyErr_Occurred())) {
+            tp_dictoffset = 0; // try again next time?
+            return NULL;
+        }
+    }
+    return *(PyObject**)((char*)tp + tp_dictoffset);
+}
+#endif
+
+/* SetItemOnTypeDict (used by FixUpExtensionType) */
+static int __Pyx__SetItemOnTypeDict(PyTypeObject *tp, PyObject *k, PyObject *v) {
+    int result;
+    PyObject *tp_dict;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    tp_dict = __Pyx_GetTypeDict(tp);
+    if (unlikely(!tp_dict)) return -1;
+#else
+    tp_dict = tp->tp_dict;
+#endif
+    result = PyDict_SetItem(tp_dict, k, v);
+    if (likely(!result)) {
+        PyType_Modified(tp);
+        if (unlikely(PyObject_HasAttr(v, __pyx_mstate_global->__pyx_n_u_set_name))) {
+            PyObject *setNameResult = PyObject_CallMethodObjArgs(v, __pyx_mstate_global->__pyx_n_u_set_name,  (PyObject *) tp, k, NULL);
+            if (!setNameResult) return -1;
+            Py_DECREF(setNameResult);
+        }
+    }
+    return result;
+}
+
+/* FixUpExtensionType */
+static int __Pyx_fix_up_extension_type_from_spec(PyType_Spec *spec, PyTypeObject *type) {
+#if __PYX_LIMITED_VERSION_HEX > 0x030900B1
+    CYTHON_UNUSED_VAR(spec);
+    CYTHON_UNUSED_VAR(type);
+    CYTHON_UNUSED_VAR(__Pyx__SetItemOnTypeDict);
+#else
+    const PyType_Slot *slot = spec->slots;
+    int changed = 0;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    while (slot && slot->slot && slot->slot != Py_tp_members)
+        slot++;
+    if (slot && slot->slot == Py_tp_members) {
+#if !CYTHON_COMPILING_IN_CPYTHON
+        const
+#endif  // !CYTHON_COMPILING_IN_CPYTHON)
+            PyMemberDef *memb = (PyMemberDef*) slot->pfunc;
+        while (memb && memb->name) {
+            if (memb->name[0] == '_' && memb->name[1] == '_') {
+                if (strcmp(memb->name, "__weaklistoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_weaklistoffset = memb->offset;
+                    changed = 1;
+                }
+                else if (strcmp(memb->name, "__dictoffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_dictoffset = memb->offset;
+                    changed = 1;
+                }
+#if CYTHON_METH_FASTCALL
+                else if (strcmp(memb->name, "__vectorcalloffset__") == 0) {
+                    assert(memb->type == T_PYSSIZET);
+                    assert(memb->flags == READONLY);
+                    type->tp_vectorcall_offset = memb->offset;
+                    changed = 1;
+                }
+#endif  // CYTHON_METH_FASTCALL
+#if !CYTHON_COMPILING_IN_PYPY
+                else if (strcmp(memb->name, "__module__") == 0) {
+                    PyObject *descr;
+                    assert(memb->type == T_OBJECT);
+                    assert(memb->flags == 0 || memb->flags == READONLY);
+                    descr = PyDescr_NewMember(type, memb);
+                    if (unlikely(!descr))
+                        return -1;
+                    int set_item_result = PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr);
+                    Py_DECREF(descr);
+                    if (unlikely(set_item_result < 0)) {
+                        return -1;
+                    }
+                    changed = 1;
+                }
+#endif  // !CYTHON_COMPILING_IN_PYPY
+            }
+            memb++;
+        }
+    }
+#endif  // !CYTHON_COMPILING_IN_LIMITED_API
+#if !CYTHON_COMPILING_IN_PYPY
+    slot = spec->slots;
+    while (slot && slot->slot && slot->slot != Py_tp_getset)
+        slot++;
+    if (slot && slot->slot == Py_tp_getset) {
+        PyGetSetDef *getset = (PyGetSetDef*) slot->pfunc;
+        while (getset && getset->name) {
+            if (getset->name[0] == '_' && getset->name[1] == '_' && strcmp(getset->name, "__module__") == 0) {
+                PyObject *descr = PyDescr_NewGetSet(type, getset);
+                if (unlikely(!descr))
+                    return -1;
+                #if CYTHON_COMPILING_IN_LIMITED_API
+                PyObject *pyname = PyUnicode_FromString(getset->name);
+                if (unlikely(!pyname)) {
+                    Py_DECREF(descr);
+                    return -1;
+                }
+                int set_item_result = __Pyx_SetItemOnTypeDict(type, pyname, descr);
+                Py_DECREF(pyname);
+                #else
+                CYTHON_UNUSED_VAR(__Pyx__SetItemOnTypeDict);
+                int set_item_result = PyDict_SetItem(type->tp_dict, PyDescr_NAME(descr), descr);
+                #endif
+                Py_DECREF(descr);
+                if (unlikely(set_item_result < 0)) {
+                    return -1;
+                }
+                changed = 1;
+            }
+            ++getset;
+        }
+    }
+#else
+    CYTHON_UNUSED_VAR(__Pyx__SetItemOnTypeDict);
+#endif  // !CYTHON_COMPILING_IN_PYPY
+    if (changed)
+        PyType_Modified(type);
+#endif  // PY_VERSION_HEX > 0x030900B1
+    return 0;
+}
+
+/* PyObjectCallNoArg (used by PyObjectCallMethod0) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallNoArg(PyObject *func) {
+    PyObject *arg[2] = {NULL, NULL};
+    return __Pyx_PyObject_FastCall(func, arg + 1, 0 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* PyObjectGetMethod (used by PyObjectCallMethod0) */
+#if !(CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000)))
+static int __Pyx_PyObject_GetMethod(PyObject *obj, PyObject *name, PyObject **method) {
+    PyObject *attr;
+#if CYTHON_UNPACK_METHODS && CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_PYTYPE_LOOKUP
+    __Pyx_TypeName type_name;
+    PyTypeObject *tp = Py_TYPE(obj);
+    PyObject *descr;
+    descrgetfunc f = NULL;
+    PyObject **dictptr, *dict;
+    int meth_found = 0;
+    assert (*method == NULL);
+    if (unlikely(tp->tp_getattro != PyObject_GenericGetAttr)) {
+        attr = __Pyx_PyObject_GetAttrStr(obj, name);
+        goto try_unpack;
+    }
+    if (unlikely(tp->tp_dict == NULL) && unlikely(PyType_Ready(tp) < 0)) {
+        return 0;
+    }
+    descr = _PyType_Lookup(tp, name);
+    if (likely(descr != NULL)) {
+        Py_INCREF(descr);
+#if defined(Py_TPFLAGS_METHOD_DESCRIPTOR) && Py_TPFLAGS_METHOD_DESCRIPTOR
+        if (__Pyx_PyType_HasFeature(Py_TYPE(descr), Py_TPFLAGS_METHOD_DESCRIPTOR))
+#else
+        #ifdef __Pyx_CyFunction_USED
+        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type) || __Pyx_CyFunction_Check(descr)))
+        #else
+        if (likely(PyFunction_Check(descr) || __Pyx_IS_TYPE(descr, &PyMethodDescr_Type)))
+        #endif
+#endif
+        {
+            meth_found = 1;
+        } else {
+            f = Py_TYPE(descr)->tp_descr_get;
+            if (f != NULL && PyDescr_IsData(descr)) {
+                attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+                Py_DECREF(descr);
+                goto try_unpack;
+            }
+        }
+    }
+    dictptr = _PyObject_GetDictPtr(obj);
+    if (dictptr != NULL && (dict = *dictptr) != NULL) {
+        Py_INCREF(dict);
+        attr = __Pyx_PyDict_GetItemStr(dict, name);
+        if (attr != NULL) {
+            Py_INCREF(attr);
+            Py_DECREF(dict);
+            Py_XDECREF(descr);
+            goto try_unpack;
+        }
+        Py_DECREF(dict);
+    }
+    if (meth_found) {
+        *method = descr;
+        return 1;
+    }
+    if (f != NULL) {
+        attr = f(descr, obj, (PyObject *)Py_TYPE(obj));
+        Py_DECREF(descr);
+        goto try_unpack;
+    }
+    if (likely(descr != NULL)) {
+        *method = descr;
+        return 0;
+    }
+    type_name = __Pyx_PyType_GetFullyQualifiedName(tp);
+    PyErr_Format(PyExc_AttributeError,
+                 "'" __Pyx_FMT_TYPENAME "' object has no attribute '%U'",
+                 type_name, name);
+    __Pyx_DECREF_TypeName(type_name);
+    return 0;
+#else
+    attr = __Pyx_PyObject_GetAttrStr(obj, name);
+    goto try_unpack;
+#endif
+try_unpack:
+#if CYTHON_UNPACK_METHODS
+    if (likely(attr) && PyMethod_Check(attr) && likely(PyMethod_GET_SELF(attr) == obj)) {
+        PyObject *function = PyMethod_GET_FUNCTION(attr);
+        Py_INCREF(function);
+        Py_DECREF(attr);
+        *method = function;
+        return 1;
+    }
+#endif
+    *method = attr;
+    return 0;
+}
+#endif
+
+/* PyObjectCallMethod0 (used by PyType_Ready) */
+static PyObject* __Pyx_PyObject_CallMethod0(PyObject* obj, PyObject* method_name) {
+#if CYTHON_VECTORCALL && (__PYX_LIMITED_VERSION_HEX >= 0x030C0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x03090000))
+    PyObject *args[1] = {obj};
+    (void) __Pyx_PyObject_CallOneArg;
+    (void) __Pyx_PyObject_CallNoArg;
+    return PyObject_VectorcallMethod(method_name, args, 1 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#else
+    PyObject *method = NULL, *result = NULL;
+    int is_method = __Pyx_PyObject_GetMethod(obj, method_name, &method);
+    if (likely(is_method)) {
+        result = __Pyx_PyObject_CallOneArg(method, obj);
+        Py_DECREF(method);
+        return result;
+    }
+    if (unlikely(!method)) goto bad;
+    result = __Pyx_PyObject_CallNoArg(method);
+    Py_DECREF(method);
+bad:
+    return result;
+#endif
+}
+
+/* ValidateBasesTuple (used by PyType_Ready) */
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_LIMITED_API || CYTHON_USE_TYPE_SPECS
+static int __Pyx_validate_bases_tuple(const char *type_name, Py_ssize_t dictoffset, PyObject *bases) {
+    Py_ssize_t i, n;
+#if CYTHON_ASSUME_SAFE_SIZE
+    n = PyTuple_GET_SIZE(bases);
+#else
+    n = PyTuple_Size(bases);
+    if (unlikely(n < 0)) return -1;
+#endif
+    for (i = 1; i < n; i++)
+    {
+        PyTypeObject *b;
+#if CYTHON_AVOID_BORROWED_REFS
+        PyObject *b0 = PySequence_GetItem(bases, i);
+        if (!b0) return -1;
+#elif CYTHON_ASSUME_SAFE_MACROS
+        PyObject *b0 = PyTuple_GET_ITEM(bases, i);
+#else
+        PyObject *b0 = PyTuple_GetItem(bases, i);
+        if (!b0) return -1;
+#endif
+        b = (PyTypeObject*) b0;
+        if (!__Pyx_PyType_HasFeature(b, Py_TPFLAGS_HEAPTYPE))
+        {
+            __Pyx_TypeName b_name = __Pyx_PyType_GetFullyQualifiedName(b);
+            PyErr_Format(PyExc_TypeError,
+                "base class '" __Pyx_FMT_TYPENAME "' is not a heap type", b_name);
+            __Pyx_DECREF_TypeName(b_name);
+#if CYTHON_AVOID_BORROWED_REFS
+            Py_DECREF(b0);
+#endif
+            return -1;
+        }
+        if (dictoffset == 0)
+        {
+            Py_ssize_t b_dictoffset = 0;
+#if CYTHON_USE_TYPE_SLOTS
+            b_dictoffset = b->tp_dictoffset;
+#else
+            PyObject *py_b_dictoffset = PyObject_GetAttrString((PyObject*)b, "__dictoffset__");
+            if (!py_b_dictoffset) goto dictoffset_return;
+            b_dictoffset = PyLong_AsSsize_t(py_b_dictoffset);
+            Py_DECREF(py_b_dictoffset);
+            if (b_dictoffset == -1 && PyErr_Occurred()) goto dictoffset_return;
+#endif
+            if (b_dictoffset) {
+                {
+                    __Pyx_TypeName b_name = __Pyx_PyType_GetFullyQualifiedName(b);
+                    PyErr_Format(PyExc_TypeError,
+                        "extension type '%.200s' has no __dict__ slot, "
+                        "but base type '" __Pyx_FMT_TYPENAME "' has: "
+                        "either add 'cdef dict __dict__' to the extension type "
+                        "or add '__slots__ = [...]' to the base type",
+                        type_name, b_name);
+                    __Pyx_DECREF_TypeName(b_name);
+                }
+#if !CYTHON_USE_TYPE_SLOTS
+              dictoffset_return:
+#endif
+#if CYTHON_AVOID_BORROWED_REFS
+                Py_DECREF(b0);
+#endif
+                return -1;
+            }
+        }
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(b0);
+#endif
+    }
+    return 0;
+}
+#endif
+
+/* PyType_Ready */
+CYTHON_UNUSED static int __Pyx_PyType_HasMultipleInheritance(PyTypeObject *t) {
+    while (t) {
+        PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
+        if (bases) {
+            return 1;
+        }
+        t = __Pyx_PyType_GetSlot(t, tp_base, PyTypeObject*);
+    }
+    return 0;
+}
+static int __Pyx_PyType_Ready(PyTypeObject *t) {
+#if CYTHON_USE_TYPE_SPECS || !CYTHON_COMPILING_IN_CPYTHON || defined(PYSTON_MAJOR_VERSION)
+    (void)__Pyx_PyObject_CallMethod0;
+#if CYTHON_USE_TYPE_SPECS
+    (void)__Pyx_validate_bases_tuple;
+#endif
+    return PyType_Ready(t);
+#else
+    int r;
+    if (!__Pyx_PyType_HasMultipleInheritance(t)) {
+        return PyType_Ready(t);
+    }
+    PyObject *bases = __Pyx_PyType_GetSlot(t, tp_bases, PyObject*);
+    if (bases && unlikely(__Pyx_validate_bases_tuple(t->tp_name, t->tp_dictoffset, bases) == -1))
+        return -1;
+#if !defined(PYSTON_MAJOR_VERSION)
+    {
+        int gc_was_enabled;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        gc_was_enabled = PyGC_Disable();
+        (void)__Pyx_PyObject_CallMethod0;
+    #else
+        PyObject *ret, *py_status;
+        PyObject *gc = NULL;
+        #if (!CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM+0 >= 0x07030400) &&\
+                !CYTHON_COMPILING_IN_GRAAL
+        gc = PyImport_GetModule(__pyx_mstate_global->__pyx_kp_u_gc);
+        #endif
+        if (unlikely(!gc)) gc = PyImport_Import(__pyx_mstate_global->__pyx_kp_u_gc);
+        if (unlikely(!gc)) return -1;
+        py_status = __Pyx_PyObject_CallMethod0(gc, __pyx_mstate_global->__pyx_kp_u_isenabled);
+        if (unlikely(!py_status)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+        gc_was_enabled = __Pyx_PyObject_IsTrue(py_status);
+        Py_DECREF(py_status);
+        if (gc_was_enabled > 0) {
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_mstate_global->__pyx_kp_u_disable);
+            if (unlikely(!ret)) {
+                Py_DECREF(gc);
+                return -1;
+            }
+            Py_DECREF(ret);
+        } else if (unlikely(gc_was_enabled == -1)) {
+            Py_DECREF(gc);
+            return -1;
+        }
+    #endif
+        t->tp_flags |= Py_TPFLAGS_HEAPTYPE;
+#if PY_VERSION_HEX >= 0x030A0000
+        t->tp_flags |= Py_TPFLAGS_IMMUTABLETYPE;
+#endif
+#else
+        (void)__Pyx_PyObject_CallMethod0;
+#endif
+    r = PyType_Ready(t);
+#if !defined(PYSTON_MAJOR_VERSION)
+        t->tp_flags &= ~Py_TPFLAGS_HEAPTYPE;
+    #if PY_VERSION_HEX >= 0x030A00b1
+        if (gc_was_enabled)
+            PyGC_Enable();
+    #else
+        if (gc_was_enabled) {
+            PyObject *tp, *v, *tb;
+            PyErr_Fetch(&tp, &v, &tb);
+            ret = __Pyx_PyObject_CallMethod0(gc, __pyx_mstate_global->__pyx_kp_u_enable);
+            if (likely(ret || r == -1)) {
+                Py_XDECREF(ret);
+                PyErr_Restore(tp, v, tb);
+            } else {
+                Py_XDECREF(tp);
+                Py_XDECREF(v);
+                Py_XDECREF(tb);
+                r = -1;
+            }
+        }
+        Py_DECREF(gc);
+    #endif
+    }
+#endif
+    return r;
+#endif
+}
+
+/* SetVTable */
+static int __Pyx_SetVtable(PyTypeObject *type, void *vtable) {
+    PyObject *ob = PyCapsule_New(vtable, 0, 0);
+    if (unlikely(!ob))
+        goto bad;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(PyObject_SetAttr((PyObject *) type, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
+#else
+    if (unlikely(PyDict_SetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable, ob) < 0))
+#endif
+        goto bad;
+    Py_DECREF(ob);
+    return 0;
+bad:
+    Py_XDECREF(ob);
+    return -1;
+}
+
+/* GetVTable (used by MergeVTables) */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* MergeVTables */
+static int __Pyx_MergeVtables(PyTypeObject *type) {
+    int i=0;
+    Py_ssize_t size;
+    void** base_vtables;
+    __Pyx_TypeName tp_base_name = NULL;
+    __Pyx_TypeName base_name = NULL;
+    void* unknown = (void*)-1;
+    PyObject* bases = __Pyx_PyType_GetSlot(type, tp_bases, PyObject*);
+    int base_depth = 0;
+    {
+        PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+        while (base) {
+            base_depth += 1;
+            base = __Pyx_PyType_GetSlot(base, tp_base, PyTypeObject*);
+        }
+    }
+    base_vtables = (void**) PyMem_Malloc(sizeof(void*) * (size_t)(base_depth + 1));
+    base_vtables[0] = unknown;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    size = PyTuple_Size(bases);
+    if (size < 0) goto other_failure;
+#else
+    size = PyTuple_GET_SIZE(bases);
+#endif
+    for (i = 1; i < size; i++) {
+        PyObject *basei;
+        void* base_vtable;
+#if CYTHON_AVOID_BORROWED_REFS
+        basei = PySequence_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#elif !CYTHON_ASSUME_SAFE_MACROS
+        basei = PyTuple_GetItem(bases, i);
+        if (unlikely(!basei)) goto other_failure;
+#else
+        basei = PyTuple_GET_ITEM(bases, i);
+#endif
+        base_vtable = __Pyx_GetVtable((PyTypeObject*)basei);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(basei);
+#endif
+        if (base_vtable != NULL) {
+            int j;
+            PyTypeObject* base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+            for (j = 0; j < base_depth; j++) {
+                if (base_vtables[j] == unknown) {
+                    base_vtables[j] = __Pyx_GetVtable(base);
+                    base_vtables[j + 1] = unknown;
+                }
+                if (base_vtables[j] == base_vtable) {
+                    break;
+                } else if (base_vtables[j] == NULL) {
+                    goto bad;
+                }
+                base = __Pyx_PyType_GetSlot(base, tp_base, PyTypeObject*);
+            }
+        }
+    }
+    PyErr_Clear();
+    PyMem_Free(base_vtables);
+    return 0;
+bad:
+    {
+        PyTypeObject* basei = NULL;
+        PyTypeObject* tp_base = __Pyx_PyType_GetSlot(type, tp_base, PyTypeObject*);
+        tp_base_name = __Pyx_PyType_GetFullyQualifiedName(tp_base);
+#if CYTHON_AVOID_BORROWED_REFS
+        basei = (PyTypeObject*)PySequence_GetItem(bases, i);
+        if (unlikely(!basei)) goto really_bad;
+#elif !CYTHON_ASSUME_SAFE_MACROS
+        basei = (PyTypeObject*)PyTuple_GetItem(bases, i);
+        if (unlikely(!basei)) goto really_bad;
+#else
+        basei = (PyTypeObject*)PyTuple_GET_ITEM(bases, i);
+#endif
+        base_name = __Pyx_PyType_GetFullyQualifiedName(basei);
+#if CYTHON_AVOID_BORROWED_REFS
+        Py_DECREF(basei);
+#endif
+    }
+    PyErr_Format(PyExc_TypeError,
+        "multiple bases have vtable conflict: '" __Pyx_FMT_TYPENAME "' and '" __Pyx_FMT_TYPENAME "'", tp_base_name, base_name);
+#if CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
+really_bad: // bad has failed!
+#endif
+    __Pyx_DECREF_TypeName(tp_base_name);
+    __Pyx_DECREF_TypeName(base_name);
+#if CYTHON_COMPILING_IN_LIMITED_API || CYTHON_AVOID_BORROWED_REFS || !CYTHON_ASSUME_SAFE_MACROS
+other_failure:
+#endif
+    PyMem_Free(base_vtables);
+    return -1;
+}
+
+/* DelItemOnTypeDict (used by SetupReduce) */
+static int __Pyx__DelItemOnTypeDict(PyTypeObject *tp, PyObject *k) {
+    int result;
+    PyObject *tp_dict;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    tp_dict = __Pyx_GetTypeDict(tp);
+    if (unlikely(!tp_dict)) return -1;
+#else
+    tp_dict = tp->tp_dict;
+#endif
+    result = PyDict_DelItem(tp_dict, k);
+    if (likely(!result)) PyType_Modified(tp);
+    return result;
+}
+
+/* SetupReduce */
+static int __Pyx_setup_reduce_is_named(PyObject* meth, PyObject* name) {
+  int ret;
+  PyObject *name_attr;
+  name_attr = __Pyx_PyObject_GetAttrStrNoError(meth, __pyx_mstate_global->__pyx_n_u_name);
+  if (likely(name_attr)) {
+      ret = PyObject_RichCompareBool(name_attr, name, Py_EQ);
+  } else {
+      ret = -1;
+  }
+  if (unlikely(ret < 0)) {
+      PyErr_Clear();
+      ret = 0;
+  }
+  Py_XDECREF(name_attr);
+  return ret;
+}
+static int __Pyx_setup_reduce(PyObject* type_obj) {
+    int ret = 0;
+    PyObject *object_reduce = NULL;
+    PyObject *object_getstate = NULL;
+    PyObject *object_reduce_ex = NULL;
+    PyObject *reduce = NULL;
+    PyObject *reduce_ex = NULL;
+    PyObject *reduce_cython = NULL;
+    PyObject *setstate = NULL;
+    PyObject *setstate_cython = NULL;
+    PyObject *getstate = NULL;
+#if CYTHON_USE_PYTYPE_LOOKUP
+    getstate = _PyType_Lookup((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_getstate);
+#else
+    getstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_getstate);
+    if (!getstate && PyErr_Occurred()) {
+        goto __PYX_BAD;
+    }
+#endif
+    if (getstate) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_getstate = _PyType_Lookup(&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_getstate);
+#else
+        object_getstate = __Pyx_PyObject_GetAttrStrNoError((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_getstate);
+        if (!object_getstate && PyErr_Occurred()) {
+            goto __PYX_BAD;
+        }
+#endif
+        if (object_getstate != getstate) {
+            goto __PYX_GOOD;
+        }
+    }
+#if CYTHON_USE_PYTYPE_LOOKUP
+    object_reduce_ex = _PyType_Lookup(&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#else
+    object_reduce_ex = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (!object_reduce_ex) goto __PYX_BAD;
+#endif
+    reduce_ex = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_mstate_global->__pyx_n_u_reduce_ex); if (unlikely(!reduce_ex)) goto __PYX_BAD;
+    if (reduce_ex == object_reduce_ex) {
+#if CYTHON_USE_PYTYPE_LOOKUP
+        object_reduce = _PyType_Lookup(&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce); if (!object_reduce) goto __PYX_BAD;
+#else
+        object_reduce = __Pyx_PyObject_GetAttrStr((PyObject*)&PyBaseObject_Type, __pyx_mstate_global->__pyx_n_u_reduce); if (!object_reduce) goto __PYX_BAD;
+#endif
+        reduce = __Pyx_PyObject_GetAttrStr(type_obj, __pyx_mstate_global->__pyx_n_u_reduce); if (unlikely(!reduce)) goto __PYX_BAD;
+        if (reduce == object_reduce || __Pyx_setup_reduce_is_named(reduce, __pyx_mstate_global->__pyx_n_u_reduce_cython)) {
+            reduce_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_reduce_cython);
+            if (likely(reduce_cython)) {
+                ret = __Pyx_SetItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_reduce, reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                ret = __Pyx_DelItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_reduce_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+            } else if (reduce == object_reduce || PyErr_Occurred()) {
+                goto __PYX_BAD;
+            }
+            setstate = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_setstate);
+            if (!setstate) PyErr_Clear();
+            if (!setstate || __Pyx_setup_reduce_is_named(setstate, __pyx_mstate_global->__pyx_n_u_setstate_cython)) {
+                setstate_cython = __Pyx_PyObject_GetAttrStrNoError(type_obj, __pyx_mstate_global->__pyx_n_u_setstate_cython);
+                if (likely(setstate_cython)) {
+                    ret = __Pyx_SetItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_setstate, setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                    ret = __Pyx_DelItemOnTypeDict((PyTypeObject*)type_obj, __pyx_mstate_global->__pyx_n_u_setstate_cython); if (unlikely(ret < 0)) goto __PYX_BAD;
+                } else if (!setstate || PyErr_Occurred()) {
+                    goto __PYX_BAD;
+                }
+            }
+            PyType_Modified((PyTypeObject*)type_obj);
+        }
+    }
+    goto __PYX_GOOD;
+__PYX_BAD:
+    if (!PyErr_Occurred()) {
+        __Pyx_TypeName type_obj_name =
+            __Pyx_PyType_GetFullyQualifiedName((PyTypeObject*)type_obj);
+        PyErr_Format(PyExc_RuntimeError,
+            "Unable to initialize pickling for " __Pyx_FMT_TYPENAME, type_obj_name);
+        __Pyx_DECREF_TypeName(type_obj_name);
+    }
+    ret = -1;
+__PYX_GOOD:
+#if !CYTHON_USE_PYTYPE_LOOKUP
+    Py_XDECREF(object_reduce);
+    Py_XDECREF(object_reduce_ex);
+    Py_XDECREF(object_getstate);
+    Py_XDECREF(getstate);
+#endif
+    Py_XDECREF(reduce);
+    Py_XDECREF(reduce_ex);
+    Py_XDECREF(reduce_cython);
+    Py_XDECREF(setstate);
+    Py_XDECREF(setstate_cython);
+    return ret;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_3_2_4
+#define __PYX_HAVE_RT_ImportType_3_2_4
+static PyTypeObject *__Pyx_ImportType_3_2_4(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_2_4 check_size)
+{
+    PyObject *result = 0;
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API)
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !( defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API) )
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    if (size == 0) {
+        return (PyTypeObject *)result;
+    }
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_3_2_4 &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_3_2_4 && (size_t)basicsize > size) {
+        if (PyErr_WarnFormat(NULL, 0,
+                "%.200s.%.200s size changed, may indicate binary incompatibility. "
+                "Expected %zd from C header, got %zd from PyObject",
+                module_name, class_name, size, basicsize) < 0) {
+            goto bad;
+        }
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* PxdImportShared (used by FunctionImport) */
+#ifndef __PYX_HAVE_RT_ImportFromPxd_3_2_4
+#define __PYX_HAVE_RT_ImportFromPxd_3_2_4
+static int __Pyx_ImportFromPxd_3_2_4(PyObject *module, const char *name, void **p, const char *sig, const char *what) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, "__pyx_capi__");
+    if (!d)
+        goto bad;
+#if (defined(Py_LIMITED_API) && Py_LIMITED_API >= 0x030d0000) || (!defined(Py_LIMITED_API) && PY_VERSION_HEX >= 0x030d0000)
+    PyDict_GetItemStringRef(d, name, &cobj);
+#else
+    cobj = PyDict_GetItemString(d, name);
+    Py_XINCREF(cobj);
+#endif
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C %.8s %.200s",
+                PyModule_GetName(module), what, name);
+        goto bad;
+    }
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C %.8s %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             what, PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    Py_DECREF(cobj);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    Py_XDECREF(cobj);
+    return -1;
+}
+#endif
+
+/* FunctionImport */
+#ifndef __PYX_HAVE_RT_ImportFunction_3_2_4
+#define __PYX_HAVE_RT_ImportFunction_3_2_4
+static int __Pyx_ImportFunction_3_2_4(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    int result = __Pyx_ImportFromPxd_3_2_4(module, funcname, &tmp.p, sig, "function");
+    if (result == 0) {
+        *f = tmp.fp;
+    }
+    return result;
+}
+#endif
+
+/* HasAttr (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!PyUnicode_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+    if (!r) {
+        return (unlikely(PyErr_Occurred())) ? -1 : 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+#endif
+
+/* ImportImpl (used by Import) */
+static int __Pyx__Import_GetModule(PyObject *qualname, PyObject **module) {
+    PyObject *imported_module = PyImport_GetModule(qualname);
+    if (unlikely(!imported_module)) {
+        *module = NULL;
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        return 0;
+    }
+    *module = imported_module;
+    return 1;
+}
+static int __Pyx__Import_Lookup(PyObject *qualname, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject **module) {
+    PyObject *imported_module;
+    PyObject *top_level_package_name;
+    Py_ssize_t i;
+    int status, module_found;
+    Py_ssize_t dot_index;
+    module_found = __Pyx__Import_GetModule(qualname, &imported_module);
+    if (unlikely(!module_found || module_found == -1)) {
+        *module = NULL;
+        return module_found;
+    }
+    if (imported_names) {
+        for (i = 0; i < len_imported_names; i++) {
+            PyObject *imported_name = imported_names[i];
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+            int has_imported_attribute = PyObject_HasAttr(imported_module, imported_name);
+#else
+            int has_imported_attribute = PyObject_HasAttrWithError(imported_module, imported_name);
+            if (unlikely(has_imported_attribute == -1)) goto error;
+#endif
+            if (!has_imported_attribute) {
+                goto not_found;
+            }
+        }
+        *module = imported_module;
+        return 1;
+    }
+    dot_index = PyUnicode_FindChar(qualname, '.', 0, PY_SSIZE_T_MAX, 1);
+    if (dot_index == -1) {
+        *module = imported_module;
+        return 1;
+    }
+    if (unlikely(dot_index == -2)) goto error;
+    top_level_package_name = PyUnicode_Substring(qualname, 0, dot_index);
+    if (unlikely(!top_level_package_name)) goto error;
+    Py_DECREF(imported_module);
+    status = __Pyx__Import_GetModule(top_level_package_name, module);
+    Py_DECREF(top_level_package_name);
+    return status;
+error:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return -1;
+not_found:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return 0;
+}
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level) {
+    PyObject *module = 0;
+    PyObject *empty_dict = 0;
+    PyObject *from_list = 0;
+    int module_found;
+    if (!qualname) {
+        qualname = name;
+    }
+    module_found = __Pyx__Import_Lookup(qualname, imported_names, len_imported_names, &module);
+    if (likely(module_found == 1)) {
+        return module;
+    } else if (unlikely(module_found == -1)) {
+        return NULL;
+    }
+    empty_dict = PyDict_New();
+    if (unlikely(!empty_dict))
+        goto bad;
+    if (imported_names) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        from_list = __Pyx_PyList_FromArray(imported_names, len_imported_names);
+        if (unlikely(!from_list))
+            goto bad;
+#else
+        from_list = PyList_New(len_imported_names);
+        if (unlikely(!from_list)) goto bad;
+        for (Py_ssize_t i=0; i<len_imported_names; ++i) {
+            if (PyList_SetItem(from_list, i, __Pyx_NewRef(imported_names[i])) < 0) goto bad;
+        }
+#endif
+    }
+    if (level == -1) {
+        const char* package_sep = strchr(__Pyx_MODULE_NAME, '.');
+        if (package_sep != (0)) {
+            module = PyImport_ImportModuleLevelObject(
+                name, moddict, empty_dict, from_list, 1);
+            if (unlikely(!module)) {
+                if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        level = 0;
+    }
+    if (!module) {
+        module = PyImport_ImportModuleLevelObject(
+            name, moddict, empty_dict, from_list, level);
+    }
+bad:
+    Py_XDECREF(from_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level) {
+    return __Pyx__Import(name, imported_names, len_imported_names, qualname, __pyx_mstate_global->__pyx_d, level);
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u__2);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
+                CYTHON_COMPILING_IN_GRAAL
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
+    }
+    return value;
+}
+
+/* dict_setdefault (used by FetchCommonType) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030F0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4)
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#elif CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
+#endif
+    return value;
+}
+
+/* AddModuleRef (used by FetchSharedCythonModule) */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
+      PyObject *module_dict = PyImport_GetModuleDict();
+      PyObject *m;
+      if (PyMapping_GetOptionalItem(module_dict, name, &m) < 0) {
+          return NULL;
+      }
+      if (m != NULL && PyModule_Check(m)) {
+          return m;
+      }
+      Py_XDECREF(m);
+      m = PyModule_NewObject(name);
+      if (m == NULL)
+          return NULL;
+      if (PyDict_CheckExact(module_dict)) {
+          PyObject *new_m;
+          (void)PyDict_SetDefaultRef(module_dict, name, m, &new_m);
+          Py_DECREF(m);
+          return new_m;
+      } else {
+           if (PyObject_SetItem(module_dict, name, m) != 0) {
+                Py_DECREF(m);
+                return NULL;
+            }
+            return m;
+      }
+  }
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *py_name = PyUnicode_FromString(name);
+      if (!py_name) return NULL;
+      PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
+      Py_DECREF(py_name);
+      return module;
+  }
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#else
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
+
+/* FetchSharedCythonModule (used by FetchCommonType) */
+static PyObject *__Pyx_FetchSharedCythonABIModule(void) {
+    return __Pyx_PyImport_AddModuleRef(__PYX_ABI_MODULE_NAME);
+}
+
+/* FetchCommonType (used by CommonTypesMetaclass) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030C0000
+static PyObject* __Pyx_PyType_FromMetaclass(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *result = __Pyx_PyType_FromModuleAndSpec(module, spec, bases);
+    if (result && metaclass) {
+        PyObject *old_tp = (PyObject*)Py_TYPE(result);
+    Py_INCREF((PyObject*)metaclass);
+#if __PYX_LIMITED_VERSION_HEX >= 0x03090000
+        Py_SET_TYPE(result, metaclass);
+#else
+        result->ob_type = metaclass;
+#endif
+        Py_DECREF(old_tp);
+    }
+    return result;
+}
+#else
+#define __Pyx_PyType_FromMetaclass(me, mo, s, b) PyType_FromMetaclass(me, mo, s, b)
+#endif
+static int __Pyx_VerifyCachedType(PyObject *cached_type,
+                               const char *name,
+                               Py_ssize_t expected_basicsize) {
+    Py_ssize_t basicsize;
+    if (!PyType_Check(cached_type)) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s is not a type object", name);
+        return -1;
+    }
+    if (expected_basicsize == 0) {
+        return 0; // size is inherited, nothing useful to check
+    }
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_basicsize;
+    py_basicsize = PyObject_GetAttrString(cached_type, "__basicsize__");
+    if (unlikely(!py_basicsize)) return -1;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = NULL;
+    if (unlikely(basicsize == (Py_ssize_t)-1) && PyErr_Occurred()) return -1;
+#else
+    basicsize = ((PyTypeObject*) cached_type)->tp_basicsize;
+#endif
+    if (basicsize != expected_basicsize) {
+        PyErr_Format(PyExc_TypeError,
+            "Shared Cython type %.200s has the wrong size, try recompiling",
+            name);
+        return -1;
+    }
+    return 0;
+}
+static PyTypeObject *__Pyx_FetchCommonTypeFromSpec(PyTypeObject *metaclass, PyObject *module, PyType_Spec *spec, PyObject *bases) {
+    PyObject *abi_module = NULL, *cached_type = NULL, *abi_module_dict, *new_cached_type, *py_object_name;
+    int get_item_ref_result;
+    const char* object_name = strrchr(spec->name, '.');
+    object_name = object_name ? object_name+1 : spec->name;
+    py_object_name = PyUnicode_FromString(object_name);
+    if (!py_object_name) return NULL;
+    abi_module = __Pyx_FetchSharedCythonABIModule();
+    if (!abi_module) goto done;
+    abi_module_dict = PyModule_GetDict(abi_module);
+    if (!abi_module_dict) goto done;
+    get_item_ref_result = __Pyx_PyDict_GetItemRef(abi_module_dict, py_object_name, &cached_type);
+    if (get_item_ref_result == 1) {
+        if (__Pyx_VerifyCachedType(
+              cached_type,
+              object_name,
+              spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    } else if (unlikely(get_item_ref_result == -1)) {
+        goto bad;
+    }
+    cached_type = __Pyx_PyType_FromMetaclass(
+        metaclass,
+        CYTHON_USE_MODULE_STATE ? module : abi_module,
+        spec, bases);
+    if (unlikely(!cached_type)) goto bad;
+    if (unlikely(__Pyx_fix_up_extension_type_from_spec(spec, (PyTypeObject *) cached_type) < 0)) goto bad;
+    new_cached_type = __Pyx_PyDict_SetDefault(abi_module_dict, py_object_name, cached_type);
+    if (unlikely(new_cached_type != cached_type)) {
+        if (unlikely(!new_cached_type)) goto bad;
+        Py_DECREF(cached_type);
+        cached_type = new_cached_type;
+        if (__Pyx_VerifyCachedType(
+                cached_type,
+                object_name,
+                spec->basicsize) < 0) {
+            goto bad;
+        }
+        goto done;
+    } else {
+        Py_DECREF(new_cached_type);
+    }
+done:
+    Py_XDECREF(abi_module);
+    Py_DECREF(py_object_name);
+    assert(cached_type == NULL || PyType_Check(cached_type));
+    return (PyTypeObject *) cached_type;
+bad:
+    Py_XDECREF(cached_type);
+    cached_type = NULL;
+    goto done;
+}
+
+/* CommonTypesMetaclass (used by CythonFunctionShared) */
+static PyObject* __pyx_CommonTypesMetaclass_get_module(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED void* context) {
+    return PyUnicode_FromString(__PYX_ABI_MODULE_NAME);
+}
+#if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+static PyObject* __pyx_CommonTypesMetaclass_call(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *args, CYTHON_UNUSED PyObject *kwds) {
+    PyErr_SetString(PyExc_TypeError, "Cannot instantiate Cython internal types");
+    return NULL;
+}
+static int __pyx_CommonTypesMetaclass_setattr(CYTHON_UNUSED PyObject *self, CYTHON_UNUSED PyObject *attr, CYTHON_UNUSED PyObject *value) {
+    PyErr_SetString(PyExc_TypeError, "Cython internal types are immutable");
+    return -1;
+}
+#endif
+static PyGetSetDef __pyx_CommonTypesMetaclass_getset[] = {
+    {"__module__", __pyx_CommonTypesMetaclass_get_module, NULL, NULL, NULL},
+    {0, 0, 0, 0, 0}
+};
+static PyType_Slot __pyx_CommonTypesMetaclass_slots[] = {
+    {Py_tp_getset, (void *)__pyx_CommonTypesMetaclass_getset},
+    #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    {Py_tp_call, (void*)__pyx_CommonTypesMetaclass_call},
+    {Py_tp_new, (void*)__pyx_CommonTypesMetaclass_call},
+    {Py_tp_setattro, (void*)__pyx_CommonTypesMetaclass_setattr},
+    #endif
+    {0, 0}
+};
+static PyType_Spec __pyx_CommonTypesMetaclass_spec = {
+    __PYX_TYPE_MODULE_PREFIX "_common_types_metatype",
+    0,
+    0,
+    Py_TPFLAGS_IMMUTABLETYPE |
+    Py_TPFLAGS_DISALLOW_INSTANTIATION |
+    Py_TPFLAGS_DEFAULT,
+    __pyx_CommonTypesMetaclass_slots
+};
+static int __pyx_CommonTypesMetaclass_init(PyObject *module) {
+    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
+    PyObject *bases = PyTuple_Pack(1, &PyType_Type);
+    if (unlikely(!bases)) {
+        return -1;
+    }
+    mstate->__pyx_CommonTypesMetaclassType = __Pyx_FetchCommonTypeFromSpec(NULL, module, &__pyx_CommonTypesMetaclass_spec, bases);
+    Py_DECREF(bases);
+    if (unlikely(mstate->__pyx_CommonTypesMetaclassType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+
+/* PyMethodNew (used by CythonFunctionShared) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    PyObject *result;
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    {
+        PyObject *args[] = {func, self};
+        result = PyObject_Vectorcall(__pyx_mstate_global->__Pyx_CachedMethodType, args, 2, NULL);
+    }
+    #else
+    result = PyObject_CallFunctionObjArgs(__pyx_mstate_global->__Pyx_CachedMethodType, func, self, NULL);
+    #endif
+    return result;
+}
+#else
+static PyObject *__Pyx_PyMethod_New(PyObject *func, PyObject *self, PyObject *typ) {
+    CYTHON_UNUSED_VAR(typ);
+    if (!self)
+        return __Pyx_NewRef(func);
+    return PyMethod_New(func, self);
+}
+#endif
+
+/* PyVectorcallFastCallDict (used by CythonFunctionShared) */
+#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
+static PyObject *__Pyx_PyVectorcall_FastCallDict_kw(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    PyObject *res = NULL;
+    PyObject *kwnames;
+    PyObject **newargs;
+    PyObject **kwvalues;
+    Py_ssize_t i;
+    #if CYTHON_AVOID_BORROWED_REFS
+    PyObject *pos;
+    #else
+    Py_ssize_t pos;
+    #endif
+    size_t j;
+    PyObject *key, *value;
+    unsigned long keys_are_strings;
+    #if !CYTHON_ASSUME_SAFE_SIZE
+    Py_ssize_t nkw = PyDict_Size(kw);
+    if (unlikely(nkw == -1)) return NULL;
+    #else
+    Py_ssize_t nkw = PyDict_GET_SIZE(kw);
+    #endif
+    newargs = (PyObject **)PyMem_Malloc((nargs + (size_t)nkw) * sizeof(args[0]));
+    if (unlikely(newargs == NULL)) {
+        PyErr_NoMemory();
+        return NULL;
+    }
+    for (j = 0; j < nargs; j++) newargs[j] = args[j];
+    kwnames = PyTuple_New(nkw);
+    if (unlikely(kwnames == NULL)) {
+        PyMem_Free(newargs);
+        return NULL;
+    }
+    kwvalues = newargs + nargs;
+    pos = 0;
+    i = 0;
+    keys_are_strings = Py_TPFLAGS_UNICODE_SUBCLASS;
+    while (__Pyx_PyDict_NextRef(kw, &pos, &key, &value)) {
+        keys_are_strings &=
+        #if CYTHON_COMPILING_IN_LIMITED_API
+            PyType_GetFlags(Py_TYPE(key));
+        #else
+            Py_TYPE(key)->tp_flags;
+        #endif
+        #if !CYTHON_ASSUME_SAFE_MACROS
+        if (unlikely(PyTuple_SetItem(kwnames, i, key) < 0)) goto cleanup;
+        #else
+        PyTuple_SET_ITEM(kwnames, i, key);
+        #endif
+        kwvalues[i] = value;
+        i++;
+    }
+    if (unlikely(!keys_are_strings)) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        goto cleanup;
+    }
+    res = vc(func, newargs, nargs, kwnames);
+cleanup:
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(pos);
+    #endif
+    Py_DECREF(kwnames);
+    for (i = 0; i < nkw; i++)
+        Py_DECREF(kwvalues[i]);
+    PyMem_Free(newargs);
+    return res;
+}
+static CYTHON_INLINE PyObject *__Pyx_PyVectorcall_FastCallDict(PyObject *func, __pyx_vectorcallfunc vc, PyObject *const *args, size_t nargs, PyObject *kw)
+{
+    Py_ssize_t kw_size =
+        likely(kw == NULL) ?
+        0 :
+#if !CYTHON_ASSUME_SAFE_SIZE
+        PyDict_Size(kw);
+#else
+        PyDict_GET_SIZE(kw);
+#endif
+    if (kw_size == 0) {
+        return vc(func, args, nargs, NULL);
+    }
+#if !CYTHON_ASSUME_SAFE_SIZE
+    else if (unlikely(kw_size == -1)) {
+        return NULL;
+    }
+#endif
+    return __Pyx_PyVectorcall_FastCallDict_kw(func, vc, args, nargs, kw);
+}
+#endif
+
+/* CythonFunctionShared (used by CythonFunction) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunctionNoMethod(PyObject *func, void (*cfunc)(void)) {
+    if (__Pyx_CyFunction_Check(func)) {
+        return PyCFunction_GetFunction(((__pyx_CyFunctionObject*)func)->func) == (PyCFunction) cfunc;
+    } else if (PyCFunction_Check(func)) {
+        return PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if ((PyObject*)Py_TYPE(func) == __pyx_mstate_global->__Pyx_CachedMethodType) {
+        int result;
+        PyObject *newFunc = PyObject_GetAttr(func, __pyx_mstate_global->__pyx_n_u_func);
+        if (unlikely(!newFunc)) {
+            PyErr_Clear(); // It's only an optimization, so don't throw an error
+            return 0;
+        }
+        result = __Pyx__IsSameCyOrCFunctionNoMethod(newFunc, cfunc);
+        Py_DECREF(newFunc);
+        return result;
+    }
+    return __Pyx__IsSameCyOrCFunctionNoMethod(func, cfunc);
+}
+#else
+static CYTHON_INLINE int __Pyx__IsSameCyOrCFunction(PyObject *func, void (*cfunc)(void)) {
+    if (PyMethod_Check(func)) {
+        func = PyMethod_GET_FUNCTION(func);
+    }
+    return __Pyx_CyOrPyCFunction_Check(func) && __Pyx_CyOrPyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+}
+#endif
+static CYTHON_INLINE void __Pyx__CyFunction_SetClassObj(__pyx_CyFunctionObject* f, PyObject* classobj) {
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    __Pyx_Py_XDECREF_SET(
+        __Pyx_CyFunction_GetClassObj(f),
+            ((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#else
+    __Pyx_Py_XDECREF_SET(
+        ((PyCMethodObject *) (f))->mm_class,
+        (PyTypeObject*)((classobj) ? __Pyx_NewRef(classobj) : NULL));
+#endif
+}
+static PyObject *
+__Pyx_CyFunction_get_doc_locked(__pyx_CyFunctionObject *op)
+{
+    if (unlikely(op->func_doc == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        op->func_doc = PyObject_GetAttrString(op->func, "__doc__");
+        if (unlikely(!op->func_doc)) return NULL;
+#else
+        if (((PyCFunctionObject*)op)->m_ml->ml_doc) {
+            op->func_doc = PyUnicode_FromString(((PyCFunctionObject*)op)->m_ml->ml_doc);
+            if (unlikely(op->func_doc == NULL))
+                return NULL;
+        } else {
+            Py_INCREF(Py_None);
+            return Py_None;
+        }
+#endif
+    }
+    Py_INCREF(op->func_doc);
+    return op->func_doc;
+}
+static PyObject *
+__Pyx_CyFunction_get_doc(__pyx_CyFunctionObject *op, void *closure) {
+    PyObject *result;
+    CYTHON_UNUSED_VAR(closure);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_doc_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_doc(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (value == NULL) {
+        value = Py_None;
+    }
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_Py_XDECREF_SET(op->func_doc, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_name_locked(__pyx_CyFunctionObject *op)
+{
+    if (unlikely(op->func_name == NULL)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+        op->func_name = PyObject_GetAttrString(op->func, "__name__");
+#else
+        op->func_name = PyUnicode_InternFromString(((PyCFunctionObject*)op)->m_ml->ml_name);
+#endif
+        if (unlikely(op->func_name == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_name);
+    return op->func_name;
+}
+static PyObject *
+__Pyx_CyFunction_get_name(__pyx_CyFunctionObject *op, void *context)
+{
+    PyObject *result = NULL;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_name_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_name(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__name__ must be set to a string object");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_Py_XDECREF_SET(op->func_name, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_qualname(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    PyObject *result;
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    Py_INCREF(op->func_qualname);
+    result = op->func_qualname;
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_qualname(__pyx_CyFunctionObject *op, PyObject *value, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(value == NULL || !PyUnicode_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__qualname__ must be set to a string object");
+        return -1;
+    }
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_Py_XDECREF_SET(op->func_qualname, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+static PyObject *
+__Pyx_CyFunction_get_dict(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    if (unlikely(op->func_dict == NULL)) {
+        op->func_dict = PyDict_New();
+        if (unlikely(op->func_dict == NULL))
+            return NULL;
+    }
+    Py_INCREF(op->func_dict);
+    return op->func_dict;
+}
+#endif
+static PyObject *
+__Pyx_CyFunction_get_globals(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(op->func_globals);
+    return op->func_globals;
+}
+static PyObject *
+__Pyx_CyFunction_get_closure(__pyx_CyFunctionObject *op, void *context)
+{
+    CYTHON_UNUSED_VAR(op);
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(Py_None);
+    return Py_None;
+}
+static PyObject *
+__Pyx_CyFunction_get_code(__pyx_CyFunctionObject *op, void *context)
+{
+    PyObject* result = (op->func_code) ? op->func_code : Py_None;
+    CYTHON_UNUSED_VAR(context);
+    Py_INCREF(result);
+    return result;
+}
+static int
+__Pyx_CyFunction_init_defaults(__pyx_CyFunctionObject *op) {
+    int result = 0;
+    PyObject *res = op->defaults_getter((PyObject *) op);
+    if (unlikely(!res))
+        return -1;
+    #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+    op->defaults_tuple = PyTuple_GET_ITEM(res, 0);
+    Py_INCREF(op->defaults_tuple);
+    op->defaults_kwdict = PyTuple_GET_ITEM(res, 1);
+    Py_INCREF(op->defaults_kwdict);
+    #else
+    op->defaults_tuple = __Pyx_PySequence_ITEM(res, 0);
+    if (unlikely(!op->defaults_tuple)) result = -1;
+    else {
+        op->defaults_kwdict = __Pyx_PySequence_ITEM(res, 1);
+        if (unlikely(!op->defaults_kwdict)) result = -1;
+    }
+    #endif
+    Py_DECREF(res);
+    return result;
+}
+static int
+__Pyx_CyFunction_set_defaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyTuple_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__defaults__ must be set to a tuple object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__defaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_Py_XDECREF_SET(op->defaults_tuple, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults_locked(__pyx_CyFunctionObject *op) {
+    PyObject* result = op->defaults_tuple;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            result = op->defaults_tuple;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_defaults(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result = NULL;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_defaults_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_kwdefaults(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value) {
+        value = Py_None;
+    } else if (unlikely(value != Py_None && !PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__kwdefaults__ must be set to a dict object");
+        return -1;
+    }
+    PyErr_WarnEx(PyExc_RuntimeWarning, "changes to cyfunction.__kwdefaults__ will not "
+                 "currently affect the values used in function calls", 1);
+    Py_INCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_Py_XDECREF_SET(op->defaults_kwdict, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults_locked(__pyx_CyFunctionObject *op) {
+    PyObject* result = op->defaults_kwdict;
+    if (unlikely(!result)) {
+        if (op->defaults_getter) {
+            if (unlikely(__Pyx_CyFunction_init_defaults(op) < 0)) return NULL;
+            result = op->defaults_kwdict;
+        } else {
+            result = Py_None;
+        }
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_kwdefaults(__pyx_CyFunctionObject *op, void *context) {
+    PyObject* result;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_kwdefaults_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static int
+__Pyx_CyFunction_set_annotations(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    if (!value || value == Py_None) {
+        value = NULL;
+    } else if (unlikely(!PyDict_Check(value))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "__annotations__ must be set to a dict object");
+        return -1;
+    }
+    Py_XINCREF(value);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    __Pyx_Py_XDECREF_SET(op->func_annotations, value);
+    __Pyx_END_CRITICAL_SECTION();
+    return 0;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations_locked(__pyx_CyFunctionObject *op) {
+    PyObject* result = op->func_annotations;
+    if (unlikely(!result)) {
+        result = PyDict_New();
+        if (unlikely(!result)) return NULL;
+        op->func_annotations = result;
+    }
+    Py_INCREF(result);
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_annotations(__pyx_CyFunctionObject *op, void *context) {
+    PyObject *result;
+    CYTHON_UNUSED_VAR(context);
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    result = __Pyx_CyFunction_get_annotations_locked(op);
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine_value(__pyx_CyFunctionObject *op) {
+    int is_coroutine = op->flags & __Pyx_CYFUNCTION_COROUTINE;
+    if (is_coroutine) {
+        PyObject *is_coroutine_value, *module, *fromlist, *marker = __pyx_mstate_global->__pyx_n_u_is_coroutine;
+        fromlist = PyList_New(1);
+        if (unlikely(!fromlist)) return NULL;
+        Py_INCREF(marker);
+#if CYTHON_ASSUME_SAFE_MACROS
+        PyList_SET_ITEM(fromlist, 0, marker);
+#else
+        if (unlikely(PyList_SetItem(fromlist, 0, marker) < 0)) {
+            Py_DECREF(marker);
+            Py_DECREF(fromlist);
+            return NULL;
+        }
+#endif
+        module = PyImport_ImportModuleLevelObject(__pyx_mstate_global->__pyx_n_u_asyncio_coroutines, NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+        if (unlikely(!module)) goto ignore;
+        is_coroutine_value = __Pyx_PyObject_GetAttrStr(module, marker);
+        Py_DECREF(module);
+        if (likely(is_coroutine_value)) {
+            return is_coroutine_value;
+        }
+ignore:
+        PyErr_Clear();
+    }
+    return __Pyx_PyBool_FromLong(is_coroutine);
+}
+static PyObject *
+__Pyx_CyFunction_get_is_coroutine(__pyx_CyFunctionObject *op, void *context) {
+    PyObject *result;
+    CYTHON_UNUSED_VAR(context);
+    if (op->func_is_coroutine) {
+        return __Pyx_NewRef(op->func_is_coroutine);
+    }
+    result = __Pyx_CyFunction_get_is_coroutine_value(op);
+    if (unlikely(!result))
+        return NULL;
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    if (op->func_is_coroutine) {
+        Py_DECREF(result);
+        result = __Pyx_NewRef(op->func_is_coroutine);
+    } else {
+        op->func_is_coroutine = __Pyx_NewRef(result);
+    }
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static void __Pyx_CyFunction_raise_argument_count_error(__pyx_CyFunctionObject *func, const char* message, Py_ssize_t size) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
+    if (!py_name) return;
+    PyErr_Format(PyExc_TypeError,
+        "%.200S() %s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+        py_name, message, size);
+    Py_DECREF(py_name);
+#else
+    const char* name = ((PyCFunctionObject*)func)->m_ml->ml_name;
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() %s (%" CYTHON_FORMAT_SSIZE_T "d given)",
+        name, message, size);
+#endif
+}
+static void __Pyx_CyFunction_raise_type_error(__pyx_CyFunctionObject *func, const char* message) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *py_name = __Pyx_CyFunction_get_name(func, NULL);
+    if (!py_name) return;
+    PyErr_Format(PyExc_TypeError,
+        "%.200S() %s",
+        py_name, message);
+    Py_DECREF(py_name);
+#else
+    const char* name = ((PyCFunctionObject*)func)->m_ml->ml_name;
+    PyErr_Format(PyExc_TypeError,
+        "%.200s() %s",
+        name, message);
+#endif
+}
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *
+__Pyx_CyFunction_get_module(__pyx_CyFunctionObject *op, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    return PyObject_GetAttrString(op->func, "__module__");
+}
+static int
+__Pyx_CyFunction_set_module(__pyx_CyFunctionObject *op, PyObject* value, void *context) {
+    CYTHON_UNUSED_VAR(context);
+    return PyObject_SetAttrString(op->func, "__module__", value);
+}
+#endif
+static PyGetSetDef __pyx_CyFunction_getsets[] = {
+    {"func_doc", (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {"__doc__",  (getter)__Pyx_CyFunction_get_doc, (setter)__Pyx_CyFunction_set_doc, 0, 0},
+    {"func_name", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {"__name__", (getter)__Pyx_CyFunction_get_name, (setter)__Pyx_CyFunction_set_name, 0, 0},
+    {"__qualname__", (getter)__Pyx_CyFunction_get_qualname, (setter)__Pyx_CyFunction_set_qualname, 0, 0},
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+    {"func_dict", (getter)__Pyx_CyFunction_get_dict, (setter)PyObject_GenericSetDict, 0, 0},
+    {"__dict__", (getter)__Pyx_CyFunction_get_dict, (setter)PyObject_GenericSetDict, 0, 0},
+#else
+    {"func_dict", (getter)PyObject_GenericGetDict, (setter)PyObject_GenericSetDict, 0, 0},
+    {"__dict__", (getter)PyObject_GenericGetDict, (setter)PyObject_GenericSetDict, 0, 0},
+#endif
+    {"func_globals", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {"__globals__", (getter)__Pyx_CyFunction_get_globals, 0, 0, 0},
+    {"func_closure", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {"__closure__", (getter)__Pyx_CyFunction_get_closure, 0, 0, 0},
+    {"func_code", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {"__code__", (getter)__Pyx_CyFunction_get_code, 0, 0, 0},
+    {"func_defaults", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {"__defaults__", (getter)__Pyx_CyFunction_get_defaults, (setter)__Pyx_CyFunction_set_defaults, 0, 0},
+    {"__kwdefaults__", (getter)__Pyx_CyFunction_get_kwdefaults, (setter)__Pyx_CyFunction_set_kwdefaults, 0, 0},
+    {"__annotations__", (getter)__Pyx_CyFunction_get_annotations, (setter)__Pyx_CyFunction_set_annotations, 0, 0},
+    {"_is_coroutine", (getter)__Pyx_CyFunction_get_is_coroutine, 0, 0, 0},
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", (getter)__Pyx_CyFunction_get_module, (setter)__Pyx_CyFunction_set_module, 0, 0},
+#endif
+    {0, 0, 0, 0, 0}
+};
+static PyMemberDef __pyx_CyFunction_members[] = {
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    {"__module__", T_OBJECT, offsetof(PyCFunctionObject, m_module), 0, 0},
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    {"__dictoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_dict), READONLY, 0},
+#endif
+#if CYTHON_METH_FASTCALL
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_vectorcall), READONLY, 0},
+#else
+    {"__vectorcalloffset__", T_PYSSIZET, offsetof(PyCFunctionObject, vectorcall), READONLY, 0},
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(__pyx_CyFunctionObject, func_weakreflist), READONLY, 0},
+#else
+    {"__weaklistoffset__", T_PYSSIZET, offsetof(PyCFunctionObject, m_weakreflist), READONLY, 0},
+#endif
+#endif
+    {0, 0, 0,  0, 0}
+};
+static PyObject *
+__Pyx_CyFunction_reduce(__pyx_CyFunctionObject *m, PyObject *args)
+{
+    PyObject *result = NULL;
+    CYTHON_UNUSED_VAR(args);
+    __Pyx_BEGIN_CRITICAL_SECTION(m);
+    Py_INCREF(m->func_qualname);
+    result = m->func_qualname;
+    __Pyx_END_CRITICAL_SECTION();
+    return result;
+}
+static PyMethodDef __pyx_CyFunction_methods[] = {
+    {"__reduce__", (PyCFunction)__Pyx_CyFunction_reduce, METH_VARARGS, 0},
+    {0, 0, 0, 0}
+};
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyFunction_weakreflist(cyfunc) ((cyfunc)->func_weakreflist)
+#else
+#define __Pyx_CyFunction_weakreflist(cyfunc) (((PyCFunctionObject*)cyfunc)->m_weakreflist)
+#endif
+static PyObject *__Pyx_CyFunction_Init(__pyx_CyFunctionObject *op, PyMethodDef *ml, int flags, PyObject* qualname,
+                                       PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunctionObject *cf = (PyCFunctionObject*) op;
+#endif
+    if (unlikely(op == NULL))
+        return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    op->func = PyCFunction_NewEx(ml, (PyObject*)op, module);
+    if (unlikely(!op->func)) return NULL;
+#endif
+    op->flags = flags;
+    __Pyx_CyFunction_weakreflist(op) = NULL;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    cf->m_ml = ml;
+    cf->m_self = (PyObject *) op;
+#endif
+    Py_XINCREF(closure);
+    op->func_closure = closure;
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    Py_XINCREF(module);
+    cf->m_module = module;
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    op->func_dict = NULL;
+#endif
+    op->func_name = NULL;
+    Py_INCREF(qualname);
+    op->func_qualname = qualname;
+    op->func_doc = NULL;
+#if PY_VERSION_HEX < 0x030900B1 || CYTHON_COMPILING_IN_LIMITED_API
+    op->func_classobj = NULL;
+#else
+    ((PyCMethodObject*)op)->mm_class = NULL;
+#endif
+    op->func_globals = globals;
+    Py_INCREF(op->func_globals);
+    Py_XINCREF(code);
+    op->func_code = code;
+    op->defaults = NULL;
+    op->defaults_tuple = NULL;
+    op->defaults_kwdict = NULL;
+    op->defaults_getter = NULL;
+    op->func_annotations = NULL;
+    op->func_is_coroutine = NULL;
+#if CYTHON_METH_FASTCALL
+    switch (ml->ml_flags & (METH_VARARGS | METH_FASTCALL | METH_NOARGS | METH_O | METH_KEYWORDS | METH_METHOD)) {
+    case METH_NOARGS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_NOARGS;
+        break;
+    case METH_O:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_O;
+        break;
+    case METH_METHOD | METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD;
+        break;
+    case METH_FASTCALL | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS;
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        __Pyx_CyFunction_func_vectorcall(op) = NULL;
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        Py_DECREF(op);
+        return NULL;
+    }
+#endif
+    return (PyObject *) op;
+}
+static int
+__Pyx_CyFunction_clear(__pyx_CyFunctionObject *m)
+{
+    Py_CLEAR(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func);
+#else
+    Py_CLEAR(((PyCFunctionObject*)m)->m_module);
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    Py_CLEAR(m->func_dict);
+#elif PY_VERSION_HEX < 0x030d0000
+    _PyObject_ClearManagedDict((PyObject*)m);
+#else
+    PyObject_ClearManagedDict((PyObject*)m);
+#endif
+    Py_CLEAR(m->func_name);
+    Py_CLEAR(m->func_qualname);
+    Py_CLEAR(m->func_doc);
+    Py_CLEAR(m->func_globals);
+    Py_CLEAR(m->func_code);
+#if !CYTHON_COMPILING_IN_LIMITED_API
+#if PY_VERSION_HEX < 0x030900B1
+    Py_CLEAR(__Pyx_CyFunction_GetClassObj(m));
+#else
+    {
+        PyObject *cls = (PyObject*) ((PyCMethodObject *) (m))->mm_class;
+        ((PyCMethodObject *) (m))->mm_class = NULL;
+        Py_XDECREF(cls);
+    }
+#endif
+#endif
+    Py_CLEAR(m->defaults_tuple);
+    Py_CLEAR(m->defaults_kwdict);
+    Py_CLEAR(m->func_annotations);
+    Py_CLEAR(m->func_is_coroutine);
+    Py_CLEAR(m->defaults);
+    return 0;
+}
+static void __Pyx__CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    if (__Pyx_CyFunction_weakreflist(m) != NULL)
+        PyObject_ClearWeakRefs((PyObject *) m);
+    __Pyx_CyFunction_clear(m);
+    __Pyx_PyHeapTypeObject_GC_Del(m);
+}
+static void __Pyx_CyFunction_dealloc(__pyx_CyFunctionObject *m)
+{
+    PyObject_GC_UnTrack(m);
+    __Pyx__CyFunction_dealloc(m);
+}
+static int __Pyx_CyFunction_traverse(__pyx_CyFunctionObject *m, visitproc visit, void *arg)
+{
+    {
+        int e = __Pyx_call_type_traverse((PyObject*)m, 1, visit, arg);
+        if (e) return e;
+    }
+    Py_VISIT(m->func_closure);
+#if CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func);
+#else
+    Py_VISIT(((PyCFunctionObject*)m)->m_module);
+#endif
+#if PY_VERSION_HEX < 0x030C0000 || CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(m->func_dict);
+#else
+    {
+        int e =
+#if PY_VERSION_HEX < 0x030d0000
+            _PyObject_VisitManagedDict
+#else
+            PyObject_VisitManagedDict
+#endif
+                ((PyObject*)m, visit, arg);
+        if (e != 0) return e;
+    }
+#endif
+    __Pyx_VISIT_CONST(m->func_name);
+    __Pyx_VISIT_CONST(m->func_qualname);
+    Py_VISIT(m->func_doc);
+    Py_VISIT(m->func_globals);
+    __Pyx_VISIT_CONST(m->func_code);
+#if !CYTHON_COMPILING_IN_LIMITED_API
+    Py_VISIT(__Pyx_CyFunction_GetClassObj(m));
+#endif
+    Py_VISIT(m->defaults_tuple);
+    Py_VISIT(m->defaults_kwdict);
+    Py_VISIT(m->func_is_coroutine);
+    Py_VISIT(m->defaults);
+    return 0;
+}
+static PyObject*
+__Pyx_CyFunction_repr(__pyx_CyFunctionObject *op)
+{
+    PyObject *repr;
+    __Pyx_BEGIN_CRITICAL_SECTION(op);
+    repr = PyUnicode_FromFormat("<cyfunction %U at %p>",
+                                op->func_qualname, (void *)op);
+    __Pyx_END_CRITICAL_SECTION();
+    return repr;
+}
+static PyObject * __Pyx_CyFunction_CallMethod(PyObject *func, PyObject *self, PyObject *arg, PyObject *kw) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *f = ((__pyx_CyFunctionObject*)func)->func;
+    PyCFunction meth;
+    int flags;
+    meth = PyCFunction_GetFunction(f);
+    if (unlikely(!meth)) return NULL;
+    flags = PyCFunction_GetFlags(f);
+    if (unlikely(flags < 0)) return NULL;
+#else
+    PyCFunctionObject* f = (PyCFunctionObject*)func;
+    PyCFunction meth = f->m_ml->ml_meth;
+    int flags = f->m_ml->ml_flags;
+#endif
+    Py_ssize_t size;
+    switch (flags & (METH_VARARGS | METH_KEYWORDS | METH_NOARGS | METH_O)) {
+    case METH_VARARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0))
+            return (*meth)(self, arg);
+        break;
+    case METH_VARARGS | METH_KEYWORDS:
+        return (*(PyCFunctionWithKeywords)(void(*)(void))meth)(self, arg, kw);
+    case METH_NOARGS:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_SIZE
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 0))
+                return (*meth)(self, NULL);
+            __Pyx_CyFunction_raise_argument_count_error(
+                (__pyx_CyFunctionObject*)func,
+                "takes no arguments", size);
+            return NULL;
+        }
+        break;
+    case METH_O:
+        if (likely(kw == NULL || PyDict_Size(kw) == 0)) {
+#if CYTHON_ASSUME_SAFE_SIZE
+            size = PyTuple_GET_SIZE(arg);
+#else
+            size = PyTuple_Size(arg);
+            if (unlikely(size < 0)) return NULL;
+#endif
+            if (likely(size == 1)) {
+                PyObject *result, *arg0;
+                #if CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS
+                arg0 = PyTuple_GET_ITEM(arg, 0);
+                #else
+                arg0 = __Pyx_PySequence_ITEM(arg, 0); if (unlikely(!arg0)) return NULL;
+                #endif
+                result = (*meth)(self, arg0);
+                #if !(CYTHON_ASSUME_SAFE_MACROS && !CYTHON_AVOID_BORROWED_REFS)
+                Py_DECREF(arg0);
+                #endif
+                return result;
+            }
+            __Pyx_CyFunction_raise_argument_count_error(
+                (__pyx_CyFunctionObject*)func,
+                "takes exactly one argument", size);
+            return NULL;
+        }
+        break;
+    default:
+        PyErr_SetString(PyExc_SystemError, "Bad call flags for CyFunction");
+        return NULL;
+    }
+    __Pyx_CyFunction_raise_type_error(
+        (__pyx_CyFunctionObject*)func, "takes no keyword arguments");
+    return NULL;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *self, *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)func)->func);
+    if (unlikely(!self) && PyErr_Occurred()) return NULL;
+#else
+    self = ((PyCFunctionObject*)func)->m_self;
+#endif
+    result = __Pyx_CyFunction_CallMethod(func, self, arg, kw);
+    return result;
+}
+static PyObject *__Pyx_CyFunction_CallAsMethod(PyObject *func, PyObject *args, PyObject *kw) {
+    PyObject *result;
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *) func;
+#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
+     __pyx_vectorcallfunc vc = __Pyx_CyFunction_func_vectorcall(cyfunc);
+    if (vc) {
+#if CYTHON_ASSUME_SAFE_MACROS && CYTHON_ASSUME_SAFE_SIZE
+        return __Pyx_PyVectorcall_FastCallDict(func, vc, &PyTuple_GET_ITEM(args, 0), (size_t)PyTuple_GET_SIZE(args), kw);
+#else
+        (void) &__Pyx_PyVectorcall_FastCallDict;
+        return PyVectorcall_Call(func, args, kw);
+#endif
+    }
+#endif
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        Py_ssize_t argc;
+        PyObject *new_args;
+        PyObject *self;
+#if CYTHON_ASSUME_SAFE_SIZE
+        argc = PyTuple_GET_SIZE(args);
+#else
+        argc = PyTuple_Size(args);
+        if (unlikely(argc < 0)) return NULL;
+#endif
+        new_args = PyTuple_GetSlice(args, 1, argc);
+        if (unlikely(!new_args))
+            return NULL;
+        self = PyTuple_GetItem(args, 0);
+        if (unlikely(!self)) {
+            Py_DECREF(new_args);
+            PyErr_Format(PyExc_TypeError,
+                         "unbound method %.200S() needs an argument",
+                         cyfunc->func_qualname);
+            return NULL;
+        }
+        result = __Pyx_CyFunction_CallMethod(func, self, new_args, kw);
+        Py_DECREF(new_args);
+    } else {
+        result = __Pyx_CyFunction_Call(func, args, kw);
+    }
+    return result;
+}
+#if CYTHON_METH_FASTCALL && CYTHON_VECTORCALL
+static CYTHON_INLINE int __Pyx_CyFunction_Vectorcall_CheckArgs(__pyx_CyFunctionObject *cyfunc, Py_ssize_t nargs, PyObject *kwnames)
+{
+    int ret = 0;
+    if ((cyfunc->flags & __Pyx_CYFUNCTION_CCLASS) && !(cyfunc->flags & __Pyx_CYFUNCTION_STATICMETHOD)) {
+        if (unlikely(nargs < 1)) {
+            __Pyx_CyFunction_raise_type_error(
+                cyfunc, "needs an argument");
+            return -1;
+        }
+        ret = 1;
+    }
+    if (unlikely(kwnames) && unlikely(__Pyx_PyTuple_GET_SIZE(kwnames))) {
+        __Pyx_CyFunction_raise_type_error(
+            cyfunc, "takes no keyword arguments");
+        return -1;
+    }
+    return ret;
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_NOARGS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+#if CYTHON_COMPILING_IN_LIMITED_API
+        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
+        if (unlikely(!self) && PyErr_Occurred()) return NULL;
+#else
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+#endif
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 0)) {
+        __Pyx_CyFunction_raise_argument_count_error(
+            cyfunc, "takes no arguments", nargs);
+        return NULL;
+    }
+    return meth(self, NULL);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_O(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, kwnames)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+#if CYTHON_COMPILING_IN_LIMITED_API
+        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
+        if (unlikely(!self) && PyErr_Occurred()) return NULL;
+#else
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+#endif
+        break;
+    default:
+        return NULL;
+    }
+    if (unlikely(nargs != 1)) {
+        __Pyx_CyFunction_raise_argument_count_error(
+            cyfunc, "takes exactly one argument", nargs);
+        return NULL;
+    }
+    return meth(self, args[0]);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+#if CYTHON_COMPILING_IN_LIMITED_API
+        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
+        if (unlikely(!self) && PyErr_Occurred()) return NULL;
+#else
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+#endif
+        break;
+    default:
+        return NULL;
+    }
+    return ((__Pyx_PyCFunctionFastWithKeywords)(void(*)(void))meth)(self, args, nargs, kwnames);
+}
+static PyObject * __Pyx_CyFunction_Vectorcall_FASTCALL_KEYWORDS_METHOD(PyObject *func, PyObject *const *args, size_t nargsf, PyObject *kwnames)
+{
+    __pyx_CyFunctionObject *cyfunc = (__pyx_CyFunctionObject *)func;
+    PyTypeObject *cls = (PyTypeObject *) __Pyx_CyFunction_GetClassObj(cyfunc);
+    Py_ssize_t nargs = PyVectorcall_NARGS(nargsf);
+    PyObject *self;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyCFunction meth = PyCFunction_GetFunction(cyfunc->func);
+    if (unlikely(!meth)) return NULL;
+#else
+    PyCFunction meth = ((PyCFunctionObject*)cyfunc)->m_ml->ml_meth;
+#endif
+    switch (__Pyx_CyFunction_Vectorcall_CheckArgs(cyfunc, nargs, NULL)) {
+    case 1:
+        self = args[0];
+        args += 1;
+        nargs -= 1;
+        break;
+    case 0:
+#if CYTHON_COMPILING_IN_LIMITED_API
+        self = PyCFunction_GetSelf(((__pyx_CyFunctionObject*)cyfunc)->func);
+        if (unlikely(!self) && PyErr_Occurred()) return NULL;
+#else
+        self = ((PyCFunctionObject*)cyfunc)->m_self;
+#endif
+        break;
+    default:
+        return NULL;
+    }
+    #if PY_VERSION_HEX < 0x030e00A6
+    size_t nargs_value = (size_t) nargs;
+    #else
+    Py_ssize_t nargs_value = nargs;
+    #endif
+    return ((__Pyx_PyCMethod)(void(*)(void))meth)(self, cls, args, nargs_value, kwnames);
+}
+#endif
+static PyType_Slot __pyx_CyFunctionType_slots[] = {
+    {Py_tp_dealloc, (void *)__Pyx_CyFunction_dealloc},
+    {Py_tp_repr, (void *)__Pyx_CyFunction_repr},
+    {Py_tp_call, (void *)__Pyx_CyFunction_CallAsMethod},
+    {Py_tp_traverse, (void *)__Pyx_CyFunction_traverse},
+    {Py_tp_clear, (void *)__Pyx_CyFunction_clear},
+    {Py_tp_methods, (void *)__pyx_CyFunction_methods},
+    {Py_tp_members, (void *)__pyx_CyFunction_members},
+    {Py_tp_getset, (void *)__pyx_CyFunction_getsets},
+    {Py_tp_descr_get, (void *)__Pyx_PyMethod_New},
+    {0, 0},
+};
+static PyType_Spec __pyx_CyFunctionType_spec = {
+    __PYX_TYPE_MODULE_PREFIX "cython_function_or_method",
+    sizeof(__pyx_CyFunctionObject),
+    0,
+#ifdef Py_TPFLAGS_METHOD_DESCRIPTOR
+    Py_TPFLAGS_METHOD_DESCRIPTOR |
+#endif
+#if CYTHON_METH_FASTCALL
+#if defined(Py_TPFLAGS_HAVE_VECTORCALL)
+    Py_TPFLAGS_HAVE_VECTORCALL |
+#elif defined(_Py_TPFLAGS_HAVE_VECTORCALL)
+    _Py_TPFLAGS_HAVE_VECTORCALL |
+#endif
+#endif // CYTHON_METH_FASTCALL
+#if PY_VERSION_HEX >= 0x030C0000 && !CYTHON_COMPILING_IN_LIMITED_API
+    Py_TPFLAGS_MANAGED_DICT |
+#endif
+    Py_TPFLAGS_IMMUTABLETYPE | Py_TPFLAGS_DISALLOW_INSTANTIATION |
+    Py_TPFLAGS_DEFAULT | Py_TPFLAGS_HAVE_GC | Py_TPFLAGS_BASETYPE,
+    __pyx_CyFunctionType_slots
+};
+static int __pyx_CyFunction_init(PyObject *module) {
+    __pyx_mstatetype *mstate = __Pyx_PyModule_GetState(module);
+    mstate->__pyx_CyFunctionType = __Pyx_FetchCommonTypeFromSpec(
+        mstate->__pyx_CommonTypesMetaclassType, module, &__pyx_CyFunctionType_spec, NULL);
+    if (unlikely(mstate->__pyx_CyFunctionType == NULL)) {
+        return -1;
+    }
+    return 0;
+}
+static CYTHON_INLINE PyObject *__Pyx_CyFunction_InitDefaults(PyObject *func, PyTypeObject *defaults_type) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults = PyObject_CallObject((PyObject*)defaults_type, NULL); // _PyObject_New(defaults_type);
+    if (unlikely(!m->defaults))
+        return NULL;
+    return m->defaults;
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsTuple(PyObject *func, PyObject *tuple) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_tuple = tuple;
+    Py_INCREF(tuple);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetDefaultsKwDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->defaults_kwdict = dict;
+    Py_INCREF(dict);
+}
+static CYTHON_INLINE void __Pyx_CyFunction_SetAnnotationsDict(PyObject *func, PyObject *dict) {
+    __pyx_CyFunctionObject *m = (__pyx_CyFunctionObject *) func;
+    m->func_annotations = dict;
+    Py_INCREF(dict);
+}
+
+/* CythonFunction */
+static PyObject *__Pyx_CyFunction_New(PyMethodDef *ml, int flags, PyObject* qualname,
+                                      PyObject *closure, PyObject *module, PyObject* globals, PyObject* code) {
+    PyObject *op = __Pyx_CyFunction_Init(
+        PyObject_GC_New(__pyx_CyFunctionObject, __pyx_mstate_global->__pyx_CyFunctionType),
+        ml, flags, qualname, closure, module, globals, code
+    );
+    if (likely(op)) {
+        PyObject_GC_Track(op);
+    }
+    return op;
+}
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    }
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache (used by AddTraceback) */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = code_cache->entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
+        Py_DECREF(tmp);
+        return;
+    }
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
+    }
+    for (i=code_cache->count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    code_cache->count++;
+    Py_INCREF(code_object);
+}
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
+#endif
+#endif
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    PyErr_Clear();
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    PyErr_Restore(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    if (c_line) {
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+    }
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyLong_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (int) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(int) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(int) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+        }
+    }
+    {
+        int val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (int) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (int) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (int) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (int) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((int) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((int) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (int) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE unsigned PY_LONG_LONG __Pyx_PyLong_As_unsigned_PY_LONG_LONG(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const unsigned PY_LONG_LONG neg_one = (unsigned PY_LONG_LONG) -1, const_zero = (unsigned PY_LONG_LONG) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        unsigned PY_LONG_LONG val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (unsigned PY_LONG_LONG) -1;
+        val = __Pyx_PyLong_As_unsigned_PY_LONG_LONG(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) >= 2 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) (((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) >= 3 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) (((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) >= 4 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) (((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (unsigned PY_LONG_LONG) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(unsigned PY_LONG_LONG) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(unsigned PY_LONG_LONG, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(unsigned PY_LONG_LONG) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(unsigned PY_LONG_LONG, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) (((unsigned PY_LONG_LONG)-1)*(((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) ((((((unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) (((unsigned PY_LONG_LONG)-1)*(((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) ((((((((unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) (((unsigned PY_LONG_LONG)-1)*(((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(unsigned PY_LONG_LONG) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(unsigned PY_LONG_LONG, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(unsigned PY_LONG_LONG) - 1 > 4 * PyLong_SHIFT)) {
+                            return (unsigned PY_LONG_LONG) ((((((((((unsigned PY_LONG_LONG)digits[3]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[2]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[1]) << PyLong_SHIFT) | (unsigned PY_LONG_LONG)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(unsigned PY_LONG_LONG) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(unsigned PY_LONG_LONG, long, PyLong_AsLong(x))
+        } else if ((sizeof(unsigned PY_LONG_LONG) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(unsigned PY_LONG_LONG, PY_LONG_LONG, PyLong_AsLongLong(x))
+        }
+    }
+    {
+        unsigned PY_LONG_LONG val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (unsigned PY_LONG_LONG) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (unsigned PY_LONG_LONG) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (unsigned PY_LONG_LONG) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (unsigned PY_LONG_LONG) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(unsigned PY_LONG_LONG) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((unsigned PY_LONG_LONG) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(unsigned PY_LONG_LONG) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((unsigned PY_LONG_LONG) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((unsigned PY_LONG_LONG) 1) << (sizeof(unsigned PY_LONG_LONG) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (unsigned PY_LONG_LONG) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to unsigned PY_LONG_LONG");
+    return (unsigned PY_LONG_LONG) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to unsigned PY_LONG_LONG");
+    return (unsigned PY_LONG_LONG) -1;
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyLong_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (long) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(long) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(long) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+        }
+    }
+    {
+        long val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (long) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (long) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (long) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (long) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((long) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((long) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (long) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FormatTypeName */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__3);
+    }
+    goto done;
+}
+#endif
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* GetRuntimeVersion */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+void __Pyx_init_runtime_version(void) {
+    if (__Pyx_cached_runtime_version == 0) {
+        const char* rt_version = Py_GetVersion();
+        unsigned long version = 0;
+        unsigned long factor = 0x01000000UL;
+        unsigned int digit = 0;
+        int i = 0;
+        while (factor) {
+            while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+                digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+                ++i;
+            }
+            version += factor * digit;
+            if (rt_version[i] != '.')
+                break;
+            digit = 0;
+            factor >>= 8;
+            ++i;
+        }
+        __Pyx_cached_runtime_version = version;
+    }
+}
+#endif
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    return Py_Version & ~0xFFUL;
+#else
+    return __Pyx_cached_runtime_version;
+#endif
+}
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+}
+
+/* NewCodeObj */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    static PyObject* __Pyx__PyCode_New(int a, int p, int k, int l, int s, int f,
+                                       PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                       PyObject *fv, PyObject *cell, PyObject* fn,
+                                       PyObject *name, int fline, PyObject *lnos) {
+        PyObject *exception_table = NULL;
+        PyObject *types_module=NULL, *code_type=NULL, *result=NULL;
+        #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+        PyObject *version_info;
+        PyObject *py_minor_version = NULL;
+        #endif
+        long minor_version = 0;
+        PyObject *type, *value, *traceback;
+        PyErr_Fetch(&type, &value, &traceback);
+        #if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+        minor_version = 11;
+        #else
+        if (!(version_info = PySys_GetObject("version_info"))) goto end;
+        if (!(py_minor_version = PySequence_GetItem(version_info, 1))) goto end;
+        minor_version = PyLong_AsLong(py_minor_version);
+        Py_DECREF(py_minor_version);
+        if (minor_version == -1 && PyErr_Occurred()) goto end;
+        #endif
+        if (!(types_module = PyImport_ImportModule("types"))) goto end;
+        if (!(code_type = PyObject_GetAttrString(types_module, "CodeType"))) goto end;
+        if (minor_version <= 7) {
+            (void)p;
+            result = PyObject_CallFunction(code_type, "iiiiiOOOOOOiOOO", a, k, l, s, f, code,
+                          c, n, v, fn, name, fline, lnos, fv, cell);
+        } else if (minor_version <= 10) {
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOiOOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, fline, lnos, fv, cell);
+        } else {
+            if (!(exception_table = PyBytes_FromStringAndSize(NULL, 0))) goto end;
+            result = PyObject_CallFunction(code_type, "iiiiiiOOOOOOOiOOOO", a,p, k, l, s, f, code,
+                          c, n, v, fn, name, name, fline, lnos, exception_table, fv, cell);
+        }
+    end:
+        Py_XDECREF(code_type);
+        Py_XDECREF(exception_table);
+        Py_XDECREF(types_module);
+        if (type) {
+            PyErr_Restore(type, value, traceback);
+        }
+        return result;
+    }
+#elif PY_VERSION_HEX >= 0x030B0000
+  static PyCodeObject* __Pyx__PyCode_New(int a, int p, int k, int l, int s, int f,
+                                         PyObject *code, PyObject *c, PyObject* n, PyObject *v,
+                                         PyObject *fv, PyObject *cell, PyObject* fn,
+                                         PyObject *name, int fline, PyObject *lnos) {
+    PyCodeObject *result;
+    result =
+      #if PY_VERSION_HEX >= 0x030C0000
+        PyUnstable_Code_NewWithPosOnlyArgs
+      #else
+        PyCode_NewWithPosOnlyArgs
+      #endif
+        (a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, name, fline, lnos, __pyx_mstate_global->__pyx_empty_bytes);
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030c00A1
+    if (likely(result))
+        result->_co_firsttraceable = 0;
+    #endif
+    return result;
+  }
+#elif !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx__PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_NewWithPosOnlyArgs(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#else
+  #define __Pyx__PyCode_New(a, p, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)\
+          PyCode_New(a, k, l, s, f, code, c, n, v, fv, cell, fn, name, fline, lnos)
+#endif
+static PyObject* __Pyx_PyCode_New(
+        const __Pyx_PyCode_New_function_description descr,
+        PyObject * const *varnames,
+        PyObject *filename,
+        PyObject *funcname,
+        PyObject *line_table,
+        PyObject *tuple_dedup_map
+) {
+    PyObject *code_obj = NULL, *varnames_tuple_dedup = NULL, *code_bytes = NULL;
+    Py_ssize_t var_count = (Py_ssize_t) descr.nlocals;
+    PyObject *varnames_tuple = PyTuple_New(var_count);
+    if (unlikely(!varnames_tuple)) return NULL;
+    for (Py_ssize_t i=0; i < var_count; i++) {
+        Py_INCREF(varnames[i]);
+        if (__Pyx_PyTuple_SET_ITEM(varnames_tuple, i, varnames[i]) != (0)) goto done;
+    }
+    #if CYTHON_COMPILING_IN_LIMITED_API
+    varnames_tuple_dedup = PyDict_GetItem(tuple_dedup_map, varnames_tuple);
+    if (!varnames_tuple_dedup) {
+        if (unlikely(PyDict_SetItem(tuple_dedup_map, varnames_tuple, varnames_tuple) < 0)) goto done;
+        varnames_tuple_dedup = varnames_tuple;
+    }
+    #else
+    varnames_tuple_dedup = PyDict_SetDefault(tuple_dedup_map, varnames_tuple, varnames_tuple);
+    if (unlikely(!varnames_tuple_dedup)) goto done;
+    #endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(varnames_tuple_dedup);
+    #endif
+    if (__PYX_LIMITED_VERSION_HEX >= (0x030b0000) && line_table != NULL && !CYTHON_COMPILING_IN_GRAAL) {
+        Py_ssize_t line_table_length = __Pyx_PyBytes_GET_SIZE(line_table);
+        #if !CYTHON_ASSUME_SAFE_SIZE
+        if (unlikely(line_table_length == -1)) goto done;
+        #endif
+        Py_ssize_t code_len = (line_table_length * 2 + 4) & ~3LL;
+        code_bytes = PyBytes_FromStringAndSize(NULL, code_len);
+        if (unlikely(!code_bytes)) goto done;
+        char* c_code_bytes = PyBytes_AsString(code_bytes);
+        if (unlikely(!c_code_bytes)) goto done;
+        memset(c_code_bytes, 0, (size_t) code_len);
+    }
+    code_obj = (PyObject*) __Pyx__PyCode_New(
+        (int) descr.argcount,
+        (int) descr.num_posonly_args,
+        (int) descr.num_kwonly_args,
+        (int) descr.nlocals,
+        0,
+        (int) descr.flags,
+        code_bytes ? code_bytes : __pyx_mstate_global->__pyx_empty_bytes,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        varnames_tuple_dedup,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        __pyx_mstate_global->__pyx_empty_tuple,
+        filename,
+        funcname,
+        (int) descr.first_line,
+        (__PYX_LIMITED_VERSION_HEX >= (0x030b0000) && line_table) ? line_table : __pyx_mstate_global->__pyx_empty_bytes
+    );
+done:
+    Py_XDECREF(code_bytes);
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_XDECREF(varnames_tuple_dedup);
+    #endif
+    Py_DECREF(varnames_tuple);
+    return code_obj;
+}
+
+/* DecompressString */
+static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo) {
+    PyObject *module = NULL, *decompress, *compressed_bytes, *decompressed;
+    const char* module_name = algo == 3 ? "compression.zstd" : algo == 2 ? "bz2" : "zlib";
+    PyObject *methodname = PyUnicode_FromString("decompress");
+    if (unlikely(!methodname)) return NULL;
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    if (algo == 3) {
+        PyObject *fromlist = Py_BuildValue("[O]", methodname);
+        if (unlikely(!fromlist)) goto bad;
+        module = PyImport_ImportModuleLevel("compression.zstd", NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+    } else
+    #endif
+        module = PyImport_ImportModule(module_name);
+    if (unlikely(!module)) goto import_failed;
+    decompress = PyObject_GetAttr(module, methodname);
+    if (unlikely(!decompress)) goto import_failed;
+    {
+        #ifdef __cplusplus
+            char *memview_bytes = const_cast<char*>(s);
+        #else
+            #if defined(__clang__)
+              #pragma clang diagnostic push
+              #pragma clang diagnostic ignored "-Wcast-qual"
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic push
+              #pragma GCC diagnostic ignored "-Wcast-qual"
+            #endif
+            char *memview_bytes = (char*) s;
+            #if defined(__clang__)
+              #pragma clang diagnostic pop
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic pop
+            #endif
+        #endif
+        #if CYTHON_COMPILING_IN_LIMITED_API && !defined(PyBUF_READ)
+        int memview_flags = 0x100;
+        #else
+        int memview_flags = PyBUF_READ;
+        #endif
+        compressed_bytes = PyMemoryView_FromMemory(memview_bytes, length, memview_flags);
+    }
+    if (unlikely(!compressed_bytes)) {
+        Py_DECREF(decompress);
+        goto bad;
+    }
+    decompressed = PyObject_CallFunctionObjArgs(decompress, compressed_bytes, NULL);
+    Py_DECREF(compressed_bytes);
+    Py_DECREF(decompress);
+    Py_DECREF(module);
+    Py_DECREF(methodname);
+    return decompressed;
+import_failed:
+    PyErr_Format(PyExc_ImportError,
+        "Failed to import '%.20s.decompress' - cannot initialise module strings. "
+        "String compression was configured with the C macro 'CYTHON_COMPRESS_STRINGS=%d'.",
+        module_name, algo);
+bad:
+    Py_XDECREF(module);
+    Py_DECREF(methodname);
+    return NULL;
+}
+
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {
+        const char* result;
+        Py_ssize_t unicode_length;
+        CYTHON_MAYBE_UNUSED_VAR(unicode_length); // only for __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (unlikely(PyArg_Parse(o, "s#", &result, length) < 0)) return NULL;
+        #else
+        result = PyUnicode_AsUTF8AndSize(o, length);
+        #endif
+        #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        unicode_length = PyUnicode_GetLength(o);
+        if (unlikely(unicode_length < 0)) return NULL;
+        if (unlikely(unicode_length != *length)) {
+            PyUnicode_AsASCIIString(o);
+            return NULL;
+        }
+        #endif
+        return result;
+    }
+#else
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+#endif
+}
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+    if (PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+    if (PyByteArray_Check(o)) {
+#if (CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS) || (CYTHON_COMPILING_IN_PYPY && (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE)))
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+#else
+        *length = PyByteArray_Size(o);
+        if (*length == -1) return NULL;
+        return PyByteArray_AsString(o);
+#endif
+    } else
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            Py_DECREF(result);
+            return NULL;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
+                 result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  PyObject *res = NULL;
+  if (likely(PyLong_Check(x)))
+      return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  if (likely(m && m->nb_int)) {
+      res = m->nb_int(x);
+  }
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+      res = PyNumber_Long(x);
+  }
+#endif
+  if (likely(res)) {
+      if (unlikely(!PyLong_CheckExact(res))) {
+          return __Pyx_PyNumber_LongWrongResultType(res);
+      }
+  }
+  else if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_TypeError,
+                      "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(__Pyx_PyLong_IsCompact(b))) {
+        return __Pyx_PyLong_CompactValue(b);
+    } else {
+      const digit* digits = __Pyx_PyLong_Digits(b);
+      const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(b);
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyLong_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyLong_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b) {
+    CYTHON_UNUSED_VAR(b);
+    return __Pyx_NewRef(Py_None);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return __Pyx_NewRef(b ? Py_True: Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t ival) {
+    return PyLong_FromSize_t(ival);
+}
+
+
+/* MultiPhaseInitModuleState */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#ifndef CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#if (CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX >= 0x030C0000)
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 1
+#else
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 0
+#endif
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE && !CYTHON_ATOMICS
+#error "Module state with PEP489 requires atomics. Currently that's one of\
+ C11, C++11, gcc atomic intrinsics or MSVC atomic intrinsics"
+#endif
+#if !CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#define __Pyx_ModuleStateLookup_Lock()
+#define __Pyx_ModuleStateLookup_Unlock()
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+static PyMutex __Pyx_ModuleStateLookup_mutex = {0};
+#define __Pyx_ModuleStateLookup_Lock() PyMutex_Lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() PyMutex_Unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(__cplusplus) && __cplusplus >= 201103L
+#include <mutex>
+static std::mutex __Pyx_ModuleStateLookup_mutex;
+#define __Pyx_ModuleStateLookup_Lock() __Pyx_ModuleStateLookup_mutex.lock()
+#define __Pyx_ModuleStateLookup_Unlock() __Pyx_ModuleStateLookup_mutex.unlock()
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ > 201112L) && !defined(__STDC_NO_THREADS__)
+#include <threads.h>
+static mtx_t __Pyx_ModuleStateLookup_mutex;
+static once_flag __Pyx_ModuleStateLookup_mutex_once_flag = ONCE_FLAG_INIT;
+static void __Pyx_ModuleStateLookup_initialize_mutex(void) {
+    mtx_init(&__Pyx_ModuleStateLookup_mutex, mtx_plain);
+}
+#define __Pyx_ModuleStateLookup_Lock()\
+  call_once(&__Pyx_ModuleStateLookup_mutex_once_flag, __Pyx_ModuleStateLookup_initialize_mutex);\
+  mtx_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() mtx_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+static pthread_mutex_t __Pyx_ModuleStateLookup_mutex = PTHREAD_MUTEX_INITIALIZER;
+#define __Pyx_ModuleStateLookup_Lock() pthread_mutex_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() pthread_mutex_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(_WIN32)
+#include <Windows.h>  // synchapi.h on its own doesn't work
+static SRWLOCK __Pyx_ModuleStateLookup_mutex = SRWLOCK_INIT;
+#define __Pyx_ModuleStateLookup_Lock() AcquireSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() ReleaseSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#else
+#error "No suitable lock available for CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE.\
+ Requires C standard >= C11, or C++ standard >= C++11,\
+ or pthreads, or the Windows 32 API, or Python >= 3.13."
+#endif
+typedef struct {
+    int64_t id;
+    PyObject *module;
+} __Pyx_InterpreterIdAndModule;
+typedef struct {
+    char interpreter_id_as_index;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+    __Pyx_InterpreterIdAndModule table[1];
+} __Pyx_ModuleStateLookupData;
+#define __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE 32
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_int_type __Pyx_ModuleStateLookup_read_counter = 0;
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_ptr_type __Pyx_ModuleStateLookup_data = 0;
+#else
+static __Pyx_ModuleStateLookupData* __Pyx_ModuleStateLookup_data = NULL;
+#endif
+static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLowerBound(
+        __Pyx_InterpreterIdAndModule* table,
+        Py_ssize_t count,
+        int64_t interpreterId) {
+    __Pyx_InterpreterIdAndModule* begin = table;
+    __Pyx_InterpreterIdAndModule* end = begin + count;
+    if (begin->id == interpreterId) {
+        return begin;
+    }
+    while ((end - begin) > __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+        __Pyx_InterpreterIdAndModule* halfway = begin + (end - begin)/2;
+        if (halfway->id == interpreterId) {
+            return halfway;
+        }
+        if (halfway->id < interpreterId) {
+            begin = halfway;
+        } else {
+            end = halfway;
+        }
+    }
+    for (; begin < end; ++begin) {
+        if (begin->id >= interpreterId) return begin;
+    }
+    return begin;
+}
+static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    if (interpreter_id == -1) return NULL;
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+    {
+        __pyx_atomic_incr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        if (likely(data)) {
+            __Pyx_ModuleStateLookupData* new_data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_acquire(&__Pyx_ModuleStateLookup_data);
+            if (likely(data == new_data)) {
+                goto read_finished;
+            }
+        }
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        __Pyx_ModuleStateLookup_Lock();
+        __pyx_atomic_incr_relaxed(&__Pyx_ModuleStateLookup_read_counter);
+        data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+        __Pyx_ModuleStateLookup_Unlock();
+    }
+  read_finished:;
+#else
+    __Pyx_ModuleStateLookupData* data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_InterpreterIdAndModule* found = NULL;
+    if (unlikely(!data)) goto end;
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            found = data->table+interpreter_id;
+        }
+    } else {
+        found = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+    }
+  end:
+    {
+        PyObject *result=NULL;
+        if (found && found->id == interpreter_id) {
+            result = found->module;
+        }
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+#endif
+        return result;
+    }
+}
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static void __Pyx_ModuleStateLookup_wait_until_no_readers(void) {
+    while (__pyx_atomic_load(&__Pyx_ModuleStateLookup_read_counter) != 0);
+}
+#else
+#define __Pyx_ModuleStateLookup_wait_until_no_readers()
+#endif
+static int __Pyx_State_AddModuleInterpIdAsIndex(__Pyx_ModuleStateLookupData **old_data, PyObject* module, int64_t interpreter_id) {
+    Py_ssize_t to_allocate = (*old_data)->allocated;
+    while (to_allocate <= interpreter_id) {
+        if (to_allocate == 0) to_allocate = 1;
+        else to_allocate *= 2;
+    }
+    __Pyx_ModuleStateLookupData *new_data = *old_data;
+    if (to_allocate != (*old_data)->allocated) {
+         new_data = (__Pyx_ModuleStateLookupData *)realloc(
+            *old_data,
+            sizeof(__Pyx_ModuleStateLookupData)+(to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+        if (!new_data) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = new_data->allocated; i < to_allocate; ++i) {
+            new_data->table[i].id = i;
+            new_data->table[i].module = NULL;
+        }
+        new_data->allocated = to_allocate;
+    }
+    new_data->table[interpreter_id].module = module;
+    if (new_data->count < interpreter_id+1) {
+        new_data->count = interpreter_id+1;
+    }
+    *old_data = new_data;
+    return 0;
+}
+static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *data) {
+    __Pyx_InterpreterIdAndModule *read = data->table;
+    __Pyx_InterpreterIdAndModule *write = data->table;
+    __Pyx_InterpreterIdAndModule *end = read + data->count;
+    for (; read<end; ++read) {
+        if (read->module) {
+            write->id = read->id;
+            write->module = read->module;
+            ++write;
+        }
+    }
+    data->count = write - data->table;
+    for (; write<end; ++write) {
+        write->id = 0;
+        write->module = NULL;
+    }
+    data->interpreter_id_as_index = 0;
+}
+static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    int result = 0;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *old_data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *old_data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_ModuleStateLookupData *new_data = old_data;
+    if (!new_data) {
+        new_data = (__Pyx_ModuleStateLookupData *)calloc(1, sizeof(__Pyx_ModuleStateLookupData));
+        if (!new_data) {
+            result = -1;
+            PyErr_NoMemory();
+            goto end;
+        }
+        new_data->allocated = 1;
+        new_data->interpreter_id_as_index = 1;
+    }
+    __Pyx_ModuleStateLookup_wait_until_no_readers();
+    if (new_data->interpreter_id_as_index) {
+        if (interpreter_id < __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+            result = __Pyx_State_AddModuleInterpIdAsIndex(&new_data, module, interpreter_id);
+            goto end;
+        }
+        __Pyx_State_ConvertFromInterpIdAsIndex(new_data);
+    }
+    {
+        Py_ssize_t insert_at = 0;
+        {
+            __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+                new_data->table, new_data->count, interpreter_id);
+            assert(lower_bound);
+            insert_at = lower_bound - new_data->table;
+            if (unlikely(insert_at < new_data->count && lower_bound->id == interpreter_id)) {
+                lower_bound->module = module;
+                goto end;  // already in table, nothing more to do
+            }
+        }
+        if (new_data->count+1 >= new_data->allocated) {
+            Py_ssize_t to_allocate = (new_data->count+1)*2;
+            new_data =
+                (__Pyx_ModuleStateLookupData*)realloc(
+                    new_data,
+                    sizeof(__Pyx_ModuleStateLookupData) +
+                    (to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+            if (!new_data) {
+                result = -1;
+                new_data = old_data;
+                PyErr_NoMemory();
+                goto end;
+            }
+            new_data->allocated = to_allocate;
+        }
+        ++new_data->count;
+        int64_t last_id = interpreter_id;
+        PyObject *last_module = module;
+        for (Py_ssize_t i=insert_at; i<new_data->count; ++i) {
+            int64_t current_id = new_data->table[i].id;
+            new_data->table[i].id = last_id;
+            last_id = current_id;
+            PyObject *current_module = new_data->table[i].module;
+            new_data->table[i].module = last_module;
+            last_module = current_module;
+        }
+    }
+  end:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, new_data);
+#else
+    __Pyx_ModuleStateLookup_data = new_data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return result;
+}
+static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *data = __Pyx_ModuleStateLookup_data;
+#endif
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            data->table[interpreter_id].module = NULL;
+        }
+        goto done;
+    }
+    {
+        __Pyx_ModuleStateLookup_wait_until_no_readers();
+        __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+        if (!lower_bound) goto done;
+        if (lower_bound->id != interpreter_id) goto done;
+        __Pyx_InterpreterIdAndModule *end = data->table+data->count;
+        for (;lower_bound<end-1; ++lower_bound) {
+            lower_bound->id = (lower_bound+1)->id;
+            lower_bound->module = (lower_bound+1)->module;
+        }
+    }
+    --data->count;
+    if (data->count == 0) {
+        free(data);
+        data = NULL;
+    }
+  done:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, data);
+#else
+    __Pyx_ModuleStateLookup_data = data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return 0;
+}
+#endif
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */
@@ -0,0 +1,56 @@
+# cython: language_level=3
+from cpython.pythread cimport PyThread_type_lock
+from nonaga_logic cimport NonagaLogic
+from nonaga_position cimport Position
+
+
+# The nodes of a search tree, field by field in growable C arrays; the children of a node are consecutive
+cdef struct NodePool:
+    int* parent
+    int* first_child
+    int* num_children           # -1 until the node is expanded
+    int* move                   # encoded move leading to the node
+    int* visits
+    int* virtual_loss           # searches going through the node right now
+    double* value               # sum of the results for the player who played move
+    signed char* mover          # player who played move
+    signed char* winner         # player who won once move is played, -1 if the game goes on
+    int size
+    int capacity
+
+
+cdef class MCTS:
+    cdef public object parameter
+    cdef public int max_color
+    cdef public double time_limit
+    cdef public int iterations
+    cdef public int threads
+    cdef public str rollout
+    cdef public int rollout_turns
+    cdef public double exploration
+    cdef public double evaluation_scale
+    cdef public bint reuse_tree
+    cdef public int max_nodes
+    cdef readonly int last_iterations
+    cdef readonly int reused_visits
+
+    cdef NodePool pool
+    cdef Position root_position
+    cdef bint has_root
+    cdef int params[8]
+    cdef int rollout_mode
+    cdef PyThread_type_lock lock
+    cdef int done_iterations
+    cdef int target_iterations
+    cdef bint failed
+
+    cdef int _iterate(self, unsigned long long* rng) noexcept nogil
+    cdef bint _expand(self, int node, Position* position) noexcept nogil
+    cdef int _select(self, int node) noexcept nogil
+    cdef double _simulate(self, Position* position, int winner, unsigned long long* rng) noexcept nogil
+    cdef double _evaluate(self, const Position* position) noexcept nogil
+    cdef int _find_node(self, int node, Position* position, const Position* target, int plies) noexcept nogil
+    cdef void _reroot(self, int node) except *
+    cdef int _best_move(self, int node, Position* position) noexcept nogil
+    cdef int _child_with_move(self, int node, int move) noexcept nogil
+    cpdef tuple get_best_move(self, NonagaLogic game_state)
@@ -0,0 +1,519 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Not profiled: its functions run without the GIL, millions of times per search, and trace hooks would dwarf them
+import random
+import threading
+import time
+
+from libc.stdlib cimport malloc, realloc, free
+from libc.string cimport memset
+from libc.math cimport sqrt, log, exp
+from cpython.pythread cimport (PyThread_allocate_lock, PyThread_free_lock, PyThread_acquire_lock,
+                               PyThread_release_lock, WAIT_LOCK)
+
+from nonaga_constants import RED, BLACK, PIECE_TO_MOVE
+from nonaga_board cimport MAX_PIECE_MOVES
+from nonaga_logic cimport NonagaLogic
+from nonaga_position cimport (Position, MAX_TILE_MOVES, load_position, same_position,
+                              fill_position_piece_moves, fill_position_tile_moves, play_piece_move,
+                              play_tile_move, undo_piece_move, undo_tile_move, move_positions,
+                              position_won, find_winning_slide, position_cost)
+
+cdef int _RED = RED
+cdef int _PIECE_TO_MOVE = PIECE_TO_MOVE
+
+# Rollout policies
+cdef enum:
+    ROLLOUT_NONE = 0        # the leaf is evaluated by cost_function right away
+    ROLLOUT_RANDOM = 1      # random moves, winning slides are always played
+    ROLLOUT_GUIDED = 2      # piece moves chosen by cost_function, random tile moves
+
+ROLLOUTS = {"none": ROLLOUT_NONE, "random": ROLLOUT_RANDOM, "guided": ROLLOUT_GUIDED}
+
+cdef enum:
+    BATCH = 16              # iterations a thread runs between two looks at the clock
+    EXPAND_VISITS = 2       # visits of a leaf before its moves are added to the tree
+    REUSE_PLIES = 4         # moves played between two searches: ours and the opponent's, piece then tile
+    LOST_COST = -2147483647 # cost_function of a move letting the opponent win
+
+
+cdef inline unsigned long long _next_random(unsigned long long* state) noexcept nogil:
+    # xorshift64*, one state per thread
+    state[0] ^= state[0] >> 12
+    state[0] ^= state[0] << 25
+    state[0] ^= state[0] >> 27
+    return state[0] * 2685821657736338717ULL
+
+
+cdef inline int _random_below(unsigned long long* state, int n) noexcept nogil:
+    return <int>((_next_random(state) >> 33) % <unsigned long long>n)
+
+
+cdef int pool_allocate(NodePool* pool, int count) noexcept nogil:
+    """Index of *count* new consecutive nodes, -1 if memory ran out."""
+    cdef int capacity = pool.capacity if pool.capacity else 1024
+    cdef void* p
+    while capacity < pool.size + count:
+        capacity *= 2
+    if capacity != pool.capacity:
+        p = realloc(pool.parent, capacity * sizeof(int))
+        if p == NULL: return -1
+        pool.parent = <int*>p
+        p = realloc(pool.first_child, capacity * sizeof(int))
+        if p == NULL: return -1
+        pool.first_child = <int*>p
+        p = realloc(pool.num_children, capacity * sizeof(int))
+        if p == NULL: return -1
+        pool.num_children = <int*>p
+        p = realloc(pool.move, capacity * sizeof(int))
+        if p == NULL: return -1
+        pool.move = <int*>p
+        p = realloc(pool.visits, capacity * sizeof(int))
+        if p == NULL: return -1
+        pool.visits = <int*>p
+        p = realloc(pool.virtual_loss, capacity * sizeof(int))
+        if p == NULL: return -1
+        pool.virtual_loss = <int*>p
+        p = realloc(pool.value, capacity * sizeof(double))
+        if p == NULL: return -1
+        pool.value = <double*>p
+        p = realloc(pool.mover, capacity * sizeof(signed char))
+        if p == NULL: return -1
+        pool.mover = <signed char*>p
+        p = realloc(pool.winner, capacity * sizeof(signed char))
+        if p == NULL: return -1
+        pool.winner = <signed char*>p
+        pool.capacity = capacity
+    cdef int first = pool.size
+    cdef int i
+    for i in range(first, first + count):
+        pool.parent[i] = -1
+        pool.first_child[i] = -1
+        pool.num_children[i] = -1
+        pool.move[i] = -1
+        pool.visits[i] = 0
+        pool.virtual_loss[i] = 0
+        pool.value[i] = 0
+        pool.mover[i] = -1
+        pool.winner[i] = -1
+    pool.size += count
+    return first
+
+
+cdef void pool_free(NodePool* pool) noexcept nogil:
+    free(pool.parent)
+    free(pool.first_child)
+    free(pool.num_children)
+    free(pool.move)
+    free(pool.visits)
+    free(pool.virtual_loss)
+    free(pool.value)
+    free(pool.mover)
+    free(pool.winner)
+    memset(pool, 0, sizeof(NodePool))
+
+
+cdef class MCTS:
+    """Monte Carlo tree search player with the get_best_move interface of AI.
+
+    The tree alternates piece and tile moves, so the wide tile move phase is
+    sampled move by move (UCT) instead of being searched exhaustively. Leaves
+    are valued by a rollout, whose piece moves can be guided by cost_function,
+    or directly by cost_function, mapped to a win probability.
+
+    The search runs on threads that only hold the GIL to look at the clock:
+    positions are played on C copies (nonaga_position) and the tree is shared
+    under a lock, with virtual losses spreading the threads over different
+    branches. The tree is kept between moves: when the game reaches a position
+    of the previous tree, its subtree becomes the new tree.
+    """
+
+    def __cinit__(self):
+        memset(&self.pool, 0, sizeof(NodePool))
+        self.lock = PyThread_allocate_lock()
+        if self.lock == NULL:
+            raise MemoryError()
+
+    def __dealloc__(self):
+        pool_free(&self.pool)
+        if self.lock != NULL:
+            PyThread_free_lock(self.lock)
+
+    def __init__(self, parameter, int color=BLACK, double time_limit=1.0, int iterations=0, int threads=1,
+                 str rollout="guided", int rollout_turns=20, double exploration=1.0,
+                 double evaluation_scale=100.0, bint reuse_tree=True, int max_nodes=2000000):
+        """Initialize the player.
+
+        Args:
+            parameter: the 8 cost_function weights of AI
+            color: player the AI plays
+            time_limit: seconds per move, 0 to only count iterations
+            iterations: iterations per move, 0 to only watch the clock
+            threads: threads searching the tree
+            rollout: "guided", "random" or "none" (see ROLLOUTS)
+            rollout_turns: turns played by a rollout before cost_function judges its position
+            exploration: UCT exploration constant
+            evaluation_scale: cost_function difference worth a 73% win probability
+            reuse_tree: keep the tree between moves
+            max_nodes: nodes after which the tree stops growing
+        """
+        if rollout not in ROLLOUTS:
+            raise ValueError(f"Unknown rollout {rollout!r}, expected one of {sorted(ROLLOUTS)}.")
+        if time_limit <= 0 and iterations <= 0:
+            raise ValueError("A time limit or a number of iterations is needed.")
+        self.parameter = parameter
+        self.max_color = color
+        self.time_limit = time_limit
+        self.iterations = iterations
+        self.threads = max(1, threads)
+        self.rollout = rollout
+        self.rollout_turns = rollout_turns
+        self.exploration = exploration
+        self.evaluation_scale = evaluation_scale
+        self.reuse_tree = reuse_tree
+        self.max_nodes = max_nodes
+        self.has_root = False
+        self.last_iterations = 0
+        self.reused_visits = 0
+
+    @property
+    def tree_size(self):
+        return self.pool.size
+
+    # ── one iteration ───────────────────────────────────
+    cdef int _iterate(self, unsigned long long* rng) noexcept nogil:
+        """Select a leaf, value it and back the result up; returns 0 once the search should stop."""
+        cdef Position position
+        cdef int node = 0, child, winner
+        cdef double red_result, result
+
+        PyThread_acquire_lock(self.lock, WAIT_LOCK)
+        if self.failed or (self.target_iterations and self.done_iterations >= self.target_iterations):
+            PyThread_release_lock(self.lock)
+            return 0
+        position = self.root_position
+        while True:
+            self.pool.virtual_loss[node] += 1
+            if self.pool.winner[node] >= 0:
+                break
+            if self.pool.num_children[node] < 0:
+                if node != 0 and self.pool.visits[node] < EXPAND_VISITS:
+                    break
+                if not self._expand(node, &position):
+                    break
+            if self.pool.num_children[node] == 0:
+                break
+            child = self._select(node)
+            if position.turn_phase == _PIECE_TO_MOVE:
+                play_piece_move(&position, self.pool.move[child])
+            else:
+                play_tile_move(&position, self.pool.move[child])
+            node = child
+        # another thread may reallocate the pool once the lock is released
+        winner = self.pool.winner[node]
+        PyThread_release_lock(self.lock)
+
+        red_result = self._simulate(&position, winner, rng)
+
+        PyThread_acquire_lock(self.lock, WAIT_LOCK)
+        while node >= 0:
+            self.pool.virtual_loss[node] -= 1
+            self.pool.visits[node] += 1
+            self.pool.value[node] += red_result if self.pool.mover[node] == _RED else 1.0 - red_result
+            node = self.pool.parent[node]
+        self.done_iterations += 1
+        PyThread_release_lock(self.lock)
+        return 1
+
+    cdef bint _expand(self, int node, Position* position) noexcept nogil:
+        """Add the children of a node; False when the tree is full."""
+        cdef int moves[MAX_TILE_MOVES]
+        cdef int count, first, i, player = position.current_player
+        cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+
+        if piece_phase:
+            count = fill_position_piece_moves(position, moves)
+        else:
+            count = fill_position_tile_moves(position, moves)
+        if self.pool.size + count > self.max_nodes:
+            return False
+        first = pool_allocate(&self.pool, count)
+        if first < 0:
+            self.failed = True
+            return False
+        for i in range(count):
+            self.pool.parent[first + i] = node
+            self.pool.move[first + i] = moves[i]
+            self.pool.mover[first + i] = player
+            if piece_phase:
+                play_piece_move(position, moves[i])
+                if position_won(position, player):
+                    self.pool.winner[first + i] = player
+                undo_piece_move(position, moves[i])
+            else:
+                # a tile move letting the opponent slide into a win is lost already
+                play_tile_move(position, moves[i])
+                if find_winning_slide(position, position.current_player) >= 0:
+                    self.pool.winner[first + i] = position.current_player
+                undo_tile_move(position, moves[i])
+        self.pool.first_child[node] = first
+        self.pool.num_children[node] = count
+        return True
+
+    cdef int _select(self, int node) noexcept nogil:
+        """UCT choice among the children of an expanded node.
+
+        A winning move is taken when there is one, lost moves only when
+        every move is lost.
+        """
+        cdef int first = self.pool.first_child[node], best = first, child, n
+        cdef double log_n = log(self.pool.visits[node] + self.pool.virtual_loss[node] + 1.0)
+        cdef double score, best_score = -1.0
+        for child in range(first, first + self.pool.num_children[node]):
+            if self.pool.winner[child] == self.pool.mover[child]:
+                return child
+            if self.pool.winner[child] >= 0:
+                continue
+            n = self.pool.visits[child] + self.pool.virtual_loss[child]
+            if n == 0:
+                return child
+            # virtual losses count as lost games until their result comes back
+            score = self.pool.value[child] / n + self.exploration * sqrt(log_n / n)
+            if score > best_score:
+                best_score = score
+                best = child
+        return best
+
+    cdef double _simulate(self, Position* position, int winner, unsigned long long* rng) noexcept nogil:
+        """Probability that RED wins from the position, from a rollout or cost_function."""
+        cdef int moves[MAX_TILE_MOVES]
+        cdef int count, move, ply, k, player, cost, best_cost
+        if winner >= 0:
+            return 1.0 if winner == _RED else 0.0
+        if self.rollout_mode != ROLLOUT_NONE:
+            for ply in range(2 * self.rollout_turns):
+                player = position.current_player
+                if position.turn_phase == _PIECE_TO_MOVE:
+                    move = find_winning_slide(position, player)
+                    if move >= 0:
+                        return 1.0 if player == _RED else 0.0
+                    count = fill_position_piece_moves(position, moves)
+                    if count == 0:
+                        break
+                    move = moves[_random_below(rng, count)]
+                    if self.rollout_mode == ROLLOUT_GUIDED:
+                        best_cost = 0
+                        for k in range(count):
+                            play_piece_move(position, moves[k])
+                            cost = position_cost(position, player, self.params)
+                            undo_piece_move(position, moves[k])
+                            if k == 0 or cost > best_cost:
+                                best_cost = cost
+                                move = moves[k]
+                    play_piece_move(position, move)
+                else:
+                    count = fill_position_tile_moves(position, moves)
+                    if count == 0:
+                        break
+                    play_tile_move(position, moves[_random_below(rng, count)])
+        return self._evaluate(position)
+
+    cdef double _evaluate(self, const Position* position) noexcept nogil:
+        return 1.0 / (1.0 + exp(-position_cost(position, _RED, self.params) / self.evaluation_scale))
+
+    # ── tree reuse ──────────────────────────────────────
+    cdef int _find_node(self, int node, Position* position, const Position* target, int plies) noexcept nogil:
+        """Node of the subtree whose position is *target*, at most *plies* moves below, -1 if none."""
+        cdef int child, found
+        cdef bint piece_phase
+        if same_position(position, target):
+            return node
+        if plies == 0 or self.pool.num_children[node] <= 0:
+            return -1
+        piece_phase = position.turn_phase == _PIECE_TO_MOVE
+        for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+            if piece_phase:
+                play_piece_move(position, self.pool.move[child])
+            else:
+                play_tile_move(position, self.pool.move[child])
+            found = self._find_node(child, position, target, plies - 1)
+            if piece_phase:
+                undo_piece_move(position, self.pool.move[child])
+            else:
+                undo_tile_move(position, self.pool.move[child])
+            if found >= 0:
+                return found
+        return -1
+
+    cdef void _reroot(self, int node) except *:
+        """Replace the tree by the subtree of *node*, copied breadth first into a new pool."""
+        cdef NodePool* old = &self.pool
+        cdef NodePool new
+        cdef int* queue = <int*>malloc(2 * old.size * sizeof(int))
+        cdef int head = 0, tail = 2, source, target, first, i, n
+        memset(&new, 0, sizeof(NodePool))
+        if queue == NULL or pool_allocate(&new, 1) < 0:
+            free(queue)
+            pool_free(&new)
+            raise MemoryError()
+        queue[0] = node
+        queue[1] = 0
+        while head < tail:
+            source = queue[head]
+            target = queue[head + 1]
+            head += 2
+            new.move[target] = old.move[source]
+            new.visits[target] = old.visits[source]
+            new.value[target] = old.value[source]
+            new.mover[target] = old.mover[source]
+            new.winner[target] = old.winner[source]
+            n = old.num_children[source]
+            new.num_children[target] = n
+            if n <= 0:
+                continue
+            first = pool_allocate(&new, n)
+            if first < 0:
+                free(queue)
+                pool_free(&new)
+                raise MemoryError()
+            new.first_child[target] = first
+            for i in range(n):
+                new.parent[first + i] = target
+                queue[tail] = old.first_child[source] + i
+                queue[tail + 1] = first + i
+                tail += 2
+        free(queue)
+        pool_free(old)
+        self.pool = new
+
+    # ── move choice ─────────────────────────────────────
+    cdef int _best_move(self, int node, Position* position) noexcept nogil:
+        """Winning or most visited move of a node, -1 if there is none.
+
+        When the search did not visit any child of the node, or did not reach
+        the node at all (node is -1), the move is the best for cost_function
+        among those that do not let the opponent win.
+        """
+        cdef int moves[MAX_TILE_MOVES]
+        cdef int best = -1, child, count, k, cost, best_cost = 0, player = position.current_player
+        cdef bint piece_phase = position.turn_phase == _PIECE_TO_MOVE
+        if node >= 0 and self.pool.num_children[node] > 0:
+            for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+                if self.pool.winner[child] == self.pool.mover[child]:
+                    return self.pool.move[child]
+                if self.pool.winner[child] < 0 and self.pool.visits[child] > 0 and (best < 0 or self.pool.visits[child] > self.pool.visits[best]):
+                    best = child
+            if best >= 0:
+                return self.pool.move[best]
+
+        if piece_phase:
+            count = fill_position_piece_moves(position, moves)
+        else:
+            count = fill_position_tile_moves(position, moves)
+        for k in range(count):
+            if piece_phase:
+                play_piece_move(position, moves[k])
+                cost = position_cost(position, player, self.params)
+                if position_won(position, player):
+                    undo_piece_move(position, moves[k])
+                    return moves[k]
+                undo_piece_move(position, moves[k])
+            else:
+                play_tile_move(position, moves[k])
+                cost = position_cost(position, player, self.params)
+                if find_winning_slide(position, position.current_player) >= 0:
+                    cost = LOST_COST
+                undo_tile_move(position, moves[k])
+            if best < 0 or cost > best_cost:
+                best = moves[k]
+                best_cost = cost
+        return best
+
+    cdef int _child_with_move(self, int node, int move) noexcept nogil:
+        cdef int child
+        if node < 0 or self.pool.num_children[node] <= 0:
+            return -1
+        for child in range(self.pool.first_child[node], self.pool.first_child[node] + self.pool.num_children[node]):
+            if self.pool.move[child] == move:
+                return child
+        return -1
+
+    # ── search ──────────────────────────────────────────
+    def _run(self, double deadline, unsigned long long seed):
+        cdef unsigned long long rng = seed | 1
+        cdef int k
+        cdef bint running = True
+        while running:
+            with nogil:
+                for k in range(BATCH):
+                    if not self._iterate(&rng):
+                        running = False
+                        break
+            if deadline and time.perf_counter() >= deadline:
+                running = False
+
+    cpdef tuple get_best_move(self, NonagaLogic game_state):
+        """Returns the best move for the player to move, searched for time_limit seconds or iterations.
+
+        Args:
+            game_state: current game state, with a piece to move
+        Returns:
+            A tuple containing the best piece move and the best tile move combination.
+        """
+        cdef Position position
+        cdef int node = -1, i, move
+        cdef double deadline
+        cdef tuple piece_move, tile_move
+
+        load_position(&position, game_state)
+        if position.turn_phase != _PIECE_TO_MOVE:
+            raise ValueError("The search starts with a piece to move.")
+        for i in range(8):
+            self.params[i] = self.parameter[i]
+        self.rollout_mode = ROLLOUTS[self.rollout]
+
+        if self.has_root and self.reuse_tree and self.pool.size:
+            node = self._find_node(0, &self.root_position, &position, REUSE_PLIES)
+        if node > 0:
+            self._reroot(node)
+        elif node < 0:
+            self.pool.size = 0
+        self.root_position = position
+        self.has_root = True
+        if self.pool.size == 0:
+            if pool_allocate(&self.pool, 1) < 0:
+                raise MemoryError()
+            self.pool.mover[0] = (position.current_player + 1) % 2
+        # the result of the root's position is for its moves to tell
+        self.pool.winner[0] = -1
+        self.reused_visits = self.pool.visits[0]
+
+        self.failed = False
+        self.done_iterations = 0
+        self.target_iterations = self.iterations
+        # nothing to search for when a slide wins right away
+        if find_winning_slide(&position, position.current_player) < 0:
+            deadline = time.perf_counter() + self.time_limit if self.time_limit > 0 else 0
+            workers = [threading.Thread(target=self._run, args=(deadline, random.getrandbits(64)), daemon=True)
+                       for _ in range(self.threads - 1)]
+            for worker in workers:
+                worker.start()
+            self._run(deadline, random.getrandbits(64))
+            for worker in workers:
+                worker.join()
+        if self.failed:
+            raise MemoryError("The search tree could not grow.")
+        self.last_iterations = self.done_iterations
+
+        # the most visited piece move, then its most visited tile move
+        move = self._best_move(0, &position)
+        if move < 0:
+            raise ValueError("The player to move has no piece move.")
+        node = self._child_with_move(0, move)
+        piece_move = move_positions(&position, move, True)
+        play_piece_move(&position, move)
+        move = self._best_move(node, &position)
+        if move < 0:
+            raise ValueError("No tile can be moved.")
+        tile_move = move_positions(&position, move, False)
+        return ((game_state.board.get_piece(piece_move[0]), piece_move[1]),
+                (game_state.board.get_tile(tile_move[0]), tile_move[1]))
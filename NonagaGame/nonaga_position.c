@@ -0,0 +1,9731 @@
+/* Generated by Cython 3.2.4 */
+
+/* BEGIN: Cython Metadata
+{
+    "distutils": {
+        "depends": [],
+        "name": "nonaga_position",
+        "sources": [
+            "NonagaGame/nonaga_position.pyx"
+        ]
+    },
+    "module_name": "nonaga_position"
+}
+END: Cython Metadata */
+
+#ifndef PY_SSIZE_T_CLEAN
+#define PY_SSIZE_T_CLEAN
+#endif /* PY_SSIZE_T_CLEAN */
+/* InitLimitedAPI */
+#if defined(Py_LIMITED_API)
+  #if !defined(CYTHON_LIMITED_API)
+  #define CYTHON_LIMITED_API 1
+  #endif
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef _MSC_VER
+  #pragma message ("Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.")
+  #else
+  #warning Limited API usage is enabled with 'CYTHON_LIMITED_API' but 'Py_LIMITED_API' does not define a Python target version. Consider setting 'Py_LIMITED_API' instead.
+  #endif
+#endif
+
+#include "Python.h"
+#ifndef Py_PYTHON_H
+    #error Python headers needed to compile C extensions, please install development version of Python.
+#elif PY_VERSION_HEX < 0x03080000
+    #error Cython requires Python 3.8+.
+#else
+#define __PYX_ABI_VERSION "3_2_4"
+#define CYTHON_HEX_VERSION 0x030204F0
+#define CYTHON_FUTURE_DIVISION 1
+/* CModulePreamble */
+#include <stddef.h>
+#ifndef offsetof
+  #define offsetof(type, member) ( (size_t) & ((type*)0) -> member )
+#endif
+#if !defined(_WIN32) && !defined(WIN32) && !defined(MS_WINDOWS)
+  #ifndef __stdcall
+    #define __stdcall
+  #endif
+  #ifndef __cdecl
+    #define __cdecl
+  #endif
+  #ifndef __fastcall
+    #define __fastcall
+  #endif
+#endif
+#ifndef DL_IMPORT
+  #define DL_IMPORT(t) t
+#endif
+#ifndef DL_EXPORT
+  #define DL_EXPORT(t) t
+#endif
+#define __PYX_COMMA ,
+#ifndef PY_LONG_LONG
+  #define PY_LONG_LONG LONG_LONG
+#endif
+#ifndef Py_HUGE_VAL
+  #define Py_HUGE_VAL HUGE_VAL
+#endif
+#define __PYX_LIMITED_VERSION_HEX PY_VERSION_HEX
+#if defined(GRAALVM_PYTHON)
+  /* For very preliminary testing purposes. Most variables are set the same as PyPy.
+     The existence of this section does not imply that anything works or is even tested */
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 1
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 0
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #undef CYTHON_PEP489_MULTI_PHASE_INIT
+  #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #undef CYTHON_USE_TP_FINALIZE
+  #define CYTHON_USE_TP_FINALIZE 0
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 1
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+#elif defined(PYPY_VERSION)
+  #define CYTHON_COMPILING_IN_PYPY 1
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 1
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_WRITER
+  #define CYTHON_USE_UNICODE_WRITER 0
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #undef CYTHON_AVOID_BORROWED_REFS
+  #define CYTHON_AVOID_BORROWED_REFS 1
+  #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL 0
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #if PY_VERSION_HEX < 0x03090000
+    #undef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 0
+  #elif !defined(CYTHON_PEP489_MULTI_PHASE_INIT)
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #undef CYTHON_USE_MODULE_STATE
+  #define CYTHON_USE_MODULE_STATE 0
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE (PYPY_VERSION_NUM >= 0x07030C00)
+  #endif
+  #undef CYTHON_USE_AM_SEND
+  #define CYTHON_USE_AM_SEND 0
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC (PYPY_VERSION_NUM >= 0x07031100)
+  #endif
+  #undef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 0
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+#elif defined(CYTHON_LIMITED_API)
+  #ifdef Py_LIMITED_API
+    #undef __PYX_LIMITED_VERSION_HEX
+    #define __PYX_LIMITED_VERSION_HEX Py_LIMITED_API
+  #endif
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 0
+  #define CYTHON_COMPILING_IN_LIMITED_API 1
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #undef CYTHON_USE_TYPE_SLOTS
+  #define CYTHON_USE_TYPE_SLOTS 0
+  #undef CYTHON_USE_TYPE_SPECS
+  #define CYTHON_USE_TYPE_SPECS 1
+  #undef CYTHON_USE_PYTYPE_LOOKUP
+  #define CYTHON_USE_PYTYPE_LOOKUP 0
+  #undef CYTHON_USE_PYLIST_INTERNALS
+  #define CYTHON_USE_PYLIST_INTERNALS 0
+  #undef CYTHON_USE_UNICODE_INTERNALS
+  #define CYTHON_USE_UNICODE_INTERNALS 0
+  #ifndef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #endif
+  #undef CYTHON_USE_PYLONG_INTERNALS
+  #define CYTHON_USE_PYLONG_INTERNALS 0
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #undef CYTHON_ASSUME_SAFE_MACROS
+  #define CYTHON_ASSUME_SAFE_MACROS 0
+  #undef CYTHON_ASSUME_SAFE_SIZE
+  #define CYTHON_ASSUME_SAFE_SIZE 0
+  #undef CYTHON_UNPACK_METHODS
+  #define CYTHON_UNPACK_METHODS 0
+  #undef CYTHON_FAST_THREAD_STATE
+  #define CYTHON_FAST_THREAD_STATE 0
+  #undef CYTHON_FAST_GIL
+  #define CYTHON_FAST_GIL 0
+  #undef CYTHON_METH_FASTCALL
+  #define CYTHON_METH_FASTCALL (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+  #undef CYTHON_FAST_PYCALL
+  #define CYTHON_FAST_PYCALL 0
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #undef CYTHON_USE_SYS_MONITORING
+  #define CYTHON_USE_SYS_MONITORING 0
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 0
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND (__PYX_LIMITED_VERSION_HEX >= 0x030A0000)
+  #endif
+  #undef CYTHON_USE_DICT_VERSIONS
+  #define CYTHON_USE_DICT_VERSIONS 0
+  #undef CYTHON_USE_EXC_INFO_STACK
+  #define CYTHON_USE_EXC_INFO_STACK 0
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 0
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+  #define CYTHON_USE_FREELISTS 1
+  #endif
+  #undef CYTHON_IMMORTAL_CONSTANTS
+  #define CYTHON_IMMORTAL_CONSTANTS 0
+#else
+  #define CYTHON_COMPILING_IN_PYPY 0
+  #define CYTHON_COMPILING_IN_CPYTHON 1
+  #define CYTHON_COMPILING_IN_LIMITED_API 0
+  #define CYTHON_COMPILING_IN_GRAAL 0
+  #ifdef Py_GIL_DISABLED
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 1
+  #else
+    #define CYTHON_COMPILING_IN_CPYTHON_FREETHREADING 0
+  #endif
+  #if PY_VERSION_HEX < 0x030A0000
+    #undef CYTHON_USE_TYPE_SLOTS
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #elif !defined(CYTHON_USE_TYPE_SLOTS)
+    #define CYTHON_USE_TYPE_SLOTS 1
+  #endif
+  #ifndef CYTHON_USE_TYPE_SPECS
+    #define CYTHON_USE_TYPE_SPECS 0
+  #endif
+  #ifndef CYTHON_USE_PYTYPE_LOOKUP
+    #define CYTHON_USE_PYTYPE_LOOKUP 1
+  #endif
+  #ifndef CYTHON_USE_PYLONG_INTERNALS
+    #define CYTHON_USE_PYLONG_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_PYLIST_INTERNALS
+    #define CYTHON_USE_PYLIST_INTERNALS 0
+  #elif !defined(CYTHON_USE_PYLIST_INTERNALS)
+    #define CYTHON_USE_PYLIST_INTERNALS 1
+  #endif
+  #ifndef CYTHON_USE_UNICODE_INTERNALS
+    #define CYTHON_USE_UNICODE_INTERNALS 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING || PY_VERSION_HEX >= 0x030B00A2
+    #undef CYTHON_USE_UNICODE_WRITER
+    #define CYTHON_USE_UNICODE_WRITER 0
+  #elif !defined(CYTHON_USE_UNICODE_WRITER)
+    #define CYTHON_USE_UNICODE_WRITER 1
+  #endif
+  #ifndef CYTHON_AVOID_BORROWED_REFS
+    #define CYTHON_AVOID_BORROWED_REFS 0
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 1
+  #elif !defined(CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS)
+    #define CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS 0
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_MACROS
+    #define CYTHON_ASSUME_SAFE_MACROS 1
+  #endif
+  #ifndef CYTHON_ASSUME_SAFE_SIZE
+    #define CYTHON_ASSUME_SAFE_SIZE 1
+  #endif
+  #ifndef CYTHON_UNPACK_METHODS
+    #define CYTHON_UNPACK_METHODS 1
+  #endif
+  #ifndef CYTHON_FAST_THREAD_STATE
+    #define CYTHON_FAST_THREAD_STATE 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_FAST_GIL
+    #define CYTHON_FAST_GIL 0
+  #elif !defined(CYTHON_FAST_GIL)
+    #define CYTHON_FAST_GIL (PY_VERSION_HEX < 0x030C00A6)
+  #endif
+  #ifndef CYTHON_METH_FASTCALL
+    #define CYTHON_METH_FASTCALL 1
+  #endif
+  #ifndef CYTHON_FAST_PYCALL
+    #define CYTHON_FAST_PYCALL 1
+  #endif
+  #ifndef CYTHON_PEP487_INIT_SUBCLASS
+    #define CYTHON_PEP487_INIT_SUBCLASS 1
+  #endif
+  #ifndef CYTHON_PEP489_MULTI_PHASE_INIT
+    #define CYTHON_PEP489_MULTI_PHASE_INIT 1
+  #endif
+  #ifndef CYTHON_USE_MODULE_STATE
+    #define CYTHON_USE_MODULE_STATE 0
+  #endif
+  #ifndef CYTHON_USE_SYS_MONITORING
+    #define CYTHON_USE_SYS_MONITORING (PY_VERSION_HEX >= 0x030d00B1)
+  #endif
+  #ifndef CYTHON_USE_TP_FINALIZE
+    #define CYTHON_USE_TP_FINALIZE 1
+  #endif
+  #ifndef CYTHON_USE_AM_SEND
+    #define CYTHON_USE_AM_SEND 1
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    #undef CYTHON_USE_DICT_VERSIONS
+    #define CYTHON_USE_DICT_VERSIONS 0
+  #elif !defined(CYTHON_USE_DICT_VERSIONS)
+    #define CYTHON_USE_DICT_VERSIONS  (PY_VERSION_HEX < 0x030C00A5 && !CYTHON_USE_MODULE_STATE)
+  #endif
+  #ifndef CYTHON_USE_EXC_INFO_STACK
+    #define CYTHON_USE_EXC_INFO_STACK 1
+  #endif
+  #ifndef CYTHON_UPDATE_DESCRIPTOR_DOC
+    #define CYTHON_UPDATE_DESCRIPTOR_DOC 1
+  #endif
+  #ifndef CYTHON_USE_FREELISTS
+    #define CYTHON_USE_FREELISTS (!CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+  #if defined(CYTHON_IMMORTAL_CONSTANTS) && PY_VERSION_HEX < 0x030C0000
+    #undef CYTHON_IMMORTAL_CONSTANTS
+    #define CYTHON_IMMORTAL_CONSTANTS 0  // definitely won't work
+  #elif !defined(CYTHON_IMMORTAL_CONSTANTS)
+    #define CYTHON_IMMORTAL_CONSTANTS (PY_VERSION_HEX >= 0x030C0000 && !CYTHON_USE_MODULE_STATE && CYTHON_COMPILING_IN_CPYTHON_FREETHREADING)
+  #endif
+#endif
+#ifndef CYTHON_COMPRESS_STRINGS
+  #define CYTHON_COMPRESS_STRINGS 1
+#endif
+#ifndef CYTHON_FAST_PYCCALL
+#define CYTHON_FAST_PYCCALL  CYTHON_FAST_PYCALL
+#endif
+#ifndef CYTHON_VECTORCALL
+#if CYTHON_COMPILING_IN_LIMITED_API
+#define CYTHON_VECTORCALL  (__PYX_LIMITED_VERSION_HEX >= 0x030C0000)
+#else
+#define CYTHON_VECTORCALL  (CYTHON_FAST_PYCCALL)
+#endif
+#endif
+#if CYTHON_USE_PYLONG_INTERNALS
+  #undef SHIFT
+  #undef BASE
+  #undef MASK
+  #ifdef SIZEOF_VOID_P
+    enum { __pyx_check_sizeof_voidp = 1 / (int)(SIZEOF_VOID_P == sizeof(void*)) };
+  #endif
+#endif
+#ifndef __has_attribute
+  #define __has_attribute(x) 0
+#endif
+#ifndef __has_cpp_attribute
+  #define __has_cpp_attribute(x) 0
+#endif
+#ifndef CYTHON_RESTRICT
+  #if defined(__GNUC__)
+    #define CYTHON_RESTRICT __restrict__
+  #elif defined(_MSC_VER) && _MSC_VER >= 1400
+    #define CYTHON_RESTRICT __restrict
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_RESTRICT restrict
+  #else
+    #define CYTHON_RESTRICT
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(maybe_unused) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(maybe_unused)
+        #define CYTHON_UNUSED [[maybe_unused]]
+      #endif
+    #endif
+  #endif
+#endif
+#ifndef CYTHON_UNUSED
+# if defined(__GNUC__)
+#   if !(defined(__cplusplus)) || (__GNUC__ > 3 || (__GNUC__ == 3 && __GNUC_MINOR__ >= 4))
+#     define CYTHON_UNUSED __attribute__ ((__unused__))
+#   else
+#     define CYTHON_UNUSED
+#   endif
+# elif defined(__ICC) || (defined(__INTEL_COMPILER) && !defined(_MSC_VER))
+#   define CYTHON_UNUSED __attribute__ ((__unused__))
+# else
+#   define CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_UNUSED_VAR
+#  if defined(__cplusplus)
+     template<class T> void CYTHON_UNUSED_VAR( const T& ) { }
+#  else
+#    define CYTHON_UNUSED_VAR(x) (void)(x)
+#  endif
+#endif
+#ifndef CYTHON_MAYBE_UNUSED_VAR
+  #define CYTHON_MAYBE_UNUSED_VAR(x) CYTHON_UNUSED_VAR(x)
+#endif
+#ifndef CYTHON_NCP_UNUSED
+# if CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#  define CYTHON_NCP_UNUSED
+# else
+#  define CYTHON_NCP_UNUSED CYTHON_UNUSED
+# endif
+#endif
+#ifndef CYTHON_USE_CPP_STD_MOVE
+  #if defined(__cplusplus) && (\
+    __cplusplus >= 201103L || (defined(_MSC_VER) && _MSC_VER >= 1600))
+    #define CYTHON_USE_CPP_STD_MOVE 1
+  #else
+    #define CYTHON_USE_CPP_STD_MOVE 0
+  #endif
+#endif
+#define __Pyx_void_to_None(void_result) ((void)(void_result), Py_INCREF(Py_None), Py_None)
+#include <stdint.h>
+typedef uintptr_t  __pyx_uintptr_t;
+#ifndef CYTHON_FALLTHROUGH
+  #if defined(__cplusplus)
+    /* for clang __has_cpp_attribute(fallthrough) is true even before C++17
+     * but leads to warnings with -pedantic, since it is a C++17 feature */
+    #if ((defined(_MSVC_LANG) && _MSVC_LANG >= 201703L) || __cplusplus >= 201703L)
+      #if __has_cpp_attribute(fallthrough)
+        #define CYTHON_FALLTHROUGH [[fallthrough]]
+      #endif
+    #endif
+    #ifndef CYTHON_FALLTHROUGH
+      #if __has_cpp_attribute(clang::fallthrough)
+        #define CYTHON_FALLTHROUGH [[clang::fallthrough]]
+      #elif __has_cpp_attribute(gnu::fallthrough)
+        #define CYTHON_FALLTHROUGH [[gnu::fallthrough]]
+      #endif
+    #endif
+  #endif
+  #ifndef CYTHON_FALLTHROUGH
+    #if __has_attribute(fallthrough)
+      #define CYTHON_FALLTHROUGH __attribute__((fallthrough))
+    #else
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+  #if defined(__clang__) && defined(__apple_build_version__)
+    #if __apple_build_version__ < 7000000
+      #undef  CYTHON_FALLTHROUGH
+      #define CYTHON_FALLTHROUGH
+    #endif
+  #endif
+#endif
+#ifndef Py_UNREACHABLE
+  #define Py_UNREACHABLE()  assert(0); abort()
+#endif
+#ifdef __cplusplus
+  template <typename T>
+  struct __PYX_IS_UNSIGNED_IMPL {static const bool value = T(0) < T(-1);};
+  #define __PYX_IS_UNSIGNED(type) (__PYX_IS_UNSIGNED_IMPL<type>::value)
+#else
+  #define __PYX_IS_UNSIGNED(type) (((type)-1) > 0)
+#endif
+#if CYTHON_COMPILING_IN_PYPY == 1
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x030A0000)
+#else
+  #define __PYX_NEED_TP_PRINT_SLOT  (PY_VERSION_HEX < 0x03090000)
+#endif
+#define __PYX_REINTERPRET_FUNCION(func_pointer, other_pointer) ((func_pointer)(void(*)(void))(other_pointer))
+
+/* CInitCode */
+#ifndef CYTHON_INLINE
+  #if defined(__clang__)
+    #define CYTHON_INLINE __inline__ __attribute__ ((__unused__))
+  #elif defined(__GNUC__)
+    #define CYTHON_INLINE __inline__
+  #elif defined(_MSC_VER)
+    #define CYTHON_INLINE __inline
+  #elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define CYTHON_INLINE inline
+  #else
+    #define CYTHON_INLINE
+  #endif
+#endif
+
+/* PythonCompatibility */
+#define __PYX_BUILD_PY_SSIZE_T "n"
+#define CYTHON_FORMAT_SSIZE_T "z"
+#define __Pyx_BUILTIN_MODULE_NAME "builtins"
+#define __Pyx_DefaultClassType PyType_Type
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #ifndef CO_OPTIMIZED
+    static int CO_OPTIMIZED;
+    #endif
+    #ifndef CO_NEWLOCALS
+    static int CO_NEWLOCALS;
+    #endif
+    #ifndef CO_VARARGS
+    static int CO_VARARGS;
+    #endif
+    #ifndef CO_VARKEYWORDS
+    static int CO_VARKEYWORDS;
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+    static int CO_ASYNC_GENERATOR;
+    #endif
+    #ifndef CO_GENERATOR
+    static int CO_GENERATOR;
+    #endif
+    #ifndef CO_COROUTINE
+    static int CO_COROUTINE;
+    #endif
+#else
+    #ifndef CO_COROUTINE
+      #define CO_COROUTINE 0x80
+    #endif
+    #ifndef CO_ASYNC_GENERATOR
+      #define CO_ASYNC_GENERATOR 0x200
+    #endif
+#endif
+static int __Pyx_init_co_variables(void);
+#if PY_VERSION_HEX >= 0x030900A4 || defined(Py_IS_TYPE)
+  #define __Pyx_IS_TYPE(ob, type) Py_IS_TYPE(ob, type)
+#else
+  #define __Pyx_IS_TYPE(ob, type) (((const PyObject*)ob)->ob_type == (type))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_Is)
+  #define __Pyx_Py_Is(x, y)  Py_Is(x, y)
+#else
+  #define __Pyx_Py_Is(x, y) ((x) == (y))
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsNone)
+  #define __Pyx_Py_IsNone(ob) Py_IsNone(ob)
+#else
+  #define __Pyx_Py_IsNone(ob) __Pyx_Py_Is((ob), Py_None)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsTrue)
+  #define __Pyx_Py_IsTrue(ob) Py_IsTrue(ob)
+#else
+  #define __Pyx_Py_IsTrue(ob) __Pyx_Py_Is((ob), Py_True)
+#endif
+#if PY_VERSION_HEX >= 0x030A00B1 || defined(Py_IsFalse)
+  #define __Pyx_Py_IsFalse(ob) Py_IsFalse(ob)
+#else
+  #define __Pyx_Py_IsFalse(ob) __Pyx_Py_Is((ob), Py_False)
+#endif
+#define __Pyx_NoneAsNull(obj)  (__Pyx_Py_IsNone(obj) ? NULL : (obj))
+#if PY_VERSION_HEX >= 0x030900F0 && !CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyObject_GC_IsFinalized(o) PyObject_GC_IsFinalized(o)
+#else
+  #define __Pyx_PyObject_GC_IsFinalized(o) _PyGC_FINALIZED(o)
+#endif
+#ifndef Py_TPFLAGS_CHECKTYPES
+  #define Py_TPFLAGS_CHECKTYPES 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_INDEX
+  #define Py_TPFLAGS_HAVE_INDEX 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_NEWBUFFER
+  #define Py_TPFLAGS_HAVE_NEWBUFFER 0
+#endif
+#ifndef Py_TPFLAGS_HAVE_FINALIZE
+  #define Py_TPFLAGS_HAVE_FINALIZE 0
+#endif
+#ifndef Py_TPFLAGS_SEQUENCE
+  #define Py_TPFLAGS_SEQUENCE 0
+#endif
+#ifndef Py_TPFLAGS_MAPPING
+  #define Py_TPFLAGS_MAPPING 0
+#endif
+#ifndef Py_TPFLAGS_IMMUTABLETYPE
+  #define Py_TPFLAGS_IMMUTABLETYPE (1UL << 8)
+#endif
+#ifndef Py_TPFLAGS_DISALLOW_INSTANTIATION
+  #define Py_TPFLAGS_DISALLOW_INSTANTIATION (1UL << 7)
+#endif
+#ifndef METH_STACKLESS
+  #define METH_STACKLESS 0
+#endif
+#ifndef METH_FASTCALL
+  #ifndef METH_FASTCALL
+     #define METH_FASTCALL 0x80
+  #endif
+  typedef PyObject *(*__Pyx_PyCFunctionFast) (PyObject *self, PyObject *const *args, Py_ssize_t nargs);
+  typedef PyObject *(*__Pyx_PyCFunctionFastWithKeywords) (PyObject *self, PyObject *const *args,
+                                                          Py_ssize_t nargs, PyObject *kwnames);
+#else
+  #if PY_VERSION_HEX >= 0x030d00A4
+  #  define __Pyx_PyCFunctionFast PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords PyCFunctionFastWithKeywords
+  #else
+  #  define __Pyx_PyCFunctionFast _PyCFunctionFast
+  #  define __Pyx_PyCFunctionFastWithKeywords _PyCFunctionFastWithKeywords
+  #endif
+#endif
+#if CYTHON_METH_FASTCALL
+  #define __Pyx_METH_FASTCALL METH_FASTCALL
+  #define __Pyx_PyCFunction_FastCall __Pyx_PyCFunctionFast
+  #define __Pyx_PyCFunction_FastCallWithKeywords __Pyx_PyCFunctionFastWithKeywords
+#else
+  #define __Pyx_METH_FASTCALL METH_VARARGS
+  #define __Pyx_PyCFunction_FastCall PyCFunction
+  #define __Pyx_PyCFunction_FastCallWithKeywords PyCFunctionWithKeywords
+#endif
+#if CYTHON_VECTORCALL
+  #define __pyx_vectorcallfunc vectorcallfunc
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  PY_VECTORCALL_ARGUMENTS_OFFSET
+  #define __Pyx_PyVectorcall_NARGS(n)  PyVectorcall_NARGS((size_t)(n))
+#else
+  #define __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET  0
+  #define __Pyx_PyVectorcall_NARGS(n)  ((Py_ssize_t)(n))
+#endif
+#if PY_VERSION_HEX >= 0x030900B1
+#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_CheckExact(func)
+#else
+#define __Pyx_PyCFunction_CheckExact(func)  PyCFunction_Check(func)
+#endif
+#define __Pyx_CyOrPyCFunction_Check(func)  PyCFunction_Check(func)
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  (((PyCFunctionObject*)(func))->m_ml->ml_meth)
+#elif !CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_CyOrPyCFunction_GET_FUNCTION(func)  PyCFunction_GET_FUNCTION(func)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_CyOrPyCFunction_GET_FLAGS(func)  (((PyCFunctionObject*)(func))->m_ml->ml_flags)
+static CYTHON_INLINE PyObject* __Pyx_CyOrPyCFunction_GET_SELF(PyObject *func) {
+    return (__Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_STATIC) ? NULL : ((PyCFunctionObject*)func)->m_self;
+}
+#endif
+static CYTHON_INLINE int __Pyx__IsSameCFunction(PyObject *func, void (*cfunc)(void)) {
+#if CYTHON_COMPILING_IN_LIMITED_API
+    return PyCFunction_Check(func) && PyCFunction_GetFunction(func) == (PyCFunction) cfunc;
+#else
+    return PyCFunction_Check(func) && PyCFunction_GET_FUNCTION(func) == (PyCFunction) cfunc;
+#endif
+}
+#define __Pyx_IsSameCFunction(func, cfunc)   __Pyx__IsSameCFunction(func, cfunc)
+#if PY_VERSION_HEX < 0x03090000 || (CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000)
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  ((void)m, PyType_FromSpecWithBases(s, b))
+  typedef PyObject *(*__Pyx_PyCMethod)(PyObject *, PyTypeObject *, PyObject *const *, size_t, PyObject *);
+#else
+  #define __Pyx_PyType_FromModuleAndSpec(m, s, b)  PyType_FromModuleAndSpec(m, s, b)
+  #define __Pyx_PyCMethod  PyCMethod
+#endif
+#ifndef METH_METHOD
+  #define METH_METHOD 0x200
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyObject_Malloc)
+  #define PyObject_Malloc(s)   PyMem_Malloc(s)
+  #define PyObject_Free(p)     PyMem_Free(p)
+  #define PyObject_Realloc(p)  PyMem_Realloc(p)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)
+#elif CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) GraalPyFrame_SetLineNumber((frame), (lineno))
+#elif CYTHON_COMPILING_IN_GRAAL
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno) _PyFrame_SetLineNumber((frame), (lineno))
+#else
+  #define __Pyx_PyCode_HasFreeVars(co)  (PyCode_GetNumFree(co) > 0)
+  #define __Pyx_PyFrame_SetLineNumber(frame, lineno)  (frame)->f_lineno = (lineno)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyThreadState_Current PyThreadState_Get()
+#elif !CYTHON_FAST_THREAD_STATE
+  #define __Pyx_PyThreadState_Current PyThreadState_GET()
+#elif PY_VERSION_HEX >= 0x030d00A1
+  #define __Pyx_PyThreadState_Current PyThreadState_GetUnchecked()
+#else
+  #define __Pyx_PyThreadState_Current _PyThreadState_UncheckedGet()
+#endif
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_INLINE void *__Pyx__PyModule_GetState(PyObject *op)
+{
+    void *result;
+    result = PyModule_GetState(op);
+    if (!result)
+        Py_FatalError("Couldn't find the module state");
+    return result;
+}
+#define __Pyx_PyModule_GetState(o) (__pyx_mstatetype *)__Pyx__PyModule_GetState(o)
+#else
+#define __Pyx_PyModule_GetState(op) ((void)op,__pyx_mstate_global)
+#endif
+#define __Pyx_PyObject_GetSlot(obj, name, func_ctype)  __Pyx_PyType_GetSlot(Py_TYPE((PyObject *) obj), name, func_ctype)
+#define __Pyx_PyObject_TryGetSlot(obj, name, func_ctype) __Pyx_PyType_TryGetSlot(Py_TYPE(obj), name, func_ctype)
+#define __Pyx_PyObject_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#define __Pyx_PyObject_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSubSlot(Py_TYPE(obj), sub, name, func_ctype)
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((type)->name)
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype) __Pyx_PyType_GetSlot(type, name, func_ctype)
+  #define __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype) (((type)->sub) ? ((type)->sub->name) : NULL)
+  #define __Pyx_PyType_TryGetSubSlot(type, sub, name, func_ctype) __Pyx_PyType_GetSubSlot(type, sub, name, func_ctype)
+#else
+  #define __Pyx_PyType_GetSlot(type, name, func_ctype)  ((func_ctype) PyType_GetSlot((type), Py_##name))
+  #define __Pyx_PyType_TryGetSlot(type, name, func_ctype)\
+    ((__PYX_LIMITED_VERSION_HEX >= 0x030A0000 ||\
+     (PyType_GetFlags(type) & Py_TPFLAGS_HEAPTYPE) || __Pyx_get_runtime_version() >= 0x030A0000) ?\
+     __Pyx_PyType_GetSlot(type, name, func_ctype) : NULL)
+  #define __Pyx_PyType_GetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_GetSlot(obj, name, func_ctype)
+  #define __Pyx_PyType_TryGetSubSlot(obj, sub, name, func_ctype) __Pyx_PyType_TryGetSlot(obj, name, func_ctype)
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || defined(_PyDict_NewPresized)
+#define __Pyx_PyDict_NewPresized(n)  ((n <= 8) ? PyDict_New() : _PyDict_NewPresized(n))
+#else
+#define __Pyx_PyDict_NewPresized(n)  PyDict_New()
+#endif
+#define __Pyx_PyNumber_Divide(x,y)         PyNumber_TrueDivide(x,y)
+#define __Pyx_PyNumber_InPlaceDivide(x,y)  PyNumber_InPlaceTrueDivide(x,y)
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_UNICODE_INTERNALS
+#define __Pyx_PyDict_GetItemStrWithError(dict, name)  _PyDict_GetItem_KnownHash(dict, name, ((PyASCIIObject *) name)->hash)
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStr(PyObject *dict, PyObject *name) {
+    PyObject *res = __Pyx_PyDict_GetItemStrWithError(dict, name);
+    if (res == NULL) PyErr_Clear();
+    return res;
+}
+#elif !CYTHON_COMPILING_IN_PYPY || PYPY_VERSION_NUM >= 0x07020000
+#define __Pyx_PyDict_GetItemStrWithError  PyDict_GetItemWithError
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#else
+static CYTHON_INLINE PyObject * __Pyx_PyDict_GetItemStrWithError(PyObject *dict, PyObject *name) {
+#if CYTHON_COMPILING_IN_PYPY
+    return PyDict_GetItem(dict, name);
+#else
+    PyDictEntry *ep;
+    PyDictObject *mp = (PyDictObject*) dict;
+    long hash = ((PyStringObject *) name)->ob_shash;
+    assert(hash != -1);
+    ep = (mp->ma_lookup)(mp, name, hash);
+    if (ep == NULL) {
+        return NULL;
+    }
+    return ep->me_value;
+#endif
+}
+#define __Pyx_PyDict_GetItemStr           PyDict_GetItem
+#endif
+#if CYTHON_USE_TYPE_SLOTS
+  #define __Pyx_PyType_GetFlags(tp)   (((PyTypeObject *)tp)->tp_flags)
+  #define __Pyx_PyType_HasFeature(type, feature)  ((__Pyx_PyType_GetFlags(type) & (feature)) != 0)
+#else
+  #define __Pyx_PyType_GetFlags(tp)   (PyType_GetFlags((PyTypeObject *)tp))
+  #define __Pyx_PyType_HasFeature(type, feature)  PyType_HasFeature(type, feature)
+#endif
+#define __Pyx_PyObject_GetIterNextFunc(iterator)  __Pyx_PyObject_GetSlot(iterator, tp_iternext, iternextfunc)
+#if CYTHON_USE_TYPE_SPECS
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  {\
+    PyTypeObject *type = Py_TYPE((PyObject*)obj);\
+    assert(__Pyx_PyType_HasFeature(type, Py_TPFLAGS_HEAPTYPE));\
+    PyObject_GC_Del(obj);\
+    Py_DECREF(type);\
+}
+#else
+#define __Pyx_PyHeapTypeObject_GC_Del(obj)  PyObject_GC_Del(obj)
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+  #define __Pyx_PyUnicode_READY(op)       (0)
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_ReadChar(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   ((void)u, 1114111U)
+  #define __Pyx_PyUnicode_KIND(u)         ((void)u, (0))
+  #define __Pyx_PyUnicode_DATA(u)         ((void*)u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   ((void)k, PyUnicode_ReadChar((PyObject*)(d), i))
+  #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GetLength(u))
+#else
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_READY(op)       (0)
+  #else
+    #define __Pyx_PyUnicode_READY(op)       (likely(PyUnicode_IS_READY(op)) ?\
+                                                0 : _PyUnicode_Ready((PyObject *)(op)))
+  #endif
+  #define __Pyx_PyUnicode_READ_CHAR(u, i) PyUnicode_READ_CHAR(u, i)
+  #define __Pyx_PyUnicode_MAX_CHAR_VALUE(u)   PyUnicode_MAX_CHAR_VALUE(u)
+  #define __Pyx_PyUnicode_KIND(u)         ((int)PyUnicode_KIND(u))
+  #define __Pyx_PyUnicode_DATA(u)         PyUnicode_DATA(u)
+  #define __Pyx_PyUnicode_READ(k, d, i)   PyUnicode_READ(k, d, i)
+  #define __Pyx_PyUnicode_WRITE(k, d, i, ch)  PyUnicode_WRITE(k, d, i, (Py_UCS4) ch)
+  #if PY_VERSION_HEX >= 0x030C0000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != PyUnicode_GET_LENGTH(u))
+  #else
+    #if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x03090000
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : ((PyCompactUnicodeObject *)(u))->wstr_length))
+    #else
+    #define __Pyx_PyUnicode_IS_TRUE(u)      (0 != (likely(PyUnicode_IS_READY(u)) ? PyUnicode_GET_LENGTH(u) : PyUnicode_GET_SIZE(u)))
+    #endif
+  #endif
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #define __Pyx_PyUnicode_Concat(a, b)      PyNumber_Add(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  PyNumber_Add(a, b)
+#else
+  #define __Pyx_PyUnicode_Concat(a, b)      PyUnicode_Concat(a, b)
+  #define __Pyx_PyUnicode_ConcatSafe(a, b)  ((unlikely((a) == Py_None) || unlikely((b) == Py_None)) ?\
+      PyNumber_Add(a, b) : __Pyx_PyUnicode_Concat(a, b))
+#endif
+#if CYTHON_COMPILING_IN_PYPY
+  #if !defined(PyUnicode_DecodeUnicodeEscape)
+    #define PyUnicode_DecodeUnicodeEscape(s, size, errors)  PyUnicode_Decode(s, size, "unicode_escape", errors)
+  #endif
+  #if !defined(PyUnicode_Contains)
+    #define PyUnicode_Contains(u, s)  PySequence_Contains(u, s)
+  #endif
+  #if !defined(PyByteArray_Check)
+    #define PyByteArray_Check(obj)  PyObject_TypeCheck(obj, &PyByteArray_Type)
+  #endif
+  #if !defined(PyObject_Format)
+    #define PyObject_Format(obj, fmt)  PyObject_CallMethod(obj, "__format__", "O", fmt)
+  #endif
+#endif
+#define __Pyx_PyUnicode_FormatSafe(a, b)  ((unlikely((a) == Py_None || (PyUnicode_Check(b) && !PyUnicode_CheckExact(b)))) ? PyNumber_Remainder(a, b) : PyUnicode_Format(a, b))
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030E0000
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && PyUnstable_Object_IsUniquelyReferenced(obj)) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#elif CYTHON_COMPILING_IN_CPYTHON
+  #define __Pyx_PySequence_ListKeepNew(obj)\
+    (likely(PyList_CheckExact(obj) && Py_REFCNT(obj) == 1) ? __Pyx_NewRef(obj) : PySequence_List(obj))
+#else
+  #define __Pyx_PySequence_ListKeepNew(obj)  PySequence_List(obj)
+#endif
+#ifndef PySet_CheckExact
+  #define PySet_CheckExact(obj)        __Pyx_IS_TYPE(obj, &PySet_Type)
+#endif
+#if PY_VERSION_HEX >= 0x030900A4
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_SET_REFCNT(obj, refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SET_SIZE(obj, size)
+#else
+  #define __Pyx_SET_REFCNT(obj, refcnt) Py_REFCNT(obj) = (refcnt)
+  #define __Pyx_SET_SIZE(obj, size) Py_SIZE(obj) = (size)
+#endif
+enum __Pyx_ReferenceSharing {
+  __Pyx_ReferenceSharing_DefinitelyUnique, // We created it so we know it's unshared - no need to check
+  __Pyx_ReferenceSharing_OwnStrongReference,
+  __Pyx_ReferenceSharing_FunctionArgument,
+  __Pyx_ReferenceSharing_SharedReference, // Never trust it to be unshared because it's a global or similar
+};
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && PY_VERSION_HEX >= 0x030E0000
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing)\
+    (sharing == __Pyx_ReferenceSharing_DefinitelyUnique ? 1 :\
+      (sharing == __Pyx_ReferenceSharing_FunctionArgument ? PyUnstable_Object_IsUniqueReferencedTemporary(o) :\
+      (sharing == __Pyx_ReferenceSharing_OwnStrongReference ? PyUnstable_Object_IsUniquelyReferenced(o) : 0)))
+#elif (CYTHON_COMPILING_IN_CPYTHON && !CYTHON_COMPILING_IN_CPYTHON_FREETHREADING) || CYTHON_COMPILING_IN_LIMITED_API
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)sharing), Py_REFCNT(o) == 1)
+#else
+#define __Pyx_IS_UNIQUELY_REFERENCED(o, sharing) (((void)o), ((void)sharing), 0)
+#endif
+#if CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+  #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+  #elif CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyList_GetItemRef(o, i) (likely((i) >= 0) ? PySequence_GetItem(o, i) : (PyErr_SetString(PyExc_IndexError, "list index out of range"), (PyObject*)NULL))
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) PySequence_ITEM(o, i)
+  #endif
+#elif CYTHON_COMPILING_IN_LIMITED_API || !CYTHON_ASSUME_SAFE_MACROS
+  #if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    #define __Pyx_PyList_GetItemRef(o, i) PyList_GetItemRef(o, i)
+  #else
+    #define __Pyx_PyList_GetItemRef(o, i) __Pyx_XNewRef(PyList_GetItem(o, i))
+  #endif
+#else
+  #define __Pyx_PyList_GetItemRef(o, i) __Pyx_NewRef(PyList_GET_ITEM(o, i))
+#endif
+#if CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS && !CYTHON_COMPILING_IN_LIMITED_API && CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PyList_GetItemRefFast(o, i, unsafe_shared) (__Pyx_IS_UNIQUELY_REFERENCED(o, unsafe_shared) ?\
+    __Pyx_NewRef(PyList_GET_ITEM(o, i)) : __Pyx_PyList_GetItemRef(o, i))
+#else
+  #define __Pyx_PyList_GetItemRefFast(o, i, unsafe_shared) __Pyx_PyList_GetItemRef(o, i)
+#endif
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyDict_GetItemRef(dict, key, result) PyDict_GetItemRef(dict, key, result)
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyObject_GetItem(dict, key);
+  if (*result == NULL) {
+    if (PyErr_ExceptionMatches(PyExc_KeyError)) {
+      PyErr_Clear();
+      return 0;
+    }
+    return -1;
+  }
+  return 1;
+}
+#else
+static CYTHON_INLINE int __Pyx_PyDict_GetItemRef(PyObject *dict, PyObject *key, PyObject **result) {
+  *result = PyDict_GetItemWithError(dict, key);
+  if (*result == NULL) {
+    return PyErr_Occurred() ? -1 : 0;
+  }
+  Py_INCREF(*result);
+  return 1;
+}
+#endif
+#if defined(CYTHON_DEBUG_VISIT_CONST) && CYTHON_DEBUG_VISIT_CONST
+  #define __Pyx_VISIT_CONST(obj)  Py_VISIT(obj)
+#else
+  #define __Pyx_VISIT_CONST(obj)
+#endif
+#if CYTHON_ASSUME_SAFE_MACROS
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_ITEM(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  Py_SIZE(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) (PyTuple_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GET_ITEM(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) (PyList_SET_ITEM(o, i, v), (0))
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GET_ITEM(o, i)
+#else
+  #define __Pyx_PySequence_ITEM(o, i) PySequence_GetItem(o, i)
+  #define __Pyx_PySequence_SIZE(seq)  PySequence_Size(seq)
+  #define __Pyx_PyTuple_SET_ITEM(o, i, v) PyTuple_SetItem(o, i, v)
+  #define __Pyx_PyTuple_GET_ITEM(o, i) PyTuple_GetItem(o, i)
+  #define __Pyx_PyList_SET_ITEM(o, i, v) PyList_SetItem(o, i, v)
+  #define __Pyx_PyList_GET_ITEM(o, i) PyList_GetItem(o, i)
+#endif
+#if CYTHON_ASSUME_SAFE_SIZE
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_GET_SIZE(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_GET_SIZE(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_GET_SIZE(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_GET_SIZE(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_GET_SIZE(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GET_LENGTH(o)
+#else
+  #define __Pyx_PyTuple_GET_SIZE(o) PyTuple_Size(o)
+  #define __Pyx_PyList_GET_SIZE(o) PyList_Size(o)
+  #define __Pyx_PySet_GET_SIZE(o) PySet_Size(o)
+  #define __Pyx_PyBytes_GET_SIZE(o) PyBytes_Size(o)
+  #define __Pyx_PyByteArray_GET_SIZE(o) PyByteArray_Size(o)
+  #define __Pyx_PyUnicode_GET_LENGTH(o) PyUnicode_GetLength(o)
+#endif
+#if CYTHON_COMPILING_IN_PYPY && !defined(PyUnicode_InternFromString)
+  #define PyUnicode_InternFromString(s) PyUnicode_FromString(s)
+#endif
+#define __Pyx_PyLong_FromHash_t PyLong_FromSsize_t
+#define __Pyx_PyLong_AsHash_t   __Pyx_PyIndex_AsSsize_t
+#if __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+    #define __Pyx_PySendResult PySendResult
+#else
+    typedef enum {
+        PYGEN_RETURN = 0,
+        PYGEN_ERROR = -1,
+        PYGEN_NEXT = 1,
+    } __Pyx_PySendResult;
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX < 0x030A00A3
+  typedef __Pyx_PySendResult (*__Pyx_pyiter_sendfunc)(PyObject *iter, PyObject *value, PyObject **result);
+#else
+  #define __Pyx_pyiter_sendfunc sendfunc
+#endif
+#if !CYTHON_USE_AM_SEND
+#define __PYX_HAS_PY_AM_SEND 0
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030A0000
+#define __PYX_HAS_PY_AM_SEND 1
+#else
+#define __PYX_HAS_PY_AM_SEND 2  // our own backported implementation
+#endif
+#if __PYX_HAS_PY_AM_SEND < 2
+    #define __Pyx_PyAsyncMethodsStruct PyAsyncMethods
+#else
+    typedef struct {
+        unaryfunc am_await;
+        unaryfunc am_aiter;
+        unaryfunc am_anext;
+        __Pyx_pyiter_sendfunc am_send;
+    } __Pyx_PyAsyncMethodsStruct;
+    #define __Pyx_SlotTpAsAsync(s) ((PyAsyncMethods*)(s))
+#endif
+#if CYTHON_USE_AM_SEND && PY_VERSION_HEX < 0x030A00F0
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (1UL << 21)
+#else
+    #define __Pyx_TPFLAGS_HAVE_AM_SEND (0)
+#endif
+#if PY_VERSION_HEX >= 0x03090000
+#define __Pyx_PyInterpreterState_Get() PyInterpreterState_Get()
+#else
+#define __Pyx_PyInterpreterState_Get() PyThreadState_Get()->interp
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030A0000
+#ifdef __cplusplus
+extern "C"
+#endif
+PyAPI_FUNC(void *) PyMem_Calloc(size_t nelem, size_t elsize);
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static int __Pyx_init_co_variable(PyObject *inspect, const char* name, int *write_to) {
+    int value;
+    PyObject *py_value = PyObject_GetAttrString(inspect, name);
+    if (!py_value) return 0;
+    value = (int) PyLong_AsLong(py_value);
+    Py_DECREF(py_value);
+    *write_to = value;
+    return value != -1 || !PyErr_Occurred();
+}
+static int __Pyx_init_co_variables(void) {
+    PyObject *inspect;
+    int result;
+    inspect = PyImport_ImportModule("inspect");
+    result =
+#if !defined(CO_OPTIMIZED)
+        __Pyx_init_co_variable(inspect, "CO_OPTIMIZED", &CO_OPTIMIZED) &&
+#endif
+#if !defined(CO_NEWLOCALS)
+        __Pyx_init_co_variable(inspect, "CO_NEWLOCALS", &CO_NEWLOCALS) &&
+#endif
+#if !defined(CO_VARARGS)
+        __Pyx_init_co_variable(inspect, "CO_VARARGS", &CO_VARARGS) &&
+#endif
+#if !defined(CO_VARKEYWORDS)
+        __Pyx_init_co_variable(inspect, "CO_VARKEYWORDS", &CO_VARKEYWORDS) &&
+#endif
+#if !defined(CO_ASYNC_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_ASYNC_GENERATOR", &CO_ASYNC_GENERATOR) &&
+#endif
+#if !defined(CO_GENERATOR)
+        __Pyx_init_co_variable(inspect, "CO_GENERATOR", &CO_GENERATOR) &&
+#endif
+#if !defined(CO_COROUTINE)
+        __Pyx_init_co_variable(inspect, "CO_COROUTINE", &CO_COROUTINE) &&
+#endif
+        1;
+    Py_DECREF(inspect);
+    return result ? 0 : -1;
+}
+#else
+static int __Pyx_init_co_variables(void) {
+    return 0;  // It's a limited API-only feature
+}
+#endif
+
+/* MathInitCode */
+#if defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)
+  #ifndef _USE_MATH_DEFINES
+    #define _USE_MATH_DEFINES
+  #endif
+#endif
+#include <math.h>
+#if defined(__CYGWIN__) && defined(_LDBL_EQ_DBL)
+#define __Pyx_truncl trunc
+#else
+#define __Pyx_truncl truncl
+#endif
+
+#ifndef CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#define CYTHON_CLINE_IN_TRACEBACK_RUNTIME 0
+#endif
+#ifndef CYTHON_CLINE_IN_TRACEBACK
+#define CYTHON_CLINE_IN_TRACEBACK CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#endif
+#if CYTHON_CLINE_IN_TRACEBACK
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; __pyx_clineno = __LINE__; (void) __pyx_clineno; }
+#else
+#define __PYX_MARK_ERR_POS(f_index, lineno)  { __pyx_filename = __pyx_f[f_index]; (void) __pyx_filename; __pyx_lineno = lineno; (void) __pyx_lineno; (void) __pyx_clineno; }
+#endif
+#define __PYX_ERR(f_index, lineno, Ln_error) \
+    { __PYX_MARK_ERR_POS(f_index, lineno) goto Ln_error; }
+
+#ifdef CYTHON_EXTERN_C
+    #undef __PYX_EXTERN_C
+    #define __PYX_EXTERN_C CYTHON_EXTERN_C
+#elif defined(__PYX_EXTERN_C)
+    #ifdef _MSC_VER
+    #pragma message ("Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.")
+    #else
+    #warning Please do not define the '__PYX_EXTERN_C' macro externally. Use 'CYTHON_EXTERN_C' instead.
+    #endif
+#else
+  #ifdef __cplusplus
+    #define __PYX_EXTERN_C extern "C"
+  #else
+    #define __PYX_EXTERN_C extern
+  #endif
+#endif
+
+#define __PYX_HAVE__nonaga_position
+#define __PYX_HAVE_API__nonaga_position
+/* Early includes */
+#include <string.h>
+#ifdef _OPENMP
+#include <omp.h>
+#endif /* _OPENMP */
+
+#if defined(PYREX_WITHOUT_ASSERTIONS) && !defined(CYTHON_WITHOUT_ASSERTIONS)
+#define CYTHON_WITHOUT_ASSERTIONS
+#endif
+
+#ifdef CYTHON_FREETHREADING_COMPATIBLE
+#if CYTHON_FREETHREADING_COMPATIBLE
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_NOT_USED
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#else
+#define __Pyx_FREETHREADING_COMPATIBLE Py_MOD_GIL_USED
+#endif
+#define __PYX_DEFAULT_STRING_ENCODING_IS_ASCII 0
+#define __PYX_DEFAULT_STRING_ENCODING_IS_UTF8 0
+#define __PYX_DEFAULT_STRING_ENCODING ""
+#define __Pyx_PyObject_FromString __Pyx_PyBytes_FromString
+#define __Pyx_PyObject_FromStringAndSize __Pyx_PyBytes_FromStringAndSize
+#define __Pyx_uchar_cast(c) ((unsigned char)c)
+#define __Pyx_long_cast(x) ((long)x)
+#define __Pyx_fits_Py_ssize_t(v, type, is_signed)  (\
+    (sizeof(type) < sizeof(Py_ssize_t))  ||\
+    (sizeof(type) > sizeof(Py_ssize_t) &&\
+          likely(v < (type)PY_SSIZE_T_MAX ||\
+                 v == (type)PY_SSIZE_T_MAX)  &&\
+          (!is_signed || likely(v > (type)PY_SSIZE_T_MIN ||\
+                                v == (type)PY_SSIZE_T_MIN)))  ||\
+    (sizeof(type) == sizeof(Py_ssize_t) &&\
+          (is_signed || likely(v < (type)PY_SSIZE_T_MAX ||\
+                               v == (type)PY_SSIZE_T_MAX)))  )
+static CYTHON_INLINE int __Pyx_is_valid_index(Py_ssize_t i, Py_ssize_t limit) {
+    return (size_t) i < (size_t) limit;
+}
+#if defined (__cplusplus) && __cplusplus >= 201103L
+    #include <cstdlib>
+    #define __Pyx_sst_abs(value) std::abs(value)
+#elif SIZEOF_INT >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) abs(value)
+#elif SIZEOF_LONG >= SIZEOF_SIZE_T
+    #define __Pyx_sst_abs(value) labs(value)
+#elif defined (_MSC_VER)
+    #define __Pyx_sst_abs(value) ((Py_ssize_t)_abs64(value))
+#elif defined (__STDC_VERSION__) && __STDC_VERSION__ >= 199901L
+    #define __Pyx_sst_abs(value) llabs(value)
+#elif defined (__GNUC__)
+    #define __Pyx_sst_abs(value) __builtin_llabs(value)
+#else
+    #define __Pyx_sst_abs(value) ((value<0) ? -value : value)
+#endif
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject*);
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject*, Py_ssize_t* length);
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char*);
+#define __Pyx_PyByteArray_FromStringAndSize(s, l) PyByteArray_FromStringAndSize((const char*)s, l)
+#define __Pyx_PyBytes_FromString        PyBytes_FromString
+#define __Pyx_PyBytes_FromStringAndSize PyBytes_FromStringAndSize
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char*);
+#if CYTHON_ASSUME_SAFE_MACROS
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AS_STRING(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AS_STRING(s)
+#else
+    #define __Pyx_PyBytes_AsWritableString(s)     ((char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableSString(s)    ((signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsWritableUString(s)    ((unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsString(s)     ((const char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsSString(s)    ((const signed char*) PyBytes_AsString(s))
+    #define __Pyx_PyBytes_AsUString(s)    ((const unsigned char*) PyBytes_AsString(s))
+    #define __Pyx_PyByteArray_AsString(s) PyByteArray_AsString(s)
+#endif
+#define __Pyx_PyObject_AsWritableString(s)    ((char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableSString(s)    ((signed char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsWritableUString(s)    ((unsigned char*)(__pyx_uintptr_t) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsSString(s)    ((const signed char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_AsUString(s)    ((const unsigned char*) __Pyx_PyObject_AsString(s))
+#define __Pyx_PyObject_FromCString(s)  __Pyx_PyObject_FromString((const char*)s)
+#define __Pyx_PyBytes_FromCString(s)   __Pyx_PyBytes_FromString((const char*)s)
+#define __Pyx_PyByteArray_FromCString(s)   __Pyx_PyByteArray_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromCString(s) __Pyx_PyUnicode_FromString((const char*)s)
+#define __Pyx_PyUnicode_FromOrdinal(o)       PyUnicode_FromOrdinal((int)o)
+#define __Pyx_PyUnicode_AsUnicode            PyUnicode_AsUnicode
+static CYTHON_INLINE PyObject *__Pyx_NewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_NewRef)
+    return Py_NewRef(obj);
+#else
+    Py_INCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_XNewRef(PyObject *obj) {
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX >= 0x030a0000 || defined(Py_XNewRef)
+    return Py_XNewRef(obj);
+#else
+    Py_XINCREF(obj);
+    return obj;
+#endif
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b);
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject*);
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject*);
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x);
+#define __Pyx_PySequence_Tuple(obj)\
+    (likely(PyTuple_CheckExact(obj)) ? __Pyx_NewRef(obj) : PySequence_Tuple(obj))
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject*);
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t);
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject*);
+#if CYTHON_ASSUME_SAFE_MACROS
+#define __Pyx_PyFloat_AsDouble(x) (PyFloat_CheckExact(x) ? PyFloat_AS_DOUBLE(x) : PyFloat_AsDouble(x))
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AS_DOUBLE(x)
+#else
+#define __Pyx_PyFloat_AsDouble(x) PyFloat_AsDouble(x)
+#define __Pyx_PyFloat_AS_DOUBLE(x) PyFloat_AsDouble(x)
+#endif
+#define __Pyx_PyFloat_AsFloat(x) ((float) __Pyx_PyFloat_AsDouble(x))
+#define __Pyx_PyNumber_Int(x) (PyLong_CheckExact(x) ? __Pyx_NewRef(x) : PyNumber_Long(x))
+#if CYTHON_USE_PYLONG_INTERNALS
+  #if PY_VERSION_HEX >= 0x030C00A7
+  #ifndef _PyLong_SIGN_MASK
+    #define _PyLong_SIGN_MASK 3
+  #endif
+  #ifndef _PyLong_NON_SIZE_BITS
+    #define _PyLong_NON_SIZE_BITS 3
+  #endif
+  #define __Pyx_PyLong_Sign(x)  (((PyLongObject*)x)->long_value.lv_tag & _PyLong_SIGN_MASK)
+  #define __Pyx_PyLong_IsNeg(x)  ((__Pyx_PyLong_Sign(x) & 2) != 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (!__Pyx_PyLong_IsNeg(x))
+  #define __Pyx_PyLong_IsZero(x)  (__Pyx_PyLong_Sign(x) & 1)
+  #define __Pyx_PyLong_IsPos(x)  (__Pyx_PyLong_Sign(x) == 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  (__Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  ((Py_ssize_t) (((PyLongObject*)x)->long_value.lv_tag >> _PyLong_NON_SIZE_BITS))
+  #define __Pyx_PyLong_SignedDigitCount(x)\
+        ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * __Pyx_PyLong_DigitCount(x))
+  #if defined(PyUnstable_Long_IsCompact) && defined(PyUnstable_Long_CompactValue)
+    #define __Pyx_PyLong_IsCompact(x)     PyUnstable_Long_IsCompact((PyLongObject*) x)
+    #define __Pyx_PyLong_CompactValue(x)  PyUnstable_Long_CompactValue((PyLongObject*) x)
+  #else
+    #define __Pyx_PyLong_IsCompact(x)     (((PyLongObject*)x)->long_value.lv_tag < (2 << _PyLong_NON_SIZE_BITS))
+    #define __Pyx_PyLong_CompactValue(x)  ((1 - (Py_ssize_t) __Pyx_PyLong_Sign(x)) * (Py_ssize_t) __Pyx_PyLong_Digits(x)[0])
+  #endif
+  typedef Py_ssize_t  __Pyx_compact_pylong;
+  typedef size_t  __Pyx_compact_upylong;
+  #else
+  #define __Pyx_PyLong_IsNeg(x)  (Py_SIZE(x) < 0)
+  #define __Pyx_PyLong_IsNonNeg(x)  (Py_SIZE(x) >= 0)
+  #define __Pyx_PyLong_IsZero(x)  (Py_SIZE(x) == 0)
+  #define __Pyx_PyLong_IsPos(x)  (Py_SIZE(x) > 0)
+  #define __Pyx_PyLong_CompactValueUnsigned(x)  ((Py_SIZE(x) == 0) ? 0 : __Pyx_PyLong_Digits(x)[0])
+  #define __Pyx_PyLong_DigitCount(x)  __Pyx_sst_abs(Py_SIZE(x))
+  #define __Pyx_PyLong_SignedDigitCount(x)  Py_SIZE(x)
+  #define __Pyx_PyLong_IsCompact(x)  (Py_SIZE(x) == 0 || Py_SIZE(x) == 1 || Py_SIZE(x) == -1)
+  #define __Pyx_PyLong_CompactValue(x)\
+        ((Py_SIZE(x) == 0) ? (sdigit) 0 : ((Py_SIZE(x) < 0) ? -(sdigit)__Pyx_PyLong_Digits(x)[0] : (sdigit)__Pyx_PyLong_Digits(x)[0]))
+  typedef sdigit  __Pyx_compact_pylong;
+  typedef digit  __Pyx_compact_upylong;
+  #endif
+  #if PY_VERSION_HEX >= 0x030C00A5
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->long_value.ob_digit)
+  #else
+  #define __Pyx_PyLong_Digits(x)  (((PyLongObject*)x)->ob_digit)
+  #endif
+#endif
+#if __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeUTF8(c_str, size, NULL)
+#elif __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_DecodeASCII(c_str, size, NULL)
+#else
+  #define __Pyx_PyUnicode_FromStringAndSize(c_str, size) PyUnicode_Decode(c_str, size, __PYX_DEFAULT_STRING_ENCODING, NULL)
+#endif
+
+
+/* Test for GCC > 2.95 */
+#if defined(__GNUC__)     && (__GNUC__ > 2 || (__GNUC__ == 2 && (__GNUC_MINOR__ > 95)))
+  #define likely(x)   __builtin_expect(!!(x), 1)
+  #define unlikely(x) __builtin_expect(!!(x), 0)
+#else /* !__GNUC__ or GCC < 2.95 */
+  #define likely(x)   (x)
+  #define unlikely(x) (x)
+#endif /* __GNUC__ */
+/* PretendToInitialize */
+#ifdef __cplusplus
+#if __cplusplus > 201103L
+#include <type_traits>
+#endif
+template <typename T>
+static void __Pyx_pretend_to_initialize(T* ptr) {
+#if __cplusplus > 201103L
+    if ((std::is_trivially_default_constructible<T>::value))
+#endif
+        *ptr = T();
+    (void)ptr;
+}
+#else
+static CYTHON_INLINE void __Pyx_pretend_to_initialize(void* ptr) { (void)ptr; }
+#endif
+
+
+#if !CYTHON_USE_MODULE_STATE
+static PyObject *__pyx_m = NULL;
+#endif
+static int __pyx_lineno;
+static int __pyx_clineno = 0;
+static const char * const __pyx_cfilenm = __FILE__;
+static const char *__pyx_filename;
+
+/* #### Code section: filename_table ### */
+
+static const char* const __pyx_f[] = {
+  "NonagaGame/nonaga_position.pyx",
+  "NonagaGame/nonaga_board.pxd",
+  "NonagaGame/nonaga_logic.pxd",
+};
+/* #### Code section: utility_code_proto_before_types ### */
+/* ForceInitThreads.proto */
+#ifndef __PYX_FORCE_INIT_THREADS
+  #define __PYX_FORCE_INIT_THREADS 0
+#endif
+
+/* NoFastGil.proto */
+#define __Pyx_PyGILState_Ensure PyGILState_Ensure
+#define __Pyx_PyGILState_Release PyGILState_Release
+#define __Pyx_FastGIL_Remember()
+#define __Pyx_FastGIL_Forget()
+#define __Pyx_FastGilFuncInit()
+
+/* Atomics.proto (used by CodeObjectCache) */
+#include <pythread.h>
+#ifndef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 1
+#endif
+#define __PYX_CYTHON_ATOMICS_ENABLED() CYTHON_ATOMICS
+#define __PYX_GET_CYTHON_COMPILING_IN_CPYTHON_FREETHREADING() CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __pyx_atomic_int_type int
+#define __pyx_nonatomic_int_type int
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__))
+    #include <stdatomic.h>
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)))
+    #include <atomic>
+#endif
+#if CYTHON_ATOMICS && (defined(__STDC_VERSION__) &&\
+                        (__STDC_VERSION__ >= 201112L) &&\
+                        !defined(__STDC_NO_ATOMICS__) &&\
+                       ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type atomic_int
+    #define __pyx_atomic_ptr_type atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) atomic_fetch_add_explicit(value, 1, memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) atomic_fetch_add_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) atomic_fetch_sub_explicit(value, 1, memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) atomic_load_explicit(value, memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) atomic_load_explicit(value, memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C atomics"
+    #endif
+#elif CYTHON_ATOMICS && (defined(__cplusplus) && (\
+                    (__cplusplus >= 201103L) ||\
+\
+                    (defined(_MSC_VER) && _MSC_VER >= 1700)) &&\
+                    ATOMIC_INT_LOCK_FREE == 2)
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type std::atomic_int
+    #define __pyx_atomic_ptr_type std::atomic_uintptr_t
+    #define __pyx_nonatomic_ptr_type uintptr_t
+    #define __pyx_atomic_incr_relaxed(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_relaxed)
+    #define __pyx_atomic_incr_acq_rel(value) std::atomic_fetch_add_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_decr_acq_rel(value) std::atomic_fetch_sub_explicit(value, 1, std::memory_order_acq_rel)
+    #define __pyx_atomic_sub(value, arg) std::atomic_fetch_sub(value, arg)
+    #define __pyx_atomic_int_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #define __pyx_atomic_load(value) std::atomic_load(value)
+    #define __pyx_atomic_store(value, new_value) std::atomic_store(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) std::atomic_load_explicit(value, std::memory_order_relaxed)
+    #define __pyx_atomic_pointer_load_acquire(value) std::atomic_load_explicit(value, std::memory_order_acquire)
+    #define __pyx_atomic_pointer_exchange(value, new_value) std::atomic_exchange(value, (__pyx_nonatomic_ptr_type)new_value)
+    #define __pyx_atomic_pointer_cmp_exchange(value, expected, desired) std::atomic_compare_exchange_strong(value, expected, desired)
+    #if defined(__PYX_DEBUG_ATOMICS) && defined(_MSC_VER)
+        #pragma message ("Using standard C++ atomics")
+    #elif defined(__PYX_DEBUG_ATOMICS)
+        #warning "Using standard C++ atomics"
+    #endif
+#elif CYTHON_ATOMICS && (__GNUC__ >= 5 || (__GNUC__ == 4 &&\
+                    (__GNUC_MINOR__ > 1 ||\
+                    (__GNUC_MINOR__ == 1 && __GNUC_PATCHLEVEL__ >= 2))))
+    #define __pyx_atomic_ptr_type void*
+    #define __pyx_nonatomic_ptr_type void*
+    #define __pyx_atomic_incr_relaxed(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) __sync_fetch_and_add(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) __sync_fetch_and_sub(value, 1)
+    #define __pyx_atomic_sub(value, arg) __sync_fetch_and_sub(value, arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_store(value, new_value) __sync_lock_test_and_set(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_load_acquire(value) __sync_fetch_and_add(value, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) __sync_lock_test_and_set(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_nonatomic_ptr_type old = __sync_val_compare_and_swap(value, *expected, desired);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Using GNU atomics"
+    #endif
+#elif CYTHON_ATOMICS && defined(_MSC_VER)
+    #include <intrin.h>
+    #undef __pyx_atomic_int_type
+    #define __pyx_atomic_int_type long
+    #define __pyx_atomic_ptr_type void*
+    #undef __pyx_nonatomic_int_type
+    #define __pyx_nonatomic_int_type long
+    #define __pyx_nonatomic_ptr_type void*
+    #pragma intrinsic (_InterlockedExchangeAdd, _InterlockedExchange, _InterlockedCompareExchange, _InterlockedCompareExchangePointer, _InterlockedExchangePointer)
+    #define __pyx_atomic_incr_relaxed(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_incr_acq_rel(value) _InterlockedExchangeAdd(value, 1)
+    #define __pyx_atomic_decr_acq_rel(value) _InterlockedExchangeAdd(value, -1)
+    #define __pyx_atomic_sub(value, arg) _InterlockedExchangeAdd(value, -arg)
+    static CYTHON_INLINE int __pyx_atomic_int_cmp_exchange(__pyx_atomic_int_type* value, __pyx_nonatomic_int_type* expected, __pyx_nonatomic_int_type desired) {
+        __pyx_nonatomic_int_type old = _InterlockedCompareExchange(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #define __pyx_atomic_load(value) _InterlockedExchangeAdd(value, 0)
+    #define __pyx_atomic_store(value, new_value) _InterlockedExchange(value, new_value)
+    #define __pyx_atomic_pointer_load_relaxed(value) *(void * volatile *)value
+    #define __pyx_atomic_pointer_load_acquire(value) _InterlockedCompareExchangePointer(value, 0, 0)
+    #define __pyx_atomic_pointer_exchange(value, new_value) _InterlockedExchangePointer(value, (__pyx_atomic_ptr_type)new_value)
+    static CYTHON_INLINE int __pyx_atomic_pointer_cmp_exchange(__pyx_atomic_ptr_type* value, __pyx_nonatomic_ptr_type* expected, __pyx_nonatomic_ptr_type desired) {
+        __pyx_atomic_ptr_type old = _InterlockedCompareExchangePointer(value, desired, *expected);
+        int result = old == *expected;
+        *expected = old;
+        return result;
+    }
+    #ifdef __PYX_DEBUG_ATOMICS
+        #pragma message ("Using MSVC atomics")
+    #endif
+#else
+    #undef CYTHON_ATOMICS
+    #define CYTHON_ATOMICS 0
+    #ifdef __PYX_DEBUG_ATOMICS
+        #warning "Not using atomics"
+    #endif
+#endif
+
+/* #### Code section: numeric_typedefs ### */
+/* #### Code section: complex_type_declarations ### */
+/* #### Code section: type_declarations ### */
+
+/*--- Type declarations ---*/
+struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates;
+struct __pyx_obj_12nonaga_board_NonagaTile;
+struct __pyx_obj_12nonaga_board_NonagaPiece;
+struct __pyx_obj_12nonaga_board_NonagaIsland;
+struct __pyx_obj_12nonaga_board_NonagaBoard;
+struct __pyx_obj_12nonaga_logic_NonagaLogic;
+struct __pyx_opt_args_12nonaga_board_11NonagaBoard_get_pieces;
+
+/* "nonaga_board.pxd":5
+ * # Occupancy grid: axial (q, r) coordinates wrapped onto a GRID_SIZE x GRID_SIZE torus.
+ * # The 19 tiles of the island never span half of GRID_SIZE, so wrapped cells never alias each other.
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     GRID_BITS = 6
+ *     GRID_SIZE = 64
+*/
+enum  {
+  __pyx_e_12nonaga_board_GRID_BITS = 6,
+  __pyx_e_12nonaga_board_GRID_SIZE = 64,
+  __pyx_e_12nonaga_board_GRID_MASK = 63,
+  __pyx_e_12nonaga_board_GRID_CELLS = 0x1000,
+  __pyx_e_12nonaga_board_MAX_PIECE_MOVES = 18,
+  __pyx_e_12nonaga_board_MAX_ISLAND_TILES = 19
+};
+
+/* "nonaga_board.pxd":13
+ *     MAX_ISLAND_TILES = 19   # all the tiles of the game
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     CELL_EMPTY = 0
+ *     CELL_TILE = 1
+*/
+enum  {
+  __pyx_e_12nonaga_board_CELL_EMPTY = 0,
+  __pyx_e_12nonaga_board_CELL_TILE = 1,
+  __pyx_e_12nonaga_board_CELL_PIECE = 2
+};
+
+/* "nonaga_board.pxd":112
+ *     cpdef bint is_there_tile(self, tuple position)
+ *     cpdef bint is_there_piece(self, tuple position)
+ *     cpdef get_pieces(self, color=*)             # <<<<<<<<<<<<<<
+ *     cdef void _fill_cells(self)
+ *     cdef int fill_piece_moves(self, int color, int* moves) noexcept nogil
+*/
+struct __pyx_opt_args_12nonaga_board_11NonagaBoard_get_pieces {
+  int __pyx_n;
+  PyObject *color;
+};
+struct __pyx_t_15nonaga_position_Position;
+
+/* "nonaga_position.pxd":5
+ * from nonaga_logic cimport NonagaLogic
+ * 
+ * cdef enum:             # <<<<<<<<<<<<<<
+ *     POSITION_TILES = 19         # tiles of a Nonaga island
+ *     POSITION_PIECES = 6
+*/
+enum  {
+
+  /* "nonaga_position.pxd":9
+ *     POSITION_PIECES = 6
+ *     # every movable tile to every empty cell next to the island
+ *     MAX_TILE_MOVES = POSITION_TILES * 6 * POSITION_TILES             # <<<<<<<<<<<<<<
+ *     NUM_COST_FEATURES = 8       # the terms weighted by the 8 parameters of AI.cost_function
+ * 
+*/
+  __pyx_e_15nonaga_position_POSITION_TILES = 19,
+  __pyx_e_15nonaga_position_POSITION_PIECES = 6,
+  __pyx_e_15nonaga_position_MAX_TILE_MOVES = ((__pyx_e_15nonaga_position_POSITION_TILES * 6) * __pyx_e_15nonaga_position_POSITION_TILES),
+  __pyx_e_15nonaga_position_NUM_COST_FEATURES = 8
+};
+
+/* "nonaga_position.pxd":15
+ * # Copy of a game position in plain C data, so that it can be played on without the GIL.
+ * # Coordinates are the real (q, r) ones; cells is the occupancy grid of NonagaBoard.
+ * cdef struct Position:             # <<<<<<<<<<<<<<
+ *     unsigned char cells[GRID_CELLS]
+ *     int num_tiles
+*/
+struct __pyx_t_15nonaga_position_Position {
+  unsigned char cells[__pyx_e_12nonaga_board_GRID_CELLS];
+  int num_tiles;
+  int tile_cells[__pyx_e_15nonaga_position_POSITION_TILES];
+  int tile_q[__pyx_e_15nonaga_position_POSITION_TILES];
+  int tile_r[__pyx_e_15nonaga_position_POSITION_TILES];
+  int num_pieces;
+  int piece_cells[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int piece_colors[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int piece_q[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int piece_r[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int current_player;
+  int turn_phase;
+};
+
+/* "nonaga_board.pxd":48
+ * 
+ * 
+ * cdef class NonagaTilesCoordinates:             # <<<<<<<<<<<<<<
+ *     cdef public int q, r, s
+ *     cdef public object island_id
+*/
+struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates *__pyx_vtab;
+  int q;
+  int r;
+  int s;
+  PyObject *island_id;
+};
+
+
+/* "nonaga_board.pxd":57
+ * 
+ * 
+ * cdef class NonagaTile(NonagaTilesCoordinates):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+*/
+struct __pyx_obj_12nonaga_board_NonagaTile {
+  struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates __pyx_base;
+};
+
+
+/* "nonaga_board.pxd":61
+ * 
+ * 
+ * cdef class NonagaPiece(NonagaTile):             # <<<<<<<<<<<<<<
+ *     cdef public int color
+ * 
+*/
+struct __pyx_obj_12nonaga_board_NonagaPiece {
+  struct __pyx_obj_12nonaga_board_NonagaTile __pyx_base;
+  int color;
+};
+
+
+/* "nonaga_board.pxd":68
+ * 
+ * 
+ * cdef class NonagaIsland:             # <<<<<<<<<<<<<<
+ *     cdef public int id
+ *     cdef public set movable_tiles, unmovable_tiles, all_tiles, border_tiles, pieces
+*/
+struct __pyx_obj_12nonaga_board_NonagaIsland {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_board_NonagaIsland *__pyx_vtab;
+  int id;
+  PyObject *movable_tiles;
+  PyObject *unmovable_tiles;
+  PyObject *all_tiles;
+  PyObject *border_tiles;
+  PyObject *pieces;
+  PyObject *frontier;
+  unsigned char occupied[__pyx_e_12nonaga_board_GRID_CELLS];
+  unsigned char neighbor_masks[__pyx_e_12nonaga_board_GRID_CELLS];
+  unsigned char articulation[__pyx_e_12nonaga_board_GRID_CELLS];
+  int _tile_cells[(3 * __pyx_e_12nonaga_board_MAX_ISLAND_TILES)];
+  int _cut[__pyx_e_12nonaga_board_MAX_ISLAND_TILES];
+  PyObject *_saved;
+};
+
+
+/* "nonaga_board.pxd":98
+ * 
+ * 
+ * cdef class NonagaBoard:             # <<<<<<<<<<<<<<
+ *     cdef public dict islands
+ *     cdef public list pieces, tiles
+*/
+struct __pyx_obj_12nonaga_board_NonagaBoard {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_board_NonagaBoard *__pyx_vtab;
+  PyObject *islands;
+  PyObject *pieces;
+  PyObject *tiles;
+  unsigned char cells[__pyx_e_12nonaga_board_GRID_CELLS];
+  int piece_cells[6];
+  int piece_colors[6];
+  int num_pieces;
+};
+
+
+/* "nonaga_logic.pxd":4
+ * from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaTile, NonagaPiece, MAX_PIECE_MOVES
+ * 
+ * cdef class NonagaLogic:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public object player_red, player_black
+*/
+struct __pyx_obj_12nonaga_logic_NonagaLogic {
+  PyObject_HEAD
+  struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic *__pyx_vtab;
+  PyObject *player_red;
+  PyObject *player_black;
+  struct __pyx_obj_12nonaga_board_NonagaBoard *board;
+  int current_player;
+  int turn_phase;
+  PyObject *change_feed;
+  PyObject *pieces_by_color;
+  int piece_distances[2][3];
+};
+
+
+
+/* "nonaga_board.pxd":48
+ * 
+ * 
+ * cdef class NonagaTilesCoordinates:             # <<<<<<<<<<<<<<
+ *     cdef public int q, r, s
+ *     cdef public object island_id
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates {
+  PyObject *(*get_island_id)(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, int __pyx_skip_dispatch);
+  PyObject *(*get_position)(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, int __pyx_skip_dispatch);
+  int (*distance_to)(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates *__pyx_vtabptr_12nonaga_board_NonagaTilesCoordinates;
+
+
+/* "nonaga_board.pxd":57
+ * 
+ * 
+ * cdef class NonagaTile(NonagaTilesCoordinates):             # <<<<<<<<<<<<<<
+ *     pass
+ * 
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaTile {
+  struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates __pyx_base;
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaTile *__pyx_vtabptr_12nonaga_board_NonagaTile;
+
+
+/* "nonaga_board.pxd":61
+ * 
+ * 
+ * cdef class NonagaPiece(NonagaTile):             # <<<<<<<<<<<<<<
+ *     cdef public int color
+ * 
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaPiece {
+  struct __pyx_vtabstruct_12nonaga_board_NonagaTile __pyx_base;
+  int (*get_color)(struct __pyx_obj_12nonaga_board_NonagaPiece *, int __pyx_skip_dispatch);
+  void (*set_color)(struct __pyx_obj_12nonaga_board_NonagaPiece *, int, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaPiece *__pyx_vtabptr_12nonaga_board_NonagaPiece;
+
+
+/* "nonaga_board.pxd":68
+ * 
+ * 
+ * cdef class NonagaIsland:             # <<<<<<<<<<<<<<
+ *     cdef public int id
+ *     cdef public set movable_tiles, unmovable_tiles, all_tiles, border_tiles, pieces
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaIsland {
+  int (*get_id)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  int (*get_number_of_tiles)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_tiles)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  PyObject *(*get_movable_tiles)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  PyObject *(*get_pieces)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int __pyx_skip_dispatch);
+  void (*_add_tile)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *);
+  void (*_clear)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  void (*_save)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  void (*_restore)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  PyObject *(*_update_articulation)(struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  PyObject *(*_articulation_after_move)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int, int, int, int);
+  void (*_place_in_frontier)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int);
+  void (*_lift_from_frontier)(struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int);
+  int (*_mask_without_tile)(struct __pyx_obj_12nonaga_board_NonagaIsland *, PyObject *, int, struct __pyx_obj_12nonaga_board_NonagaTile *);
+  PyObject *(*valid_tile_destinations)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *, int __pyx_skip_dispatch);
+  PyObject *(*ordered_tile_destinations)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *);
+  int (*is_valid_tile_destination)(struct __pyx_obj_12nonaga_board_NonagaIsland *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaIsland *__pyx_vtabptr_12nonaga_board_NonagaIsland;
+
+
+/* "nonaga_board.pxd":98
+ * 
+ * 
+ * cdef class NonagaBoard:             # <<<<<<<<<<<<<<
+ *     cdef public dict islands
+ *     cdef public list pieces, tiles
+*/
+
+struct __pyx_vtabstruct_12nonaga_board_NonagaBoard {
+  PyObject *(*_initialize_board)(struct __pyx_obj_12nonaga_board_NonagaBoard *);
+  void (*_set_content)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, PyObject *);
+  struct __pyx_obj_12nonaga_board_NonagaPiece *(*get_piece)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  struct __pyx_obj_12nonaga_board_NonagaTile *(*get_tile)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  int (*is_there_tile)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  int (*is_there_piece)(struct __pyx_obj_12nonaga_board_NonagaBoard *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*get_pieces)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int __pyx_skip_dispatch, struct __pyx_opt_args_12nonaga_board_11NonagaBoard_get_pieces *__pyx_optional_args);
+  void (*_fill_cells)(struct __pyx_obj_12nonaga_board_NonagaBoard *);
+  int (*fill_piece_moves)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int, int *);
+  struct __pyx_obj_12nonaga_board_NonagaPiece *(*get_piece_at_cell)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int);
+  PyObject *(*cell_position)(struct __pyx_obj_12nonaga_board_NonagaBoard *, int, int, int);
+};
+static struct __pyx_vtabstruct_12nonaga_board_NonagaBoard *__pyx_vtabptr_12nonaga_board_NonagaBoard;
+
+
+/* "nonaga_logic.pxd":4
+ * from nonaga_board cimport NonagaBoard, NonagaIsland, NonagaTile, NonagaPiece, MAX_PIECE_MOVES
+ * 
+ * cdef class NonagaLogic:             # <<<<<<<<<<<<<<
+ * 
+ *     cdef public object player_red, player_black
+*/
+
+struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic {
+  PyObject *(*get_board_state)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_valid_tile_moves_ai)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  PyObject *(*get_all_valid_tile_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  PyObject *(*get_all_valid_piece_moves_ai)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  PyObject *(*get_all_valid_piece_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  PyObject *(*is_ai_player)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int);
+  PyObject *(*_get_valid_tile_positions)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, struct __pyx_obj_12nonaga_board_NonagaIsland *);
+  int (*is_valid_tile_destination)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *, int __pyx_skip_dispatch);
+  PyObject *(*_get_valid_piece_moves_in_direction)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaPiece *, struct __pyx_obj_12nonaga_board_NonagaIsland *, int, int);
+  void (*move_tile)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *, int __pyx_skip_dispatch);
+  void (*move_piece)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaPiece *, PyObject *, int __pyx_skip_dispatch);
+  void (*undo_tile_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaTile *, PyObject *);
+  void (*undo_piece_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, struct __pyx_obj_12nonaga_board_NonagaPiece *, PyObject *);
+  void (*_next_turn_phase)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  void (*_last_turn_phase)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  int (*get_current_turn_phase)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  void (*_track_pieces)(struct __pyx_obj_12nonaga_logic_NonagaLogic *);
+  void (*_update_piece_distances)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int);
+  int (*check_win_condition)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  int (*may_connect_in_one_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  PyObject *(*_winning_piece_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int);
+  PyObject *(*get_winning_piece_moves)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  int (*has_winning_piece_move)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int, int __pyx_skip_dispatch);
+  int (*get_current_player)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+  void (*switch_player)(struct __pyx_obj_12nonaga_logic_NonagaLogic *, int __pyx_skip_dispatch);
+};
+static struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic *__pyx_vtabptr_12nonaga_logic_NonagaLogic;
+/* #### Code section: utility_code_proto ### */
+
+/* --- Runtime support code (head) --- */
+/* Refnanny.proto */
+#ifndef CYTHON_REFNANNY
+  #define CYTHON_REFNANNY 0
+#endif
+#if CYTHON_REFNANNY
+  typedef struct {
+    void (*INCREF)(void*, PyObject*, Py_ssize_t);
+    void (*DECREF)(void*, PyObject*, Py_ssize_t);
+    void (*GOTREF)(void*, PyObject*, Py_ssize_t);
+    void (*GIVEREF)(void*, PyObject*, Py_ssize_t);
+    void* (*SetupContext)(const char*, Py_ssize_t, const char*);
+    void (*FinishContext)(void**);
+  } __Pyx_RefNannyAPIStruct;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNanny = NULL;
+  static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname);
+  #define __Pyx_RefNannyDeclarations void *__pyx_refnanny = NULL;
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)\
+          if (acquire_gil) {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+              PyGILState_Release(__pyx_gilstate_save);\
+          } else {\
+              __pyx_refnanny = __Pyx_RefNanny->SetupContext((name), (__LINE__), (__FILE__));\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContextNogil() {\
+              PyGILState_STATE __pyx_gilstate_save = PyGILState_Ensure();\
+              __Pyx_RefNannyFinishContext();\
+              PyGILState_Release(__pyx_gilstate_save);\
+          }
+  #define __Pyx_RefNannyFinishContext()\
+          __Pyx_RefNanny->FinishContext(&__pyx_refnanny)
+  #define __Pyx_INCREF(r)  __Pyx_RefNanny->INCREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_DECREF(r)  __Pyx_RefNanny->DECREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GOTREF(r)  __Pyx_RefNanny->GOTREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_GIVEREF(r) __Pyx_RefNanny->GIVEREF(__pyx_refnanny, (PyObject *)(r), (__LINE__))
+  #define __Pyx_XINCREF(r)  do { if((r) == NULL); else {__Pyx_INCREF(r); }} while(0)
+  #define __Pyx_XDECREF(r)  do { if((r) == NULL); else {__Pyx_DECREF(r); }} while(0)
+  #define __Pyx_XGOTREF(r)  do { if((r) == NULL); else {__Pyx_GOTREF(r); }} while(0)
+  #define __Pyx_XGIVEREF(r) do { if((r) == NULL); else {__Pyx_GIVEREF(r);}} while(0)
+#else
+  #define __Pyx_RefNannyDeclarations
+  #define __Pyx_RefNannySetupContext(name, acquire_gil)
+  #define __Pyx_RefNannyFinishContextNogil()
+  #define __Pyx_RefNannyFinishContext()
+  #define __Pyx_INCREF(r) Py_INCREF(r)
+  #define __Pyx_DECREF(r) Py_DECREF(r)
+  #define __Pyx_GOTREF(r)
+  #define __Pyx_GIVEREF(r)
+  #define __Pyx_XINCREF(r) Py_XINCREF(r)
+  #define __Pyx_XDECREF(r) Py_XDECREF(r)
+  #define __Pyx_XGOTREF(r)
+  #define __Pyx_XGIVEREF(r)
+#endif
+#define __Pyx_Py_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; Py_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_XDECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_XDECREF(tmp);\
+    } while (0)
+#define __Pyx_DECREF_SET(r, v) do {\
+        PyObject *tmp = (PyObject *) r;\
+        r = v; __Pyx_DECREF(tmp);\
+    } while (0)
+#define __Pyx_CLEAR(r)    do { PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);} while(0)
+#define __Pyx_XCLEAR(r)   do { if((r) != NULL) {PyObject* tmp = ((PyObject*)(r)); r = NULL; __Pyx_DECREF(tmp);}} while(0)
+
+/* DivInt[long].proto */
+static CYTHON_INLINE long __Pyx_div_long(long, long, int b_is_constant);
+
+/* ErrOccurredWithGIL.proto */
+static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void);
+
+/* PyThreadStateGet.proto (used by PyErrFetchRestore) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyThreadState_declare  PyThreadState *__pyx_tstate;
+#define __Pyx_PyThreadState_assign  __pyx_tstate = __Pyx_PyThreadState_Current;
+#if PY_VERSION_HEX >= 0x030C00A6
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->current_exception != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->current_exception ? (PyObject*) Py_TYPE(__pyx_tstate->current_exception) : (PyObject*) NULL)
+#else
+#define __Pyx_PyErr_Occurred()  (__pyx_tstate->curexc_type != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  (__pyx_tstate->curexc_type)
+#endif
+#else
+#define __Pyx_PyThreadState_declare
+#define __Pyx_PyThreadState_assign
+#define __Pyx_PyErr_Occurred()  (PyErr_Occurred() != NULL)
+#define __Pyx_PyErr_CurrentExceptionType()  PyErr_Occurred()
+#endif
+
+/* PyErrFetchRestore.proto (used by WriteUnraisableException) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_Clear() __Pyx_ErrRestore(NULL, NULL, NULL)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  __Pyx_ErrRestoreInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)    __Pyx_ErrFetchInState(PyThreadState_GET(), type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  __Pyx_ErrRestoreInState(__pyx_tstate, type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)    __Pyx_ErrFetchInState(__pyx_tstate, type, value, tb)
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb);
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb);
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A6
+#define __Pyx_PyErr_SetNone(exc) (Py_INCREF(exc), __Pyx_ErrRestore((exc), NULL, NULL))
+#else
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#endif
+#else
+#define __Pyx_PyErr_Clear() PyErr_Clear()
+#define __Pyx_PyErr_SetNone(exc) PyErr_SetNone(exc)
+#define __Pyx_ErrRestoreWithState(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchWithState(type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestoreInState(tstate, type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetchInState(tstate, type, value, tb)  PyErr_Fetch(type, value, tb)
+#define __Pyx_ErrRestore(type, value, tb)  PyErr_Restore(type, value, tb)
+#define __Pyx_ErrFetch(type, value, tb)  PyErr_Fetch(type, value, tb)
+#endif
+
+/* WriteUnraisableException.proto */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil);
+
+/* PyValueError_Check.proto */
+#define __Pyx_PyExc_ValueError_Check(obj)  __Pyx_TypeCheck(obj, PyExc_ValueError)
+
+/* PyObjectCall.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw);
+#else
+#define __Pyx_PyObject_Call(func, arg, kw) PyObject_Call(func, arg, kw)
+#endif
+
+/* PyObjectCallMethO.proto (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg);
+#endif
+
+/* PyObjectFastCall.proto */
+#define __Pyx_PyObject_FastCall(func, args, nargs)  __Pyx_PyObject_FastCallDict(func, args, (size_t)(nargs), NULL)
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs);
+
+/* RaiseException.export */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause);
+
+/* ModInt[long].proto */
+static CYTHON_INLINE long __Pyx_mod_long(long, long, int b_is_constant);
+
+/* FunctionExport.proto */
+static int __Pyx_ExportFunction(PyObject *api_dict, const char *name, void (*f)(void), const char *sig);
+
+/* GetApiDict.proto */
+static PyObject *__Pyx_ApiExport_GetApiDict(void);
+
+/* IncludeStringH.proto */
+#include <string.h>
+
+/* TypeImport.proto */
+#ifndef __PYX_HAVE_RT_ImportType_proto_3_2_4
+#define __PYX_HAVE_RT_ImportType_proto_3_2_4
+#if defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L
+#include <stdalign.h>
+#endif
+#if (defined (__STDC_VERSION__) && __STDC_VERSION__ >= 201112L) || __cplusplus >= 201103L
+#define __PYX_GET_STRUCT_ALIGNMENT_3_2_4(s) alignof(s)
+#else
+#define __PYX_GET_STRUCT_ALIGNMENT_3_2_4(s) sizeof(void*)
+#endif
+enum __Pyx_ImportType_CheckSize_3_2_4 {
+   __Pyx_ImportType_CheckSize_Error_3_2_4 = 0,
+   __Pyx_ImportType_CheckSize_Warn_3_2_4 = 1,
+   __Pyx_ImportType_CheckSize_Ignore_3_2_4 = 2
+};
+static PyTypeObject *__Pyx_ImportType_3_2_4(PyObject* module, const char *module_name, const char *class_name, size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_2_4 check_size);
+#endif
+
+/* GetVTable.proto */
+static void* __Pyx_GetVtable(PyTypeObject *type);
+
+/* FunctionImport.proto */
+static int __Pyx_ImportFunction_3_2_4(PyObject *module, const char *funcname, void (**f)(void), const char *sig);
+
+/* PyErrExceptionMatches.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+#define __Pyx_PyErr_ExceptionMatches(err) __Pyx_PyErr_ExceptionMatchesInState(__pyx_tstate, err)
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err);
+#else
+#define __Pyx_PyErr_ExceptionMatches(err)  PyErr_ExceptionMatches(err)
+#endif
+
+/* PyObjectGetAttrStr.proto (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name);
+#else
+#define __Pyx_PyObject_GetAttrStr(o,n) PyObject_GetAttr(o,n)
+#endif
+
+/* PyObjectGetAttrStrNoError.proto (used by HasAttr) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name);
+
+/* HasAttr.proto (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_HasAttr(o, n)  PyObject_HasAttrWithError(o, n)
+#else
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *, PyObject *);
+#endif
+
+/* PyObjectCallOneArg.proto (used by ImportImpl) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg);
+
+/* TupleAndListFromArray.proto (used by ImportImpl) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON || CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject* __Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n);
+#endif
+
+/* ImportImpl.export */
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level);
+
+/* Import.proto */
+static CYTHON_INLINE PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level);
+
+/* ImportFrom.proto */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name);
+
+/* GetBuiltinName.proto (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name);
+
+/* PyDictVersioning.proto (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+#define __PYX_DICT_VERSION_INIT  ((PY_UINT64_T) -1)
+#define __PYX_GET_DICT_VERSION(dict)  (((PyDictObject*)(dict))->ma_version_tag)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)\
+    (version_var) = __PYX_GET_DICT_VERSION(dict);\
+    (cache_var) = (value);
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP) {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    if (likely(__PYX_GET_DICT_VERSION(DICT) == __pyx_dict_version)) {\
+        (VAR) = __Pyx_XNewRef(__pyx_dict_cached_value);\
+    } else {\
+        (VAR) = __pyx_dict_cached_value = (LOOKUP);\
+        __pyx_dict_version = __PYX_GET_DICT_VERSION(DICT);\
+    }\
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj);
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj);
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version);
+#else
+#define __PYX_GET_DICT_VERSION(dict)  (0)
+#define __PYX_UPDATE_DICT_CACHE(dict, value, cache_var, version_var)
+#define __PYX_PY_DICT_LOOKUP_IF_MODIFIED(VAR, DICT, LOOKUP)  (VAR) = (LOOKUP);
+#endif
+
+/* GetModuleGlobalName.proto */
+#if CYTHON_USE_DICT_VERSIONS
+#define __Pyx_GetModuleGlobalName(var, name)  do {\
+    static PY_UINT64_T __pyx_dict_version = 0;\
+    static PyObject *__pyx_dict_cached_value = NULL;\
+    (var) = (likely(__pyx_dict_version == __PYX_GET_DICT_VERSION(__pyx_mstate_global->__pyx_d))) ?\
+        (likely(__pyx_dict_cached_value) ? __Pyx_NewRef(__pyx_dict_cached_value) : __Pyx_GetBuiltinName(name)) :\
+        __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  do {\
+    PY_UINT64_T __pyx_dict_version;\
+    PyObject *__pyx_dict_cached_value;\
+    (var) = __Pyx__GetModuleGlobalName(name, &__pyx_dict_version, &__pyx_dict_cached_value);\
+} while(0)
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value);
+#else
+#define __Pyx_GetModuleGlobalName(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+#define __Pyx_GetModuleGlobalNameUncached(var, name)  (var) = __Pyx__GetModuleGlobalName(name)
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name);
+#endif
+
+/* dict_setdefault.proto (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value);
+
+/* CLineInTraceback.proto (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line);
+#else
+#define __Pyx_CLineForTraceback(tstate, c_line)  (((CYTHON_CLINE_IN_TRACEBACK)) ? c_line : 0)
+#endif
+
+/* CodeObjectCache.proto (used by AddTraceback) */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject __Pyx_CachedCodeObjectType;
+#else
+typedef PyCodeObject __Pyx_CachedCodeObjectType;
+#endif
+typedef struct {
+    __Pyx_CachedCodeObjectType* code_object;
+    int code_line;
+} __Pyx_CodeObjectCacheEntry;
+struct __Pyx_CodeObjectCache {
+    int count;
+    int max_count;
+    __Pyx_CodeObjectCacheEntry* entries;
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_int_type accessor_count;
+  #endif
+};
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line);
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line);
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object);
+
+/* AddTraceback.proto */
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename);
+
+/* GCCDiagnostics.proto */
+#if !defined(__INTEL_COMPILER) && defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 6))
+#define __Pyx_HAS_GCC_DIAGNOSTIC
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *);
+
+/* PyObjectVectorCallKwBuilder.proto (used by CIntToPy) */
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#if CYTHON_VECTORCALL
+#if PY_VERSION_HEX >= 0x03090000
+#define __Pyx_Object_Vectorcall_CallFromBuilder PyObject_Vectorcall
+#else
+#define __Pyx_Object_Vectorcall_CallFromBuilder _PyObject_Vectorcall
+#endif
+#define __Pyx_MakeVectorcallBuilderKwds(n) PyTuple_New(n)
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n);
+#else
+#define __Pyx_Object_Vectorcall_CallFromBuilder __Pyx_PyObject_FastCallDict
+#define __Pyx_MakeVectorcallBuilderKwds(n) __Pyx_PyDict_NewPresized(n)
+#define __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n) PyDict_SetItem(builder, key, value)
+#define __Pyx_VectorcallBuilder_AddArgStr(key, value, builder, args, n) PyDict_SetItemString(builder, key, value)
+#endif
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value);
+
+/* CIntToPy.proto */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value);
+
+/* FormatTypeName.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+typedef PyObject *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%U"
+#define __Pyx_DECREF_TypeName(obj) Py_XDECREF(obj)
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+#define __Pyx_PyType_GetFullyQualifiedName PyType_GetFullyQualifiedName
+#else
+static __Pyx_TypeName __Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp);
+#endif
+#else  // !LIMITED_API
+typedef const char *__Pyx_TypeName;
+#define __Pyx_FMT_TYPENAME "%.200s"
+#define __Pyx_PyType_GetFullyQualifiedName(tp) ((tp)->tp_name)
+#define __Pyx_DECREF_TypeName(obj)
+#endif
+
+/* CIntFromPy.proto */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *);
+
+/* FastTypeChecks.proto */
+#if CYTHON_COMPILING_IN_CPYTHON
+#define __Pyx_TypeCheck(obj, type) __Pyx_IsSubtype(Py_TYPE(obj), (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) __Pyx_IsAnySubtype2(Py_TYPE(obj), (PyTypeObject *)type1, (PyTypeObject *)type2)
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject *type);
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2);
+#else
+#define __Pyx_TypeCheck(obj, type) PyObject_TypeCheck(obj, (PyTypeObject *)type)
+#define __Pyx_TypeCheck2(obj, type1, type2) (PyObject_TypeCheck(obj, (PyTypeObject *)type1) || PyObject_TypeCheck(obj, (PyTypeObject *)type2))
+#define __Pyx_PyErr_GivenExceptionMatches(err, type) PyErr_GivenExceptionMatches(err, type)
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *type1, PyObject *type2) {
+    return PyErr_GivenExceptionMatches(err, type1) || PyErr_GivenExceptionMatches(err, type2);
+}
+#endif
+#define __Pyx_PyErr_ExceptionMatches2(err1, err2)  __Pyx_PyErr_GivenExceptionMatches2(__Pyx_PyErr_CurrentExceptionType(), err1, err2)
+#define __Pyx_PyException_Check(obj) __Pyx_TypeCheck(obj, PyExc_Exception)
+#ifdef PyExceptionInstance_Check
+  #define __Pyx_PyBaseException_Check(obj) PyExceptionInstance_Check(obj)
+#else
+  #define __Pyx_PyBaseException_Check(obj) __Pyx_TypeCheck(obj, PyExc_BaseException)
+#endif
+
+/* GetRuntimeVersion.proto */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+static unsigned long __Pyx_cached_runtime_version = 0;
+static void __Pyx_init_runtime_version(void);
+#else
+#define __Pyx_init_runtime_version()
+#endif
+static unsigned long __Pyx_get_runtime_version(void);
+
+/* AddModuleRef.proto */
+#if ((CYTHON_COMPILING_IN_CPYTHON_FREETHREADING ) ||\
+     __PYX_LIMITED_VERSION_HEX < 0x030d0000)
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name);
+#else
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#endif
+
+/* CheckBinaryVersion.proto */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer);
+
+/* DecompressString.proto */
+static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo);
+
+/* MultiPhaseInitModuleState.proto */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+static PyObject *__Pyx_State_FindModule(void*);
+static int __Pyx_State_AddModule(PyObject* module, void*);
+static int __Pyx_State_RemoveModule(void*);
+#elif CYTHON_USE_MODULE_STATE
+#define __Pyx_State_FindModule PyState_FindModule
+#define __Pyx_State_AddModule PyState_AddModule
+#define __Pyx_State_RemoveModule PyState_RemoveModule
+#endif
+
+/* #### Code section: module_declarations ### */
+/* CythonABIVersion.proto */
+#if CYTHON_COMPILING_IN_LIMITED_API
+    #if CYTHON_METH_FASTCALL
+        #define __PYX_FASTCALL_ABI_SUFFIX  "_fastcall"
+    #else
+        #define __PYX_FASTCALL_ABI_SUFFIX
+    #endif
+    #define __PYX_LIMITED_ABI_SUFFIX "limited" __PYX_FASTCALL_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#else
+    #define __PYX_LIMITED_ABI_SUFFIX
+#endif
+#if __PYX_HAS_PY_AM_SEND == 1
+    #define __PYX_AM_SEND_ABI_SUFFIX
+#elif __PYX_HAS_PY_AM_SEND == 2
+    #define __PYX_AM_SEND_ABI_SUFFIX "amsendbackport"
+#else
+    #define __PYX_AM_SEND_ABI_SUFFIX "noamsend"
+#endif
+#ifndef __PYX_MONITORING_ABI_SUFFIX
+    #define __PYX_MONITORING_ABI_SUFFIX
+#endif
+#if CYTHON_USE_TP_FINALIZE
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX
+#else
+    #define __PYX_TP_FINALIZE_ABI_SUFFIX "nofinalize"
+#endif
+#if CYTHON_USE_FREELISTS || !defined(__Pyx_AsyncGen_USED)
+    #define __PYX_FREELISTS_ABI_SUFFIX
+#else
+    #define __PYX_FREELISTS_ABI_SUFFIX "nofreelists"
+#endif
+#define CYTHON_ABI  __PYX_ABI_VERSION __PYX_LIMITED_ABI_SUFFIX __PYX_MONITORING_ABI_SUFFIX __PYX_TP_FINALIZE_ABI_SUFFIX __PYX_FREELISTS_ABI_SUFFIX __PYX_AM_SEND_ABI_SUFFIX
+#define __PYX_ABI_MODULE_NAME "_cython_" CYTHON_ABI
+#define __PYX_TYPE_MODULE_PREFIX __PYX_ABI_MODULE_NAME "."
+
+
+/* Module declarations from "nonaga_board" */
+static CYTHON_INLINE int __pyx_f_12nonaga_board_cell_index(int, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_12nonaga_board_unwrap_coordinate(int, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_12nonaga_board_encode_piece_move(int, int); /*proto*/
+static CYTHON_INLINE int __pyx_f_12nonaga_board_piece_move_from(int); /*proto*/
+static CYTHON_INLINE int __pyx_f_12nonaga_board_piece_move_to(int); /*proto*/
+static int (*__pyx_f_12nonaga_board_step_cell)(int, int); /*proto*/
+static int (*__pyx_f_12nonaga_board_neighbor_mask)(unsigned char const *, int); /*proto*/
+static int (*__pyx_f_12nonaga_board_is_movable_tile)(int); /*proto*/
+static int (*__pyx_f_12nonaga_board_is_valid_tile_destination_mask)(int); /*proto*/
+static void (*__pyx_f_12nonaga_board_articulation_tiles)(unsigned char const *, int const *, int, int *, int *, int *); /*proto*/
+static int (*__pyx_f_12nonaga_board_slide_moves)(unsigned char const *, int const *, int const *, int, int, int *); /*proto*/
+
+/* Module declarations from "nonaga_logic" */
+
+/* Module declarations from "libc.string" */
+
+/* Module declarations from "nonaga_position" */
+static int __pyx_v_15nonaga_position__PIECE_TO_MOVE;
+static int __pyx_v_15nonaga_position__TILE_TO_MOVE;
+static void __pyx_f_15nonaga_position_set_position(struct __pyx_t_15nonaga_position_Position *, int, int const *, int const *, int, int const *, int const *, int const *, int, int); /*proto*/
+static void __pyx_f_15nonaga_position_position_features(struct __pyx_t_15nonaga_position_Position const *, int, int *); /*proto*/
+static void __pyx_f_15nonaga_position_cost_features(struct __pyx_t_15nonaga_position_Position const *, int, int *); /*proto*/
+static CYTHON_INLINE int __pyx_f_15nonaga_position__hex_distance(int, int, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_15nonaga_position__next_phase(struct __pyx_t_15nonaga_position_Position *); /*proto*/
+static CYTHON_INLINE void __pyx_f_15nonaga_position__last_phase(struct __pyx_t_15nonaga_position_Position *); /*proto*/
+static CYTHON_INLINE void __pyx_f_15nonaga_position__slide(struct __pyx_t_15nonaga_position_Position *, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_15nonaga_position__carry(struct __pyx_t_15nonaga_position_Position *, int, int); /*proto*/
+static CYTHON_INLINE void __pyx_f_15nonaga_position__pieces_of(struct __pyx_t_15nonaga_position_Position const *, int, int *); /*proto*/
+static CYTHON_INLINE int __pyx_f_15nonaga_position__connects(struct __pyx_t_15nonaga_position_Position const *, int const *, int); /*proto*/
+/* #### Code section: typeinfo ### */
+/* #### Code section: before_global_var ### */
+#define __Pyx_MODULE_NAME "nonaga_position"
+extern int __pyx_module_is_main_nonaga_position;
+int __pyx_module_is_main_nonaga_position = 0;
+
+/* Implementation of "nonaga_position" */
+/* #### Code section: global_var ### */
+/* #### Code section: string_decls ### */
+/* #### Code section: decls ### */
+/* #### Code section: late_includes ### */
+/* #### Code section: module_state ### */
+/* SmallCodeConfig */
+#ifndef CYTHON_SMALL_CODE
+#if defined(__clang__)
+    #define CYTHON_SMALL_CODE
+#elif defined(__GNUC__) && (__GNUC__ > 4 || (__GNUC__ == 4 && __GNUC_MINOR__ >= 3))
+    #define CYTHON_SMALL_CODE __attribute__((cold))
+#else
+    #define CYTHON_SMALL_CODE
+#endif
+#endif
+
+typedef struct {
+  PyObject *__pyx_d;
+  PyObject *__pyx_b;
+  PyObject *__pyx_cython_runtime;
+  PyObject *__pyx_empty_tuple;
+  PyObject *__pyx_empty_bytes;
+  PyObject *__pyx_empty_unicode;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaTilesCoordinates;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaTile;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaPiece;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaIsland;
+  PyTypeObject *__pyx_ptype_12nonaga_board_NonagaBoard;
+  PyTypeObject *__pyx_ptype_12nonaga_logic_NonagaLogic;
+  PyObject *__pyx_string_tab[17];
+/* #### Code section: module_state_contents ### */
+/* CodeObjectCache.module_state_decls */
+struct __Pyx_CodeObjectCache __pyx_code_cache;
+
+/* #### Code section: module_state_end ### */
+} __pyx_mstatetype;
+
+#if CYTHON_USE_MODULE_STATE
+#ifdef __cplusplus
+namespace {
+extern struct PyModuleDef __pyx_moduledef;
+} /* anonymous namespace */
+#else
+static struct PyModuleDef __pyx_moduledef;
+#endif
+
+#define __pyx_mstate_global (__Pyx_PyModule_GetState(__Pyx_State_FindModule(&__pyx_moduledef)))
+
+#define __pyx_m (__Pyx_State_FindModule(&__pyx_moduledef))
+#else
+static __pyx_mstatetype __pyx_mstate_global_static =
+#ifdef __cplusplus
+    {};
+#else
+    {0};
+#endif
+static __pyx_mstatetype * const __pyx_mstate_global = &__pyx_mstate_global_static;
+#endif
+/* #### Code section: constant_name_defines ### */
+#define __pyx_kp_u_ __pyx_string_tab[0]
+#define __pyx_kp_u_Too_many_tiles_or_pieces_for_a_P __pyx_string_tab[1]
+#define __pyx_kp_u__2 __pyx_string_tab[2]
+#define __pyx_n_u_PIECE_TO_MOVE __pyx_string_tab[3]
+#define __pyx_n_u_TILE_TO_MOVE __pyx_string_tab[4]
+#define __pyx_n_u_cline_in_traceback __pyx_string_tab[5]
+#define __pyx_n_u_main __pyx_string_tab[6]
+#define __pyx_n_u_module __pyx_string_tab[7]
+#define __pyx_n_u_name __pyx_string_tab[8]
+#define __pyx_n_u_nonaga_constants __pyx_string_tab[9]
+#define __pyx_n_u_pyx_capi __pyx_string_tab[10]
+#define __pyx_n_u_pyx_vtable __pyx_string_tab[11]
+#define __pyx_n_u_qualname __pyx_string_tab[12]
+#define __pyx_n_u_setdefault __pyx_string_tab[13]
+#define __pyx_n_u_test __pyx_string_tab[14]
+#define __pyx_kp_b_PyObject_struct___pyx_t_15nonaga __pyx_string_tab[15]
+#define __pyx_kp_b_int_int_int_int_int_int_unsigned __pyx_string_tab[16]
+/* #### Code section: module_state_clear ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_clear(PyObject *m) {
+  __pyx_mstatetype *clear_module_state = __Pyx_PyModule_GetState(m);
+  if (!clear_module_state) return 0;
+  Py_CLEAR(clear_module_state->__pyx_d);
+  Py_CLEAR(clear_module_state->__pyx_b);
+  Py_CLEAR(clear_module_state->__pyx_cython_runtime);
+  Py_CLEAR(clear_module_state->__pyx_empty_tuple);
+  Py_CLEAR(clear_module_state->__pyx_empty_bytes);
+  Py_CLEAR(clear_module_state->__pyx_empty_unicode);
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __Pyx_State_RemoveModule(NULL);
+  #endif
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaTile);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaPiece);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaIsland);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_board_NonagaBoard);
+  Py_CLEAR(clear_module_state->__pyx_ptype_12nonaga_logic_NonagaLogic);
+  for (int i=0; i<17; ++i) { Py_CLEAR(clear_module_state->__pyx_string_tab[i]); }
+/* #### Code section: module_state_clear_contents ### */
+/* #### Code section: module_state_clear_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_state_traverse ### */
+#if CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __pyx_m_traverse(PyObject *m, visitproc visit, void *arg) {
+  __pyx_mstatetype *traverse_module_state = __Pyx_PyModule_GetState(m);
+  if (!traverse_module_state) return 0;
+  Py_VISIT(traverse_module_state->__pyx_d);
+  Py_VISIT(traverse_module_state->__pyx_b);
+  Py_VISIT(traverse_module_state->__pyx_cython_runtime);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_tuple);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_bytes);
+  __Pyx_VISIT_CONST(traverse_module_state->__pyx_empty_unicode);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaTile);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaPiece);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaIsland);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_board_NonagaBoard);
+  Py_VISIT(traverse_module_state->__pyx_ptype_12nonaga_logic_NonagaLogic);
+  for (int i=0; i<17; ++i) { __Pyx_VISIT_CONST(traverse_module_state->__pyx_string_tab[i]); }
+/* #### Code section: module_state_traverse_contents ### */
+/* #### Code section: module_state_traverse_end ### */
+return 0;
+}
+#endif
+/* #### Code section: module_code ### */
+
+/* "nonaga_board.pxd":19
+ * 
+ * 
+ * cdef inline int cell_index(int q, int r) nogil:             # <<<<<<<<<<<<<<
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_cell_index(int __pyx_v_q, int __pyx_v_r) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":20
+ * 
+ * cdef inline int cell_index(int q, int r) nogil:
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:
+*/
+  __pyx_r = (((__pyx_v_q & __pyx_e_12nonaga_board_GRID_MASK) << __pyx_e_12nonaga_board_GRID_BITS) | (__pyx_v_r & __pyx_e_12nonaga_board_GRID_MASK));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":19
+ * 
+ * 
+ * cdef inline int cell_index(int q, int r) nogil:             # <<<<<<<<<<<<<<
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":22
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:             # <<<<<<<<<<<<<<
+ *     """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+ *     return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_unwrap_coordinate(int __pyx_v_wrapped, int __pyx_v_reference) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":24
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:
+ *     """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+ *     return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2             # <<<<<<<<<<<<<<
+ * 
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+*/
+  __pyx_r = ((__pyx_v_reference + (((__pyx_v_wrapped - __pyx_v_reference) + __Pyx_div_long(__pyx_e_12nonaga_board_GRID_SIZE, 2, 1)) & __pyx_e_12nonaga_board_GRID_MASK)) - __Pyx_div_long(__pyx_e_12nonaga_board_GRID_SIZE, 2, 1));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":22
+ *     return ((q & GRID_MASK) << GRID_BITS) | (r & GRID_MASK)
+ * 
+ * cdef inline int unwrap_coordinate(int wrapped, int reference) nogil:             # <<<<<<<<<<<<<<
+ *     """Real coordinate congruent to *wrapped* that lies closest to *reference*."""
+ *     return reference + ((wrapped - reference + GRID_SIZE // 2) & GRID_MASK) - GRID_SIZE // 2
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":27
+ * 
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+ * cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:             # <<<<<<<<<<<<<<
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_encode_piece_move(int __pyx_v_from_cell, int __pyx_v_to_cell) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":28
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+ * cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int piece_move_from(int move) nogil:
+*/
+  __pyx_r = ((__pyx_v_from_cell << (2 * __pyx_e_12nonaga_board_GRID_BITS)) | __pyx_v_to_cell);
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":27
+ * 
+ * # Piece moves are encoded as a single int holding the origin and destination cells
+ * cdef inline int encode_piece_move(int from_cell, int to_cell) nogil:             # <<<<<<<<<<<<<<
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":30
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+ * cdef inline int piece_move_from(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move >> (2 * GRID_BITS)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_piece_move_from(int __pyx_v_move) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":31
+ * 
+ * cdef inline int piece_move_from(int move) nogil:
+ *     return move >> (2 * GRID_BITS)             # <<<<<<<<<<<<<<
+ * 
+ * cdef inline int piece_move_to(int move) nogil:
+*/
+  __pyx_r = (__pyx_v_move >> (2 * __pyx_e_12nonaga_board_GRID_BITS));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":30
+ *     return (from_cell << (2 * GRID_BITS)) | to_cell
+ * 
+ * cdef inline int piece_move_from(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move >> (2 * GRID_BITS)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_board.pxd":33
+ *     return move >> (2 * GRID_BITS)
+ * 
+ * cdef inline int piece_move_to(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move & (GRID_CELLS - 1)
+ * 
+*/
+
+static CYTHON_INLINE int __pyx_f_12nonaga_board_piece_move_to(int __pyx_v_move) {
+  int __pyx_r;
+
+  /* "nonaga_board.pxd":34
+ * 
+ * cdef inline int piece_move_to(int move) nogil:
+ *     return move & (GRID_CELLS - 1)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = (__pyx_v_move & (__pyx_e_12nonaga_board_GRID_CELLS - 1));
+  goto __pyx_L0;
+
+  /* "nonaga_board.pxd":33
+ *     return move >> (2 * GRID_BITS)
+ * 
+ * cdef inline int piece_move_to(int move) nogil:             # <<<<<<<<<<<<<<
+ *     return move & (GRID_CELLS - 1)
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":17
+ * 
+ * 
+ * cdef inline int _hex_distance(int q1, int r1, int q2, int r2) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int dq = q1 - q2
+ *     cdef int dr = r1 - r2
+*/
+
+static CYTHON_INLINE int __pyx_f_15nonaga_position__hex_distance(int __pyx_v_q1, int __pyx_v_r1, int __pyx_v_q2, int __pyx_v_r2) {
+  int __pyx_v_dq;
+  int __pyx_v_dr;
+  int __pyx_v_ds;
+  int __pyx_r;
+  int __pyx_t_1;
+
+  /* "nonaga_position.pyx":18
+ * 
+ * cdef inline int _hex_distance(int q1, int r1, int q2, int r2) noexcept nogil:
+ *     cdef int dq = q1 - q2             # <<<<<<<<<<<<<<
+ *     cdef int dr = r1 - r2
+ *     cdef int ds = dq + dr
+*/
+  __pyx_v_dq = (__pyx_v_q1 - __pyx_v_q2);
+
+  /* "nonaga_position.pyx":19
+ * cdef inline int _hex_distance(int q1, int r1, int q2, int r2) noexcept nogil:
+ *     cdef int dq = q1 - q2
+ *     cdef int dr = r1 - r2             # <<<<<<<<<<<<<<
+ *     cdef int ds = dq + dr
+ *     if dq < 0: dq = -dq
+*/
+  __pyx_v_dr = (__pyx_v_r1 - __pyx_v_r2);
+
+  /* "nonaga_position.pyx":20
+ *     cdef int dq = q1 - q2
+ *     cdef int dr = r1 - r2
+ *     cdef int ds = dq + dr             # <<<<<<<<<<<<<<
+ *     if dq < 0: dq = -dq
+ *     if dr < 0: dr = -dr
+*/
+  __pyx_v_ds = (__pyx_v_dq + __pyx_v_dr);
+
+  /* "nonaga_position.pyx":21
+ *     cdef int dr = r1 - r2
+ *     cdef int ds = dq + dr
+ *     if dq < 0: dq = -dq             # <<<<<<<<<<<<<<
+ *     if dr < 0: dr = -dr
+ *     if ds < 0: ds = -ds
+*/
+  __pyx_t_1 = (__pyx_v_dq < 0);
+  if (__pyx_t_1) {
+    __pyx_v_dq = (-__pyx_v_dq);
+  }
+
+  /* "nonaga_position.pyx":22
+ *     cdef int ds = dq + dr
+ *     if dq < 0: dq = -dq
+ *     if dr < 0: dr = -dr             # <<<<<<<<<<<<<<
+ *     if ds < 0: ds = -ds
+ *     return (dq + dr + ds) // 2
+*/
+  __pyx_t_1 = (__pyx_v_dr < 0);
+  if (__pyx_t_1) {
+    __pyx_v_dr = (-__pyx_v_dr);
+  }
+
+  /* "nonaga_position.pyx":23
+ *     if dq < 0: dq = -dq
+ *     if dr < 0: dr = -dr
+ *     if ds < 0: ds = -ds             # <<<<<<<<<<<<<<
+ *     return (dq + dr + ds) // 2
+ * 
+*/
+  __pyx_t_1 = (__pyx_v_ds < 0);
+  if (__pyx_t_1) {
+    __pyx_v_ds = (-__pyx_v_ds);
+  }
+
+  /* "nonaga_position.pyx":24
+ *     if dr < 0: dr = -dr
+ *     if ds < 0: ds = -ds
+ *     return (dq + dr + ds) // 2             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = __Pyx_div_long(((__pyx_v_dq + __pyx_v_dr) + __pyx_v_ds), 2, 1);
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":17
+ * 
+ * 
+ * cdef inline int _hex_distance(int q1, int r1, int q2, int r2) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int dq = q1 - q2
+ *     cdef int dr = r1 - r2
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":27
+ * 
+ * 
+ * cdef void set_position(Position* position, int num_tiles, const int* tile_q, const int* tile_r,             # <<<<<<<<<<<<<<
+ *                        int num_pieces, const int* piece_q, const int* piece_r, const int* piece_colors,
+ *                        int current_player, int turn_phase) noexcept nogil:
+*/
+
+static void __pyx_f_15nonaga_position_set_position(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_num_tiles, int const *__pyx_v_tile_q, int const *__pyx_v_tile_r, int __pyx_v_num_pieces, int const *__pyx_v_piece_q, int const *__pyx_v_piece_r, int const *__pyx_v_piece_colors, int __pyx_v_current_player, int __pyx_v_turn_phase) {
+  int __pyx_v_i;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":32
+ *     """Fill a position from its coordinates; at most POSITION_TILES tiles and POSITION_PIECES pieces."""
+ *     cdef int i
+ *     memset(position.cells, CELL_EMPTY, GRID_CELLS)             # <<<<<<<<<<<<<<
+ *     position.num_tiles = num_tiles
+ *     for i in range(num_tiles):
+*/
+  (void)(memset(__pyx_v_position->cells, __pyx_e_12nonaga_board_CELL_EMPTY, __pyx_e_12nonaga_board_GRID_CELLS));
+
+  /* "nonaga_position.pyx":33
+ *     cdef int i
+ *     memset(position.cells, CELL_EMPTY, GRID_CELLS)
+ *     position.num_tiles = num_tiles             # <<<<<<<<<<<<<<
+ *     for i in range(num_tiles):
+ *         position.tile_q[i] = tile_q[i]
+*/
+  __pyx_v_position->num_tiles = __pyx_v_num_tiles;
+
+  /* "nonaga_position.pyx":34
+ *     memset(position.cells, CELL_EMPTY, GRID_CELLS)
+ *     position.num_tiles = num_tiles
+ *     for i in range(num_tiles):             # <<<<<<<<<<<<<<
+ *         position.tile_q[i] = tile_q[i]
+ *         position.tile_r[i] = tile_r[i]
+*/
+  __pyx_t_1 = __pyx_v_num_tiles;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":35
+ *     position.num_tiles = num_tiles
+ *     for i in range(num_tiles):
+ *         position.tile_q[i] = tile_q[i]             # <<<<<<<<<<<<<<
+ *         position.tile_r[i] = tile_r[i]
+ *         position.tile_cells[i] = cell_index(tile_q[i], tile_r[i])
+*/
+    (__pyx_v_position->tile_q[__pyx_v_i]) = (__pyx_v_tile_q[__pyx_v_i]);
+
+    /* "nonaga_position.pyx":36
+ *     for i in range(num_tiles):
+ *         position.tile_q[i] = tile_q[i]
+ *         position.tile_r[i] = tile_r[i]             # <<<<<<<<<<<<<<
+ *         position.tile_cells[i] = cell_index(tile_q[i], tile_r[i])
+ *         position.cells[position.tile_cells[i]] = CELL_TILE
+*/
+    (__pyx_v_position->tile_r[__pyx_v_i]) = (__pyx_v_tile_r[__pyx_v_i]);
+
+    /* "nonaga_position.pyx":37
+ *         position.tile_q[i] = tile_q[i]
+ *         position.tile_r[i] = tile_r[i]
+ *         position.tile_cells[i] = cell_index(tile_q[i], tile_r[i])             # <<<<<<<<<<<<<<
+ *         position.cells[position.tile_cells[i]] = CELL_TILE
+ *     position.num_pieces = num_pieces
+*/
+    __pyx_t_4 = __pyx_f_12nonaga_board_cell_index((__pyx_v_tile_q[__pyx_v_i]), (__pyx_v_tile_r[__pyx_v_i])); if (unlikely(__pyx_t_4 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 37, __pyx_L1_error)
+    (__pyx_v_position->tile_cells[__pyx_v_i]) = __pyx_t_4;
+
+    /* "nonaga_position.pyx":38
+ *         position.tile_r[i] = tile_r[i]
+ *         position.tile_cells[i] = cell_index(tile_q[i], tile_r[i])
+ *         position.cells[position.tile_cells[i]] = CELL_TILE             # <<<<<<<<<<<<<<
+ *     position.num_pieces = num_pieces
+ *     for i in range(num_pieces):
+*/
+    (__pyx_v_position->cells[(__pyx_v_position->tile_cells[__pyx_v_i])]) = __pyx_e_12nonaga_board_CELL_TILE;
+  }
+
+  /* "nonaga_position.pyx":39
+ *         position.tile_cells[i] = cell_index(tile_q[i], tile_r[i])
+ *         position.cells[position.tile_cells[i]] = CELL_TILE
+ *     position.num_pieces = num_pieces             # <<<<<<<<<<<<<<
+ *     for i in range(num_pieces):
+ *         position.piece_q[i] = piece_q[i]
+*/
+  __pyx_v_position->num_pieces = __pyx_v_num_pieces;
+
+  /* "nonaga_position.pyx":40
+ *         position.cells[position.tile_cells[i]] = CELL_TILE
+ *     position.num_pieces = num_pieces
+ *     for i in range(num_pieces):             # <<<<<<<<<<<<<<
+ *         position.piece_q[i] = piece_q[i]
+ *         position.piece_r[i] = piece_r[i]
+*/
+  __pyx_t_1 = __pyx_v_num_pieces;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":41
+ *     position.num_pieces = num_pieces
+ *     for i in range(num_pieces):
+ *         position.piece_q[i] = piece_q[i]             # <<<<<<<<<<<<<<
+ *         position.piece_r[i] = piece_r[i]
+ *         position.piece_colors[i] = piece_colors[i]
+*/
+    (__pyx_v_position->piece_q[__pyx_v_i]) = (__pyx_v_piece_q[__pyx_v_i]);
+
+    /* "nonaga_position.pyx":42
+ *     for i in range(num_pieces):
+ *         position.piece_q[i] = piece_q[i]
+ *         position.piece_r[i] = piece_r[i]             # <<<<<<<<<<<<<<
+ *         position.piece_colors[i] = piece_colors[i]
+ *         position.piece_cells[i] = cell_index(piece_q[i], piece_r[i])
+*/
+    (__pyx_v_position->piece_r[__pyx_v_i]) = (__pyx_v_piece_r[__pyx_v_i]);
+
+    /* "nonaga_position.pyx":43
+ *         position.piece_q[i] = piece_q[i]
+ *         position.piece_r[i] = piece_r[i]
+ *         position.piece_colors[i] = piece_colors[i]             # <<<<<<<<<<<<<<
+ *         position.piece_cells[i] = cell_index(piece_q[i], piece_r[i])
+ *         position.cells[position.piece_cells[i]] = CELL_PIECE
+*/
+    (__pyx_v_position->piece_colors[__pyx_v_i]) = (__pyx_v_piece_colors[__pyx_v_i]);
+
+    /* "nonaga_position.pyx":44
+ *         position.piece_r[i] = piece_r[i]
+ *         position.piece_colors[i] = piece_colors[i]
+ *         position.piece_cells[i] = cell_index(piece_q[i], piece_r[i])             # <<<<<<<<<<<<<<
+ *         position.cells[position.piece_cells[i]] = CELL_PIECE
+ *     position.current_player = current_player
+*/
+    __pyx_t_4 = __pyx_f_12nonaga_board_cell_index((__pyx_v_piece_q[__pyx_v_i]), (__pyx_v_piece_r[__pyx_v_i])); if (unlikely(__pyx_t_4 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 44, __pyx_L1_error)
+    (__pyx_v_position->piece_cells[__pyx_v_i]) = __pyx_t_4;
+
+    /* "nonaga_position.pyx":45
+ *         position.piece_colors[i] = piece_colors[i]
+ *         position.piece_cells[i] = cell_index(piece_q[i], piece_r[i])
+ *         position.cells[position.piece_cells[i]] = CELL_PIECE             # <<<<<<<<<<<<<<
+ *     position.current_player = current_player
+ *     position.turn_phase = turn_phase
+*/
+    (__pyx_v_position->cells[(__pyx_v_position->piece_cells[__pyx_v_i])]) = __pyx_e_12nonaga_board_CELL_PIECE;
+  }
+
+  /* "nonaga_position.pyx":46
+ *         position.piece_cells[i] = cell_index(piece_q[i], piece_r[i])
+ *         position.cells[position.piece_cells[i]] = CELL_PIECE
+ *     position.current_player = current_player             # <<<<<<<<<<<<<<
+ *     position.turn_phase = turn_phase
+ * 
+*/
+  __pyx_v_position->current_player = __pyx_v_current_player;
+
+  /* "nonaga_position.pyx":47
+ *         position.cells[position.piece_cells[i]] = CELL_PIECE
+ *     position.current_player = current_player
+ *     position.turn_phase = turn_phase             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_v_position->turn_phase = __pyx_v_turn_phase;
+
+  /* "nonaga_position.pyx":27
+ * 
+ * 
+ * cdef void set_position(Position* position, int num_tiles, const int* tile_q, const int* tile_r,             # <<<<<<<<<<<<<<
+ *                        int num_pieces, const int* piece_q, const int* piece_r, const int* piece_colors,
+ *                        int current_player, int turn_phase) noexcept nogil:
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.set_position", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":50
+ * 
+ * 
+ * cdef void load_position(Position* position, NonagaLogic game) except *:             # <<<<<<<<<<<<<<
+ *     """Copy the position of a game; it must have at most POSITION_TILES tiles and POSITION_PIECES pieces."""
+ *     cdef NonagaBoard board = game.board
+*/
+
+static void __pyx_f_15nonaga_position_load_position(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, struct __pyx_obj_12nonaga_logic_NonagaLogic *__pyx_v_game) {
+  struct __pyx_obj_12nonaga_board_NonagaBoard *__pyx_v_board = 0;
+  struct __pyx_obj_12nonaga_board_NonagaTile *__pyx_v_tile = 0;
+  struct __pyx_obj_12nonaga_board_NonagaPiece *__pyx_v_piece = 0;
+  int __pyx_v_tile_q[__pyx_e_15nonaga_position_POSITION_TILES];
+  int __pyx_v_tile_r[__pyx_e_15nonaga_position_POSITION_TILES];
+  int __pyx_v_piece_q[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int __pyx_v_piece_r[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int __pyx_v_piece_colors[__pyx_e_15nonaga_position_POSITION_PIECES];
+  int __pyx_v_i;
+  __Pyx_RefNannyDeclarations
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_t_2;
+  Py_ssize_t __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  size_t __pyx_t_6;
+  Py_ssize_t __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("load_position", 0);
+
+  /* "nonaga_position.pyx":52
+ * cdef void load_position(Position* position, NonagaLogic game) except *:
+ *     """Copy the position of a game; it must have at most POSITION_TILES tiles and POSITION_PIECES pieces."""
+ *     cdef NonagaBoard board = game.board             # <<<<<<<<<<<<<<
+ *     cdef NonagaTile tile
+ *     cdef NonagaPiece piece
+*/
+  __pyx_t_1 = ((PyObject *)__pyx_v_game->board);
+  __Pyx_INCREF(__pyx_t_1);
+  __pyx_v_board = ((struct __pyx_obj_12nonaga_board_NonagaBoard *)__pyx_t_1);
+  __pyx_t_1 = 0;
+
+  /* "nonaga_position.pyx":61
+ *     cdef int piece_colors[POSITION_PIECES]
+ *     cdef int i
+ *     if len(board.tiles) > POSITION_TILES or len(board.pieces) > POSITION_PIECES:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Too many tiles or pieces for a Position.")
+ *     for i in range(len(board.tiles)):
+*/
+  __pyx_t_1 = __pyx_v_board->tiles;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 61, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = (__pyx_t_3 > __pyx_e_15nonaga_position_POSITION_TILES);
+  if (!__pyx_t_4) {
+  } else {
+    __pyx_t_2 = __pyx_t_4;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_1 = __pyx_v_board->pieces;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 61, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 61, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_4 = (__pyx_t_3 > __pyx_e_15nonaga_position_POSITION_PIECES);
+  __pyx_t_2 = __pyx_t_4;
+  __pyx_L4_bool_binop_done:;
+  if (unlikely(__pyx_t_2)) {
+
+    /* "nonaga_position.pyx":62
+ *     cdef int i
+ *     if len(board.tiles) > POSITION_TILES or len(board.pieces) > POSITION_PIECES:
+ *         raise ValueError("Too many tiles or pieces for a Position.")             # <<<<<<<<<<<<<<
+ *     for i in range(len(board.tiles)):
+ *         tile = <NonagaTile>board.tiles[i]
+*/
+    __pyx_t_5 = NULL;
+    __pyx_t_6 = 1;
+    {
+      PyObject *__pyx_callargs[2] = {__pyx_t_5, __pyx_mstate_global->__pyx_kp_u_Too_many_tiles_or_pieces_for_a_P};
+      __pyx_t_1 = __Pyx_PyObject_FastCall((PyObject*)(((PyTypeObject*)PyExc_ValueError)), __pyx_callargs+__pyx_t_6, (2-__pyx_t_6) | (__pyx_t_6*__Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET));
+      __Pyx_XDECREF(__pyx_t_5); __pyx_t_5 = 0;
+      if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 62, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_1);
+    }
+    __Pyx_Raise(__pyx_t_1, 0, 0, 0);
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+    __PYX_ERR(0, 62, __pyx_L1_error)
+
+    /* "nonaga_position.pyx":61
+ *     cdef int piece_colors[POSITION_PIECES]
+ *     cdef int i
+ *     if len(board.tiles) > POSITION_TILES or len(board.pieces) > POSITION_PIECES:             # <<<<<<<<<<<<<<
+ *         raise ValueError("Too many tiles or pieces for a Position.")
+ *     for i in range(len(board.tiles)):
+*/
+  }
+
+  /* "nonaga_position.pyx":63
+ *     if len(board.tiles) > POSITION_TILES or len(board.pieces) > POSITION_PIECES:
+ *         raise ValueError("Too many tiles or pieces for a Position.")
+ *     for i in range(len(board.tiles)):             # <<<<<<<<<<<<<<
+ *         tile = <NonagaTile>board.tiles[i]
+ *         tile_q[i] = tile.q
+*/
+  __pyx_t_1 = __pyx_v_board->tiles;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 63, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 63, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __pyx_t_3;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "nonaga_position.pyx":64
+ *         raise ValueError("Too many tiles or pieces for a Position.")
+ *     for i in range(len(board.tiles)):
+ *         tile = <NonagaTile>board.tiles[i]             # <<<<<<<<<<<<<<
+ *         tile_q[i] = tile.q
+ *         tile_r[i] = tile.r
+*/
+    if (unlikely(__pyx_v_board->tiles == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 64, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_PyList_GET_ITEM(__pyx_v_board->tiles, __pyx_v_i);
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_tile, ((struct __pyx_obj_12nonaga_board_NonagaTile *)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "nonaga_position.pyx":65
+ *     for i in range(len(board.tiles)):
+ *         tile = <NonagaTile>board.tiles[i]
+ *         tile_q[i] = tile.q             # <<<<<<<<<<<<<<
+ *         tile_r[i] = tile.r
+ *     for i in range(len(board.pieces)):
+*/
+    __pyx_t_9 = __pyx_v_tile->__pyx_base.q;
+    (__pyx_v_tile_q[__pyx_v_i]) = __pyx_t_9;
+
+    /* "nonaga_position.pyx":66
+ *         tile = <NonagaTile>board.tiles[i]
+ *         tile_q[i] = tile.q
+ *         tile_r[i] = tile.r             # <<<<<<<<<<<<<<
+ *     for i in range(len(board.pieces)):
+ *         piece = <NonagaPiece>board.pieces[i]
+*/
+    __pyx_t_9 = __pyx_v_tile->__pyx_base.r;
+    (__pyx_v_tile_r[__pyx_v_i]) = __pyx_t_9;
+  }
+
+  /* "nonaga_position.pyx":67
+ *         tile_q[i] = tile.q
+ *         tile_r[i] = tile.r
+ *     for i in range(len(board.pieces)):             # <<<<<<<<<<<<<<
+ *         piece = <NonagaPiece>board.pieces[i]
+ *         piece_q[i] = piece.q
+*/
+  __pyx_t_1 = __pyx_v_board->pieces;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 67, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 67, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_7 = __pyx_t_3;
+  for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+    __pyx_v_i = __pyx_t_8;
+
+    /* "nonaga_position.pyx":68
+ *         tile_r[i] = tile.r
+ *     for i in range(len(board.pieces)):
+ *         piece = <NonagaPiece>board.pieces[i]             # <<<<<<<<<<<<<<
+ *         piece_q[i] = piece.q
+ *         piece_r[i] = piece.r
+*/
+    if (unlikely(__pyx_v_board->pieces == Py_None)) {
+      PyErr_SetString(PyExc_TypeError, "'NoneType' object is not subscriptable");
+      __PYX_ERR(0, 68, __pyx_L1_error)
+    }
+    __pyx_t_1 = __Pyx_PyList_GET_ITEM(__pyx_v_board->pieces, __pyx_v_i);
+    __Pyx_INCREF(__pyx_t_1);
+    __Pyx_XDECREF_SET(__pyx_v_piece, ((struct __pyx_obj_12nonaga_board_NonagaPiece *)__pyx_t_1));
+    __pyx_t_1 = 0;
+
+    /* "nonaga_position.pyx":69
+ *     for i in range(len(board.pieces)):
+ *         piece = <NonagaPiece>board.pieces[i]
+ *         piece_q[i] = piece.q             # <<<<<<<<<<<<<<
+ *         piece_r[i] = piece.r
+ *         piece_colors[i] = piece.color
+*/
+    __pyx_t_9 = __pyx_v_piece->__pyx_base.__pyx_base.q;
+    (__pyx_v_piece_q[__pyx_v_i]) = __pyx_t_9;
+
+    /* "nonaga_position.pyx":70
+ *         piece = <NonagaPiece>board.pieces[i]
+ *         piece_q[i] = piece.q
+ *         piece_r[i] = piece.r             # <<<<<<<<<<<<<<
+ *         piece_colors[i] = piece.color
+ *     set_position(position, len(board.tiles), tile_q, tile_r, len(board.pieces), piece_q, piece_r, piece_colors,
+*/
+    __pyx_t_9 = __pyx_v_piece->__pyx_base.__pyx_base.r;
+    (__pyx_v_piece_r[__pyx_v_i]) = __pyx_t_9;
+
+    /* "nonaga_position.pyx":71
+ *         piece_q[i] = piece.q
+ *         piece_r[i] = piece.r
+ *         piece_colors[i] = piece.color             # <<<<<<<<<<<<<<
+ *     set_position(position, len(board.tiles), tile_q, tile_r, len(board.pieces), piece_q, piece_r, piece_colors,
+ *                  game.current_player, game.turn_phase)
+*/
+    __pyx_t_9 = __pyx_v_piece->color;
+    (__pyx_v_piece_colors[__pyx_v_i]) = __pyx_t_9;
+  }
+
+  /* "nonaga_position.pyx":72
+ *         piece_r[i] = piece.r
+ *         piece_colors[i] = piece.color
+ *     set_position(position, len(board.tiles), tile_q, tile_r, len(board.pieces), piece_q, piece_r, piece_colors,             # <<<<<<<<<<<<<<
+ *                  game.current_player, game.turn_phase)
+ * 
+*/
+  __pyx_t_1 = __pyx_v_board->tiles;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 72, __pyx_L1_error)
+  }
+  __pyx_t_3 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_3 == ((Py_ssize_t)-1))) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = __pyx_v_board->pieces;
+  __Pyx_INCREF(__pyx_t_1);
+  if (unlikely(__pyx_t_1 == Py_None)) {
+    PyErr_SetString(PyExc_TypeError, "object of type 'NoneType' has no len()");
+    __PYX_ERR(0, 72, __pyx_L1_error)
+  }
+  __pyx_t_7 = __Pyx_PyList_GET_SIZE(__pyx_t_1); if (unlikely(__pyx_t_7 == ((Py_ssize_t)-1))) __PYX_ERR(0, 72, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+
+  /* "nonaga_position.pyx":73
+ *         piece_colors[i] = piece.color
+ *     set_position(position, len(board.tiles), tile_q, tile_r, len(board.pieces), piece_q, piece_r, piece_colors,
+ *                  game.current_player, game.turn_phase)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_f_15nonaga_position_set_position(__pyx_v_position, __pyx_t_3, __pyx_v_tile_q, __pyx_v_tile_r, __pyx_t_7, __pyx_v_piece_q, __pyx_v_piece_r, __pyx_v_piece_colors, __pyx_v_game->current_player, __pyx_v_game->turn_phase);
+
+  /* "nonaga_position.pyx":50
+ * 
+ * 
+ * cdef void load_position(Position* position, NonagaLogic game) except *:             # <<<<<<<<<<<<<<
+ *     """Copy the position of a game; it must have at most POSITION_TILES tiles and POSITION_PIECES pieces."""
+ *     cdef NonagaBoard board = game.board
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_AddTraceback("nonaga_position.load_position", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_L0:;
+  __Pyx_XDECREF((PyObject *)__pyx_v_board);
+  __Pyx_XDECREF((PyObject *)__pyx_v_tile);
+  __Pyx_XDECREF((PyObject *)__pyx_v_piece);
+  __Pyx_RefNannyFinishContext();
+}
+
+/* "nonaga_position.pyx":76
+ * 
+ * 
+ * cdef bint same_position(const Position* a, const Position* b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Same tiles, same pieces of each color and same player and phase to play."""
+ *     cdef int i, j
+*/
+
+static int __pyx_f_15nonaga_position_same_position(struct __pyx_t_15nonaga_position_Position const *__pyx_v_a, struct __pyx_t_15nonaga_position_Position const *__pyx_v_b) {
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_found;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+
+  /* "nonaga_position.pyx":80
+ *     cdef int i, j
+ *     cdef bint found
+ *     if a.current_player != b.current_player or a.turn_phase != b.turn_phase or a.num_pieces != b.num_pieces:             # <<<<<<<<<<<<<<
+ *         return False
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:
+*/
+  __pyx_t_2 = (__pyx_v_a->current_player != __pyx_v_b->current_player);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_a->turn_phase != __pyx_v_b->turn_phase);
+  if (!__pyx_t_2) {
+  } else {
+    __pyx_t_1 = __pyx_t_2;
+    goto __pyx_L4_bool_binop_done;
+  }
+  __pyx_t_2 = (__pyx_v_a->num_pieces != __pyx_v_b->num_pieces);
+  __pyx_t_1 = __pyx_t_2;
+  __pyx_L4_bool_binop_done:;
+  if (__pyx_t_1) {
+
+    /* "nonaga_position.pyx":81
+ *     cdef bint found
+ *     if a.current_player != b.current_player or a.turn_phase != b.turn_phase or a.num_pieces != b.num_pieces:
+ *         return False             # <<<<<<<<<<<<<<
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:
+ *         return False
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "nonaga_position.pyx":80
+ *     cdef int i, j
+ *     cdef bint found
+ *     if a.current_player != b.current_player or a.turn_phase != b.turn_phase or a.num_pieces != b.num_pieces:             # <<<<<<<<<<<<<<
+ *         return False
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:
+*/
+  }
+
+  /* "nonaga_position.pyx":82
+ *     if a.current_player != b.current_player or a.turn_phase != b.turn_phase or a.num_pieces != b.num_pieces:
+ *         return False
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:             # <<<<<<<<<<<<<<
+ *         return False
+ *     for i in range(a.num_pieces):
+*/
+  __pyx_t_1 = (memcmp(__pyx_v_a->cells, __pyx_v_b->cells, __pyx_e_12nonaga_board_GRID_CELLS) != 0);
+  if (__pyx_t_1) {
+
+    /* "nonaga_position.pyx":83
+ *         return False
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:
+ *         return False             # <<<<<<<<<<<<<<
+ *     for i in range(a.num_pieces):
+ *         found = False
+*/
+    __pyx_r = 0;
+    goto __pyx_L0;
+
+    /* "nonaga_position.pyx":82
+ *     if a.current_player != b.current_player or a.turn_phase != b.turn_phase or a.num_pieces != b.num_pieces:
+ *         return False
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:             # <<<<<<<<<<<<<<
+ *         return False
+ *     for i in range(a.num_pieces):
+*/
+  }
+
+  /* "nonaga_position.pyx":84
+ *     if memcmp(a.cells, b.cells, GRID_CELLS) != 0:
+ *         return False
+ *     for i in range(a.num_pieces):             # <<<<<<<<<<<<<<
+ *         found = False
+ *         for j in range(b.num_pieces):
+*/
+  __pyx_t_3 = __pyx_v_a->num_pieces;
+  __pyx_t_4 = __pyx_t_3;
+  for (__pyx_t_5 = 0; __pyx_t_5 < __pyx_t_4; __pyx_t_5+=1) {
+    __pyx_v_i = __pyx_t_5;
+
+    /* "nonaga_position.pyx":85
+ *         return False
+ *     for i in range(a.num_pieces):
+ *         found = False             # <<<<<<<<<<<<<<
+ *         for j in range(b.num_pieces):
+ *             if a.piece_cells[i] == b.piece_cells[j]:
+*/
+    __pyx_v_found = 0;
+
+    /* "nonaga_position.pyx":86
+ *     for i in range(a.num_pieces):
+ *         found = False
+ *         for j in range(b.num_pieces):             # <<<<<<<<<<<<<<
+ *             if a.piece_cells[i] == b.piece_cells[j]:
+ *                 found = a.piece_colors[i] == b.piece_colors[j]
+*/
+    __pyx_t_6 = __pyx_v_b->num_pieces;
+    __pyx_t_7 = __pyx_t_6;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_j = __pyx_t_8;
+
+      /* "nonaga_position.pyx":87
+ *         found = False
+ *         for j in range(b.num_pieces):
+ *             if a.piece_cells[i] == b.piece_cells[j]:             # <<<<<<<<<<<<<<
+ *                 found = a.piece_colors[i] == b.piece_colors[j]
+ *                 break
+*/
+      __pyx_t_1 = ((__pyx_v_a->piece_cells[__pyx_v_i]) == (__pyx_v_b->piece_cells[__pyx_v_j]));
+      if (__pyx_t_1) {
+
+        /* "nonaga_position.pyx":88
+ *         for j in range(b.num_pieces):
+ *             if a.piece_cells[i] == b.piece_cells[j]:
+ *                 found = a.piece_colors[i] == b.piece_colors[j]             # <<<<<<<<<<<<<<
+ *                 break
+ *         if not found:
+*/
+        __pyx_v_found = ((__pyx_v_a->piece_colors[__pyx_v_i]) == (__pyx_v_b->piece_colors[__pyx_v_j]));
+
+        /* "nonaga_position.pyx":89
+ *             if a.piece_cells[i] == b.piece_cells[j]:
+ *                 found = a.piece_colors[i] == b.piece_colors[j]
+ *                 break             # <<<<<<<<<<<<<<
+ *         if not found:
+ *             return False
+*/
+        goto __pyx_L11_break;
+
+        /* "nonaga_position.pyx":87
+ *         found = False
+ *         for j in range(b.num_pieces):
+ *             if a.piece_cells[i] == b.piece_cells[j]:             # <<<<<<<<<<<<<<
+ *                 found = a.piece_colors[i] == b.piece_colors[j]
+ *                 break
+*/
+      }
+    }
+    __pyx_L11_break:;
+
+    /* "nonaga_position.pyx":90
+ *                 found = a.piece_colors[i] == b.piece_colors[j]
+ *                 break
+ *         if not found:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+*/
+    __pyx_t_1 = (!__pyx_v_found);
+    if (__pyx_t_1) {
+
+      /* "nonaga_position.pyx":91
+ *                 break
+ *         if not found:
+ *             return False             # <<<<<<<<<<<<<<
+ *     return True
+ * 
+*/
+      __pyx_r = 0;
+      goto __pyx_L0;
+
+      /* "nonaga_position.pyx":90
+ *                 found = a.piece_colors[i] == b.piece_colors[j]
+ *                 break
+ *         if not found:             # <<<<<<<<<<<<<<
+ *             return False
+ *     return True
+*/
+    }
+  }
+
+  /* "nonaga_position.pyx":92
+ *         if not found:
+ *             return False
+ *     return True             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = 1;
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":76
+ * 
+ * 
+ * cdef bint same_position(const Position* a, const Position* b) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Same tiles, same pieces of each color and same player and phase to play."""
+ *     cdef int i, j
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":96
+ * 
+ * #  moves
+ * cdef int fill_position_piece_moves(const Position* position, int* moves) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Encoded slides of the player to move, see NonagaBoard.fill_piece_moves."""
+ *     return slide_moves(position.cells, position.piece_cells, position.piece_colors,
+*/
+
+static int __pyx_f_15nonaga_position_fill_position_piece_moves(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int *__pyx_v_moves) {
+  int __pyx_r;
+
+  /* "nonaga_position.pyx":98
+ * cdef int fill_position_piece_moves(const Position* position, int* moves) noexcept nogil:
+ *     """Encoded slides of the player to move, see NonagaBoard.fill_piece_moves."""
+ *     return slide_moves(position.cells, position.piece_cells, position.piece_colors,             # <<<<<<<<<<<<<<
+ *                        position.num_pieces, position.current_player, moves)
+ * 
+*/
+  __pyx_r = __pyx_f_12nonaga_board_slide_moves(__pyx_v_position->cells, __pyx_v_position->piece_cells, __pyx_v_position->piece_colors, __pyx_v_position->num_pieces, __pyx_v_position->current_player, __pyx_v_moves);
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":96
+ * 
+ * #  moves
+ * cdef int fill_position_piece_moves(const Position* position, int* moves) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Encoded slides of the player to move, see NonagaBoard.fill_piece_moves."""
+ *     return slide_moves(position.cells, position.piece_cells, position.piece_colors,
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":102
+ * 
+ * 
+ * cdef int fill_position_tile_moves(Position* position, int* moves) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Tile moves of NonagaLogic.get_all_valid_tile_moves, encoded like piece moves by encode_piece_move.
+ * 
+*/
+
+static int __pyx_f_15nonaga_position_fill_position_tile_moves(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int *__pyx_v_moves) {
+  int __pyx_v_frontier[(__pyx_e_15nonaga_position_POSITION_TILES * 6)];
+  int __pyx_v_order[__pyx_e_15nonaga_position_POSITION_TILES];
+  int __pyx_v_low[__pyx_e_15nonaga_position_POSITION_TILES];
+  int __pyx_v_cut[__pyx_e_15nonaga_position_POSITION_TILES];
+  int __pyx_v_num_frontier;
+  int __pyx_v_count;
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_cell;
+  int __pyx_v_origin;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  int __pyx_t_8;
+  int __pyx_t_9;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":115
+ *     cdef int low[POSITION_TILES]
+ *     cdef bint cut[POSITION_TILES]
+ *     cdef int num_frontier = 0, count = 0             # <<<<<<<<<<<<<<
+ *     cdef int i, j, k, cell, origin
+ * 
+*/
+  __pyx_v_num_frontier = 0;
+  __pyx_v_count = 0;
+
+  /* "nonaga_position.pyx":119
+ * 
+ *     # empty cells touching the island, the only candidates, sorted like NonagaIsland.ordered_tile_destinations
+ *     for i in range(position.num_tiles):             # <<<<<<<<<<<<<<
+ *         for k in range(6):
+ *             cell = step_cell(position.tile_cells[i], k)
+*/
+  __pyx_t_1 = __pyx_v_position->num_tiles;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":120
+ *     # empty cells touching the island, the only candidates, sorted like NonagaIsland.ordered_tile_destinations
+ *     for i in range(position.num_tiles):
+ *         for k in range(6):             # <<<<<<<<<<<<<<
+ *             cell = step_cell(position.tile_cells[i], k)
+ *             if position.cells[cell] != CELL_EMPTY:
+*/
+    for (__pyx_t_4 = 0; __pyx_t_4 < 6; __pyx_t_4+=1) {
+      __pyx_v_k = __pyx_t_4;
+
+      /* "nonaga_position.pyx":121
+ *     for i in range(position.num_tiles):
+ *         for k in range(6):
+ *             cell = step_cell(position.tile_cells[i], k)             # <<<<<<<<<<<<<<
+ *             if position.cells[cell] != CELL_EMPTY:
+ *                 continue
+*/
+      __pyx_v_cell = __pyx_f_12nonaga_board_step_cell((__pyx_v_position->tile_cells[__pyx_v_i]), __pyx_v_k);
+
+      /* "nonaga_position.pyx":122
+ *         for k in range(6):
+ *             cell = step_cell(position.tile_cells[i], k)
+ *             if position.cells[cell] != CELL_EMPTY:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             j = num_frontier
+*/
+      __pyx_t_5 = ((__pyx_v_position->cells[__pyx_v_cell]) != __pyx_e_12nonaga_board_CELL_EMPTY);
+      if (__pyx_t_5) {
+
+        /* "nonaga_position.pyx":123
+ *             cell = step_cell(position.tile_cells[i], k)
+ *             if position.cells[cell] != CELL_EMPTY:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             j = num_frontier
+ *             while j > 0 and frontier[j - 1] > cell:
+*/
+        goto __pyx_L5_continue;
+
+        /* "nonaga_position.pyx":122
+ *         for k in range(6):
+ *             cell = step_cell(position.tile_cells[i], k)
+ *             if position.cells[cell] != CELL_EMPTY:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             j = num_frontier
+*/
+      }
+
+      /* "nonaga_position.pyx":124
+ *             if position.cells[cell] != CELL_EMPTY:
+ *                 continue
+ *             j = num_frontier             # <<<<<<<<<<<<<<
+ *             while j > 0 and frontier[j - 1] > cell:
+ *                 j -= 1
+*/
+      __pyx_v_j = __pyx_v_num_frontier;
+
+      /* "nonaga_position.pyx":125
+ *                 continue
+ *             j = num_frontier
+ *             while j > 0 and frontier[j - 1] > cell:             # <<<<<<<<<<<<<<
+ *                 j -= 1
+ *             if j > 0 and frontier[j - 1] == cell:
+*/
+      while (1) {
+        __pyx_t_6 = (__pyx_v_j > 0);
+        if (__pyx_t_6) {
+        } else {
+          __pyx_t_5 = __pyx_t_6;
+          goto __pyx_L10_bool_binop_done;
+        }
+        __pyx_t_6 = ((__pyx_v_frontier[(__pyx_v_j - 1)]) > __pyx_v_cell);
+        __pyx_t_5 = __pyx_t_6;
+        __pyx_L10_bool_binop_done:;
+        if (!__pyx_t_5) break;
+
+        /* "nonaga_position.pyx":126
+ *             j = num_frontier
+ *             while j > 0 and frontier[j - 1] > cell:
+ *                 j -= 1             # <<<<<<<<<<<<<<
+ *             if j > 0 and frontier[j - 1] == cell:
+ *                 continue
+*/
+        __pyx_v_j = (__pyx_v_j - 1);
+      }
+
+      /* "nonaga_position.pyx":127
+ *             while j > 0 and frontier[j - 1] > cell:
+ *                 j -= 1
+ *             if j > 0 and frontier[j - 1] == cell:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))
+*/
+      __pyx_t_6 = (__pyx_v_j > 0);
+      if (__pyx_t_6) {
+      } else {
+        __pyx_t_5 = __pyx_t_6;
+        goto __pyx_L13_bool_binop_done;
+      }
+      __pyx_t_6 = ((__pyx_v_frontier[(__pyx_v_j - 1)]) == __pyx_v_cell);
+      __pyx_t_5 = __pyx_t_6;
+      __pyx_L13_bool_binop_done:;
+      if (__pyx_t_5) {
+
+        /* "nonaga_position.pyx":128
+ *                 j -= 1
+ *             if j > 0 and frontier[j - 1] == cell:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))
+ *             frontier[j] = cell
+*/
+        goto __pyx_L5_continue;
+
+        /* "nonaga_position.pyx":127
+ *             while j > 0 and frontier[j - 1] > cell:
+ *                 j -= 1
+ *             if j > 0 and frontier[j - 1] == cell:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))
+*/
+      }
+
+      /* "nonaga_position.pyx":129
+ *             if j > 0 and frontier[j - 1] == cell:
+ *                 continue
+ *             memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))             # <<<<<<<<<<<<<<
+ *             frontier[j] = cell
+ *             num_frontier += 1
+*/
+      (void)(memmove((&(__pyx_v_frontier[(__pyx_v_j + 1)])), (&(__pyx_v_frontier[__pyx_v_j])), ((__pyx_v_num_frontier - __pyx_v_j) * (sizeof(int)))));
+
+      /* "nonaga_position.pyx":130
+ *                 continue
+ *             memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))
+ *             frontier[j] = cell             # <<<<<<<<<<<<<<
+ *             num_frontier += 1
+ * 
+*/
+      (__pyx_v_frontier[__pyx_v_j]) = __pyx_v_cell;
+
+      /* "nonaga_position.pyx":131
+ *             memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))
+ *             frontier[j] = cell
+ *             num_frontier += 1             # <<<<<<<<<<<<<<
+ * 
+ *     articulation_tiles(position.cells, position.tile_cells, position.num_tiles, order, low, cut)
+*/
+      __pyx_v_num_frontier = (__pyx_v_num_frontier + 1);
+      __pyx_L5_continue:;
+    }
+  }
+
+  /* "nonaga_position.pyx":133
+ *             num_frontier += 1
+ * 
+ *     articulation_tiles(position.cells, position.tile_cells, position.num_tiles, order, low, cut)             # <<<<<<<<<<<<<<
+ *     for i in range(position.num_tiles):
+ *         origin = position.tile_cells[i]
+*/
+  __pyx_f_12nonaga_board_articulation_tiles(__pyx_v_position->cells, __pyx_v_position->tile_cells, __pyx_v_position->num_tiles, __pyx_v_order, __pyx_v_low, __pyx_v_cut);
+
+  /* "nonaga_position.pyx":134
+ * 
+ *     articulation_tiles(position.cells, position.tile_cells, position.num_tiles, order, low, cut)
+ *     for i in range(position.num_tiles):             # <<<<<<<<<<<<<<
+ *         origin = position.tile_cells[i]
+ *         if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):
+*/
+  __pyx_t_1 = __pyx_v_position->num_tiles;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":135
+ *     articulation_tiles(position.cells, position.tile_cells, position.num_tiles, order, low, cut)
+ *     for i in range(position.num_tiles):
+ *         origin = position.tile_cells[i]             # <<<<<<<<<<<<<<
+ *         if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):
+ *             continue
+*/
+    __pyx_v_origin = (__pyx_v_position->tile_cells[__pyx_v_i]);
+
+    /* "nonaga_position.pyx":136
+ *     for i in range(position.num_tiles):
+ *         origin = position.tile_cells[i]
+ *         if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):             # <<<<<<<<<<<<<<
+ *             continue
+ *         position.cells[origin] = CELL_EMPTY
+*/
+    __pyx_t_6 = ((__pyx_v_position->cells[__pyx_v_origin]) != __pyx_e_12nonaga_board_CELL_TILE);
+    if (!__pyx_t_6) {
+    } else {
+      __pyx_t_5 = __pyx_t_6;
+      goto __pyx_L18_bool_binop_done;
+    }
+    if (!(__pyx_v_cut[__pyx_v_i])) {
+    } else {
+      __pyx_t_5 = (__pyx_v_cut[__pyx_v_i]);
+      goto __pyx_L18_bool_binop_done;
+    }
+    __pyx_t_6 = (!__pyx_f_12nonaga_board_is_movable_tile(__pyx_f_12nonaga_board_neighbor_mask(__pyx_v_position->cells, __pyx_v_origin)));
+    __pyx_t_5 = __pyx_t_6;
+    __pyx_L18_bool_binop_done:;
+    if (__pyx_t_5) {
+
+      /* "nonaga_position.pyx":137
+ *         origin = position.tile_cells[i]
+ *         if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):
+ *             continue             # <<<<<<<<<<<<<<
+ *         position.cells[origin] = CELL_EMPTY
+ *         for j in range(num_frontier):
+*/
+      goto __pyx_L15_continue;
+
+      /* "nonaga_position.pyx":136
+ *     for i in range(position.num_tiles):
+ *         origin = position.tile_cells[i]
+ *         if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):             # <<<<<<<<<<<<<<
+ *             continue
+ *         position.cells[origin] = CELL_EMPTY
+*/
+    }
+
+    /* "nonaga_position.pyx":138
+ *         if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):
+ *             continue
+ *         position.cells[origin] = CELL_EMPTY             # <<<<<<<<<<<<<<
+ *         for j in range(num_frontier):
+ *             if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):
+*/
+    (__pyx_v_position->cells[__pyx_v_origin]) = __pyx_e_12nonaga_board_CELL_EMPTY;
+
+    /* "nonaga_position.pyx":139
+ *             continue
+ *         position.cells[origin] = CELL_EMPTY
+ *         for j in range(num_frontier):             # <<<<<<<<<<<<<<
+ *             if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):
+ *                 moves[count] = encode_piece_move(origin, frontier[j])
+*/
+    __pyx_t_4 = __pyx_v_num_frontier;
+    __pyx_t_7 = __pyx_t_4;
+    for (__pyx_t_8 = 0; __pyx_t_8 < __pyx_t_7; __pyx_t_8+=1) {
+      __pyx_v_j = __pyx_t_8;
+
+      /* "nonaga_position.pyx":140
+ *         position.cells[origin] = CELL_EMPTY
+ *         for j in range(num_frontier):
+ *             if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):             # <<<<<<<<<<<<<<
+ *                 moves[count] = encode_piece_move(origin, frontier[j])
+ *                 count += 1
+*/
+      __pyx_t_5 = __pyx_f_12nonaga_board_is_valid_tile_destination_mask(__pyx_f_12nonaga_board_neighbor_mask(__pyx_v_position->cells, (__pyx_v_frontier[__pyx_v_j])));
+      if (__pyx_t_5) {
+
+        /* "nonaga_position.pyx":141
+ *         for j in range(num_frontier):
+ *             if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):
+ *                 moves[count] = encode_piece_move(origin, frontier[j])             # <<<<<<<<<<<<<<
+ *                 count += 1
+ *         position.cells[origin] = CELL_TILE
+*/
+        __pyx_t_9 = __pyx_f_12nonaga_board_encode_piece_move(__pyx_v_origin, (__pyx_v_frontier[__pyx_v_j])); if (unlikely(__pyx_t_9 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 141, __pyx_L1_error)
+        (__pyx_v_moves[__pyx_v_count]) = __pyx_t_9;
+
+        /* "nonaga_position.pyx":142
+ *             if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):
+ *                 moves[count] = encode_piece_move(origin, frontier[j])
+ *                 count += 1             # <<<<<<<<<<<<<<
+ *         position.cells[origin] = CELL_TILE
+ *     return count
+*/
+        __pyx_v_count = (__pyx_v_count + 1);
+
+        /* "nonaga_position.pyx":140
+ *         position.cells[origin] = CELL_EMPTY
+ *         for j in range(num_frontier):
+ *             if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):             # <<<<<<<<<<<<<<
+ *                 moves[count] = encode_piece_move(origin, frontier[j])
+ *                 count += 1
+*/
+      }
+    }
+
+    /* "nonaga_position.pyx":143
+ *                 moves[count] = encode_piece_move(origin, frontier[j])
+ *                 count += 1
+ *         position.cells[origin] = CELL_TILE             # <<<<<<<<<<<<<<
+ *     return count
+ * 
+*/
+    (__pyx_v_position->cells[__pyx_v_origin]) = __pyx_e_12nonaga_board_CELL_TILE;
+    __pyx_L15_continue:;
+  }
+
+  /* "nonaga_position.pyx":144
+ *                 count += 1
+ *         position.cells[origin] = CELL_TILE
+ *     return count             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = __pyx_v_count;
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":102
+ * 
+ * 
+ * cdef int fill_position_tile_moves(Position* position, int* moves) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Tile moves of NonagaLogic.get_all_valid_tile_moves, encoded like piece moves by encode_piece_move.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.fill_position_tile_moves", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":147
+ * 
+ * 
+ * cdef inline void _next_phase(Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if position.turn_phase == _PIECE_TO_MOVE:
+ *         position.turn_phase = _TILE_TO_MOVE
+*/
+
+static CYTHON_INLINE void __pyx_f_15nonaga_position__next_phase(struct __pyx_t_15nonaga_position_Position *__pyx_v_position) {
+  int __pyx_t_1;
+
+  /* "nonaga_position.pyx":148
+ * 
+ * cdef inline void _next_phase(Position* position) noexcept nogil:
+ *     if position.turn_phase == _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *         position.turn_phase = _TILE_TO_MOVE
+ *     else:
+*/
+  __pyx_t_1 = (__pyx_v_position->turn_phase == __pyx_v_15nonaga_position__PIECE_TO_MOVE);
+  if (__pyx_t_1) {
+
+    /* "nonaga_position.pyx":149
+ * cdef inline void _next_phase(Position* position) noexcept nogil:
+ *     if position.turn_phase == _PIECE_TO_MOVE:
+ *         position.turn_phase = _TILE_TO_MOVE             # <<<<<<<<<<<<<<
+ *     else:
+ *         position.turn_phase = _PIECE_TO_MOVE
+*/
+    __pyx_v_position->turn_phase = __pyx_v_15nonaga_position__TILE_TO_MOVE;
+
+    /* "nonaga_position.pyx":148
+ * 
+ * cdef inline void _next_phase(Position* position) noexcept nogil:
+ *     if position.turn_phase == _PIECE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *         position.turn_phase = _TILE_TO_MOVE
+ *     else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "nonaga_position.pyx":151
+ *         position.turn_phase = _TILE_TO_MOVE
+ *     else:
+ *         position.turn_phase = _PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ *         position.current_player = (position.current_player + 1) % 2
+ * 
+*/
+  /*else*/ {
+    __pyx_v_position->turn_phase = __pyx_v_15nonaga_position__PIECE_TO_MOVE;
+
+    /* "nonaga_position.pyx":152
+ *     else:
+ *         position.turn_phase = _PIECE_TO_MOVE
+ *         position.current_player = (position.current_player + 1) % 2             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+    __pyx_v_position->current_player = __Pyx_mod_long((__pyx_v_position->current_player + 1), 2, 1);
+  }
+  __pyx_L3:;
+
+  /* "nonaga_position.pyx":147
+ * 
+ * 
+ * cdef inline void _next_phase(Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if position.turn_phase == _PIECE_TO_MOVE:
+ *         position.turn_phase = _TILE_TO_MOVE
+*/
+
+  /* function exit code */
+}
+
+/* "nonaga_position.pyx":155
+ * 
+ * 
+ * cdef inline void _last_phase(Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if position.turn_phase == _TILE_TO_MOVE:
+ *         position.turn_phase = _PIECE_TO_MOVE
+*/
+
+static CYTHON_INLINE void __pyx_f_15nonaga_position__last_phase(struct __pyx_t_15nonaga_position_Position *__pyx_v_position) {
+  int __pyx_t_1;
+
+  /* "nonaga_position.pyx":156
+ * 
+ * cdef inline void _last_phase(Position* position) noexcept nogil:
+ *     if position.turn_phase == _TILE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *         position.turn_phase = _PIECE_TO_MOVE
+ *     else:
+*/
+  __pyx_t_1 = (__pyx_v_position->turn_phase == __pyx_v_15nonaga_position__TILE_TO_MOVE);
+  if (__pyx_t_1) {
+
+    /* "nonaga_position.pyx":157
+ * cdef inline void _last_phase(Position* position) noexcept nogil:
+ *     if position.turn_phase == _TILE_TO_MOVE:
+ *         position.turn_phase = _PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ *     else:
+ *         position.turn_phase = _TILE_TO_MOVE
+*/
+    __pyx_v_position->turn_phase = __pyx_v_15nonaga_position__PIECE_TO_MOVE;
+
+    /* "nonaga_position.pyx":156
+ * 
+ * cdef inline void _last_phase(Position* position) noexcept nogil:
+ *     if position.turn_phase == _TILE_TO_MOVE:             # <<<<<<<<<<<<<<
+ *         position.turn_phase = _PIECE_TO_MOVE
+ *     else:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "nonaga_position.pyx":159
+ *         position.turn_phase = _PIECE_TO_MOVE
+ *     else:
+ *         position.turn_phase = _TILE_TO_MOVE             # <<<<<<<<<<<<<<
+ *         position.current_player = (position.current_player + 1) % 2
+ * 
+*/
+  /*else*/ {
+    __pyx_v_position->turn_phase = __pyx_v_15nonaga_position__TILE_TO_MOVE;
+
+    /* "nonaga_position.pyx":160
+ *     else:
+ *         position.turn_phase = _TILE_TO_MOVE
+ *         position.current_player = (position.current_player + 1) % 2             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+    __pyx_v_position->current_player = __Pyx_mod_long((__pyx_v_position->current_player + 1), 2, 1);
+  }
+  __pyx_L3:;
+
+  /* "nonaga_position.pyx":155
+ * 
+ * 
+ * cdef inline void _last_phase(Position* position) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     if position.turn_phase == _TILE_TO_MOVE:
+ *         position.turn_phase = _PIECE_TO_MOVE
+*/
+
+  /* function exit code */
+}
+
+/* "nonaga_position.pyx":163
+ * 
+ * 
+ * cdef inline void _slide(Position* position, int origin, int destination) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(position.num_pieces):
+*/
+
+static CYTHON_INLINE void __pyx_f_15nonaga_position__slide(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_origin, int __pyx_v_destination) {
+  int __pyx_v_i;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":165
+ * cdef inline void _slide(Position* position, int origin, int destination) noexcept nogil:
+ *     cdef int i
+ *     for i in range(position.num_pieces):             # <<<<<<<<<<<<<<
+ *         if position.piece_cells[i] == origin:
+ *             position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])
+*/
+  __pyx_t_1 = __pyx_v_position->num_pieces;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":166
+ *     cdef int i
+ *     for i in range(position.num_pieces):
+ *         if position.piece_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *             position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])
+ *             position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])
+*/
+    __pyx_t_4 = ((__pyx_v_position->piece_cells[__pyx_v_i]) == __pyx_v_origin);
+    if (__pyx_t_4) {
+
+      /* "nonaga_position.pyx":167
+ *     for i in range(position.num_pieces):
+ *         if position.piece_cells[i] == origin:
+ *             position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])             # <<<<<<<<<<<<<<
+ *             position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])
+ *             position.piece_cells[i] = destination
+*/
+      __pyx_t_5 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_v_destination >> __pyx_e_12nonaga_board_GRID_BITS), (__pyx_v_position->piece_q[__pyx_v_i])); if (unlikely(__pyx_t_5 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 167, __pyx_L1_error)
+      (__pyx_v_position->piece_q[__pyx_v_i]) = __pyx_t_5;
+
+      /* "nonaga_position.pyx":168
+ *         if position.piece_cells[i] == origin:
+ *             position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])
+ *             position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])             # <<<<<<<<<<<<<<
+ *             position.piece_cells[i] = destination
+ *             break
+*/
+      __pyx_t_5 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_v_destination & __pyx_e_12nonaga_board_GRID_MASK), (__pyx_v_position->piece_r[__pyx_v_i])); if (unlikely(__pyx_t_5 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 168, __pyx_L1_error)
+      (__pyx_v_position->piece_r[__pyx_v_i]) = __pyx_t_5;
+
+      /* "nonaga_position.pyx":169
+ *             position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])
+ *             position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])
+ *             position.piece_cells[i] = destination             # <<<<<<<<<<<<<<
+ *             break
+ *     position.cells[origin] = CELL_TILE
+*/
+      (__pyx_v_position->piece_cells[__pyx_v_i]) = __pyx_v_destination;
+
+      /* "nonaga_position.pyx":170
+ *             position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])
+ *             position.piece_cells[i] = destination
+ *             break             # <<<<<<<<<<<<<<
+ *     position.cells[origin] = CELL_TILE
+ *     position.cells[destination] = CELL_PIECE
+*/
+      goto __pyx_L4_break;
+
+      /* "nonaga_position.pyx":166
+ *     cdef int i
+ *     for i in range(position.num_pieces):
+ *         if position.piece_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *             position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])
+ *             position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])
+*/
+    }
+  }
+  __pyx_L4_break:;
+
+  /* "nonaga_position.pyx":171
+ *             position.piece_cells[i] = destination
+ *             break
+ *     position.cells[origin] = CELL_TILE             # <<<<<<<<<<<<<<
+ *     position.cells[destination] = CELL_PIECE
+ * 
+*/
+  (__pyx_v_position->cells[__pyx_v_origin]) = __pyx_e_12nonaga_board_CELL_TILE;
+
+  /* "nonaga_position.pyx":172
+ *             break
+ *     position.cells[origin] = CELL_TILE
+ *     position.cells[destination] = CELL_PIECE             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  (__pyx_v_position->cells[__pyx_v_destination]) = __pyx_e_12nonaga_board_CELL_PIECE;
+
+  /* "nonaga_position.pyx":163
+ * 
+ * 
+ * cdef inline void _slide(Position* position, int origin, int destination) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(position.num_pieces):
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position._slide", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":175
+ * 
+ * 
+ * cdef inline void _carry(Position* position, int origin, int destination) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(position.num_tiles):
+*/
+
+static CYTHON_INLINE void __pyx_f_15nonaga_position__carry(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_origin, int __pyx_v_destination) {
+  int __pyx_v_i;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":177
+ * cdef inline void _carry(Position* position, int origin, int destination) noexcept nogil:
+ *     cdef int i
+ *     for i in range(position.num_tiles):             # <<<<<<<<<<<<<<
+ *         if position.tile_cells[i] == origin:
+ *             position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])
+*/
+  __pyx_t_1 = __pyx_v_position->num_tiles;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":178
+ *     cdef int i
+ *     for i in range(position.num_tiles):
+ *         if position.tile_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *             position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])
+ *             position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])
+*/
+    __pyx_t_4 = ((__pyx_v_position->tile_cells[__pyx_v_i]) == __pyx_v_origin);
+    if (__pyx_t_4) {
+
+      /* "nonaga_position.pyx":179
+ *     for i in range(position.num_tiles):
+ *         if position.tile_cells[i] == origin:
+ *             position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])             # <<<<<<<<<<<<<<
+ *             position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])
+ *             position.tile_cells[i] = destination
+*/
+      __pyx_t_5 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_v_destination >> __pyx_e_12nonaga_board_GRID_BITS), (__pyx_v_position->tile_q[__pyx_v_i])); if (unlikely(__pyx_t_5 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 179, __pyx_L1_error)
+      (__pyx_v_position->tile_q[__pyx_v_i]) = __pyx_t_5;
+
+      /* "nonaga_position.pyx":180
+ *         if position.tile_cells[i] == origin:
+ *             position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])
+ *             position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])             # <<<<<<<<<<<<<<
+ *             position.tile_cells[i] = destination
+ *             break
+*/
+      __pyx_t_5 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_v_destination & __pyx_e_12nonaga_board_GRID_MASK), (__pyx_v_position->tile_r[__pyx_v_i])); if (unlikely(__pyx_t_5 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 180, __pyx_L1_error)
+      (__pyx_v_position->tile_r[__pyx_v_i]) = __pyx_t_5;
+
+      /* "nonaga_position.pyx":181
+ *             position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])
+ *             position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])
+ *             position.tile_cells[i] = destination             # <<<<<<<<<<<<<<
+ *             break
+ *     position.cells[origin] = CELL_EMPTY
+*/
+      (__pyx_v_position->tile_cells[__pyx_v_i]) = __pyx_v_destination;
+
+      /* "nonaga_position.pyx":182
+ *             position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])
+ *             position.tile_cells[i] = destination
+ *             break             # <<<<<<<<<<<<<<
+ *     position.cells[origin] = CELL_EMPTY
+ *     position.cells[destination] = CELL_TILE
+*/
+      goto __pyx_L4_break;
+
+      /* "nonaga_position.pyx":178
+ *     cdef int i
+ *     for i in range(position.num_tiles):
+ *         if position.tile_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *             position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])
+ *             position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])
+*/
+    }
+  }
+  __pyx_L4_break:;
+
+  /* "nonaga_position.pyx":183
+ *             position.tile_cells[i] = destination
+ *             break
+ *     position.cells[origin] = CELL_EMPTY             # <<<<<<<<<<<<<<
+ *     position.cells[destination] = CELL_TILE
+ * 
+*/
+  (__pyx_v_position->cells[__pyx_v_origin]) = __pyx_e_12nonaga_board_CELL_EMPTY;
+
+  /* "nonaga_position.pyx":184
+ *             break
+ *     position.cells[origin] = CELL_EMPTY
+ *     position.cells[destination] = CELL_TILE             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  (__pyx_v_position->cells[__pyx_v_destination]) = __pyx_e_12nonaga_board_CELL_TILE;
+
+  /* "nonaga_position.pyx":175
+ * 
+ * 
+ * cdef inline void _carry(Position* position, int origin, int destination) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     cdef int i
+ *     for i in range(position.num_tiles):
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position._carry", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":187
+ * 
+ * 
+ * cdef void play_piece_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _slide(position, piece_move_from(move), piece_move_to(move))
+ *     _next_phase(position)
+*/
+
+static void __pyx_f_15nonaga_position_play_piece_move(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_move) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":188
+ * 
+ * cdef void play_piece_move(Position* position, int move) noexcept nogil:
+ *     _slide(position, piece_move_from(move), piece_move_to(move))             # <<<<<<<<<<<<<<
+ *     _next_phase(position)
+ * 
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_from(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 188, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 188, __pyx_L1_error)
+  __pyx_f_15nonaga_position__slide(__pyx_v_position, __pyx_t_1, __pyx_t_2);
+
+  /* "nonaga_position.pyx":189
+ * cdef void play_piece_move(Position* position, int move) noexcept nogil:
+ *     _slide(position, piece_move_from(move), piece_move_to(move))
+ *     _next_phase(position)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_f_15nonaga_position__next_phase(__pyx_v_position);
+
+  /* "nonaga_position.pyx":187
+ * 
+ * 
+ * cdef void play_piece_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _slide(position, piece_move_from(move), piece_move_to(move))
+ *     _next_phase(position)
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.play_piece_move", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":192
+ * 
+ * 
+ * cdef void play_tile_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _carry(position, piece_move_from(move), piece_move_to(move))
+ *     _next_phase(position)
+*/
+
+static void __pyx_f_15nonaga_position_play_tile_move(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_move) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":193
+ * 
+ * cdef void play_tile_move(Position* position, int move) noexcept nogil:
+ *     _carry(position, piece_move_from(move), piece_move_to(move))             # <<<<<<<<<<<<<<
+ *     _next_phase(position)
+ * 
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_from(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 193, __pyx_L1_error)
+  __pyx_f_15nonaga_position__carry(__pyx_v_position, __pyx_t_1, __pyx_t_2);
+
+  /* "nonaga_position.pyx":194
+ * cdef void play_tile_move(Position* position, int move) noexcept nogil:
+ *     _carry(position, piece_move_from(move), piece_move_to(move))
+ *     _next_phase(position)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_f_15nonaga_position__next_phase(__pyx_v_position);
+
+  /* "nonaga_position.pyx":192
+ * 
+ * 
+ * cdef void play_tile_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _carry(position, piece_move_from(move), piece_move_to(move))
+ *     _next_phase(position)
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.play_tile_move", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":197
+ * 
+ * 
+ * cdef void undo_piece_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _last_phase(position)
+ *     _slide(position, piece_move_to(move), piece_move_from(move))
+*/
+
+static void __pyx_f_15nonaga_position_undo_piece_move(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_move) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":198
+ * 
+ * cdef void undo_piece_move(Position* position, int move) noexcept nogil:
+ *     _last_phase(position)             # <<<<<<<<<<<<<<
+ *     _slide(position, piece_move_to(move), piece_move_from(move))
+ * 
+*/
+  __pyx_f_15nonaga_position__last_phase(__pyx_v_position);
+
+  /* "nonaga_position.pyx":199
+ * cdef void undo_piece_move(Position* position, int move) noexcept nogil:
+ *     _last_phase(position)
+ *     _slide(position, piece_move_to(move), piece_move_from(move))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 199, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_12nonaga_board_piece_move_from(__pyx_v_move); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 199, __pyx_L1_error)
+  __pyx_f_15nonaga_position__slide(__pyx_v_position, __pyx_t_1, __pyx_t_2);
+
+  /* "nonaga_position.pyx":197
+ * 
+ * 
+ * cdef void undo_piece_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _last_phase(position)
+ *     _slide(position, piece_move_to(move), piece_move_from(move))
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.undo_piece_move", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":202
+ * 
+ * 
+ * cdef void undo_tile_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _last_phase(position)
+ *     _carry(position, piece_move_to(move), piece_move_from(move))
+*/
+
+static void __pyx_f_15nonaga_position_undo_tile_move(struct __pyx_t_15nonaga_position_Position *__pyx_v_position, int __pyx_v_move) {
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":203
+ * 
+ * cdef void undo_tile_move(Position* position, int move) noexcept nogil:
+ *     _last_phase(position)             # <<<<<<<<<<<<<<
+ *     _carry(position, piece_move_to(move), piece_move_from(move))
+ * 
+*/
+  __pyx_f_15nonaga_position__last_phase(__pyx_v_position);
+
+  /* "nonaga_position.pyx":204
+ * cdef void undo_tile_move(Position* position, int move) noexcept nogil:
+ *     _last_phase(position)
+ *     _carry(position, piece_move_to(move), piece_move_from(move))             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 204, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_12nonaga_board_piece_move_from(__pyx_v_move); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 204, __pyx_L1_error)
+  __pyx_f_15nonaga_position__carry(__pyx_v_position, __pyx_t_1, __pyx_t_2);
+
+  /* "nonaga_position.pyx":202
+ * 
+ * 
+ * cdef void undo_tile_move(Position* position, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     _last_phase(position)
+ *     _carry(position, piece_move_to(move), piece_move_from(move))
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.undo_tile_move", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":207
+ * 
+ * 
+ * cdef tuple move_positions(const Position* position, int move, bint piece_move):             # <<<<<<<<<<<<<<
+ *     """(origin, destination) position tuples of a move that can be played in the position."""
+ *     cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+*/
+
+static PyObject *__pyx_f_15nonaga_position_move_positions(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_move, int __pyx_v_piece_move) {
+  int __pyx_v_origin;
+  int __pyx_v_destination;
+  int __pyx_v_i;
+  int __pyx_v_q;
+  int __pyx_v_r;
+  int __pyx_v_dq;
+  int __pyx_v_dr;
+  PyObject *__pyx_r = NULL;
+  __Pyx_RefNannyDeclarations
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  PyObject *__pyx_t_5 = NULL;
+  PyObject *__pyx_t_6 = NULL;
+  PyObject *__pyx_t_7 = NULL;
+  PyObject *__pyx_t_8 = NULL;
+  PyObject *__pyx_t_9 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("move_positions", 0);
+
+  /* "nonaga_position.pyx":209
+ * cdef tuple move_positions(const Position* position, int move, bint piece_move):
+ *     """(origin, destination) position tuples of a move that can be played in the position."""
+ *     cdef int origin = piece_move_from(move), destination = piece_move_to(move)             # <<<<<<<<<<<<<<
+ *     cdef int i, q = 0, r = 0
+ *     if piece_move:
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_from(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_v_origin = __pyx_t_1;
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 209, __pyx_L1_error)
+  __pyx_v_destination = __pyx_t_1;
+
+  /* "nonaga_position.pyx":210
+ *     """(origin, destination) position tuples of a move that can be played in the position."""
+ *     cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+ *     cdef int i, q = 0, r = 0             # <<<<<<<<<<<<<<
+ *     if piece_move:
+ *         for i in range(position.num_pieces):
+*/
+  __pyx_v_q = 0;
+  __pyx_v_r = 0;
+
+  /* "nonaga_position.pyx":211
+ *     cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+ *     cdef int i, q = 0, r = 0
+ *     if piece_move:             # <<<<<<<<<<<<<<
+ *         for i in range(position.num_pieces):
+ *             if position.piece_cells[i] == origin:
+*/
+  if (__pyx_v_piece_move) {
+
+    /* "nonaga_position.pyx":212
+ *     cdef int i, q = 0, r = 0
+ *     if piece_move:
+ *         for i in range(position.num_pieces):             # <<<<<<<<<<<<<<
+ *             if position.piece_cells[i] == origin:
+ *                 q = position.piece_q[i]
+*/
+    __pyx_t_1 = __pyx_v_position->num_pieces;
+    __pyx_t_2 = __pyx_t_1;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_i = __pyx_t_3;
+
+      /* "nonaga_position.pyx":213
+ *     if piece_move:
+ *         for i in range(position.num_pieces):
+ *             if position.piece_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *                 q = position.piece_q[i]
+ *                 r = position.piece_r[i]
+*/
+      __pyx_t_4 = ((__pyx_v_position->piece_cells[__pyx_v_i]) == __pyx_v_origin);
+      if (__pyx_t_4) {
+
+        /* "nonaga_position.pyx":214
+ *         for i in range(position.num_pieces):
+ *             if position.piece_cells[i] == origin:
+ *                 q = position.piece_q[i]             # <<<<<<<<<<<<<<
+ *                 r = position.piece_r[i]
+ *     else:
+*/
+        __pyx_v_q = (__pyx_v_position->piece_q[__pyx_v_i]);
+
+        /* "nonaga_position.pyx":215
+ *             if position.piece_cells[i] == origin:
+ *                 q = position.piece_q[i]
+ *                 r = position.piece_r[i]             # <<<<<<<<<<<<<<
+ *     else:
+ *         for i in range(position.num_tiles):
+*/
+        __pyx_v_r = (__pyx_v_position->piece_r[__pyx_v_i]);
+
+        /* "nonaga_position.pyx":213
+ *     if piece_move:
+ *         for i in range(position.num_pieces):
+ *             if position.piece_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *                 q = position.piece_q[i]
+ *                 r = position.piece_r[i]
+*/
+      }
+    }
+
+    /* "nonaga_position.pyx":211
+ *     cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+ *     cdef int i, q = 0, r = 0
+ *     if piece_move:             # <<<<<<<<<<<<<<
+ *         for i in range(position.num_pieces):
+ *             if position.piece_cells[i] == origin:
+*/
+    goto __pyx_L3;
+  }
+
+  /* "nonaga_position.pyx":217
+ *                 r = position.piece_r[i]
+ *     else:
+ *         for i in range(position.num_tiles):             # <<<<<<<<<<<<<<
+ *             if position.tile_cells[i] == origin:
+ *                 q = position.tile_q[i]
+*/
+  /*else*/ {
+    __pyx_t_1 = __pyx_v_position->num_tiles;
+    __pyx_t_2 = __pyx_t_1;
+    for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+      __pyx_v_i = __pyx_t_3;
+
+      /* "nonaga_position.pyx":218
+ *     else:
+ *         for i in range(position.num_tiles):
+ *             if position.tile_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *                 q = position.tile_q[i]
+ *                 r = position.tile_r[i]
+*/
+      __pyx_t_4 = ((__pyx_v_position->tile_cells[__pyx_v_i]) == __pyx_v_origin);
+      if (__pyx_t_4) {
+
+        /* "nonaga_position.pyx":219
+ *         for i in range(position.num_tiles):
+ *             if position.tile_cells[i] == origin:
+ *                 q = position.tile_q[i]             # <<<<<<<<<<<<<<
+ *                 r = position.tile_r[i]
+ *     cdef int dq = unwrap_coordinate(destination >> GRID_BITS, q)
+*/
+        __pyx_v_q = (__pyx_v_position->tile_q[__pyx_v_i]);
+
+        /* "nonaga_position.pyx":220
+ *             if position.tile_cells[i] == origin:
+ *                 q = position.tile_q[i]
+ *                 r = position.tile_r[i]             # <<<<<<<<<<<<<<
+ *     cdef int dq = unwrap_coordinate(destination >> GRID_BITS, q)
+ *     cdef int dr = unwrap_coordinate(destination & GRID_MASK, r)
+*/
+        __pyx_v_r = (__pyx_v_position->tile_r[__pyx_v_i]);
+
+        /* "nonaga_position.pyx":218
+ *     else:
+ *         for i in range(position.num_tiles):
+ *             if position.tile_cells[i] == origin:             # <<<<<<<<<<<<<<
+ *                 q = position.tile_q[i]
+ *                 r = position.tile_r[i]
+*/
+      }
+    }
+  }
+  __pyx_L3:;
+
+  /* "nonaga_position.pyx":221
+ *                 q = position.tile_q[i]
+ *                 r = position.tile_r[i]
+ *     cdef int dq = unwrap_coordinate(destination >> GRID_BITS, q)             # <<<<<<<<<<<<<<
+ *     cdef int dr = unwrap_coordinate(destination & GRID_MASK, r)
+ *     return (q, r, -q - r), (dq, dr, -dq - dr)
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_v_destination >> __pyx_e_12nonaga_board_GRID_BITS), __pyx_v_q); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 221, __pyx_L1_error)
+  __pyx_v_dq = __pyx_t_1;
+
+  /* "nonaga_position.pyx":222
+ *                 r = position.tile_r[i]
+ *     cdef int dq = unwrap_coordinate(destination >> GRID_BITS, q)
+ *     cdef int dr = unwrap_coordinate(destination & GRID_MASK, r)             # <<<<<<<<<<<<<<
+ *     return (q, r, -q - r), (dq, dr, -dq - dr)
+ * 
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_v_destination & __pyx_e_12nonaga_board_GRID_MASK), __pyx_v_r); if (unlikely(__pyx_t_1 == ((int)-1) && PyErr_Occurred())) __PYX_ERR(0, 222, __pyx_L1_error)
+  __pyx_v_dr = __pyx_t_1;
+
+  /* "nonaga_position.pyx":223
+ *     cdef int dq = unwrap_coordinate(destination >> GRID_BITS, q)
+ *     cdef int dr = unwrap_coordinate(destination & GRID_MASK, r)
+ *     return (q, r, -q - r), (dq, dr, -dq - dr)             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_XDECREF(__pyx_r);
+  __pyx_t_5 = __Pyx_PyLong_From_int(__pyx_v_q); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_r); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_7 = __Pyx_PyLong_From_int(((-__pyx_v_q) - __pyx_v_r)); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_8 = PyTuple_New(3); if (unlikely(!__pyx_t_8)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_8);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 0, __pyx_t_5) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 1, __pyx_t_6) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_8, 2, __pyx_t_7) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __pyx_t_5 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_7 = 0;
+  __pyx_t_7 = __Pyx_PyLong_From_int(__pyx_v_dq); if (unlikely(!__pyx_t_7)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_7);
+  __pyx_t_6 = __Pyx_PyLong_From_int(__pyx_v_dr); if (unlikely(!__pyx_t_6)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_6);
+  __pyx_t_5 = __Pyx_PyLong_From_int(((-__pyx_v_dq) - __pyx_v_dr)); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __pyx_t_9 = PyTuple_New(3); if (unlikely(!__pyx_t_9)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_9);
+  __Pyx_GIVEREF(__pyx_t_7);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 0, __pyx_t_7) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_6);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 1, __pyx_t_6) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_5);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_9, 2, __pyx_t_5) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __pyx_t_7 = 0;
+  __pyx_t_6 = 0;
+  __pyx_t_5 = 0;
+  __pyx_t_5 = PyTuple_New(2); if (unlikely(!__pyx_t_5)) __PYX_ERR(0, 223, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_5);
+  __Pyx_GIVEREF(__pyx_t_8);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 0, __pyx_t_8) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __Pyx_GIVEREF(__pyx_t_9);
+  if (__Pyx_PyTuple_SET_ITEM(__pyx_t_5, 1, __pyx_t_9) != (0)) __PYX_ERR(0, 223, __pyx_L1_error);
+  __pyx_t_8 = 0;
+  __pyx_t_9 = 0;
+  __pyx_r = ((PyObject*)__pyx_t_5);
+  __pyx_t_5 = 0;
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":207
+ * 
+ * 
+ * cdef tuple move_positions(const Position* position, int move, bint piece_move):             # <<<<<<<<<<<<<<
+ *     """(origin, destination) position tuples of a move that can be played in the position."""
+ *     cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_5);
+  __Pyx_XDECREF(__pyx_t_6);
+  __Pyx_XDECREF(__pyx_t_7);
+  __Pyx_XDECREF(__pyx_t_8);
+  __Pyx_XDECREF(__pyx_t_9);
+  __Pyx_AddTraceback("nonaga_position.move_positions", __pyx_clineno, __pyx_lineno, __pyx_filename);
+  __pyx_r = 0;
+  __pyx_L0:;
+  __Pyx_XGIVEREF(__pyx_r);
+  __Pyx_RefNannyFinishContext();
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":227
+ * 
+ * #  evaluation
+ * cdef inline void _pieces_of(const Position* position, int color, int* indices) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Indices of the (first three) pieces of a player, in board order like NonagaLogic.pieces_by_color."""
+ *     cdef int i, n = 0
+*/
+
+static CYTHON_INLINE void __pyx_f_15nonaga_position__pieces_of(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_color, int *__pyx_v_indices) {
+  int __pyx_v_i;
+  int __pyx_v_n;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+
+  /* "nonaga_position.pyx":229
+ * cdef inline void _pieces_of(const Position* position, int color, int* indices) noexcept nogil:
+ *     """Indices of the (first three) pieces of a player, in board order like NonagaLogic.pieces_by_color."""
+ *     cdef int i, n = 0             # <<<<<<<<<<<<<<
+ *     for i in range(position.num_pieces):
+ *         if position.piece_colors[i] == color and n < 3:
+*/
+  __pyx_v_n = 0;
+
+  /* "nonaga_position.pyx":230
+ *     """Indices of the (first three) pieces of a player, in board order like NonagaLogic.pieces_by_color."""
+ *     cdef int i, n = 0
+ *     for i in range(position.num_pieces):             # <<<<<<<<<<<<<<
+ *         if position.piece_colors[i] == color and n < 3:
+ *             indices[n] = i
+*/
+  __pyx_t_1 = __pyx_v_position->num_pieces;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_i = __pyx_t_3;
+
+    /* "nonaga_position.pyx":231
+ *     cdef int i, n = 0
+ *     for i in range(position.num_pieces):
+ *         if position.piece_colors[i] == color and n < 3:             # <<<<<<<<<<<<<<
+ *             indices[n] = i
+ *             n += 1
+*/
+    __pyx_t_5 = ((__pyx_v_position->piece_colors[__pyx_v_i]) == __pyx_v_color);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_4 = __pyx_t_5;
+      goto __pyx_L6_bool_binop_done;
+    }
+    __pyx_t_5 = (__pyx_v_n < 3);
+    __pyx_t_4 = __pyx_t_5;
+    __pyx_L6_bool_binop_done:;
+    if (__pyx_t_4) {
+
+      /* "nonaga_position.pyx":232
+ *     for i in range(position.num_pieces):
+ *         if position.piece_colors[i] == color and n < 3:
+ *             indices[n] = i             # <<<<<<<<<<<<<<
+ *             n += 1
+ * 
+*/
+      (__pyx_v_indices[__pyx_v_n]) = __pyx_v_i;
+
+      /* "nonaga_position.pyx":233
+ *         if position.piece_colors[i] == color and n < 3:
+ *             indices[n] = i
+ *             n += 1             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+      __pyx_v_n = (__pyx_v_n + 1);
+
+      /* "nonaga_position.pyx":231
+ *     cdef int i, n = 0
+ *     for i in range(position.num_pieces):
+ *         if position.piece_colors[i] == color and n < 3:             # <<<<<<<<<<<<<<
+ *             indices[n] = i
+ *             n += 1
+*/
+    }
+  }
+
+  /* "nonaga_position.pyx":227
+ * 
+ * #  evaluation
+ * cdef inline void _pieces_of(const Position* position, int color, int* indices) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Indices of the (first three) pieces of a player, in board order like NonagaLogic.pieces_by_color."""
+ *     cdef int i, n = 0
+*/
+
+  /* function exit code */
+}
+
+/* "nonaga_position.pyx":236
+ * 
+ * 
+ * cdef bint position_won(const Position* position, int color) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """NonagaLogic.check_win_condition: at least two pairs of the player's pieces in contact."""
+ *     cdef int p[3]
+*/
+
+static int __pyx_f_15nonaga_position_position_won(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_color) {
+  int __pyx_v_p[3];
+  int __pyx_v_k;
+  int __pyx_v_contacts;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+
+  /* "nonaga_position.pyx":239
+ *     """NonagaLogic.check_win_condition: at least two pairs of the player's pieces in contact."""
+ *     cdef int p[3]
+ *     cdef int k, contacts = 0             # <<<<<<<<<<<<<<
+ *     _pieces_of(position, color, p)
+ *     for k in range(3):
+*/
+  __pyx_v_contacts = 0;
+
+  /* "nonaga_position.pyx":240
+ *     cdef int p[3]
+ *     cdef int k, contacts = 0
+ *     _pieces_of(position, color, p)             # <<<<<<<<<<<<<<
+ *     for k in range(3):
+ *         if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],
+*/
+  __pyx_f_15nonaga_position__pieces_of(__pyx_v_position, __pyx_v_color, __pyx_v_p);
+
+  /* "nonaga_position.pyx":241
+ *     cdef int k, contacts = 0
+ *     _pieces_of(position, color, p)
+ *     for k in range(3):             # <<<<<<<<<<<<<<
+ *         if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],
+ *                          position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:
+*/
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_k = __pyx_t_1;
+
+    /* "nonaga_position.pyx":243
+ *     for k in range(3):
+ *         if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],
+ *                          position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:             # <<<<<<<<<<<<<<
+ *             contacts += 1
+ *     return contacts >= 2
+*/
+    __pyx_t_2 = (__pyx_f_15nonaga_position__hex_distance((__pyx_v_position->piece_q[(__pyx_v_p[__pyx_v_k])]), (__pyx_v_position->piece_r[(__pyx_v_p[__pyx_v_k])]), (__pyx_v_position->piece_q[(__pyx_v_p[__Pyx_mod_long((__pyx_v_k + 1), 3, 1)])]), (__pyx_v_position->piece_r[(__pyx_v_p[__Pyx_mod_long((__pyx_v_k + 1), 3, 1)])])) == 1);
+
+    /* "nonaga_position.pyx":242
+ *     _pieces_of(position, color, p)
+ *     for k in range(3):
+ *         if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],             # <<<<<<<<<<<<<<
+ *                          position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:
+ *             contacts += 1
+*/
+    if (__pyx_t_2) {
+
+      /* "nonaga_position.pyx":244
+ *         if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],
+ *                          position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:
+ *             contacts += 1             # <<<<<<<<<<<<<<
+ *     return contacts >= 2
+ * 
+*/
+      __pyx_v_contacts = (__pyx_v_contacts + 1);
+
+      /* "nonaga_position.pyx":242
+ *     _pieces_of(position, color, p)
+ *     for k in range(3):
+ *         if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],             # <<<<<<<<<<<<<<
+ *                          position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:
+ *             contacts += 1
+*/
+    }
+  }
+
+  /* "nonaga_position.pyx":245
+ *                          position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:
+ *             contacts += 1
+ *     return contacts >= 2             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = (__pyx_v_contacts >= 2);
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":236
+ * 
+ * 
+ * cdef bint position_won(const Position* position, int color) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """NonagaLogic.check_win_condition: at least two pairs of the player's pieces in contact."""
+ *     cdef int p[3]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":248
+ * 
+ * 
+ * cdef inline bint _connects(const Position* position, const int* p, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Whether the slide of one of the pieces p puts two pairs of them in contact."""
+ *     cdef int i, moved = 0, a, b, q, r, contacts = 0
+*/
+
+static CYTHON_INLINE int __pyx_f_15nonaga_position__connects(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int const *__pyx_v_p, int __pyx_v_move) {
+  int __pyx_v_i;
+  int __pyx_v_moved;
+  int __pyx_v_a;
+  int __pyx_v_b;
+  int __pyx_v_q;
+  int __pyx_v_r;
+  int __pyx_v_contacts;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":250
+ * cdef inline bint _connects(const Position* position, const int* p, int move) noexcept nogil:
+ *     """Whether the slide of one of the pieces p puts two pairs of them in contact."""
+ *     cdef int i, moved = 0, a, b, q, r, contacts = 0             # <<<<<<<<<<<<<<
+ *     for i in range(3):
+ *         if position.piece_cells[p[i]] == piece_move_from(move):
+*/
+  __pyx_v_moved = 0;
+  __pyx_v_contacts = 0;
+
+  /* "nonaga_position.pyx":251
+ *     """Whether the slide of one of the pieces p puts two pairs of them in contact."""
+ *     cdef int i, moved = 0, a, b, q, r, contacts = 0
+ *     for i in range(3):             # <<<<<<<<<<<<<<
+ *         if position.piece_cells[p[i]] == piece_move_from(move):
+ *             moved = i
+*/
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "nonaga_position.pyx":252
+ *     cdef int i, moved = 0, a, b, q, r, contacts = 0
+ *     for i in range(3):
+ *         if position.piece_cells[p[i]] == piece_move_from(move):             # <<<<<<<<<<<<<<
+ *             moved = i
+ *     a = p[(moved + 1) % 3]
+*/
+    __pyx_t_2 = __pyx_f_12nonaga_board_piece_move_from(__pyx_v_move); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 252, __pyx_L1_error)
+    __pyx_t_3 = ((__pyx_v_position->piece_cells[(__pyx_v_p[__pyx_v_i])]) == __pyx_t_2);
+    if (__pyx_t_3) {
+
+      /* "nonaga_position.pyx":253
+ *     for i in range(3):
+ *         if position.piece_cells[p[i]] == piece_move_from(move):
+ *             moved = i             # <<<<<<<<<<<<<<
+ *     a = p[(moved + 1) % 3]
+ *     b = p[(moved + 2) % 3]
+*/
+      __pyx_v_moved = __pyx_v_i;
+
+      /* "nonaga_position.pyx":252
+ *     cdef int i, moved = 0, a, b, q, r, contacts = 0
+ *     for i in range(3):
+ *         if position.piece_cells[p[i]] == piece_move_from(move):             # <<<<<<<<<<<<<<
+ *             moved = i
+ *     a = p[(moved + 1) % 3]
+*/
+    }
+  }
+
+  /* "nonaga_position.pyx":254
+ *         if position.piece_cells[p[i]] == piece_move_from(move):
+ *             moved = i
+ *     a = p[(moved + 1) % 3]             # <<<<<<<<<<<<<<
+ *     b = p[(moved + 2) % 3]
+ *     q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])
+*/
+  __pyx_v_a = (__pyx_v_p[__Pyx_mod_long((__pyx_v_moved + 1), 3, 1)]);
+
+  /* "nonaga_position.pyx":255
+ *             moved = i
+ *     a = p[(moved + 1) % 3]
+ *     b = p[(moved + 2) % 3]             # <<<<<<<<<<<<<<
+ *     q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])
+ *     r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])
+*/
+  __pyx_v_b = (__pyx_v_p[__Pyx_mod_long((__pyx_v_moved + 2), 3, 1)]);
+
+  /* "nonaga_position.pyx":256
+ *     a = p[(moved + 1) % 3]
+ *     b = p[(moved + 2) % 3]
+ *     q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])             # <<<<<<<<<<<<<<
+ *     r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:
+*/
+  __pyx_t_1 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_t_2 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_t_1 >> __pyx_e_12nonaga_board_GRID_BITS), (__pyx_v_position->piece_q[(__pyx_v_p[__pyx_v_moved])])); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 256, __pyx_L1_error)
+  __pyx_v_q = __pyx_t_2;
+
+  /* "nonaga_position.pyx":257
+ *     b = p[(moved + 2) % 3]
+ *     q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])
+ *     r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])             # <<<<<<<<<<<<<<
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1
+*/
+  __pyx_t_2 = __pyx_f_12nonaga_board_piece_move_to(__pyx_v_move); if (unlikely(__pyx_t_2 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_t_1 = __pyx_f_12nonaga_board_unwrap_coordinate((__pyx_t_2 & __pyx_e_12nonaga_board_GRID_MASK), (__pyx_v_position->piece_r[(__pyx_v_p[__pyx_v_moved])])); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 257, __pyx_L1_error)
+  __pyx_v_r = __pyx_t_1;
+
+  /* "nonaga_position.pyx":258
+ *     q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])
+ *     r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:             # <<<<<<<<<<<<<<
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+*/
+  __pyx_t_3 = (__pyx_f_15nonaga_position__hex_distance((__pyx_v_position->piece_q[__pyx_v_a]), (__pyx_v_position->piece_r[__pyx_v_a]), (__pyx_v_position->piece_q[__pyx_v_b]), (__pyx_v_position->piece_r[__pyx_v_b])) == 1);
+  if (__pyx_t_3) {
+
+    /* "nonaga_position.pyx":259
+ *     r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1             # <<<<<<<<<<<<<<
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+ *         contacts += 1
+*/
+    __pyx_v_contacts = (__pyx_v_contacts + 1);
+
+    /* "nonaga_position.pyx":258
+ *     q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])
+ *     r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:             # <<<<<<<<<<<<<<
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+*/
+  }
+
+  /* "nonaga_position.pyx":260
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:             # <<<<<<<<<<<<<<
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:
+*/
+  __pyx_t_3 = (__pyx_f_15nonaga_position__hex_distance(__pyx_v_q, __pyx_v_r, (__pyx_v_position->piece_q[__pyx_v_a]), (__pyx_v_position->piece_r[__pyx_v_a])) == 1);
+  if (__pyx_t_3) {
+
+    /* "nonaga_position.pyx":261
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+ *         contacts += 1             # <<<<<<<<<<<<<<
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1
+*/
+    __pyx_v_contacts = (__pyx_v_contacts + 1);
+
+    /* "nonaga_position.pyx":260
+ *     if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:             # <<<<<<<<<<<<<<
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:
+*/
+  }
+
+  /* "nonaga_position.pyx":262
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:             # <<<<<<<<<<<<<<
+ *         contacts += 1
+ *     return contacts >= 2
+*/
+  __pyx_t_3 = (__pyx_f_15nonaga_position__hex_distance(__pyx_v_q, __pyx_v_r, (__pyx_v_position->piece_q[__pyx_v_b]), (__pyx_v_position->piece_r[__pyx_v_b])) == 1);
+  if (__pyx_t_3) {
+
+    /* "nonaga_position.pyx":263
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1             # <<<<<<<<<<<<<<
+ *     return contacts >= 2
+ * 
+*/
+    __pyx_v_contacts = (__pyx_v_contacts + 1);
+
+    /* "nonaga_position.pyx":262
+ *     if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+ *         contacts += 1
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:             # <<<<<<<<<<<<<<
+ *         contacts += 1
+ *     return contacts >= 2
+*/
+  }
+
+  /* "nonaga_position.pyx":264
+ *     if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:
+ *         contacts += 1
+ *     return contacts >= 2             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = (__pyx_v_contacts >= 2);
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":248
+ * 
+ * 
+ * cdef inline bint _connects(const Position* position, const int* p, int move) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Whether the slide of one of the pieces p puts two pairs of them in contact."""
+ *     cdef int i, moved = 0, a, b, q, r, contacts = 0
+*/
+
+  /* function exit code */
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position._connects", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __pyx_r = 0;
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":267
+ * 
+ * 
+ * cdef int find_winning_slide(const Position* position, int color) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """An encoded slide connecting the player's three pieces, -1 if there is none."""
+ *     cdef int moves[MAX_PIECE_MOVES]
+*/
+
+static int __pyx_f_15nonaga_position_find_winning_slide(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_color) {
+  int __pyx_v_moves[__pyx_e_12nonaga_board_MAX_PIECE_MOVES];
+  int __pyx_v_p[3];
+  int __pyx_v_count;
+  int __pyx_v_k;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "nonaga_position.pyx":271
+ *     cdef int moves[MAX_PIECE_MOVES]
+ *     cdef int p[3]
+ *     cdef int count = slide_moves(position.cells, position.piece_cells, position.piece_colors,             # <<<<<<<<<<<<<<
+ *                                  position.num_pieces, color, moves)
+ *     cdef int k
+*/
+  __pyx_v_count = __pyx_f_12nonaga_board_slide_moves(__pyx_v_position->cells, __pyx_v_position->piece_cells, __pyx_v_position->piece_colors, __pyx_v_position->num_pieces, __pyx_v_color, __pyx_v_moves);
+
+  /* "nonaga_position.pyx":274
+ *                                  position.num_pieces, color, moves)
+ *     cdef int k
+ *     _pieces_of(position, color, p)             # <<<<<<<<<<<<<<
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):
+*/
+  __pyx_f_15nonaga_position__pieces_of(__pyx_v_position, __pyx_v_color, __pyx_v_p);
+
+  /* "nonaga_position.pyx":275
+ *     cdef int k
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):             # <<<<<<<<<<<<<<
+ *         if _connects(position, p, moves[k]):
+ *             return moves[k]
+*/
+  __pyx_t_1 = __pyx_v_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_k = __pyx_t_3;
+
+    /* "nonaga_position.pyx":276
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):             # <<<<<<<<<<<<<<
+ *             return moves[k]
+ *     return -1
+*/
+    __pyx_t_4 = __pyx_f_15nonaga_position__connects(__pyx_v_position, __pyx_v_p, (__pyx_v_moves[__pyx_v_k]));
+    if (__pyx_t_4) {
+
+      /* "nonaga_position.pyx":277
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):
+ *             return moves[k]             # <<<<<<<<<<<<<<
+ *     return -1
+ * 
+*/
+      __pyx_r = (__pyx_v_moves[__pyx_v_k]);
+      goto __pyx_L0;
+
+      /* "nonaga_position.pyx":276
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):             # <<<<<<<<<<<<<<
+ *             return moves[k]
+ *     return -1
+*/
+    }
+  }
+
+  /* "nonaga_position.pyx":278
+ *         if _connects(position, p, moves[k]):
+ *             return moves[k]
+ *     return -1             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = -1;
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":267
+ * 
+ * 
+ * cdef int find_winning_slide(const Position* position, int color) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """An encoded slide connecting the player's three pieces, -1 if there is none."""
+ *     cdef int moves[MAX_PIECE_MOVES]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":281
+ * 
+ * 
+ * cdef int fill_winning_slides(const Position* position, int color, int* moves) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Every encoded slide connecting the player's three pieces, like NonagaLogic.get_winning_piece_moves.
+ * 
+*/
+
+static int __pyx_f_15nonaga_position_fill_winning_slides(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_color, int *__pyx_v_moves) {
+  int __pyx_v_p[3];
+  int __pyx_v_count;
+  int __pyx_v_k;
+  int __pyx_v_winning;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+
+  /* "nonaga_position.pyx":287
+ *     """
+ *     cdef int p[3]
+ *     cdef int count = slide_moves(position.cells, position.piece_cells, position.piece_colors,             # <<<<<<<<<<<<<<
+ *                                  position.num_pieces, color, moves)
+ *     cdef int k, winning = 0
+*/
+  __pyx_v_count = __pyx_f_12nonaga_board_slide_moves(__pyx_v_position->cells, __pyx_v_position->piece_cells, __pyx_v_position->piece_colors, __pyx_v_position->num_pieces, __pyx_v_color, __pyx_v_moves);
+
+  /* "nonaga_position.pyx":289
+ *     cdef int count = slide_moves(position.cells, position.piece_cells, position.piece_colors,
+ *                                  position.num_pieces, color, moves)
+ *     cdef int k, winning = 0             # <<<<<<<<<<<<<<
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):
+*/
+  __pyx_v_winning = 0;
+
+  /* "nonaga_position.pyx":290
+ *                                  position.num_pieces, color, moves)
+ *     cdef int k, winning = 0
+ *     _pieces_of(position, color, p)             # <<<<<<<<<<<<<<
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):
+*/
+  __pyx_f_15nonaga_position__pieces_of(__pyx_v_position, __pyx_v_color, __pyx_v_p);
+
+  /* "nonaga_position.pyx":291
+ *     cdef int k, winning = 0
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):             # <<<<<<<<<<<<<<
+ *         if _connects(position, p, moves[k]):
+ *             moves[winning] = moves[k]
+*/
+  __pyx_t_1 = __pyx_v_count;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_k = __pyx_t_3;
+
+    /* "nonaga_position.pyx":292
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):             # <<<<<<<<<<<<<<
+ *             moves[winning] = moves[k]
+ *             winning += 1
+*/
+    __pyx_t_4 = __pyx_f_15nonaga_position__connects(__pyx_v_position, __pyx_v_p, (__pyx_v_moves[__pyx_v_k]));
+    if (__pyx_t_4) {
+
+      /* "nonaga_position.pyx":293
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):
+ *             moves[winning] = moves[k]             # <<<<<<<<<<<<<<
+ *             winning += 1
+ *     return winning
+*/
+      (__pyx_v_moves[__pyx_v_winning]) = (__pyx_v_moves[__pyx_v_k]);
+
+      /* "nonaga_position.pyx":294
+ *         if _connects(position, p, moves[k]):
+ *             moves[winning] = moves[k]
+ *             winning += 1             # <<<<<<<<<<<<<<
+ *     return winning
+ * 
+*/
+      __pyx_v_winning = (__pyx_v_winning + 1);
+
+      /* "nonaga_position.pyx":292
+ *     _pieces_of(position, color, p)
+ *     for k in range(count):
+ *         if _connects(position, p, moves[k]):             # <<<<<<<<<<<<<<
+ *             moves[winning] = moves[k]
+ *             winning += 1
+*/
+    }
+  }
+
+  /* "nonaga_position.pyx":295
+ *             moves[winning] = moves[k]
+ *             winning += 1
+ *     return winning             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __pyx_r = __pyx_v_winning;
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":281
+ * 
+ * 
+ * cdef int fill_winning_slides(const Position* position, int color, int* moves) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """Every encoded slide connecting the player's three pieces, like NonagaLogic.get_winning_piece_moves.
+ * 
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+
+/* "nonaga_position.pyx":298
+ * 
+ * 
+ * cdef void position_features(const Position* position, int color, int* features) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """The four terms of AI.cost_function for one player's pieces.
+ * 
+*/
+
+static void __pyx_f_15nonaga_position_position_features(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_color, int *__pyx_v_features) {
+  int __pyx_v_p[3];
+  int __pyx_v_pq[3];
+  int __pyx_v_pr[3];
+  int __pyx_v_ps[3];
+  int __pyx_v_i;
+  int __pyx_v_j;
+  int __pyx_v_k;
+  int __pyx_v_q;
+  int __pyx_v_r;
+  int __pyx_v_s;
+  int __pyx_v_cell;
+  int __pyx_v_aligned;
+  int __pyx_v_missing;
+  int __pyx_v_enemies;
+  int __pyx_v_d1;
+  int __pyx_v_d2;
+  int __pyx_v_d3;
+  int __pyx_v_distance;
+  int __pyx_v_q_min;
+  int __pyx_v_q_max;
+  int __pyx_v_r_min;
+  int __pyx_v_r_max;
+  int __pyx_v_s_min;
+  int __pyx_v_s_max;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+  int __pyx_t_4;
+  int __pyx_t_5;
+  int __pyx_t_6;
+  int __pyx_t_7;
+  long __pyx_t_8;
+  long __pyx_t_9;
+  long __pyx_t_10;
+  long __pyx_t_11;
+  int __pyx_t_12;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  PyGILState_STATE __pyx_gilstate_save;
+
+  /* "nonaga_position.pyx":309
+ *     cdef int pr[3]
+ *     cdef int ps[3]
+ *     cdef int i, j, k, q, r, s, cell, aligned = 0, missing = 0, enemies = 0             # <<<<<<<<<<<<<<
+ *     _pieces_of(position, color, p)
+ *     for i in range(3):
+*/
+  __pyx_v_aligned = 0;
+  __pyx_v_missing = 0;
+  __pyx_v_enemies = 0;
+
+  /* "nonaga_position.pyx":310
+ *     cdef int ps[3]
+ *     cdef int i, j, k, q, r, s, cell, aligned = 0, missing = 0, enemies = 0
+ *     _pieces_of(position, color, p)             # <<<<<<<<<<<<<<
+ *     for i in range(3):
+ *         pq[i] = position.piece_q[p[i]]
+*/
+  __pyx_f_15nonaga_position__pieces_of(__pyx_v_position, __pyx_v_color, __pyx_v_p);
+
+  /* "nonaga_position.pyx":311
+ *     cdef int i, j, k, q, r, s, cell, aligned = 0, missing = 0, enemies = 0
+ *     _pieces_of(position, color, p)
+ *     for i in range(3):             # <<<<<<<<<<<<<<
+ *         pq[i] = position.piece_q[p[i]]
+ *         pr[i] = position.piece_r[p[i]]
+*/
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "nonaga_position.pyx":312
+ *     _pieces_of(position, color, p)
+ *     for i in range(3):
+ *         pq[i] = position.piece_q[p[i]]             # <<<<<<<<<<<<<<
+ *         pr[i] = position.piece_r[p[i]]
+ *         ps[i] = -pq[i] - pr[i]
+*/
+    (__pyx_v_pq[__pyx_v_i]) = (__pyx_v_position->piece_q[(__pyx_v_p[__pyx_v_i])]);
+
+    /* "nonaga_position.pyx":313
+ *     for i in range(3):
+ *         pq[i] = position.piece_q[p[i]]
+ *         pr[i] = position.piece_r[p[i]]             # <<<<<<<<<<<<<<
+ *         ps[i] = -pq[i] - pr[i]
+ *     for i in range(3):
+*/
+    (__pyx_v_pr[__pyx_v_i]) = (__pyx_v_position->piece_r[(__pyx_v_p[__pyx_v_i])]);
+
+    /* "nonaga_position.pyx":314
+ *         pq[i] = position.piece_q[p[i]]
+ *         pr[i] = position.piece_r[p[i]]
+ *         ps[i] = -pq[i] - pr[i]             # <<<<<<<<<<<<<<
+ *     for i in range(3):
+ *         j = (i + 1) % 3
+*/
+    (__pyx_v_ps[__pyx_v_i]) = ((-(__pyx_v_pq[__pyx_v_i])) - (__pyx_v_pr[__pyx_v_i]));
+  }
+
+  /* "nonaga_position.pyx":315
+ *         pr[i] = position.piece_r[p[i]]
+ *         ps[i] = -pq[i] - pr[i]
+ *     for i in range(3):             # <<<<<<<<<<<<<<
+ *         j = (i + 1) % 3
+ *         aligned += (pq[i] == pq[j]) + (pr[i] == pr[j]) + (ps[i] == ps[j])
+*/
+  for (__pyx_t_1 = 0; __pyx_t_1 < 3; __pyx_t_1+=1) {
+    __pyx_v_i = __pyx_t_1;
+
+    /* "nonaga_position.pyx":316
+ *         ps[i] = -pq[i] - pr[i]
+ *     for i in range(3):
+ *         j = (i + 1) % 3             # <<<<<<<<<<<<<<
+ *         aligned += (pq[i] == pq[j]) + (pr[i] == pr[j]) + (ps[i] == ps[j])
+ * 
+*/
+    __pyx_v_j = __Pyx_mod_long((__pyx_v_i + 1), 3, 1);
+
+    /* "nonaga_position.pyx":317
+ *     for i in range(3):
+ *         j = (i + 1) % 3
+ *         aligned += (pq[i] == pq[j]) + (pr[i] == pr[j]) + (ps[i] == ps[j])             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int d1 = _hex_distance(pq[0], pr[0], pq[1], pr[1])
+*/
+    __pyx_v_aligned = (__pyx_v_aligned + ((((__pyx_v_pq[__pyx_v_i]) == (__pyx_v_pq[__pyx_v_j])) + ((__pyx_v_pr[__pyx_v_i]) == (__pyx_v_pr[__pyx_v_j]))) + ((__pyx_v_ps[__pyx_v_i]) == (__pyx_v_ps[__pyx_v_j]))));
+  }
+
+  /* "nonaga_position.pyx":319
+ *         aligned += (pq[i] == pq[j]) + (pr[i] == pr[j]) + (ps[i] == ps[j])
+ * 
+ *     cdef int d1 = _hex_distance(pq[0], pr[0], pq[1], pr[1])             # <<<<<<<<<<<<<<
+ *     cdef int d2 = _hex_distance(pq[1], pr[1], pq[2], pr[2])
+ *     cdef int d3 = _hex_distance(pq[2], pr[2], pq[0], pr[0])
+*/
+  __pyx_v_d1 = __pyx_f_15nonaga_position__hex_distance((__pyx_v_pq[0]), (__pyx_v_pr[0]), (__pyx_v_pq[1]), (__pyx_v_pr[1]));
+
+  /* "nonaga_position.pyx":320
+ * 
+ *     cdef int d1 = _hex_distance(pq[0], pr[0], pq[1], pr[1])
+ *     cdef int d2 = _hex_distance(pq[1], pr[1], pq[2], pr[2])             # <<<<<<<<<<<<<<
+ *     cdef int d3 = _hex_distance(pq[2], pr[2], pq[0], pr[0])
+ *     cdef int distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)
+*/
+  __pyx_v_d2 = __pyx_f_15nonaga_position__hex_distance((__pyx_v_pq[1]), (__pyx_v_pr[1]), (__pyx_v_pq[2]), (__pyx_v_pr[2]));
+
+  /* "nonaga_position.pyx":321
+ *     cdef int d1 = _hex_distance(pq[0], pr[0], pq[1], pr[1])
+ *     cdef int d2 = _hex_distance(pq[1], pr[1], pq[2], pr[2])
+ *     cdef int d3 = _hex_distance(pq[2], pr[2], pq[0], pr[0])             # <<<<<<<<<<<<<<
+ *     cdef int distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)
+ * 
+*/
+  __pyx_v_d3 = __pyx_f_15nonaga_position__hex_distance((__pyx_v_pq[2]), (__pyx_v_pr[2]), (__pyx_v_pq[0]), (__pyx_v_pr[0]));
+
+  /* "nonaga_position.pyx":322
+ *     cdef int d2 = _hex_distance(pq[1], pr[1], pq[2], pr[2])
+ *     cdef int d3 = _hex_distance(pq[2], pr[2], pq[0], pr[0])
+ *     cdef int distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)             # <<<<<<<<<<<<<<
+ * 
+ *     cdef int q_min = min(pq[0], pq[1], pq[2]), q_max = max(pq[0], pq[1], pq[2])
+*/
+  __pyx_t_3 = (__pyx_v_d1 > __pyx_v_d2);
+  if (__pyx_t_3) {
+  } else {
+    __pyx_t_2 = __pyx_t_3;
+    goto __pyx_L7_bool_binop_done;
+  }
+  __pyx_t_3 = (__pyx_v_d1 > __pyx_v_d3);
+  __pyx_t_2 = __pyx_t_3;
+  __pyx_L7_bool_binop_done:;
+  if (__pyx_t_2) {
+    __pyx_t_1 = (__pyx_v_d2 + __pyx_v_d3);
+  } else {
+    __pyx_t_5 = (__pyx_v_d2 > __pyx_v_d1);
+    if (__pyx_t_5) {
+    } else {
+      __pyx_t_3 = __pyx_t_5;
+      goto __pyx_L9_bool_binop_done;
+    }
+    __pyx_t_5 = (__pyx_v_d2 > __pyx_v_d3);
+    __pyx_t_3 = __pyx_t_5;
+    __pyx_L9_bool_binop_done:;
+    if (__pyx_t_3) {
+      __pyx_t_4 = (__pyx_v_d3 + __pyx_v_d1);
+    } else {
+      __pyx_t_4 = (__pyx_v_d1 + __pyx_v_d2);
+    }
+    __pyx_t_1 = __pyx_t_4;
+  }
+  __pyx_v_distance = __pyx_t_1;
+
+  /* "nonaga_position.pyx":324
+ *     cdef int distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)
+ * 
+ *     cdef int q_min = min(pq[0], pq[1], pq[2]), q_max = max(pq[0], pq[1], pq[2])             # <<<<<<<<<<<<<<
+ *     cdef int r_min = min(pr[0], pr[1], pr[2]), r_max = max(pr[0], pr[1], pr[2])
+ *     cdef int s_min = min(ps[0], ps[1], ps[2]), s_max = max(ps[0], ps[1], ps[2])
+*/
+  __pyx_t_1 = (__pyx_v_pq[1]);
+  __pyx_t_4 = (__pyx_v_pq[2]);
+  __pyx_t_6 = (__pyx_v_pq[0]);
+  __pyx_t_2 = (__pyx_t_1 < __pyx_t_6);
+  if (__pyx_t_2) {
+    __pyx_t_7 = __pyx_t_1;
+  } else {
+    __pyx_t_7 = __pyx_t_6;
+  }
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_t_2 = (__pyx_t_4 < __pyx_t_6);
+  if (__pyx_t_2) {
+    __pyx_t_7 = __pyx_t_4;
+  } else {
+    __pyx_t_7 = __pyx_t_6;
+  }
+  __pyx_v_q_min = __pyx_t_7;
+  __pyx_t_7 = (__pyx_v_pq[1]);
+  __pyx_t_1 = (__pyx_v_pq[2]);
+  __pyx_t_4 = (__pyx_v_pq[0]);
+  __pyx_t_2 = (__pyx_t_7 > __pyx_t_4);
+  if (__pyx_t_2) {
+    __pyx_t_6 = __pyx_t_7;
+  } else {
+    __pyx_t_6 = __pyx_t_4;
+  }
+  __pyx_t_4 = __pyx_t_6;
+  __pyx_t_2 = (__pyx_t_1 > __pyx_t_4);
+  if (__pyx_t_2) {
+    __pyx_t_6 = __pyx_t_1;
+  } else {
+    __pyx_t_6 = __pyx_t_4;
+  }
+  __pyx_v_q_max = __pyx_t_6;
+
+  /* "nonaga_position.pyx":325
+ * 
+ *     cdef int q_min = min(pq[0], pq[1], pq[2]), q_max = max(pq[0], pq[1], pq[2])
+ *     cdef int r_min = min(pr[0], pr[1], pr[2]), r_max = max(pr[0], pr[1], pr[2])             # <<<<<<<<<<<<<<
+ *     cdef int s_min = min(ps[0], ps[1], ps[2]), s_max = max(ps[0], ps[1], ps[2])
+ *     for q in range(q_min, q_max + 1):
+*/
+  __pyx_t_6 = (__pyx_v_pr[1]);
+  __pyx_t_7 = (__pyx_v_pr[2]);
+  __pyx_t_1 = (__pyx_v_pr[0]);
+  __pyx_t_2 = (__pyx_t_6 < __pyx_t_1);
+  if (__pyx_t_2) {
+    __pyx_t_4 = __pyx_t_6;
+  } else {
+    __pyx_t_4 = __pyx_t_1;
+  }
+  __pyx_t_1 = __pyx_t_4;
+  __pyx_t_2 = (__pyx_t_7 < __pyx_t_1);
+  if (__pyx_t_2) {
+    __pyx_t_4 = __pyx_t_7;
+  } else {
+    __pyx_t_4 = __pyx_t_1;
+  }
+  __pyx_v_r_min = __pyx_t_4;
+  __pyx_t_4 = (__pyx_v_pr[1]);
+  __pyx_t_6 = (__pyx_v_pr[2]);
+  __pyx_t_7 = (__pyx_v_pr[0]);
+  __pyx_t_2 = (__pyx_t_4 > __pyx_t_7);
+  if (__pyx_t_2) {
+    __pyx_t_1 = __pyx_t_4;
+  } else {
+    __pyx_t_1 = __pyx_t_7;
+  }
+  __pyx_t_7 = __pyx_t_1;
+  __pyx_t_2 = (__pyx_t_6 > __pyx_t_7);
+  if (__pyx_t_2) {
+    __pyx_t_1 = __pyx_t_6;
+  } else {
+    __pyx_t_1 = __pyx_t_7;
+  }
+  __pyx_v_r_max = __pyx_t_1;
+
+  /* "nonaga_position.pyx":326
+ *     cdef int q_min = min(pq[0], pq[1], pq[2]), q_max = max(pq[0], pq[1], pq[2])
+ *     cdef int r_min = min(pr[0], pr[1], pr[2]), r_max = max(pr[0], pr[1], pr[2])
+ *     cdef int s_min = min(ps[0], ps[1], ps[2]), s_max = max(ps[0], ps[1], ps[2])             # <<<<<<<<<<<<<<
+ *     for q in range(q_min, q_max + 1):
+ *         for r in range(r_min, r_max + 1):
+*/
+  __pyx_t_1 = (__pyx_v_ps[1]);
+  __pyx_t_4 = (__pyx_v_ps[2]);
+  __pyx_t_6 = (__pyx_v_ps[0]);
+  __pyx_t_2 = (__pyx_t_1 < __pyx_t_6);
+  if (__pyx_t_2) {
+    __pyx_t_7 = __pyx_t_1;
+  } else {
+    __pyx_t_7 = __pyx_t_6;
+  }
+  __pyx_t_6 = __pyx_t_7;
+  __pyx_t_2 = (__pyx_t_4 < __pyx_t_6);
+  if (__pyx_t_2) {
+    __pyx_t_7 = __pyx_t_4;
+  } else {
+    __pyx_t_7 = __pyx_t_6;
+  }
+  __pyx_v_s_min = __pyx_t_7;
+  __pyx_t_7 = (__pyx_v_ps[1]);
+  __pyx_t_1 = (__pyx_v_ps[2]);
+  __pyx_t_4 = (__pyx_v_ps[0]);
+  __pyx_t_2 = (__pyx_t_7 > __pyx_t_4);
+  if (__pyx_t_2) {
+    __pyx_t_6 = __pyx_t_7;
+  } else {
+    __pyx_t_6 = __pyx_t_4;
+  }
+  __pyx_t_4 = __pyx_t_6;
+  __pyx_t_2 = (__pyx_t_1 > __pyx_t_4);
+  if (__pyx_t_2) {
+    __pyx_t_6 = __pyx_t_1;
+  } else {
+    __pyx_t_6 = __pyx_t_4;
+  }
+  __pyx_v_s_max = __pyx_t_6;
+
+  /* "nonaga_position.pyx":327
+ *     cdef int r_min = min(pr[0], pr[1], pr[2]), r_max = max(pr[0], pr[1], pr[2])
+ *     cdef int s_min = min(ps[0], ps[1], ps[2]), s_max = max(ps[0], ps[1], ps[2])
+ *     for q in range(q_min, q_max + 1):             # <<<<<<<<<<<<<<
+ *         for r in range(r_min, r_max + 1):
+ *             s = -q - r
+*/
+  __pyx_t_8 = (__pyx_v_q_max + 1);
+  __pyx_t_9 = __pyx_t_8;
+  for (__pyx_t_6 = __pyx_v_q_min; __pyx_t_6 < __pyx_t_9; __pyx_t_6+=1) {
+    __pyx_v_q = __pyx_t_6;
+
+    /* "nonaga_position.pyx":328
+ *     cdef int s_min = min(ps[0], ps[1], ps[2]), s_max = max(ps[0], ps[1], ps[2])
+ *     for q in range(q_min, q_max + 1):
+ *         for r in range(r_min, r_max + 1):             # <<<<<<<<<<<<<<
+ *             s = -q - r
+ *             if s < s_min or s > s_max:
+*/
+    __pyx_t_10 = (__pyx_v_r_max + 1);
+    __pyx_t_11 = __pyx_t_10;
+    for (__pyx_t_7 = __pyx_v_r_min; __pyx_t_7 < __pyx_t_11; __pyx_t_7+=1) {
+      __pyx_v_r = __pyx_t_7;
+
+      /* "nonaga_position.pyx":329
+ *     for q in range(q_min, q_max + 1):
+ *         for r in range(r_min, r_max + 1):
+ *             s = -q - r             # <<<<<<<<<<<<<<
+ *             if s < s_min or s > s_max:
+ *                 continue
+*/
+      __pyx_v_s = ((-__pyx_v_q) - __pyx_v_r);
+
+      /* "nonaga_position.pyx":330
+ *         for r in range(r_min, r_max + 1):
+ *             s = -q - r
+ *             if s < s_min or s > s_max:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             cell = cell_index(q, r)
+*/
+      __pyx_t_3 = (__pyx_v_s < __pyx_v_s_min);
+      if (!__pyx_t_3) {
+      } else {
+        __pyx_t_2 = __pyx_t_3;
+        goto __pyx_L16_bool_binop_done;
+      }
+      __pyx_t_3 = (__pyx_v_s > __pyx_v_s_max);
+      __pyx_t_2 = __pyx_t_3;
+      __pyx_L16_bool_binop_done:;
+      if (__pyx_t_2) {
+
+        /* "nonaga_position.pyx":331
+ *             s = -q - r
+ *             if s < s_min or s > s_max:
+ *                 continue             # <<<<<<<<<<<<<<
+ *             cell = cell_index(q, r)
+ *             if position.cells[cell] == CELL_EMPTY:
+*/
+        goto __pyx_L13_continue;
+
+        /* "nonaga_position.pyx":330
+ *         for r in range(r_min, r_max + 1):
+ *             s = -q - r
+ *             if s < s_min or s > s_max:             # <<<<<<<<<<<<<<
+ *                 continue
+ *             cell = cell_index(q, r)
+*/
+      }
+
+      /* "nonaga_position.pyx":332
+ *             if s < s_min or s > s_max:
+ *                 continue
+ *             cell = cell_index(q, r)             # <<<<<<<<<<<<<<
+ *             if position.cells[cell] == CELL_EMPTY:
+ *                 missing += 1
+*/
+      __pyx_t_1 = __pyx_f_12nonaga_board_cell_index(__pyx_v_q, __pyx_v_r); if (unlikely(__pyx_t_1 == ((int)-1) && __Pyx_ErrOccurredWithGIL())) __PYX_ERR(0, 332, __pyx_L1_error)
+      __pyx_v_cell = __pyx_t_1;
+
+      /* "nonaga_position.pyx":333
+ *                 continue
+ *             cell = cell_index(q, r)
+ *             if position.cells[cell] == CELL_EMPTY:             # <<<<<<<<<<<<<<
+ *                 missing += 1
+ *             elif position.cells[cell] == CELL_PIECE:
+*/
+      __pyx_t_2 = ((__pyx_v_position->cells[__pyx_v_cell]) == __pyx_e_12nonaga_board_CELL_EMPTY);
+      if (__pyx_t_2) {
+
+        /* "nonaga_position.pyx":334
+ *             cell = cell_index(q, r)
+ *             if position.cells[cell] == CELL_EMPTY:
+ *                 missing += 1             # <<<<<<<<<<<<<<
+ *             elif position.cells[cell] == CELL_PIECE:
+ *                 for k in range(position.num_pieces):
+*/
+        __pyx_v_missing = (__pyx_v_missing + 1);
+
+        /* "nonaga_position.pyx":333
+ *                 continue
+ *             cell = cell_index(q, r)
+ *             if position.cells[cell] == CELL_EMPTY:             # <<<<<<<<<<<<<<
+ *                 missing += 1
+ *             elif position.cells[cell] == CELL_PIECE:
+*/
+        goto __pyx_L18;
+      }
+
+      /* "nonaga_position.pyx":335
+ *             if position.cells[cell] == CELL_EMPTY:
+ *                 missing += 1
+ *             elif position.cells[cell] == CELL_PIECE:             # <<<<<<<<<<<<<<
+ *                 for k in range(position.num_pieces):
+ *                     if position.piece_cells[k] == cell:
+*/
+      __pyx_t_2 = ((__pyx_v_position->cells[__pyx_v_cell]) == __pyx_e_12nonaga_board_CELL_PIECE);
+      if (__pyx_t_2) {
+
+        /* "nonaga_position.pyx":336
+ *                 missing += 1
+ *             elif position.cells[cell] == CELL_PIECE:
+ *                 for k in range(position.num_pieces):             # <<<<<<<<<<<<<<
+ *                     if position.piece_cells[k] == cell:
+ *                         if position.piece_colors[k] != color:
+*/
+        __pyx_t_1 = __pyx_v_position->num_pieces;
+        __pyx_t_4 = __pyx_t_1;
+        for (__pyx_t_12 = 0; __pyx_t_12 < __pyx_t_4; __pyx_t_12+=1) {
+          __pyx_v_k = __pyx_t_12;
+
+          /* "nonaga_position.pyx":337
+ *             elif position.cells[cell] == CELL_PIECE:
+ *                 for k in range(position.num_pieces):
+ *                     if position.piece_cells[k] == cell:             # <<<<<<<<<<<<<<
+ *                         if position.piece_colors[k] != color:
+ *                             enemies += 1
+*/
+          __pyx_t_2 = ((__pyx_v_position->piece_cells[__pyx_v_k]) == __pyx_v_cell);
+          if (__pyx_t_2) {
+
+            /* "nonaga_position.pyx":338
+ *                 for k in range(position.num_pieces):
+ *                     if position.piece_cells[k] == cell:
+ *                         if position.piece_colors[k] != color:             # <<<<<<<<<<<<<<
+ *                             enemies += 1
+ *                         break
+*/
+            __pyx_t_2 = ((__pyx_v_position->piece_colors[__pyx_v_k]) != __pyx_v_color);
+            if (__pyx_t_2) {
+
+              /* "nonaga_position.pyx":339
+ *                     if position.piece_cells[k] == cell:
+ *                         if position.piece_colors[k] != color:
+ *                             enemies += 1             # <<<<<<<<<<<<<<
+ *                         break
+ *     features[0] = aligned
+*/
+              __pyx_v_enemies = (__pyx_v_enemies + 1);
+
+              /* "nonaga_position.pyx":338
+ *                 for k in range(position.num_pieces):
+ *                     if position.piece_cells[k] == cell:
+ *                         if position.piece_colors[k] != color:             # <<<<<<<<<<<<<<
+ *                             enemies += 1
+ *                         break
+*/
+            }
+
+            /* "nonaga_position.pyx":340
+ *                         if position.piece_colors[k] != color:
+ *                             enemies += 1
+ *                         break             # <<<<<<<<<<<<<<
+ *     features[0] = aligned
+ *     features[1] = distance
+*/
+            goto __pyx_L20_break;
+
+            /* "nonaga_position.pyx":337
+ *             elif position.cells[cell] == CELL_PIECE:
+ *                 for k in range(position.num_pieces):
+ *                     if position.piece_cells[k] == cell:             # <<<<<<<<<<<<<<
+ *                         if position.piece_colors[k] != color:
+ *                             enemies += 1
+*/
+          }
+        }
+        __pyx_L20_break:;
+
+        /* "nonaga_position.pyx":335
+ *             if position.cells[cell] == CELL_EMPTY:
+ *                 missing += 1
+ *             elif position.cells[cell] == CELL_PIECE:             # <<<<<<<<<<<<<<
+ *                 for k in range(position.num_pieces):
+ *                     if position.piece_cells[k] == cell:
+*/
+      }
+      __pyx_L18:;
+      __pyx_L13_continue:;
+    }
+  }
+
+  /* "nonaga_position.pyx":341
+ *                             enemies += 1
+ *                         break
+ *     features[0] = aligned             # <<<<<<<<<<<<<<
+ *     features[1] = distance
+ *     features[2] = missing
+*/
+  (__pyx_v_features[0]) = __pyx_v_aligned;
+
+  /* "nonaga_position.pyx":342
+ *                         break
+ *     features[0] = aligned
+ *     features[1] = distance             # <<<<<<<<<<<<<<
+ *     features[2] = missing
+ *     features[3] = enemies
+*/
+  (__pyx_v_features[1]) = __pyx_v_distance;
+
+  /* "nonaga_position.pyx":343
+ *     features[0] = aligned
+ *     features[1] = distance
+ *     features[2] = missing             # <<<<<<<<<<<<<<
+ *     features[3] = enemies
+ * 
+*/
+  (__pyx_v_features[2]) = __pyx_v_missing;
+
+  /* "nonaga_position.pyx":344
+ *     features[1] = distance
+ *     features[2] = missing
+ *     features[3] = enemies             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  (__pyx_v_features[3]) = __pyx_v_enemies;
+
+  /* "nonaga_position.pyx":298
+ * 
+ * 
+ * cdef void position_features(const Position* position, int color, int* features) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """The four terms of AI.cost_function for one player's pieces.
+ * 
+*/
+
+  /* function exit code */
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __pyx_gilstate_save = __Pyx_PyGILState_Ensure();
+  __Pyx_WriteUnraisable("nonaga_position.position_features", __pyx_clineno, __pyx_lineno, __pyx_filename, 1, 0);
+  __Pyx_PyGILState_Release(__pyx_gilstate_save);
+  __pyx_L0:;
+}
+
+/* "nonaga_position.pyx":347
+ * 
+ * 
+ * cdef void cost_features(const Position* position, int max_color, int* row) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """The 8 terms of AI.cost_function for the player max_color, signed so that the cost is sum(params[k] * row[k])."""
+ *     cdef int mine[4]
+*/
+
+static void __pyx_f_15nonaga_position_cost_features(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_max_color, int *__pyx_v_row) {
+  int __pyx_v_mine[4];
+  int __pyx_v_theirs[4];
+
+  /* "nonaga_position.pyx":351
+ *     cdef int mine[4]
+ *     cdef int theirs[4]
+ *     position_features(position, max_color, mine)             # <<<<<<<<<<<<<<
+ *     position_features(position, (max_color + 1) % 2, theirs)
+ *     row[0] = mine[0]
+*/
+  __pyx_f_15nonaga_position_position_features(__pyx_v_position, __pyx_v_max_color, __pyx_v_mine);
+
+  /* "nonaga_position.pyx":352
+ *     cdef int theirs[4]
+ *     position_features(position, max_color, mine)
+ *     position_features(position, (max_color + 1) % 2, theirs)             # <<<<<<<<<<<<<<
+ *     row[0] = mine[0]
+ *     row[1] = -mine[1]
+*/
+  __pyx_f_15nonaga_position_position_features(__pyx_v_position, __Pyx_mod_long((__pyx_v_max_color + 1), 2, 1), __pyx_v_theirs);
+
+  /* "nonaga_position.pyx":353
+ *     position_features(position, max_color, mine)
+ *     position_features(position, (max_color + 1) % 2, theirs)
+ *     row[0] = mine[0]             # <<<<<<<<<<<<<<
+ *     row[1] = -mine[1]
+ *     row[2] = -mine[2]
+*/
+  (__pyx_v_row[0]) = (__pyx_v_mine[0]);
+
+  /* "nonaga_position.pyx":354
+ *     position_features(position, (max_color + 1) % 2, theirs)
+ *     row[0] = mine[0]
+ *     row[1] = -mine[1]             # <<<<<<<<<<<<<<
+ *     row[2] = -mine[2]
+ *     row[3] = -mine[3]
+*/
+  (__pyx_v_row[1]) = (-(__pyx_v_mine[1]));
+
+  /* "nonaga_position.pyx":355
+ *     row[0] = mine[0]
+ *     row[1] = -mine[1]
+ *     row[2] = -mine[2]             # <<<<<<<<<<<<<<
+ *     row[3] = -mine[3]
+ *     row[4] = -theirs[0]
+*/
+  (__pyx_v_row[2]) = (-(__pyx_v_mine[2]));
+
+  /* "nonaga_position.pyx":356
+ *     row[1] = -mine[1]
+ *     row[2] = -mine[2]
+ *     row[3] = -mine[3]             # <<<<<<<<<<<<<<
+ *     row[4] = -theirs[0]
+ *     row[5] = theirs[1]
+*/
+  (__pyx_v_row[3]) = (-(__pyx_v_mine[3]));
+
+  /* "nonaga_position.pyx":357
+ *     row[2] = -mine[2]
+ *     row[3] = -mine[3]
+ *     row[4] = -theirs[0]             # <<<<<<<<<<<<<<
+ *     row[5] = theirs[1]
+ *     row[6] = theirs[2]
+*/
+  (__pyx_v_row[4]) = (-(__pyx_v_theirs[0]));
+
+  /* "nonaga_position.pyx":358
+ *     row[3] = -mine[3]
+ *     row[4] = -theirs[0]
+ *     row[5] = theirs[1]             # <<<<<<<<<<<<<<
+ *     row[6] = theirs[2]
+ *     row[7] = theirs[3]
+*/
+  (__pyx_v_row[5]) = (__pyx_v_theirs[1]);
+
+  /* "nonaga_position.pyx":359
+ *     row[4] = -theirs[0]
+ *     row[5] = theirs[1]
+ *     row[6] = theirs[2]             # <<<<<<<<<<<<<<
+ *     row[7] = theirs[3]
+ * 
+*/
+  (__pyx_v_row[6]) = (__pyx_v_theirs[2]);
+
+  /* "nonaga_position.pyx":360
+ *     row[5] = theirs[1]
+ *     row[6] = theirs[2]
+ *     row[7] = theirs[3]             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  (__pyx_v_row[7]) = (__pyx_v_theirs[3]);
+
+  /* "nonaga_position.pyx":347
+ * 
+ * 
+ * cdef void cost_features(const Position* position, int max_color, int* row) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """The 8 terms of AI.cost_function for the player max_color, signed so that the cost is sum(params[k] * row[k])."""
+ *     cdef int mine[4]
+*/
+
+  /* function exit code */
+}
+
+/* "nonaga_position.pyx":363
+ * 
+ * 
+ * cdef int position_cost(const Position* position, int max_color, const int* params) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """AI.cost_function of the position for the player max_color, with the same 8 weights."""
+ *     cdef int row[NUM_COST_FEATURES]
+*/
+
+static int __pyx_f_15nonaga_position_position_cost(struct __pyx_t_15nonaga_position_Position const *__pyx_v_position, int __pyx_v_max_color, int const *__pyx_v_params) {
+  int __pyx_v_row[__pyx_e_15nonaga_position_NUM_COST_FEATURES];
+  int __pyx_v_k;
+  int __pyx_v_cost;
+  int __pyx_r;
+  int __pyx_t_1;
+  int __pyx_t_2;
+  int __pyx_t_3;
+
+  /* "nonaga_position.pyx":366
+ *     """AI.cost_function of the position for the player max_color, with the same 8 weights."""
+ *     cdef int row[NUM_COST_FEATURES]
+ *     cdef int k, cost = 0             # <<<<<<<<<<<<<<
+ *     cost_features(position, max_color, row)
+ *     for k in range(NUM_COST_FEATURES):
+*/
+  __pyx_v_cost = 0;
+
+  /* "nonaga_position.pyx":367
+ *     cdef int row[NUM_COST_FEATURES]
+ *     cdef int k, cost = 0
+ *     cost_features(position, max_color, row)             # <<<<<<<<<<<<<<
+ *     for k in range(NUM_COST_FEATURES):
+ *         cost += params[k] * row[k]
+*/
+  __pyx_f_15nonaga_position_cost_features(__pyx_v_position, __pyx_v_max_color, __pyx_v_row);
+
+  /* "nonaga_position.pyx":368
+ *     cdef int k, cost = 0
+ *     cost_features(position, max_color, row)
+ *     for k in range(NUM_COST_FEATURES):             # <<<<<<<<<<<<<<
+ *         cost += params[k] * row[k]
+ *     return cost
+*/
+  __pyx_t_1 = __pyx_e_15nonaga_position_NUM_COST_FEATURES;
+  __pyx_t_2 = __pyx_t_1;
+  for (__pyx_t_3 = 0; __pyx_t_3 < __pyx_t_2; __pyx_t_3+=1) {
+    __pyx_v_k = __pyx_t_3;
+
+    /* "nonaga_position.pyx":369
+ *     cost_features(position, max_color, row)
+ *     for k in range(NUM_COST_FEATURES):
+ *         cost += params[k] * row[k]             # <<<<<<<<<<<<<<
+ *     return cost
+*/
+    __pyx_v_cost = (__pyx_v_cost + ((__pyx_v_params[__pyx_v_k]) * (__pyx_v_row[__pyx_v_k])));
+  }
+
+  /* "nonaga_position.pyx":370
+ *     for k in range(NUM_COST_FEATURES):
+ *         cost += params[k] * row[k]
+ *     return cost             # <<<<<<<<<<<<<<
+*/
+  __pyx_r = __pyx_v_cost;
+  goto __pyx_L0;
+
+  /* "nonaga_position.pyx":363
+ * 
+ * 
+ * cdef int position_cost(const Position* position, int max_color, const int* params) noexcept nogil:             # <<<<<<<<<<<<<<
+ *     """AI.cost_function of the position for the player max_color, with the same 8 weights."""
+ *     cdef int row[NUM_COST_FEATURES]
+*/
+
+  /* function exit code */
+  __pyx_L0:;
+  return __pyx_r;
+}
+/* #### Code section: module_exttypes ### */
+
+static PyMethodDef __pyx_methods[] = {
+  {0, 0, 0, 0}
+};
+/* #### Code section: initfunc_declarations ### */
+static CYTHON_SMALL_CODE int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitGlobals(void); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate); /*proto*/
+static CYTHON_SMALL_CODE int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate); /*proto*/
+/* #### Code section: init_module ### */
+
+static int __Pyx_modinit_global_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_global_init_code", 0);
+  /*--- Global init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_variable_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_export_code", 0);
+  /*--- Variable export code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_export_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_export_code", 0);
+  /*--- Function export code ---*/
+  {
+    __pyx_t_1 = __Pyx_ApiExport_GetApiDict(); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    const char * __pyx_export_signature = __Pyx_PyBytes_AsString(__pyx_mstate_global->__pyx_kp_b_PyObject_struct___pyx_t_15nonaga);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!__pyx_export_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
+    #endif
+    const char * __pyx_export_name = __pyx_export_signature + 866;
+    void (*const __pyx_export_pointers[])(void) = {(void (*)(void))&__pyx_f_15nonaga_position_move_positions, (void (*)(void))&__pyx_f_15nonaga_position_fill_position_tile_moves, (void (*)(void))&__pyx_f_15nonaga_position_fill_position_piece_moves, (void (*)(void))&__pyx_f_15nonaga_position_find_winning_slide, (void (*)(void))&__pyx_f_15nonaga_position_position_won, (void (*)(void))&__pyx_f_15nonaga_position_fill_winning_slides, (void (*)(void))&__pyx_f_15nonaga_position_position_cost, (void (*)(void))&__pyx_f_15nonaga_position_same_position, (void (*)(void))&__pyx_f_15nonaga_position_play_piece_move, (void (*)(void))&__pyx_f_15nonaga_position_play_tile_move, (void (*)(void))&__pyx_f_15nonaga_position_undo_piece_move, (void (*)(void))&__pyx_f_15nonaga_position_undo_tile_move, (void (*)(void))&__pyx_f_15nonaga_position_set_position, (void (*)(void))&__pyx_f_15nonaga_position_load_position, (void (*)(void))&__pyx_f_15nonaga_position_cost_features, (void (*)(void))&__pyx_f_15nonaga_position_position_features, (void (*)(void)) NULL};
+    void (*const *__pyx_export_pointer)(void) = __pyx_export_pointers;
+    const char *__pyx_export_current_signature = __pyx_export_signature;
+    while (*__pyx_export_pointer) {
+      if (__Pyx_ExportFunction(__pyx_t_1, __pyx_export_name, *__pyx_export_pointer, __pyx_export_current_signature) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+      ++__pyx_export_pointer;
+      __pyx_export_name = strchr(__pyx_export_name, '\0') + 1;
+      __pyx_export_signature = strchr(__pyx_export_signature, '\0') + 1;
+      if (*__pyx_export_signature != '\0') __pyx_export_current_signature = __pyx_export_signature;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_type_init_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_init_code", 0);
+  /*--- Type init code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_type_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_type_import_code", 0);
+  /*--- Type import code ---*/
+  __pyx_t_1 = PyImport_ImportModule("nonaga_board"); if (unlikely(!__pyx_t_1)) __PYX_ERR(1, 48, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaTilesCoordinates",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTilesCoordinates),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates) __PYX_ERR(1, 48, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaTilesCoordinates = (struct __pyx_vtabstruct_12nonaga_board_NonagaTilesCoordinates*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTilesCoordinates); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaTilesCoordinates)) __PYX_ERR(1, 48, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTile = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaTile",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTile), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTile),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTile), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTile),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaTile), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaTile),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTile) __PYX_ERR(1, 57, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaTile = (struct __pyx_vtabstruct_12nonaga_board_NonagaTile*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaTile); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaTile)) __PYX_ERR(1, 57, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaPiece = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaPiece",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaPiece), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaPiece),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaPiece), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaPiece),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaPiece), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaPiece),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaPiece) __PYX_ERR(1, 61, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaPiece = (struct __pyx_vtabstruct_12nonaga_board_NonagaPiece*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaPiece); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaPiece)) __PYX_ERR(1, 61, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaIsland = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaIsland",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaIsland), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaIsland),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaIsland), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaIsland),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaIsland), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaIsland),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaIsland) __PYX_ERR(1, 68, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaIsland = (struct __pyx_vtabstruct_12nonaga_board_NonagaIsland*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaIsland); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaIsland)) __PYX_ERR(1, 68, __pyx_L1_error)
+  __pyx_mstate->__pyx_ptype_12nonaga_board_NonagaBoard = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_board", "NonagaBoard",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaBoard), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaBoard),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaBoard), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaBoard),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_board_NonagaBoard), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_board_NonagaBoard),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaBoard) __PYX_ERR(1, 98, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_board_NonagaBoard = (struct __pyx_vtabstruct_12nonaga_board_NonagaBoard*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_board_NonagaBoard); if (unlikely(!__pyx_vtabptr_12nonaga_board_NonagaBoard)) __PYX_ERR(1, 98, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __pyx_t_1 = PyImport_ImportModule("nonaga_logic"); if (unlikely(!__pyx_t_1)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_1);
+  __pyx_mstate->__pyx_ptype_12nonaga_logic_NonagaLogic = __Pyx_ImportType_3_2_4(__pyx_t_1, "nonaga_logic", "NonagaLogic",
+  #if defined(PYPY_VERSION_NUM) && PYPY_VERSION_NUM < 0x050B0000
+  sizeof(struct __pyx_obj_12nonaga_logic_NonagaLogic), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_logic_NonagaLogic),
+  #elif CYTHON_COMPILING_IN_LIMITED_API
+  sizeof(struct __pyx_obj_12nonaga_logic_NonagaLogic), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_logic_NonagaLogic),
+  #else
+  sizeof(struct __pyx_obj_12nonaga_logic_NonagaLogic), __PYX_GET_STRUCT_ALIGNMENT_3_2_4(struct __pyx_obj_12nonaga_logic_NonagaLogic),
+  #endif
+  __Pyx_ImportType_CheckSize_Warn_3_2_4); if (!__pyx_mstate->__pyx_ptype_12nonaga_logic_NonagaLogic) __PYX_ERR(2, 4, __pyx_L1_error)
+  __pyx_vtabptr_12nonaga_logic_NonagaLogic = (struct __pyx_vtabstruct_12nonaga_logic_NonagaLogic*)__Pyx_GetVtable(__pyx_mstate->__pyx_ptype_12nonaga_logic_NonagaLogic); if (unlikely(!__pyx_vtabptr_12nonaga_logic_NonagaLogic)) __PYX_ERR(2, 4, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+static int __Pyx_modinit_variable_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_modinit_variable_import_code", 0);
+  /*--- Variable import code ---*/
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+
+static int __Pyx_modinit_function_import_code(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  PyObject *__pyx_t_1 = NULL;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannySetupContext("__Pyx_modinit_function_import_code", 0);
+  /*--- Function import code ---*/
+  {
+    __pyx_t_1 = PyImport_ImportModule("nonaga_board"); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+    __Pyx_GOTREF(__pyx_t_1);
+    const char * __pyx_import_signature = __Pyx_PyBytes_AsString(__pyx_mstate_global->__pyx_kp_b_int_int_int_int_int_int_unsigned);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (unlikely(!__pyx_import_signature)) __PYX_ERR(0, 1, __pyx_L1_error)
+    #endif
+    const char * __pyx_import_name = __pyx_import_signature + 198;
+    void (**const __pyx_import_pointers[])(void) = {(void (**)(void))&__pyx_f_12nonaga_board_is_movable_tile, (void (**)(void))&__pyx_f_12nonaga_board_is_valid_tile_destination_mask, (void (**)(void))&__pyx_f_12nonaga_board_step_cell, (void (**)(void))&__pyx_f_12nonaga_board_slide_moves, (void (**)(void))&__pyx_f_12nonaga_board_neighbor_mask, (void (**)(void))&__pyx_f_12nonaga_board_articulation_tiles, (void (**)(void)) NULL};
+    void (**const *__pyx_import_pointer)(void) = __pyx_import_pointers;
+    const char *__pyx_import_current_signature = __pyx_import_signature;
+    while (*__pyx_import_pointer) {
+      if (__Pyx_ImportFunction_3_2_4(__pyx_t_1, __pyx_import_name, *__pyx_import_pointer, __pyx_import_current_signature) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+      ++__pyx_import_pointer;
+      __pyx_import_name = strchr(__pyx_import_name, '\0') + 1;
+      __pyx_import_signature = strchr(__pyx_import_signature, '\0') + 1;
+      if (*__pyx_import_signature != '\0') __pyx_import_current_signature = __pyx_import_signature;
+    }
+    __Pyx_DECREF(__pyx_t_1); __pyx_t_1 = 0;
+  }
+  __Pyx_RefNannyFinishContext();
+  return 0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_1);
+  __Pyx_RefNannyFinishContext();
+  return -1;
+}
+
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+static PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def); /*proto*/
+static int __pyx_pymod_exec_nonaga_position(PyObject* module); /*proto*/
+static PyModuleDef_Slot __pyx_moduledef_slots[] = {
+  {Py_mod_create, (void*)__pyx_pymod_create},
+  {Py_mod_exec, (void*)__pyx_pymod_exec_nonaga_position},
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  {Py_mod_gil, __Pyx_FREETHREADING_COMPATIBLE},
+  #endif
+  #if PY_VERSION_HEX >= 0x030C0000 && CYTHON_USE_MODULE_STATE
+  {Py_mod_multiple_interpreters, Py_MOD_MULTIPLE_INTERPRETERS_NOT_SUPPORTED},
+  #endif
+  {0, NULL}
+};
+#endif
+
+#ifdef __cplusplus
+namespace {
+  struct PyModuleDef __pyx_moduledef =
+  #else
+  static struct PyModuleDef __pyx_moduledef =
+  #endif
+  {
+      PyModuleDef_HEAD_INIT,
+      "nonaga_position",
+      0, /* m_doc */
+    #if CYTHON_USE_MODULE_STATE
+      sizeof(__pyx_mstatetype), /* m_size */
+    #else
+      (CYTHON_PEP489_MULTI_PHASE_INIT) ? 0 : -1, /* m_size */
+    #endif
+      __pyx_methods /* m_methods */,
+    #if CYTHON_PEP489_MULTI_PHASE_INIT
+      __pyx_moduledef_slots, /* m_slots */
+    #else
+      NULL, /* m_reload */
+    #endif
+    #if CYTHON_USE_MODULE_STATE
+      __pyx_m_traverse, /* m_traverse */
+      __pyx_m_clear, /* m_clear */
+      NULL /* m_free */
+    #else
+      NULL, /* m_traverse */
+      NULL, /* m_clear */
+      NULL /* m_free */
+    #endif
+  };
+  #ifdef __cplusplus
+} /* anonymous namespace */
+#endif
+
+/* PyModInitFuncType */
+#ifndef CYTHON_NO_PYINIT_EXPORT
+  #define __Pyx_PyMODINIT_FUNC PyMODINIT_FUNC
+#else
+  #ifdef __cplusplus
+  #define __Pyx_PyMODINIT_FUNC extern "C" PyObject *
+  #else
+  #define __Pyx_PyMODINIT_FUNC PyObject *
+  #endif
+#endif
+
+__Pyx_PyMODINIT_FUNC PyInit_nonaga_position(void) CYTHON_SMALL_CODE; /*proto*/
+__Pyx_PyMODINIT_FUNC PyInit_nonaga_position(void)
+#if CYTHON_PEP489_MULTI_PHASE_INIT
+{
+  return PyModuleDef_Init(&__pyx_moduledef);
+}
+/* ModuleCreationPEP489 */
+#if CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
+      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+static PY_INT64_T __Pyx_GetCurrentInterpreterId(void) {
+    {
+        PyObject *module = PyImport_ImportModule("_interpreters"); // 3.13+ I think
+        if (!module) {
+            PyErr_Clear(); // just try the 3.8-3.12 version
+            module = PyImport_ImportModule("_xxsubinterpreters");
+            if (!module) goto bad;
+        }
+        PyObject *current = PyObject_CallMethod(module, "get_current", NULL);
+        Py_DECREF(module);
+        if (!current) goto bad;
+        if (PyTuple_Check(current)) {
+            PyObject *new_current = PySequence_GetItem(current, 0);
+            Py_DECREF(current);
+            current = new_current;
+            if (!new_current) goto bad;
+        }
+        long long as_c_int = PyLong_AsLongLong(current);
+        Py_DECREF(current);
+        return as_c_int;
+    }
+  bad:
+    PySys_WriteStderr("__Pyx_GetCurrentInterpreterId failed. Try setting the C define CYTHON_PEP489_MULTI_PHASE_INIT=0\n");
+    return -1;
+}
+#endif
+#if !CYTHON_USE_MODULE_STATE
+static CYTHON_SMALL_CODE int __Pyx_check_single_interpreter(void) {
+    static PY_INT64_T main_interpreter_id = -1;
+#if CYTHON_COMPILING_IN_GRAAL && defined(GRAALPY_VERSION_NUM) && GRAALPY_VERSION_NUM > 0x19000000
+    PY_INT64_T current_id = GraalPyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_GRAAL
+    PY_INT64_T current_id = PyInterpreterState_GetIDFromThreadState(PyThreadState_Get());
+#elif CYTHON_COMPILING_IN_LIMITED_API && (__PYX_LIMITED_VERSION_HEX < 0x03090000\
+      || ((defined(_WIN32) || defined(WIN32) || defined(MS_WINDOWS)) && __PYX_LIMITED_VERSION_HEX < 0x030A0000))
+    PY_INT64_T current_id = __Pyx_GetCurrentInterpreterId();
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyInterpreterState_Get());
+#else
+    PY_INT64_T current_id = PyInterpreterState_GetID(PyThreadState_Get()->interp);
+#endif
+    if (unlikely(current_id == -1)) {
+        return -1;
+    }
+    if (main_interpreter_id == -1) {
+        main_interpreter_id = current_id;
+        return 0;
+    } else if (unlikely(main_interpreter_id != current_id)) {
+        PyErr_SetString(
+            PyExc_ImportError,
+            "Interpreter change detected - this module can only be loaded into one interpreter per process.");
+        return -1;
+    }
+    return 0;
+}
+#endif
+static CYTHON_SMALL_CODE int __Pyx_copy_spec_to_module(PyObject *spec, PyObject *moddict, const char* from_name, const char* to_name, int allow_none)
+{
+    PyObject *value = PyObject_GetAttrString(spec, from_name);
+    int result = 0;
+    if (likely(value)) {
+        if (allow_none || value != Py_None) {
+            result = PyDict_SetItemString(moddict, to_name, value);
+        }
+        Py_DECREF(value);
+    } else if (PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        PyErr_Clear();
+    } else {
+        result = -1;
+    }
+    return result;
+}
+static CYTHON_SMALL_CODE PyObject* __pyx_pymod_create(PyObject *spec, PyModuleDef *def) {
+    PyObject *module = NULL, *moddict, *modname;
+    CYTHON_UNUSED_VAR(def);
+    #if !CYTHON_USE_MODULE_STATE
+    if (__Pyx_check_single_interpreter())
+        return NULL;
+    #endif
+    if (__pyx_m)
+        return __Pyx_NewRef(__pyx_m);
+    modname = PyObject_GetAttrString(spec, "name");
+    if (unlikely(!modname)) goto bad;
+    module = PyModule_NewObject(modname);
+    Py_DECREF(modname);
+    if (unlikely(!module)) goto bad;
+    moddict = PyModule_GetDict(module);
+    if (unlikely(!moddict)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "loader", "__loader__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "origin", "__file__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "parent", "__package__", 1) < 0)) goto bad;
+    if (unlikely(__Pyx_copy_spec_to_module(spec, moddict, "submodule_search_locations", "__path__", 0) < 0)) goto bad;
+    return module;
+bad:
+    Py_XDECREF(module);
+    return NULL;
+}
+
+
+static CYTHON_SMALL_CODE int __pyx_pymod_exec_nonaga_position(PyObject *__pyx_pyinit_module)
+#endif
+{
+  int stringtab_initialized = 0;
+  #if CYTHON_USE_MODULE_STATE
+  int pystate_addmodule_run = 0;
+  #endif
+  __pyx_mstatetype *__pyx_mstate = NULL;
+  PyObject *__pyx_t_1 = NULL;
+  PyObject *__pyx_t_2 = NULL;
+  Py_ssize_t __pyx_t_3;
+  PyObject *__pyx_t_4 = NULL;
+  int __pyx_t_5;
+  int __pyx_lineno = 0;
+  const char *__pyx_filename = NULL;
+  int __pyx_clineno = 0;
+  __Pyx_RefNannyDeclarations
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  if (__pyx_m) {
+    if (__pyx_m == __pyx_pyinit_module) return 0;
+    PyErr_SetString(PyExc_RuntimeError, "Module 'nonaga_position' has already been imported. Re-initialisation is not supported.");
+    return -1;
+  }
+  #else
+  if (__pyx_m) return __Pyx_NewRef(__pyx_m);
+  #endif
+  /*--- Module creation code ---*/
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  __pyx_t_1 = __pyx_pyinit_module;
+  Py_INCREF(__pyx_t_1);
+  #else
+  __pyx_t_1 = PyModule_Create(&__pyx_moduledef); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 1, __pyx_L1_error)
+  #endif
+  #if CYTHON_USE_MODULE_STATE
+  {
+    int add_module_result = __Pyx_State_AddModule(__pyx_t_1, &__pyx_moduledef);
+    __pyx_t_1 = 0; /* transfer ownership from __pyx_t_1 to "nonaga_position" pseudovariable */
+    if (unlikely((add_module_result < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    pystate_addmodule_run = 1;
+  }
+  #else
+  __pyx_m = __pyx_t_1;
+  #endif
+  #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  PyUnstable_Module_SetGIL(__pyx_m, Py_MOD_GIL_USED);
+  #endif
+  __pyx_mstate = __pyx_mstate_global;
+  CYTHON_UNUSED_VAR(__pyx_t_1);
+  __pyx_mstate->__pyx_d = PyModule_GetDict(__pyx_m); if (unlikely(!__pyx_mstate->__pyx_d)) __PYX_ERR(0, 1, __pyx_L1_error)
+  Py_INCREF(__pyx_mstate->__pyx_d);
+  __pyx_mstate->__pyx_b = __Pyx_PyImport_AddModuleRef(__Pyx_BUILTIN_MODULE_NAME); if (unlikely(!__pyx_mstate->__pyx_b)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_cython_runtime = __Pyx_PyImport_AddModuleRef("cython_runtime"); if (unlikely(!__pyx_mstate->__pyx_cython_runtime)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (PyObject_SetAttrString(__pyx_m, "__builtins__", __pyx_mstate->__pyx_b) < 0) __PYX_ERR(0, 1, __pyx_L1_error)
+  /* ImportRefnannyAPI */
+  #if CYTHON_REFNANNY
+  __Pyx_RefNanny = __Pyx_RefNannyImportAPI("refnanny");
+  if (!__Pyx_RefNanny) {
+    PyErr_Clear();
+    __Pyx_RefNanny = __Pyx_RefNannyImportAPI("Cython.Runtime.refnanny");
+    if (!__Pyx_RefNanny)
+        Py_FatalError("failed to import 'refnanny' module");
+  }
+  #endif
+  
+__Pyx_RefNannySetupContext("PyInit_nonaga_position", 0);
+  __Pyx_init_runtime_version();
+  if (__Pyx_check_binary_version(__PYX_LIMITED_VERSION_HEX, __Pyx_get_runtime_version(), CYTHON_COMPILING_IN_LIMITED_API) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_tuple = PyTuple_New(0); if (unlikely(!__pyx_mstate->__pyx_empty_tuple)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_bytes = PyBytes_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_bytes)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __pyx_mstate->__pyx_empty_unicode = PyUnicode_FromStringAndSize("", 0); if (unlikely(!__pyx_mstate->__pyx_empty_unicode)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Library function declarations ---*/
+  /*--- Initialize various global constants etc. ---*/
+  if (__Pyx_InitConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  stringtab_initialized = 1;
+  if (__Pyx_InitGlobals() < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__pyx_module_is_main_nonaga_position) {
+    if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_name, __pyx_mstate_global->__pyx_n_u_main) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  }
+  {
+    PyObject *modules = PyImport_GetModuleDict(); if (unlikely(!modules)) __PYX_ERR(0, 1, __pyx_L1_error)
+    if (!PyDict_GetItemString(modules, "nonaga_position")) {
+      if (unlikely((PyDict_SetItemString(modules, "nonaga_position", __pyx_m) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+    }
+  }
+  /*--- Builtin init code ---*/
+  if (__Pyx_InitCachedBuiltins(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Constants init code ---*/
+  if (__Pyx_InitCachedConstants(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  if (__Pyx_CreateCodeObjects(__pyx_mstate) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Global type/function init code ---*/
+  (void)__Pyx_modinit_global_init_code(__pyx_mstate);
+  (void)__Pyx_modinit_variable_export_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_function_export_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_type_init_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_type_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  (void)__Pyx_modinit_variable_import_code(__pyx_mstate);
+  if (unlikely((__Pyx_modinit_function_import_code(__pyx_mstate) < 0))) __PYX_ERR(0, 1, __pyx_L1_error)
+  /*--- Execution code ---*/
+
+  /* "nonaga_position.pyx":5
+ * from libc.string cimport memcmp, memmove, memset
+ * 
+ * from nonaga_constants import PIECE_TO_MOVE, TILE_TO_MOVE             # <<<<<<<<<<<<<<
+ * from nonaga_board cimport (NonagaBoard, NonagaPiece, NonagaTile, GRID_BITS, GRID_MASK, GRID_CELLS, CELL_EMPTY, CELL_TILE, CELL_PIECE,
+ *                            MAX_PIECE_MOVES,
+*/
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_PIECE_TO_MOVE,__pyx_mstate_global->__pyx_n_u_TILE_TO_MOVE};
+    __pyx_t_1 = __Pyx_Import(__pyx_mstate_global->__pyx_n_u_nonaga_constants, __pyx_imported_names, 2, NULL, 0); if (unlikely(!__pyx_t_1)) __PYX_ERR(0, 5, __pyx_L1_error)
+  }
+  __pyx_t_2 = __pyx_t_1;
+  __Pyx_GOTREF(__pyx_t_2);
+  {
+    PyObject* const __pyx_imported_names[] = {__pyx_mstate_global->__pyx_n_u_PIECE_TO_MOVE,__pyx_mstate_global->__pyx_n_u_TILE_TO_MOVE};
+    for (__pyx_t_3=0; __pyx_t_3 < 2; __pyx_t_3++) {
+      __pyx_t_4 = __Pyx_ImportFrom(__pyx_t_2, __pyx_imported_names[__pyx_t_3]); if (unlikely(!__pyx_t_4)) __PYX_ERR(0, 5, __pyx_L1_error)
+      __Pyx_GOTREF(__pyx_t_4);
+      if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_imported_names[__pyx_t_3], __pyx_t_4) < (0)) __PYX_ERR(0, 5, __pyx_L1_error)
+      __Pyx_DECREF(__pyx_t_4); __pyx_t_4 = 0;
+    }
+  }
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /* "nonaga_position.pyx":13
+ * from nonaga_logic cimport NonagaLogic
+ * 
+ * cdef int _PIECE_TO_MOVE = PIECE_TO_MOVE             # <<<<<<<<<<<<<<
+ * cdef int _TILE_TO_MOVE = TILE_TO_MOVE
+ * 
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_PIECE_TO_MOVE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyLong_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 13, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_15nonaga_position__PIECE_TO_MOVE = __pyx_t_5;
+
+  /* "nonaga_position.pyx":14
+ * 
+ * cdef int _PIECE_TO_MOVE = PIECE_TO_MOVE
+ * cdef int _TILE_TO_MOVE = TILE_TO_MOVE             # <<<<<<<<<<<<<<
+ * 
+ * 
+*/
+  __Pyx_GetModuleGlobalName(__pyx_t_2, __pyx_mstate_global->__pyx_n_u_TILE_TO_MOVE); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  __pyx_t_5 = __Pyx_PyLong_As_int(__pyx_t_2); if (unlikely((__pyx_t_5 == (int)-1) && PyErr_Occurred())) __PYX_ERR(0, 14, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+  __pyx_v_15nonaga_position__TILE_TO_MOVE = __pyx_t_5;
+
+  /* "nonaga_position.pyx":1
+ * # cython: language_level=3, boundscheck=False, wraparound=False             # <<<<<<<<<<<<<<
+ * # Not profiled: its functions run without the GIL, millions of times per search, and trace hooks would dwarf them
+ * from libc.string cimport memcmp, memmove, memset
+*/
+  __pyx_t_2 = __Pyx_PyDict_NewPresized(0); if (unlikely(!__pyx_t_2)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_GOTREF(__pyx_t_2);
+  if (PyDict_SetItem(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_test, __pyx_t_2) < (0)) __PYX_ERR(0, 1, __pyx_L1_error)
+  __Pyx_DECREF(__pyx_t_2); __pyx_t_2 = 0;
+
+  /*--- Wrapped vars code ---*/
+
+  goto __pyx_L0;
+  __pyx_L1_error:;
+  __Pyx_XDECREF(__pyx_t_2);
+  __Pyx_XDECREF(__pyx_t_4);
+  if (__pyx_m) {
+    if (__pyx_mstate->__pyx_d && stringtab_initialized) {
+      __Pyx_AddTraceback("init nonaga_position", __pyx_clineno, __pyx_lineno, __pyx_filename);
+    }
+    #if !CYTHON_USE_MODULE_STATE
+    Py_CLEAR(__pyx_m);
+    #else
+    Py_DECREF(__pyx_m);
+    if (pystate_addmodule_run) {
+      PyObject *tp, *value, *tb;
+      PyErr_Fetch(&tp, &value, &tb);
+      PyState_RemoveModule(&__pyx_moduledef);
+      PyErr_Restore(tp, value, tb);
+    }
+    #endif
+  } else if (!PyErr_Occurred()) {
+    PyErr_SetString(PyExc_ImportError, "init nonaga_position");
+  }
+  __pyx_L0:;
+  __Pyx_RefNannyFinishContext();
+  #if CYTHON_PEP489_MULTI_PHASE_INIT
+  return (__pyx_m != NULL) ? 0 : -1;
+  #else
+  return __pyx_m;
+  #endif
+}
+/* #### Code section: pystring_table ### */
+/* #### Code section: cached_builtins ### */
+
+static int __Pyx_InitCachedBuiltins(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  return 0;
+}
+/* #### Code section: cached_constants ### */
+
+static int __Pyx_InitCachedConstants(__pyx_mstatetype *__pyx_mstate) {
+  __Pyx_RefNannyDeclarations
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  __Pyx_RefNannySetupContext("__Pyx_InitCachedConstants", 0);
+  __Pyx_RefNannyFinishContext();
+  return 0;
+}
+/* #### Code section: init_constants ### */
+
+static int __Pyx_InitConstants(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  {
+    const struct { const unsigned int length: 11; } index[] = {{1},{40},{1},{13},{12},{18},{8},{10},{8},{16},{12},{14},{12},{10},{8},{1132},{299}};
+    #if (CYTHON_COMPRESS_STRINGS) == 2 /* compression: bz2 (522 bytes) */
+const char* const cstring = "BZh91AY&SY\247\014:\310\000\000\212_\200@\000@u2\000\212'\305\000\277\377\377\340@\0021\n\353I\t\"\2311\t\246&\215O)\240\321\017\324\230\320$\324\205O\024mFj\231\244=\r@\320\364@`\001\243CF\021\223A\243M\001\202JL\202f\223\324h`\232\000d\006\226F?O\277\354[^,<\357\362\273\213^\206\307J\374gFy\263\023\234E\005!\317\256\240,\213\027\321\204\351\211W\033\014\252JU\035\333\340\007\352\261c\375\276Cd3\224\240\261Z \r\010\210 2d\314\202r\305\0134,\365\333\267\217W\365\355\034\354^\204\014} \013&\271\216\035\207\r\363\005Q\256`\243!\202,\025u\335\274\333K\220\236_\237<\251\030\273\325gXR)ByyW\347d\254\005\330z$\276\013\001=R\245\226+e\032B\373\022Ww\277\342\351$\276\243\336\243\204\343\323\355oQ]\371\037n=\333t)\251\245j\016\371\252\266p\205\315q\302\023\"T\312\265M\356V7k\267\026Q\300q\265\n\342\370\276\306(\0363Sh[5\016\220\240\361\2073\215\346!\225\246)+\361\031pZl\307\010\242\000\340}*4\252S\351key\231,\020@A\355\210La0 h\341\001\260\306\024\r8\231=n\014\307\031)a\005\na6\271\210(:\031\2260\223\251\"\200[u\214\207iz8\t\227\277\360&\231\306\020\304$,\037\231l\365\336\255Q=\030@w\274I\371!\037\315\263\323\301n\204\302\n\313\320xr\305OA\322L0\314\222c8&6\350T\350R\301\222|\t\023\214\306d\003\"\370m\200\206*\257m9\002\311\313\0045B\221\021\200T%HL\302[\213\227\032\246\376L4m\251$\325\024\265\2414\271\371$+v\205\345\353\003\013X\010!\303\335%o9\234\322_\242\356H\247\n\022\024\341\207Y\000";
+    PyObject *data = __Pyx_DecompressString(cstring, 522, 2);
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #elif (CYTHON_COMPRESS_STRINGS) != 0 /* compression: zlib (441 bytes) */
+const char* const cstring = "x\332\255TKo\3330\014\326O\321q\t\206\002\035\260\363\016C\016\005\332%\207`W\202\226\025W\255Ly\026\235.\377~z8~\364\201\325i}\220I\361\373H\212\242x\265wN\326H'\311\306j/]+\033\243U\220\016AD\271s\336\260qt\365cw\263\371\271\201\375\026\356\266\2777\373\233\333AV\326\220\006C\300-*]\240z\004\2501\350\341\253]\331Y\035%\302:\374\311\021V\010\312\221g$\366\000\315\351/(lL\304D\371\310Xd\306\237\016mfy\315\245>`g\031\200\265\017\353\356\264-\036\264b\271\376\342\271\355\202\220\331\014\327\337\373\030M\2379\234\217 ST\271\376*\rqZV\",r\201\207\314\225\353\305\304i\350\017\322W\342#\354\317\310 \373\350w.\367\264\230\262\022Gg\312\345\367\025*&.\244\316\216\372R\371\217\371\265\216\273 \217\031\330\025\017p\375\255\207[W\031\005\277\222r\033\345K\212\364j{\210\332\035\365\000\366\342`\254\035\271qV@D<7\244\3311X\250\204'Cd\250\002oM\251\305\200{r\224\2313\273\037\001\312y\026>\276\376\363\226h,\236&\001\262>d\":*\335\324\234\364\321\034f\310\350\312:,G-\306\202\203F\356\332i\n\347\235\324\337\223\207\367lzt\344ME\272\224\352\036\333%\2750\177\212o\2739\337\350;\003\365n\347\277\020\304\307:\244\331\032\213\022\365#\206\242\347\022\205\332\263!L\347\256\321?\n\317\272\001\245\255\025\351f\372+%m\252\373\302\265\031\203-\033\325Y\034Z\302\377\003\271UK\002";
+    PyObject *data = __Pyx_DecompressString(cstring, 441, 1);
+    if (unlikely(!data)) __PYX_ERR(0, 1, __pyx_L1_error)
+    const char* const bytes = __Pyx_PyBytes_AsString(data);
+    #if !CYTHON_ASSUME_SAFE_MACROS
+    if (likely(bytes)); else { Py_DECREF(data); __PYX_ERR(0, 1, __pyx_L1_error) }
+    #endif
+    #else /* compression: none (1614 bytes) */
+const char* const bytes = ".Too many tiles or pieces for a Position.?PIECE_TO_MOVETILE_TO_MOVEcline_in_traceback__main____module____name__nonaga_constants__pyx_capi____pyx_vtable____qualname__setdefault__test__PyObject *(struct __pyx_t_15nonaga_position_Position const *, int, int)\000int (struct __pyx_t_15nonaga_position_Position *, int *)\000int (struct __pyx_t_15nonaga_position_Position const *, int *)\000int (struct __pyx_t_15nonaga_position_Position const *, int)\000\000int (struct __pyx_t_15nonaga_position_Position const *, int, int *)\000int (struct __pyx_t_15nonaga_position_Position const *, int, int const *)\000int (struct __pyx_t_15nonaga_position_Position const *, struct __pyx_t_15nonaga_position_Position const *)\000void (struct __pyx_t_15nonaga_position_Position *, int)\000\000\000\000void (struct __pyx_t_15nonaga_position_Position *, int, int const *, int const *, int, int const *, int const *, int const *, int, int)\000void (struct __pyx_t_15nonaga_position_Position *, struct __pyx_obj_12nonaga_logic_NonagaLogic *)\000void (struct __pyx_t_15nonaga_position_Position const *, int, int *)\000\000move_positions\000fill_position_tile_moves\000fill_position_piece_moves\000find_winning_slide\000position_won\000fill_winning_slides\000position_cost\000same_position\000play_piece_move\000play_tile_move\000undo_piece_move\000undo_tile_move\000set_position\000load_position\000cost_features\000position_featuresint (int)\000\000int (int, int)\000int (unsigned char const *, int const *, int const *, int, int, int *)\000int (unsigned char const *, int)\000void (unsigned char const *, int const *, int, int *, int *, int *)\000is_movable_tile\000is_valid_tile_destination_mask\000step_cell\000slide_moves\000neighbor_mask\000articulation_tiles";
+    PyObject *data = NULL;
+    CYTHON_UNUSED_VAR(__Pyx_DecompressString);
+    #endif
+    PyObject **stringtab = __pyx_mstate->__pyx_string_tab;
+    Py_ssize_t pos = 0;
+    for (int i = 0; i < 15; i++) {
+      Py_ssize_t bytes_length = index[i].length;
+      PyObject *string = PyUnicode_DecodeUTF8(bytes + pos, bytes_length, NULL);
+      if (likely(string) && i >= 3) PyUnicode_InternInPlace(&string);
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+      stringtab[i] = string;
+      pos += bytes_length;
+    }
+    for (int i = 15; i < 17; i++) {
+      Py_ssize_t bytes_length = index[i].length;
+      PyObject *string = PyBytes_FromStringAndSize(bytes + pos, bytes_length);
+      stringtab[i] = string;
+      pos += bytes_length;
+      if (unlikely(!string)) {
+        Py_XDECREF(data);
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    Py_XDECREF(data);
+    for (Py_ssize_t i = 0; i < 17; i++) {
+      if (unlikely(PyObject_Hash(stringtab[i]) == -1)) {
+        __PYX_ERR(0, 1, __pyx_L1_error)
+      }
+    }
+    #if CYTHON_IMMORTAL_CONSTANTS
+    {
+      PyObject **table = stringtab + 15;
+      for (Py_ssize_t i=0; i<2; ++i) {
+        #if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+        #if PY_VERSION_HEX < 0x030E0000
+        if (_Py_IsOwnedByCurrentThread(table[i]) && Py_REFCNT(table[i]) == 1)
+        #else
+        if (PyUnstable_Object_IsUniquelyReferenced(table[i]))
+        #endif
+        {
+          Py_SET_REFCNT(table[i], _Py_IMMORTAL_REFCNT_LOCAL);
+        }
+        #else
+        Py_SET_REFCNT(table[i], _Py_IMMORTAL_INITIAL_REFCNT);
+        #endif
+      }
+    }
+    #endif
+  }
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: init_codeobjects ### */
+
+static int __Pyx_CreateCodeObjects(__pyx_mstatetype *__pyx_mstate) {
+  CYTHON_UNUSED_VAR(__pyx_mstate);
+  return 0;
+}
+/* #### Code section: init_globals ### */
+
+static int __Pyx_InitGlobals(void) {
+  /* PythonCompatibility.init */
+  if (likely(__Pyx_init_co_variables() == 0)); else
+  
+  if (unlikely(PyErr_Occurred())) __PYX_ERR(0, 1, __pyx_L1_error)
+
+  return 0;
+  __pyx_L1_error:;
+  return -1;
+}
+/* #### Code section: cleanup_globals ### */
+/* #### Code section: cleanup_module ### */
+/* #### Code section: main_method ### */
+/* #### Code section: utility_code_pragmas ### */
+#ifdef _MSC_VER
+#pragma warning( push )
+/* Warning 4127: conditional expression is constant
+ * Cython uses constant conditional expressions to allow in inline functions to be optimized at
+ * compile-time, so this warning is not useful
+ */
+#pragma warning( disable : 4127 )
+#endif
+
+
+
+/* #### Code section: utility_code_def ### */
+
+/* --- Runtime support code --- */
+/* Refnanny */
+#if CYTHON_REFNANNY
+static __Pyx_RefNannyAPIStruct *__Pyx_RefNannyImportAPI(const char *modname) {
+    PyObject *m = NULL, *p = NULL;
+    void *r = NULL;
+    m = PyImport_ImportModule(modname);
+    if (!m) goto end;
+    p = PyObject_GetAttrString(m, "RefNannyAPI");
+    if (!p) goto end;
+    r = PyLong_AsVoidPtr(p);
+end:
+    Py_XDECREF(p);
+    Py_XDECREF(m);
+    return (__Pyx_RefNannyAPIStruct *)r;
+}
+#endif
+
+/* DivInt[long] */
+static CYTHON_INLINE long __Pyx_div_long(long a, long b, int b_is_constant) {
+    long q = a / b;
+    long r = a - q*b;
+    long adapt_python = (b_is_constant ?
+        ((r != 0) & ((r < 0) ^ (b < 0))) :
+        ((r != 0) & ((r ^ b) < 0))
+    );
+    return q - adapt_python;
+}
+
+/* ErrOccurredWithGIL */
+static CYTHON_INLINE int __Pyx_ErrOccurredWithGIL(void) {
+  int err;
+  PyGILState_STATE _save = PyGILState_Ensure();
+  err = !!PyErr_Occurred();
+  PyGILState_Release(_save);
+  return err;
+}
+
+/* PyErrFetchRestore (used by WriteUnraisableException) */
+#if CYTHON_FAST_THREAD_STATE
+static CYTHON_INLINE void __Pyx_ErrRestoreInState(PyThreadState *tstate, PyObject *type, PyObject *value, PyObject *tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *tmp_value;
+    assert(type == NULL || (value != NULL && type == (PyObject*) Py_TYPE(value)));
+    if (value) {
+        #if CYTHON_COMPILING_IN_CPYTHON
+        if (unlikely(((PyBaseExceptionObject*) value)->traceback != tb))
+        #endif
+            PyException_SetTraceback(value, tb);
+    }
+    tmp_value = tstate->current_exception;
+    tstate->current_exception = value;
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(type);
+    Py_XDECREF(tb);
+#else
+    PyObject *tmp_type, *tmp_value, *tmp_tb;
+    tmp_type = tstate->curexc_type;
+    tmp_value = tstate->curexc_value;
+    tmp_tb = tstate->curexc_traceback;
+    tstate->curexc_type = type;
+    tstate->curexc_value = value;
+    tstate->curexc_traceback = tb;
+    Py_XDECREF(tmp_type);
+    Py_XDECREF(tmp_value);
+    Py_XDECREF(tmp_tb);
+#endif
+}
+static CYTHON_INLINE void __Pyx_ErrFetchInState(PyThreadState *tstate, PyObject **type, PyObject **value, PyObject **tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject* exc_value;
+    exc_value = tstate->current_exception;
+    tstate->current_exception = 0;
+    *value = exc_value;
+    *type = NULL;
+    *tb = NULL;
+    if (exc_value) {
+        *type = (PyObject*) Py_TYPE(exc_value);
+        Py_INCREF(*type);
+        #if CYTHON_COMPILING_IN_CPYTHON
+        *tb = ((PyBaseExceptionObject*) exc_value)->traceback;
+        Py_XINCREF(*tb);
+        #else
+        *tb = PyException_GetTraceback(exc_value);
+        #endif
+    }
+#else
+    *type = tstate->curexc_type;
+    *value = tstate->curexc_value;
+    *tb = tstate->curexc_traceback;
+    tstate->curexc_type = 0;
+    tstate->curexc_value = 0;
+    tstate->curexc_traceback = 0;
+#endif
+}
+#endif
+
+/* WriteUnraisableException */
+static void __Pyx_WriteUnraisable(const char *name, int clineno,
+                                  int lineno, const char *filename,
+                                  int full_traceback, int nogil) {
+    PyObject *old_exc, *old_val, *old_tb;
+    PyObject *ctx;
+    __Pyx_PyThreadState_declare
+    PyGILState_STATE state;
+    if (nogil)
+        state = PyGILState_Ensure();
+    else state = (PyGILState_STATE)0;
+    CYTHON_UNUSED_VAR(clineno);
+    CYTHON_UNUSED_VAR(lineno);
+    CYTHON_UNUSED_VAR(filename);
+    CYTHON_MAYBE_UNUSED_VAR(nogil);
+    __Pyx_PyThreadState_assign
+    __Pyx_ErrFetch(&old_exc, &old_val, &old_tb);
+    if (full_traceback) {
+        Py_XINCREF(old_exc);
+        Py_XINCREF(old_val);
+        Py_XINCREF(old_tb);
+        __Pyx_ErrRestore(old_exc, old_val, old_tb);
+        PyErr_PrintEx(0);
+    }
+    ctx = PyUnicode_FromString(name);
+    __Pyx_ErrRestore(old_exc, old_val, old_tb);
+    if (!ctx) {
+        PyErr_WriteUnraisable(Py_None);
+    } else {
+        PyErr_WriteUnraisable(ctx);
+        Py_DECREF(ctx);
+    }
+    if (nogil)
+        PyGILState_Release(state);
+}
+
+/* PyObjectCall (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_Call(PyObject *func, PyObject *arg, PyObject *kw) {
+    PyObject *result;
+    ternaryfunc call = Py_TYPE(func)->tp_call;
+    if (unlikely(!call))
+        return PyObject_Call(func, arg, kw);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = (*call)(func, arg, kw);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectCallMethO (used by PyObjectFastCall) */
+#if CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallMethO(PyObject *func, PyObject *arg) {
+    PyObject *self, *result;
+    PyCFunction cfunc;
+    cfunc = __Pyx_CyOrPyCFunction_GET_FUNCTION(func);
+    self = __Pyx_CyOrPyCFunction_GET_SELF(func);
+    if (unlikely(Py_EnterRecursiveCall(" while calling a Python object")))
+        return NULL;
+    result = cfunc(self, arg);
+    Py_LeaveRecursiveCall();
+    if (unlikely(!result) && unlikely(!PyErr_Occurred())) {
+        PyErr_SetString(
+            PyExc_SystemError,
+            "NULL result without error in PyObject_Call");
+    }
+    return result;
+}
+#endif
+
+/* PyObjectFastCall */
+#if PY_VERSION_HEX < 0x03090000 || CYTHON_COMPILING_IN_LIMITED_API
+static PyObject* __Pyx_PyObject_FastCall_fallback(PyObject *func, PyObject * const*args, size_t nargs, PyObject *kwargs) {
+    PyObject *argstuple;
+    PyObject *result = 0;
+    size_t i;
+    argstuple = PyTuple_New((Py_ssize_t)nargs);
+    if (unlikely(!argstuple)) return NULL;
+    for (i = 0; i < nargs; i++) {
+        Py_INCREF(args[i]);
+        if (__Pyx_PyTuple_SET_ITEM(argstuple, (Py_ssize_t)i, args[i]) != (0)) goto bad;
+    }
+    result = __Pyx_PyObject_Call(func, argstuple, kwargs);
+  bad:
+    Py_DECREF(argstuple);
+    return result;
+}
+#endif
+#if CYTHON_VECTORCALL && !CYTHON_COMPILING_IN_LIMITED_API
+  #if PY_VERSION_HEX < 0x03090000
+    #define __Pyx_PyVectorcall_Function(callable) _PyVectorcall_Function(callable)
+  #elif CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE vectorcallfunc __Pyx_PyVectorcall_Function(PyObject *callable) {
+    PyTypeObject *tp = Py_TYPE(callable);
+    #if defined(__Pyx_CyFunction_USED)
+    if (__Pyx_CyFunction_CheckExact(callable)) {
+        return __Pyx_CyFunction_func_vectorcall(callable);
+    }
+    #endif
+    if (!PyType_HasFeature(tp, Py_TPFLAGS_HAVE_VECTORCALL)) {
+        return NULL;
+    }
+    assert(PyCallable_Check(callable));
+    Py_ssize_t offset = tp->tp_vectorcall_offset;
+    assert(offset > 0);
+    vectorcallfunc ptr;
+    memcpy(&ptr, (char *) callable + offset, sizeof(ptr));
+    return ptr;
+}
+  #else
+    #define __Pyx_PyVectorcall_Function(callable) PyVectorcall_Function(callable)
+  #endif
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_FastCallDict(PyObject *func, PyObject *const *args, size_t _nargs, PyObject *kwargs) {
+    Py_ssize_t nargs = __Pyx_PyVectorcall_NARGS(_nargs);
+#if CYTHON_COMPILING_IN_CPYTHON
+    if (nargs == 0 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_NOARGS))
+            return __Pyx_PyObject_CallMethO(func, NULL);
+    }
+    else if (nargs == 1 && kwargs == NULL) {
+        if (__Pyx_CyOrPyCFunction_Check(func) && likely( __Pyx_CyOrPyCFunction_GET_FLAGS(func) & METH_O))
+            return __Pyx_PyObject_CallMethO(func, args[0]);
+    }
+#endif
+    if (kwargs == NULL) {
+        #if CYTHON_VECTORCALL
+          #if CYTHON_COMPILING_IN_LIMITED_API
+            return PyObject_Vectorcall(func, args, _nargs, NULL);
+          #else
+            vectorcallfunc f = __Pyx_PyVectorcall_Function(func);
+            if (f) {
+                return f(func, args, _nargs, NULL);
+            }
+          #endif
+        #endif
+    }
+    if (nargs == 0) {
+        return __Pyx_PyObject_Call(func, __pyx_mstate_global->__pyx_empty_tuple, kwargs);
+    }
+    #if PY_VERSION_HEX >= 0x03090000 && !CYTHON_COMPILING_IN_LIMITED_API
+    return PyObject_VectorcallDict(func, args, (size_t)nargs, kwargs);
+    #else
+    return __Pyx_PyObject_FastCall_fallback(func, args, (size_t)nargs, kwargs);
+    #endif
+}
+
+/* RaiseException */
+static void __Pyx_Raise(PyObject *type, PyObject *value, PyObject *tb, PyObject *cause) {
+    PyObject* owned_instance = NULL;
+    if (tb == Py_None) {
+        tb = 0;
+    } else if (tb && !PyTraceBack_Check(tb)) {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: arg 3 must be a traceback or None");
+        goto bad;
+    }
+    if (value == Py_None)
+        value = 0;
+    if (PyExceptionInstance_Check(type)) {
+        if (value) {
+            PyErr_SetString(PyExc_TypeError,
+                "instance exception may not have a separate value");
+            goto bad;
+        }
+        value = type;
+        type = (PyObject*) Py_TYPE(value);
+    } else if (PyExceptionClass_Check(type)) {
+        PyObject *instance_class = NULL;
+        if (value && PyExceptionInstance_Check(value)) {
+            instance_class = (PyObject*) Py_TYPE(value);
+            if (instance_class != type) {
+                int is_subclass = PyObject_IsSubclass(instance_class, type);
+                if (!is_subclass) {
+                    instance_class = NULL;
+                } else if (unlikely(is_subclass == -1)) {
+                    goto bad;
+                } else {
+                    type = instance_class;
+                }
+            }
+        }
+        if (!instance_class) {
+            PyObject *args;
+            if (!value)
+                args = PyTuple_New(0);
+            else if (PyTuple_Check(value)) {
+                Py_INCREF(value);
+                args = value;
+            } else
+                args = PyTuple_Pack(1, value);
+            if (!args)
+                goto bad;
+            owned_instance = PyObject_Call(type, args, NULL);
+            Py_DECREF(args);
+            if (!owned_instance)
+                goto bad;
+            value = owned_instance;
+            if (!PyExceptionInstance_Check(value)) {
+                PyErr_Format(PyExc_TypeError,
+                             "calling %R should have returned an instance of "
+                             "BaseException, not %R",
+                             type, Py_TYPE(value));
+                goto bad;
+            }
+        }
+    } else {
+        PyErr_SetString(PyExc_TypeError,
+            "raise: exception class must be a subclass of BaseException");
+        goto bad;
+    }
+    if (cause) {
+        PyObject *fixed_cause;
+        if (cause == Py_None) {
+            fixed_cause = NULL;
+        } else if (PyExceptionClass_Check(cause)) {
+            fixed_cause = PyObject_CallObject(cause, NULL);
+            if (fixed_cause == NULL)
+                goto bad;
+        } else if (PyExceptionInstance_Check(cause)) {
+            fixed_cause = cause;
+            Py_INCREF(fixed_cause);
+        } else {
+            PyErr_SetString(PyExc_TypeError,
+                            "exception causes must derive from "
+                            "BaseException");
+            goto bad;
+        }
+        PyException_SetCause(value, fixed_cause);
+    }
+    PyErr_SetObject(type, value);
+    if (tb) {
+#if PY_VERSION_HEX >= 0x030C00A6
+        PyException_SetTraceback(value, tb);
+#elif CYTHON_FAST_THREAD_STATE
+        PyThreadState *tstate = __Pyx_PyThreadState_Current;
+        PyObject* tmp_tb = tstate->curexc_traceback;
+        if (tb != tmp_tb) {
+            Py_INCREF(tb);
+            tstate->curexc_traceback = tb;
+            Py_XDECREF(tmp_tb);
+        }
+#else
+        PyObject *tmp_type, *tmp_value, *tmp_tb;
+        PyErr_Fetch(&tmp_type, &tmp_value, &tmp_tb);
+        Py_INCREF(tb);
+        PyErr_Restore(tmp_type, tmp_value, tb);
+        Py_XDECREF(tmp_tb);
+#endif
+    }
+bad:
+    Py_XDECREF(owned_instance);
+    return;
+}
+
+/* ModInt[long] */
+static CYTHON_INLINE long __Pyx_mod_long(long a, long b, int b_is_constant) {
+    long r = a % b;
+    long adapt_python = (b_is_constant ?
+        ((r != 0) & ((r < 0) ^ (b < 0))) :
+        ((r != 0) & ((r ^ b) < 0))
+    );
+    return r + adapt_python * b;
+}
+
+/* FunctionExport */
+static int __Pyx_ExportFunction(PyObject *api_dict, const char *name, void (*f)(void), const char *sig) {
+    PyObject *cobj;
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    tmp.fp = f;
+    cobj = PyCapsule_New(tmp.p, sig, 0);
+    if (!cobj)
+        goto bad;
+    if (PyDict_SetItemString(api_dict, name, cobj) < 0)
+        goto bad;
+    Py_DECREF(cobj);
+    return 0;
+bad:
+    Py_XDECREF(cobj);
+    return -1;
+}
+
+/* GetApiDict */
+static PyObject *__Pyx_ApiExport_GetApiDict(void) {
+    PyObject *d;
+    if (__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, __pyx_mstate_global->__pyx_n_u_pyx_capi, &d) == -1)
+        return NULL;
+    if (!d) {
+        d = PyDict_New();
+        if (!d)
+            goto bad;
+        if (PyObject_SetAttr(__pyx_m, __pyx_mstate_global->__pyx_n_u_pyx_capi, d) < 0)
+            goto bad;
+    }
+    return d;
+bad:
+    Py_XDECREF(d);
+    return NULL;
+}
+
+/* TypeImport */
+#ifndef __PYX_HAVE_RT_ImportType_3_2_4
+#define __PYX_HAVE_RT_ImportType_3_2_4
+static PyTypeObject *__Pyx_ImportType_3_2_4(PyObject *module, const char *module_name, const char *class_name,
+    size_t size, size_t alignment, enum __Pyx_ImportType_CheckSize_3_2_4 check_size)
+{
+    PyObject *result = 0;
+    Py_ssize_t basicsize;
+    Py_ssize_t itemsize;
+#if defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API)
+    PyObject *py_basicsize;
+    PyObject *py_itemsize;
+#endif
+    result = PyObject_GetAttrString(module, class_name);
+    if (!result)
+        goto bad;
+    if (!PyType_Check(result)) {
+        PyErr_Format(PyExc_TypeError,
+            "%.200s.%.200s is not a type object",
+            module_name, class_name);
+        goto bad;
+    }
+#if !( defined(Py_LIMITED_API) || (defined(CYTHON_COMPILING_IN_LIMITED_API) && CYTHON_COMPILING_IN_LIMITED_API) )
+    basicsize = ((PyTypeObject *)result)->tp_basicsize;
+    itemsize = ((PyTypeObject *)result)->tp_itemsize;
+#else
+    if (size == 0) {
+        return (PyTypeObject *)result;
+    }
+    py_basicsize = PyObject_GetAttrString(result, "__basicsize__");
+    if (!py_basicsize)
+        goto bad;
+    basicsize = PyLong_AsSsize_t(py_basicsize);
+    Py_DECREF(py_basicsize);
+    py_basicsize = 0;
+    if (basicsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+    py_itemsize = PyObject_GetAttrString(result, "__itemsize__");
+    if (!py_itemsize)
+        goto bad;
+    itemsize = PyLong_AsSsize_t(py_itemsize);
+    Py_DECREF(py_itemsize);
+    py_itemsize = 0;
+    if (itemsize == (Py_ssize_t)-1 && PyErr_Occurred())
+        goto bad;
+#endif
+    if (itemsize) {
+        if (size % alignment) {
+            alignment = size % alignment;
+        }
+        if (itemsize < (Py_ssize_t)alignment)
+            itemsize = (Py_ssize_t)alignment;
+    }
+    if ((size_t)(basicsize + itemsize) < size) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd from PyObject",
+            module_name, class_name, size, basicsize+itemsize);
+        goto bad;
+    }
+    if (check_size == __Pyx_ImportType_CheckSize_Error_3_2_4 &&
+            ((size_t)basicsize > size || (size_t)(basicsize + itemsize) < size)) {
+        PyErr_Format(PyExc_ValueError,
+            "%.200s.%.200s size changed, may indicate binary incompatibility. "
+            "Expected %zd from C header, got %zd-%zd from PyObject",
+            module_name, class_name, size, basicsize, basicsize+itemsize);
+        goto bad;
+    }
+    else if (check_size == __Pyx_ImportType_CheckSize_Warn_3_2_4 && (size_t)basicsize > size) {
+        if (PyErr_WarnFormat(NULL, 0,
+                "%.200s.%.200s size changed, may indicate binary incompatibility. "
+                "Expected %zd from C header, got %zd from PyObject",
+                module_name, class_name, size, basicsize) < 0) {
+            goto bad;
+        }
+    }
+    return (PyTypeObject *)result;
+bad:
+    Py_XDECREF(result);
+    return NULL;
+}
+#endif
+
+/* GetVTable */
+static void* __Pyx_GetVtable(PyTypeObject *type) {
+    void* ptr;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    PyObject *ob = PyObject_GetAttr((PyObject *)type, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#else
+    PyObject *ob = PyObject_GetItem(type->tp_dict, __pyx_mstate_global->__pyx_n_u_pyx_vtable);
+#endif
+    if (!ob)
+        goto bad;
+    ptr = PyCapsule_GetPointer(ob, 0);
+    if (!ptr && !PyErr_Occurred())
+        PyErr_SetString(PyExc_RuntimeError, "invalid vtable found for imported type");
+    Py_DECREF(ob);
+    return ptr;
+bad:
+    Py_XDECREF(ob);
+    return NULL;
+}
+
+/* PxdImportShared (used by FunctionImport) */
+#ifndef __PYX_HAVE_RT_ImportFromPxd_3_2_4
+#define __PYX_HAVE_RT_ImportFromPxd_3_2_4
+static int __Pyx_ImportFromPxd_3_2_4(PyObject *module, const char *name, void **p, const char *sig, const char *what) {
+    PyObject *d = 0;
+    PyObject *cobj = 0;
+    d = PyObject_GetAttrString(module, "__pyx_capi__");
+    if (!d)
+        goto bad;
+#if (defined(Py_LIMITED_API) && Py_LIMITED_API >= 0x030d0000) || (!defined(Py_LIMITED_API) && PY_VERSION_HEX >= 0x030d0000)
+    PyDict_GetItemStringRef(d, name, &cobj);
+#else
+    cobj = PyDict_GetItemString(d, name);
+    Py_XINCREF(cobj);
+#endif
+    if (!cobj) {
+        PyErr_Format(PyExc_ImportError,
+            "%.200s does not export expected C %.8s %.200s",
+                PyModule_GetName(module), what, name);
+        goto bad;
+    }
+    if (!PyCapsule_IsValid(cobj, sig)) {
+        PyErr_Format(PyExc_TypeError,
+            "C %.8s %.200s.%.200s has wrong signature (expected %.500s, got %.500s)",
+             what, PyModule_GetName(module), name, sig, PyCapsule_GetName(cobj));
+        goto bad;
+    }
+    *p = PyCapsule_GetPointer(cobj, sig);
+    if (!(*p))
+        goto bad;
+    Py_DECREF(d);
+    Py_DECREF(cobj);
+    return 0;
+bad:
+    Py_XDECREF(d);
+    Py_XDECREF(cobj);
+    return -1;
+}
+#endif
+
+/* FunctionImport */
+#ifndef __PYX_HAVE_RT_ImportFunction_3_2_4
+#define __PYX_HAVE_RT_ImportFunction_3_2_4
+static int __Pyx_ImportFunction_3_2_4(PyObject *module, const char *funcname, void (**f)(void), const char *sig) {
+    union {
+        void (*fp)(void);
+        void *p;
+    } tmp;
+    int result = __Pyx_ImportFromPxd_3_2_4(module, funcname, &tmp.p, sig, "function");
+    if (result == 0) {
+        *f = tmp.fp;
+    }
+    return result;
+}
+#endif
+
+/* PyErrExceptionMatches (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_FAST_THREAD_STATE
+static int __Pyx_PyErr_ExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        if (__Pyx_PyErr_GivenExceptionMatches(exc_type, PyTuple_GET_ITEM(tuple, i))) return 1;
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_ExceptionMatchesInState(PyThreadState* tstate, PyObject* err) {
+    int result;
+    PyObject *exc_type;
+#if PY_VERSION_HEX >= 0x030C00A6
+    PyObject *current_exception = tstate->current_exception;
+    if (unlikely(!current_exception)) return 0;
+    exc_type = (PyObject*) Py_TYPE(current_exception);
+    if (exc_type == err) return 1;
+#else
+    exc_type = tstate->curexc_type;
+    if (exc_type == err) return 1;
+    if (unlikely(!exc_type)) return 0;
+#endif
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_INCREF(exc_type);
+    #endif
+    if (unlikely(PyTuple_Check(err))) {
+        result = __Pyx_PyErr_ExceptionMatchesTuple(exc_type, err);
+    } else {
+        result = __Pyx_PyErr_GivenExceptionMatches(exc_type, err);
+    }
+    #if CYTHON_AVOID_BORROWED_REFS
+    Py_DECREF(exc_type);
+    #endif
+    return result;
+}
+#endif
+
+/* PyObjectGetAttrStr (used by PyObjectGetAttrStrNoError) */
+#if CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStr(PyObject* obj, PyObject* attr_name) {
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro))
+        return tp->tp_getattro(obj, attr_name);
+    return PyObject_GetAttr(obj, attr_name);
+}
+#endif
+
+/* PyObjectGetAttrStrNoError (used by HasAttr) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static void __Pyx_PyObject_GetAttrStr_ClearAttributeError(void) {
+    __Pyx_PyThreadState_declare
+    __Pyx_PyThreadState_assign
+    if (likely(__Pyx_PyErr_ExceptionMatches(PyExc_AttributeError)))
+        __Pyx_PyErr_Clear();
+}
+#endif
+static CYTHON_INLINE PyObject* __Pyx_PyObject_GetAttrStrNoError(PyObject* obj, PyObject* attr_name) {
+    PyObject *result;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+    (void) PyObject_GetOptionalAttr(obj, attr_name, &result);
+    return result;
+#else
+#if CYTHON_COMPILING_IN_CPYTHON && CYTHON_USE_TYPE_SLOTS
+    PyTypeObject* tp = Py_TYPE(obj);
+    if (likely(tp->tp_getattro == PyObject_GenericGetAttr)) {
+        return _PyObject_GenericGetAttrWithDict(obj, attr_name, NULL, 1);
+    }
+#endif
+    result = __Pyx_PyObject_GetAttrStr(obj, attr_name);
+    if (unlikely(!result)) {
+        __Pyx_PyObject_GetAttrStr_ClearAttributeError();
+    }
+    return result;
+#endif
+}
+
+/* HasAttr (used by ImportImpl) */
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static CYTHON_INLINE int __Pyx_HasAttr(PyObject *o, PyObject *n) {
+    PyObject *r;
+    if (unlikely(!PyUnicode_Check(n))) {
+        PyErr_SetString(PyExc_TypeError,
+                        "hasattr(): attribute name must be string");
+        return -1;
+    }
+    r = __Pyx_PyObject_GetAttrStrNoError(o, n);
+    if (!r) {
+        return (unlikely(PyErr_Occurred())) ? -1 : 0;
+    } else {
+        Py_DECREF(r);
+        return 1;
+    }
+}
+#endif
+
+/* PyObjectCallOneArg (used by ImportImpl) */
+static CYTHON_INLINE PyObject* __Pyx_PyObject_CallOneArg(PyObject *func, PyObject *arg) {
+    PyObject *args[2] = {NULL, arg};
+    return __Pyx_PyObject_FastCall(func, args+1, 1 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET);
+}
+
+/* TupleAndListFromArray (used by ImportImpl) */
+#if !CYTHON_COMPILING_IN_CPYTHON && CYTHON_METH_FASTCALL
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    Py_ssize_t i;
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    for (i = 0; i < n; i++) {
+        if (unlikely(__Pyx_PyTuple_SET_ITEM(res, i, src[i]) < (0))) {
+            Py_DECREF(res);
+            return NULL;
+        }
+        Py_INCREF(src[i]);
+    }
+    return res;
+}
+#elif CYTHON_COMPILING_IN_CPYTHON
+static CYTHON_INLINE void __Pyx_copy_object_array(PyObject *const *CYTHON_RESTRICT src, PyObject** CYTHON_RESTRICT dest, Py_ssize_t length) {
+    PyObject *v;
+    Py_ssize_t i;
+    for (i = 0; i < length; i++) {
+        v = dest[i] = src[i];
+        Py_INCREF(v);
+    }
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyTuple_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return __Pyx_NewRef(__pyx_mstate_global->__pyx_empty_tuple);
+    }
+    res = PyTuple_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyTupleObject*)res)->ob_item, n);
+    return res;
+}
+static CYTHON_INLINE PyObject *
+__Pyx_PyList_FromArray(PyObject *const *src, Py_ssize_t n)
+{
+    PyObject *res;
+    if (n <= 0) {
+        return PyList_New(0);
+    }
+    res = PyList_New(n);
+    if (unlikely(res == NULL)) return NULL;
+    __Pyx_copy_object_array(src, ((PyListObject*)res)->ob_item, n);
+    return res;
+}
+#endif
+
+/* ImportImpl (used by Import) */
+static int __Pyx__Import_GetModule(PyObject *qualname, PyObject **module) {
+    PyObject *imported_module = PyImport_GetModule(qualname);
+    if (unlikely(!imported_module)) {
+        *module = NULL;
+        if (PyErr_Occurred()) {
+            return -1;
+        }
+        return 0;
+    }
+    *module = imported_module;
+    return 1;
+}
+static int __Pyx__Import_Lookup(PyObject *qualname, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject **module) {
+    PyObject *imported_module;
+    PyObject *top_level_package_name;
+    Py_ssize_t i;
+    int status, module_found;
+    Py_ssize_t dot_index;
+    module_found = __Pyx__Import_GetModule(qualname, &imported_module);
+    if (unlikely(!module_found || module_found == -1)) {
+        *module = NULL;
+        return module_found;
+    }
+    if (imported_names) {
+        for (i = 0; i < len_imported_names; i++) {
+            PyObject *imported_name = imported_names[i];
+#if __PYX_LIMITED_VERSION_HEX < 0x030d0000
+            int has_imported_attribute = PyObject_HasAttr(imported_module, imported_name);
+#else
+            int has_imported_attribute = PyObject_HasAttrWithError(imported_module, imported_name);
+            if (unlikely(has_imported_attribute == -1)) goto error;
+#endif
+            if (!has_imported_attribute) {
+                goto not_found;
+            }
+        }
+        *module = imported_module;
+        return 1;
+    }
+    dot_index = PyUnicode_FindChar(qualname, '.', 0, PY_SSIZE_T_MAX, 1);
+    if (dot_index == -1) {
+        *module = imported_module;
+        return 1;
+    }
+    if (unlikely(dot_index == -2)) goto error;
+    top_level_package_name = PyUnicode_Substring(qualname, 0, dot_index);
+    if (unlikely(!top_level_package_name)) goto error;
+    Py_DECREF(imported_module);
+    status = __Pyx__Import_GetModule(top_level_package_name, module);
+    Py_DECREF(top_level_package_name);
+    return status;
+error:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return -1;
+not_found:
+    Py_DECREF(imported_module);
+    *module = NULL;
+    return 0;
+}
+static PyObject *__Pyx__Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, PyObject *moddict, int level) {
+    PyObject *module = 0;
+    PyObject *empty_dict = 0;
+    PyObject *from_list = 0;
+    int module_found;
+    if (!qualname) {
+        qualname = name;
+    }
+    module_found = __Pyx__Import_Lookup(qualname, imported_names, len_imported_names, &module);
+    if (likely(module_found == 1)) {
+        return module;
+    } else if (unlikely(module_found == -1)) {
+        return NULL;
+    }
+    empty_dict = PyDict_New();
+    if (unlikely(!empty_dict))
+        goto bad;
+    if (imported_names) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        from_list = __Pyx_PyList_FromArray(imported_names, len_imported_names);
+        if (unlikely(!from_list))
+            goto bad;
+#else
+        from_list = PyList_New(len_imported_names);
+        if (unlikely(!from_list)) goto bad;
+        for (Py_ssize_t i=0; i<len_imported_names; ++i) {
+            if (PyList_SetItem(from_list, i, __Pyx_NewRef(imported_names[i])) < 0) goto bad;
+        }
+#endif
+    }
+    if (level == -1) {
+        const char* package_sep = strchr(__Pyx_MODULE_NAME, '.');
+        if (package_sep != (0)) {
+            module = PyImport_ImportModuleLevelObject(
+                name, moddict, empty_dict, from_list, 1);
+            if (unlikely(!module)) {
+                if (unlikely(!PyErr_ExceptionMatches(PyExc_ImportError)))
+                    goto bad;
+                PyErr_Clear();
+            }
+        }
+        level = 0;
+    }
+    if (!module) {
+        module = PyImport_ImportModuleLevelObject(
+            name, moddict, empty_dict, from_list, level);
+    }
+bad:
+    Py_XDECREF(from_list);
+    Py_XDECREF(empty_dict);
+    return module;
+}
+
+/* Import */
+static PyObject *__Pyx_Import(PyObject *name, PyObject *const *imported_names, Py_ssize_t len_imported_names, PyObject *qualname, int level) {
+    return __Pyx__Import(name, imported_names, len_imported_names, qualname, __pyx_mstate_global->__pyx_d, level);
+}
+
+/* ImportFrom */
+static PyObject* __Pyx_ImportFrom(PyObject* module, PyObject* name) {
+    PyObject* value = __Pyx_PyObject_GetAttrStr(module, name);
+    if (unlikely(!value) && PyErr_ExceptionMatches(PyExc_AttributeError)) {
+        const char* module_name_str = 0;
+        PyObject* module_name = 0;
+        PyObject* module_dot = 0;
+        PyObject* full_name = 0;
+        PyErr_Clear();
+        module_name_str = PyModule_GetName(module);
+        if (unlikely(!module_name_str)) { goto modbad; }
+        module_name = PyUnicode_FromString(module_name_str);
+        if (unlikely(!module_name)) { goto modbad; }
+        module_dot = PyUnicode_Concat(module_name, __pyx_mstate_global->__pyx_kp_u_);
+        if (unlikely(!module_dot)) { goto modbad; }
+        full_name = PyUnicode_Concat(module_dot, name);
+        if (unlikely(!full_name)) { goto modbad; }
+        #if (CYTHON_COMPILING_IN_PYPY && PYPY_VERSION_NUM  < 0x07030400) ||\
+                CYTHON_COMPILING_IN_GRAAL
+        {
+            PyObject *modules = PyImport_GetModuleDict();
+            if (unlikely(!modules))
+                goto modbad;
+            value = PyObject_GetItem(modules, full_name);
+        }
+        #else
+        value = PyImport_GetModule(full_name);
+        #endif
+      modbad:
+        Py_XDECREF(full_name);
+        Py_XDECREF(module_dot);
+        Py_XDECREF(module_name);
+    }
+    if (unlikely(!value)) {
+        PyErr_Format(PyExc_ImportError, "cannot import name %S", name);
+    }
+    return value;
+}
+
+/* GetBuiltinName (used by GetModuleGlobalName) */
+static PyObject *__Pyx_GetBuiltinName(PyObject *name) {
+    PyObject* result = __Pyx_PyObject_GetAttrStrNoError(__pyx_mstate_global->__pyx_b, name);
+    if (unlikely(!result) && !PyErr_Occurred()) {
+        PyErr_Format(PyExc_NameError,
+            "name '%U' is not defined", name);
+    }
+    return result;
+}
+
+/* PyDictVersioning (used by GetModuleGlobalName) */
+#if CYTHON_USE_DICT_VERSIONS && CYTHON_USE_TYPE_SLOTS
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_tp_dict_version(PyObject *obj) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    return likely(dict) ? __PYX_GET_DICT_VERSION(dict) : 0;
+}
+static CYTHON_INLINE PY_UINT64_T __Pyx_get_object_dict_version(PyObject *obj) {
+    PyObject **dictptr = NULL;
+    Py_ssize_t offset = Py_TYPE(obj)->tp_dictoffset;
+    if (offset) {
+#if CYTHON_COMPILING_IN_CPYTHON
+        dictptr = (likely(offset > 0)) ? (PyObject **) ((char *)obj + offset) : _PyObject_GetDictPtr(obj);
+#else
+        dictptr = _PyObject_GetDictPtr(obj);
+#endif
+    }
+    return (dictptr && *dictptr) ? __PYX_GET_DICT_VERSION(*dictptr) : 0;
+}
+static CYTHON_INLINE int __Pyx_object_dict_version_matches(PyObject* obj, PY_UINT64_T tp_dict_version, PY_UINT64_T obj_dict_version) {
+    PyObject *dict = Py_TYPE(obj)->tp_dict;
+    if (unlikely(!dict) || unlikely(tp_dict_version != __PYX_GET_DICT_VERSION(dict)))
+        return 0;
+    return obj_dict_version == __Pyx_get_object_dict_version(obj);
+}
+#endif
+
+/* GetModuleGlobalName */
+#if CYTHON_USE_DICT_VERSIONS
+static PyObject *__Pyx__GetModuleGlobalName(PyObject *name, PY_UINT64_T *dict_version, PyObject **dict_cached_value)
+#else
+static CYTHON_INLINE PyObject *__Pyx__GetModuleGlobalName(PyObject *name)
+#endif
+{
+    PyObject *result;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    if (unlikely(!__pyx_m)) {
+        if (!PyErr_Occurred())
+            PyErr_SetNone(PyExc_NameError);
+        return NULL;
+    }
+    result = PyObject_GetAttr(__pyx_m, name);
+    if (likely(result)) {
+        return result;
+    }
+    PyErr_Clear();
+#elif CYTHON_AVOID_BORROWED_REFS || CYTHON_AVOID_THREAD_UNSAFE_BORROWED_REFS
+    if (unlikely(__Pyx_PyDict_GetItemRef(__pyx_mstate_global->__pyx_d, name, &result) == -1)) PyErr_Clear();
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return result;
+    }
+#else
+    result = _PyDict_GetItem_KnownHash(__pyx_mstate_global->__pyx_d, name, ((PyASCIIObject *) name)->hash);
+    __PYX_UPDATE_DICT_CACHE(__pyx_mstate_global->__pyx_d, result, *dict_cached_value, *dict_version)
+    if (likely(result)) {
+        return __Pyx_NewRef(result);
+    }
+    PyErr_Clear();
+#endif
+    return __Pyx_GetBuiltinName(name);
+}
+
+/* dict_setdefault (used by CLineInTraceback) */
+static CYTHON_INLINE PyObject *__Pyx_PyDict_SetDefault(PyObject *d, PyObject *key, PyObject *default_value) {
+    PyObject* value;
+#if __PYX_LIMITED_VERSION_HEX >= 0x030F0000 || (!CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4)
+    PyDict_SetDefaultRef(d, key, default_value, &value);
+#elif CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX >= 0x030C0000
+    PyObject *args[] = {d, key, default_value};
+    value = PyObject_VectorcallMethod(__pyx_mstate_global->__pyx_n_u_setdefault, args, 3 | PY_VECTORCALL_ARGUMENTS_OFFSET, NULL);
+#elif CYTHON_COMPILING_IN_LIMITED_API
+    value = PyObject_CallMethodObjArgs(d, __pyx_mstate_global->__pyx_n_u_setdefault, key, default_value, NULL);
+#else
+    value = PyDict_SetDefault(d, key, default_value);
+    if (unlikely(!value)) return NULL;
+    Py_INCREF(value);
+#endif
+    return value;
+}
+
+/* CLineInTraceback (used by AddTraceback) */
+#if CYTHON_CLINE_IN_TRACEBACK && CYTHON_CLINE_IN_TRACEBACK_RUNTIME
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030A0000
+#define __Pyx_PyProbablyModule_GetDict(o) __Pyx_XNewRef(PyModule_GetDict(o))
+#elif !CYTHON_COMPILING_IN_CPYTHON || CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+#define __Pyx_PyProbablyModule_GetDict(o) PyObject_GenericGetDict(o, NULL);
+#else
+PyObject* __Pyx_PyProbablyModule_GetDict(PyObject *o) {
+    PyObject **dict_ptr = _PyObject_GetDictPtr(o);
+    return dict_ptr ? __Pyx_XNewRef(*dict_ptr) : NULL;
+}
+#endif
+static int __Pyx_CLineForTraceback(PyThreadState *tstate, int c_line) {
+    PyObject *use_cline = NULL;
+    PyObject *ptype, *pvalue, *ptraceback;
+    PyObject *cython_runtime_dict;
+    CYTHON_MAYBE_UNUSED_VAR(tstate);
+    if (unlikely(!__pyx_mstate_global->__pyx_cython_runtime)) {
+        return c_line;
+    }
+    __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+    cython_runtime_dict = __Pyx_PyProbablyModule_GetDict(__pyx_mstate_global->__pyx_cython_runtime);
+    if (likely(cython_runtime_dict)) {
+        __PYX_PY_DICT_LOOKUP_IF_MODIFIED(
+            use_cline, cython_runtime_dict,
+            __Pyx_PyDict_SetDefault(cython_runtime_dict, __pyx_mstate_global->__pyx_n_u_cline_in_traceback, Py_False))
+    }
+    if (use_cline == NULL || use_cline == Py_False || (use_cline != Py_True && PyObject_Not(use_cline) != 0)) {
+        c_line = 0;
+    }
+    Py_XDECREF(use_cline);
+    Py_XDECREF(cython_runtime_dict);
+    __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+    return c_line;
+}
+#endif
+
+/* CodeObjectCache (used by AddTraceback) */
+static int __pyx_bisect_code_objects(__Pyx_CodeObjectCacheEntry* entries, int count, int code_line) {
+    int start = 0, mid = 0, end = count - 1;
+    if (end >= 0 && code_line > entries[end].code_line) {
+        return count;
+    }
+    while (start < end) {
+        mid = start + (end - start) / 2;
+        if (code_line < entries[mid].code_line) {
+            end = mid;
+        } else if (code_line > entries[mid].code_line) {
+             start = mid + 1;
+        } else {
+            return mid;
+        }
+    }
+    if (code_line <= entries[mid].code_line) {
+        return mid;
+    } else {
+        return mid + 1;
+    }
+}
+static __Pyx_CachedCodeObjectType *__pyx__find_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line) {
+    __Pyx_CachedCodeObjectType* code_object;
+    int pos;
+    if (unlikely(!code_line) || unlikely(!code_cache->entries)) {
+        return NULL;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if (unlikely(pos >= code_cache->count) || unlikely(code_cache->entries[pos].code_line != code_line)) {
+        return NULL;
+    }
+    code_object = code_cache->entries[pos].code_object;
+    Py_INCREF(code_object);
+    return code_object;
+}
+static __Pyx_CachedCodeObjectType *__pyx_find_code_object(int code_line) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__find_code_object;
+    return NULL; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just miss.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type old_count = __pyx_atomic_incr_acq_rel(&code_cache->accessor_count);
+    if (old_count < 0) {
+        __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+        return NULL;
+    }
+#endif
+    __Pyx_CachedCodeObjectType *result = __pyx__find_code_object(code_cache, code_line);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_decr_acq_rel(&code_cache->accessor_count);
+#endif
+    return result;
+#endif
+}
+static void __pyx__insert_code_object(struct __Pyx_CodeObjectCache *code_cache, int code_line, __Pyx_CachedCodeObjectType* code_object)
+{
+    int pos, i;
+    __Pyx_CodeObjectCacheEntry* entries = code_cache->entries;
+    if (unlikely(!code_line)) {
+        return;
+    }
+    if (unlikely(!entries)) {
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Malloc(64*sizeof(__Pyx_CodeObjectCacheEntry));
+        if (likely(entries)) {
+            code_cache->entries = entries;
+            code_cache->max_count = 64;
+            code_cache->count = 1;
+            entries[0].code_line = code_line;
+            entries[0].code_object = code_object;
+            Py_INCREF(code_object);
+        }
+        return;
+    }
+    pos = __pyx_bisect_code_objects(code_cache->entries, code_cache->count, code_line);
+    if ((pos < code_cache->count) && unlikely(code_cache->entries[pos].code_line == code_line)) {
+        __Pyx_CachedCodeObjectType* tmp = entries[pos].code_object;
+        entries[pos].code_object = code_object;
+        Py_INCREF(code_object);
+        Py_DECREF(tmp);
+        return;
+    }
+    if (code_cache->count == code_cache->max_count) {
+        int new_max = code_cache->max_count + 64;
+        entries = (__Pyx_CodeObjectCacheEntry*)PyMem_Realloc(
+            code_cache->entries, ((size_t)new_max) * sizeof(__Pyx_CodeObjectCacheEntry));
+        if (unlikely(!entries)) {
+            return;
+        }
+        code_cache->entries = entries;
+        code_cache->max_count = new_max;
+    }
+    for (i=code_cache->count; i>pos; i--) {
+        entries[i] = entries[i-1];
+    }
+    entries[pos].code_line = code_line;
+    entries[pos].code_object = code_object;
+    code_cache->count++;
+    Py_INCREF(code_object);
+}
+static void __pyx_insert_code_object(int code_line, __Pyx_CachedCodeObjectType* code_object) {
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING && !CYTHON_ATOMICS
+    (void)__pyx__insert_code_object;
+    return; // Most implementation should have atomics. But otherwise, don't make it thread-safe, just fail.
+#else
+    struct __Pyx_CodeObjectCache *code_cache = &__pyx_mstate_global->__pyx_code_cache;
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_nonatomic_int_type expected = 0;
+    if (!__pyx_atomic_int_cmp_exchange(&code_cache->accessor_count, &expected, INT_MIN)) {
+        return;
+    }
+#endif
+    __pyx__insert_code_object(code_cache, code_line, code_object);
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+    __pyx_atomic_sub(&code_cache->accessor_count, INT_MIN);
+#endif
+#endif
+}
+
+/* AddTraceback */
+#include "compile.h"
+#include "frameobject.h"
+#include "traceback.h"
+#if PY_VERSION_HEX >= 0x030b00a6 && !CYTHON_COMPILING_IN_LIMITED_API && !defined(PYPY_VERSION)
+  #ifndef Py_BUILD_CORE
+    #define Py_BUILD_CORE 1
+  #endif
+  #include "internal/pycore_frame.h"
+#endif
+#if CYTHON_COMPILING_IN_LIMITED_API
+static PyObject *__Pyx_PyCode_Replace_For_AddTraceback(PyObject *code, PyObject *scratch_dict,
+                                                       PyObject *firstlineno, PyObject *name) {
+    PyObject *replace = NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_firstlineno", firstlineno))) return NULL;
+    if (unlikely(PyDict_SetItemString(scratch_dict, "co_name", name))) return NULL;
+    replace = PyObject_GetAttrString(code, "replace");
+    if (likely(replace)) {
+        PyObject *result = PyObject_Call(replace, __pyx_mstate_global->__pyx_empty_tuple, scratch_dict);
+        Py_DECREF(replace);
+        return result;
+    }
+    PyErr_Clear();
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyObject *code_object = NULL, *py_py_line = NULL, *py_funcname = NULL, *dict = NULL;
+    PyObject *replace = NULL, *getframe = NULL, *frame = NULL;
+    PyObject *exc_type, *exc_value, *exc_traceback;
+    int success = 0;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(__Pyx_PyThreadState_Current, c_line);
+    }
+    PyErr_Fetch(&exc_type, &exc_value, &exc_traceback);
+    code_object = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!code_object) {
+        code_object = Py_CompileString("_getframe()", filename, Py_eval_input);
+        if (unlikely(!code_object)) goto bad;
+        py_py_line = PyLong_FromLong(py_line);
+        if (unlikely(!py_py_line)) goto bad;
+        if (c_line) {
+            py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        } else {
+            py_funcname = PyUnicode_FromString(funcname);
+        }
+        if (unlikely(!py_funcname)) goto bad;
+        dict = PyDict_New();
+        if (unlikely(!dict)) goto bad;
+        {
+            PyObject *old_code_object = code_object;
+            code_object = __Pyx_PyCode_Replace_For_AddTraceback(code_object, dict, py_py_line, py_funcname);
+            Py_DECREF(old_code_object);
+        }
+        if (unlikely(!code_object)) goto bad;
+        __pyx_insert_code_object(c_line ? -c_line : py_line, code_object);
+    } else {
+        dict = PyDict_New();
+    }
+    getframe = PySys_GetObject("_getframe");
+    if (unlikely(!getframe)) goto bad;
+    if (unlikely(PyDict_SetItemString(dict, "_getframe", getframe))) goto bad;
+    frame = PyEval_EvalCode(code_object, dict, dict);
+    if (unlikely(!frame) || frame == Py_None) goto bad;
+    success = 1;
+  bad:
+    PyErr_Restore(exc_type, exc_value, exc_traceback);
+    Py_XDECREF(code_object);
+    Py_XDECREF(py_py_line);
+    Py_XDECREF(py_funcname);
+    Py_XDECREF(dict);
+    Py_XDECREF(replace);
+    if (success) {
+        PyTraceBack_Here(
+            (struct _frame*)frame);
+    }
+    Py_XDECREF(frame);
+}
+#else
+static PyCodeObject* __Pyx_CreateCodeObjectForTraceback(
+            const char *funcname, int c_line,
+            int py_line, const char *filename) {
+    PyCodeObject *py_code = NULL;
+    PyObject *py_funcname = NULL;
+    if (c_line) {
+        py_funcname = PyUnicode_FromFormat( "%s (%s:%d)", funcname, __pyx_cfilenm, c_line);
+        if (!py_funcname) goto bad;
+        funcname = PyUnicode_AsUTF8(py_funcname);
+        if (!funcname) goto bad;
+    }
+    py_code = PyCode_NewEmpty(filename, funcname, py_line);
+    Py_XDECREF(py_funcname);
+    return py_code;
+bad:
+    Py_XDECREF(py_funcname);
+    return NULL;
+}
+static void __Pyx_AddTraceback(const char *funcname, int c_line,
+                               int py_line, const char *filename) {
+    PyCodeObject *py_code = 0;
+    PyFrameObject *py_frame = 0;
+    PyThreadState *tstate = __Pyx_PyThreadState_Current;
+    PyObject *ptype, *pvalue, *ptraceback;
+    if (c_line) {
+        c_line = __Pyx_CLineForTraceback(tstate, c_line);
+    }
+    py_code = __pyx_find_code_object(c_line ? -c_line : py_line);
+    if (!py_code) {
+        __Pyx_ErrFetchInState(tstate, &ptype, &pvalue, &ptraceback);
+        py_code = __Pyx_CreateCodeObjectForTraceback(
+            funcname, c_line, py_line, filename);
+        if (!py_code) {
+            /* If the code object creation fails, then we should clear the
+               fetched exception references and propagate the new exception */
+            Py_XDECREF(ptype);
+            Py_XDECREF(pvalue);
+            Py_XDECREF(ptraceback);
+            goto bad;
+        }
+        __Pyx_ErrRestoreInState(tstate, ptype, pvalue, ptraceback);
+        __pyx_insert_code_object(c_line ? -c_line : py_line, py_code);
+    }
+    py_frame = PyFrame_New(
+        tstate,            /*PyThreadState *tstate,*/
+        py_code,           /*PyCodeObject *code,*/
+        __pyx_mstate_global->__pyx_d,    /*PyObject *globals,*/
+        0                  /*PyObject *locals*/
+    );
+    if (!py_frame) goto bad;
+    __Pyx_PyFrame_SetLineNumber(py_frame, py_line);
+    PyTraceBack_Here(py_frame);
+bad:
+    Py_XDECREF(py_code);
+    Py_XDECREF(py_frame);
+}
+#endif
+
+/* CIntFromPyVerify */
+#define __PYX_VERIFY_RETURN_INT(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 0)
+#define __PYX_VERIFY_RETURN_INT_EXC(target_type, func_type, func_value)\
+    __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, 1)
+#define __PYX__VERIFY_RETURN_INT(target_type, func_type, func_value, exc)\
+    {\
+        func_type value = func_value;\
+        if (sizeof(target_type) < sizeof(func_type)) {\
+            if (unlikely(value != (func_type) (target_type) value)) {\
+                func_type zero = 0;\
+                if (exc && unlikely(value == (func_type)-1 && PyErr_Occurred()))\
+                    return (target_type) -1;\
+                if (is_unsigned && unlikely(value < zero))\
+                    goto raise_neg_overflow;\
+                else\
+                    goto raise_overflow;\
+            }\
+        }\
+        return (target_type) value;\
+    }
+
+/* CIntFromPy */
+static CYTHON_INLINE int __Pyx_PyLong_As_int(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        int val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (int) -1;
+        val = __Pyx_PyLong_As_int(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 2 * PyLong_SHIFT)) {
+                            return (int) (((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 3 * PyLong_SHIFT)) {
+                            return (int) (((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) >= 4 * PyLong_SHIFT)) {
+                            return (int) (((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (int) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(int) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(int) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(int, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(int) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(int) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                            return (int) ((((((int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(int) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(int) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                            return (int) ((((((((int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(int) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) (((int)-1)*(((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(int) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(int, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(int) - 1 > 4 * PyLong_SHIFT)) {
+                            return (int) ((((((((((int)digits[3]) << PyLong_SHIFT) | (int)digits[2]) << PyLong_SHIFT) | (int)digits[1]) << PyLong_SHIFT) | (int)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(int) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, long, PyLong_AsLong(x))
+        } else if ((sizeof(int) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(int, PY_LONG_LONG, PyLong_AsLongLong(x))
+        }
+    }
+    {
+        int val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (int) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (int) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (int) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (int) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(int) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((int) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(int) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((int) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((int) 1) << (sizeof(int) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (int) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to int");
+    return (int) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to int");
+    return (int) -1;
+}
+
+/* PyObjectVectorCallKwBuilder (used by CIntToPy) */
+#if CYTHON_VECTORCALL
+static int __Pyx_VectorcallBuilder_AddArg(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_PyObject_FastCallDict;
+    if (__Pyx_PyTuple_SET_ITEM(builder, n, key) != (0)) return -1;
+    Py_INCREF(key);
+    args[n] = value;
+    return 0;
+}
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    (void)__Pyx_VectorcallBuilder_AddArgStr;
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return __Pyx_VectorcallBuilder_AddArg(key, value, builder, args, n);
+}
+static int __Pyx_VectorcallBuilder_AddArgStr(const char *key, PyObject *value, PyObject *builder, PyObject **args, int n) {
+    PyObject *pyKey = PyUnicode_FromString(key);
+    if (!pyKey) return -1;
+    return __Pyx_VectorcallBuilder_AddArg(pyKey, value, builder, args, n);
+}
+#else // CYTHON_VECTORCALL
+CYTHON_UNUSED static int __Pyx_VectorcallBuilder_AddArg_Check(PyObject *key, PyObject *value, PyObject *builder, CYTHON_UNUSED PyObject **args, CYTHON_UNUSED int n) {
+    if (unlikely(!PyUnicode_Check(key))) {
+        PyErr_SetString(PyExc_TypeError, "keywords must be strings");
+        return -1;
+    }
+    return PyDict_SetItem(builder, key, value);
+}
+#endif
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_int(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From_long(long value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(long) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(long) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(long) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(long) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(long),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(long));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* CIntToPy */
+static CYTHON_INLINE PyObject* __Pyx_PyLong_From___pyx_anon_enum(int value) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const int neg_one = (int) -1, const_zero = (int) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (is_unsigned) {
+        if (sizeof(int) < sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(unsigned long)) {
+            return PyLong_FromUnsignedLong((unsigned long) value);
+#if !CYTHON_COMPILING_IN_PYPY
+        } else if (sizeof(int) <= sizeof(unsigned PY_LONG_LONG)) {
+            return PyLong_FromUnsignedLongLong((unsigned PY_LONG_LONG) value);
+#endif
+        }
+    } else {
+        if (sizeof(int) <= sizeof(long)) {
+            return PyLong_FromLong((long) value);
+        } else if (sizeof(int) <= sizeof(PY_LONG_LONG)) {
+            return PyLong_FromLongLong((PY_LONG_LONG) value);
+        }
+    }
+    {
+        unsigned char *bytes = (unsigned char *)&value;
+#if !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d00A4
+        if (is_unsigned) {
+            return PyLong_FromUnsignedNativeBytes(bytes, sizeof(value), -1);
+        } else {
+            return PyLong_FromNativeBytes(bytes, sizeof(value), -1);
+        }
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX < 0x030d0000
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        return _PyLong_FromByteArray(bytes, sizeof(int),
+                                     little, !is_unsigned);
+#else
+        int one = 1; int little = (int)*(unsigned char *)&one;
+        PyObject *from_bytes, *result = NULL, *kwds = NULL;
+        PyObject *py_bytes = NULL, *order_str = NULL;
+        from_bytes = PyObject_GetAttrString((PyObject*)&PyLong_Type, "from_bytes");
+        if (!from_bytes) return NULL;
+        py_bytes = PyBytes_FromStringAndSize((char*)bytes, sizeof(int));
+        if (!py_bytes) goto limited_bad;
+        order_str = PyUnicode_FromString(little ? "little" : "big");
+        if (!order_str) goto limited_bad;
+        {
+            PyObject *args[3+(CYTHON_VECTORCALL ? 1 : 0)] = { NULL, py_bytes, order_str };
+            if (!is_unsigned) {
+                kwds = __Pyx_MakeVectorcallBuilderKwds(1);
+                if (!kwds) goto limited_bad;
+                if (__Pyx_VectorcallBuilder_AddArgStr("signed", __Pyx_NewRef(Py_True), kwds, args+3, 0) < 0) goto limited_bad;
+            }
+            result = __Pyx_Object_Vectorcall_CallFromBuilder(from_bytes, args+1, 2 | __Pyx_PY_VECTORCALL_ARGUMENTS_OFFSET, kwds);
+        }
+        limited_bad:
+        Py_XDECREF(kwds);
+        Py_XDECREF(order_str);
+        Py_XDECREF(py_bytes);
+        Py_XDECREF(from_bytes);
+        return result;
+#endif
+    }
+}
+
+/* FormatTypeName */
+#if CYTHON_COMPILING_IN_LIMITED_API && __PYX_LIMITED_VERSION_HEX < 0x030d0000
+static __Pyx_TypeName
+__Pyx_PyType_GetFullyQualifiedName(PyTypeObject* tp)
+{
+    PyObject *module = NULL, *name = NULL, *result = NULL;
+    #if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+    name = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_qualname);
+    #else
+    name = PyType_GetQualName(tp);
+    #endif
+    if (unlikely(name == NULL) || unlikely(!PyUnicode_Check(name))) goto bad;
+    module = __Pyx_PyObject_GetAttrStr((PyObject *)tp,
+                                               __pyx_mstate_global->__pyx_n_u_module);
+    if (unlikely(module == NULL) || unlikely(!PyUnicode_Check(module))) goto bad;
+    if (PyUnicode_CompareWithASCIIString(module, "builtins") == 0) {
+        result = name;
+        name = NULL;
+        goto done;
+    }
+    result = PyUnicode_FromFormat("%U.%U", module, name);
+    if (unlikely(result == NULL)) goto bad;
+  done:
+    Py_XDECREF(name);
+    Py_XDECREF(module);
+    return result;
+  bad:
+    PyErr_Clear();
+    if (name) {
+        result = name;
+        name = NULL;
+    } else {
+        result = __Pyx_NewRef(__pyx_mstate_global->__pyx_kp_u__2);
+    }
+    goto done;
+}
+#endif
+
+/* CIntFromPy */
+static CYTHON_INLINE long __Pyx_PyLong_As_long(PyObject *x) {
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic push
+#pragma GCC diagnostic ignored "-Wconversion"
+#endif
+    const long neg_one = (long) -1, const_zero = (long) 0;
+#ifdef __Pyx_HAS_GCC_DIAGNOSTIC
+#pragma GCC diagnostic pop
+#endif
+    const int is_unsigned = neg_one > const_zero;
+    if (unlikely(!PyLong_Check(x))) {
+        long val;
+        PyObject *tmp = __Pyx_PyNumber_Long(x);
+        if (!tmp) return (long) -1;
+        val = __Pyx_PyLong_As_long(tmp);
+        Py_DECREF(tmp);
+        return val;
+    }
+    if (is_unsigned) {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (unlikely(__Pyx_PyLong_IsNeg(x))) {
+            goto raise_neg_overflow;
+        } else if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_upylong, __Pyx_PyLong_CompactValueUnsigned(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_DigitCount(x)) {
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 2 * PyLong_SHIFT)) {
+                            return (long) (((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 3 * PyLong_SHIFT)) {
+                            return (long) (((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) >= 4 * PyLong_SHIFT)) {
+                            return (long) (((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0]));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+#if CYTHON_COMPILING_IN_CPYTHON && PY_VERSION_HEX < 0x030C00A7
+        if (unlikely(Py_SIZE(x) < 0)) {
+            goto raise_neg_overflow;
+        }
+#else
+        {
+            int result = PyObject_RichCompareBool(x, Py_False, Py_LT);
+            if (unlikely(result < 0))
+                return (long) -1;
+            if (unlikely(result == 1))
+                goto raise_neg_overflow;
+        }
+#endif
+        if ((sizeof(long) <= sizeof(unsigned long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned long, PyLong_AsUnsignedLong(x))
+        } else if ((sizeof(long) <= sizeof(unsigned PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, unsigned PY_LONG_LONG, PyLong_AsUnsignedLongLong(x))
+        }
+    } else {
+#if CYTHON_USE_PYLONG_INTERNALS
+        if (__Pyx_PyLong_IsCompact(x)) {
+            __PYX_VERIFY_RETURN_INT(long, __Pyx_compact_pylong, __Pyx_PyLong_CompactValue(x))
+        } else {
+            const digit* digits = __Pyx_PyLong_Digits(x);
+            assert(__Pyx_PyLong_DigitCount(x) > 1);
+            switch (__Pyx_PyLong_SignedDigitCount(x)) {
+                case -2:
+                    if ((8 * sizeof(long) - 1 > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 2:
+                    if ((8 * sizeof(long) > 1 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 2 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                            return (long) ((((((long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -3:
+                    if ((8 * sizeof(long) - 1 > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 3:
+                    if ((8 * sizeof(long) > 2 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 3 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                            return (long) ((((((((long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case -4:
+                    if ((8 * sizeof(long) - 1 > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, long, -(long) (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) (((long)-1)*(((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+                case 4:
+                    if ((8 * sizeof(long) > 3 * PyLong_SHIFT)) {
+                        if ((8 * sizeof(unsigned long) > 4 * PyLong_SHIFT)) {
+                            __PYX_VERIFY_RETURN_INT(long, unsigned long, (((((((((unsigned long)digits[3]) << PyLong_SHIFT) | (unsigned long)digits[2]) << PyLong_SHIFT) | (unsigned long)digits[1]) << PyLong_SHIFT) | (unsigned long)digits[0])))
+                        } else if ((8 * sizeof(long) - 1 > 4 * PyLong_SHIFT)) {
+                            return (long) ((((((((((long)digits[3]) << PyLong_SHIFT) | (long)digits[2]) << PyLong_SHIFT) | (long)digits[1]) << PyLong_SHIFT) | (long)digits[0])));
+                        }
+                    }
+                    break;
+            }
+        }
+#endif
+        if ((sizeof(long) <= sizeof(long))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, long, PyLong_AsLong(x))
+        } else if ((sizeof(long) <= sizeof(PY_LONG_LONG))) {
+            __PYX_VERIFY_RETURN_INT_EXC(long, PY_LONG_LONG, PyLong_AsLongLong(x))
+        }
+    }
+    {
+        long val;
+        int ret = -1;
+#if PY_VERSION_HEX >= 0x030d00A6 && !CYTHON_COMPILING_IN_LIMITED_API
+        Py_ssize_t bytes_copied = PyLong_AsNativeBytes(
+            x, &val, sizeof(val), Py_ASNATIVEBYTES_NATIVE_ENDIAN | (is_unsigned ? Py_ASNATIVEBYTES_UNSIGNED_BUFFER | Py_ASNATIVEBYTES_REJECT_NEGATIVE : 0));
+        if (unlikely(bytes_copied == -1)) {
+        } else if (unlikely(bytes_copied > (Py_ssize_t) sizeof(val))) {
+            goto raise_overflow;
+        } else {
+            ret = 0;
+        }
+#elif PY_VERSION_HEX < 0x030d0000 && !(CYTHON_COMPILING_IN_PYPY || CYTHON_COMPILING_IN_LIMITED_API) || defined(_PyLong_AsByteArray)
+        int one = 1; int is_little = (int)*(unsigned char *)&one;
+        unsigned char *bytes = (unsigned char *)&val;
+        ret = _PyLong_AsByteArray((PyLongObject *)x,
+                                    bytes, sizeof(val),
+                                    is_little, !is_unsigned);
+#else
+        PyObject *v;
+        PyObject *stepval = NULL, *mask = NULL, *shift = NULL;
+        int bits, remaining_bits, is_negative = 0;
+        int chunk_size = (sizeof(long) < 8) ? 30 : 62;
+        if (likely(PyLong_CheckExact(x))) {
+            v = __Pyx_NewRef(x);
+        } else {
+            v = PyNumber_Long(x);
+            if (unlikely(!v)) return (long) -1;
+            assert(PyLong_CheckExact(v));
+        }
+        {
+            int result = PyObject_RichCompareBool(v, Py_False, Py_LT);
+            if (unlikely(result < 0)) {
+                Py_DECREF(v);
+                return (long) -1;
+            }
+            is_negative = result == 1;
+        }
+        if (is_unsigned && unlikely(is_negative)) {
+            Py_DECREF(v);
+            goto raise_neg_overflow;
+        } else if (is_negative) {
+            stepval = PyNumber_Invert(v);
+            Py_DECREF(v);
+            if (unlikely(!stepval))
+                return (long) -1;
+        } else {
+            stepval = v;
+        }
+        v = NULL;
+        val = (long) 0;
+        mask = PyLong_FromLong((1L << chunk_size) - 1); if (unlikely(!mask)) goto done;
+        shift = PyLong_FromLong(chunk_size); if (unlikely(!shift)) goto done;
+        for (bits = 0; bits < (int) sizeof(long) * 8 - chunk_size; bits += chunk_size) {
+            PyObject *tmp, *digit;
+            long idigit;
+            digit = PyNumber_And(stepval, mask);
+            if (unlikely(!digit)) goto done;
+            idigit = PyLong_AsLong(digit);
+            Py_DECREF(digit);
+            if (unlikely(idigit < 0)) goto done;
+            val |= ((long) idigit) << bits;
+            tmp = PyNumber_Rshift(stepval, shift);
+            if (unlikely(!tmp)) goto done;
+            Py_DECREF(stepval); stepval = tmp;
+        }
+        Py_DECREF(shift); shift = NULL;
+        Py_DECREF(mask); mask = NULL;
+        {
+            long idigit = PyLong_AsLong(stepval);
+            if (unlikely(idigit < 0)) goto done;
+            remaining_bits = ((int) sizeof(long) * 8) - bits - (is_unsigned ? 0 : 1);
+            if (unlikely(idigit >= (1L << remaining_bits)))
+                goto raise_overflow;
+            val |= ((long) idigit) << bits;
+        }
+        if (!is_unsigned) {
+            if (unlikely(val & (((long) 1) << (sizeof(long) * 8 - 1))))
+                goto raise_overflow;
+            if (is_negative)
+                val = ~val;
+        }
+        ret = 0;
+    done:
+        Py_XDECREF(shift);
+        Py_XDECREF(mask);
+        Py_XDECREF(stepval);
+#endif
+        if (unlikely(ret))
+            return (long) -1;
+        return val;
+    }
+raise_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "value too large to convert to long");
+    return (long) -1;
+raise_neg_overflow:
+    PyErr_SetString(PyExc_OverflowError,
+        "can't convert negative value to long");
+    return (long) -1;
+}
+
+/* FastTypeChecks */
+#if CYTHON_COMPILING_IN_CPYTHON
+static int __Pyx_InBases(PyTypeObject *a, PyTypeObject *b) {
+    while (a) {
+        a = __Pyx_PyType_GetSlot(a, tp_base, PyTypeObject*);
+        if (a == b)
+            return 1;
+    }
+    return b == &PyBaseObject_Type;
+}
+static CYTHON_INLINE int __Pyx_IsSubtype(PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (a == b) return 1;
+    mro = a->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            if (PyTuple_GET_ITEM(mro, i) == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(a, b);
+}
+static CYTHON_INLINE int __Pyx_IsAnySubtype2(PyTypeObject *cls, PyTypeObject *a, PyTypeObject *b) {
+    PyObject *mro;
+    if (cls == a || cls == b) return 1;
+    mro = cls->tp_mro;
+    if (likely(mro)) {
+        Py_ssize_t i, n;
+        n = PyTuple_GET_SIZE(mro);
+        for (i = 0; i < n; i++) {
+            PyObject *base = PyTuple_GET_ITEM(mro, i);
+            if (base == (PyObject *)a || base == (PyObject *)b)
+                return 1;
+        }
+        return 0;
+    }
+    return __Pyx_InBases(cls, a) || __Pyx_InBases(cls, b);
+}
+static CYTHON_INLINE int __Pyx_inner_PyErr_GivenExceptionMatches2(PyObject *err, PyObject* exc_type1, PyObject *exc_type2) {
+    if (exc_type1) {
+        return __Pyx_IsAnySubtype2((PyTypeObject*)err, (PyTypeObject*)exc_type1, (PyTypeObject*)exc_type2);
+    } else {
+        return __Pyx_IsSubtype((PyTypeObject*)err, (PyTypeObject*)exc_type2);
+    }
+}
+static int __Pyx_PyErr_GivenExceptionMatchesTuple(PyObject *exc_type, PyObject *tuple) {
+    Py_ssize_t i, n;
+    assert(PyExceptionClass_Check(exc_type));
+    n = PyTuple_GET_SIZE(tuple);
+    for (i=0; i<n; i++) {
+        if (exc_type == PyTuple_GET_ITEM(tuple, i)) return 1;
+    }
+    for (i=0; i<n; i++) {
+        PyObject *t = PyTuple_GET_ITEM(tuple, i);
+        if (likely(PyExceptionClass_Check(t))) {
+            if (__Pyx_inner_PyErr_GivenExceptionMatches2(exc_type, NULL, t)) return 1;
+        } else {
+        }
+    }
+    return 0;
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches(PyObject *err, PyObject* exc_type) {
+    if (likely(err == exc_type)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        if (likely(PyExceptionClass_Check(exc_type))) {
+            return __Pyx_inner_PyErr_GivenExceptionMatches2(err, NULL, exc_type);
+        } else if (likely(PyTuple_Check(exc_type))) {
+            return __Pyx_PyErr_GivenExceptionMatchesTuple(err, exc_type);
+        } else {
+        }
+    }
+    return PyErr_GivenExceptionMatches(err, exc_type);
+}
+static CYTHON_INLINE int __Pyx_PyErr_GivenExceptionMatches2(PyObject *err, PyObject *exc_type1, PyObject *exc_type2) {
+    assert(PyExceptionClass_Check(exc_type1));
+    assert(PyExceptionClass_Check(exc_type2));
+    if (likely(err == exc_type1 || err == exc_type2)) return 1;
+    if (likely(PyExceptionClass_Check(err))) {
+        return __Pyx_inner_PyErr_GivenExceptionMatches2(err, exc_type1, exc_type2);
+    }
+    return (PyErr_GivenExceptionMatches(err, exc_type1) || PyErr_GivenExceptionMatches(err, exc_type2));
+}
+#endif
+
+/* GetRuntimeVersion */
+#if __PYX_LIMITED_VERSION_HEX < 0x030b0000
+void __Pyx_init_runtime_version(void) {
+    if (__Pyx_cached_runtime_version == 0) {
+        const char* rt_version = Py_GetVersion();
+        unsigned long version = 0;
+        unsigned long factor = 0x01000000UL;
+        unsigned int digit = 0;
+        int i = 0;
+        while (factor) {
+            while ('0' <= rt_version[i] && rt_version[i] <= '9') {
+                digit = digit * 10 + (unsigned int) (rt_version[i] - '0');
+                ++i;
+            }
+            version += factor * digit;
+            if (rt_version[i] != '.')
+                break;
+            digit = 0;
+            factor >>= 8;
+            ++i;
+        }
+        __Pyx_cached_runtime_version = version;
+    }
+}
+#endif
+static unsigned long __Pyx_get_runtime_version(void) {
+#if __PYX_LIMITED_VERSION_HEX >= 0x030b0000
+    return Py_Version & ~0xFFUL;
+#else
+    return __Pyx_cached_runtime_version;
+#endif
+}
+
+/* AddModuleRef */
+#if CYTHON_COMPILING_IN_CPYTHON_FREETHREADING
+  static PyObject *__Pyx_PyImport_AddModuleObjectRef(PyObject *name) {
+      PyObject *module_dict = PyImport_GetModuleDict();
+      PyObject *m;
+      if (PyMapping_GetOptionalItem(module_dict, name, &m) < 0) {
+          return NULL;
+      }
+      if (m != NULL && PyModule_Check(m)) {
+          return m;
+      }
+      Py_XDECREF(m);
+      m = PyModule_NewObject(name);
+      if (m == NULL)
+          return NULL;
+      if (PyDict_CheckExact(module_dict)) {
+          PyObject *new_m;
+          (void)PyDict_SetDefaultRef(module_dict, name, m, &new_m);
+          Py_DECREF(m);
+          return new_m;
+      } else {
+           if (PyObject_SetItem(module_dict, name, m) != 0) {
+                Py_DECREF(m);
+                return NULL;
+            }
+            return m;
+      }
+  }
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *py_name = PyUnicode_FromString(name);
+      if (!py_name) return NULL;
+      PyObject *module = __Pyx_PyImport_AddModuleObjectRef(py_name);
+      Py_DECREF(py_name);
+      return module;
+  }
+#elif __PYX_LIMITED_VERSION_HEX >= 0x030d0000
+  #define __Pyx_PyImport_AddModuleRef(name) PyImport_AddModuleRef(name)
+#else
+  static PyObject *__Pyx_PyImport_AddModuleRef(const char *name) {
+      PyObject *module = PyImport_AddModule(name);
+      Py_XINCREF(module);
+      return module;
+  }
+#endif
+
+/* CheckBinaryVersion */
+static int __Pyx_check_binary_version(unsigned long ct_version, unsigned long rt_version, int allow_newer) {
+    const unsigned long MAJOR_MINOR = 0xFFFF0000UL;
+    if ((rt_version & MAJOR_MINOR) == (ct_version & MAJOR_MINOR))
+        return 0;
+    if (likely(allow_newer && (rt_version & MAJOR_MINOR) > (ct_version & MAJOR_MINOR)))
+        return 1;
+    {
+        char message[200];
+        PyOS_snprintf(message, sizeof(message),
+                      "compile time Python version %d.%d "
+                      "of module '%.100s' "
+                      "%s "
+                      "runtime version %d.%d",
+                       (int) (ct_version >> 24), (int) ((ct_version >> 16) & 0xFF),
+                       __Pyx_MODULE_NAME,
+                       (allow_newer) ? "was newer than" : "does not match",
+                       (int) (rt_version >> 24), (int) ((rt_version >> 16) & 0xFF)
+       );
+        return PyErr_WarnEx(NULL, message, 1);
+    }
+}
+
+/* DecompressString */
+static PyObject *__Pyx_DecompressString(const char *s, Py_ssize_t length, int algo) {
+    PyObject *module = NULL, *decompress, *compressed_bytes, *decompressed;
+    const char* module_name = algo == 3 ? "compression.zstd" : algo == 2 ? "bz2" : "zlib";
+    PyObject *methodname = PyUnicode_FromString("decompress");
+    if (unlikely(!methodname)) return NULL;
+    #if __PYX_LIMITED_VERSION_HEX >= 0x030e0000
+    if (algo == 3) {
+        PyObject *fromlist = Py_BuildValue("[O]", methodname);
+        if (unlikely(!fromlist)) goto bad;
+        module = PyImport_ImportModuleLevel("compression.zstd", NULL, NULL, fromlist, 0);
+        Py_DECREF(fromlist);
+    } else
+    #endif
+        module = PyImport_ImportModule(module_name);
+    if (unlikely(!module)) goto import_failed;
+    decompress = PyObject_GetAttr(module, methodname);
+    if (unlikely(!decompress)) goto import_failed;
+    {
+        #ifdef __cplusplus
+            char *memview_bytes = const_cast<char*>(s);
+        #else
+            #if defined(__clang__)
+              #pragma clang diagnostic push
+              #pragma clang diagnostic ignored "-Wcast-qual"
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic push
+              #pragma GCC diagnostic ignored "-Wcast-qual"
+            #endif
+            char *memview_bytes = (char*) s;
+            #if defined(__clang__)
+              #pragma clang diagnostic pop
+            #elif !defined(__INTEL_COMPILER) && defined(__GNUC__)
+              #pragma GCC diagnostic pop
+            #endif
+        #endif
+        #if CYTHON_COMPILING_IN_LIMITED_API && !defined(PyBUF_READ)
+        int memview_flags = 0x100;
+        #else
+        int memview_flags = PyBUF_READ;
+        #endif
+        compressed_bytes = PyMemoryView_FromMemory(memview_bytes, length, memview_flags);
+    }
+    if (unlikely(!compressed_bytes)) {
+        Py_DECREF(decompress);
+        goto bad;
+    }
+    decompressed = PyObject_CallFunctionObjArgs(decompress, compressed_bytes, NULL);
+    Py_DECREF(compressed_bytes);
+    Py_DECREF(decompress);
+    Py_DECREF(module);
+    Py_DECREF(methodname);
+    return decompressed;
+import_failed:
+    PyErr_Format(PyExc_ImportError,
+        "Failed to import '%.20s.decompress' - cannot initialise module strings. "
+        "String compression was configured with the C macro 'CYTHON_COMPRESS_STRINGS=%d'.",
+        module_name, algo);
+bad:
+    Py_XDECREF(module);
+    Py_DECREF(methodname);
+    return NULL;
+}
+
+#include <string.h>
+static CYTHON_INLINE Py_ssize_t __Pyx_ssize_strlen(const char *s) {
+    size_t len = strlen(s);
+    if (unlikely(len > (size_t) PY_SSIZE_T_MAX)) {
+        PyErr_SetString(PyExc_OverflowError, "byte string is too long");
+        return -1;
+    }
+    return (Py_ssize_t) len;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyUnicode_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return __Pyx_PyUnicode_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE PyObject* __Pyx_PyByteArray_FromString(const char* c_str) {
+    Py_ssize_t len = __Pyx_ssize_strlen(c_str);
+    if (unlikely(len < 0)) return NULL;
+    return PyByteArray_FromStringAndSize(c_str, len);
+}
+static CYTHON_INLINE const char* __Pyx_PyObject_AsString(PyObject* o) {
+    Py_ssize_t ignore;
+    return __Pyx_PyObject_AsStringAndSize(o, &ignore);
+}
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+static CYTHON_INLINE const char* __Pyx_PyUnicode_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+    if (unlikely(__Pyx_PyUnicode_READY(o) == -1)) return NULL;
+#if CYTHON_COMPILING_IN_LIMITED_API
+    {
+        const char* result;
+        Py_ssize_t unicode_length;
+        CYTHON_MAYBE_UNUSED_VAR(unicode_length); // only for __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        #if __PYX_LIMITED_VERSION_HEX < 0x030A0000
+        if (unlikely(PyArg_Parse(o, "s#", &result, length) < 0)) return NULL;
+        #else
+        result = PyUnicode_AsUTF8AndSize(o, length);
+        #endif
+        #if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+        unicode_length = PyUnicode_GetLength(o);
+        if (unlikely(unicode_length < 0)) return NULL;
+        if (unlikely(unicode_length != *length)) {
+            PyUnicode_AsASCIIString(o);
+            return NULL;
+        }
+        #endif
+        return result;
+    }
+#else
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII
+    if (likely(PyUnicode_IS_ASCII(o))) {
+        *length = PyUnicode_GET_LENGTH(o);
+        return PyUnicode_AsUTF8(o);
+    } else {
+        PyUnicode_AsASCIIString(o);
+        return NULL;
+    }
+#else
+    return PyUnicode_AsUTF8AndSize(o, length);
+#endif
+#endif
+}
+#endif
+static CYTHON_INLINE const char* __Pyx_PyObject_AsStringAndSize(PyObject* o, Py_ssize_t *length) {
+#if __PYX_DEFAULT_STRING_ENCODING_IS_ASCII || __PYX_DEFAULT_STRING_ENCODING_IS_UTF8
+    if (PyUnicode_Check(o)) {
+        return __Pyx_PyUnicode_AsStringAndSize(o, length);
+    } else
+#endif
+    if (PyByteArray_Check(o)) {
+#if (CYTHON_ASSUME_SAFE_SIZE && CYTHON_ASSUME_SAFE_MACROS) || (CYTHON_COMPILING_IN_PYPY && (defined(PyByteArray_AS_STRING) && defined(PyByteArray_GET_SIZE)))
+        *length = PyByteArray_GET_SIZE(o);
+        return PyByteArray_AS_STRING(o);
+#else
+        *length = PyByteArray_Size(o);
+        if (*length == -1) return NULL;
+        return PyByteArray_AsString(o);
+#endif
+    } else
+    {
+        char* result;
+        int r = PyBytes_AsStringAndSize(o, &result, length);
+        if (unlikely(r < 0)) {
+            return NULL;
+        } else {
+            return result;
+        }
+    }
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrue(PyObject* x) {
+   int is_true = x == Py_True;
+   if (is_true | (x == Py_False) | (x == Py_None)) return is_true;
+   else return PyObject_IsTrue(x);
+}
+static CYTHON_INLINE int __Pyx_PyObject_IsTrueAndDecref(PyObject* x) {
+    int retval;
+    if (unlikely(!x)) return -1;
+    retval = __Pyx_PyObject_IsTrue(x);
+    Py_DECREF(x);
+    return retval;
+}
+static PyObject* __Pyx_PyNumber_LongWrongResultType(PyObject* result) {
+    __Pyx_TypeName result_type_name = __Pyx_PyType_GetFullyQualifiedName(Py_TYPE(result));
+    if (PyLong_Check(result)) {
+        if (PyErr_WarnFormat(PyExc_DeprecationWarning, 1,
+                "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ").  "
+                "The ability to return an instance of a strict subclass of int is deprecated, "
+                "and may be removed in a future version of Python.",
+                result_type_name)) {
+            __Pyx_DECREF_TypeName(result_type_name);
+            Py_DECREF(result);
+            return NULL;
+        }
+        __Pyx_DECREF_TypeName(result_type_name);
+        return result;
+    }
+    PyErr_Format(PyExc_TypeError,
+                 "__int__ returned non-int (type " __Pyx_FMT_TYPENAME ")",
+                 result_type_name);
+    __Pyx_DECREF_TypeName(result_type_name);
+    Py_DECREF(result);
+    return NULL;
+}
+static CYTHON_INLINE PyObject* __Pyx_PyNumber_Long(PyObject* x) {
+#if CYTHON_USE_TYPE_SLOTS
+  PyNumberMethods *m;
+#endif
+  PyObject *res = NULL;
+  if (likely(PyLong_Check(x)))
+      return __Pyx_NewRef(x);
+#if CYTHON_USE_TYPE_SLOTS
+  m = Py_TYPE(x)->tp_as_number;
+  if (likely(m && m->nb_int)) {
+      res = m->nb_int(x);
+  }
+#else
+  if (!PyBytes_CheckExact(x) && !PyUnicode_CheckExact(x)) {
+      res = PyNumber_Long(x);
+  }
+#endif
+  if (likely(res)) {
+      if (unlikely(!PyLong_CheckExact(res))) {
+          return __Pyx_PyNumber_LongWrongResultType(res);
+      }
+  }
+  else if (!PyErr_Occurred()) {
+      PyErr_SetString(PyExc_TypeError,
+                      "an integer is required");
+  }
+  return res;
+}
+static CYTHON_INLINE Py_ssize_t __Pyx_PyIndex_AsSsize_t(PyObject* b) {
+  Py_ssize_t ival;
+  PyObject *x;
+  if (likely(PyLong_CheckExact(b))) {
+    #if CYTHON_USE_PYLONG_INTERNALS
+    if (likely(__Pyx_PyLong_IsCompact(b))) {
+        return __Pyx_PyLong_CompactValue(b);
+    } else {
+      const digit* digits = __Pyx_PyLong_Digits(b);
+      const Py_ssize_t size = __Pyx_PyLong_SignedDigitCount(b);
+      switch (size) {
+         case 2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -2:
+           if (8 * sizeof(Py_ssize_t) > 2 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -3:
+           if (8 * sizeof(Py_ssize_t) > 3 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case 4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return (Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+         case -4:
+           if (8 * sizeof(Py_ssize_t) > 4 * PyLong_SHIFT) {
+             return -(Py_ssize_t) (((((((((size_t)digits[3]) << PyLong_SHIFT) | (size_t)digits[2]) << PyLong_SHIFT) | (size_t)digits[1]) << PyLong_SHIFT) | (size_t)digits[0]));
+           }
+           break;
+      }
+    }
+    #endif
+    return PyLong_AsSsize_t(b);
+  }
+  x = PyNumber_Index(b);
+  if (!x) return -1;
+  ival = PyLong_AsSsize_t(x);
+  Py_DECREF(x);
+  return ival;
+}
+static CYTHON_INLINE Py_hash_t __Pyx_PyIndex_AsHash_t(PyObject* o) {
+  if (sizeof(Py_hash_t) == sizeof(Py_ssize_t)) {
+    return (Py_hash_t) __Pyx_PyIndex_AsSsize_t(o);
+  } else {
+    Py_ssize_t ival;
+    PyObject *x;
+    x = PyNumber_Index(o);
+    if (!x) return -1;
+    ival = PyLong_AsLong(x);
+    Py_DECREF(x);
+    return ival;
+  }
+}
+static CYTHON_INLINE PyObject *__Pyx_Owned_Py_None(int b) {
+    CYTHON_UNUSED_VAR(b);
+    return __Pyx_NewRef(Py_None);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyBool_FromLong(long b) {
+  return __Pyx_NewRef(b ? Py_True: Py_False);
+}
+static CYTHON_INLINE PyObject * __Pyx_PyLong_FromSize_t(size_t ival) {
+    return PyLong_FromSize_t(ival);
+}
+
+
+/* MultiPhaseInitModuleState */
+#if CYTHON_PEP489_MULTI_PHASE_INIT && CYTHON_USE_MODULE_STATE
+#ifndef CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#if (CYTHON_COMPILING_IN_LIMITED_API || PY_VERSION_HEX >= 0x030C0000)
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 1
+#else
+  #define CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE 0
+#endif
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE && !CYTHON_ATOMICS
+#error "Module state with PEP489 requires atomics. Currently that's one of\
+ C11, C++11, gcc atomic intrinsics or MSVC atomic intrinsics"
+#endif
+#if !CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+#define __Pyx_ModuleStateLookup_Lock()
+#define __Pyx_ModuleStateLookup_Unlock()
+#elif !CYTHON_COMPILING_IN_LIMITED_API && PY_VERSION_HEX >= 0x030d0000
+static PyMutex __Pyx_ModuleStateLookup_mutex = {0};
+#define __Pyx_ModuleStateLookup_Lock() PyMutex_Lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() PyMutex_Unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(__cplusplus) && __cplusplus >= 201103L
+#include <mutex>
+static std::mutex __Pyx_ModuleStateLookup_mutex;
+#define __Pyx_ModuleStateLookup_Lock() __Pyx_ModuleStateLookup_mutex.lock()
+#define __Pyx_ModuleStateLookup_Unlock() __Pyx_ModuleStateLookup_mutex.unlock()
+#elif defined(__STDC_VERSION__) && (__STDC_VERSION__ > 201112L) && !defined(__STDC_NO_THREADS__)
+#include <threads.h>
+static mtx_t __Pyx_ModuleStateLookup_mutex;
+static once_flag __Pyx_ModuleStateLookup_mutex_once_flag = ONCE_FLAG_INIT;
+static void __Pyx_ModuleStateLookup_initialize_mutex(void) {
+    mtx_init(&__Pyx_ModuleStateLookup_mutex, mtx_plain);
+}
+#define __Pyx_ModuleStateLookup_Lock()\
+  call_once(&__Pyx_ModuleStateLookup_mutex_once_flag, __Pyx_ModuleStateLookup_initialize_mutex);\
+  mtx_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() mtx_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(HAVE_PTHREAD_H)
+#include <pthread.h>
+static pthread_mutex_t __Pyx_ModuleStateLookup_mutex = PTHREAD_MUTEX_INITIALIZER;
+#define __Pyx_ModuleStateLookup_Lock() pthread_mutex_lock(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() pthread_mutex_unlock(&__Pyx_ModuleStateLookup_mutex)
+#elif defined(_WIN32)
+#include <Windows.h>  // synchapi.h on its own doesn't work
+static SRWLOCK __Pyx_ModuleStateLookup_mutex = SRWLOCK_INIT;
+#define __Pyx_ModuleStateLookup_Lock() AcquireSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#define __Pyx_ModuleStateLookup_Unlock() ReleaseSRWLockExclusive(&__Pyx_ModuleStateLookup_mutex)
+#else
+#error "No suitable lock available for CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE.\
+ Requires C standard >= C11, or C++ standard >= C++11,\
+ or pthreads, or the Windows 32 API, or Python >= 3.13."
+#endif
+typedef struct {
+    int64_t id;
+    PyObject *module;
+} __Pyx_InterpreterIdAndModule;
+typedef struct {
+    char interpreter_id_as_index;
+    Py_ssize_t count;
+    Py_ssize_t allocated;
+    __Pyx_InterpreterIdAndModule table[1];
+} __Pyx_ModuleStateLookupData;
+#define __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE 32
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_int_type __Pyx_ModuleStateLookup_read_counter = 0;
+#endif
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static __pyx_atomic_ptr_type __Pyx_ModuleStateLookup_data = 0;
+#else
+static __Pyx_ModuleStateLookupData* __Pyx_ModuleStateLookup_data = NULL;
+#endif
+static __Pyx_InterpreterIdAndModule* __Pyx_State_FindModuleStateLookupTableLowerBound(
+        __Pyx_InterpreterIdAndModule* table,
+        Py_ssize_t count,
+        int64_t interpreterId) {
+    __Pyx_InterpreterIdAndModule* begin = table;
+    __Pyx_InterpreterIdAndModule* end = begin + count;
+    if (begin->id == interpreterId) {
+        return begin;
+    }
+    while ((end - begin) > __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+        __Pyx_InterpreterIdAndModule* halfway = begin + (end - begin)/2;
+        if (halfway->id == interpreterId) {
+            return halfway;
+        }
+        if (halfway->id < interpreterId) {
+            begin = halfway;
+        } else {
+            end = halfway;
+        }
+    }
+    for (; begin < end; ++begin) {
+        if (begin->id >= interpreterId) return begin;
+    }
+    return begin;
+}
+static PyObject *__Pyx_State_FindModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    if (interpreter_id == -1) return NULL;
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData* data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+    {
+        __pyx_atomic_incr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        if (likely(data)) {
+            __Pyx_ModuleStateLookupData* new_data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_acquire(&__Pyx_ModuleStateLookup_data);
+            if (likely(data == new_data)) {
+                goto read_finished;
+            }
+        }
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+        __Pyx_ModuleStateLookup_Lock();
+        __pyx_atomic_incr_relaxed(&__Pyx_ModuleStateLookup_read_counter);
+        data = (__Pyx_ModuleStateLookupData*)__pyx_atomic_pointer_load_relaxed(&__Pyx_ModuleStateLookup_data);
+        __Pyx_ModuleStateLookup_Unlock();
+    }
+  read_finished:;
+#else
+    __Pyx_ModuleStateLookupData* data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_InterpreterIdAndModule* found = NULL;
+    if (unlikely(!data)) goto end;
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            found = data->table+interpreter_id;
+        }
+    } else {
+        found = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+    }
+  end:
+    {
+        PyObject *result=NULL;
+        if (found && found->id == interpreter_id) {
+            result = found->module;
+        }
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+        __pyx_atomic_decr_acq_rel(&__Pyx_ModuleStateLookup_read_counter);
+#endif
+        return result;
+    }
+}
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+static void __Pyx_ModuleStateLookup_wait_until_no_readers(void) {
+    while (__pyx_atomic_load(&__Pyx_ModuleStateLookup_read_counter) != 0);
+}
+#else
+#define __Pyx_ModuleStateLookup_wait_until_no_readers()
+#endif
+static int __Pyx_State_AddModuleInterpIdAsIndex(__Pyx_ModuleStateLookupData **old_data, PyObject* module, int64_t interpreter_id) {
+    Py_ssize_t to_allocate = (*old_data)->allocated;
+    while (to_allocate <= interpreter_id) {
+        if (to_allocate == 0) to_allocate = 1;
+        else to_allocate *= 2;
+    }
+    __Pyx_ModuleStateLookupData *new_data = *old_data;
+    if (to_allocate != (*old_data)->allocated) {
+         new_data = (__Pyx_ModuleStateLookupData *)realloc(
+            *old_data,
+            sizeof(__Pyx_ModuleStateLookupData)+(to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+        if (!new_data) {
+            PyErr_NoMemory();
+            return -1;
+        }
+        for (Py_ssize_t i = new_data->allocated; i < to_allocate; ++i) {
+            new_data->table[i].id = i;
+            new_data->table[i].module = NULL;
+        }
+        new_data->allocated = to_allocate;
+    }
+    new_data->table[interpreter_id].module = module;
+    if (new_data->count < interpreter_id+1) {
+        new_data->count = interpreter_id+1;
+    }
+    *old_data = new_data;
+    return 0;
+}
+static void __Pyx_State_ConvertFromInterpIdAsIndex(__Pyx_ModuleStateLookupData *data) {
+    __Pyx_InterpreterIdAndModule *read = data->table;
+    __Pyx_InterpreterIdAndModule *write = data->table;
+    __Pyx_InterpreterIdAndModule *end = read + data->count;
+    for (; read<end; ++read) {
+        if (read->module) {
+            write->id = read->id;
+            write->module = read->module;
+            ++write;
+        }
+    }
+    data->count = write - data->table;
+    for (; write<end; ++write) {
+        write->id = 0;
+        write->module = NULL;
+    }
+    data->interpreter_id_as_index = 0;
+}
+static int __Pyx_State_AddModule(PyObject* module, CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    int result = 0;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *old_data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *old_data = __Pyx_ModuleStateLookup_data;
+#endif
+    __Pyx_ModuleStateLookupData *new_data = old_data;
+    if (!new_data) {
+        new_data = (__Pyx_ModuleStateLookupData *)calloc(1, sizeof(__Pyx_ModuleStateLookupData));
+        if (!new_data) {
+            result = -1;
+            PyErr_NoMemory();
+            goto end;
+        }
+        new_data->allocated = 1;
+        new_data->interpreter_id_as_index = 1;
+    }
+    __Pyx_ModuleStateLookup_wait_until_no_readers();
+    if (new_data->interpreter_id_as_index) {
+        if (interpreter_id < __PYX_MODULE_STATE_LOOKUP_SMALL_SIZE) {
+            result = __Pyx_State_AddModuleInterpIdAsIndex(&new_data, module, interpreter_id);
+            goto end;
+        }
+        __Pyx_State_ConvertFromInterpIdAsIndex(new_data);
+    }
+    {
+        Py_ssize_t insert_at = 0;
+        {
+            __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+                new_data->table, new_data->count, interpreter_id);
+            assert(lower_bound);
+            insert_at = lower_bound - new_data->table;
+            if (unlikely(insert_at < new_data->count && lower_bound->id == interpreter_id)) {
+                lower_bound->module = module;
+                goto end;  // already in table, nothing more to do
+            }
+        }
+        if (new_data->count+1 >= new_data->allocated) {
+            Py_ssize_t to_allocate = (new_data->count+1)*2;
+            new_data =
+                (__Pyx_ModuleStateLookupData*)realloc(
+                    new_data,
+                    sizeof(__Pyx_ModuleStateLookupData) +
+                    (to_allocate-1)*sizeof(__Pyx_InterpreterIdAndModule));
+            if (!new_data) {
+                result = -1;
+                new_data = old_data;
+                PyErr_NoMemory();
+                goto end;
+            }
+            new_data->allocated = to_allocate;
+        }
+        ++new_data->count;
+        int64_t last_id = interpreter_id;
+        PyObject *last_module = module;
+        for (Py_ssize_t i=insert_at; i<new_data->count; ++i) {
+            int64_t current_id = new_data->table[i].id;
+            new_data->table[i].id = last_id;
+            last_id = current_id;
+            PyObject *current_module = new_data->table[i].module;
+            new_data->table[i].module = last_module;
+            last_module = current_module;
+        }
+    }
+  end:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, new_data);
+#else
+    __Pyx_ModuleStateLookup_data = new_data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return result;
+}
+static int __Pyx_State_RemoveModule(CYTHON_UNUSED void* dummy) {
+    int64_t interpreter_id = PyInterpreterState_GetID(__Pyx_PyInterpreterState_Get());
+    if (interpreter_id == -1) return -1;
+    __Pyx_ModuleStateLookup_Lock();
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __Pyx_ModuleStateLookupData *data = (__Pyx_ModuleStateLookupData *)
+            __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, 0);
+#else
+    __Pyx_ModuleStateLookupData *data = __Pyx_ModuleStateLookup_data;
+#endif
+    if (data->interpreter_id_as_index) {
+        if (interpreter_id < data->count) {
+            data->table[interpreter_id].module = NULL;
+        }
+        goto done;
+    }
+    {
+        __Pyx_ModuleStateLookup_wait_until_no_readers();
+        __Pyx_InterpreterIdAndModule* lower_bound = __Pyx_State_FindModuleStateLookupTableLowerBound(
+            data->table, data->count, interpreter_id);
+        if (!lower_bound) goto done;
+        if (lower_bound->id != interpreter_id) goto done;
+        __Pyx_InterpreterIdAndModule *end = data->table+data->count;
+        for (;lower_bound<end-1; ++lower_bound) {
+            lower_bound->id = (lower_bound+1)->id;
+            lower_bound->module = (lower_bound+1)->module;
+        }
+    }
+    --data->count;
+    if (data->count == 0) {
+        free(data);
+        data = NULL;
+    }
+  done:
+#if CYTHON_MODULE_STATE_LOOKUP_THREAD_SAFE
+    __pyx_atomic_pointer_exchange(&__Pyx_ModuleStateLookup_data, data);
+#else
+    __Pyx_ModuleStateLookup_data = data;
+#endif
+    __Pyx_ModuleStateLookup_Unlock();
+    return 0;
+}
+#endif
+
+/* #### Code section: utility_code_pragmas_end ### */
+#ifdef _MSC_VER
+#pragma warning( pop )
+#endif
+
+
+
+/* #### Code section: end ### */
+#endif /* Py_PYTHON_H */
@@ -0,0 +1,49 @@
+# cython: language_level=3
+from nonaga_board cimport GRID_CELLS
+from nonaga_logic cimport NonagaLogic
+
+cdef enum:
+    POSITION_TILES = 19         # tiles of a Nonaga island
+    POSITION_PIECES = 6
+    # every movable tile to every empty cell next to the island
+    MAX_TILE_MOVES = POSITION_TILES * 6 * POSITION_TILES
+    NUM_COST_FEATURES = 8       # the terms weighted by the 8 parameters of AI.cost_function
+
+
+# Copy of a game position in plain C data, so that it can be played on without the GIL.
+# Coordinates are the real (q, r) ones; cells is the occupancy grid of NonagaBoard.
+cdef struct Position:
+    unsigned char cells[GRID_CELLS]
+    int num_tiles
+    int tile_cells[POSITION_TILES]
+    int tile_q[POSITION_TILES]
+    int tile_r[POSITION_TILES]
+    int num_pieces
+    int piece_cells[POSITION_PIECES]
+    int piece_colors[POSITION_PIECES]
+    int piece_q[POSITION_PIECES]
+    int piece_r[POSITION_PIECES]
+    int current_player
+    int turn_phase
+
+
+cdef void set_position(Position* position, int num_tiles, const int* tile_q, const int* tile_r,
+                       int num_pieces, const int* piece_q, const int* piece_r, const int* piece_colors,
+                       int current_player, int turn_phase) noexcept nogil
+cdef void load_position(Position* position, NonagaLogic game) except *
+cdef bint same_position(const Position* a, const Position* b) noexcept nogil
+
+cdef int fill_position_piece_moves(const Position* position, int* moves) noexcept nogil
+cdef int fill_position_tile_moves(Position* position, int* moves) noexcept nogil
+cdef void play_piece_move(Position* position, int move) noexcept nogil
+cdef void play_tile_move(Position* position, int move) noexcept nogil
+cdef void undo_piece_move(Position* position, int move) noexcept nogil
+cdef void undo_tile_move(Position* position, int move) noexcept nogil
+cdef tuple move_positions(const Position* position, int move, bint piece_move)
+
+cdef bint position_won(const Position* position, int color) noexcept nogil
+cdef int find_winning_slide(const Position* position, int color) noexcept nogil
+cdef int fill_winning_slides(const Position* position, int color, int* moves) noexcept nogil
+cdef void position_features(const Position* position, int color, int* features) noexcept nogil
+cdef void cost_features(const Position* position, int max_color, int* row) noexcept nogil
+cdef int position_cost(const Position* position, int max_color, const int* params) noexcept nogil
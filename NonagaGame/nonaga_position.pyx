@@ -0,0 +1,370 @@
+# cython: language_level=3, boundscheck=False, wraparound=False
+# Not profiled: its functions run without the GIL, millions of times per search, and trace hooks would dwarf them
+from libc.string cimport memcmp, memmove, memset
+
+from nonaga_constants import PIECE_TO_MOVE, TILE_TO_MOVE
+from nonaga_board cimport (NonagaBoard, NonagaPiece, NonagaTile, GRID_BITS, GRID_MASK, GRID_CELLS, CELL_EMPTY, CELL_TILE, CELL_PIECE,
+                           MAX_PIECE_MOVES,
+                           cell_index, unwrap_coordinate, encode_piece_move, piece_move_from, piece_move_to,
+                           step_cell, neighbor_mask, is_movable_tile, is_valid_tile_destination_mask, articulation_tiles,
+                           slide_moves)
+from nonaga_logic cimport NonagaLogic
+
+cdef int _PIECE_TO_MOVE = PIECE_TO_MOVE
+cdef int _TILE_TO_MOVE = TILE_TO_MOVE
+
+
+cdef inline int _hex_distance(int q1, int r1, int q2, int r2) noexcept nogil:
+    cdef int dq = q1 - q2
+    cdef int dr = r1 - r2
+    cdef int ds = dq + dr
+    if dq < 0: dq = -dq
+    if dr < 0: dr = -dr
+    if ds < 0: ds = -ds
+    return (dq + dr + ds) // 2
+
+
+cdef void set_position(Position* position, int num_tiles, const int* tile_q, const int* tile_r,
+                       int num_pieces, const int* piece_q, const int* piece_r, const int* piece_colors,
+                       int current_player, int turn_phase) noexcept nogil:
+    """Fill a position from its coordinates; at most POSITION_TILES tiles and POSITION_PIECES pieces."""
+    cdef int i
+    memset(position.cells, CELL_EMPTY, GRID_CELLS)
+    position.num_tiles = num_tiles
+    for i in range(num_tiles):
+        position.tile_q[i] = tile_q[i]
+        position.tile_r[i] = tile_r[i]
+        position.tile_cells[i] = cell_index(tile_q[i], tile_r[i])
+        position.cells[position.tile_cells[i]] = CELL_TILE
+    position.num_pieces = num_pieces
+    for i in range(num_pieces):
+        position.piece_q[i] = piece_q[i]
+        position.piece_r[i] = piece_r[i]
+        position.piece_colors[i] = piece_colors[i]
+        position.piece_cells[i] = cell_index(piece_q[i], piece_r[i])
+        position.cells[position.piece_cells[i]] = CELL_PIECE
+    position.current_player = current_player
+    position.turn_phase = turn_phase
+
+
+cdef void load_position(Position* position, NonagaLogic game) except *:
+    """Copy the position of a game; it must have at most POSITION_TILES tiles and POSITION_PIECES pieces."""
+    cdef NonagaBoard board = game.board
+    cdef NonagaTile tile
+    cdef NonagaPiece piece
+    cdef int tile_q[POSITION_TILES]
+    cdef int tile_r[POSITION_TILES]
+    cdef int piece_q[POSITION_PIECES]
+    cdef int piece_r[POSITION_PIECES]
+    cdef int piece_colors[POSITION_PIECES]
+    cdef int i
+    if len(board.tiles) > POSITION_TILES or len(board.pieces) > POSITION_PIECES:
+        raise ValueError("Too many tiles or pieces for a Position.")
+    for i in range(len(board.tiles)):
+        tile = <NonagaTile>board.tiles[i]
+        tile_q[i] = tile.q
+        tile_r[i] = tile.r
+    for i in range(len(board.pieces)):
+        piece = <NonagaPiece>board.pieces[i]
+        piece_q[i] = piece.q
+        piece_r[i] = piece.r
+        piece_colors[i] = piece.color
+    set_position(position, len(board.tiles), tile_q, tile_r, len(board.pieces), piece_q, piece_r, piece_colors,
+                 game.current_player, game.turn_phase)
+
+
+cdef bint same_position(const Position* a, const Position* b) noexcept nogil:
+    """Same tiles, same pieces of each color and same player and phase to play."""
+    cdef int i, j
+    cdef bint found
+    if a.current_player != b.current_player or a.turn_phase != b.turn_phase or a.num_pieces != b.num_pieces:
+        return False
+    if memcmp(a.cells, b.cells, GRID_CELLS) != 0:
+        return False
+    for i in range(a.num_pieces):
+        found = False
+        for j in range(b.num_pieces):
+            if a.piece_cells[i] == b.piece_cells[j]:
+                found = a.piece_colors[i] == b.piece_colors[j]
+                break
+        if not found:
+            return False
+    return True
+
+
+# ── moves ────────────────────────────────────────────────
+cdef int fill_position_piece_moves(const Position* position, int* moves) noexcept nogil:
+    """Encoded slides of the player to move, see NonagaBoard.fill_piece_moves."""
+    return slide_moves(position.cells, position.piece_cells, position.piece_colors,
+                       position.num_pieces, position.current_player, moves)
+
+
+cdef int fill_position_tile_moves(Position* position, int* moves) noexcept nogil:
+    """Tile moves of NonagaLogic.get_all_valid_tile_moves, encoded like piece moves by encode_piece_move.
+
+    They come in the order of get_all_valid_tile_moves_ai: by tile, in board
+    order, then by destination cell.
+
+    *moves* must hold at least MAX_TILE_MOVES entries. The position is
+    modified while a tile is lifted, and restored before returning.
+    """
+    cdef int frontier[POSITION_TILES * 6]
+    cdef int order[POSITION_TILES]
+    cdef int low[POSITION_TILES]
+    cdef bint cut[POSITION_TILES]
+    cdef int num_frontier = 0, count = 0
+    cdef int i, j, k, cell, origin
+
+    # empty cells touching the island, the only candidates, sorted like NonagaIsland.ordered_tile_destinations
+    for i in range(position.num_tiles):
+        for k in range(6):
+            cell = step_cell(position.tile_cells[i], k)
+            if position.cells[cell] != CELL_EMPTY:
+                continue
+            j = num_frontier
+            while j > 0 and frontier[j - 1] > cell:
+                j -= 1
+            if j > 0 and frontier[j - 1] == cell:
+                continue
+            memmove(&frontier[j + 1], &frontier[j], (num_frontier - j) * sizeof(int))
+            frontier[j] = cell
+            num_frontier += 1
+
+    articulation_tiles(position.cells, position.tile_cells, position.num_tiles, order, low, cut)
+    for i in range(position.num_tiles):
+        origin = position.tile_cells[i]
+        if position.cells[origin] != CELL_TILE or cut[i] or not is_movable_tile(neighbor_mask(position.cells, origin)):
+            continue
+        position.cells[origin] = CELL_EMPTY
+        for j in range(num_frontier):
+            if is_valid_tile_destination_mask(neighbor_mask(position.cells, frontier[j])):
+                moves[count] = encode_piece_move(origin, frontier[j])
+                count += 1
+        position.cells[origin] = CELL_TILE
+    return count
+
+
+cdef inline void _next_phase(Position* position) noexcept nogil:
+    if position.turn_phase == _PIECE_TO_MOVE:
+        position.turn_phase = _TILE_TO_MOVE
+    else:
+        position.turn_phase = _PIECE_TO_MOVE
+        position.current_player = (position.current_player + 1) % 2
+
+
+cdef inline void _last_phase(Position* position) noexcept nogil:
+    if position.turn_phase == _TILE_TO_MOVE:
+        position.turn_phase = _PIECE_TO_MOVE
+    else:
+        position.turn_phase = _TILE_TO_MOVE
+        position.current_player = (position.current_player + 1) % 2
+
+
+cdef inline void _slide(Position* position, int origin, int destination) noexcept nogil:
+    cdef int i
+    for i in range(position.num_pieces):
+        if position.piece_cells[i] == origin:
+            position.piece_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.piece_q[i])
+            position.piece_r[i] = unwrap_coordinate(destination & GRID_MASK, position.piece_r[i])
+            position.piece_cells[i] = destination
+            break
+    position.cells[origin] = CELL_TILE
+    position.cells[destination] = CELL_PIECE
+
+
+cdef inline void _carry(Position* position, int origin, int destination) noexcept nogil:
+    cdef int i
+    for i in range(position.num_tiles):
+        if position.tile_cells[i] == origin:
+            position.tile_q[i] = unwrap_coordinate(destination >> GRID_BITS, position.tile_q[i])
+            position.tile_r[i] = unwrap_coordinate(destination & GRID_MASK, position.tile_r[i])
+            position.tile_cells[i] = destination
+            break
+    position.cells[origin] = CELL_EMPTY
+    position.cells[destination] = CELL_TILE
+
+
+cdef void play_piece_move(Position* position, int move) noexcept nogil:
+    _slide(position, piece_move_from(move), piece_move_to(move))
+    _next_phase(position)
+
+
+cdef void play_tile_move(Position* position, int move) noexcept nogil:
+    _carry(position, piece_move_from(move), piece_move_to(move))
+    _next_phase(position)
+
+
+cdef void undo_piece_move(Position* position, int move) noexcept nogil:
+    _last_phase(position)
+    _slide(position, piece_move_to(move), piece_move_from(move))
+
+
+cdef void undo_tile_move(Position* position, int move) noexcept nogil:
+    _last_phase(position)
+    _carry(position, piece_move_to(move), piece_move_from(move))
+
+
+cdef tuple move_positions(const Position* position, int move, bint piece_move):
+    """(origin, destination) position tuples of a move that can be played in the position."""
+    cdef int origin = piece_move_from(move), destination = piece_move_to(move)
+    cdef int i, q = 0, r = 0
+    if piece_move:
+        for i in range(position.num_pieces):
+            if position.piece_cells[i] == origin:
+                q = position.piece_q[i]
+                r = position.piece_r[i]
+    else:
+        for i in range(position.num_tiles):
+            if position.tile_cells[i] == origin:
+                q = position.tile_q[i]
+                r = position.tile_r[i]
+    cdef int dq = unwrap_coordinate(destination >> GRID_BITS, q)
+    cdef int dr = unwrap_coordinate(destination & GRID_MASK, r)
+    return (q, r, -q - r), (dq, dr, -dq - dr)
+
+
+# ── evaluation ───────────────────────────────────────────
+cdef inline void _pieces_of(const Position* position, int color, int* indices) noexcept nogil:
+    """Indices of the (first three) pieces of a player, in board order like NonagaLogic.pieces_by_color."""
+    cdef int i, n = 0
+    for i in range(position.num_pieces):
+        if position.piece_colors[i] == color and n < 3:
+            indices[n] = i
+            n += 1
+
+
+cdef bint position_won(const Position* position, int color) noexcept nogil:
+    """NonagaLogic.check_win_condition: at least two pairs of the player's pieces in contact."""
+    cdef int p[3]
+    cdef int k, contacts = 0
+    _pieces_of(position, color, p)
+    for k in range(3):
+        if _hex_distance(position.piece_q[p[k]], position.piece_r[p[k]],
+                         position.piece_q[p[(k + 1) % 3]], position.piece_r[p[(k + 1) % 3]]) == 1:
+            contacts += 1
+    return contacts >= 2
+
+
+cdef inline bint _connects(const Position* position, const int* p, int move) noexcept nogil:
+    """Whether the slide of one of the pieces p puts two pairs of them in contact."""
+    cdef int i, moved = 0, a, b, q, r, contacts = 0
+    for i in range(3):
+        if position.piece_cells[p[i]] == piece_move_from(move):
+            moved = i
+    a = p[(moved + 1) % 3]
+    b = p[(moved + 2) % 3]
+    q = unwrap_coordinate(piece_move_to(move) >> GRID_BITS, position.piece_q[p[moved]])
+    r = unwrap_coordinate(piece_move_to(move) & GRID_MASK, position.piece_r[p[moved]])
+    if _hex_distance(position.piece_q[a], position.piece_r[a], position.piece_q[b], position.piece_r[b]) == 1:
+        contacts += 1
+    if _hex_distance(q, r, position.piece_q[a], position.piece_r[a]) == 1:
+        contacts += 1
+    if _hex_distance(q, r, position.piece_q[b], position.piece_r[b]) == 1:
+        contacts += 1
+    return contacts >= 2
+
+
+cdef int find_winning_slide(const Position* position, int color) noexcept nogil:
+    """An encoded slide connecting the player's three pieces, -1 if there is none."""
+    cdef int moves[MAX_PIECE_MOVES]
+    cdef int p[3]
+    cdef int count = slide_moves(position.cells, position.piece_cells, position.piece_colors,
+                                 position.num_pieces, color, moves)
+    cdef int k
+    _pieces_of(position, color, p)
+    for k in range(count):
+        if _connects(position, p, moves[k]):
+            return moves[k]
+    return -1
+
+
+cdef int fill_winning_slides(const Position* position, int color, int* moves) noexcept nogil:
+    """Every encoded slide connecting the player's three pieces, like NonagaLogic.get_winning_piece_moves.
+
+    *moves* must hold MAX_PIECE_MOVES entries; returns their number.
+    """
+    cdef int p[3]
+    cdef int count = slide_moves(position.cells, position.piece_cells, position.piece_colors,
+                                 position.num_pieces, color, moves)
+    cdef int k, winning = 0
+    _pieces_of(position, color, p)
+    for k in range(count):
+        if _connects(position, p, moves[k]):
+            moves[winning] = moves[k]
+            winning += 1
+    return winning
+
+
+cdef void position_features(const Position* position, int color, int* features) noexcept nogil:
+    """The four terms of AI.cost_function for one player's pieces.
+
+    features receives: coordinates shared by pairs of pieces, sum of the
+    two pair distances cost_function keeps, empty cells and enemy pieces in
+    the box spanned by the pieces.
+    """
+    cdef int p[3]
+    cdef int pq[3]
+    cdef int pr[3]
+    cdef int ps[3]
+    cdef int i, j, k, q, r, s, cell, aligned = 0, missing = 0, enemies = 0
+    _pieces_of(position, color, p)
+    for i in range(3):
+        pq[i] = position.piece_q[p[i]]
+        pr[i] = position.piece_r[p[i]]
+        ps[i] = -pq[i] - pr[i]
+    for i in range(3):
+        j = (i + 1) % 3
+        aligned += (pq[i] == pq[j]) + (pr[i] == pr[j]) + (ps[i] == ps[j])
+
+    cdef int d1 = _hex_distance(pq[0], pr[0], pq[1], pr[1])
+    cdef int d2 = _hex_distance(pq[1], pr[1], pq[2], pr[2])
+    cdef int d3 = _hex_distance(pq[2], pr[2], pq[0], pr[0])
+    cdef int distance = d2 + d3 if d1 > d2 and d1 > d3 else (d3 + d1 if d2 > d1 and d2 > d3 else d1 + d2)
+
+    cdef int q_min = min(pq[0], pq[1], pq[2]), q_max = max(pq[0], pq[1], pq[2])
+    cdef int r_min = min(pr[0], pr[1], pr[2]), r_max = max(pr[0], pr[1], pr[2])
+    cdef int s_min = min(ps[0], ps[1], ps[2]), s_max = max(ps[0], ps[1], ps[2])
+    for q in range(q_min, q_max + 1):
+        for r in range(r_min, r_max + 1):
+            s = -q - r
+            if s < s_min or s > s_max:
+                continue
+            cell = cell_index(q, r)
+            if position.cells[cell] == CELL_EMPTY:
+                missing += 1
+            elif position.cells[cell] == CELL_PIECE:
+                for k in range(position.num_pieces):
+                    if position.piece_cells[k] == cell:
+                        if position.piece_colors[k] != color:
+                            enemies += 1
+                        break
+    features[0] = aligned
+    features[1] = distance
+    features[2] = missing
+    features[3] = enemies
+
+
+cdef void cost_features(const Position* position, int max_color, int* row) noexcept nogil:
+    """The 8 terms of AI.cost_function for the player max_color, signed so that the cost is sum(params[k] * row[k])."""
+    cdef int mine[4]
+    cdef int theirs[4]
+    position_features(position, max_color, mine)
+    position_features(position, (max_color + 1) % 2, theirs)
+    row[0] = mine[0]
+    row[1] = -mine[1]
+    row[2] = -mine[2]
+    row[3] = -mine[3]
+    row[4] = -theirs[0]
+    row[5] = theirs[1]
+    row[6] = theirs[2]
+    row[7] = theirs[3]
+
+
+cdef int position_cost(const Position* position, int max_color, const int* params) noexcept nogil:
+    """AI.cost_function of the position for the player max_color, with the same 8 weights."""
+    cdef int row[NUM_COST_FEATURES]
+    cdef int k, cost = 0
+    cost_features(position, max_color, row)
+    for k in range(NUM_COST_FEATURES):
+        cost += params[k] * row[k]
+    return cost
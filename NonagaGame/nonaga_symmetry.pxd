@@ -0,0 +1,22 @@
+# cython: language_level=3
+from nonaga_logic cimport NonagaLogic
+
+cdef enum:
+    NUM_TRANSFORMS = 12     # 6 rotations, each with or without a reflection
+    MAX_TILES = 32
+    MAX_PIECES = 8
+
+
+cdef class Symmetry:
+    cdef readonly int transform
+    cdef readonly bint swap_colors
+    cdef readonly int dq, dr
+
+    cpdef tuple apply(self, tuple position)
+    cpdef tuple invert(self, tuple position)
+    cpdef int apply_color(self, int color)
+
+
+cdef bytes _canonicalize(NonagaLogic game, Symmetry symmetry)
+cpdef bytes canonical_key(NonagaLogic game)
+cpdef tuple canonicalize(NonagaLogic game)
@@ -0,0 +1,281 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, profile=True
+from nonaga_board cimport NonagaBoard, NonagaTile, NonagaPiece
+
+# ──────────────────────────────────────────────────────────
+# The 12 symmetries of the hex grid as integer matrices on axial coordinates:
+# q' = TRANSFORMS[t][0] * q + TRANSFORMS[t][1] * r,  r' = TRANSFORMS[t][2] * q + TRANSFORMS[t][3] * r
+# ──────────────────────────────────────────────────────────
+def _cube_transform(int t, int q, int r):
+    """Reflect (swap r and s) when t >= 6, then rotate by t % 6 steps of 60 degrees."""
+    cdef int s = -q - r
+    if t >= 6:
+        r, s = s, r
+    for _ in range(t % 6):
+        q, r, s = -r, -s, -q
+    return q, r
+
+cdef int[NUM_TRANSFORMS][4] TRANSFORMS
+cdef int[NUM_TRANSFORMS] INVERSE
+cdef int _t, _u
+for _t in range(NUM_TRANSFORMS):
+    TRANSFORMS[_t][0], TRANSFORMS[_t][2] = _cube_transform(_t, 1, 0)
+    TRANSFORMS[_t][1], TRANSFORMS[_t][3] = _cube_transform(_t, 0, 1)
+for _t in range(NUM_TRANSFORMS):
+    for _u in range(NUM_TRANSFORMS):
+        if (_cube_transform(_u, *_cube_transform(_t, 1, 0)) == (1, 0)
+                and _cube_transform(_u, *_cube_transform(_t, 0, 1)) == (0, 1)):
+            INVERSE[_t] = _u
+
+
+cdef class Symmetry:
+    """Maps positions of a game to its canonical form and back.
+
+    The canonical position is obtained by applying one of the 12 grid symmetries
+    (transform), then translating by (-dq, -dr), and swapping the colors of
+    pieces and players when swap_colors is set.
+    """
+
+    def __init__(self, int transform=0, bint swap_colors=False, int dq=0, int dr=0):
+        self.transform = transform
+        self.swap_colors = swap_colors
+        self.dq = dq
+        self.dr = dr
+
+    cpdef tuple apply(self, tuple position):
+        """Canonical coordinates of a position of the original game."""
+        cdef int q = position[0], r = position[1]
+        cdef int* m = TRANSFORMS[self.transform]
+        cdef int cq = m[0] * q + m[1] * r - self.dq
+        cdef int cr = m[2] * q + m[3] * r - self.dr
+        return (cq, cr, -cq - cr)
+
+    cpdef tuple invert(self, tuple position):
+        """Original coordinates of a canonical position."""
+        cdef int q = position[0] + self.dq, r = position[1] + self.dr
+        cdef int* m = TRANSFORMS[INVERSE[self.transform]]
+        cdef int oq = m[0] * q + m[1] * r
+        cdef int orr = m[2] * q + m[3] * r
+        return (oq, orr, -oq - orr)
+
+    cpdef int apply_color(self, int color):
+        """Canonical color of a player or piece; applying it again gives the original color."""
+        return color ^ 1 if self.swap_colors else color
+
+    def apply_move(self, move):
+        """Canonical form of a ((piece, destination), (tile, destination)) move."""
+        (piece, piece_destination), (tile, tile_destination) = move
+        return ((self.apply(tuple(piece)), self.apply(tuple(piece_destination))),
+                (self.apply(tuple(tile)), self.apply(tuple(tile_destination))))
+
+    def invert_move(self, move):
+        """Original form of a canonical ((piece, destination), (tile, destination)) move."""
+        (piece, piece_destination), (tile, tile_destination) = move
+        return ((self.invert(tuple(piece)), self.invert(tuple(piece_destination))),
+                (self.invert(tuple(tile)), self.invert(tuple(tile_destination))))
+
+    def __repr__(self):
+        return f"Symmetry(transform={self.transform}, swap_colors={self.swap_colors}, dq={self.dq}, dr={self.dr})"
+
+
+cdef inline void _sort(unsigned short* values, int n) noexcept nogil:
+    cdef int i, j
+    cdef unsigned short value
+    for i in range(1, n):
+        value = values[i]
+        j = i - 1
+        while j >= 0 and values[j] > value:
+            values[j + 1] = values[j]
+            j -= 1
+        values[j + 1] = value
+
+
+cdef inline int _compare(unsigned short* a, unsigned short* b, int n) noexcept nogil:
+    cdef int i
+    for i in range(n):
+        if a[i] != b[i]:
+            return -1 if a[i] < b[i] else 1
+    return 0
+
+
+cdef inline int _compare_rows(unsigned long long* a, unsigned long long* b, int n) noexcept nogil:
+    """Compare two tile sets as their sorted cell codes would compare, without sorting them.
+
+    Both sets have the same size, so the one holding the smallest cell of their
+    symmetric difference is the smaller one.
+    """
+    cdef int i
+    cdef unsigned long long diff
+    for i in range(n):
+        diff = a[i] ^ b[i]
+        if diff:
+            return -1 if a[i] & (diff & (~diff + 1)) else 1
+    return 0
+
+
+cdef int _canonical_form(int n_tiles, int* tq, int* tr, int n_pieces, int* pq, int* pr, int* pc,
+                         int player, int phase, unsigned short* best, int* best_info) noexcept nogil:
+    """Smallest encoding of the position over all symmetries and color swaps.
+
+    Cells are encoded as 16-bit values q * 64 + r + 32 after the symmetry and a
+    translation bringing the smallest tile to q = r = 0: tiles sorted, then
+    pieces with their color sorted, then the player to move and the phase.
+    The tiles of an island are connected, so they span fewer than MAX_TILES rows
+    and columns around that tile.
+
+    Returns:
+        the number of values written to best; best_info receives the
+        transform, color swap, dq and dr that produced it
+    """
+    # tile sets as one 64-bit row of r + 32 bits per q, compared without sorting
+    cdef unsigned long long rows[MAX_TILES]
+    cdef unsigned long long best_rows[MAX_TILES]
+    cdef unsigned short rest[MAX_PIECES + 1]
+    cdef unsigned short best_rest[MAX_PIECES + 1]
+    cdef int xq[MAX_TILES]
+    cdef int xr[MAX_TILES]
+    cdef int rest_length = n_pieces + 1
+    cdef bint found = False
+    cdef int t, i, swap, q0, r0, q, r, order
+    cdef unsigned long long row
+    cdef int* m
+
+    for t in range(NUM_TRANSFORMS):
+        m = TRANSFORMS[t]
+        q0 = r0 = 0
+        for i in range(n_tiles):
+            xq[i] = m[0] * tq[i] + m[1] * tr[i]
+            xr[i] = m[2] * tq[i] + m[3] * tr[i]
+            if i == 0 or xq[i] < q0 or (xq[i] == q0 and xr[i] < r0):
+                q0 = xq[i]
+                r0 = xr[i]
+        for i in range(n_tiles):
+            rows[i] = 0
+        for i in range(n_tiles):
+            rows[xq[i] - q0] |= 1ULL << (xr[i] - r0 + 32)
+        # The tiles decide first, the pieces only break ties between equivalent islands
+        order = _compare_rows(rows, best_rows, n_tiles) if found else -1
+        if order > 0:
+            continue
+
+        for swap in range(2):
+            for i in range(n_pieces):
+                q = m[0] * pq[i] + m[1] * pr[i] - q0
+                r = m[2] * pq[i] + m[3] * pr[i] - r0
+                rest[i] = <unsigned short>((q * 64 + r + 32) * 2 + (pc[i] ^ swap))
+            _sort(rest, n_pieces)
+            rest[n_pieces] = <unsigned short>((player ^ swap) * 2 + phase)
+            if order < 0 or _compare(rest, best_rest, rest_length) < 0:
+                for i in range(n_tiles):
+                    best_rows[i] = rows[i]
+                for i in range(rest_length):
+                    best_rest[i] = rest[i]
+                best_info[0] = t
+                best_info[1] = swap
+                best_info[2] = q0
+                best_info[3] = r0
+                found = True
+                order = 0
+
+    # sorted tile codes are the set bits of the rows, in order
+    cdef int length = 0
+    for q in range(n_tiles):
+        row = best_rows[q]
+        r = 0
+        while row:
+            if row & 1:
+                best[length] = <unsigned short>(q * 64 + r)
+                length += 1
+            row >>= 1
+            r += 1
+    for i in range(rest_length):
+        best[length + i] = best_rest[i]
+    return length + rest_length
+
+
+cdef bytes _encode(unsigned short* values, int length):
+    # big-endian, so that keys sort like the values they encode
+    cdef char data[2 * (MAX_TILES + MAX_PIECES + 1)]
+    cdef int i
+    for i in range(length):
+        data[2 * i] = <char>(values[i] >> 8)
+        data[2 * i + 1] = <char>(values[i] & 0xFF)
+    return data[:2 * length]
+
+
+cdef bytes _canonicalize(NonagaLogic game, Symmetry symmetry):
+    """Canonical key of the game's position; fills *symmetry* with the transform when it is not None."""
+    cdef NonagaBoard board = game.board
+    cdef int tq[MAX_TILES]
+    cdef int tr[MAX_TILES]
+    cdef int pq[MAX_PIECES]
+    cdef int pr[MAX_PIECES]
+    cdef int pc[MAX_PIECES]
+    cdef unsigned short best[MAX_TILES + MAX_PIECES + 1]
+    cdef int info[4]
+    cdef int n_tiles = len(board.tiles), n_pieces = len(board.pieces), i, length
+    cdef NonagaTile tile
+    cdef NonagaPiece piece
+
+    if n_tiles > MAX_TILES or n_pieces > MAX_PIECES:
+        raise ValueError("Too many tiles or pieces to canonicalize.")
+    for i in range(n_tiles):
+        tile = <NonagaTile>board.tiles[i]
+        tq[i] = tile.q
+        tr[i] = tile.r
+    for i in range(n_pieces):
+        piece = <NonagaPiece>board.pieces[i]
+        pq[i] = piece.q
+        pr[i] = piece.r
+        pc[i] = piece.color
+    length = _canonical_form(n_tiles, tq, tr, n_pieces, pq, pr, pc, game.current_player, game.turn_phase, best, info)
+    if symmetry is not None:
+        symmetry.transform = info[0]
+        symmetry.swap_colors = info[1]
+        symmetry.dq = info[2]
+        symmetry.dr = info[3]
+    return _encode(best, length)
+
+
+cpdef bytes canonical_key(NonagaLogic game):
+    """Key equal for all positions equivalent under the grid symmetries, translations and a color swap.
+
+    Usable as a dictionary key by transposition tables, opening books and result caches.
+    """
+    return _canonicalize(game, None)
+
+
+cpdef tuple canonicalize(NonagaLogic game):
+    """Canonical key of the game's position and the Symmetry mapping the game to it.
+
+    Returns:
+        (key, symmetry)
+    """
+    cdef Symmetry symmetry = Symmetry()
+    return _canonicalize(game, symmetry), symmetry
+
+
+def canonicalize_snapshot(dict snapshot):
+    """canonicalize() for a NonagaLogic.get_snapshot() position, also accepting one decoded from JSON."""
+    cdef int tq[MAX_TILES]
+    cdef int tr[MAX_TILES]
+    cdef int pq[MAX_PIECES]
+    cdef int pr[MAX_PIECES]
+    cdef int pc[MAX_PIECES]
+    cdef unsigned short best[MAX_TILES + MAX_PIECES + 1]
+    cdef int info[4]
+    cdef list tiles = list(snapshot["tiles"]), pieces = list(snapshot["pieces"])
+    cdef int n_tiles = len(tiles), n_pieces = len(pieces), i, length
+
+    if n_tiles > MAX_TILES or n_pieces > MAX_PIECES:
+        raise ValueError("Too many tiles or pieces to canonicalize.")
+    for i in range(n_tiles):
+        tq[i] = tiles[i][0]
+        tr[i] = tiles[i][1]
+    for i in range(n_pieces):
+        position, color = pieces[i]
+        pq[i] = position[0]
+        pr[i] = position[1]
+        pc[i] = color
+    length = _canonical_form(n_tiles, tq, tr, n_pieces, pq, pr, pc,
+                             snapshot["current_player"], snapshot["turn_phase"], best, info)
+    return _encode(best, length), Symmetry(info[0], info[1], info[2], info[3])
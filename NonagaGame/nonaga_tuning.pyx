@@ -0,0 +1,293 @@
+# cython: language_level=3, boundscheck=False, wraparound=False, profile=True
+"""Texel-style fitting of the cost_function weights on recorded positions.
+
+A sample is a game snapshot with the result of its game for RED: 1 won,
+0 lost, 0.5 drawn. It gives one row of cost features per player, and
+the weights predict the player's result as sigmoid(sum(weights[k] * row[k])).
+"""
+from array import array
+
+from libc.math cimport exp, log, fabs
+
+from nonaga_constants import RED, BLACK
+from nonaga_position cimport Position, POSITION_TILES, POSITION_PIECES, NUM_COST_FEATURES, set_position, cost_features
+
+cdef int _RED = RED
+cdef int _BLACK = BLACK
+
+LOSSES = ("logistic", "squared")
+
+
+cdef inline double _sigmoid(double z) noexcept nogil:
+    return 1.0 / (1.0 + exp(-z))
+
+
+def extract_features(samples):
+    """Cost features and targets of (snapshot, red_result) samples.
+
+    The snapshots are unpacked into flat coordinate arrays, then the features
+    of all the positions are computed in one pass without the GIL.
+
+    Returns:
+        (features, targets): array('i') of rows of NUM_COST_FEATURES columns
+        and array('d'), with RED's row then BLACK's row for each sample
+    """
+    cdef list items = list(samples)
+    cdef Py_ssize_t n = len(items), i, j
+    cdef int[::1] num_tiles = array('i', [0]) * n
+    cdef int[::1] tile_q = array('i', [0]) * (n * POSITION_TILES)
+    cdef int[::1] tile_r = array('i', [0]) * (n * POSITION_TILES)
+    cdef int[::1] num_pieces = array('i', [0]) * n
+    cdef int[::1] piece_q = array('i', [0]) * (n * POSITION_PIECES)
+    cdef int[::1] piece_r = array('i', [0]) * (n * POSITION_PIECES)
+    cdef int[::1] piece_colors = array('i', [0]) * (n * POSITION_PIECES)
+    cdef int[::1] players = array('i', [0]) * n
+    cdef int[::1] phases = array('i', [0]) * n
+    features = array('i', [0]) * (2 * n * NUM_COST_FEATURES)
+    targets = array('d', [0.0]) * (2 * n)
+    cdef int[::1] feature_view = features
+    cdef double[::1] target_view = targets
+    cdef double result
+    cdef Position position
+
+    for i in range(n):
+        snapshot, result = items[i]
+        if not 0.0 <= result <= 1.0:
+            raise ValueError(f"Sample {i} has result {result}, expected a value between 0 and 1.")
+        tiles, pieces = snapshot["tiles"], snapshot["pieces"]
+        if len(tiles) > POSITION_TILES or len(pieces) > POSITION_PIECES:
+            raise ValueError(f"Sample {i} has too many tiles or pieces.")
+        num_tiles[i] = len(tiles)
+        for j in range(len(tiles)):
+            tile_q[i * POSITION_TILES + j] = tiles[j][0]
+            tile_r[i * POSITION_TILES + j] = tiles[j][1]
+        num_pieces[i] = len(pieces)
+        for j in range(len(pieces)):
+            piece_q[i * POSITION_PIECES + j] = pieces[j][0][0]
+            piece_r[i * POSITION_PIECES + j] = pieces[j][0][1]
+            piece_colors[i * POSITION_PIECES + j] = pieces[j][1]
+        players[i] = snapshot["current_player"]
+        phases[i] = snapshot["turn_phase"]
+        target_view[2 * i] = result
+        target_view[2 * i + 1] = 1.0 - result
+
+    with nogil:
+        for i in range(n):
+            set_position(&position, num_tiles[i], &tile_q[i * POSITION_TILES], &tile_r[i * POSITION_TILES],
+                         num_pieces[i], &piece_q[i * POSITION_PIECES], &piece_r[i * POSITION_PIECES],
+                         &piece_colors[i * POSITION_PIECES], players[i], phases[i])
+            cost_features(&position, _RED, &feature_view[2 * i * NUM_COST_FEATURES])
+            cost_features(&position, _BLACK, &feature_view[(2 * i + 1) * NUM_COST_FEATURES])
+    return features, targets
+
+
+# ── fitting ──────────────────────────────────────────────
+cdef double _loss(const int* features, const double* targets, Py_ssize_t rows, int columns,
+                  const double* weights, bint squared, double regularization) noexcept nogil:
+    """Mean loss of the rows, plus regularization times the squared weights."""
+    cdef Py_ssize_t i
+    cdef int k
+    cdef double z, p, total = 0.0
+    for i in range(rows):
+        z = 0.0
+        for k in range(columns):
+            z += weights[k] * features[i * columns + k]
+        p = _sigmoid(z)
+        if squared:
+            total += (p - targets[i]) * (p - targets[i])
+        else:
+            p = min(max(p, 1e-12), 1.0 - 1e-12)
+            total -= targets[i] * log(p) + (1.0 - targets[i]) * log(1.0 - p)
+    total /= rows
+    for k in range(columns):
+        total += regularization * weights[k] * weights[k]
+    return total
+
+
+cdef void _derivatives(const int* features, const double* targets, Py_ssize_t rows, int columns,
+                       const double* weights, bint squared, double regularization,
+                       double* gradient, double* hessian) noexcept nogil:
+    """Gradient and (Gauss-)Newton Hessian of _loss, the Hessian row-major."""
+    cdef Py_ssize_t i
+    cdef int j, k
+    cdef double z, p, slope, residual, curvature
+    for k in range(columns):
+        gradient[k] = 0.0
+        for j in range(columns):
+            hessian[k * columns + j] = 0.0
+    for i in range(rows):
+        z = 0.0
+        for k in range(columns):
+            z += weights[k] * features[i * columns + k]
+        p = _sigmoid(z)
+        slope = p * (1.0 - p)
+        if squared:
+            residual = 2.0 * (p - targets[i]) * slope
+            curvature = 2.0 * slope * slope
+        else:
+            residual = p - targets[i]
+            curvature = slope
+        for k in range(columns):
+            gradient[k] += residual * features[i * columns + k]
+            for j in range(k + 1):
+                hessian[k * columns + j] += curvature * features[i * columns + k] * features[i * columns + j]
+    for k in range(columns):
+        gradient[k] = gradient[k] / rows + 2.0 * regularization * weights[k]
+        for j in range(k + 1):
+            hessian[k * columns + j] /= rows
+            hessian[j * columns + k] = hessian[k * columns + j]
+        hessian[k * columns + k] += 2.0 * regularization
+
+
+cdef bint _solve(double* matrix, double* vector, int n) noexcept nogil:
+    """Solve matrix x = vector in place (x ends in vector) by Gaussian elimination; False if singular."""
+    cdef int i, j, k, pivot
+    cdef double factor, swap
+    for k in range(n):
+        pivot = k
+        for i in range(k + 1, n):
+            if fabs(matrix[i * n + k]) > fabs(matrix[pivot * n + k]):
+                pivot = i
+        if fabs(matrix[pivot * n + k]) < 1e-300:
+            return False
+        if pivot != k:
+            for j in range(n):
+                swap = matrix[k * n + j]
+                matrix[k * n + j] = matrix[pivot * n + j]
+                matrix[pivot * n + j] = swap
+            swap = vector[k]
+            vector[k] = vector[pivot]
+            vector[pivot] = swap
+        for i in range(k + 1, n):
+            factor = matrix[i * n + k] / matrix[k * n + k]
+            for j in range(k, n):
+                matrix[i * n + j] -= factor * matrix[k * n + j]
+            vector[i] -= factor * vector[k]
+    for k in range(n - 1, -1, -1):
+        for j in range(k + 1, n):
+            vector[k] -= matrix[k * n + j] * vector[j]
+        vector[k] /= matrix[k * n + k]
+    return True
+
+
+cdef int _fit(const int* features, const double* targets, Py_ssize_t rows, int columns, double* weights,
+              bint squared, double regularization, int iterations, double tolerance) noexcept nogil:
+    """Newton steps from *weights*, halved while they do not lower the loss; returns the steps taken."""
+    cdef double gradient[NUM_COST_FEATURES]
+    cdef double hessian[NUM_COST_FEATURES * NUM_COST_FEATURES]
+    cdef double trial[NUM_COST_FEATURES]
+    cdef double current = _loss(features, targets, rows, columns, weights, squared, regularization)
+    cdef double step, candidate = current
+    cdef int iteration, k
+    for iteration in range(iterations):
+        _derivatives(features, targets, rows, columns, weights, squared, regularization, gradient, hessian)
+        if not _solve(hessian, gradient, columns):
+            return iteration
+        step = 1.0
+        while step > 1e-8:
+            for k in range(columns):
+                trial[k] = weights[k] - step * gradient[k]
+            candidate = _loss(features, targets, rows, columns, trial, squared, regularization)
+            if candidate < current:
+                break
+            step /= 2
+        if candidate >= current:
+            return iteration
+        for k in range(columns):
+            weights[k] = trial[k]
+        if current - candidate < tolerance:
+            return iteration + 1
+        current = candidate
+    return iterations
+
+
+cdef Py_ssize_t _rows(features, targets, int columns) except -1:
+    if len(features) != len(targets) * columns:
+        raise ValueError(f"{len(features)} features do not make {len(targets)} rows of {columns}.")
+    if len(targets) == 0:
+        raise ValueError("No samples to fit.")
+    return len(targets)
+
+
+cdef bint _squared(str loss) except -1:
+    if loss not in LOSSES:
+        raise ValueError(f"Unknown loss {loss!r}, expected one of {LOSSES}.")
+    return loss == "squared"
+
+
+def fit_weights(features, targets, str loss="logistic", double regularization=1e-6, int iterations=100,
+                double tolerance=1e-10):
+    """Weights minimizing the mean loss of sigmoid(row . weights) against the targets.
+
+    "logistic" is the cross-entropy, "squared" the mean squared error of
+    Texel's tuning method. Both are minimized by Newton's method (Gauss-Newton
+    for the squared error) from zero weights.
+
+    Args:
+        features, targets: as returned by extract_features
+        loss: one of LOSSES
+        regularization: weight of the L2 penalty on the weights
+    Returns:
+        list of NUM_COST_FEATURES floats
+    """
+    cdef const int[::1] feature_view = features
+    cdef const double[::1] target_view = targets
+    cdef Py_ssize_t rows = _rows(features, targets, NUM_COST_FEATURES)
+    cdef bint squared = _squared(loss)
+    cdef double weights[NUM_COST_FEATURES]
+    cdef int k
+    for k in range(NUM_COST_FEATURES):
+        weights[k] = 0.0
+    with nogil:
+        _fit(&feature_view[0], &target_view[0], rows, NUM_COST_FEATURES, weights, squared, regularization,
+             iterations, tolerance)
+    return [weights[k] for k in range(NUM_COST_FEATURES)]
+
+
+def fit_scale(features, targets, genome, str loss="logistic"):
+    """Factor K for which sigmoid(K * cost_function) best predicts the targets with an integer genome.
+
+    Texel's tuning method fits K once, so that the losses of different
+    genomes can be compared.
+    """
+    cdef Py_ssize_t rows = _rows(features, targets, NUM_COST_FEATURES), i
+    cdef bint squared = _squared(loss)
+    cdef int k
+    cdef int params[NUM_COST_FEATURES]
+    cdef const int[::1] feature_view = features
+    cdef const double[::1] target_view = targets
+    costs = array('i', [0]) * rows
+    cdef int[::1] cost_view = costs
+    cdef double scale = 0.0
+    for k in range(NUM_COST_FEATURES):
+        params[k] = genome[k]
+    with nogil:
+        for i in range(rows):
+            for k in range(NUM_COST_FEATURES):
+                cost_view[i] += params[k] * feature_view[i * NUM_COST_FEATURES + k]
+        _fit(&cost_view[0], &target_view[0], rows, 1, &scale, squared, 0.0, 100, 1e-12)
+    return scale
+
+
+def mean_loss(features, targets, weights, str loss="logistic"):
+    """Mean loss of sigmoid(row . weights) against the targets, without regularization."""
+    cdef const int[::1] feature_view = features
+    cdef const double[::1] target_view = targets
+    cdef Py_ssize_t rows = _rows(features, targets, NUM_COST_FEATURES)
+    cdef double values[NUM_COST_FEATURES]
+    cdef int k
+    for k in range(NUM_COST_FEATURES):
+        values[k] = weights[k]
+    return _loss(&feature_view[0], &target_view[0], rows, NUM_COST_FEATURES, values, _squared(loss), 0.0)
+
+
+def to_genome(weights, int bound=100):
+    """Integer genome for AI_PARAM or parameters.json, scaled so that the largest weight is *bound*.
+
+    cost_function only ranks positions, so the scale does not change the
+    moves of the AI.
+    """
+    cdef double largest = max(abs(w) for w in weights)
+    if largest == 0:
+        return [0] * len(weights)
+    return [int(round(w * bound / largest)) for w in weights]
@@ -0,0 +1,48 @@
+import asyncio
+import json
+
+# Messages are JSON objects, one per line. Positions travel as [q, r, s] lists.
+MAX_MESSAGE_SIZE = 64 * 1024
+
+
+class ProtocolError(Exception):
+    """A message could not be decoded or is not valid in the current state."""
+
+
+class MessageTooLong(ProtocolError):
+    """A line exceeded MAX_MESSAGE_SIZE, the stream cannot be read any further."""
+
+
+def encode_message(message):
+    """Serialize a message dict to the bytes sent on the wire."""
+    return json.dumps(message, separators=(",", ":")).encode() + b"\n"
+
+
+def decode_message(line):
+    """Parse one received line into a message dict."""
+    try:
+        message = json.loads(line)
+    except ValueError as e:
+        raise ProtocolError(f"Malformed message: {e}") from None
+    if not isinstance(message, dict) or not isinstance(message.get("type"), str):
+        raise ProtocolError("A message must be an object with a 'type' field.")
+    return message
+
+
+async def read_message(reader):
+    """Read the next message from an asyncio StreamReader, None once the peer closed the connection."""
+    try:
+        line = await reader.readuntil(b"\n")
+    except (asyncio.IncompleteReadError, ConnectionError):
+        return None
+    except asyncio.LimitOverrunError:
+        raise MessageTooLong("Message too long.") from None
+    return decode_message(line)
+
+
+def to_position(value):
+    """Position tuple from its [q, r, s] wire form, validating it on the way."""
+    if (not isinstance(value, (list, tuple)) or len(value) != 3
+            or not all(isinstance(c, int) and not isinstance(c, bool) for c in value) or sum(value) != 0):
+        raise ProtocolError(f"Invalid position: {value!r}")
+    return tuple(value)
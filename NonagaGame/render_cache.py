@@ -0,0 +1,72 @@
+import pygame
+import math
+
+
+class RenderCache:
+    """Pre-rendered sprites for one hexagon size, so frames are drawn with blits only.
+
+    Sprites are created on first use for each color and kept until the cache
+    is dropped, which happens when the hexagon size changes.
+    """
+
+    def __init__(self, hex_size, circle_size, border_color=(0, 0, 0)):
+        """Initialize the cache.
+
+        Args:
+            hex_size: distance from a hexagon center to its vertices, in pixels
+            circle_size: radius of the piece circles, in pixels
+            border_color: RGB tuple for the hexagon borders
+        """
+        self.hex_size = hex_size
+        self.circle_size = circle_size
+        self.border_color = border_color
+        self._hexagons = {}
+        self._circles = {}
+        self._texts = {}
+
+    def hexagon(self, color):
+        """Return (surface, (anchor_x, anchor_y)) of a flat-top hexagon with a border.
+
+        Blitting the surface at (center_x - anchor_x, center_y - anchor_y) centers
+        the hexagon on (center_x, center_y).
+        """
+        sprite = self._hexagons.get(color)
+        if sprite is None:
+            width = 2 * self.hex_size + 2
+            height = math.ceil(math.sqrt(3) * self.hex_size) + 2
+            anchor = (width // 2, height // 2)
+            surface = pygame.Surface((width, height), pygame.SRCALPHA)
+            points = []
+            for i in range(6):
+                angle = math.pi / 3 * i
+                points.append((anchor[0] + self.hex_size * math.cos(angle),
+                               anchor[1] + self.hex_size * math.sin(angle)))
+            pygame.draw.polygon(surface, color, points)
+            pygame.draw.polygon(surface, self.border_color, points, 2)
+            sprite = (surface, anchor)
+            self._hexagons[color] = sprite
+        return sprite
+
+    def circle(self, color):
+        """Return (surface, (anchor_x, anchor_y)) of a filled piece circle."""
+        sprite = self._circles.get(color)
+        if sprite is None:
+            side = 2 * math.ceil(self.circle_size) + 2
+            anchor = (side // 2, side // 2)
+            surface = pygame.Surface((side, side), pygame.SRCALPHA)
+            pygame.draw.circle(surface, color, anchor, self.circle_size)
+            sprite = (surface, anchor)
+            self._circles[color] = sprite
+        return sprite
+
+    def text(self, font, text, color):
+        """Return the rendered surface of a text, rendering each (text, color) pair once."""
+        key = (id(font), text, color)
+        surface = self._texts.get(key)
+        if surface is None:
+            # Titles change with every move and the AI progress, keep the cache small
+            if len(self._texts) > 64:
+                self._texts.clear()
+            surface = font.render(text, True, color)
+            self._texts[key] = surface
+        return surface
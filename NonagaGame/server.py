@@ -0,0 +1,399 @@
+import argparse
+import asyncio
+import itertools
+import secrets
+
+if __name__ == "__main__":
+    # Build the extensions before importing them
+    from compiler import compile_cython_files
+    compile_cython_files()
+
+from nonaga_constants import RED, BLACK, PIECE_TO_MOVE, TILE_TO_MOVE, AI_PARAM
+from nonaga_logic import NonagaLogic
+from ai_service import AIService, AIServiceClient
+from change_feed import ChangeFeed, FeedPublisher
+from protocol import MAX_MESSAGE_SIZE, MessageTooLong, ProtocolError, encode_message, read_message, to_position
+
+RECONNECT_TIMEOUT = 120  # seconds a disconnected player has to come back before forfeiting
+MAX_WRITE_BUFFER = 1024 * 1024  # bytes queued for a client that does not read before dropping it
+
+
+class Connection:
+    """One client socket, seated at most at one game or watching one."""
+
+    def __init__(self, writer):
+        self.writer = writer
+        self.session = None
+        self.color = None
+        self.subscription = None
+
+    def send(self, message):
+        """Queue a message; a client too slow to read what it is sent is disconnected."""
+        if self.writer.is_closing():
+            return
+        self.writer.write(encode_message(message))
+        if self.writer.transport.get_write_buffer_size() > MAX_WRITE_BUFFER:
+            self.writer.close()
+
+
+class GameSession:
+    """A game hosted by the server, with the seats of its two players."""
+
+    def __init__(self, game_id, ai_color=None, ai_depth=2):
+        self.game_id = game_id
+        self.logic = NonagaLogic(None, None)
+        # Spectators follow the game through numbered deltas instead of full states
+        self.publisher = FeedPublisher(ChangeFeed(self.logic))
+        self.ai_color = ai_color
+        self.ai_depth = ai_depth
+        self.tokens = {}          # color -> reconnect token
+        self.connections = {}     # color -> Connection
+        self.winner = None
+        self.ai_task = None
+        self.expiry = {}          # color -> timer ending the reconnection delay
+
+    def free_color(self):
+        """Color of a seat no human took yet, None if the game is full."""
+        for color in (RED, BLACK):
+            if color != self.ai_color and color not in self.tokens:
+                return color
+        return None
+
+    def seat(self, color, connection):
+        """Give *color* to *connection* and return the token to reconnect with."""
+        token = self.tokens.setdefault(color, secrets.token_urlsafe(16))
+        if color in self.expiry:
+            self.expiry.pop(color).cancel()
+        self.connections[color] = connection
+        connection.session = self
+        connection.color = color
+        return token
+
+    def state_message(self):
+        message = {"type": "state", "game_id": self.game_id, "winner": self.winner}
+        message.update(self.logic.get_snapshot())
+        return message
+
+    def apply_move(self, color, kind, origin, destination):
+        """Validate a move of the player *color* and play it.
+
+        Raises:
+            ProtocolError: if the move is not legal in the current position
+        """
+        if self.winner is not None:
+            raise ProtocolError("The game is over.")
+        if self.logic.get_current_player() != color:
+            raise ProtocolError("It is not your turn.")
+        board = self.logic.board
+        if kind == "piece":
+            if self.logic.get_current_turn_phase() != PIECE_TO_MOVE:
+                raise ProtocolError("A tile has to be moved.")
+            piece = board.get_piece(origin)
+            if piece is None or piece.get_color() != color:
+                raise ProtocolError("There is no piece of yours there.")
+            if destination not in self.logic.get_all_valid_piece_moves().get(origin, []):
+                raise ProtocolError("The piece cannot move there.")
+            self.logic.move_piece(piece, destination)
+        else:
+            if self.logic.get_current_turn_phase() != TILE_TO_MOVE:
+                raise ProtocolError("A piece has to be moved.")
+            if destination not in self.logic.get_all_valid_tile_moves().get(origin, ()):
+                raise ProtocolError("The tile cannot move there.")
+            self.logic.move_tile(board.get_tile(origin), destination)
+
+        if self.logic.check_win_condition(RED):
+            self.winner = RED
+        elif self.logic.check_win_condition(BLACK):
+            self.winner = BLACK
+
+    def forfeit(self, color):
+        if self.winner is None:
+            self.winner = BLACK if color == RED else RED
+
+    def ai_to_move(self):
+        return self.winner is None and self.ai_color is not None and self.logic.get_current_player() == self.ai_color
+
+
+class NonagaServer:
+    """Hosts many concurrent games over TCP, one JSON message per line.
+
+    Client messages:
+        {"type": "create", "opponent": "human" | "ai", "color": 0 | 1, "depth": 2}
+        {"type": "join", "game_id": ...}
+        {"type": "reconnect", "game_id": ..., "token": ...}
+        {"type": "move", "kind": "piece" | "tile", "from": [q, r, s], "to": [q, r, s]}
+        {"type": "watch", "game_id": ...}
+
+    Server messages: "joined" (game id, color and reconnect token), "state"
+    (the position after every move), "opponent_disconnected",
+    "opponent_reconnected" and "error". Spectators get a "keyframe" followed
+    by the "delta" events of the game's ChangeFeed. If the AI fails to move,
+    its players get an "error" and the final "state" with the AI forfeiting,
+    and the game is closed. A game that is won is closed as soon as its
+    final "state" is sent, so its players may create or join another and a
+    long-running server only keeps the games in progress.
+
+    AI moves are requested from an AIService, in this process by default or
+    shared with other servers through an AIServiceClient, and searched in
+    worker processes so the event loop never blocks.
+    """
+
+    def __init__(self, ai_parameter=None, ai_service=None, reconnect_timeout=RECONNECT_TIMEOUT):
+        self.ai_parameter = ai_parameter if ai_parameter is not None else AI_PARAM
+        self._owns_ai_service = ai_service is None
+        self.ai_service = ai_service if ai_service is not None else AIService()
+        self.reconnect_timeout = reconnect_timeout
+        self.games = {}
+        self._game_ids = itertools.count(1)
+        self._server = None
+
+    async def start(self, host="127.0.0.1", port=0):
+        """Start listening; port 0 picks a free port, available afterwards as self.port."""
+        self._server = await asyncio.start_server(self._handle_connection, host, port, limit=MAX_MESSAGE_SIZE)
+        self.port = self._server.sockets[0].getsockname()[1]
+        return self
+
+    async def serve_forever(self):
+        async with self._server:
+            await self._server.serve_forever()
+
+    async def close(self):
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        for session in self.games.values():
+            if session.ai_task is not None:
+                session.ai_task.cancel()
+        if self._owns_ai_service:
+            await self.ai_service.close()
+
+    # ── connections ──────────────────────────────────────
+    async def _handle_connection(self, reader, writer):
+        connection = Connection(writer)
+        try:
+            while True:
+                try:
+                    message = await read_message(reader)
+                    if message is None:
+                        break
+                    self._dispatch(connection, message)
+                except MessageTooLong as e:
+                    connection.send({"type": "error", "message": str(e)})
+                    break
+                except ProtocolError as e:
+                    connection.send({"type": "error", "message": str(e)})
+        finally:
+            if connection.subscription is not None:
+                connection.subscription.close()
+            self._disconnect(connection)
+            writer.close()
+
+    def _dispatch(self, connection, message):
+        kind = message["type"]
+        if kind == "move":
+            self._on_move(connection, message)
+        elif kind == "create":
+            self._on_create(connection, message)
+        elif kind == "join":
+            self._on_join(connection, message)
+        elif kind == "reconnect":
+            self._on_reconnect(connection, message)
+        elif kind == "watch":
+            self._on_watch(connection, message)
+        else:
+            raise ProtocolError(f"Unknown message type: {kind!r}")
+
+    def _disconnect(self, connection):
+        session = connection.session
+        if session is None or session.connections.get(connection.color) is not connection:
+            return
+        del session.connections[connection.color]
+        connection.session = None
+        if session.connections:
+            self._broadcast(session, {"type": "opponent_disconnected", "game_id": session.game_id})
+        session.expiry[connection.color] = asyncio.get_running_loop().call_later(
+            self.reconnect_timeout, self._expire, session, connection.color)
+
+    def _expire(self, session, color):
+        """End of the reconnection delay of the player *color*."""
+        session.expiry.pop(color, None)
+        if color in session.connections or self.games.get(session.game_id) is not session:
+            return
+        if session.connections:
+            session.forfeit(color)
+            self._broadcast(session, session.state_message())
+        self._close_session(session)
+
+    def _close_session(self, session):
+        """Forget a game: stop its AI and timers, end its feed and free the seats of its players."""
+        if session.ai_task is not None and session.ai_task is not asyncio.current_task():
+            session.ai_task.cancel()
+        for timer in session.expiry.values():
+            timer.cancel()
+        session.expiry.clear()
+        for connection in session.connections.values():
+            connection.session = None
+        session.connections.clear()
+        session.publisher.close()
+        if self.games.get(session.game_id) is session:
+            del self.games[session.game_id]
+
+    def _broadcast(self, session, message):
+        for connection in list(session.connections.values()):
+            connection.send(message)
+
+    def _broadcast_state(self, session):
+        """Send the position to the players, then close the game if it is over."""
+        self._broadcast(session, session.state_message())
+        if session.winner is not None:
+            self._close_session(session)
+
+    def _require_seat(self, connection):
+        if connection.session is not None:
+            raise ProtocolError("Already playing a game.")
+        if connection.subscription is not None:
+            raise ProtocolError("Already watching a game.")
+
+    # ── handlers ──────────────────────────────────────────
+    def _on_create(self, connection, message):
+        self._require_seat(connection)
+        color = message.get("color", RED)
+        if color not in (RED, BLACK):
+            raise ProtocolError("Invalid color.")
+        opponent = message.get("opponent", "human")
+        if opponent not in ("human", "ai"):
+            raise ProtocolError("Invalid opponent.")
+        depth = message.get("depth", 2)
+        if not isinstance(depth, int) or not 1 <= depth <= 4:
+            raise ProtocolError("Invalid depth.")
+
+        game_id = str(next(self._game_ids))
+        ai_color = (BLACK if color == RED else RED) if opponent == "ai" else None
+        session = GameSession(game_id, ai_color, depth)
+        self.games[game_id] = session
+        token = session.seat(color, connection)
+        connection.send({"type": "joined", "game_id": game_id, "color": color, "token": token})
+        connection.send(session.state_message())
+        self._schedule_ai(session)
+
+    def _on_join(self, connection, message):
+        self._require_seat(connection)
+        session = self.games.get(str(message.get("game_id")))
+        if session is None:
+            raise ProtocolError("No such game.")
+        color = session.free_color()
+        if color is None:
+            raise ProtocolError("The game is full.")
+        token = session.seat(color, connection)
+        connection.send({"type": "joined", "game_id": session.game_id, "color": color, "token": token})
+        self._broadcast(session, session.state_message())
+
+    def _on_reconnect(self, connection, message):
+        self._require_seat(connection)
+        session = self.games.get(str(message.get("game_id")))
+        token = message.get("token")
+        color = None
+        if session is not None:
+            color = next((c for c, t in session.tokens.items() if secrets.compare_digest(t, str(token))), None)
+        if color is None:
+            raise ProtocolError("Unknown game or token.")
+        previous = session.connections.get(color)
+        if previous is not None:
+            # The old socket is still open, e.g. a half-dead connection: the new one replaces it
+            previous.session = None
+            previous.writer.close()
+        session.seat(color, connection)
+        connection.send({"type": "joined", "game_id": session.game_id, "color": color, "token": token})
+        connection.send(session.state_message())
+        for other_color, other in session.connections.items():
+            if other_color != color:
+                other.send({"type": "opponent_reconnected", "game_id": session.game_id})
+
+    def _on_watch(self, connection, message):
+        self._require_seat(connection)
+        session = self.games.get(str(message.get("game_id")))
+        if session is None:
+            raise ProtocolError("No such game.")
+        connection.subscription = session.publisher.subscribe()
+        asyncio.ensure_future(self._pump(connection, connection.subscription))
+
+    async def _pump(self, connection, subscription):
+        """Write the feed of a watched game to the spectator as fast as it reads it."""
+        try:
+            async for data in subscription:
+                if connection.writer.is_closing():
+                    break
+                connection.writer.write(data)
+                await connection.writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            subscription.close()
+
+    def _on_move(self, connection, message):
+        session = connection.session
+        if session is None:
+            raise ProtocolError("Not playing a game.")
+        kind = message.get("kind")
+        if kind not in ("piece", "tile"):
+            raise ProtocolError("Invalid move kind.")
+        session.apply_move(connection.color, kind, to_position(message.get("from")), to_position(message.get("to")))
+        self._broadcast_state(session)
+        self._schedule_ai(session)
+
+    # ── AI ────────────────────────────────────────────────
+    def _schedule_ai(self, session):
+        if session.ai_to_move() and (session.ai_task is None or session.ai_task.done()):
+            session.ai_task = asyncio.ensure_future(self._play_ai(session))
+
+    async def _play_ai(self, session):
+        try:
+            move = await self.ai_service.request_move(session.logic.get_snapshot(), session.ai_depth,
+                                                      self.ai_parameter)
+            if self.games.get(session.game_id) is not session or not session.ai_to_move():
+                return
+            if move is None:
+                raise RuntimeError("the search returned no move")
+            (piece, piece_destination), (tile, tile_destination) = move
+            session.apply_move(session.ai_color, "piece", piece, piece_destination)
+            if session.winner is None:
+                session.apply_move(session.ai_color, "tile", tile, tile_destination)
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            self._ai_failed(session, e)
+            return
+        self._broadcast_state(session)
+
+    def _ai_failed(self, session, error):
+        """The AI of a game could not play: it forfeits and the game is closed."""
+        if self.games.get(session.game_id) is not session:
+            return
+        session.forfeit(session.ai_color)
+        self._broadcast(session, {"type": "error", "game_id": session.game_id,
+                                  "message": f"The AI could not move ({error}) and forfeits."})
+        self._broadcast(session, session.state_message())
+        self._close_session(session)
+
+
+async def _main(host, port, ai_service_address):
+    ai_service = None
+    if ai_service_address is not None:
+        ai_host, ai_port = ai_service_address.rsplit(":", 1)
+        ai_service = await AIServiceClient().connect(ai_host, int(ai_port))
+    server = await NonagaServer(ai_service=ai_service).start(host, port)
+    print(f"Nonaga server listening on {host}:{server.port}", flush=True)
+    try:
+        await server.serve_forever()
+    finally:
+        await server.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Host Nonaga games over TCP.")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--ai-service", default=None, metavar="HOST:PORT",
+                        help="AI service shared with other servers (default: search in this process's own pools)")
+    args = parser.parse_args()
+    asyncio.run(_main(args.host, args.port, args.ai_service))
@@ -0,0 +1,128 @@
+import argparse
+import json
+import os
+import random
+import time
+
+if __name__ == "__main__":
+    from compiler import compile_cython_files
+    compile_cython_files()
+
+from nonaga_constants import AI_PARAM, RED, BLACK
+from nonaga_logic import NonagaLogic
+from nonaga_tuning import extract_features, fit_weights, fit_scale, mean_loss, to_genome, LOSSES
+from build_endgame import play_random_turn
+from AI import AI
+
+
+def record_games(games, genomes=None, depth=1, randomness=0.2, max_turns=60, opening_turns=2, seed=None):
+    """Positions of AI games, each with the result of its game for RED (1 won, 0 lost, 0.5 drawn).
+
+    Each game opposes two genomes drawn at random, and a share of the moves
+    is played at random so that the games do not all follow the same line.
+    Only quiet positions are kept: at the start of a turn, after the first
+    opening_turns, when the player to move cannot win with a slide.
+    """
+    rng = random.Random(seed)
+    genomes = [list(genome) for genome in (genomes if genomes else [AI_PARAM])]
+    samples = []
+    for _ in range(games):
+        game = NonagaLogic()
+        players = {RED: AI(rng.choice(genomes), depth, RED), BLACK: AI(rng.choice(genomes), depth, BLACK)}
+        positions = []
+        result = 0.5
+        for turn in range(max_turns):
+            player = game.get_current_player()
+            if turn >= opening_turns and not game.has_winning_piece_move(player):
+                positions.append(game.get_snapshot())
+            if rng.random() < randomness:
+                play_random_turn(game, rng)
+            else:
+                (piece, piece_destination), (tile, tile_destination) = players[player].get_best_move(game)
+                game.move_piece(piece, piece_destination)
+                game.move_tile(tile, tile_destination)
+            if game.check_win_condition(RED):
+                result = 1.0
+                break
+            if game.check_win_condition(BLACK):
+                result = 0.0
+                break
+        samples.extend((snapshot, result) for snapshot in positions)
+    return samples
+
+
+def save_samples(path, samples):
+    """Append samples to a file of one JSON object per line."""
+    with open(path, "a") as f:
+        for snapshot, result in samples:
+            f.write(json.dumps({"position": snapshot, "result": result}) + "\n")
+
+
+def load_samples(path):
+    with open(path) as f:
+        return [(record["position"], record["result"]) for record in map(json.loads, f) if record]
+
+
+def tune(samples, loss="logistic", bound=100, regularization=1e-6, baselines=(), verbose=True):
+    """Fit the cost_function weights on the samples.
+
+    Args:
+        baselines: genomes whose loss is reported next to the tuned one
+    Returns:
+        the tuned genome, integers like AI_PARAM
+    """
+    start = time.perf_counter()
+    features, targets = extract_features(samples)
+    extracted = time.perf_counter()
+    weights = fit_weights(features, targets, loss, regularization)
+    genome = to_genome(weights, bound)
+    if verbose:
+        print(f"{len(samples)} positions: features in {extracted - start:.2f}s, "
+              f"fit in {time.perf_counter() - extracted:.2f}s")
+        for name, candidate in [("tuned", genome)] + [(str(list(b)), b) for b in baselines]:
+            scale = fit_scale(features, targets, candidate, loss)
+            print(f"{name}: {loss} loss {mean_loss(features, targets, [scale * w for w in candidate], loss):.5f} "
+                  f"(K = {scale:.5f})")
+    return genome
+
+
+def append_genome(path, genome):
+    """Add a genome to a parameters.json file, one genome per line."""
+    genomes = []
+    if os.path.exists(path):
+        with open(path) as f:
+            genomes = json.load(f)
+    genomes.append(genome)
+    with open(path, "w") as f:
+        f.write("[" + ",\n".join(json.dumps(g) for g in genomes) + "]")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Fit the cost_function weights on recorded positions.")
+    parser.add_argument("dataset", help="file of recorded positions, one JSON object per line")
+    parser.add_argument("--games", type=int, default=0, help="self-play games to record into the dataset first")
+    parser.add_argument("--parameters", default=None,
+                        help="parameters.json whose genomes play the recorded games and are compared to the result")
+    parser.add_argument("--depth", type=int, default=1, help="search depth of the recorded games")
+    parser.add_argument("--randomness", type=float, default=0.2, help="share of random moves in the recorded games")
+    parser.add_argument("--max-turns", type=int, default=60, help="turns after which a recorded game is drawn")
+    parser.add_argument("--seed", type=int, default=None, help="random seed of the recorded games")
+    parser.add_argument("--loss", choices=LOSSES, default="logistic")
+    parser.add_argument("--bound", type=int, default=100, help="largest absolute gene of the tuned genome")
+    parser.add_argument("--append-to", default=None, help="parameters.json to add the tuned genome to")
+    args = parser.parse_args()
+
+    genomes = [AI_PARAM]
+    if args.parameters:
+        with open(args.parameters) as f:
+            genomes = json.load(f)
+    if args.games:
+        start = time.perf_counter()
+        recorded = record_games(args.games, genomes, args.depth, args.randomness, args.max_turns, seed=args.seed)
+        save_samples(args.dataset, recorded)
+        print(f"{len(recorded)} positions of {args.games} games recorded in {time.perf_counter() - start:.1f}s")
+    tuned = tune(load_samples(args.dataset), args.loss, args.bound, baselines=genomes)
+    print(tuned)
+    if args.append_to:
+        append_genome(args.append_to, tuned)
+        print(f"added to {args.append_to}")
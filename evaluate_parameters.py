@@ -1,11 +1,13 @@
 
 import json
 import csv
+import math
+import statistics
 import sys
 import os
 import itertools
 import concurrent.futures
-from typing import List
+from typing import List, Optional
 
 # Ensure NonagaGame is in the path context so models import cleanly
 my_nonaga_path = os.path.abspath("NonagaGame")
@@ -13,8 +15,7 @@ if my_nonaga_path not in sys.path:
     sys.path.append(my_nonaga_path)
     
 from nonaga_constants import RED, BLACK
-from nonaga_logic import NonagaLogic
-from AI import AI
+from match_pool import process_pool
 from compiler import compile_cython_files
 
 def load_parameters(filepath: str) -> List[List[int]]:
@@ -22,17 +23,25 @@ def load_parameters(filepath: str) -> List[List[int]]:
         return json.load(f)
 
 
-def run_match(ai_1_params: List[int], ai_2_params: List[int], max_moves: int = 150) -> tuple[int, int]:
+def run_match(ai_1_params: List[int], ai_2_params: List[int], max_moves: int = 150,
+              native: bool = False) -> tuple[int, int]:
     """
     Simulates a match between two AI parameter sets.
     Returns a tuple of points (score1, score2) where:
     Win = 1, Draw/Timeout = 0, Loss = 0
+    With native=True the match is played in C by nonaga_match.play_match.
     """
-    ai_red = AI(parameter=ai_1_params, depth=2, color=RED)
-    ai_black = AI(parameter=ai_2_params, depth=2, color=BLACK)
+    if native:
+        from nonaga_match import play_match
+        winner, _ = play_match(ai_1_params, ai_2_params, depth=2, max_moves=max_moves)
+        return int(winner == RED), int(winner == BLACK)
 
-    game = NonagaLogic(player_red=ai_red, player_black=ai_black, new_game=True)
+    # the game and AI objects of the previous match of this process are reset and reused
+    with process_pool().match(ai_1_params, ai_2_params, depth=2) as (game, ai_red, ai_black):
+        return _play_match(game, ai_red, ai_black, max_moves)
 
+
+def _play_match(game, ai_red, ai_black, max_moves: int) -> tuple[int, int]:
     moves = 0
     while moves < max_moves:
         current_color = game.get_current_player()
@@ -58,13 +67,176 @@ def run_match(ai_1_params: List[int], ai_2_params: List[int], max_moves: int = 1
     return 0, 0
 
 
-def evaluate_matchup(task: tuple[int, int, List[int], List[int], int]) -> tuple[int, int, int, int]:
-    idx1, idx2, ai_1_params, ai_2_params, max_moves = task
-    score1, score2 = run_match(ai_1_params, ai_2_params, max_moves=max_moves)
+def evaluate_matchup(task: tuple[int, int, List[int], List[int], int, bool]) -> tuple[int, int, int, int]:
+    idx1, idx2, ai_1_params, ai_2_params, max_moves, native = task
+    score1, score2 = run_match(ai_1_params, ai_2_params, max_moves=max_moves, native=native)
     return idx1, idx2, score1, score2
 
 
-def tournament():
+# ── ratings ───────────────────────────────────────────
+# Glicko ratings, one rating period per round; the players do not change
+# between rounds, so the deviations only shrink.
+INITIAL_RATING = 1500.0
+INITIAL_RD = 350.0
+_Q = math.log(10) / 400
+
+
+def _g(rd: float) -> float:
+    return 1 / math.sqrt(1 + 3 * (_Q * rd / math.pi) ** 2)
+
+
+def expected_score(rating: float, opponent_rating: float, opponent_rd: float) -> float:
+    """Expected score of a player against an opponent, a draw counting 1/2."""
+    return 1 / (1 + 10 ** (-_g(opponent_rd) * (rating - opponent_rating) / 400))
+
+
+def update_ratings(ratings: List[float], rds: List[float],
+                   results: List[tuple[int, int, float]]) -> tuple[List[float], List[float]]:
+    """New (ratings, rds) after a rating period of games (i, j, score of i)."""
+    games = {i: [] for i in range(len(ratings))}
+    for i, j, score in results:
+        games[i].append((j, score))
+        games[j].append((i, 1 - score))
+
+    new_ratings, new_rds = list(ratings), list(rds)
+    for i, played in games.items():
+        if not played:
+            continue
+        variance_inv = 0.0
+        delta = 0.0
+        for j, score in played:
+            g = _g(rds[j])
+            e = expected_score(ratings[i], ratings[j], rds[j])
+            variance_inv += _Q * _Q * g * g * e * (1 - e)
+            delta += g * (score - e)
+        precision = 1 / (rds[i] * rds[i]) + variance_inv
+        new_ratings[i] = ratings[i] + _Q / precision * delta
+        new_rds[i] = math.sqrt(1 / precision)
+    return new_ratings, new_rds
+
+
+def ranking(ratings: List[float]) -> List[int]:
+    """Player indices from the highest rating to the lowest."""
+    return sorted(range(len(ratings)), key=lambda i: (-ratings[i], i))
+
+
+def unresolved_places(ratings: List[float], rds: List[float], top: int, confidence: float) -> int:
+    """How many of the first *top* places are not settled yet.
+
+    A place is settled when the player holding it is stronger than the next
+    one with probability *confidence*. Two near-equal players stay
+    unsettled however many games they play: only the round budget of
+    swiss_ranking ends their games.
+    """
+    z = statistics.NormalDist().inv_cdf(confidence)
+    order = ranking(ratings)
+    unresolved = 0
+    for a, b in zip(order[:top], order[1:top + 1]):
+        spread = z * math.sqrt(rds[a] ** 2 + rds[b] ** 2)
+        if ratings[a] - ratings[b] <= spread:
+            unresolved += 1
+    return unresolved
+
+
+# ── Swiss pairing ─────────────────────────────────────
+def game_information(rating: float, opponent_rating: float, opponent_rd: float) -> float:
+    """What a game against this opponent tells about a player's rating (its Fisher information)."""
+    g = _g(opponent_rd)
+    e = expected_score(rating, opponent_rating, opponent_rd)
+    return _Q * _Q * g * g * e * (1 - e)
+
+
+def swiss_pairings(ratings: List[float], rds: List[float], meetings: dict, red_balance: List[int],
+                   byes: List[int]) -> tuple[List[tuple[int, int]], Optional[int]]:
+    """Pair the players of one round; returns ([(red, black), ...], the player without a game or None).
+
+    Going down the ranking, each player meets the opponent a game against
+    whom is most informative, divided by one plus the number of times they
+    already met: close ratings make informative games, and the discount
+    moves players on to new opponents so that all ratings get tied together.
+    With an odd number of players the lowest ranked one with fewest byes
+    sits out. The player who played RED less often takes RED.
+    """
+    order = ranking(ratings)
+    bye = None
+    if len(order) % 2:
+        bye = min(reversed(order), key=lambda i: byes[i])
+        order.remove(bye)
+
+    pairs = []
+    while order:
+        a = order.pop(0)
+        b = max(order, key=lambda j: game_information(ratings[a], ratings[j], rds[j])
+                / (1 + meetings.get((min(a, j), max(a, j)), 0)))
+        order.remove(b)
+        if red_balance[b] < red_balance[a]:
+            a, b = b, a
+        pairs.append((a, b))
+    return pairs, bye
+
+
+def swiss_ranking(num_players: int, play_round, confidence: float = 0.9, top: int = 10,
+                  max_rounds: Optional[int] = None, verbose: bool = True) -> dict:
+    """Rank players with Swiss rounds until the first *top* places are settled, see unresolved_places.
+
+    play_round takes a list of (red, black) pairings and returns one
+    (score_red, score_black) per game, in order, so that the caller decides
+    how the games of a round run (e.g. concurrently). *max_rounds* is the
+    budget of rounds, by default num_players - 1 (half the games of a round
+    robin); the places still unsettled when it runs out are reported.
+    Returns ratings, rds, wins, games, rounds, the ranking and the number of
+    places left unresolved.
+    """
+    if max_rounds is None:
+        max_rounds = num_players - 1
+    top = min(top, num_players - 1)
+    ratings = [INITIAL_RATING] * num_players
+    rds = [INITIAL_RD] * num_players
+    wins = [0] * num_players
+    games = [0] * num_players
+    red_balance = [0] * num_players
+    byes = [0] * num_players
+    meetings = {}
+    unresolved = top
+    rounds = 0
+
+    while rounds < max_rounds and unresolved:
+        pairs, bye = swiss_pairings(ratings, rds, meetings, red_balance, byes)
+        if bye is not None:
+            byes[bye] += 1
+
+        results = []
+        for (red, black), (score_red, score_black) in zip(pairs, play_round(pairs)):
+            key = (min(red, black), max(red, black))
+            meetings[key] = meetings.get(key, 0) + 1
+            red_balance[red] += 1
+            red_balance[black] -= 1
+            games[red] += 1
+            games[black] += 1
+            wins[red] += score_red
+            wins[black] += score_black
+            results.append((red, black, 0.5 if score_red == score_black else float(score_red)))
+
+        ratings, rds = update_ratings(ratings, rds, results)
+        rounds += 1
+        unresolved = unresolved_places(ratings, rds, top, confidence)
+        if verbose:
+            print(f"Round {rounds}: {len(pairs)} games, {top - unresolved} of the first {top} places settled")
+
+    return {"ratings": ratings, "rds": rds, "wins": wins, "games": games, "rounds": rounds,
+            "ranking": ranking(ratings), "unresolved": unresolved}
+
+
+# ── tournaments ───────────────────────────────────────
+def tournament(pairing: str = "round-robin", confidence: float = 0.9, top: int = 10,
+               max_rounds: Optional[int] = None, native: bool = False):
+    """Rank the genomes of parameters.json by playing depth-2 matches between them.
+
+    pairing="round-robin" plays every ordered pair once; pairing="swiss" plays
+    Swiss rounds under Glicko ratings until the ranking is stable, see
+    swiss_ranking. The games of a round are played concurrently by a process pool,
+    in C with native=True (see run_match).
+    """
     print("Starting tournament setup...")
 
     param_file = os.path.abspath("parameters.json")
@@ -80,18 +252,23 @@ def tournament():
         print("Need at least 2 AIs in parameters.json to run a tournament!")
         return
 
+    max_moves = 50
+    max_workers = int(os.environ.get("SLURM_CPUS_PER_TASK", os.cpu_count() or 1))
+
+    if pairing == "swiss":
+        swiss_tournament(genomes, max_moves, max_workers, confidence, top, max_rounds, native)
+        return
+
     # Keep track of points arrays
     scores = {i: 0 for i in range(num_genomes)}
     match_results = []
-    max_moves = 50
 
     # Generate round-robin matchups (everyone plays everyone exactly once)
     matchups = list(itertools.permutations(range(num_genomes), 2))
     print(f"Running {len(matchups)} total matches...\n")
 
-    max_workers = int(os.environ.get("SLURM_CPUS_PER_TASK", os.cpu_count() or 1))
     tasks = [
-        (idx1, idx2, genomes[idx1], genomes[idx2], max_moves)
+        (idx1, idx2, genomes[idx1], genomes[idx2], max_moves, native)
         for idx1, idx2 in matchups
     ]
 
@@ -127,5 +304,47 @@ def tournament():
     print(f"\nTournament complete! Results successfully logged to {log_file}.")
 
 
+def swiss_tournament(genomes: List[List[int]], max_moves: int, max_workers: int,
+                     confidence: float = 0.9, top: int = 10, max_rounds: Optional[int] = None,
+                     native: bool = False):
+    """Swiss part of tournament: each round's games go to the process pool at once."""
+    num_genomes = len(genomes)
+    with concurrent.futures.ProcessPoolExecutor(max_workers=max_workers) as executor:
+        def play_round(pairs):
+            tasks = [(red, black, genomes[red], genomes[black], max_moves, native) for red, black in pairs]
+            return [(score1, score2) for _, _, score1, score2 in executor.map(evaluate_matchup, tasks)]
+
+        result = swiss_ranking(num_genomes, play_round, confidence, top, max_rounds)
+
+    num_games = sum(result["games"]) // 2
+    print(f"\n{num_games} games in {result['rounds']} rounds "
+          f"(a round robin plays {num_genomes * (num_genomes - 1)}), "
+          f"{result['unresolved']} of the first places unsettled")
+
+    log_file = "tournament_results.csv"
+    with open(log_file, "w", newline="") as f:
+        writer = csv.writer(f)
+        writer.writerow(["Rank", "AI_ID", "Genome", "Rating", "RD", "Total_Wins", "Games"])
+        for rank, i in enumerate(result["ranking"], 1):
+            writer.writerow([rank, i, str(genomes[i]), round(result["ratings"][i], 1),
+                             round(result["rds"][i], 1), result["wins"][i], result["games"][i]])
+
+    print(f"\nTournament complete! Results successfully logged to {log_file}.")
+
+
 if __name__ == "__main__":
-    tournament()
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Rank the AI parameters of parameters.json.")
+    parser.add_argument("--pairing", choices=["round-robin", "swiss"], default="round-robin",
+                        help="every ordered pair once, or Swiss rounds until the ranking is stable")
+    parser.add_argument("--confidence", type=float, default=0.9,
+                        help="swiss: stop once each of the first places is ahead of the next with this probability")
+    parser.add_argument("--top", type=int, default=10, help="swiss: number of places that must be ordered")
+    parser.add_argument("--max-rounds", type=int, default=None,
+                        help="swiss: budget of rounds, after which the unsettled places are reported "
+                             "(default: number of AIs - 1)")
+    parser.add_argument("--native", action="store_true",
+                        help="play the matches in C with nonaga_match.play_match instead of AI objects")
+    args = parser.parse_args()
+    tournament(args.pairing, args.confidence, args.top, args.max_rounds, args.native)
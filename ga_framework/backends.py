@@ -1,11 +1,102 @@
-from typing import List, Callable
+import copy
+import os
+import sys
+import time
+from array import array
+from multiprocessing import resource_tracker, shared_memory
+from typing import List, Callable, Optional, Tuple
 import concurrent.futures
-from interfaces import ParallelBackend
+from interfaces import ParallelBackend, FitnessFunction
+
+
+class PopulationBroadcast:
+    """A generation's population packed once into a shared memory block, read by the workers by name.
+
+    The block holds the generation id, the population size and the genome
+    length, followed by the genes as 64-bit integers.
+    """
+    HEADER = 3
+
+    def __init__(self, population: List[List[int]], generation: int):
+        genome_length = len(population[0]) if population else 0
+        values = array('q', [generation, len(population), genome_length])
+        for individual in population:
+            if len(individual) != genome_length:
+                raise ValueError("All genomes of a population must have the same length.")
+            values.extend(individual)
+        data = values.tobytes()
+        self.generation = generation
+        self.block = shared_memory.SharedMemory(create=True, size=len(data))
+        self.block.buf[:len(data)] = data
+        self.name = self.block.name
+
+    @staticmethod
+    def _attach(name: str) -> shared_memory.SharedMemory:
+        """Open the block of another process without registering it with the resource tracker.
+
+        Only the master, which created the block, may unlink it. Before
+        Python 3.13 attaching registers the block as if the reader owned it:
+        a reader with a tracker of its own would unlink it or warn of a leak
+        when it exits, and unregistering afterwards would drop the master's
+        registration from a tracker the reader shares with it.
+        """
+        if sys.version_info >= (3, 13):
+            return shared_memory.SharedMemory(name=name, track=False)
+        register = resource_tracker.register
+        resource_tracker.register = lambda name, rtype: None
+        try:
+            return shared_memory.SharedMemory(name=name)
+        finally:
+            resource_tracker.register = register
+
+    @staticmethod
+    def read(name: str) -> List[List[int]]:
+        block = PopulationBroadcast._attach(name)
+        try:
+            values = array('q')
+            values.frombytes(bytes(block.buf[:PopulationBroadcast.HEADER * values.itemsize]))
+            _, size, length = values
+            values = array('q')
+            values.frombytes(bytes(block.buf[PopulationBroadcast.HEADER * values.itemsize:
+                                             (PopulationBroadcast.HEADER + size * length) * values.itemsize]))
+        finally:
+            block.close()
+        return [values[i * length:(i + 1) * length].tolist() for i in range(size)]
+
+    def close(self):
+        self.block.close()
+        self.block.unlink()
+
+
+# State of a worker process of MasterSlaveBackend: its fitness function and the last population it read
+_worker = {}
+
+
+def _init_worker(fitness: FitnessFunction):
+    _worker["fitness"] = fitness
+    _worker["generation"] = None
+    _worker["population"] = []
+
+
+def _evaluate_index(task) -> Tuple[float, int, float, float]:
+    """(fitness, worker pid, start, end) of one individual."""
+    start = time.time()
+    name, generation, index = task
+    if _worker["generation"] != generation:
+        _worker["population"] = PopulationBroadcast.read(name)
+        _worker["generation"] = generation
+        # tournaments draw their opponents from the population
+        if hasattr(_worker["fitness"], 'population'):
+            _worker["fitness"].population = _worker["population"]
+    return _worker["fitness"].evaluate(_worker["population"][index]), os.getpid(), start, time.time()
 
 
 class MasterSlaveBackend(ParallelBackend):
     def __init__(self, max_workers: int = None):
         self.max_workers = max_workers
+        self._executor = None
+        self._fitness = None
+        self._generation = 0
 
     def map_evaluate(self, evaluate_func: Callable[[List[int]], float], population: List[List[int]]) -> List[float]:
         # Using a ProcessPoolExecutor to map the evaluate function to the population
@@ -13,3 +104,44 @@ class MasterSlaveBackend(ParallelBackend):
         with concurrent.futures.ProcessPoolExecutor(max_workers=self.max_workers) as executor:
             fitnesses = list(executor.map(evaluate_func, population))
         return fitnesses
+
+    def evaluate_population(self, fitness: FitnessFunction, population: List[List[int]],
+                            indices: Optional[List[int]] = None) -> List[float]:
+        # The population is published once in shared memory and the tasks only carry its
+        # generation id and an index, instead of pickling the population (inside the bound
+        # evaluate method) for every individual. The pool is kept between generations so that
+        # the fitness function itself reaches each worker only once, when it starts.
+        if self._executor is None or self._fitness is not fitness:
+            self.close()
+            payload = copy.copy(fitness)
+            if hasattr(payload, 'population'):
+                payload.population = []
+            self._executor = concurrent.futures.ProcessPoolExecutor(
+                max_workers=self.max_workers, initializer=_init_worker, initargs=(payload,))
+            self._fitness = fitness
+            if self.telemetry is not None:
+                self.telemetry.pool_started()
+        self._generation += 1
+        broadcast = PopulationBroadcast(population, self._generation)
+        try:
+            workers = self.worker_count()
+            if indices is None:
+                indices = range(len(population))
+            tasks = [(broadcast.name, broadcast.generation, index) for index in indices]
+            results = list(self._executor.map(_evaluate_index, tasks,
+                                              chunksize=max(1, len(tasks) // (4 * workers))))
+        finally:
+            broadcast.close()
+        if self.telemetry is not None:
+            for _, pid, start, end in results:
+                self.telemetry.record_task(f"worker {pid}", start, end)
+        return [fitness_value for fitness_value, _, _, _ in results]
+
+    def worker_count(self) -> int:
+        return self.max_workers or os.cpu_count() or 1
+
+    def close(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+            self._fitness = None
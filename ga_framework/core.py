@@ -1,8 +1,11 @@
 import random
 import csv
 import os
-from typing import List, Tuple
-from interfaces import SelectionStrategy, CrossoverStrategy, MutationStrategy, FitnessFunction, ParallelBackend
+import time
+from contextlib import nullcontext
+from typing import List, Tuple, Optional
+from interfaces import SelectionStrategy, CrossoverStrategy, MutationStrategy, FitnessFunction, ParallelBackend, SurrogateModel
+from telemetry import Telemetry
 
 
 class ModularGA:
@@ -12,88 +15,199 @@ class ModularGA:
                  mutation: MutationStrategy,
                  fitness: FitnessFunction,
                  backend: ParallelBackend,
-                 log_file: str = "ga_metrics.csv"):
-        """Initialize the Genetic Algorithm with strategy injection."""
+                 log_file: str = "ga_metrics.csv",
+                 surrogate: Optional[SurrogateModel] = None,
+                 screen_fraction: float = 0.3,
+                 exploration_fraction: float = 0.1,
+                 telemetry: Optional[Telemetry] = None):
+        """Initialize the Genetic Algorithm with strategy injection.
+
+        With a surrogate, only the screen_fraction of each generation's
+        offspring it rates best, plus a random exploration_fraction of the
+        others, are really evaluated, as is the elite carried over; the others
+        are selected on the surrogate's estimate, capped at the worst real
+        fitness of the generation (see _selection_fitnesses).
+        With telemetry, the phases of each generation and the backend's tasks
+        are timed, the metrics log gets the Telemetry.COLUMNS and the trace is
+        written when run returns.
+        """
         self.selection = selection
         self.crossover = crossover
         self.mutation = mutation
         self.fitness = fitness
         self.backend = backend
         self.log_file = log_file
-
+        self.surrogate = surrogate
+        self.screen_fraction = screen_fraction
+        self.exploration_fraction = exploration_fraction
+        self.telemetry = telemetry
+        self.backend.telemetry = telemetry
+
+        headers = ["Generation", "Best_Fitness", "Average_Fitness",
+                   "Worst_Fitness"] + [f"Top_{i}_Genome" for i in range(1, 11)]
+        if telemetry is not None:
+            headers += Telemetry.COLUMNS
         # Init the CSV headers if it's new
         if not os.path.exists(self.log_file):
             with open(self.log_file, 'w', newline='') as f:
                 writer = csv.writer(f)
-                headers = ["Generation", "Best_Fitness", "Average_Fitness",
-                           "Worst_Fitness"] + [f"Top_{i}_Genome" for i in range(1, 11)]
                 writer.writerow(headers)
+        elif telemetry is not None:
+            self._extend_log_headers(headers)
+
+    def _extend_log_headers(self, headers: List[str]) -> None:
+        """Give an existing log written without telemetry the telemetry columns (empty in its earlier rows)."""
+        with open(self.log_file, newline='') as f:
+            rows = list(csv.reader(f))
+        if rows and rows[0] == headers:
+            return
+        with open(self.log_file, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(headers)
+            writer.writerows(rows[1:])
+
+    def _phase(self, name: str):
+        return self.telemetry.phase(name) if self.telemetry is not None else nullcontext()
 
     def _generate_initial_population(self, pop_size: int, genome_length: int, min_val: int = -100, max_val: int = 100) -> List[List[int]]:
         """Creates the initial population of integer lists."""
         return [[random.randint(min_val, max_val) for _ in range(genome_length)] for _ in range(pop_size)]
 
+    def _screen(self, population: List[List[int]], carried: int) -> Tuple[List[int], List[float]]:
+        """Indices of the individuals to evaluate for real, and the surrogate's estimates for all of them.
+
+        The first *carried* individuals, the elite of the previous generation,
+        are always evaluated; only the offspring after them are screened.
+        """
+        if self.surrogate is None or not self.surrogate.is_trained():
+            return list(range(len(population))), [0.0] * len(population)
+        estimates = self.surrogate.predict(population)
+        offspring = len(population) - carried
+        ranked = sorted(range(carried, len(population)), key=estimates.__getitem__, reverse=True)
+        promising = max(1, round(self.screen_fraction * offspring))
+        others = ranked[promising:]
+        explored = random.sample(others, min(len(others), round(self.exploration_fraction * offspring)))
+        return list(range(carried)) + sorted(ranked[:promising] + explored), estimates
+
+    @staticmethod
+    def _selection_fitnesses(fitnesses: List[float], evaluated: List[int], worst_fitness: float) -> List[float]:
+        """Fitnesses selection draws on: the real ones, and estimates no higher than the worst real one.
+
+        The screened-out offspring were rated less promising than those
+        evaluated, and the surrogate is fitted on past populations, so an
+        estimate is not allowed to outrank a genome whose fitness was measured.
+        """
+        evaluated = set(evaluated)
+        return [value if i in evaluated else min(value, worst_fitness) for i, value in enumerate(fitnesses)]
+
     def run(self, generations: int, pop_size: int = 100, genome_length: int = 8, min_gene_val: int = -100, max_gene_val: int = 100, mutation_prob: float = 0.2):
         """Execute the genetic algorithm search."""
         population = self._generate_initial_population(
             pop_size, genome_length, min_gene_val, max_gene_val)
+        carried = 0
+        try:
+            for generation in range(generations):
+                population, carried = self._generation(generation, population, carried, pop_size, mutation_prob)
+        finally:
+            if self.telemetry is not None:
+                self.telemetry.write_trace()
 
-        for generation in range(generations):
-            # 0. Inject current population into fitness function if needed (for tournaments/k-matchups)
-            if hasattr(self.fitness, 'population'):
-                self.fitness.population = list(population)
-
-            # 1. Map Evaluation (Delegated to Backend)
-            fitnesses = self.backend.map_evaluate(
-                self.fitness.evaluate, population)
+        return population
 
-            # 2. Extract metrics
-            best_fitness = max(fitnesses)
-            worst_fitness = min(fitnesses)
-            avg_fitness = sum(fitnesses) / len(fitnesses)
+    def _generation(self, generation: int, population: List[List[int]], carried: int, pop_size: int,
+                    mutation_prob: float) -> Tuple[List[List[int]], int]:
+        """Evaluate, log and breed one generation whose first *carried* individuals are the previous elite.
+
+        Returns the next generation and the number of elites at its start.
+        """
+        telemetry = self.telemetry
+        if telemetry is not None:
+            telemetry.start_generation(generation)
+
+        # 0. Inject current population into fitness function if needed (for tournaments/k-matchups)
+        if hasattr(self.fitness, 'population'):
+            self.fitness.population = list(population)
+
+        # 1. Map Evaluation (Delegated to Backend, which publishes the population to its workers)
+        #    of the individuals the surrogate, if any, does not screen out
+        with self._phase("surrogate"):
+            evaluated, fitnesses = self._screen(population, carried)
+        with self._phase("evaluate"):
+            evaluated_fitnesses = self.backend.evaluate_population(
+                self.fitness, population, evaluated)
+        for index, value in zip(evaluated, evaluated_fitnesses):
+            fitnesses[index] = value
+        if self.surrogate is not None:
+            with self._phase("surrogate"):
+                self.surrogate.update([population[i] for i in evaluated], evaluated_fitnesses)
+
+        with self._phase("log"):
+            # 2. Extract metrics (of the evaluated individuals only)
+            best_fitness = max(evaluated_fitnesses)
+            worst_fitness = min(evaluated_fitnesses)
+            avg_fitness = sum(evaluated_fitnesses) / len(evaluated_fitnesses)
 
             # Sort population by fitness to get top 5 genomes
-            pop_with_fitness = list(zip(population, fitnesses))
+            pop_with_fitness = [(population[i], fitnesses[i]) for i in evaluated]
             pop_with_fitness.sort(key=lambda x: x[1], reverse=True)
             top_5_genomes = [str(x[0]) for x in pop_with_fitness[:5]]
             while len(top_5_genomes) < 5:
                 top_5_genomes.append("")
 
-            # 3. Log Generation State (append to CSV)
-            with open(self.log_file, "a", newline='') as f:
-                writer = csv.writer(f)
-                writer.writerow([generation, best_fitness,
-                                avg_fitness, worst_fitness] + top_5_genomes)
-
             print(
-                f"Gen {generation} | Best: {best_fitness:.2f} | Avg: {avg_fitness:.2f} | Worst: {worst_fitness:.2f}")
+                f"Gen {generation} | Best: {best_fitness:.2f} | Avg: {avg_fitness:.2f} | Worst: {worst_fitness:.2f}"
+                f" | Evaluated: {len(evaluated)}/{len(population)}")
 
-            # 4. Generate new population
+        # 3. Generate new population
+        with self._phase("breed"):
             new_population = []
+            if len(evaluated) < len(population):
+                fitnesses = self._selection_fitnesses(fitnesses, evaluated, worst_fitness)
 
             # Keep best individual (Elitism - Optional, doing it simply here)
-            best_index = fitnesses.index(best_fitness)
+            best_index = evaluated[evaluated_fitnesses.index(best_fitness)]
             new_population.append(list(population[best_index]))
 
             # Generate the rest
+            clock = time.perf_counter
+            selection_time = crossover_time = mutation_time = 0.0
             while len(new_population) < pop_size:
                 # Select parents
+                start = clock()
                 parents = self.selection.select(population, fitnesses, 2)
                 parent1, parent2 = parents[0], parents[1]
 
                 # Crossover
+                selected = clock()
                 child1, child2 = self.crossover.crossover(parent1, parent2)
 
                 # Mutation
+                crossed = clock()
                 if random.random() < mutation_prob:
                     child1 = self.mutation.mutate(child1)
                 if random.random() < mutation_prob:
                     child2 = self.mutation.mutate(child2)
+                mutated = clock()
+
+                selection_time += selected - start
+                crossover_time += crossed - selected
+                mutation_time += mutated - crossed
 
                 new_population.append(child1)
                 if len(new_population) < pop_size:
                     new_population.append(child2)
 
-            population = new_population
-
-        return population
+        # 4. Log Generation State (append to CSV), with the timings of the whole generation
+        row = [generation, best_fitness, avg_fitness, worst_fitness] + top_5_genomes
+        if telemetry is not None:
+            telemetry.add_time("selection", selection_time)
+            telemetry.add_time("crossover", crossover_time)
+            telemetry.add_time("mutation", mutation_time)
+            summary = telemetry.end_generation(self.backend.worker_count())
+            # the telemetry columns come after the ten Top_i_Genome ones
+            row += [""] * 5 + [summary[column] for column in Telemetry.COLUMNS]
+        with open(self.log_file, "a", newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(row)
+
+        return new_population, 1
@@ -0,0 +1,460 @@
+"""Evaluation of a population by worker processes on any number of hosts, over TCP.
+
+DistributedBackend runs a broker in the master process. Workers connect to
+it from every node of the job (``python ga_framework/distributed.py
+HOST:PORT --processes N``), each process taking one task at a time, or
+are started on localhost by the backend itself. The broker
+
+- sends each worker the fitness function and the population once per
+  generation, then tasks that only carry an index,
+- streams the results back as soon as each task is done,
+- drops a worker that closes its connection or stops sending heartbeats,
+  and gives its tasks to the others,
+- retries a task that failed, up to max_attempts times.
+
+Connections use multiprocessing.connection, so messages are pickled and
+the workers authenticate with a shared secret key. There is no default
+key: the broker generates one when it is given none, which only the
+workers it starts itself know, and it listens on 127.0.0.1 unless it is
+given a host. Only open the port on the cluster's private network.
+"""
+import argparse
+import copy
+import os
+import pickle
+import queue
+import secrets
+import socket
+import sys
+import threading
+import time
+import traceback
+from collections import deque
+from multiprocessing import Process, AuthenticationError
+from multiprocessing.connection import Listener, Client, wait
+from typing import List, Callable, Optional, Iterator, Tuple
+
+from interfaces import ParallelBackend, FitnessFunction
+
+DEFAULT_PORT = 5757
+AUTHKEY_VARIABLE = "NONAGA_GA_AUTHKEY"
+
+
+class _Job:
+    """A generation sent to the workers: what evaluates an individual, and the population."""
+
+    def __init__(self, job_id: int, target, population: List[List[int]], is_fitness: bool):
+        self.id = job_id
+        # pickled once, whatever the number of workers
+        self.message = pickle.dumps(("job", job_id, target, population, is_fitness))
+        self.cancelled = False
+
+
+class _Task:
+    def __init__(self, task_id: int, job: _Job, index: int):
+        self.id = task_id
+        self.job = job
+        self.index = index
+        self.attempts = 0
+        self.done = False
+
+
+class _Worker:
+    def __init__(self, conn, name: str):
+        self.conn = conn
+        self.name = name
+        self.job_id = None
+        self.in_flight = {}
+        self.last_seen = time.monotonic()
+
+
+class DistributedBackend(ParallelBackend):
+    def __init__(self, host: str = "127.0.0.1", port: int = DEFAULT_PORT, authkey: Optional[bytes] = None,
+                 local_workers: int = 0, heartbeat_interval: float = 5.0, heartbeat_timeout: float = 60.0,
+                 max_attempts: int = 3, prefetch: int = 2, verbose: bool = True):
+        """Start the broker and listen for workers.
+
+        Args:
+            host: interface to listen on; workers on other hosts need an
+                address they can reach, e.g. the host name or "0.0.0.0"
+            port: 0 picks a free port, see self.address
+            authkey: secret shared with the workers; when None a random key
+                is generated, which only the local workers receive
+            local_workers: worker processes started on this host, e.g. to test
+                the backend on one machine; remote workers may join them
+            heartbeat_timeout: seconds without any message after which a worker
+                is considered lost; it must cover a few heartbeat intervals
+            max_attempts: failures (errors or lost workers) after which a task
+                makes the evaluation raise
+            prefetch: tasks a worker holds at once, so that it does not wait for
+                the next one after sending a result
+        """
+        if authkey is None:
+            authkey = secrets.token_bytes(32)
+        elif not authkey:
+            raise ValueError("The authentication key of the workers must not be empty.")
+        self.authkey = authkey
+        self.heartbeat_interval = heartbeat_interval
+        self.heartbeat_timeout = heartbeat_timeout
+        self.max_attempts = max_attempts
+        self.prefetch = prefetch
+        self.verbose = verbose
+        self._listener = Listener((host, port), authkey=authkey)
+        self.address = self._listener.address
+        self._lock = threading.Lock()
+        self._joining = []
+        self._workers = []
+        self._pending = deque()
+        self._results = queue.Queue()
+        self._next_id = 0
+        self._closed = False
+        # local workers are forked before the broker threads start
+        self._processes = [Process(target=run_worker, args=(("127.0.0.1", self.address[1]), authkey), daemon=True)
+                           for _ in range(local_workers)]
+        for process in self._processes:
+            process.start()
+        self._threads = [threading.Thread(target=self._serve, daemon=True),
+                         threading.Thread(target=self._accept, daemon=True)]
+        for thread in self._threads:
+            thread.start()
+
+    # ── caller side ─────────────────────────────────────────
+    def map_evaluate(self, evaluate_func: Callable[[List[int]], float], population: List[List[int]]) -> List[float]:
+        return self._collect(self._submit(evaluate_func, population, range(len(population)), False))
+
+    def evaluate_population(self, fitness: FitnessFunction, population: List[List[int]],
+                            indices: Optional[List[int]] = None) -> List[float]:
+        return self._collect(self._submit_population(fitness, population, indices))
+
+    def stream_population(self, fitness: FitnessFunction, population: List[List[int]],
+                          indices: Optional[List[int]] = None) -> Iterator[Tuple[int, float]]:
+        """Yield (index, fitness) pairs in the order the workers finish them."""
+        job, tasks = self._submit_population(fitness, population, indices)
+        for position, fitness_value in self._stream(job, tasks):
+            yield tasks[position].index, fitness_value
+
+    def worker_count(self) -> int:
+        with self._lock:
+            return len(self._workers)
+
+    def wait_for_workers(self, count: int, timeout: Optional[float] = None) -> int:
+        """Block until *count* workers have joined or the timeout expires; returns the number joined.
+
+        A connection counts once its worker has finished the handshake, so
+        that the tasks sent next have somewhere to go.
+        """
+        deadline = None if timeout is None else time.monotonic() + timeout
+        while True:
+            with self._lock:
+                joined = len(self._workers)
+            if joined >= count or (deadline is not None and time.monotonic() >= deadline):
+                return joined
+            time.sleep(0.05)
+
+    def close(self) -> None:
+        if self._closed:
+            return
+        self._closed = True
+        self._threads[0].join(timeout=5)
+        try:
+            # wakes up the accepting thread, which closing the listener does not
+            Client(("127.0.0.1", self.address[1]), authkey=self.authkey).close()
+        except (OSError, AuthenticationError, EOFError):
+            pass
+        self._threads[1].join(timeout=5)
+        self._listener.close()
+        with self._lock:
+            workers, self._workers = self._workers + [_Worker(conn, "") for conn in self._joining], []
+            self._joining = []
+        for worker in workers:
+            try:
+                worker.conn.send(("stop",))
+                worker.conn.close()
+            except OSError:
+                pass
+        for process in self._processes:
+            process.join(timeout=5)
+            if process.is_alive():
+                process.terminate()
+        self._processes = []
+
+    def _submit_population(self, fitness: FitnessFunction, population: List[List[int]],
+                           indices: Optional[List[int]]):
+        # tournaments draw their opponents from the population, which the workers
+        # give back to their copy of the fitness function as it is sent next to it
+        payload = copy.copy(fitness)
+        if hasattr(payload, 'population'):
+            payload.population = []
+        return self._submit(payload, population, range(len(population)) if indices is None else indices, True)
+
+    def _submit(self, target, population: List[List[int]], indices, is_fitness: bool):
+        if self._closed:
+            raise RuntimeError("The backend is closed.")
+        with self._lock:
+            self._next_id += 1
+            job = _Job(self._next_id, target, population, is_fitness)
+            tasks = []
+            for index in indices:
+                self._next_id += 1
+                tasks.append(_Task(self._next_id, job, index))
+            self._pending.extend(tasks)
+        return job, tasks
+
+    def _collect(self, submitted) -> List[float]:
+        job, tasks = submitted
+        fitnesses = [0.0] * len(tasks)
+        for position, fitness_value in self._stream(job, tasks):
+            fitnesses[position] = fitness_value
+        return fitnesses
+
+    def _stream(self, job: _Job, tasks: List[_Task]):
+        positions = {task.id: position for position, task in enumerate(tasks)}
+        remaining = len(tasks)
+        try:
+            while remaining:
+                task_id, ok, value = self._results.get()
+                if task_id not in positions:
+                    # finished before an earlier job was abandoned
+                    continue
+                remaining -= 1
+                if not ok:
+                    raise RuntimeError(f"Task {positions[task_id]} of the generation failed "
+                                       f"{self.max_attempts} times, last with:\n{value}")
+                yield positions[task_id], value
+        finally:
+            # results of an abandoned job are dropped by the broker
+            with self._lock:
+                job.cancelled = True
+
+    # ── broker threads ──────────────────────────────────────
+    def _log(self, message: str) -> None:
+        if self.verbose:
+            print(f"[distributed] {message}", flush=True)
+
+    def _accept(self) -> None:
+        while not self._closed:
+            try:
+                conn = self._listener.accept()
+            except (OSError, AuthenticationError, EOFError):
+                # a client without the key, or one that went away during the handshake
+                continue
+            if self._closed:
+                conn.close()
+                break
+            with self._lock:
+                self._joining.append(conn)
+
+    def _serve(self) -> None:
+        while not self._closed:
+            with self._lock:
+                conns = {worker.conn: worker for worker in self._workers}
+                conns.update((conn, None) for conn in self._joining)
+            if conns:
+                for conn in wait(list(conns), timeout=0.1):
+                    self._receive(conn, conns[conn])
+            else:
+                time.sleep(0.1)
+            now = time.monotonic()
+            with self._lock:
+                for worker in list(self._workers):
+                    if now - worker.last_seen > self.heartbeat_timeout:
+                        self._drop(worker, f"no heartbeat for {now - worker.last_seen:.0f}s")
+                self._dispatch()
+
+    def _receive(self, conn, worker: Optional[_Worker]) -> None:
+        try:
+            message = conn.recv()
+        except (EOFError, OSError):
+            with self._lock:
+                if worker is None:
+                    self._joining.remove(conn)
+                else:
+                    self._drop(worker, "connection closed")
+            return
+        with self._lock:
+            if worker is None:
+                # the first message of a worker is ("hello", name)
+                self._joining.remove(conn)
+                worker = _Worker(conn, message[1])
+                self._workers.append(worker)
+                self._send(worker, ("welcome", self.heartbeat_interval))
+                self._log(f"{worker.name} joined, {len(self._workers)} workers")
+                return
+            worker.last_seen = time.monotonic()
+            kind = message[0]
+            if kind == "result" or kind == "error":
+                task = worker.in_flight.pop(message[1], None)
+                if task is None or task.done or task.job.cancelled:
+                    return
+                if kind == "result":
+                    if self.telemetry is not None:
+                        # ("result", task_id, fitness, start, end), timed by the worker
+                        self.telemetry.record_task(worker.name, message[3], message[4])
+                    self._finish(task, True, message[2])
+                else:
+                    self._retry(task, f"{worker.name}: {message[2]}")
+
+    def _send(self, worker: _Worker, message) -> bool:
+        try:
+            if isinstance(message, bytes):
+                worker.conn.send_bytes(message)
+            else:
+                worker.conn.send(message)
+            return True
+        except OSError:
+            self._drop(worker, "connection lost")
+            return False
+
+    def _dispatch(self) -> None:
+        # called with the lock held
+        for worker in sorted(self._workers, key=lambda w: len(w.in_flight)):
+            while self._pending and len(worker.in_flight) < self.prefetch:
+                task = self._pending.popleft()
+                if task.done or task.job.cancelled:
+                    continue
+                if worker.job_id != task.job.id:
+                    if not self._send(worker, task.job.message):
+                        self._pending.appendleft(task)
+                        break
+                    worker.job_id = task.job.id
+                if not self._send(worker, ("task", task.id, task.job.id, task.index)):
+                    self._pending.appendleft(task)
+                    break
+                worker.in_flight[task.id] = task
+
+    def _drop(self, worker: _Worker, reason: str) -> None:
+        # called with the lock held
+        if worker not in self._workers:
+            return
+        self._workers.remove(worker)
+        try:
+            worker.conn.close()
+        except OSError:
+            pass
+        self._log(f"{worker.name} lost ({reason}), {len(worker.in_flight)} tasks retried, "
+                  f"{len(self._workers)} workers left")
+        for task in worker.in_flight.values():
+            if not task.done and not task.job.cancelled:
+                self._retry(task, f"{worker.name} lost ({reason})")
+        worker.in_flight = {}
+
+    def _retry(self, task: _Task, error: str) -> None:
+        task.attempts += 1
+        if task.attempts >= self.max_attempts:
+            self._finish(task, False, error)
+        else:
+            self._pending.appendleft(task)
+
+    def _finish(self, task: _Task, ok: bool, value) -> None:
+        task.done = True
+        self._results.put((task.id, ok, value))
+
+
+# ── worker side ─────────────────────────────────────────
+def _connect(address, authkey: bytes, timeout: float):
+    """Connect to the broker, retrying while it is not listening yet."""
+    deadline = time.monotonic() + timeout
+    while True:
+        try:
+            return Client(address, authkey=authkey)
+        except OSError:
+            if time.monotonic() >= deadline:
+                raise
+            time.sleep(1.0)
+
+
+def run_worker(address, authkey: bytes, name: Optional[str] = None,
+               connect_timeout: float = 300.0) -> int:
+    """Evaluate the tasks of a broker until it stops or goes away; returns the number of tasks done."""
+    conn = _connect(address, authkey, connect_timeout)
+    send_lock = threading.Lock()
+    stopped = threading.Event()
+
+    def send(message):
+        with send_lock:
+            conn.send(message)
+
+    def beat(interval):
+        # the fitness function returns to the interpreter between games, which lets this thread run
+        while not stopped.wait(interval):
+            try:
+                send(("heartbeat",))
+            except OSError:
+                return
+
+    send(("hello", name or f"{socket.gethostname()}:{os.getpid()}"))
+    evaluate, population, job_id = None, [], None
+    done = 0
+    try:
+        while True:
+            try:
+                message = conn.recv()
+            except (EOFError, OSError):
+                break
+            kind = message[0]
+            if kind == "welcome":
+                threading.Thread(target=beat, args=(message[1],), daemon=True).start()
+            elif kind == "job":
+                _, job_id, target, population, is_fitness = message
+                evaluate = target
+                if is_fitness:
+                    if hasattr(target, 'population'):
+                        target.population = population
+                    evaluate = target.evaluate
+            elif kind == "task":
+                _, task_id, task_job, index = message
+                if task_job != job_id:
+                    send(("error", task_id, f"task of job {task_job} received during job {job_id}"))
+                    continue
+                try:
+                    start = time.time()
+                    fitness_value = evaluate(population[index])
+                    reply = ("result", task_id, fitness_value, start, time.time())
+                except Exception:
+                    reply = ("error", task_id, traceback.format_exc())
+                try:
+                    send(reply)
+                except OSError:
+                    # dropped by the broker, which gave the task to another worker
+                    break
+                done += 1
+            elif kind == "stop":
+                break
+    finally:
+        stopped.set()
+        conn.close()
+    return done
+
+
+def parse_address(text: str):
+    host, _, port = text.rpartition(":")
+    return (host or "127.0.0.1", int(port) if port else DEFAULT_PORT)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Run GA evaluation workers for a DistributedBackend.")
+    parser.add_argument("address", help="HOST:PORT of the master")
+    parser.add_argument("--processes", type=int, default=None,
+                        help="worker processes on this host (default: SLURM_CPUS_PER_TASK or the CPU count)")
+    parser.add_argument("--authkey", default=os.environ.get(AUTHKEY_VARIABLE),
+                        help=f"secret key shared with the master (default: ${AUTHKEY_VARIABLE})")
+    parser.add_argument("--connect-timeout", type=float, default=300.0,
+                        help="seconds to wait for the master to start listening")
+    args = parser.parse_args()
+    if not args.authkey:
+        parser.error(f"the key of the master is required, set {AUTHKEY_VARIABLE} or pass --authkey")
+
+    nonaga_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "NonagaGame")
+    if nonaga_path not in sys.path:
+        sys.path.append(nonaga_path)
+    from compiler import compile_cython_files
+    compile_cython_files()
+
+    processes = args.processes or int(os.environ.get("SLURM_CPUS_PER_TASK", 0)) or os.cpu_count() or 1
+    address = parse_address(args.address)
+    workers = [Process(target=run_worker, args=(address, args.authkey.encode(), None, args.connect_timeout))
+               for _ in range(processes)]
+    for worker in workers:
+        worker.start()
+    for worker in workers:
+        worker.join()
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple, Callable
+from typing import List, Tuple, Callable, Optional
 
 
 class SelectionStrategy(ABC):
@@ -32,6 +32,45 @@ class FitnessFunction(ABC):
 
 class ParallelBackend(ABC):
     """Interface handling the distribution of tasks or populations."""
+    # set by ModularGA; backends that time their tasks report them to it (see telemetry.py)
+    telemetry = None
+
     @abstractmethod
     def map_evaluate(self, evaluate_func: Callable[[List[int]], float], population: List[List[int]]) -> List[float]:
         pass
+
+    def evaluate_population(self, fitness: FitnessFunction, population: List[List[int]],
+                            indices: Optional[List[int]] = None) -> List[float]:
+        """Evaluate a generation with a fitness function.
+
+        Only the individuals at *indices* are evaluated when given, in that
+        order, against the whole population. Backends that can publish the
+        population to their workers once per generation override this; by
+        default each individual is mapped with the bound evaluate method.
+        """
+        if indices is None:
+            return self.map_evaluate(fitness.evaluate, population)
+        return self.map_evaluate(fitness.evaluate, [population[i] for i in indices])
+
+    def worker_count(self) -> Optional[int]:
+        """Number of workers evaluating in parallel, if the backend knows it."""
+        return None
+
+    def close(self) -> None:
+        """Release the workers a backend keeps between generations."""
+        pass
+
+
+class SurrogateModel(ABC):
+    """Cheap model of the fitness function, trained online on the individuals evaluated so far."""
+    @abstractmethod
+    def update(self, population: List[List[int]], fitnesses: List[float]) -> None:
+        pass
+
+    @abstractmethod
+    def predict(self, population: List[List[int]]) -> List[float]:
+        pass
+
+    @abstractmethod
+    def is_trained(self) -> bool:
+        pass
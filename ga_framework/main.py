@@ -1,3 +1,7 @@
+import time
+
+STARTUP_TIME = time.perf_counter()
+
 import os
 import sys
 
@@ -13,18 +17,38 @@ if __name__ == '__main__':
 
     parser = argparse.ArgumentParser(
         description="Run Nonaga Genetic Algorithm")
-    parser.add_argument("--mode", type=str, choices=["local", "slurm"], default="local",
-                        help="Execution mode: 'local' (fixed cores) or 'slurm' (dynamic cores)")
+    parser.add_argument("--mode", type=str, choices=["local", "slurm", "distributed"], default="local",
+                        help="Execution mode: 'local' (fixed cores), 'slurm' (dynamic cores) or "
+                             "'distributed' (workers on several nodes connect to this process)")
+    parser.add_argument("--host", type=str, default="127.0.0.1",
+                        help="Interface the distributed mode listens on; workers on other nodes need one they "
+                             "reach, e.g. the host name")
+    parser.add_argument("--port", type=int, default=5757,
+                        help="Port the distributed mode listens on for workers")
+    parser.add_argument("--local-workers", type=int, default=0,
+                        help="Worker processes the distributed mode also starts on this host")
+    parser.add_argument("--min-workers", type=int, default=1,
+                        help="Workers the distributed mode waits for before the first generation")
+    parser.add_argument("--surrogate", action="store_true",
+                        help="Only play the tournaments of the offspring a surrogate model rates promising")
+    parser.add_argument("--native", action="store_true",
+                        help="Play the tournament games in compiled code (nonaga_match) instead of from Python")
+    parser.add_argument("--trace", type=str, default=None, metavar="FILE",
+                        help="Time each generation and worker task, add the timings to ga_metrics.csv "
+                             "and write a Chrome trace (chrome://tracing, ui.perfetto.dev) to FILE")
     args = parser.parse_args()
 
     # Compile Cython files before importing GA logic
-    from compiler import compile_cython_files
+    from compiler import compile_cython_files, report_startup_time
     print("Ensuring Cython core components are compiled...")
-    compile_cython_files()
+    compiled = compile_cython_files()
 
     import strategies
     from backends import MasterSlaveBackend
     from core import ModularGA
+    from telemetry import Telemetry
+
+    report_startup_time(STARTUP_TIME, compiled)
 
     print("Initializing Modular GA...")
 
@@ -33,7 +57,7 @@ if __name__ == '__main__':
     crossover = strategies.ArithmeticCrossover()
     mutation = strategies.RandomIntMutation(
         mutation_rate=0.5, min_val=-100, max_val=100)
-    fitness = strategies.NonagaTournamentFitness(k_opponents=50, max_moves=30)
+    fitness = strategies.NonagaTournamentFitness(k_opponents=50, max_moves=30, native=args.native)
 
     # 2. Initialize parallel backend
     if args.mode == "slurm":
@@ -52,6 +76,17 @@ if __name__ == '__main__':
         print(
             f"[{args.mode.upper()}] Running parallel backend with {num_cores} workers.")
         backend = MasterSlaveBackend(max_workers=num_cores)
+    elif args.mode == "distributed":
+        from distributed import DistributedBackend, AUTHKEY_VARIABLE
+        authkey = os.environ.get(AUTHKEY_VARIABLE)
+        if not authkey and args.local_workers < args.min_workers:
+            # a generated key is only known to the local workers
+            parser.error(f"workers started elsewhere need the secret key, set {AUTHKEY_VARIABLE}")
+        backend = DistributedBackend(host=args.host, port=args.port, authkey=authkey.encode() if authkey else None,
+                                     local_workers=args.local_workers)
+        print(f"[{args.mode.upper()}] Listening for workers on port {backend.address[1]}, "
+              f"waiting for {args.min_workers}.")
+        print(f"[{args.mode.upper()}] {backend.wait_for_workers(args.min_workers)} workers connected.")
     else:
         # Default local mode with a fixed number of workers
         print(f"[{args.mode.upper()}] Running parallel backend with fixed 4 workers.")
@@ -64,11 +99,16 @@ if __name__ == '__main__':
         mutation=mutation,
         fitness=fitness,
         backend=backend,
-        log_file="ga_metrics.csv"
+        log_file="ga_metrics.csv",
+        surrogate=strategies.QuadraticSurrogate() if args.surrogate else None,
+        telemetry=Telemetry(args.trace) if args.trace else None
     )
 
     # 4. Run the GA for n generations as MVP
     print("Running GA optimization...")
-    final_population = ga.run(generations=300, pop_size=100, genome_length=8)
+    try:
+        final_population = ga.run(generations=300, pop_size=100, genome_length=8)
+    finally:
+        backend.close()
 
     print("\nOptimization Complete. View ga_metrics.csv for generation logs.")
@@ -1,6 +1,6 @@
 import random
 from typing import List, Tuple
-from interfaces import SelectionStrategy, CrossoverStrategy, MutationStrategy, FitnessFunction
+from interfaces import SelectionStrategy, CrossoverStrategy, MutationStrategy, FitnessFunction, SurrogateModel
 
 # =========================== SelectionStrategy ===========================
 
@@ -115,11 +115,14 @@ class NonagaTournamentFitness(FitnessFunction):
     """
     Evaluates an individual by making it play K games against randomly selected 
     opponents from the current generation. Points are awarded based on wins.
+    With native=True the K games are played in C by nonaga_match.play_lockstep
+    instead of move by move from Python, the positions they share searched once.
     """
 
-    def __init__(self, k_opponents: int, max_moves: int):
+    def __init__(self, k_opponents: int, max_moves: int, native: bool = False):
         self.k_opponents = k_opponents
         self.max_moves = max_moves
+        self.native = native
         self.population = []  # Will be dynamically injected by ModularGA
 
     def evaluate(self, individual: List[int]) -> float:
@@ -132,8 +135,7 @@ class NonagaTournamentFitness(FitnessFunction):
             sys.path.append(my_nonaga_path)
 
         try:
-            from AI import AI
-            from nonaga_logic import NonagaLogic
+            from match_pool import process_pool
             from nonaga_constants import RED, BLACK
         except ImportError as e:
             print(f"Error importing Nonaga modules: {e}")
@@ -145,7 +147,16 @@ class NonagaTournamentFitness(FitnessFunction):
         # Select K random opponents from the current generation
         opponents = random.choices(self.population, k=self.k_opponents)
 
+        if self.native:
+            from nonaga_match import play_lockstep
+            # the individual plays RED, as below
+            winners, _, _ = play_lockstep([(individual, opponent) for opponent in opponents],
+                                          max_moves=self.max_moves)
+            return float(sum(1 if winner == RED else -1 if winner == BLACK else 0 for winner in winners))
+
         score = 0.0
+        # the game and AI objects are reset for each match instead of being built again
+        pool = process_pool()
 
         for opponent in opponents:
             # We fix the individual to RED and opponent to BLACK for each match to simplify,
@@ -154,35 +165,106 @@ class NonagaTournamentFitness(FitnessFunction):
             color_ind, color_opp = RED, BLACK
 
             # Using depth=1 to keep GA evaluations reasonably fast
-            ai_ind = AI(parameter=individual, depth=1, color=color_ind)
-            ai_opp = AI(parameter=opponent, depth=1, color=color_opp)
-
-            game = NonagaLogic(player_red=ai_ind,
-                               player_black=ai_opp, new_game=True)
-
-            moves = 0
-            while moves < self.max_moves:
-                current_color = game.get_current_player()
-                active_ai = ai_ind if current_color == color_ind else ai_opp
-
-                try:
-                    # get_best_move determines what the AI does without executing it directly
-                    best_piece_move, best_tile_move = active_ai.get_best_move(
-                        game)
-                    # Excute in the real logic board
-                    game.move_piece(best_piece_move[0], best_piece_move[1])
-                    game.move_tile(best_tile_move[0], best_tile_move[1])
-                except Exception as e:
-                    # Invalid move or AI crashed, break and count as a loss/draw
-                    break
-
-                if game.check_win_condition(color_ind):
-                    score += 1.0
-                    break
-                elif game.check_win_condition(color_opp):
-                    score -= 1.0  # Penalize for losing
-                    break
-
-                moves += 1
+            with pool.match(individual, opponent, depth=1) as (game, ai_ind, ai_opp):
+                moves = 0
+                while moves < self.max_moves:
+                    current_color = game.get_current_player()
+                    active_ai = ai_ind if current_color == color_ind else ai_opp
+
+                    try:
+                        # get_best_move determines what the AI does without executing it directly
+                        best_piece_move, best_tile_move = active_ai.get_best_move(
+                            game)
+                        # Excute in the real logic board
+                        game.move_piece(best_piece_move[0], best_piece_move[1])
+                        game.move_tile(best_tile_move[0], best_tile_move[1])
+                    except Exception as e:
+                        # Invalid move or AI crashed, break and count as a loss/draw
+                        break
+
+                    if game.check_win_condition(color_ind):
+                        score += 1.0
+                        break
+                    elif game.check_win_condition(color_opp):
+                        score -= 1.0  # Penalize for losing
+                        break
+
+                    moves += 1
 
         return score
+
+
+# =========================== SurrogateModel ===========================
+
+
+class QuadraticSurrogate(SurrogateModel):
+    """
+    Ridge regression of the fitness on the genes, their squares and their pairwise products.
+    The normal equations are accumulated online, one generation at a time, and the older
+    generations are weighted down by `decay` because tournament fitness depends on the
+    population it was measured against.
+    """
+
+    def __init__(self, decay: float = 0.7, ridge: float = 1e-2, scale: float = 100.0):
+        self.decay = decay
+        self.ridge = ridge
+        self.scale = scale
+        self._xtx = None
+        self._xty = None
+        self._weights = None
+
+    def _features(self, individual: List[int]) -> List[float]:
+        x = [gene / self.scale for gene in individual]
+        return [1.0] + x + [x[i] * x[j] for i in range(len(x)) for j in range(i, len(x))]
+
+    def update(self, population: List[List[int]], fitnesses: List[float]) -> None:
+        if not population:
+            return
+        rows = [self._features(individual) for individual in population]
+        size = len(rows[0])
+        if self._xtx is None or len(self._xtx) != size:
+            self._xtx = [[0.0] * size for _ in range(size)]
+            self._xty = [0.0] * size
+        for i in range(size):
+            self._xty[i] *= self.decay
+            for j in range(size):
+                self._xtx[i][j] *= self.decay
+        for row, fitness in zip(rows, fitnesses):
+            for i in range(size):
+                self._xty[i] += row[i] * fitness
+                for j in range(i, size):
+                    self._xtx[i][j] += row[i] * row[j]
+        # Mirror the upper triangle and add the ridge penalty, except on the intercept
+        matrix = [[self._xtx[min(i, j)][max(i, j)] + (self.ridge if i == j and i > 0 else 0.0)
+                   for j in range(size)] for i in range(size)]
+        self._weights = _solve(matrix, list(self._xty))
+
+    def predict(self, population: List[List[int]]) -> List[float]:
+        return [sum(w * x for w, x in zip(self._weights, self._features(individual))) for individual in population]
+
+    def is_trained(self) -> bool:
+        return self._weights is not None
+
+
+def _solve(matrix: List[List[float]], vector: List[float]) -> List[float]:
+    """Solve matrix x = vector by Gaussian elimination with partial pivoting (the inputs are modified)."""
+    n = len(vector)
+    for k in range(n):
+        pivot = max(range(k, n), key=lambda i: abs(matrix[i][k]))
+        if abs(matrix[pivot][k]) < 1e-12:
+            continue
+        matrix[k], matrix[pivot] = matrix[pivot], matrix[k]
+        vector[k], vector[pivot] = vector[pivot], vector[k]
+        for i in range(k + 1, n):
+            factor = matrix[i][k] / matrix[k][k]
+            if factor:
+                for j in range(k, n):
+                    matrix[i][j] -= factor * matrix[k][j]
+                vector[i] -= factor * vector[k]
+    solution = [0.0] * n
+    for k in range(n - 1, -1, -1):
+        if abs(matrix[k][k]) < 1e-12:
+            continue
+        solution[k] = (vector[k] - sum(matrix[k][j] * solution[j] for j in range(k + 1, n))) / matrix[k][k]
+    return solution
+
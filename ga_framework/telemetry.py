@@ -0,0 +1,150 @@
+"""Timings of a GA run: where the time of each generation goes, and how busy the workers are.
+
+ModularGA times the phases of every generation (evaluation, breeding,
+logging, surrogate) and the backends report each evaluation task: which
+worker ran it, from when to when. At the end of a generation summary
+columns go into the metrics CSV, and write_trace exports everything in the
+Chrome trace event format, which chrome://tracing or https://ui.perfetto.dev
+show as a timeline with one row per worker.
+
+Times are time.time() seconds, so that the tasks timed in worker processes
+or on other hosts line up with the phases of the master (up to the clock
+offset between hosts).
+"""
+import json
+import statistics
+import time
+from contextlib import contextmanager
+from typing import Dict, Optional
+
+_MASTER, _WORKERS = 1, 2
+
+
+class Telemetry:
+    # summary columns appended to the metrics CSV, see end_generation
+    COLUMNS = ["Generation_Time", "Evaluate_Time", "Breed_Time", "Selection_Time", "Crossover_Time",
+               "Mutation_Time", "Log_Time", "Surrogate_Time", "Pool_Startup_Time", "Tasks", "Task_Mean",
+               "Task_Max", "Straggler_Ratio", "Tail_Time", "Worker_Idle_Time", "Worker_Utilization"]
+
+    def __init__(self, trace_file: Optional[str] = "ga_trace.json"):
+        self.trace_file = trace_file
+        self.origin = time.time()
+        self.generation = None
+        self._events = []
+        self._worker_ids = {}
+        self._tasks = []
+        self._times = {}
+        self._generation_start = None
+        self._pool_start = None
+
+    # ── recording ───────────────────────────────────────────
+    def start_generation(self, generation: int) -> None:
+        self.generation = generation
+        self._generation_start = time.time()
+        self._tasks = []
+        self._times = {}
+
+    @contextmanager
+    def phase(self, name: str):
+        """Time a phase of the current generation in the master."""
+        start = time.time()
+        try:
+            yield
+        finally:
+            end = time.time()
+            self.add_time(name, end - start)
+            self._span(_MASTER, 0, name, start, end)
+
+    def add_time(self, name: str, seconds: float) -> None:
+        """Count time towards a phase without a span of its own, e.g. the many short mutations of a generation."""
+        self._times[name] = self._times.get(name, 0.0) + seconds
+
+    def pool_started(self, at: Optional[float] = None) -> None:
+        """Called by a backend that starts its workers: the time until each of them begins its first task is startup."""
+        self._pool_start = time.time() if at is None else at
+
+    def record_task(self, worker: str, start: float, end: float) -> None:
+        """Called by a backend for each evaluation task; may be called from another thread."""
+        self._tasks.append((worker, start, end))
+
+    def end_generation(self, workers: Optional[int] = None) -> Dict[str, float]:
+        """Summary of the current generation, one value per column of COLUMNS.
+
+        *workers* is the number of workers the backend had; those that got no
+        task count as idle for the whole evaluation. The straggler ratio is the
+        longest task over the median one, the tail time how long the last
+        worker kept running after the first one had nothing left to do.
+        """
+        end = time.time()
+        tasks = list(self._tasks)
+        durations = [task_end - task_start for _, task_start, task_end in tasks]
+        median = statistics.median(durations) if durations else 0.0
+        first_start, last_end = {}, {}
+        busy = {}
+        for worker, task_start, task_end in tasks:
+            self._span(_WORKERS, self._worker_id(worker), "evaluate", task_start, task_end)
+            first_start[worker] = min(first_start.get(worker, task_start), task_start)
+            last_end[worker] = max(last_end.get(worker, task_end), task_end)
+            busy[worker] = busy.get(worker, 0.0) + task_end - task_start
+
+        startup = 0.0
+        if self._pool_start is not None and tasks:
+            for worker, start in first_start.items():
+                self._span(_WORKERS, self._worker_id(worker), "startup", self._pool_start, start)
+            startup = max(first_start.values()) - self._pool_start
+            self._pool_start = None
+
+        evaluation = self._times.get("evaluate", 0.0)
+        workers = max(workers or 0, len(busy))
+        capacity = workers * evaluation
+        summary = {
+            "Generation_Time": end - self._generation_start,
+            "Evaluate_Time": evaluation,
+            "Breed_Time": self._times.get("breed", 0.0),
+            "Selection_Time": self._times.get("selection", 0.0),
+            "Crossover_Time": self._times.get("crossover", 0.0),
+            "Mutation_Time": self._times.get("mutation", 0.0),
+            "Log_Time": self._times.get("log", 0.0),
+            "Surrogate_Time": self._times.get("surrogate", 0.0),
+            "Pool_Startup_Time": startup,
+            "Tasks": len(tasks),
+            "Task_Mean": statistics.mean(durations) if durations else 0.0,
+            "Task_Max": max(durations, default=0.0),
+            "Straggler_Ratio": max(durations) / median if median > 0 else 0.0,
+            "Tail_Time": max(last_end.values()) - min(last_end.values()) if last_end else 0.0,
+            "Worker_Idle_Time": max(0.0, capacity - sum(busy.values())) if busy else 0.0,
+            "Worker_Utilization": sum(busy.values()) / capacity if busy and capacity > 0 else 0.0,
+        }
+        self._span(_MASTER, 0, f"generation {self.generation}", self._generation_start, end,
+                   {column: round(value, 6) for column, value in summary.items()})
+        return summary
+
+    # ── trace ───────────────────────────────────────────────
+    def _worker_id(self, worker: str) -> int:
+        if worker not in self._worker_ids:
+            self._worker_ids[worker] = len(self._worker_ids) + 1
+        return self._worker_ids[worker]
+
+    def _span(self, pid: int, tid: int, name: str, start: float, end: float, args: Optional[dict] = None) -> None:
+        event = {"name": name, "ph": "X", "pid": pid, "tid": tid,
+                 "ts": (start - self.origin) * 1e6, "dur": max(0.0, end - start) * 1e6,
+                 "args": {"generation": self.generation}}
+        if args:
+            event["args"].update(args)
+        self._events.append(event)
+
+    def trace(self) -> dict:
+        """Everything recorded so far as a Chrome trace: the master's phases, then one row per worker."""
+        metadata = [{"name": "process_name", "ph": "M", "pid": _MASTER, "args": {"name": "GA master"}},
+                    {"name": "process_name", "ph": "M", "pid": _WORKERS, "args": {"name": "workers"}},
+                    {"name": "thread_name", "ph": "M", "pid": _MASTER, "tid": 0, "args": {"name": "generations"}}]
+        metadata += [{"name": "thread_name", "ph": "M", "pid": _WORKERS, "tid": tid, "args": {"name": worker}}
+                     for worker, tid in self._worker_ids.items()]
+        return {"traceEvents": metadata + self._events, "displayTimeUnit": "ms"}
+
+    def write_trace(self, path: Optional[str] = None) -> None:
+        path = path or self.trace_file
+        if path is None:
+            return
+        with open(path, "w") as f:
+            json.dump(self.trace(), f)
@@ -1,12 +1,12 @@
 from setuptools import setup
 from Cython.Build import cythonize
-import os
+import glob
 
 setup(
     name="nonaga",
+    # Every Cython source of NonagaGame is an extension, as NonagaGame/compiler.py assumes
     ext_modules=cythonize(
-        ["NonagaGame/nonaga_constants.pyx", "NonagaGame/nonaga_board.pyx",
-            "NonagaGame/nonaga_logic.pyx", "NonagaGame/AI.pyx"],
+        sorted(glob.glob("NonagaGame/*.pyx")),
         compiler_directives={
             "language_level": "3",
             "boundscheck": False,
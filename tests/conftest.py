@@ -0,0 +1,11 @@
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+sys.path.insert(0, os.path.join(ROOT, "ga_framework"))
+sys.path.insert(0, os.path.join(ROOT, "NonagaGame"))
+
+# The tests run against extensions built from the current sources
+from compiler import compile_cython_files
+compile_cython_files()
@@ -0,0 +1,89 @@
+"""AIService shares searches between identical and symmetric positions and never leaves a request waiting."""
+import asyncio
+
+import pytest
+
+from nonaga_logic import NonagaLogic
+from nonaga_symmetry import Symmetry
+from protocol import ProtocolError
+from ai_service import AIService, AIServiceClient
+
+
+def mirrored(snapshot, symmetry):
+    return {"tiles": [symmetry.apply(tuple(t)) for t in snapshot["tiles"]],
+            "pieces": [(symmetry.apply(tuple(p)), symmetry.apply_color(c)) for p, c in snapshot["pieces"]],
+            "current_player": symmetry.apply_color(snapshot["current_player"]),
+            "turn_phase": snapshot["turn_phase"]}
+
+
+def is_legal(snapshot, move):
+    game = NonagaLogic.from_snapshot(snapshot)
+    (piece, piece_destination), (tile, tile_destination) = move
+    if piece_destination not in game.get_all_valid_piece_moves().get(piece, []):
+        return False
+    game.move_piece(game.board.get_piece(piece), piece_destination)
+    return tile_destination in game.get_all_valid_tile_moves().get(tile, ())
+
+
+class BrokenPool:
+    def submit(self, *args, **kwargs):
+        raise RuntimeError("cannot schedule new futures after shutdown")
+
+    def shutdown(self, *args, **kwargs):
+        pass
+
+
+class BrokenService(AIService):
+    def _get_pool(self, depth):
+        self._pools[depth] = BrokenPool()
+        return self._pools[depth]
+
+
+def test_symmetric_requests_share_one_search():
+    async def main():
+        service = AIService(pools={1: 1})
+        try:
+            snapshot = NonagaLogic(new_game=True).get_snapshot()
+            image = mirrored(snapshot, Symmetry(7, True, 1, 2))
+            first, second = await asyncio.gather(service.request_move(snapshot, 1),
+                                                 service.request_move(image, 1))
+            assert is_legal(snapshot, first) and is_legal(image, second)
+            assert service.stats["searched"] == 1 and service.stats["joined"] == 1
+            assert await service.request_move(snapshot, 1) == first
+            assert service.stats["cache_hits"] == 1
+        finally:
+            await service.close()
+    asyncio.run(main())
+
+
+def test_failed_batch_fails_every_waiting_request():
+    async def main():
+        service = BrokenService(pools={1: 1}, batch_delay=0.01)
+        game = NonagaLogic(new_game=True)
+        snapshots = [game.get_snapshot()]
+        game.move_piece(*next((game.board.get_piece(p), d[0]) for p, d in game.get_all_valid_piece_moves().items()
+                              if game.board.get_piece(p).color == game.get_current_player() and d))
+        game.move_tile(*next((game.board.get_tile(t), sorted(d)[0])
+                             for t, d in game.get_all_valid_tile_moves().items() if d))
+        snapshots.append(game.get_snapshot())
+        results = await asyncio.wait_for(asyncio.gather(*(service.request_move(s, 1) for s in snapshots),
+                                                        return_exceptions=True), 5)
+        assert all(isinstance(result, RuntimeError) for result in results)
+        assert service._in_flight == {} and service._pools == {}
+        await service.close()
+    asyncio.run(main())
+
+
+def test_client_gets_errors_as_exceptions():
+    async def main():
+        service = await AIService(pools={1: 1}).start()
+        client = await AIServiceClient().connect(port=service.port)
+        try:
+            with pytest.raises(ValueError):
+                await service.request_move(NonagaLogic(new_game=True).get_snapshot(), 3)
+            with pytest.raises(ProtocolError):
+                await client.request_move(NonagaLogic(new_game=True).get_snapshot(), 3)
+        finally:
+            await client.close()
+            await service.close()
+    asyncio.run(main())
@@ -0,0 +1,49 @@
+"""The movable tiles of an island, kept up to date through its articulation points, equal those of brute force."""
+import random
+
+import pytest
+
+from nonaga_logic import NonagaLogic
+from nonaga_board import NonagaIsland, NonagaTile, NonagaPiece
+from build_endgame import play_random_turn
+
+# Same order as NEIGHBOR_OFFSETS of nonaga_board: bit i of a mask is the tile at offset i
+OFFSETS = [(1, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1)]
+
+
+def connected(cells):
+    if not cells:
+        return True
+    start = next(iter(cells))
+    seen, stack = {start}, [start]
+    while stack:
+        q, r = stack.pop()
+        for dq, dr in OFFSETS:
+            cell = (q + dq, r + dr)
+            if cell in cells and cell not in seen:
+                seen.add(cell)
+                stack.append(cell)
+    return len(seen) == len(cells)
+
+
+def islands(seed, turns):
+    """The island after every turn of a random game."""
+    rng = random.Random(seed)
+    game = NonagaLogic(new_game=True)
+    for _ in range(turns):
+        play_random_turn(game, rng)
+        yield game.board.islands[0]
+        if game.check_win_condition(0) or game.check_win_condition(1):
+            break
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_movable_tiles_match_brute_force(seed):
+    for island in islands(seed, 30):
+        cells = {tile.get_position()[:2] for tile in island.all_tiles}
+        fresh = NonagaIsland(0, [NonagaTile(*tile.get_position()) for tile in island.all_tiles],
+                             [NonagaPiece(*piece.get_position(), piece.color) for piece in island.pieces])
+        movable = {tile.get_position() for tile in island.movable_tiles}
+        assert movable == {tile.get_position() for tile in fresh.movable_tiles}
+        for q, r, _ in movable:
+            assert connected(cells - {(q, r)})
@@ -0,0 +1,69 @@
+"""MasterSlaveBackend evaluates through a population broadcast in shared memory."""
+import subprocess
+import sys
+
+import pytest
+
+from backends import MasterSlaveBackend, PopulationBroadcast
+from interfaces import FitnessFunction
+
+
+class DistanceToPopulation(FitnessFunction):
+    """Needs the population, as the tournament fitness does."""
+
+    def __init__(self):
+        self.population = []
+
+    def evaluate(self, individual):
+        return float(sum(abs(a - b) for other in self.population for a, b in zip(individual, other)))
+
+
+def double_sum(individual):
+    return 2.0 * sum(individual)
+
+
+@pytest.fixture
+def backend():
+    backend = MasterSlaveBackend(max_workers=2)
+    yield backend
+    backend.close()
+
+
+def test_map_evaluate(backend):
+    population = [[i, -i, 3] for i in range(10)]
+    assert backend.map_evaluate(double_sum, population) == [double_sum(individual) for individual in population]
+
+
+def test_evaluate_population_reads_the_broadcast(backend):
+    fitness = DistanceToPopulation()
+    for generation in range(2):
+        population = [[i + generation, 2 * i] for i in range(8)]
+        fitness.population = population
+        expected = [fitness.evaluate(individual) for individual in population]
+        assert backend.evaluate_population(fitness, population) == expected
+        assert backend.evaluate_population(fitness, population, indices=[5, 1]) == [expected[5], expected[1]]
+
+
+def test_broadcast_round_trip():
+    population = [[1, -2, 3], [4, 5, -6]]
+    broadcast = PopulationBroadcast(population, 7)
+    try:
+        assert PopulationBroadcast.read(broadcast.name) == population
+    finally:
+        broadcast.close()
+    with pytest.raises(ValueError):
+        PopulationBroadcast([[1, 2], [3]], 0)
+
+
+def test_reader_with_its_own_tracker_leaves_the_block():
+    broadcast = PopulationBroadcast([[1, 2, 3]], 1)
+    try:
+        code = f"from backends import PopulationBroadcast; print(PopulationBroadcast.read({broadcast.name!r}))"
+        reader = subprocess.run([sys.executable, "-c", code], capture_output=True, text=True,
+                                env={"PYTHONPATH": ":".join(sys.path)})
+        assert reader.stdout.strip() == "[[1, 2, 3]]"
+        assert "leaked" not in reader.stderr
+        # still there for the workers that read it next
+        assert PopulationBroadcast.read(broadcast.name) == [[1, 2, 3]]
+    finally:
+        broadcast.close()
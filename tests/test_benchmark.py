@@ -0,0 +1,30 @@
+"""benchmark.py plays seeded games and reports each kind of player in its own unit."""
+import json
+import os
+
+import pytest
+
+from benchmark import game_key, parse_config, play_game, summarize
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parameters.json")) as f:
+    PARAMETER = json.load(f)[0]
+
+
+def test_parse_config():
+    assert parse_config("ab:2") == ("ab", 2)
+    assert parse_config("mcts:0.5") == ("mcts", 0.5)
+    with pytest.raises(ValueError):
+        parse_config("minimax:2")
+
+
+def test_units_are_kept_apart():
+    tasks = [("ab:1/p0", "ab:1", PARAMETER, "mcts:0.01/p0", "mcts:0.01", PARAMETER, 0, 0, 2, 4, 1),
+             ("mcts:0.01/p0", "mcts:0.01", PARAMETER, "ab:1/p0", "ab:1", PARAMETER, 0, 0, 2, 4, 1)]
+    records = [play_game(task) for task in tasks]
+    assert [record["key"] for record in records] == [game_key(task) for task in tasks]
+    pairings, summary = summarize(["ab:1/p0", "mcts:0.01/p0"], records)
+    assert pairings[0]["games"] == 2
+    assert pairings[0]["player_cost"]["search_unit"] == "positions"
+    assert pairings[0]["opponent_cost"]["search_unit"] == "playouts"
+    assert {s["player"]: s["search_unit"] for s in summary} == {"ab:1/p0": "positions",
+                                                                 "mcts:0.01/p0": "playouts"}
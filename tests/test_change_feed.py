@@ -0,0 +1,70 @@
+"""Spectators rebuild the position of a game from its ChangeFeed, even when they fall behind."""
+import asyncio
+import json
+import random
+
+from nonaga_logic import NonagaLogic
+from build_endgame import play_random_turn
+from change_feed import ChangeFeed, FeedPublisher, FeedReader
+
+
+def same_position(reader, game):
+    snapshot = game.get_snapshot()
+    return reader.get_snapshot() == {"tiles": sorted(snapshot["tiles"]), "pieces": sorted(snapshot["pieces"]),
+                                     "current_player": snapshot["current_player"],
+                                     "turn_phase": snapshot["turn_phase"]}
+
+
+def drain(subscription):
+    messages = []
+    while subscription._messages:
+        messages.append(json.loads(subscription._messages.popleft()))
+    return messages
+
+
+def test_reader_follows_the_game():
+    game = NonagaLogic(new_game=True)
+    feed = ChangeFeed(game, keyframe_interval=7)
+    reader = FeedReader()
+    reader.apply(feed.keyframe())
+    feed.listeners.append(lambda event: reader.apply(json.loads(json.dumps(event))))
+    rng = random.Random(0)
+    for _ in range(20):
+        play_random_turn(game, rng)
+        assert same_position(reader, game)
+
+
+def test_gap_waits_for_a_keyframe():
+    game = NonagaLogic(new_game=True)
+    feed = ChangeFeed(game, keyframe_interval=4)
+    events = []
+    feed.listeners.append(events.append)
+    rng = random.Random(1)
+    for _ in range(4):
+        play_random_turn(game, rng)
+    reader = FeedReader()
+    reader.apply(events[0])
+    results = [reader.apply(event) for event in events[2:]]
+    assert results[0] is False
+    assert events[-1]["type"] == "keyframe" and results[-1] is True
+    assert same_position(reader, game)
+
+
+def test_slow_subscriber_is_resynchronized():
+    async def main():
+        game = NonagaLogic(new_game=True)
+        publisher = FeedPublisher(ChangeFeed(game), buffer_size=5)
+        fast, slow = publisher.subscribe(), publisher.subscribe()
+        fast_reader, slow_reader = FeedReader(), FeedReader()
+        rng = random.Random(2)
+        for _ in range(10):
+            play_random_turn(game, rng)
+            for message in drain(fast):
+                assert fast_reader.apply(message)
+        for message in drain(slow):
+            slow_reader.apply(message)
+        assert slow.resyncs > 0 and fast.resyncs == 0
+        assert same_position(fast_reader, game) and same_position(slow_reader, game)
+        publisher.close()
+        assert await slow.get() is None
+    asyncio.run(main())
@@ -0,0 +1,46 @@
+"""compiler.py reuses a current build and serializes builds with a lock that cannot go stale."""
+import multiprocessing
+import os
+import threading
+
+import compiler
+
+
+def hold_lock(path, locked):
+    with compiler._build_lock(path):
+        locked.set()
+        threading.Event().wait()
+
+
+def test_modules_are_the_cython_sources():
+    _, nonaga_dir = compiler._project_paths()
+    sources = {name[:-len(".pyx")] for name in os.listdir(nonaga_dir) if name.endswith(".pyx")}
+    assert compiler.cython_modules() == sorted(sources)
+
+
+def test_current_build_is_reused():
+    # conftest built the extensions
+    assert compiler.compile_cython_files() is False
+
+
+def test_lock_waits_for_its_holder_and_survives_it(tmp_path):
+    path = str(tmp_path / "build.lock")
+    locked = multiprocessing.Event()
+    holder = multiprocessing.Process(target=hold_lock, args=(path, locked), daemon=True)
+    holder.start()
+    assert locked.wait(30)
+
+    acquired = threading.Event()
+
+    def take():
+        with compiler._build_lock(path):
+            acquired.set()
+
+    waiter = threading.Thread(target=take, daemon=True)
+    waiter.start()
+    assert not acquired.wait(0.5)
+    # a holder that dies without releasing the lock does not leave it taken
+    holder.kill()
+    holder.join()
+    assert acquired.wait(30)
+    waiter.join()
@@ -0,0 +1,44 @@
+"""DistributedBackend evaluates populations on workers that know its key."""
+from multiprocessing import AuthenticationError
+from multiprocessing.connection import Client
+
+import pytest
+
+from distributed import DistributedBackend
+
+
+def square_sum(individual):
+    return float(sum(gene * gene for gene in individual))
+
+
+@pytest.fixture
+def backend():
+    backend = DistributedBackend(port=0, local_workers=2, verbose=False)
+    yield backend
+    backend.close()
+
+
+def test_map_evaluate_keeps_the_order(backend):
+    assert backend.wait_for_workers(2, timeout=30) == 2
+    population = [[i, i + 1, -i] for i in range(20)]
+    assert backend.map_evaluate(square_sum, population) == [square_sum(individual) for individual in population]
+
+
+def test_listens_on_loopback_with_a_random_key(backend):
+    assert backend.address[0] == "127.0.0.1"
+    assert len(backend.authkey) >= 16
+    other = DistributedBackend(port=0, verbose=False)
+    try:
+        assert other.authkey != backend.authkey
+    finally:
+        other.close()
+
+
+def test_rejects_an_unknown_key(backend):
+    with pytest.raises(AuthenticationError):
+        Client(backend.address, authkey=b"nonaga-ga")
+
+
+def test_rejects_an_empty_key():
+    with pytest.raises(ValueError):
+        DistributedBackend(port=0, authkey=b"", verbose=False)
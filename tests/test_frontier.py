@@ -0,0 +1,50 @@
+"""The frontier of an island, kept up to date as tiles move, equals the one computed from scratch."""
+import random
+
+import pytest
+
+from nonaga_logic import NonagaLogic
+from build_endgame import play_random_turn
+
+# Same order as NEIGHBOR_OFFSETS of nonaga_board: bit i of a mask is the tile at offset i
+OFFSETS = [(1, -1), (1, 0), (0, 1), (-1, 1), (-1, 0), (0, -1)]
+
+
+def brute_frontier(cells):
+    """Empty cells next to a tile, with the mask of their tile neighbours."""
+    frontier = {}
+    for q, r in cells:
+        for dq, dr in OFFSETS:
+            cell = (q + dq, r + dr)
+            if cell not in cells and cell not in frontier:
+                frontier[cell] = sum(1 << i for i, (eq, er) in enumerate(OFFSETS)
+                                     if (cell[0] + eq, cell[1] + er) in cells)
+    return {(q, r, -q - r): mask for (q, r), mask in frontier.items()}
+
+
+def islands(seed, turns):
+    """The island after every turn of a random game."""
+    rng = random.Random(seed)
+    game = NonagaLogic(new_game=True)
+    for _ in range(turns):
+        play_random_turn(game, rng)
+        yield game.board.islands[0]
+        if game.check_win_condition(0) or game.check_win_condition(1):
+            break
+
+
+@pytest.mark.parametrize("seed", range(20))
+def test_frontier_matches_brute_force(seed):
+    for island in islands(seed, 30):
+        cells = {tile.get_position()[:2] for tile in island.all_tiles}
+        assert island.frontier == brute_frontier(cells)
+
+
+def test_reset_restores_the_frontier():
+    game = NonagaLogic(new_game=True)
+    start = dict(game.board.islands[0].frontier)
+    rng = random.Random(0)
+    for _ in range(5):
+        play_random_turn(game, rng)
+    game.reset()
+    assert game.board.islands[0].frontier == start
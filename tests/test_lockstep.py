@@ -0,0 +1,31 @@
+"""play_lockstep plays the games of play_matches, searching each shared position once."""
+import json
+import os
+
+from nonaga_match import play_lockstep, play_matches
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parameters.json")) as f:
+    PARAMETERS = json.load(f)
+
+PAIRINGS = [(PARAMETERS[a], PARAMETERS[b]) for a in range(len(PARAMETERS)) for b in range(len(PARAMETERS)) if a != b]
+
+
+def test_lockstep_matches_play_matches():
+    winners, turns = play_matches(PAIRINGS, depth=1)
+    lockstep_winners, lockstep_turns, searched = play_lockstep(PAIRINGS)
+    assert list(lockstep_winners) == list(winners)
+    assert list(lockstep_turns) == list(turns)
+    assert searched <= sum(turns)
+
+
+def test_shared_positions_are_searched_once():
+    pairing = PAIRINGS[0]
+    _, turns, searched = play_lockstep([pairing])
+    _, _, searched_four = play_lockstep([pairing] * 4)
+    # four copies of a game reach the same positions
+    assert searched_four == searched == turns[0]
+
+
+def test_no_pairings():
+    winners, turns, searched = play_lockstep([])
+    assert list(winners) == [] and list(turns) == [] and searched == 0
@@ -0,0 +1,42 @@
+"""Matches played on pooled games are those of new games, and a match always returns to its pool."""
+import json
+import os
+
+import pytest
+
+from match_pool import MatchPool, process_pool
+from evaluate_parameters import _play_match
+from strategies import NonagaTournamentFitness
+from nonaga_logic import NonagaLogic
+from AI import AI
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parameters.json")) as f:
+    PARAMETERS = json.load(f)
+
+
+def test_pooled_match_equals_new_match():
+    pool = MatchPool()
+    for red, black in [(0, 1), (2, 3), (1, 0)]:
+        with pool.match(PARAMETERS[red], PARAMETERS[black], depth=1) as (game, ai_red, ai_black):
+            pooled = _play_match(game, ai_red, ai_black, 20), game.get_snapshot()
+        game = NonagaLogic(new_game=True)
+        game.reset()
+        fresh = _play_match(game, AI(PARAMETERS[red], 1, 0), AI(PARAMETERS[black], 1, 1), 20), game.get_snapshot()
+        assert pooled == fresh
+    assert len(pool._free) == 1
+
+
+def test_match_is_released_when_the_game_raises():
+    pool = MatchPool()
+    with pytest.raises(RuntimeError):
+        with pool.match(PARAMETERS[0], PARAMETERS[1]):
+            raise RuntimeError("the game failed")
+    assert len(pool._free) == 1
+
+
+def test_tournament_fitness_gives_its_matches_back():
+    fitness = NonagaTournamentFitness(k_opponents=3, max_moves=4)
+    fitness.population = PARAMETERS[:3]
+    free = len(process_pool()._free)
+    fitness.evaluate(PARAMETERS[0])
+    assert len(process_pool()._free) == max(free, 1)
@@ -0,0 +1,31 @@
+"""Several threads searching one MCTS tree complete the iterations and return a legal move."""
+import json
+import os
+import random
+
+import pytest
+
+from nonaga_logic import NonagaLogic
+from nonaga_mcts import MCTS
+from build_endgame import play_random_turn
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parameters.json")) as f:
+    PARAMETER = json.load(f)[0]
+
+
+@pytest.mark.parametrize("threads", [1, 4])
+def test_threads_play_legal_moves(threads):
+    game = NonagaLogic(new_game=True)
+    rng = random.Random(threads)
+    for _ in range(4):
+        play_random_turn(game, rng)
+    player = MCTS(PARAMETER, game.get_current_player(), time_limit=0, iterations=2000, threads=threads)
+    (piece, destination), (tile, tile_destination) = player.get_best_move(game)
+
+    assert player.last_iterations >= 2000
+    assert player.tree_size > 1
+    assert piece.color == game.get_current_player()
+    assert destination in game.get_all_valid_piece_moves()[piece.get_position()]
+    game.move_piece(piece, destination)
+    assert game.is_valid_tile_destination(tile, tile_destination)
+
@@ -0,0 +1,44 @@
+"""The native matches of nonaga_match play the games of the Python AI."""
+import json
+import os
+import random
+
+import pytest
+
+from nonaga_constants import RED, BLACK
+from nonaga_logic import NonagaLogic
+from nonaga_match import match_moves, play_match, play_matches
+from AI import AI
+
+with open(os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "parameters.json")) as f:
+    PARAMETERS = json.load(f)
+
+PAIRINGS = [(a, b) for a in range(len(PARAMETERS)) for b in range(len(PARAMETERS)) if a != b]
+
+
+def ai_moves(params_red, params_black, depth, max_moves):
+    """Turns of a game between two AI players, in the form of match_moves."""
+    game = NonagaLogic(new_game=True)
+    players = {RED: AI(params_red, depth, RED), BLACK: AI(params_black, depth, BLACK)}
+    turns = []
+    for _ in range(max_moves):
+        (piece, piece_destination), (tile, tile_destination) = players[game.get_current_player()].get_best_move(game)
+        turns.append(((piece.get_position(), piece_destination), (tile.get_position(), tile_destination)))
+        game.move_piece(piece, piece_destination)
+        game.move_tile(tile, tile_destination)
+        if game.check_win_condition(RED) or game.check_win_condition(BLACK):
+            break
+    return turns
+
+
+@pytest.mark.parametrize("red, black", random.Random(0).sample(PAIRINGS, 4))
+def test_match_moves_replay_ai(red, black):
+    assert match_moves(PARAMETERS[red], PARAMETERS[black], 1, 30) == \
+        ai_moves(PARAMETERS[red], PARAMETERS[black], 1, 30)
+
+
+
+def test_play_matches_equals_play_match():
+    pairings = [(PARAMETERS[a], PARAMETERS[b]) for a, b in PAIRINGS[:6]]
+    winners, turns = play_matches(pairings, depth=1, threads=2)
+    assert [tuple(result) for result in zip(winners, turns)] == [play_match(red, black) for red, black in pairings]
@@ -0,0 +1,131 @@
+"""NonagaServer over loopback TCP: games against humans and against the AI service."""
+import asyncio
+import json
+
+from nonaga_constants import RED, BLACK
+from ai_service import AIService, AIServiceClient
+from change_feed import FeedReader
+from server import NonagaServer
+
+
+class Client:
+    def __init__(self, reader, writer):
+        self.reader = reader
+        self.writer = writer
+
+    @classmethod
+    async def connect(cls, server):
+        return cls(*await asyncio.open_connection("127.0.0.1", server.port))
+
+    async def send(self, message):
+        self.writer.write((json.dumps(message) + "\n").encode())
+        await self.writer.drain()
+
+    async def receive(self, kind=None):
+        """Next message, skipping those of another type when *kind* is given."""
+        while True:
+            message = json.loads(await asyncio.wait_for(self.reader.readline(), 30))
+            if kind is None or message["type"] == kind:
+                return message
+
+    def close(self):
+        self.writer.close()
+
+
+class FailingAI:
+    async def request_move(self, snapshot, depth, parameter=None):
+        raise RuntimeError("no worker")
+
+    async def close(self):
+        pass
+
+
+def test_ai_service_round_trip():
+    """A game against the AI, searched by an AIService reached through its socket."""
+    async def main():
+        service = await AIService(pools={1: 1}).start()
+        client = await AIServiceClient().connect(port=service.port)
+        server = await NonagaServer(ai_service=client).start()
+        try:
+            player = await Client.connect(server)
+            await player.send({"type": "create", "opponent": "ai", "color": BLACK, "depth": 1})
+            joined = await player.receive("joined")
+            assert joined["color"] == BLACK
+            start = await player.receive("state")
+            assert start["current_player"] == RED
+            after = await player.receive("state")
+            assert after["current_player"] == BLACK and after["winner"] is None
+            # the AI played a piece move and a tile move
+            assert after["tiles"] != start["tiles"] and after["pieces"] != start["pieces"]
+            player.close()
+        finally:
+            await server.close()
+            await client.close()
+            await service.close()
+    asyncio.run(main())
+
+
+def test_finished_game_is_released():
+    async def main():
+        server = await NonagaServer(ai_service=FailingAI(), reconnect_timeout=0.05).start()
+        try:
+            red, black = await Client.connect(server), await Client.connect(server)
+            await red.send({"type": "create", "opponent": "human", "color": RED})
+            game_id = (await red.receive("joined"))["game_id"]
+            await black.send({"type": "join", "game_id": game_id})
+            await black.receive("joined")
+            black.close()
+            await red.receive("opponent_disconnected")
+            final = await red.receive("state")
+            assert final["winner"] == RED
+            assert server.games == {}
+            # the winner is free to start another game
+            await red.send({"type": "create", "opponent": "human"})
+            assert (await red.receive("joined"))["game_id"] != game_id
+            red.close()
+        finally:
+            await server.close()
+    asyncio.run(main())
+
+
+def test_failing_ai_forfeits():
+    async def main():
+        server = await NonagaServer(ai_service=FailingAI()).start()
+        try:
+            player = await Client.connect(server)
+            await player.send({"type": "create", "opponent": "ai", "color": BLACK})
+            error = await player.receive("error")
+            assert "forfeits" in error["message"]
+            assert (await player.receive("state"))["winner"] == BLACK
+            assert server.games == {}
+            player.close()
+        finally:
+            await server.close()
+    asyncio.run(main())
+
+
+def test_spectator_follows_the_moves():
+    async def main():
+        server = await NonagaServer(ai_service=FailingAI()).start()
+        try:
+            red, spectator = await Client.connect(server), await Client.connect(server)
+            await red.send({"type": "create", "opponent": "human", "color": RED})
+            game_id = (await red.receive("joined"))["game_id"]
+            await spectator.send({"type": "watch", "game_id": game_id})
+            keyframe = await spectator.receive()
+            assert keyframe["type"] == "keyframe"
+
+            reader = FeedReader()
+            reader.apply(keyframe)
+            game = server.games[game_id].logic
+            origin, destinations = next((p, d) for p, d in game.get_all_valid_piece_moves().items()
+                                        if game.board.get_piece(p).color == RED and d)
+            await red.send({"type": "move", "kind": "piece", "from": list(origin), "to": list(destinations[0])})
+            delta = await spectator.receive()
+            assert delta["type"] == "delta" and reader.apply(delta)
+            assert reader.get_snapshot()["pieces"] == sorted(game.get_snapshot()["pieces"])
+            red.close()
+            spectator.close()
+        finally:
+            await server.close()
+    asyncio.run(main())
@@ -0,0 +1,79 @@
+"""The quadratic surrogate learns a fitness, and ModularGA only evaluates the elite and the offspring it picks."""
+import random
+
+from core import ModularGA
+from interfaces import FitnessFunction, ParallelBackend
+from strategies import QuadraticSurrogate, RouletteWheelSelection, SinglePointCrossover, RandomIntMutation
+
+
+def quadratic(individual):
+    return 3.0 + 0.5 * individual[0] - 0.02 * individual[1] ** 2 + 0.01 * individual[0] * individual[2]
+
+
+class CountingFitness(FitnessFunction):
+    def __init__(self):
+        self.calls = 0
+
+    def evaluate(self, individual):
+        self.calls += 1
+        return quadratic(individual) + 1000.0
+
+
+class SerialBackend(ParallelBackend):
+    def map_evaluate(self, evaluate_func, population):
+        return [evaluate_func(individual) for individual in population]
+
+
+def random_population(rng, size):
+    return [[rng.randint(-50, 50) for _ in range(3)] for _ in range(size)]
+
+
+def test_fit_and_predict():
+    rng = random.Random(0)
+    surrogate = QuadraticSurrogate(ridge=1e-6)
+    assert not surrogate.is_trained()
+    population = random_population(rng, 60)
+    surrogate.update(population, [quadratic(individual) for individual in population])
+    assert surrogate.is_trained()
+    unseen = random_population(rng, 20)
+    for predicted, individual in zip(surrogate.predict(unseen), unseen):
+        assert abs(predicted - quadratic(individual)) < 0.5
+
+
+def test_older_generations_fade():
+    rng = random.Random(1)
+    surrogate = QuadraticSurrogate(decay=0.1, ridge=1e-6)
+    population = random_population(rng, 40)
+    surrogate.update(population, [0.0] * len(population))
+    surrogate.update(population, [10.0] * len(population))
+    assert all(abs(value - 10.0) < 1.0 for value in surrogate.predict(population))
+
+
+def test_screen_keeps_the_elite_and_picks_offspring(tmp_path):
+    rng = random.Random(2)
+    ga = ModularGA(RouletteWheelSelection(), SinglePointCrossover(), RandomIntMutation(), CountingFitness(),
+                   SerialBackend(), log_file=str(tmp_path / "log.csv"), surrogate=QuadraticSurrogate(),
+                   screen_fraction=0.2, exploration_fraction=0.1)
+    population = random_population(rng, 30)
+    ga.surrogate.update(population, [quadratic(individual) for individual in population])
+    evaluated, estimates = ga._screen(population, carried=1)
+    assert evaluated[0] == 0
+    assert len(evaluated) == 1 + round(0.2 * 29) + round(0.1 * 29)
+    best_offspring = max(range(1, 30), key=estimates.__getitem__)
+    assert best_offspring in evaluated
+
+
+def test_estimates_never_outrank_real_fitnesses():
+    fitnesses = [5.0, 1.0, 9.0, -3.0]
+    assert ModularGA._selection_fitnesses(fitnesses, [0, 1], 1.0) == [5.0, 1.0, 1.0, -3.0]
+
+
+def test_run_evaluates_fewer_individuals(tmp_path):
+    random.seed(3)
+    fitness = CountingFitness()
+    ga = ModularGA(RouletteWheelSelection(), SinglePointCrossover(), RandomIntMutation(min_val=-50, max_val=50),
+                   fitness, SerialBackend(), log_file=str(tmp_path / "log.csv"), surrogate=QuadraticSurrogate(),
+                   screen_fraction=0.3, exploration_fraction=0.1)
+    ga.run(generations=4, pop_size=20, genome_length=3, min_gene_val=-50, max_gene_val=50)
+    # the first generation is evaluated whole, the next ones the elite and 8 of the 19 offspring
+    assert fitness.calls == 20 + 3 * (1 + 6 + 2)
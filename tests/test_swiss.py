@@ -0,0 +1,76 @@
+"""Swiss rounds pair close players, and the ranking stops at its round budget unless the top places are settled."""
+import random
+
+from evaluate_parameters import (INITIAL_RATING, INITIAL_RD, expected_score, swiss_pairings, swiss_ranking,
+                                 unresolved_places, update_ratings)
+
+
+def test_everyone_plays_once_and_the_weakest_sits_out():
+    ratings = [1500.0, 1700.0, 1300.0, 1600.0, 1400.0]
+    pairs, bye = swiss_pairings(ratings, [100.0] * 5, {}, [0] * 5, [0] * 5)
+    assert bye == 2
+    players = [player for pair in pairs for player in pair]
+    assert sorted(players) == [0, 1, 3, 4]
+
+
+def test_the_bye_goes_to_who_had_fewest():
+    ratings = [1500.0, 1700.0, 1300.0]
+    pairs, bye = swiss_pairings(ratings, [100.0] * 3, {}, [0] * 3, [0, 0, 1])
+    assert bye == 0
+    assert pairs == [(1, 2)] or pairs == [(2, 1)]
+
+
+def test_red_goes_to_who_played_it_less():
+    pairs, _ = swiss_pairings([1600.0, 1500.0], [100.0] * 2, {}, [1, -1], [0, 0])
+    assert pairs == [(1, 0)]
+
+
+def test_players_move_on_to_new_opponents():
+    ratings = [1600.0, 1590.0, 1500.0, 1490.0]
+    rds = [100.0] * 4
+    first, _ = swiss_pairings(ratings, rds, {}, [0] * 4, [0] * 4)
+    assert {frozenset(pair) for pair in first} == {frozenset((0, 1)), frozenset((2, 3))}
+    meetings = {(0, 1): 3, (2, 3): 3}
+    second, _ = swiss_pairings(ratings, rds, meetings, [0] * 4, [0] * 4)
+    assert frozenset((0, 1)) not in {frozenset(pair) for pair in second}
+
+
+def test_update_ratings():
+    ratings, rds = update_ratings([INITIAL_RATING] * 3, [INITIAL_RD] * 3, [(0, 1, 1.0)])
+    assert ratings[0] > INITIAL_RATING > ratings[1]
+    assert rds[0] < INITIAL_RD and rds[1] < INITIAL_RD
+    assert ratings[2] == INITIAL_RATING and rds[2] == INITIAL_RD
+    drawn, _ = update_ratings([INITIAL_RATING] * 2, [INITIAL_RD] * 2, [(0, 1, 0.5)])
+    assert drawn == [INITIAL_RATING, INITIAL_RATING]
+
+
+def test_near_equal_players_stay_unsettled():
+    assert unresolved_places([1500.0, 1501.0, 1499.0], [30.0] * 3, 2, 0.9) == 2
+    assert unresolved_places([1900.0, 1500.0, 1100.0], [30.0] * 3, 2, 0.9) == 0
+
+
+def simulated_round(strengths, rng):
+    def play_round(pairs):
+        results = []
+        for red, black in pairs:
+            red_won = rng.random() < expected_score(strengths[red], strengths[black], 0.0)
+            results.append((1, 0) if red_won else (0, 1))
+        return results
+    return play_round
+
+
+def test_ranking_stops_at_its_budget():
+    rng = random.Random(0)
+    strengths = [1500.0 + rng.uniform(-5, 5) for _ in range(12)]
+    result = swiss_ranking(12, simulated_round(strengths, rng), top=4, max_rounds=5, verbose=False)
+    assert result["rounds"] == 5
+    assert result["unresolved"] > 0
+    assert sum(result["games"]) == 2 * 6 * 5
+
+
+def test_strong_players_end_on_top():
+    rng = random.Random(1)
+    strengths = [1000.0 + 100.0 * i for i in range(16)]
+    result = swiss_ranking(16, simulated_round(strengths, rng), top=3, verbose=False)
+    assert result["rounds"] <= 15
+    assert set(result["ranking"][:3]) <= {15, 14, 13, 12}
@@ -0,0 +1,74 @@
+"""canonical_key is the same for all the images of a position under the grid symmetries."""
+import json
+import random
+
+import pytest
+
+from nonaga_logic import NonagaLogic
+from nonaga_symmetry import Symmetry, canonical_key, canonicalize, canonicalize_snapshot
+from build_endgame import play_random_turn
+
+
+def random_game(seed, turns):
+    rng = random.Random(seed)
+    game = NonagaLogic(new_game=True)
+    for _ in range(turns):
+        play_random_turn(game, rng)
+        if game.check_win_condition(0) or game.check_win_condition(1):
+            break
+    return game
+
+
+def image(snapshot, symmetry):
+    """The snapshot with every position and color mapped by symmetry."""
+    return {"tiles": [symmetry.apply(tuple(t)) for t in snapshot["tiles"]],
+            "pieces": [(symmetry.apply(tuple(p)), symmetry.apply_color(c)) for p, c in snapshot["pieces"]],
+            "current_player": symmetry.apply_color(snapshot["current_player"]),
+            "turn_phase": snapshot["turn_phase"]}
+
+
+@pytest.mark.parametrize("seed", range(5))
+def test_key_is_invariant(seed):
+    game = random_game(seed, 6)
+    key = canonical_key(game)
+    snapshot = game.get_snapshot()
+    assert canonicalize_snapshot(snapshot)[0] == key
+    rng = random.Random(seed)
+    for transform in range(12):
+        for swap in (False, True):
+            symmetry = Symmetry(transform, swap, rng.randint(-3, 3), rng.randint(-3, 3))
+            moved = NonagaLogic.from_snapshot(image(snapshot, symmetry))
+            assert canonical_key(moved) == key
+
+
+def test_symmetry_maps_to_canonical_position():
+    game = random_game(1, 4)
+    key, symmetry = canonicalize(game)
+    canonical = NonagaLogic.from_snapshot(image(game.get_snapshot(), symmetry))
+    assert canonical_key(canonical) == key
+    for position in game.get_snapshot()["tiles"]:
+        assert symmetry.invert(symmetry.apply(tuple(position))) == tuple(position)
+
+
+
+def test_json_snapshot_has_the_same_key():
+    game = random_game(4, 5)
+    snapshot = json.loads(json.dumps(game.get_snapshot()))
+    assert canonicalize_snapshot(snapshot)[0] == canonical_key(game)
+
+
+def test_canonical_move_maps_to_a_legal_move():
+    """A move shared in canonical coordinates, as the AI service caches it, is legal in every image."""
+    game = random_game(5, 3)
+    snapshot = game.get_snapshot()
+    _, symmetry = canonicalize(game)
+    piece, destinations = next((p, d) for p, d in game.get_all_valid_piece_moves().items()
+                               if game.board.get_piece(p).color == game.get_current_player() and d)
+    canonical_move = symmetry.apply_move(((piece, destinations[0]), ((0, 0, 0), (0, 0, 0))))
+    for transform in (1, 7):
+        image_symmetry = Symmetry(transform, True, 2, -1)
+        other = NonagaLogic.from_snapshot(image(snapshot, image_symmetry))
+        _, other_symmetry = canonicalize(other)
+        (other_piece, other_destination), _ = other_symmetry.invert_move(canonical_move)
+        assert other_destination in other.get_all_valid_piece_moves()[other_piece]
+        assert symmetry.invert_move(canonical_move)[0] == (piece, destinations[0])
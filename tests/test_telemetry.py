@@ -0,0 +1,72 @@
+"""Telemetry sums the phases of a generation, summarizes the worker tasks and exports a Chrome trace."""
+import json
+import time
+
+import pytest
+
+from telemetry import Telemetry
+
+
+def test_phases_count_towards_the_generation():
+    telemetry = Telemetry(trace_file=None)
+    telemetry.start_generation(0)
+    with telemetry.phase("breed"):
+        time.sleep(0.01)
+    telemetry.add_time("mutation", 0.25)
+    telemetry.add_time("mutation", 0.25)
+    summary = telemetry.end_generation()
+    assert list(summary) == Telemetry.COLUMNS
+    assert summary["Breed_Time"] >= 0.01
+    assert summary["Mutation_Time"] == pytest.approx(0.5)
+    assert summary["Generation_Time"] >= summary["Breed_Time"]
+    assert summary["Tasks"] == 0 and summary["Worker_Utilization"] == 0.0
+
+
+def test_worker_summary():
+    telemetry = Telemetry(trace_file=None)
+    telemetry.start_generation(3)
+    t = time.time()
+    telemetry.pool_started(at=t - 0.5)
+    telemetry.add_time("evaluate", 4.0)
+    telemetry.record_task("w1", t, t + 1)
+    telemetry.record_task("w1", t + 1, t + 2)
+    telemetry.record_task("w2", t, t + 1)
+    telemetry.record_task("w2", t + 1, t + 4)
+    summary = telemetry.end_generation(workers=3)
+    assert summary["Tasks"] == 4
+    assert summary["Task_Mean"] == pytest.approx(1.5)
+    assert summary["Task_Max"] == pytest.approx(3.0)
+    assert summary["Straggler_Ratio"] == pytest.approx(3.0)
+    assert summary["Tail_Time"] == pytest.approx(2.0)
+    assert summary["Pool_Startup_Time"] == pytest.approx(0.5)
+    # the third worker got no task: 6 busy seconds out of 3 workers * 4 seconds
+    assert summary["Worker_Utilization"] == pytest.approx(0.5)
+    assert summary["Worker_Idle_Time"] == pytest.approx(6.0)
+
+
+def test_trace(tmp_path):
+    path = tmp_path / "trace.json"
+    telemetry = Telemetry(trace_file=str(path))
+    telemetry.start_generation(0)
+    with telemetry.phase("evaluate"):
+        t = time.time()
+        telemetry.record_task("w1", t, t + 0.001)
+    telemetry.end_generation(workers=1)
+    telemetry.write_trace()
+
+    trace = json.loads(path.read_text())
+    assert trace == telemetry.trace()
+    events = trace["traceEvents"]
+    names = {event["args"]["name"] for event in events if event["ph"] == "M"}
+    assert {"GA master", "workers", "generations", "w1"} <= names
+    spans = [event for event in events if event["ph"] == "X"]
+    assert {span["name"] for span in spans} == {"evaluate", "generation 0"}
+    worker_span = next(span for span in spans if span["pid"] == 2)
+    assert worker_span["dur"] == pytest.approx(1000.0, rel=1e-3)
+    generation = next(span for span in spans if span["name"] == "generation 0")
+    assert generation["args"]["Tasks"] == 1
+
+
+def test_no_trace_file():
+    telemetry = Telemetry(trace_file=None)
+    telemetry.write_trace()